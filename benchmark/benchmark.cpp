@@ -0,0 +1,808 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#include <vulkan/vulkan.h>
+
+// The definitions are compiled here, as the benchmark also uses the value set internals to get the
+// values of every type
+#define VK_VALUE_SERIALIZATION_CONFIG_MAIN
+#include <vk_value_serialization.hpp>
+
+#define VK_RESULT_TO_STRING_CONFIG_MAIN
+#include <vk_result_to_string.h>
+
+#define VK_STRUCT_CLEANUP_CONFIG_MAIN
+#include <vk_struct_cleanup.h>
+
+#define VK_STRUCT_COMPARE_CONFIG_MAIN
+#include <vk_struct_compare.h>
+
+#define VK_STRUCT_COPY_CONFIG_MAIN
+#include <vk_struct_copy.h>
+
+#define VK_STRUCT_ENCODE_CONFIG_MAIN
+#include <vk_struct_encode.h>
+
+#define VK_STRUCT_HASH_CONFIG_MAIN
+#include <vk_struct_hash.h>
+
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <fstream>
+#include <functional>
+#include <map>
+#include <sstream>
+#include <string>
+#include <vector>
+
+namespace {
+
+uint64_t gAllocationCount = 0;
+
+} // namespace
+
+// Allocations are counted by replacing malloc and friends, which the C++ allocations also go
+// through. This relies on glibc providing the original functions under other names, so elsewhere
+// (and when a sanitizer replaces them instead) allocations aren't counted, and are reported as n/a.
+#if defined(__GLIBC__)
+#define COUNT_ALLOCATIONS
+#endif
+#if defined(__SANITIZE_ADDRESS__)
+#undef COUNT_ALLOCATIONS
+#elif defined(__has_feature)
+#if __has_feature(address_sanitizer)
+#undef COUNT_ALLOCATIONS
+#endif
+#endif
+
+#ifdef COUNT_ALLOCATIONS
+extern "C" {
+void *__libc_malloc(size_t size);
+void *__libc_calloc(size_t count, size_t size);
+void *__libc_realloc(void *ptr, size_t size);
+void __libc_free(void *ptr);
+
+void *malloc(size_t size) {
+  ++gAllocationCount;
+  return __libc_malloc(size);
+}
+
+void *calloc(size_t count, size_t size) {
+  ++gAllocationCount;
+  return __libc_calloc(count, size);
+}
+
+void *realloc(void *ptr, size_t size) {
+  ++gAllocationCount;
+  return __libc_realloc(ptr, size);
+}
+
+void free(void *ptr) { __libc_free(ptr); }
+}
+#endif
+
+namespace {
+
+using Clock = std::chrono::steady_clock;
+
+// Results are accumulated here so that the benchmarked calls can't be optimized out
+uint64_t volatile gSink = 0;
+
+struct Options {
+  std::chrono::nanoseconds minTime = std::chrono::milliseconds{100};
+  std::string filter;
+  // The committed baseline, when built by CMake, which only has the allocations
+#ifdef BENCHMARK_BASELINE_FILE
+  std::string baselineFile = BENCHMARK_BASELINE_FILE;
+#else
+  std::string baselineFile;
+#endif
+  std::string writeBaselineFile;
+  bool allocationsOnly = false;
+  double tolerance = 0.25;
+};
+
+struct Result {
+  std::string name;
+  double nsPerOp;
+  // NaN when allocations aren't counted
+  double allocationsPerOp;
+};
+
+// Formats a result value into the buffer, with NaN (not measured) values as n/a
+char const *formatValue(char *pBuffer, size_t size, char const *pFormat, double value) {
+  if (std::isnan(value))
+    snprintf(pBuffer, size, "n/a");
+  else
+    snprintf(pBuffer, size, pFormat, value);
+  return pBuffer;
+}
+
+/**
+ * @brief Times batches of operations until the minimum time has been spent running them
+ * @param name is the name the results are reported under
+ * @param opsPerBatch is the number of operations each batch performs
+ * @param setup is run before each batch, and isn't timed
+ * @param batch runs the batch of operations being timed
+ */
+Result runBenchmark(Options const &options,
+                    std::string const &name,
+                    size_t opsPerBatch,
+                    std::function<void()> const &setup,
+                    std::function<void()> const &batch) {
+  // Warm-up run
+  setup();
+  batch();
+
+  uint64_t batchCount = 0;
+  uint64_t allocationCount = 0;
+  Clock::duration totalTime{0};
+  do {
+    setup();
+
+    uint64_t const startAllocationCount = gAllocationCount;
+    auto const startTime = Clock::now();
+    batch();
+    totalTime += Clock::now() - startTime;
+    allocationCount += gAllocationCount - startAllocationCount;
+
+    ++batchCount;
+  } while (totalTime < options.minTime);
+
+  double const opCount = static_cast<double>(batchCount * opsPerBatch);
+  return Result{
+      name,
+      static_cast<double>(std::chrono::duration_cast<std::chrono::nanoseconds>(totalTime).count()) /
+          opCount,
+#ifdef COUNT_ALLOCATIONS
+      static_cast<double>(allocationCount) / opCount,
+#else
+      NAN,
+#endif
+  };
+}
+
+// A value of a value set, along with how it is serialized
+struct Value {
+  STecVkValueSet const *pValueSet;
+  char const *pTypeName;
+  uint64_t value;
+  std::string serialized;
+};
+
+struct Values {
+  std::vector<Value> enums;
+  std::vector<Value> flags32;
+  std::vector<Value> flags64;
+  // Enums as their full names, ie. 'VK_IMAGE_LAYOUT_GENERAL' rather than 'GENERAL'
+  std::vector<Value> fullEnums;
+};
+
+void addValue(std::vector<Value> &values, STecVkValueSet const *pValueSet, uint64_t value) {
+  Value newValue{pValueSet, getValueSetName(pValueSet), value, {}};
+  if (pValueSet->type == ENUM_TYPE_FLAG64) {
+    vk_serialize_set(pValueSet, value, &newValue.serialized);
+  } else {
+    vk_serialize_set(pValueSet, static_cast<uint32_t>(value), &newValue.serialized);
+  }
+  values.emplace_back(std::move(newValue));
+}
+
+/**
+ * @brief Collects a realistic mix of values for every value set
+ *
+ * Plain enums are represented by each of their values. Bitmasks are represented by each of their
+ * named bits, along with no bits, all named bits, and a number of (deterministically) random
+ * combinations of the named bits.
+ */
+Values collectValues() {
+  Values values;
+  uint64_t random = 0x853C49E6748FEA9BULL;
+
+  for (uint32_t i = 0;; ++i) {
+    STecVkValueSet const *pValueSet = vk_get_value_set_at(i);
+    if (pValueSet == nullptr)
+      break;
+    if (pValueSet->count == 0)
+      continue;
+
+    if (pValueSet->type == ENUM_TYPE_ENUM) {
+      for (size_t j = 0; j < pValueSet->count; ++j) {
+        // Aliases serialize to the same name as their target, so skip them past the first
+        uint64_t const value = getValue(pValueSet, j);
+        bool seen = false;
+        for (size_t k = 0; k < j; ++k)
+          seen = seen || (getValue(pValueSet, k) == value);
+        if (seen)
+          continue;
+
+        addValue(values.enums, pValueSet, value);
+        Value fullValue = values.enums.back();
+        fullValue.serialized = getValueSetPrefix(pValueSet) + fullValue.serialized;
+        values.fullEnums.emplace_back(std::move(fullValue));
+      }
+    } else {
+      std::vector<Value> &flagValues =
+          (pValueSet->type == ENUM_TYPE_FLAG64) ? values.flags64 : values.flags32;
+
+      std::vector<uint64_t> bits;
+      uint64_t allBits = 0;
+      for (size_t j = 0; j < pValueSet->count; ++j) {
+        uint64_t const value = getValue(pValueSet, j);
+        if (value != 0 && (value & (value - 1)) == 0 && (allBits & value) == 0) {
+          bits.push_back(value);
+          allBits |= value;
+        }
+      }
+
+      addValue(flagValues, pValueSet, 0);
+      addValue(flagValues, pValueSet, allBits);
+      for (uint64_t bit : bits)
+        addValue(flagValues, pValueSet, bit);
+      for (size_t j = 0; j < bits.size(); ++j) {
+        random = random * 6364136223846793005ULL + 1442695040888963407ULL;
+        addValue(flagValues, pValueSet, (random >> 11) & allBits);
+      }
+    }
+  }
+
+  return values;
+}
+
+// Finds all recognized VkResult values, including those of every extension block
+std::vector<VkResult> collectResults() {
+  std::vector<VkResult> results;
+  for (int32_t value = -20; value <= 20; ++value) {
+    if (VkResult_to_string(static_cast<VkResult>(value)) != nullptr)
+      results.push_back(static_cast<VkResult>(value));
+  }
+  for (int32_t extension = 0; extension < 1000; ++extension) {
+    for (int32_t offset = 0; offset < 10; ++offset) {
+      int32_t const value = 1000000000 + extension * 1000 + offset;
+      if (VkResult_to_string(static_cast<VkResult>(value)) != nullptr)
+        results.push_back(static_cast<VkResult>(value));
+      if (VkResult_to_string(static_cast<VkResult>(-value)) != nullptr)
+        results.push_back(static_cast<VkResult>(-value));
+    }
+  }
+  return results;
+}
+
+char *allocString(char const *pStr) {
+  char *pNewStr = static_cast<char *>(std::malloc(strlen(pStr) + 1));
+  memcpy(pNewStr, pStr, strlen(pStr) + 1);
+  return pNewStr;
+}
+
+template <typename T>
+T *allocStruct() {
+  return static_cast<T *>(std::calloc(1, sizeof(T)));
+}
+
+// An instance create info as an application would typically fill out, with everything on the heap
+VkInstanceCreateInfo *createInstanceCreateInfo() {
+  auto *pAppInfo = allocStruct<VkApplicationInfo>();
+  pAppInfo->sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+  pAppInfo->pApplicationName = allocString("Benchmark");
+  pAppInfo->pEngineName = allocString("Vulkan Mini Libs 2");
+  pAppInfo->apiVersion = VK_API_VERSION_1_0;
+
+  auto **ppLayers = static_cast<char const **>(std::malloc(sizeof(char const *)));
+  ppLayers[0] = allocString("VK_LAYER_KHRONOS_validation");
+
+  char const *const cExtensions[] = {"VK_KHR_surface", "VK_KHR_xcb_surface", "VK_EXT_debug_utils"};
+  auto **ppExtensions = static_cast<char const **>(std::malloc(sizeof(cExtensions)));
+  for (size_t i = 0; i < 3; ++i)
+    ppExtensions[i] = allocString(cExtensions[i]);
+
+  auto *pDebugInfo = allocStruct<VkDebugUtilsMessengerCreateInfoEXT>();
+  pDebugInfo->sType = VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT;
+
+  auto *pCreateInfo = allocStruct<VkInstanceCreateInfo>();
+  pCreateInfo->sType = VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO;
+  pCreateInfo->pNext = pDebugInfo;
+  pCreateInfo->pApplicationInfo = pAppInfo;
+  pCreateInfo->enabledLayerCount = 1;
+  pCreateInfo->ppEnabledLayerNames = ppLayers;
+  pCreateInfo->enabledExtensionCount = 3;
+  pCreateInfo->ppEnabledExtensionNames = ppExtensions;
+  return pCreateInfo;
+}
+
+// A graphics pipeline create info with its usual set of states, with everything on the heap
+VkGraphicsPipelineCreateInfo *createGraphicsPipelineCreateInfo() {
+  auto *pStages = static_cast<VkPipelineShaderStageCreateInfo *>(
+      std::calloc(2, sizeof(VkPipelineShaderStageCreateInfo)));
+  for (size_t i = 0; i < 2; ++i) {
+    pStages[i].sType = VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO;
+    pStages[i].stage = (i == 0) ? VK_SHADER_STAGE_VERTEX_BIT : VK_SHADER_STAGE_FRAGMENT_BIT;
+    pStages[i].pName = allocString("main");
+  }
+
+  auto *pBindings = allocStruct<VkVertexInputBindingDescription>();
+  auto *pAttributes = static_cast<VkVertexInputAttributeDescription *>(
+      std::calloc(3, sizeof(VkVertexInputAttributeDescription)));
+  auto *pVertexInput = allocStruct<VkPipelineVertexInputStateCreateInfo>();
+  pVertexInput->sType = VK_STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO;
+  pVertexInput->vertexBindingDescriptionCount = 1;
+  pVertexInput->pVertexBindingDescriptions = pBindings;
+  pVertexInput->vertexAttributeDescriptionCount = 3;
+  pVertexInput->pVertexAttributeDescriptions = pAttributes;
+
+  auto *pInputAssembly = allocStruct<VkPipelineInputAssemblyStateCreateInfo>();
+  pInputAssembly->sType = VK_STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO;
+
+  auto *pViewport = allocStruct<VkPipelineViewportStateCreateInfo>();
+  pViewport->sType = VK_STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO;
+
+  auto *pRasterization = allocStruct<VkPipelineRasterizationStateCreateInfo>();
+  pRasterization->sType = VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO;
+
+  auto *pMultisample = allocStruct<VkPipelineMultisampleStateCreateInfo>();
+  pMultisample->sType = VK_STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO;
+
+  auto *pDepthStencil = allocStruct<VkPipelineDepthStencilStateCreateInfo>();
+  pDepthStencil->sType = VK_STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO;
+
+  auto *pAttachments = allocStruct<VkPipelineColorBlendAttachmentState>();
+  auto *pColorBlend = allocStruct<VkPipelineColorBlendStateCreateInfo>();
+  pColorBlend->sType = VK_STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO;
+  pColorBlend->attachmentCount = 1;
+  pColorBlend->pAttachments = pAttachments;
+
+  auto *pDynamicStates = static_cast<VkDynamicState *>(std::malloc(2 * sizeof(VkDynamicState)));
+  pDynamicStates[0] = VK_DYNAMIC_STATE_VIEWPORT;
+  pDynamicStates[1] = VK_DYNAMIC_STATE_SCISSOR;
+  auto *pDynamic = allocStruct<VkPipelineDynamicStateCreateInfo>();
+  pDynamic->sType = VK_STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO;
+  pDynamic->dynamicStateCount = 2;
+  pDynamic->pDynamicStates = pDynamicStates;
+
+  auto *pCreateInfo = allocStruct<VkGraphicsPipelineCreateInfo>();
+  pCreateInfo->sType = VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO;
+  pCreateInfo->stageCount = 2;
+  pCreateInfo->pStages = pStages;
+  pCreateInfo->pVertexInputState = pVertexInput;
+  pCreateInfo->pInputAssemblyState = pInputAssembly;
+  pCreateInfo->pViewportState = pViewport;
+  pCreateInfo->pRasterizationState = pRasterization;
+  pCreateInfo->pMultisampleState = pMultisample;
+  pCreateInfo->pDepthStencilState = pDepthStencil;
+  pCreateInfo->pColorBlendState = pColorBlend;
+  pCreateInfo->pDynamicState = pDynamic;
+  return pCreateInfo;
+}
+
+std::vector<Result> runBenchmarks(Options const &options) {
+  std::vector<Result> results;
+  auto run = [&](std::string const &name, size_t opsPerBatch, std::function<void()> const &setup,
+                 std::function<void()> const &batch) {
+    if (!options.filter.empty() && name.find(options.filter) == std::string::npos)
+      return;
+    results.emplace_back(runBenchmark(options, name, opsPerBatch, setup, batch));
+    char allocations[32];
+    printf("%-48s %12.2f %12s\n", results.back().name.c_str(), results.back().nsPerOp,
+           formatValue(allocations, sizeof(allocations), "%.2f", results.back().allocationsPerOp));
+    fflush(stdout);
+  };
+  auto runUntimedSetup = [&](std::string const &name, size_t opsPerBatch,
+                             std::function<void()> const &batch) {
+    run(name, opsPerBatch, [] {}, batch);
+  };
+
+  printf("%-48s %12s %12s\n", "Benchmark", "ns/op", "allocs/op");
+
+  // Value serialization
+  Values const values = collectValues();
+  struct ValueMix {
+    char const *pName;
+    std::vector<Value> const &values;
+    bool is64;
+  };
+  ValueMix const valueMixes[] = {
+      {"enums", values.enums, false},
+      {"flags", values.flags32, false},
+      {"flags64", values.flags64, true},
+  };
+
+  for (auto const &mix : valueMixes) {
+    std::string const suffix = std::string{" ("} + mix.pName + ")";
+    char buffer[VK_SERIALIZATION_BUFFER_SIZE];
+
+    runUntimedSetup(std::string{mix.is64 ? "vk_serialize64" : "vk_serialize32"} + suffix,
+                    mix.values.size(), [&] {
+                      for (auto const &value : mix.values) {
+                        uint32_t length = sizeof(buffer);
+                        if (mix.is64)
+                          vk_serialize64(value.pTypeName, value.value, &length, buffer);
+                        else
+                          vk_serialize32(value.pTypeName, static_cast<uint32_t>(value.value),
+                                         &length, buffer);
+                        gSink = gSink + length;
+                      }
+                    });
+
+    runUntimedSetup(std::string{mix.is64 ? "vk_serialize_set64" : "vk_serialize_set32"} + suffix,
+                    mix.values.size(), [&] {
+                      for (auto const &value : mix.values) {
+                        uint32_t length = sizeof(buffer);
+                        if (mix.is64)
+                          vk_serialize_set64(value.pValueSet, value.value, &length, buffer);
+                        else
+                          vk_serialize_set32(value.pValueSet, static_cast<uint32_t>(value.value),
+                                             &length, buffer);
+                        gSink = gSink + length;
+                      }
+                    });
+
+    runUntimedSetup("vk_serialize_set<T> std::string" + suffix, mix.values.size(), [&] {
+      for (auto const &value : mix.values) {
+        std::string serialized;
+        if (mix.is64)
+          vk_serialize_set(value.pValueSet, value.value, &serialized);
+        else
+          vk_serialize_set(value.pValueSet, static_cast<uint32_t>(value.value), &serialized);
+        gSink = gSink + serialized.size();
+      }
+    });
+  }
+
+  ValueMix const parseMixes[] = {
+      {"enums", values.enums, false},
+      {"full enums", values.fullEnums, false},
+      {"flags", values.flags32, false},
+      {"flags64", values.flags64, true},
+  };
+
+  for (auto const &mix : parseMixes) {
+    std::string const suffix = std::string{" ("} + mix.pName + ")";
+
+    runUntimedSetup(std::string{mix.is64 ? "vk_parse64" : "vk_parse32"} + suffix, mix.values.size(),
+                    [&] {
+                      for (auto const &value : mix.values) {
+                        uint64_t parsed = 0;
+                        if (mix.is64)
+                          vk_parse64(value.pTypeName, value.serialized.c_str(), &parsed);
+                        else
+                          vk_parse32(value.pTypeName, value.serialized.c_str(), &parsed);
+                        gSink = gSink + parsed;
+                      }
+                    });
+
+    runUntimedSetup(std::string{mix.is64 ? "vk_parse_set64" : "vk_parse_set32"} + suffix,
+                    mix.values.size(), [&] {
+                      for (auto const &value : mix.values) {
+                        uint64_t parsed = 0;
+                        if (mix.is64)
+                          vk_parse_set64(value.pValueSet, value.serialized.c_str(), &parsed);
+                        else
+                          vk_parse_set32(value.pValueSet, value.serialized.c_str(), &parsed);
+                        gSink = gSink + parsed;
+                      }
+                    });
+  }
+
+  // Result strings
+  std::vector<VkResult> const vkResults = collectResults();
+  runUntimedSetup("VkResult_to_string", vkResults.size(), [&] {
+    for (VkResult result : vkResults)
+      gSink = gSink + (uintptr_t)VkResult_to_string(result);
+  });
+
+  std::vector<char const *> vkResultStrings;
+  for (VkResult result : vkResults)
+    vkResultStrings.push_back(VkResult_to_string(result));
+  runUntimedSetup("VkResult_from_string", vkResultStrings.size(), [&] {
+    for (char const *pResultString : vkResultStrings) {
+      VkResult parsed = VK_SUCCESS;
+      VkResult_from_string(pResultString, &parsed);
+      gSink = gSink + parsed;
+    }
+  });
+
+  // Struct cleanup, where the structs to cleanup are created untimed
+  size_t const cCleanupBatchSize = 64;
+  std::vector<void *> structs;
+  run(
+      "cleanup_vk_struct (VkInstanceCreateInfo)", cCleanupBatchSize,
+      [&] {
+        structs.clear();
+        for (size_t i = 0; i < cCleanupBatchSize; ++i)
+          structs.push_back(createInstanceCreateInfo());
+      },
+      [&] {
+        for (void *pStruct : structs) {
+          cleanup_vk_struct(pStruct);
+          std::free(pStruct);
+        }
+      });
+  run(
+      "cleanup_vk_struct (VkGraphicsPipelineCreateInfo)", cCleanupBatchSize,
+      [&] {
+        structs.clear();
+        for (size_t i = 0; i < cCleanupBatchSize; ++i)
+          structs.push_back(createGraphicsPipelineCreateInfo());
+      },
+      [&] {
+        for (void *pStruct : structs) {
+          cleanup_vk_struct(pStruct);
+          std::free(pStruct);
+        }
+      });
+
+  // Struct comparison, of equal structs so that everything is compared
+  size_t const cCompareBatchSize = 1000;
+  {
+    VkInstanceCreateInfo *pInstance = createInstanceCreateInfo();
+    VkInstanceCreateInfo instanceCopy = *pInstance;
+    runUntimedSetup("compare_VkInstanceCreateInfo", cCompareBatchSize, [&] {
+      for (size_t i = 0; i < cCompareBatchSize; ++i)
+        gSink = gSink + compare_VkInstanceCreateInfo(pInstance, &instanceCopy);
+    });
+
+    VkGraphicsPipelineCreateInfo *pPipeline = createGraphicsPipelineCreateInfo();
+    VkGraphicsPipelineCreateInfo pipelineCopy = *pPipeline;
+    runUntimedSetup("compare_VkGraphicsPipelineCreateInfo", cCompareBatchSize, [&] {
+      for (size_t i = 0; i < cCompareBatchSize; ++i)
+        gSink = gSink + compare_VkGraphicsPipelineCreateInfo(pPipeline, &pipelineCopy);
+    });
+
+    runUntimedSetup("compare_vk_struct (VkGraphicsPipelineCreateInfo)", cCompareBatchSize, [&] {
+      for (size_t i = 0; i < cCompareBatchSize; ++i)
+        gSink = gSink + compare_vk_struct(pPipeline, &pipelineCopy);
+    });
+
+    VkPipelineColorBlendAttachmentState blendState1{};
+    VkPipelineColorBlendAttachmentState blendState2{};
+    runUntimedSetup("compare_VkPipelineColorBlendAttachmentState", cCompareBatchSize, [&] {
+      for (size_t i = 0; i < cCompareBatchSize; ++i)
+        gSink = gSink + compare_VkPipelineColorBlendAttachmentState(&blendState1, &blendState2);
+    });
+
+    VkImageCreateInfo image1{};
+    image1.sType = VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO;
+    VkImageCreateInfo image2 = image1;
+    runUntimedSetup("compare_VkImageCreateInfo", cCompareBatchSize, [&] {
+      for (size_t i = 0; i < cCompareBatchSize; ++i)
+        gSink = gSink + compare_VkImageCreateInfo(&image1, &image2);
+    });
+
+    cleanup_vk_struct(pPipeline);
+    std::free(pPipeline);
+    cleanup_vk_struct(pInstance);
+    std::free(pInstance);
+  }
+
+  // Struct copies, each made as a single allocation
+  size_t const cCopyBatchSize = 64;
+  {
+    VkInstanceCreateInfo *pInstance = createInstanceCreateInfo();
+    runUntimedSetup("copy_VkInstanceCreateInfo", cCopyBatchSize, [&] {
+      for (size_t i = 0; i < cCopyBatchSize; ++i) {
+        VkInstanceCreateInfo *pCopy = copy_VkInstanceCreateInfo(pInstance);
+        gSink = gSink + pCopy->enabledLayerCount;
+        std::free(pCopy);
+      }
+    });
+
+    VkGraphicsPipelineCreateInfo *pPipeline = createGraphicsPipelineCreateInfo();
+    runUntimedSetup("copy_VkGraphicsPipelineCreateInfo", cCopyBatchSize, [&] {
+      for (size_t i = 0; i < cCopyBatchSize; ++i) {
+        VkGraphicsPipelineCreateInfo *pCopy = copy_VkGraphicsPipelineCreateInfo(pPipeline);
+        gSink = gSink + pCopy->stageCount;
+        std::free(pCopy);
+      }
+    });
+
+    cleanup_vk_struct(pPipeline);
+    std::free(pPipeline);
+    cleanup_vk_struct(pInstance);
+    std::free(pInstance);
+  }
+
+  // Struct encoding, such as for persisting pipeline cache keys
+  size_t const cEncodeBatchSize = 64;
+  {
+    VkGraphicsPipelineCreateInfo *pPipeline = createGraphicsPipelineCreateInfo();
+    std::vector<char> encoded(encode_vk_struct(pPipeline, nullptr, 0));
+    runUntimedSetup("encode_vk_struct (VkGraphicsPipelineCreateInfo)", cEncodeBatchSize, [&] {
+      for (size_t i = 0; i < cEncodeBatchSize; ++i)
+        gSink = gSink + encode_vk_struct(pPipeline, encoded.data(), encoded.size());
+    });
+
+    runUntimedSetup("decode_vk_struct (VkGraphicsPipelineCreateInfo)", cEncodeBatchSize, [&] {
+      for (size_t i = 0; i < cEncodeBatchSize; ++i) {
+        auto *pDecoded = static_cast<VkGraphicsPipelineCreateInfo *>(
+            decode_vk_struct(encoded.data(), encoded.size()));
+        gSink = gSink + pDecoded->stageCount;
+        std::free(pDecoded);
+      }
+    });
+
+    cleanup_vk_struct(pPipeline);
+    std::free(pPipeline);
+  }
+
+  // Struct hashing, such as for keys of pipeline or sampler caches
+  size_t const cHashBatchSize = 1000;
+  {
+    VkGraphicsPipelineCreateInfo *pPipeline = createGraphicsPipelineCreateInfo();
+    runUntimedSetup("hash_VkGraphicsPipelineCreateInfo", cHashBatchSize, [&] {
+      for (size_t i = 0; i < cHashBatchSize; ++i)
+        gSink = gSink + hash_VkGraphicsPipelineCreateInfo(pPipeline);
+    });
+
+    runUntimedSetup("hash_vk_struct (VkGraphicsPipelineCreateInfo)", cHashBatchSize, [&] {
+      for (size_t i = 0; i < cHashBatchSize; ++i)
+        gSink = gSink + hash_vk_struct(pPipeline);
+    });
+
+    VkSamplerCreateInfo sampler{};
+    sampler.sType = VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO;
+    runUntimedSetup("hash_VkSamplerCreateInfo", cHashBatchSize, [&] {
+      for (size_t i = 0; i < cHashBatchSize; ++i)
+        gSink = gSink + hash_VkSamplerCreateInfo(&sampler);
+    });
+
+    cleanup_vk_struct(pPipeline);
+    std::free(pPipeline);
+  }
+
+  return results;
+}
+
+// Baseline values of '-' weren't measured, and aren't compared
+double parseBaselineValue(std::string const &value) {
+  return (value == "-") ? NAN : std::stod(value);
+}
+
+// Baseline files have a line for each benchmark, as tab-separated name, ns/op and allocs/op
+std::map<std::string, Result> readBaseline(std::string const &path) {
+  std::map<std::string, Result> baseline;
+  std::ifstream file{path};
+  if (!file) {
+    fprintf(stderr, "Error: Could not open baseline file: %s\n", path.c_str());
+    exit(EXIT_FAILURE);
+  }
+
+  std::string line;
+  while (std::getline(file, line)) {
+    if (line.empty() || line[0] == '#')
+      continue;
+
+    std::istringstream lineStream{line};
+    Result result;
+    std::string nsPerOp;
+    std::string allocationsPerOp;
+    if (!std::getline(lineStream, result.name, '\t') || !std::getline(lineStream, nsPerOp, '\t') ||
+        !std::getline(lineStream, allocationsPerOp)) {
+      fprintf(stderr, "Error: Malformed baseline line: %s\n", line.c_str());
+      exit(EXIT_FAILURE);
+    }
+    result.nsPerOp = parseBaselineValue(nsPerOp);
+    result.allocationsPerOp = parseBaselineValue(allocationsPerOp);
+    baseline[result.name] = result;
+  }
+
+  return baseline;
+}
+
+void writeBaseline(std::string const &path,
+                   std::vector<Result> const &results,
+                   bool allocationsOnly) {
+  std::ofstream file{path};
+  if (!file) {
+    fprintf(stderr, "Error: Could not open baseline file for writing: %s\n", path.c_str());
+    exit(EXIT_FAILURE);
+  }
+
+  file << "# name\tns/op\tallocs/op\n";
+  for (auto const &result : results) {
+    file << result.name << '\t';
+    if (allocationsOnly)
+      file << "-\t";
+    else
+      file << result.nsPerOp << '\t';
+    if (std::isnan(result.allocationsPerOp))
+      file << "-\n";
+    else
+      file << result.allocationsPerOp << '\n';
+  }
+}
+
+/**
+ * @brief Compares results against a baseline
+ * @return True if any result is slower than the baseline by more than the tolerance, or makes more
+ * allocations. Values that either side didn't measure aren't compared.
+ */
+bool checkRegressions(Options const &options, std::vector<Result> const &results) {
+  std::map<std::string, Result> const baseline = readBaseline(options.baselineFile);
+
+  bool regressed = false;
+  printf("\n%-48s %12s %12s\n", "Baseline comparison", "ns/op", "allocs/op");
+  for (auto const &result : results) {
+    auto it = baseline.find(result.name);
+    if (it == baseline.end()) {
+      printf("%-48s %12s %12s\n", result.name.c_str(), "new", "new");
+      continue;
+    }
+
+    // comparisons with NaN are false, so unmeasured values never regress
+    double const change = (result.nsPerOp - it->second.nsPerOp) / it->second.nsPerOp;
+    double const allocationChange = result.allocationsPerOp - it->second.allocationsPerOp;
+    bool const slower = change > options.tolerance;
+    bool const moreAllocations = allocationChange > 0.005;
+
+    char changeString[32];
+    char allocationString[32];
+    printf("%-48s %12s %12s%s\n", result.name.c_str(),
+           formatValue(changeString, sizeof(changeString), "%+.1f%%", change * 100.0),
+           formatValue(allocationString, sizeof(allocationString), "%+.2f", allocationChange),
+           (slower || moreAllocations) ? "  REGRESSION" : "");
+    regressed = regressed || slower || moreAllocations;
+  }
+
+  return regressed;
+}
+
+void printUsage(char const *pProgram) {
+  printf("Usage: %s [options]\n", pProgram);
+  printf(" --filter <STR>          Only run benchmarks with names containing the string\n");
+  printf(" --min-time <MS>         Minimum time to run each benchmark for (default: 100)\n");
+  printf(" --baseline <FILE>       Compare results to a baseline, failing on regressions\n");
+  printf(
+      "                         (default: the allocations of benchmark/benchmark_baseline.txt)\n");
+  printf(" --no-baseline           Don't compare results to any baseline\n");
+  printf(" --tolerance <PERCENT>   Slowdown allowed before it's a regression (default: 25)\n");
+  printf(" --write-baseline <FILE> Write the results as a new baseline\n");
+  printf(" --allocations-only      Only write the allocations to the new baseline, as the times\n");
+  printf("                         depend on the machine\n");
+}
+
+} // namespace
+
+int main(int argc, char **argv) {
+  Options options;
+  for (int i = 1; i < argc; ++i) {
+    std::string const arg = argv[i];
+    if (arg == "-h" || arg == "--help") {
+      printUsage(argv[0]);
+      return EXIT_SUCCESS;
+    } else if (arg == "--no-baseline") {
+      options.baselineFile.clear();
+    } else if (arg == "--allocations-only") {
+      options.allocationsOnly = true;
+    } else if (i + 1 == argc) {
+      printUsage(argv[0]);
+      return EXIT_FAILURE;
+    } else if (arg == "--filter") {
+      options.filter = argv[++i];
+    } else if (arg == "--min-time") {
+      options.minTime = std::chrono::milliseconds{std::atoi(argv[++i])};
+    } else if (arg == "--baseline") {
+      options.baselineFile = argv[++i];
+    } else if (arg == "--tolerance") {
+      options.tolerance = std::atof(argv[++i]) / 100.0;
+    } else if (arg == "--write-baseline") {
+      options.writeBaselineFile = argv[++i];
+    } else {
+      printUsage(argv[0]);
+      return EXIT_FAILURE;
+    }
+  }
+
+  std::vector<Result> const results = runBenchmarks(options);
+
+  if (!options.writeBaselineFile.empty())
+    writeBaseline(options.writeBaselineFile, results, options.allocationsOnly);
+
+  if (!options.baselineFile.empty() && checkRegressions(options, results))
+    return EXIT_FAILURE;
+
+  return EXIT_SUCCESS;
+}
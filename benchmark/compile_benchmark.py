@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2026 George Cave.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import glob
+import os
+import re
+import shlex
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+# Times how long the generated headers take to preprocess and compile, and how large the resulting
+# code and read-only data are, both when only the declarations are included and when the
+# definitions are compiled with the header's CONFIG_MAIN.
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'compile_baseline.txt')
+MODES = ['declarations', 'definitions']
+METRICS = ['preprocess ms', 'compile ms', '.text', '.rodata']
+
+
+def get_headers(include_dir):
+    # The generated C headers, along with the define that compiles their definitions
+    headers = []
+    for path in sorted(glob.glob(os.path.join(include_dir, 'vk_*.h'))):
+        name = os.path.basename(path)
+        config_main = name[:-len('.h')].upper() + '_CONFIG_MAIN'
+        with open(path, 'r') as header_file:
+            if config_main in header_file.read():
+                headers.append((name, config_main))
+    return headers
+
+
+def get_include_flags(vulkan_include):
+    # An empty directory is the compiler's own include paths
+    return ['-I', vulkan_include] if vulkan_include else []
+
+
+def get_header_version(compiler, vulkan_include, work_dir):
+    # The VK_HEADER_VERSION of the Vulkan headers, as seen by the compiler
+    source = os.path.join(work_dir, 'header_version.c')
+    with open(source, 'w') as source_file:
+        source_file.write('#include <vulkan/vulkan.h>\nVK_HEADER_VERSION\n')
+
+    result = subprocess.run([compiler, '-E', '-P'] + get_include_flags(vulkan_include) + [source],
+                            capture_output=True, text=True)
+    lines = result.stdout.split()
+    if result.returncode != 0 or not lines or not lines[-1].isdigit():
+        print('Error: Could not get the VK_HEADER_VERSION of the Vulkan headers: {}\n{}'.format(vulkan_include, result.stderr))
+        sys.exit(1)
+    return int(lines[-1])
+
+
+def get_compiler_id(compiler, work_dir):
+    # The compiler and its major version, such as 'gcc 14', as the sizes are only comparable between
+    # builds from the same one
+    source = os.path.join(work_dir, 'compiler_id.c')
+    with open(source, 'w') as source_file:
+        source_file.write('#if defined(__clang__)\nclang __clang_major__\n#elif defined(__GNUC__)\ngcc __GNUC__\n#else\nunknown 0\n#endif\n')
+
+    result = subprocess.run([compiler, '-E', '-P', source], capture_output=True, text=True)
+    if result.returncode != 0:
+        return 'unknown'
+    return ' '.join(result.stdout.split())
+
+
+def extract_vulkan_headers(docs_dir, version, out_dir):
+    # Extracts the Vulkan headers of the given version from a Vulkan-Docs repository, the same one
+    # that tools/generate.sh clones for the XML registry
+    tags = subprocess.run(['git', '-C', docs_dir, 'tag'], capture_output=True, text=True, check=True).stdout.split()
+    tag = next((tag for tag in tags if re.match(r'^v[0-9]+\.[0-9]+\.{}$'.format(version), tag)), None)
+    if tag is None:
+        print('Error: No tag found for version {} in: {}'.format(version, docs_dir))
+        sys.exit(1)
+
+    archive = subprocess.run(['git', '-C', docs_dir, 'archive', tag, 'include'], capture_output=True, check=True).stdout
+    subprocess.run(['tar', '-x', '-C', out_dir], input=archive, check=True)
+    return os.path.join(out_dir, 'include')
+
+
+def get_elf_section_sizes(path):
+    # Sums the sizes of the .text and .rodata sections (and any named .text.*/.rodata.*) of an ELF
+    # object, or returns zeroes for other object formats
+    sizes = {'.text': 0, '.rodata': 0}
+    with open(path, 'rb') as object_file:
+        data = object_file.read()
+    if data[:4] != b'\x7fELF':
+        return sizes
+
+    is_64 = data[4] == 2
+    endian = '<' if data[5] == 1 else '>'
+    if is_64:
+        shoff, = struct.unpack_from(endian + 'Q', data, 0x28)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', data, 0x3A)
+        section_format = endian + 'IIQQQQ'
+    else:
+        shoff, = struct.unpack_from(endian + 'I', data, 0x20)
+        shentsize, shnum, shstrndx = struct.unpack_from(endian + 'HHH', data, 0x2E)
+        section_format = endian + 'IIIIII'
+
+    sections = [struct.unpack_from(section_format, data, shoff + i * shentsize) for i in range(shnum)]
+    names_offset = sections[shstrndx][4]
+    for section in sections:
+        name_start = names_offset + section[0]
+        name = data[name_start:data.index(b'\0', name_start)].decode()
+        for key in sizes:
+            if name == key or name.startswith(key + '.'):
+                sizes[key] += section[5]
+    return sizes
+
+
+def time_command(command, repeat):
+    # The fastest of the runs, as the least disturbed by anything else running
+    fastest = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run(command, capture_output=True, text=True)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        if result.returncode != 0:
+            print('Error: Command failed: {}\n{}'.format(' '.join(command), result.stderr))
+            sys.exit(1)
+        fastest = elapsed if fastest is None else min(fastest, elapsed)
+    return fastest
+
+
+def run_benchmarks(args, vulkan_includes, work_dir):
+    results = []
+    include_dir = os.path.join(ROOT_DIR, 'include')
+    flags = shlex.split(args.flags)
+
+    print('{:<56} {:>14} {:>12} {:>10} {:>10}'.format('Benchmark', *METRICS))
+    for vulkan_include in vulkan_includes:
+        version = get_header_version(args.compiler, vulkan_include, work_dir)
+        for header, config_main in get_headers(include_dir):
+            for mode in MODES:
+                name = '{} {} v{}'.format(header, mode, version)
+                if args.filter and args.filter not in name:
+                    continue
+
+                source = os.path.join(work_dir, 'compile_benchmark.c')
+                with open(source, 'w') as source_file:
+                    if mode == 'definitions':
+                        source_file.write('#define {}\n'.format(config_main))
+                    source_file.write('#include <{}>\n'.format(header))
+
+                command = [args.compiler, '-std=c11', '-I', include_dir] + get_include_flags(vulkan_include) + flags
+                preprocess_ms = time_command(command + ['-E', source, '-o', os.path.join(work_dir, 'compile_benchmark.i')], args.repeat)
+                object_path = os.path.join(work_dir, 'compile_benchmark.o')
+                compile_ms = time_command(command + ['-c', source, '-o', object_path], args.repeat)
+                sizes = get_elf_section_sizes(object_path)
+
+                result = [name, preprocess_ms, compile_ms, sizes['.text'], sizes['.rodata']]
+                print('{:<56} {:>14.1f} {:>12.1f} {:>10} {:>10}'.format(*result))
+                results.append(result)
+
+    return results
+
+
+# Baseline files have a line for each benchmark, as tab-separated name and metrics, where a metric
+# of '-' isn't compared. The compiler and flags the sizes were measured with are given by a
+# '# build: ' line.
+def read_baseline(path):
+    baseline = {}
+    build_id = None
+    try:
+        baseline_file = open(path, 'r')
+    except:
+        print('Error: Could not open baseline file: ', path)
+        sys.exit(1)
+
+    for line in baseline_file:
+        if line.startswith('# build: '):
+            build_id = line[len('# build: '):].strip()
+        if not line.strip() or line.startswith('#'):
+            continue
+        line_data = line.rstrip('\n').split('\t')
+        if len(line_data) != len(METRICS) + 1:
+            print('Error: Malformed baseline line: ', line)
+            sys.exit(1)
+        baseline[line_data[0]] = [None if value == '-' else float(value) for value in line_data[1:]]
+    return baseline, build_id
+
+
+def write_baseline(path, results, build_id, sizes_only):
+    with open(path, 'w') as baseline_file:
+        baseline_file.write('# build: {}\n'.format(build_id))
+        baseline_file.write('# name\t{}\n'.format('\t'.join(METRICS)))
+        for result in results:
+            if sizes_only:
+                baseline_file.write('{}\t-\t-\t{}\t{}\n'.format(result[0], result[3], result[4]))
+            else:
+                baseline_file.write('{}\t{:.1f}\t{:.1f}\t{}\t{}\n'.format(*result))
+
+
+def check_regressions(args, results, build_id):
+    # Whether any result is over its baseline by more than the tolerance, that of the times being
+    # larger as they are noisier than the sizes. Sizes are only compared when measured with the same
+    # compiler and flags as the baseline.
+    baseline, baseline_build_id = read_baseline(args.baseline)
+    tolerances = [args.tolerance, args.tolerance, args.size_tolerance, args.size_tolerance]
+    compare_sizes = baseline_build_id is None or baseline_build_id == build_id
+    if not compare_sizes:
+        print('\nSizes are not compared, as the baseline is of {} rather than {}'.format(baseline_build_id, build_id))
+
+    regressed = False
+    print('\n{:<56} {:>14} {:>12} {:>10} {:>10}'.format('Baseline comparison', *METRICS))
+    for result in results:
+        name = result[0]
+        if name not in baseline:
+            print('{:<56} {:>14} {:>12} {:>10} {:>10}'.format(name, *(['new'] * len(METRICS))))
+            continue
+
+        changes = []
+        result_regressed = False
+        for index, (value, baseline_value, tolerance) in enumerate(zip(result[1:], baseline[name], tolerances)):
+            if baseline_value is None or (index >= 2 and not compare_sizes):
+                changes.append('-')
+                continue
+            if baseline_value:
+                change = (value - baseline_value) / baseline_value
+            else:
+                change = float('inf') if value > 0 else 0.0
+            changes.append('{:+.1f}%'.format(change * 100.0))
+            result_regressed = result_regressed or change > tolerance / 100.0
+        print('{:<56} {:>14} {:>12} {:>10} {:>10}{}'.format(name, *changes, '  REGRESSION' if result_regressed else ''))
+        regressed = regressed or result_regressed
+
+    return regressed
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description='Benchmarks the compile time and binary size of the generated headers')
+    parser.add_argument('--compiler',
+                        help='The C compiler to use, which has to take GCC/Clang style options (default: $CC or cc)',
+                        default=os.environ.get('CC', 'cc'))
+    parser.add_argument('--flags',
+                        help='Extra flags to compile with (default: -O2)',
+                        default='-O2')
+    parser.add_argument('--vulkan-include',
+                        help='A directory of Vulkan headers to compile against, can be given for each version to measure (default: the compiler\'s own)',
+                        action='append', default=[])
+    parser.add_argument('--vulkan-docs',
+                        help='A Vulkan-Docs repository to extract the headers of each of --versions from')
+    parser.add_argument('--versions',
+                        help='Comma-separated list of header versions to extract from --vulkan-docs')
+    parser.add_argument('--filter',
+                        help='Only run benchmarks with names containing the string')
+    parser.add_argument('--repeat',
+                        help='Times to run each command, taking the fastest (default: 3)',
+                        type=int, default=3)
+    parser.add_argument('--baseline',
+                        help='Compare results to a baseline, failing on regressions (default: the sizes of benchmark/compile_baseline.txt)',
+                        default=DEFAULT_BASELINE)
+    parser.add_argument('--no-baseline',
+                        help='Don\'t compare results to any baseline',
+                        action='store_true')
+    parser.add_argument('--tolerance',
+                        help='Percentage the times can increase by before it\'s a regression (default: 25)',
+                        type=float, default=25.0)
+    parser.add_argument('--size-tolerance',
+                        help='Percentage the sizes can increase by before it\'s a regression (default: 5)',
+                        type=float, default=5.0)
+    parser.add_argument('--write-baseline',
+                        help='Write the results as a new baseline')
+    parser.add_argument('--sizes-only',
+                        help='Only write the sizes to the new baseline, as the times depend on the machine',
+                        action='store_true')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        vulkan_includes = list(args.vulkan_include)
+        if args.vulkan_docs:
+            if not args.versions:
+                print('Error: --versions is required with --vulkan-docs')
+                sys.exit(1)
+            for version in args.versions.split(','):
+                version_dir = os.path.join(work_dir, 'v' + version.strip())
+                os.mkdir(version_dir)
+                vulkan_includes.append(extract_vulkan_headers(args.vulkan_docs, version.strip(), version_dir))
+        if not vulkan_includes:
+            vulkan_includes = ['']
+
+        results = run_benchmarks(args, vulkan_includes, work_dir)
+        build_id = ' '.join([get_compiler_id(args.compiler, work_dir)] + shlex.split(args.flags))
+
+    if args.write_baseline:
+        write_baseline(args.write_baseline, results, build_id, args.sizes_only)
+
+    if not args.no_baseline and check_regressions(args, results, build_id):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
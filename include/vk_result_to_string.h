@@ -29,6 +29,9 @@ extern "C" {
 
 #include <vulkan/vulkan.h>
 
+#include <stdbool.h>
+#include <stddef.h>
+
 #ifdef __cplusplus
 static_assert(VK_HEADER_VERSION >= 72,
               "VK_HEADER_VERSION is lower than the minimum supported version (v72)");
@@ -50,12 +53,26 @@ _Static_assert(VK_HEADER_VERSION >= 72,
 /// returns NULL.
 char const *VkResult_to_string(VkResult result);
 
+/// Parses a string representing a VkResult value into pResult. Both the names returned by
+/// VkResult_to_string and any other names for the same values are accepted, where the comparison is
+/// case insensitive, spaces can be used in place of underscores, the 'VK_' prefix is optional
+/// and any surrounding whitespace is ignored. Returns true if the string was recognized and pResult
+/// set, otherwise returns false and pResult is not modified.
+bool VkResult_from_string(char const *pString, VkResult *pResult);
+
+/// Same as VkResult_from_string, except that the string is of the given length, rather than
+/// null-terminated.
+bool VkResult_from_string_n(char const *pString, size_t length, VkResult *pResult);
+
 /// Similar to VkResult_to_string, except in the case where it is an unknown value, returns a string
 /// stating '(unrecognized positive/negative VkResult value)', thus never returning NULL.
 char const *vkResultToString(VkResult result);
 
 #ifdef VK_RESULT_TO_STRING_CONFIG_MAIN
 
+#include <ctype.h>
+#include <string.h>
+
 char const *VkResult_to_string(VkResult result) {
   // Check in descending order to get the 'latest' version of the error code text available.
   // Also, because codes have been re-used over time, can't use a switch and have to do this large
@@ -170,6 +187,156 @@ char const *VkResult_to_string(VkResult result) {
   }
 }
 
+static uint16_t const cVkResultHashSeeds[31] = {
+    0, 5, 3, 10, 1,  1,  8,  2,  5, 1, 1,  7, 1,  6, 10, 4,
+    9, 3, 1, 18, 15, 12, 12, 13, 1, 9, 39, 2, 14, 3, 4,
+};
+
+static char const *const cVkResultHashNames[64] = {
+    "INCOMPATIBLE_SHADER_BINARY_EXT",
+    "ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS_KHR",
+    "ERROR_OUT_OF_HOST_MEMORY",
+    "ERROR_INVALID_EXTERNAL_HANDLE",
+    "ERROR_OUT_OF_POOL_MEMORY_KHR",
+    "ERROR_VIDEO_PROFILE_FORMAT_NOT_SUPPORTED_KHR",
+    "ERROR_SURFACE_LOST_KHR",
+    "ERROR_COMPRESSION_EXHAUSTED_EXT",
+    "SUBOPTIMAL_KHR",
+    "ERROR_FRAGMENTED_POOL",
+    "ERROR_INCOMPATIBLE_VERSION_KHR",
+    "EVENT_SET",
+    "ERROR_VIDEO_STD_VERSION_NOT_SUPPORTED_KHR",
+    "ERROR_PIPELINE_COMPILE_REQUIRED_EXT",
+    "PIPELINE_COMPILE_REQUIRED",
+    "ERROR_VIDEO_PROFILE_CODEC_NOT_SUPPORTED_KHR",
+    "OPERATION_DEFERRED_KHR",
+    "SUCCESS",
+    "ERROR_VALIDATION_FAILED_EXT",
+    "ERROR_IMAGE_USAGE_NOT_SUPPORTED_KHR",
+    "ERROR_FULL_SCREEN_EXCLUSIVE_MODE_LOST_EXT",
+    "PIPELINE_COMPILE_REQUIRED_EXT",
+    "PIPELINE_BINARY_MISSING_KHR",
+    "NOT_READY",
+    "ERROR_INVALID_OPAQUE_CAPTURE_ADDRESS",
+    "ERROR_INITIALIZATION_FAILED",
+    "ERROR_INVALID_DEVICE_ADDRESS_EXT",
+    "ERROR_INCOMPATIBLE_SHADER_BINARY_EXT",
+    "ERROR_NOT_PERMITTED_KHR",
+    "ERROR_INVALID_EXTERNAL_HANDLE_KHR",
+    "ERROR_VIDEO_PROFILE_OPERATION_NOT_SUPPORTED_KHR",
+    "ERROR_INCOMPATIBLE_DISPLAY_KHR",
+    NULL,
+    "ERROR_OUT_OF_DEVICE_MEMORY",
+    "EVENT_RESET",
+    "ERROR_VIDEO_PICTURE_LAYOUT_NOT_SUPPORTED_KHR",
+    "ERROR_NOT_PERMITTED",
+    "TIMEOUT",
+    "ERROR_FEATURE_NOT_PRESENT",
+    "ERROR_DEVICE_LOST",
+    "ERROR_FORMAT_NOT_SUPPORTED",
+    "ERROR_NOT_ENOUGH_SPACE_KHR",
+    "ERROR_FRAGMENTATION_EXT",
+    "ERROR_TOO_MANY_OBJECTS",
+    "ERROR_NATIVE_WINDOW_IN_USE_KHR",
+    "ERROR_MEMORY_MAP_FAILED",
+    "INCOMPLETE",
+    "ERROR_PRESENT_TIMING_QUEUE_FULL_EXT",
+    "ERROR_VALIDATION_FAILED",
+    "THREAD_DONE_KHR",
+    "ERROR_INVALID_VIDEO_STD_PARAMETERS_KHR",
+    "OPERATION_NOT_DEFERRED_KHR",
+    "THREAD_IDLE_KHR",
+    NULL,
+    "ERROR_OUT_OF_DATE_KHR",
+    "ERROR_EXTENSION_NOT_PRESENT",
+    "ERROR_INCOMPATIBLE_DRIVER",
+    "ERROR_OUT_OF_POOL_MEMORY",
+    "ERROR_NOT_PERMITTED_EXT",
+    "ERROR_INVALID_SHADER_NV",
+    "ERROR_LAYER_NOT_PRESENT",
+    "ERROR_UNKNOWN",
+    "ERROR_INVALID_DRM_FORMAT_MODIFIER_PLANE_LAYOUT_EXT",
+    "ERROR_FRAGMENTATION",
+};
+
+static int32_t const cVkResultHashValues[64] = {
+    1000482000,  -1000257000, -1,          -1000072003, -1000069000, -1000023003, -1000000000,
+    -1000338000, 1000001003,  -12,         -1000150000, 3,           -1000023005, 1000297000,
+    1000297000,  -1000023004, 1000268002,  0,           -1000011001, -1000023000, -1000255000,
+    1000297000,  1000483000,  1,           -1000257000, -3,          -1000257000, 1000482000,
+    -1000174001, -1000072003, -1000023002, -1000003001, 0,           -2,          4,
+    -1000023001, -1000174001, 2,           -8,          -4,          -11,         -1000483000,
+    -1000161000, -10,         -1000000001, -5,          5,           -1000208000, -1000011001,
+    1000268001,  -1000299000, 1000268003,  1000268000,  0,           -1000001004, -7,
+    -9,          -1000069000, -1000174001, -1000012000, -6,          -13,         -1000158000,
+    -1000161000,
+};
+
+/// Formats a character being parsed to match the names, with spaces as underscores and all other
+/// characters capitalized. Names are plain ASCII, so this avoids the locale lookups of toupper.
+static char formatVkResultChar(char ch) {
+  if (ch == ' ')
+    return '_';
+  if (ch >= 'a' && ch <= 'z')
+    return (char)(ch - 'a' + 'A');
+  return ch;
+}
+
+bool VkResult_from_string(char const *pString, VkResult *pResult) {
+  if (pString == NULL)
+    return false;
+
+  return VkResult_from_string_n(pString, strlen(pString), pResult);
+}
+
+bool VkResult_from_string_n(char const *pString, size_t length, VkResult *pResult) {
+  if (pString == NULL)
+    return false;
+
+  // Trim whitespace from either end
+  char const *pEnd = pString + length;
+  while (pString != pEnd && isspace((unsigned char)*pString))
+    ++pString;
+  while (pEnd != pString && isspace((unsigned char)pEnd[-1]))
+    --pEnd;
+  length = (size_t)(pEnd - pString);
+
+  // Skip the optional prefix
+  if (length > 3 && formatVkResultChar(pString[0]) == 'V' &&
+      formatVkResultChar(pString[1]) == 'K' && formatVkResultChar(pString[2]) == '_') {
+    pString += 3;
+    length -= 3;
+  }
+
+  // 32-bit FNV-1a of the formatted name
+  uint32_t hash = 2166136261U;
+  for (size_t i = 0; i < length; ++i) {
+    hash = (hash ^ (unsigned char)formatVkResultChar(pString[i])) * 16777619U;
+  }
+
+  // Displace by the seed of the hash's bucket, then mix to find the only slot the name can be in
+  uint32_t slot = hash ^ cVkResultHashSeeds[hash % 31];
+  slot ^= slot >> 16;
+  slot *= 0x85EBCA6BU;
+  slot ^= slot >> 13;
+  slot *= 0xC2B2AE35U;
+  slot ^= slot >> 16;
+  slot %= 64;
+
+  char const *pName = cVkResultHashNames[slot];
+  if (pName == NULL)
+    return false;
+  for (size_t i = 0; i < length; ++i) {
+    if (pName[i] == '\0' || formatVkResultChar(pString[i]) != pName[i])
+      return false;
+  }
+  if (pName[length] != '\0')
+    return false;
+
+  *pResult = (VkResult)cVkResultHashValues[slot];
+  return true;
+}
+
 char const *vkResultToString(VkResult result) {
   char const *pResultString = VkResult_to_string(result);
   if (pResultString != NULL)
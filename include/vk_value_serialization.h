@@ -22,6 +22,14 @@
 
     so that the definitions are compiled somewhere following the one definition rule, either from
     this header *OR* the vk_value_serialization.hpp header.
+
+    Optionally, also define on that compilation unit:
+    #define VK_VALUE_SERIALIZATION_CONFIG_CACHE
+
+    to have each thread keep a small cache of recently serialized values, so that serializing the
+    same value of the same type again is just a copy of the cached string. The number of entries
+    and the longest string cached can be changed by defining VK_VALUE_SERIALIZATION_CACHE_SIZE
+    (default 64) and VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE (default 128).
 */
 
 #ifdef __cplusplus
@@ -170,21 +178,144 @@ STecVkSerializationResult vk_parse64(char const *pVkType,
                                      char const *pVkString,
                                      void *pParsedValue);
 
+/// Opaque handle to the set of values of a single Vulkan enumerator/flag type
+typedef struct STecVkValueSet STecVkValueSet;
+
+/**
+ * @brief Finds the value set for a Vulkan enumerator/flag type
+ * @param pVkType is a pointer to the string name of the Vulkan enumerator/flag type
+ * @return Pointer to the type's value set, or NULL if the type could not be determined or found.
+ *
+ * The returned value set is valid for the lifetime of the program, and can be used with the
+ * vk_serialize_set32/64 and vk_parse_set32/64 functions to skip resolving the type name on every
+ * call.
+ */
+STecVkValueSet const *vk_get_value_set(char const *pVkType);
+
+/**
+ * @brief Returns the value set at the given index
+ * @param index is the index of the value set
+ * @return Pointer to the value set, or NULL if the index is out of range.
+ *
+ * The indices of each type's value set are fixed for a given version of this header, and are
+ * available at compile-time in C++ via the vk_value_set namespace.
+ */
+STecVkValueSet const *vk_get_value_set_at(uint32_t index);
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type (32-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param vkValue is the numeric value being serialized
+ * @param pSerializedLength is a pointer to an integer related to the size of pSerialized, as
+ * described in vk_serialize32.
+ * @param pSerialized is either NULL or a pointer to an character array.
+ *
+ * Behaves the same as vk_serialize32, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_serialize_set32(STecVkValueSet const *pValueSet,
+                                             uint32_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized);
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type (64-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param vkValue is the numeric value being serialized
+ * @param pSerializedLength is a pointer to an integer related to the size of pSerialized, as
+ * described in vk_serialize64.
+ * @param pSerialized is either NULL or a pointer to an character array.
+ *
+ * Behaves the same as vk_serialize64, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_serialize_set64(STecVkValueSet const *pValueSet,
+                                             uint64_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (32-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse32, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_parse_set32(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (64-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse64, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_parse_set64(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (32-bit) of a given length
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed, which doesn't need to be
+ * null-terminated
+ * @param stringLength is the number of characters of pVkString to parse
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse_set32. The string is parsed in place, and is neither copied nor
+ * modified.
+ */
+STecVkSerializationResult vk_parse_set_n32(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (64-bit) of a given length
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed, which doesn't need to be
+ * null-terminated
+ * @param stringLength is the number of characters of pVkString to parse
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse_set64. The string is parsed in place, and is neither copied nor
+ * modified.
+ */
+STecVkSerializationResult vk_parse_set_n64(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue);
+
 #ifdef VK_VALUE_SERIALIZATION_CONFIG_MAIN
-#include <assert.h>
 #include <ctype.h>
 #include <stdbool.h>
-#include <stdlib.h>
 #include <string.h>
+#ifdef _MSC_VER
+#include <intrin.h>
+#endif
+
+#define cNoValueIndex 0xFFFF
+
+#define cExtensionValueBase 1000000000
 
 #define cVendorCount sizeof(cVendorList) / sizeof(char const *)
 char const *cVendorList[43] = {
-    "IMG",        "AMD",   "AMDX",   "ARM",   "FSL",     "BRCM",       "NXP",     "NV",
-    "NVX",        "VIV",   "VSI",    "KDAB",  "ANDROID", "CHROMIUM",   "FUCHSIA", "GGP",
-    "GOOGLE",     "QCOM",  "LUNARG", "NZXT",  "SAMSUNG", "SEC",        "TIZEN",   "RENDERDOC",
-    "NN",         "MVK",   "KHR",    "KHX",   "EXT",     "MESA",       "INTEL",   "HUAWEI",
-    "OHOS",       "VALVE", "QNX",    "JUICE", "FB",      "RASTERGRID", "MSFT",    "SHADY",
-    "FREDEMMOTT", "MTK",   "OPENXR",
+    "FREDEMMOTT", "RASTERGRID", "RENDERDOC", "CHROMIUM", "ANDROID", "FUCHSIA", "SAMSUNG", "GOOGLE",
+    "HUAWEI",     "LUNARG",     "OPENXR",    "INTEL",    "JUICE",   "SHADY",   "TIZEN",   "VALVE",
+    "AMDX",       "BRCM",       "KDAB",      "MESA",     "MSFT",    "NZXT",    "OHOS",    "QCOM",
+    "AMD",        "ARM",        "EXT",       "FSL",      "GGP",     "IMG",     "KHR",     "KHX",
+    "MTK",        "MVK",        "NVX",       "NXP",      "QNX",     "SEC",     "VIV",     "VSI",
+    "FB",         "NN",         "NV",
 };
 
 static char const *const VkFramebufferCreateFlagsStrings[2] = {
@@ -197,6 +328,10 @@ static uint32_t const VkFramebufferCreateFlagsValues[2] = {
     0x00000001, // IMAGELESS
 };
 
+static uint16_t const VkFramebufferCreateFlagsBitIndices[1] = {
+    1, // IMAGELESS
+};
+
 static char const *const VkQueryPoolCreateFlagsStrings[1] = {
     "RESET_BIT_KHR", // 0x00000001
 };
@@ -205,6 +340,10 @@ static uint32_t const VkQueryPoolCreateFlagsValues[1] = {
     0x00000001, // RESET_BIT_KHR
 };
 
+static uint16_t const VkQueryPoolCreateFlagsBitIndices[1] = {
+    0, // RESET_BIT_KHR
+};
+
 static char const *const VkRenderPassCreateFlagsStrings[6] = {
     "RESERVED_0_BIT_KHR",                   // 0x00000001
     "VK_RENDER_PASS_RESERVED_BIT_1_QCOM",   // 0x00000002
@@ -223,6 +362,13 @@ static uint32_t const VkRenderPassCreateFlagsValues[6] = {
     0x00000008, // RESERVED_3_BIT_IMG
 };
 
+static uint16_t const VkRenderPassCreateFlagsBitIndices[4] = {
+    0, // RESERVED_0_BIT_KHR
+    2, // TRANSFORM_BIT_QCOM
+    4, // PER_LAYER_FRAGMENT_DENSITY_BIT_VALVE
+    5, // RESERVED_3_BIT_IMG
+};
+
 static char const *const VkSamplerCreateFlagsStrings[7] = {
     "SUBSAMPLED_BIT_EXT",                       // 0x00000001
     "SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT", // 0x00000002
@@ -243,6 +389,14 @@ static uint32_t const VkSamplerCreateFlagsValues[7] = {
     0x00000008, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
 };
 
+static uint16_t const VkSamplerCreateFlagsBitIndices[5] = {
+    0, // SUBSAMPLED_BIT_EXT
+    1, // SUBSAMPLED_COARSE_RECONSTRUCTION_BIT_EXT
+    5, // NON_SEAMLESS_CUBE_MAP_BIT_EXT
+    6, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
+    4, // IMAGE_PROCESSING_BIT_QCOM
+};
+
 static char const *const VkPipelineLayoutCreateFlagsStrings[4] = {
     "RESERVED_0_BIT_AMD",       // 0x00000001
     "RESERVED_1_BIT_AMD",       // 0x00000002
@@ -257,7 +411,13 @@ static uint32_t const VkPipelineLayoutCreateFlagsValues[4] = {
     0x00000004, // NO_TASK_SHADER_BIT_KHR
 };
 
-static char const *const VkPipelineCacheCreateFlagsStrings[8] = {
+static uint16_t const VkPipelineLayoutCreateFlagsBitIndices[3] = {
+    0, // RESERVED_0_BIT_AMD
+    2, // INDEPENDENT_SETS_BIT_EXT
+    3, // NO_TASK_SHADER_BIT_KHR
+};
+
+static char const *const VkPipelineCacheCreateFlagsStrings[7] = {
     "EXTERNALLY_SYNCHRONIZED_BIT_EXT",       // 0x00000001
     "RESERVED_1_BIT_KHR",                    // 0x00000002
     "RESERVED_1_BIT_EXT",                    // 0x00000002
@@ -267,7 +427,7 @@ static char const *const VkPipelineCacheCreateFlagsStrings[8] = {
     "INTERNALLY_SYNCHRONIZED_MERGE_BIT_KHR", // 0x00000008
 };
 
-static uint32_t const VkPipelineCacheCreateFlagsValues[8] = {
+static uint32_t const VkPipelineCacheCreateFlagsValues[7] = {
     0x00000001, // EXTERNALLY_SYNCHRONIZED_BIT_EXT
     0x00000002, // RESERVED_1_BIT_KHR
     0x00000002, // RESERVED_1_BIT_EXT
@@ -277,6 +437,13 @@ static uint32_t const VkPipelineCacheCreateFlagsValues[8] = {
     0x00000008, // INTERNALLY_SYNCHRONIZED_MERGE_BIT_KHR
 };
 
+static uint16_t const VkPipelineCacheCreateFlagsBitIndices[4] = {
+    5, // EXTERNALLY_SYNCHRONIZED
+    2, // RESERVED_1_BIT_EXT
+    4, // RESERVED_2_BIT_KHR
+    6, // INTERNALLY_SYNCHRONIZED_MERGE_BIT_KHR
+};
+
 static char const *const VkPipelineDepthStencilStateCreateFlagsStrings[4] = {
     "RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_ARM",   // 0x00000001
     "RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_ARM", // 0x00000002
@@ -291,6 +458,11 @@ static uint32_t const VkPipelineDepthStencilStateCreateFlagsValues[4] = {
     0x00000002, // RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT
 };
 
+static uint16_t const VkPipelineDepthStencilStateCreateFlagsBitIndices[2] = {
+    2, // RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT
+    3, // RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT
+};
+
 static char const *const VkPipelineColorBlendStateCreateFlagsStrings[2] = {
     "RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_ARM", // 0x00000001
     "RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT", // 0x00000001
@@ -301,6 +473,10 @@ static uint32_t const VkPipelineColorBlendStateCreateFlagsValues[2] = {
     0x00000001, // RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT
 };
 
+static uint16_t const VkPipelineColorBlendStateCreateFlagsBitIndices[1] = {
+    1, // RASTERIZATION_ORDER_ATTACHMENT_ACCESS_BIT_EXT
+};
+
 static char const *const VkPipelineShaderStageCreateFlagsStrings[6] = {
     "ALLOW_VARYING_SUBGROUP_SIZE_BIT_EXT", // 0x00000001
     "REQUIRE_FULL_SUBGROUPS_BIT_EXT",      // 0x00000002
@@ -319,6 +495,13 @@ static uint32_t const VkPipelineShaderStageCreateFlagsValues[6] = {
     0x00000002, // REQUIRE_FULL_SUBGROUPS
 };
 
+static uint16_t const VkPipelineShaderStageCreateFlagsBitIndices[4] = {
+    4, // ALLOW_VARYING_SUBGROUP_SIZE
+    5, // REQUIRE_FULL_SUBGROUPS
+    2, // RESERVED_2_BIT_NV
+    3, // RESERVED_3_BIT_KHR
+};
+
 static char const *const VkDescriptorSetLayoutCreateFlagsStrings[15] = {
     "PUSH_DESCRIPTOR_BIT_KHR",                       // 0x00000001
     "UPDATE_AFTER_BIND_POOL_BIT_EXT",                // 0x00000002
@@ -355,6 +538,17 @@ static uint32_t const VkDescriptorSetLayoutCreateFlagsValues[15] = {
     0x00000001, // PUSH_DESCRIPTOR
 };
 
+static uint16_t const VkDescriptorSetLayoutCreateFlagsBitIndices[8] = {
+    14, // PUSH_DESCRIPTOR
+    3,  // UPDATE_AFTER_BIND_POOL
+    8,  // HOST_ONLY_POOL_BIT_EXT
+    5,  // RESERVED_3_BIT_AMD
+    9,  // DESCRIPTOR_BUFFER_BIT_EXT
+    10, // EMBEDDED_IMMUTABLE_SAMPLERS_BIT_EXT
+    13, // PER_STAGE_BIT_NV
+    12, // INDIRECT_BINDABLE_BIT_NV
+};
+
 static char const *const VkInstanceCreateFlagsStrings[2] = {
     "ENUMERATE_PORTABILITY_BIT_KHR", // 0x00000001
     "RESERVED_616_BIT_EXT",          // 0x00000002
@@ -365,6 +559,11 @@ static uint32_t const VkInstanceCreateFlagsValues[2] = {
     0x00000002, // RESERVED_616_BIT_EXT
 };
 
+static uint16_t const VkInstanceCreateFlagsBitIndices[2] = {
+    0, // ENUMERATE_PORTABILITY_BIT_KHR
+    1, // RESERVED_616_BIT_EXT
+};
+
 static char const *const VkDeviceQueueCreateFlagsStrings[4] = {
     "PROTECTED",                       // 0x00000001
     "RESERVED_1_BIT_QCOM",             // 0x00000002
@@ -379,6 +578,12 @@ static uint32_t const VkDeviceQueueCreateFlagsValues[4] = {
     0x00000004, // INTERNALLY_SYNCHRONIZED_BIT_KHR
 };
 
+static uint16_t const VkDeviceQueueCreateFlagsBitIndices[3] = {
+    0, // PROTECTED
+    1, // RESERVED_1_BIT_QCOM
+    3, // INTERNALLY_SYNCHRONIZED_BIT_KHR
+};
+
 static char const *const VkQueueFlagsStrings[18] = {
     "GRAPHICS",             // 0x00000001
     "COMPUTE",              // 0x00000002
@@ -421,6 +626,23 @@ static uint32_t const VkQueueFlagsValues[18] = {
     0x00002000, // RESERVED_13_BIT_EXT
 };
 
+static uint16_t const VkQueueFlagsBitIndices[14] = {
+    0,  // GRAPHICS
+    1,  // COMPUTE
+    2,  // TRANSFER
+    3,  // SPARSE_BINDING
+    4,  // PROTECTED
+    7,  // VIDEO_DECODE_BIT_KHR
+    8,  // VIDEO_ENCODE_BIT_KHR
+    9,  // RESERVED_7_BIT_QCOM
+    12, // OPTICAL_FLOW_BIT_NV
+    11, // RESERVED_9_BIT_EXT
+    15, // DATA_GRAPH_BIT_ARM
+    13, // RESERVED_11_BIT_ARM
+    16, // RESERVED_12_BIT_EXT
+    17, // RESERVED_13_BIT_EXT
+};
+
 static char const *const VkMemoryPropertyFlagsStrings[11] = {
     "DEVICE_LOCAL",            // 0x00000001
     "HOST_VISIBLE",            // 0x00000002
@@ -449,6 +671,19 @@ static uint32_t const VkMemoryPropertyFlagsValues[11] = {
     0x00000200, // RESERVED_9_QCOM
 };
 
+static uint16_t const VkMemoryPropertyFlagsBitIndices[10] = {
+    0,  // DEVICE_LOCAL
+    1,  // HOST_VISIBLE
+    2,  // HOST_COHERENT
+    3,  // HOST_CACHED
+    4,  // LAZILY_ALLOCATED
+    5,  // PROTECTED
+    6,  // DEVICE_COHERENT_BIT_AMD
+    7,  // DEVICE_UNCACHED_BIT_AMD
+    9,  // RDMA_CAPABLE_BIT_NV
+    10, // RESERVED_9_QCOM
+};
+
 static char const *const VkMemoryHeapFlagsStrings[6] = {
     "MULTI_INSTANCE_BIT_KHR", // 0x00000002
     "DEVICE_LOCAL",           // 0x00000001
@@ -467,6 +702,13 @@ static uint32_t const VkMemoryHeapFlagsValues[6] = {
     0x00000008, // TILE_MEMORY_BIT_QCOM
 };
 
+static uint16_t const VkMemoryHeapFlagsBitIndices[4] = {
+    1, // DEVICE_LOCAL
+    2, // MULTI_INSTANCE
+    3, // RESERVED_2_BIT_KHR
+    5, // TILE_MEMORY_BIT_QCOM
+};
+
 static char const *const VkAccessFlagsStrings[47] = {
     "SHADING_RATE_IMAGE_READ_BIT_NV",                // 0x00800000
     "ACCELERATION_STRUCTURE_READ_BIT_NV",            // 0x00200000
@@ -567,6 +809,46 @@ static uint32_t const VkAccessFlagsValues[47] = {
     0x00040000, // COMMAND_PREPROCESS_WRITE_BIT_EXT
 };
 
+static uint16_t const VkAccessFlagsBitIndices[32] = {
+    6,  // INDIRECT_COMMAND_READ
+    7,  // INDEX_READ
+    8,  // VERTEX_ATTRIBUTE_READ
+    9,  // UNIFORM_READ
+    10, // INPUT_ATTACHMENT_READ
+    11, // SHADER_READ
+    12, // SHADER_WRITE
+    13, // COLOR_ATTACHMENT_READ
+    14, // COLOR_ATTACHMENT_WRITE
+    15, // DEPTH_STENCIL_ATTACHMENT_READ
+    16, // DEPTH_STENCIL_ATTACHMENT_WRITE
+    17, // TRANSFER_READ
+    18, // TRANSFER_WRITE
+    19, // HOST_READ
+    20, // HOST_WRITE
+    21, // MEMORY_READ
+    22, // MEMORY_WRITE
+    45, // COMMAND_PREPROCESS_READ_BIT_EXT
+    46, // COMMAND_PREPROCESS_WRITE_BIT_EXT
+    23, // COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT
+    26, // CONDITIONAL_RENDERING_READ_BIT_EXT
+    41, // ACCELERATION_STRUCTURE_READ_BIT_KHR
+    42, // ACCELERATION_STRUCTURE_WRITE_BIT_KHR
+    43, // FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR
+    40, // FRAGMENT_DENSITY_MAP_READ_BIT_EXT
+    33, // TRANSFORM_FEEDBACK_WRITE_BIT_EXT
+    34, // TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
+    35, // TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT
+    37, // RESERVED_28_BIT_KHR
+    38, // RESERVED_29_BIT_KHR
+    36, // RESERVED_30_BIT_KHR
+    39, // RESERVED_31_BIT_KHR
+};
+
+static uint16_t const VkAccessFlagsCombinedIndices[2] = {
+    44, // NONE
+    5,  // NONE_KHR
+};
+
 static char const *const VkBufferUsageFlagsStrings[51] = {
     "RAY_TRACING_BIT_NV",                                   // 0x00000400
     "SHADER_DEVICE_ADDRESS_BIT_EXT",                        // 0x00020000
@@ -675,6 +957,40 @@ static uint32_t const VkBufferUsageFlagsValues[51] = {
     0x10000000, // DESCRIPTOR_HEAP_BIT_EXT
 };
 
+static uint16_t const VkBufferUsageFlagsBitIndices[31] = {
+    3,  // TRANSFER_SRC
+    4,  // TRANSFER_DST
+    5,  // UNIFORM_TEXEL_BUFFER
+    6,  // STORAGE_TEXEL_BUFFER
+    7,  // UNIFORM_BUFFER
+    8,  // STORAGE_BUFFER
+    9,  // INDEX_BUFFER
+    10, // VERTEX_BUFFER
+    11, // INDIRECT_BUFFER
+    12, // CONDITIONAL_RENDERING_BIT_EXT
+    28, // SHADER_BINDING_TABLE_BIT_KHR
+    15, // TRANSFORM_FEEDBACK_BUFFER_BIT_EXT
+    16, // TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT
+    29, // VIDEO_DECODE_SRC_BIT_KHR
+    30, // VIDEO_DECODE_DST_BIT_KHR
+    31, // VIDEO_ENCODE_DST_BIT_KHR
+    32, // VIDEO_ENCODE_SRC_BIT_KHR
+    21, // SHADER_DEVICE_ADDRESS
+    22, // RESERVED_18_BIT_QCOM
+    26, // ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR
+    27, // ACCELERATION_STRUCTURE_STORAGE_BIT_KHR
+    40, // SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT
+    41, // RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT
+    38, // MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT
+    39, // MICROMAP_STORAGE_BIT_EXT
+    43, // EXECUTION_GRAPH_SCRATCH_BIT_AMDX
+    42, // PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT
+    49, // TILE_MEMORY_BIT_QCOM
+    50, // DESCRIPTOR_HEAP_BIT_EXT
+    46, // RESERVED_29_BIT_KHR
+    47, // RESERVED_30_BIT_KHR
+};
+
 static char const *const VkBufferCreateFlagsStrings[13] = {
     "DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_EXT",    // 0x00000010
     "DEVICE_ADDRESS_CAPTURE_REPLAY_BIT_KHR",    // 0x00000010
@@ -707,6 +1023,17 @@ static uint32_t const VkBufferCreateFlagsValues[13] = {
     0x00000080, // RESERVED_7_BIT_IMG
 };
 
+static uint16_t const VkBufferCreateFlagsBitIndices[8] = {
+    2,  // SPARSE_BINDING
+    3,  // SPARSE_RESIDENCY
+    4,  // SPARSE_ALIASED
+    5,  // PROTECTED
+    6,  // DEVICE_ADDRESS_CAPTURE_REPLAY
+    9,  // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
+    11, // VIDEO_PROFILE_INDEPENDENT_BIT_KHR
+    12, // RESERVED_7_BIT_IMG
+};
+
 static char const *const VkShaderStageFlagsStrings[46] = {
     "TASK_BIT_NV",                // 0x00000040
     "MESH_BIT_NV",                // 0x00000080
@@ -805,6 +1132,34 @@ static uint32_t const VkShaderStageFlagsValues[46] = {
     0x00010000, // RESERVED_16_BIT_HUAWEI
 };
 
+static uint16_t const VkShaderStageFlagsBitIndices[20] = {
+    8,             // VERTEX
+    9,             // TESSELLATION_CONTROL
+    10,            // TESSELLATION_EVALUATION
+    11,            // GEOMETRY
+    12,            // FRAGMENT
+    13,            // COMPUTE
+    40,            // TASK_BIT_EXT
+    41,            // MESH_BIT_EXT
+    30,            // RAYGEN_BIT_KHR
+    31,            // ANY_HIT_BIT_KHR
+    32,            // CLOSEST_HIT_BIT_KHR
+    33,            // MISS_BIT_KHR
+    34,            // INTERSECTION_BIT_KHR
+    35,            // CALLABLE_BIT_KHR
+    36,            // SUBPASS_SHADING_BIT_HUAWEI
+    44,            // RESERVED_15_BIT_NV
+    45,            // RESERVED_16_BIT_HUAWEI
+    39,            // EXT_483_RESERVE_17
+    cNoValueIndex, // bit 18
+    43,            // CLUSTER_CULLING_BIT_HUAWEI
+};
+
+static uint16_t const VkShaderStageFlagsCombinedIndices[2] = {
+    15, // ALL
+    14, // ALL_GRAPHICS
+};
+
 static char const *const VkImageUsageFlagsStrings[54] = {
     "SHADING_RATE_IMAGE_BIT_NV",                   // 0x00000100
     "HOST_TRANSFER_BIT_EXT",                       // 0x00400000
@@ -919,6 +1274,40 @@ static uint32_t const VkImageUsageFlagsValues[54] = {
     0x00020000, // RESERVED_17_BIT_HUAWEI
 };
 
+static uint16_t const VkImageUsageFlagsBitIndices[31] = {
+    2,  // TRANSFER_SRC
+    3,  // TRANSFER_DST
+    4,  // SAMPLED
+    5,  // STORAGE
+    6,  // COLOR_ATTACHMENT
+    7,  // DEPTH_STENCIL_ATTACHMENT
+    8,  // TRANSIENT_ATTACHMENT
+    9,  // INPUT_ATTACHMENT
+    21, // FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    18, // FRAGMENT_DENSITY_MAP_BIT_EXT
+    22, // VIDEO_DECODE_DST_BIT_KHR
+    23, // VIDEO_DECODE_SRC_BIT_KHR
+    24, // VIDEO_DECODE_DPB_BIT_KHR
+    25, // VIDEO_ENCODE_DST_BIT_KHR
+    26, // VIDEO_ENCODE_SRC_BIT_KHR
+    27, // VIDEO_ENCODE_DPB_BIT_KHR
+    51, // RESERVED_16_BIT_HUAWEI
+    53, // RESERVED_17_BIT_HUAWEI
+    29, // INVOCATION_MASK_BIT_HUAWEI
+    36, // ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    34, // SAMPLE_WEIGHT_BIT_QCOM
+    35, // SAMPLE_BLOCK_MATCH_BIT_QCOM
+    43, // HOST_TRANSFER
+    47, // TENSOR_ALIASING_BIT_ARM
+    38, // RESERVED_24_BIT_COREAVI
+    41, // VIDEO_ENCODE_QUANTIZATION_DELTA_MAP_BIT_KHR
+    42, // VIDEO_ENCODE_EMPHASIS_MAP_BIT_KHR
+    46, // TILE_MEMORY_BIT_QCOM
+    48, // RESERVED_28_BIT_EXT
+    49, // RESERVED_29_BIT_KHR
+    50, // RESERVED_30_BIT_KHR
+};
+
 static char const *const VkImageCreateFlagsStrings[41] = {
     "SPLIT_INSTANCE_BIND_REGIONS_BIT_KHR",           // 0x00000040
     "2D_ARRAY_COMPATIBLE_BIT_KHR",                   // 0x00000020
@@ -1007,6 +1396,32 @@ static uint32_t const VkImageCreateFlagsValues[41] = {
     0x00080000, // RESERVED_19_BIT_NV
 };
 
+static uint16_t const VkImageCreateFlagsBitIndices[23] = {
+    8,  // SPARSE_BINDING
+    9,  // SPARSE_RESIDENCY
+    10, // SPARSE_ALIASED
+    11, // MUTABLE_FORMAT
+    12, // CUBE_COMPATIBLE
+    15, // 2D_ARRAY_COMPATIBLE
+    14, // SPLIT_INSTANCE_BIND_REGIONS
+    16, // BLOCK_TEXEL_VIEW_COMPATIBLE
+    17, // EXTENDED_USAGE
+    19, // DISJOINT
+    13, // ALIAS
+    18, // PROTECTED
+    20, // SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT
+    23, // CORNER_SAMPLED_BIT_NV
+    24, // SUBSAMPLED_BIT_EXT
+    35, // FRAGMENT_DENSITY_MAP_OFFSET_BIT_EXT
+    38, // DESCRIPTOR_HEAP_CAPTURE_REPLAY_BIT_EXT
+    30, // 2D_VIEW_COMPATIBLE_BIT_EXT
+    31, // MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT
+    40, // RESERVED_19_BIT_NV
+    34, // VIDEO_PROFILE_INDEPENDENT_BIT_KHR
+    36, // RESERVED_21_BIT_IMG
+    39, // ALIAS_SINGLE_LAYER_DESCRIPTOR_BIT_KHR
+};
+
 static char const *const VkImageViewCreateFlagsStrings[6] = {
     "FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT",     // 0x00000001
     "RESERVED_1_BIT_EXT",                       // 0x00000002
@@ -1025,6 +1440,13 @@ static uint32_t const VkImageViewCreateFlagsValues[6] = {
     0x00000004, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
 };
 
+static uint16_t const VkImageViewCreateFlagsBitIndices[4] = {
+    0, // FRAGMENT_DENSITY_MAP_DYNAMIC_BIT_EXT
+    2, // FRAGMENT_DENSITY_MAP_DEFERRED_BIT_EXT
+    5, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
+    4, // RESERVED_3_BIT_EXT
+};
+
 static char const *const VkPipelineCreateFlagsStrings[69] = {
     "DISPATCH_BASE",                                                                   // 0x00000010
     "VIEW_INDEX_FROM_DEVICE_INDEX_BIT_KHR",                                            // 0x00000008
@@ -1169,6 +1591,40 @@ static uint32_t const VkPipelineCreateFlagsValues[69] = {
     0x01000000, // RAY_TRACING_OPACITY_MICROMAP_BIT_KHR
 };
 
+static uint16_t const VkPipelineCreateFlagsBitIndices[31] = {
+    11, // DISABLE_OPTIMIZATION
+    12, // ALLOW_DERIVATIVES
+    13, // DERIVATIVE
+    14, // VIEW_INDEX_FROM_DEVICE_INDEX
+    20, // DISPATCH_BASE
+    17, // DEFER_COMPILE_BIT_NV
+    18, // CAPTURE_STATISTICS_BIT_KHR
+    19, // CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR
+    51, // FAIL_ON_PIPELINE_COMPILE_REQUIRED
+    52, // EARLY_RETURN_ON_FAILURE
+    54, // LINK_TIME_OPTIMIZATION_BIT_EXT
+    40, // LIBRARY_BIT_KHR
+    37, // RAY_TRACING_SKIP_TRIANGLES_BIT_KHR
+    38, // RAY_TRACING_SKIP_AABBS_BIT_KHR
+    33, // RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR
+    34, // RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR
+    35, // RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR
+    36, // RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR
+    39, // INDIRECT_BINDABLE_BIT_NV
+    42, // RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR
+    48, // RAY_TRACING_ALLOW_MOTION_BIT_NV
+    50, // RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    49, // RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT
+    53, // RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT
+    68, // RAY_TRACING_OPACITY_MICROMAP_BIT_KHR
+    59, // COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    60, // DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    66, // NO_PROTECTED_ACCESS
+    65, // RAY_TRACING_DISPLACEMENT_MICROMAP_BIT_NV
+    64, // DESCRIPTOR_BUFFER_BIT_EXT
+    67, // PROTECTED_ACCESS_ONLY
+};
+
 static char const *const VkColorComponentFlagsStrings[4] = {
     "R", // 0x00000001
     "G", // 0x00000002
@@ -1183,6 +1639,13 @@ static uint32_t const VkColorComponentFlagsValues[4] = {
     0x00000008, // A
 };
 
+static uint16_t const VkColorComponentFlagsBitIndices[4] = {
+    0, // R
+    1, // G
+    2, // B
+    3, // A
+};
+
 static char const *const VkFenceCreateFlagsStrings[1] = {
     "SIGNALED", // 0x00000001
 };
@@ -1191,6 +1654,10 @@ static uint32_t const VkFenceCreateFlagsValues[1] = {
     0x00000001, // SIGNALED
 };
 
+static uint16_t const VkFenceCreateFlagsBitIndices[1] = {
+    0, // SIGNALED
+};
+
 static char const *const VkFormatFeatureFlagsStrings[49] = {
     "SAMPLED_IMAGE_FILTER_CUBIC_BIT_IMG",                                              // 0x00002000
     "TRANSFER_SRC_BIT_KHR",                                                            // 0x00004000
@@ -1295,6 +1762,40 @@ static uint32_t const VkFormatFeatureFlagsValues[49] = {
     0x10000000, // VIDEO_ENCODE_DPB_BIT_KHR
 };
 
+static uint16_t const VkFormatFeatureFlagsBitIndices[31] = {
+    11, // SAMPLED_IMAGE
+    12, // STORAGE_IMAGE
+    13, // STORAGE_IMAGE_ATOMIC
+    14, // UNIFORM_TEXEL_BUFFER
+    15, // STORAGE_TEXEL_BUFFER
+    16, // STORAGE_TEXEL_BUFFER_ATOMIC
+    17, // VERTEX_BUFFER
+    18, // COLOR_ATTACHMENT
+    19, // COLOR_ATTACHMENT_BLEND
+    20, // DEPTH_STENCIL_ATTACHMENT
+    21, // BLIT_SRC
+    22, // BLIT_DST
+    23, // SAMPLED_IMAGE_FILTER_LINEAR
+    39, // SAMPLED_IMAGE_FILTER_CUBIC_BIT_EXT
+    24, // TRANSFER_SRC
+    25, // TRANSFER_DST
+    41, // SAMPLED_IMAGE_FILTER_MINMAX
+    26, // MIDPOINT_CHROMA_SAMPLES
+    27, // SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER
+    28, // SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER
+    29, // SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT
+    30, // SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE
+    31, // DISJOINT
+    32, // COSITED_CHROMA_SAMPLES
+    38, // FRAGMENT_DENSITY_MAP_BIT_EXT
+    45, // VIDEO_DECODE_OUTPUT_BIT_KHR
+    46, // VIDEO_DECODE_DPB_BIT_KHR
+    47, // VIDEO_ENCODE_INPUT_BIT_KHR
+    48, // VIDEO_ENCODE_DPB_BIT_KHR
+    42, // ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR
+    44, // FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+};
+
 static char const *const VkQueryControlFlagsStrings[1] = {
     "PRECISE", // 0x00000001
 };
@@ -1303,6 +1804,10 @@ static uint32_t const VkQueryControlFlagsValues[1] = {
     0x00000001, // PRECISE
 };
 
+static uint16_t const VkQueryControlFlagsBitIndices[1] = {
+    0, // PRECISE
+};
+
 static char const *const VkQueryResultFlagsStrings[5] = {
     "64",                  // 0x00000001
     "WAIT",                // 0x00000002
@@ -1319,6 +1824,14 @@ static uint32_t const VkQueryResultFlagsValues[5] = {
     0x00000010, // WITH_STATUS_BIT_KHR
 };
 
+static uint16_t const VkQueryResultFlagsBitIndices[5] = {
+    0, // 64
+    1, // WAIT
+    2, // WITH_AVAILABILITY
+    3, // PARTIAL
+    4, // WITH_STATUS_BIT_KHR
+};
+
 static char const *const VkShaderModuleCreateFlagsStrings[1] = {
     "RESERVED_0_BIT_NV", // 0x00000001
 };
@@ -1327,6 +1840,10 @@ static uint32_t const VkShaderModuleCreateFlagsValues[1] = {
     0x00000001, // RESERVED_0_BIT_NV
 };
 
+static uint16_t const VkShaderModuleCreateFlagsBitIndices[1] = {
+    0, // RESERVED_0_BIT_NV
+};
+
 static char const *const VkEventCreateFlagsStrings[2] = {
     "DEVICE_ONLY_BIT_KHR", // 0x00000001
     "DEVICE_ONLY",         // 0x00000001
@@ -1337,6 +1854,10 @@ static uint32_t const VkEventCreateFlagsValues[2] = {
     0x00000001, // DEVICE_ONLY
 };
 
+static uint16_t const VkEventCreateFlagsBitIndices[1] = {
+    1, // DEVICE_ONLY
+};
+
 static char const *const VkCommandPoolCreateFlagsStrings[3] = {
     "TRANSIENT",            // 0x00000001
     "RESET_COMMAND_BUFFER", // 0x00000002
@@ -1349,6 +1870,12 @@ static uint32_t const VkCommandPoolCreateFlagsValues[3] = {
     0x00000004, // PROTECTED
 };
 
+static uint16_t const VkCommandPoolCreateFlagsBitIndices[3] = {
+    0, // TRANSIENT
+    1, // RESET_COMMAND_BUFFER
+    2, // PROTECTED
+};
+
 static char const *const VkCommandPoolResetFlagsStrings[2] = {
     "RELEASE_RESOURCES",      // 0x00000001
     "RESERVED_1_BIT_COREAVI", // 0x00000002
@@ -1359,6 +1886,11 @@ static uint32_t const VkCommandPoolResetFlagsValues[2] = {
     0x00000002, // RESERVED_1_BIT_COREAVI
 };
 
+static uint16_t const VkCommandPoolResetFlagsBitIndices[2] = {
+    0, // RELEASE_RESOURCES
+    1, // RESERVED_1_BIT_COREAVI
+};
+
 static char const *const VkCommandBufferResetFlagsStrings[1] = {
     "RELEASE_RESOURCES", // 0x00000001
 };
@@ -1367,6 +1899,10 @@ static uint32_t const VkCommandBufferResetFlagsValues[1] = {
     0x00000001, // RELEASE_RESOURCES
 };
 
+static uint16_t const VkCommandBufferResetFlagsBitIndices[1] = {
+    0, // RELEASE_RESOURCES
+};
+
 static char const *const VkCommandBufferUsageFlagsStrings[5] = {
     "ONE_TIME_SUBMIT",       // 0x00000001
     "RENDER_PASS_CONTINUE",  // 0x00000002
@@ -1383,6 +1919,14 @@ static uint32_t const VkCommandBufferUsageFlagsValues[5] = {
     0x00000010, // RESERVED_4_BIT_HUAWEI
 };
 
+static uint16_t const VkCommandBufferUsageFlagsBitIndices[5] = {
+    0, // ONE_TIME_SUBMIT
+    1, // RENDER_PASS_CONTINUE
+    2, // SIMULTANEOUS_USE
+    3, // RESERVED_3_BIT_HUAWEI
+    4, // RESERVED_4_BIT_HUAWEI
+};
+
 static char const *const VkQueryPipelineStatisticFlagsStrings[14] = {
     "INPUT_ASSEMBLY_VERTICES",                       // 0x00000001
     "INPUT_ASSEMBLY_PRIMITIVES",                     // 0x00000002
@@ -1417,6 +1961,23 @@ static uint32_t const VkQueryPipelineStatisticFlagsValues[14] = {
     0x00002000, // CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI
 };
 
+static uint16_t const VkQueryPipelineStatisticFlagsBitIndices[14] = {
+    0,  // INPUT_ASSEMBLY_VERTICES
+    1,  // INPUT_ASSEMBLY_PRIMITIVES
+    2,  // VERTEX_SHADER_INVOCATIONS
+    3,  // GEOMETRY_SHADER_INVOCATIONS
+    4,  // GEOMETRY_SHADER_PRIMITIVES
+    5,  // CLIPPING_INVOCATIONS
+    6,  // CLIPPING_PRIMITIVES
+    7,  // FRAGMENT_SHADER_INVOCATIONS
+    8,  // TESSELLATION_CONTROL_SHADER_PATCHES
+    9,  // TESSELLATION_EVALUATION_SHADER_INVOCATIONS
+    10, // COMPUTE_SHADER_INVOCATIONS
+    11, // TASK_SHADER_INVOCATIONS_BIT_EXT
+    12, // MESH_SHADER_INVOCATIONS_BIT_EXT
+    13, // CLUSTER_CULLING_SHADER_INVOCATIONS_BIT_HUAWEI
+};
+
 static char const *const VkMemoryMapFlagsStrings[1] = {
     "PLACED_BIT_EXT", // 0x00000001
 };
@@ -1425,6 +1986,10 @@ static uint32_t const VkMemoryMapFlagsValues[1] = {
     0x00000001, // PLACED_BIT_EXT
 };
 
+static uint16_t const VkMemoryMapFlagsBitIndices[1] = {
+    0, // PLACED_BIT_EXT
+};
+
 static char const *const VkMemoryUnmapFlagsStrings[1] = {
     "RESERVE_BIT_EXT", // 0x00000001
 };
@@ -1433,6 +1998,10 @@ static uint32_t const VkMemoryUnmapFlagsValues[1] = {
     0x00000001, // RESERVE_BIT_EXT
 };
 
+static uint16_t const VkMemoryUnmapFlagsBitIndices[1] = {
+    0, // RESERVE_BIT_EXT
+};
+
 static char const *const VkImageAspectFlagsStrings[17] = {
     "PLANE_0_BIT_KHR",        // 0x00000010
     "PLANE_1_BIT_KHR",        // 0x00000020
@@ -1473,6 +2042,26 @@ static uint32_t const VkImageAspectFlagsValues[17] = {
     0x00000800, // RESERVED_11_BIT_HUAWEI
 };
 
+static uint16_t const VkImageAspectFlagsBitIndices[12] = {
+    4,  // COLOR
+    5,  // DEPTH
+    6,  // STENCIL
+    7,  // METADATA
+    8,  // PLANE_0
+    9,  // PLANE_1
+    10, // PLANE_2
+    11, // MEMORY_PLANE_0_BIT_EXT
+    12, // MEMORY_PLANE_1_BIT_EXT
+    13, // MEMORY_PLANE_2_BIT_EXT
+    14, // MEMORY_PLANE_3_BIT_EXT
+    16, // RESERVED_11_BIT_HUAWEI
+};
+
+static uint16_t const VkImageAspectFlagsCombinedIndices[2] = {
+    15, // NONE
+    3,  // NONE_KHR
+};
+
 static char const *const VkSparseMemoryBindFlagsStrings[1] = {
     "METADATA", // 0x00000001
 };
@@ -1481,6 +2070,10 @@ static uint32_t const VkSparseMemoryBindFlagsValues[1] = {
     0x00000001, // METADATA
 };
 
+static uint16_t const VkSparseMemoryBindFlagsBitIndices[1] = {
+    0, // METADATA
+};
+
 static char const *const VkSparseImageFormatFlagsStrings[3] = {
     "SINGLE_MIPTAIL",         // 0x00000001
     "ALIGNED_MIP_SIZE",       // 0x00000002
@@ -1493,6 +2086,12 @@ static uint32_t const VkSparseImageFormatFlagsValues[3] = {
     0x00000004, // NONSTANDARD_BLOCK_SIZE
 };
 
+static uint16_t const VkSparseImageFormatFlagsBitIndices[3] = {
+    0, // SINGLE_MIPTAIL
+    1, // ALIGNED_MIP_SIZE
+    2, // NONSTANDARD_BLOCK_SIZE
+};
+
 static char const *const VkSubpassDescriptionFlagsStrings[17] = {
     "FRAGMENT_REGION_BIT_QCOM",                              // 0x00000004
     "SHADER_RESOLVE_BIT_QCOM",                               // 0x00000008
@@ -1533,6 +2132,18 @@ static uint32_t const VkSubpassDescriptionFlagsValues[17] = {
     0x00000008, // CUSTOM_RESOLVE_BIT_EXT
 };
 
+static uint16_t const VkSubpassDescriptionFlagsBitIndices[9] = {
+    5,  // PER_VIEW_ATTRIBUTES_BIT_NVX
+    6,  // PER_VIEW_POSITION_X_ONLY_BIT_NVX
+    15, // FRAGMENT_REGION_BIT_EXT
+    16, // CUSTOM_RESOLVE_BIT_EXT
+    10, // RASTERIZATION_ORDER_ATTACHMENT_COLOR_ACCESS_BIT_EXT
+    11, // RASTERIZATION_ORDER_ATTACHMENT_DEPTH_ACCESS_BIT_EXT
+    12, // RASTERIZATION_ORDER_ATTACHMENT_STENCIL_ACCESS_BIT_EXT
+    13, // ENABLE_LEGACY_DITHERING_BIT_EXT
+    14, // TILE_SHADING_APRON_BIT_QCOM
+};
+
 static char const *const VkPipelineStageFlagsStrings[43] = {
     "SHADING_RATE_IMAGE_BIT_NV",                // 0x00400000
     "TASK_SHADER_BIT_NV",                       // 0x00080000
@@ -1625,6 +2236,42 @@ static uint32_t const VkPipelineStageFlagsValues[43] = {
     0x00020000, // COMMAND_PREPROCESS_BIT_EXT
 };
 
+static uint16_t const VkPipelineStageFlagsBitIndices[28] = {
+    7,  // TOP_OF_PIPE
+    8,  // DRAW_INDIRECT
+    9,  // VERTEX_INPUT
+    10, // VERTEX_SHADER
+    11, // TESSELLATION_CONTROL_SHADER
+    12, // TESSELLATION_EVALUATION_SHADER
+    13, // GEOMETRY_SHADER
+    14, // FRAGMENT_SHADER
+    15, // EARLY_FRAGMENT_TESTS
+    16, // LATE_FRAGMENT_TESTS
+    17, // COLOR_ATTACHMENT_OUTPUT
+    18, // COMPUTE_SHADER
+    19, // TRANSFER
+    20, // BOTTOM_OF_PIPE
+    21, // HOST
+    22, // ALL_GRAPHICS
+    23, // ALL_COMMANDS
+    42, // COMMAND_PREPROCESS_BIT_EXT
+    25, // CONDITIONAL_RENDERING_BIT_EXT
+    40, // TASK_SHADER_BIT_EXT
+    41, // MESH_SHADER_BIT_EXT
+    37, // RAY_TRACING_SHADER_BIT_KHR
+    38, // FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    35, // FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    32, // TRANSFORM_FEEDBACK_BIT_EXT
+    36, // ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    34, // RESERVED_26_BIT_KHR
+    33, // RESERVED_27_BIT_KHR
+};
+
+static uint16_t const VkPipelineStageFlagsCombinedIndices[2] = {
+    39, // NONE
+    6,  // NONE_KHR
+};
+
 static char const *const VkSampleCountFlagsStrings[7] = {
     "1",  // 0x00000001
     "2",  // 0x00000002
@@ -1645,6 +2292,16 @@ static uint32_t const VkSampleCountFlagsValues[7] = {
     0x00000040, // 64
 };
 
+static uint16_t const VkSampleCountFlagsBitIndices[7] = {
+    0, // 1
+    1, // 2
+    2, // 4
+    3, // 8
+    4, // 16
+    5, // 32
+    6, // 64
+};
+
 static char const *const VkAttachmentDescriptionFlagsStrings[5] = {
     "MAY_ALIAS",                                // 0x00000001
     "RESERVED_1_BIT_KHR",                       // 0x00000002
@@ -1661,6 +2318,12 @@ static uint32_t const VkAttachmentDescriptionFlagsValues[5] = {
     0x00000004, // RESOLVE_ENABLE_TRANSFER_FUNCTION_BIT_KHR
 };
 
+static uint16_t const VkAttachmentDescriptionFlagsBitIndices[3] = {
+    0, // MAY_ALIAS
+    3, // RESOLVE_SKIP_TRANSFER_FUNCTION_BIT_KHR
+    4, // RESOLVE_ENABLE_TRANSFER_FUNCTION_BIT_KHR
+};
+
 static char const *const VkStencilFaceFlagsStrings[4] = {
     "VK_STENCIL_FRONT_AND_BACK", // 0x00000003
     "FRONT",                     // 0x00000001
@@ -1675,6 +2338,16 @@ static uint32_t const VkStencilFaceFlagsValues[4] = {
     0x00000003, // FRONT_AND_BACK
 };
 
+static uint16_t const VkStencilFaceFlagsBitIndices[2] = {
+    1, // FRONT
+    2, // BACK
+};
+
+static uint16_t const VkStencilFaceFlagsCombinedIndices[2] = {
+    3, // FRONT_AND_BACK
+    0, // VK_STENCIL_FRONT_AND_BACK
+};
+
 static char const *const VkCullModeFlagsStrings[4] = {
     "NONE",           // 0
     "FRONT",          // 0x00000001
@@ -1689,6 +2362,16 @@ static uint32_t const VkCullModeFlagsValues[4] = {
     0x00000003, // FRONT_AND_BACK
 };
 
+static uint16_t const VkCullModeFlagsBitIndices[2] = {
+    1, // FRONT
+    2, // BACK
+};
+
+static uint16_t const VkCullModeFlagsCombinedIndices[2] = {
+    3, // FRONT_AND_BACK
+    0, // NONE
+};
+
 static char const *const VkDescriptorPoolCreateFlagsStrings[8] = {
     "UPDATE_AFTER_BIND_BIT_EXT",               // 0x00000002
     "HOST_ONLY_BIT_VALVE",                     // 0x00000004
@@ -1711,6 +2394,14 @@ static uint32_t const VkDescriptorPoolCreateFlagsValues[8] = {
     0x00000010, // ALLOW_OVERALLOCATION_POOLS_BIT_NV
 };
 
+static uint16_t const VkDescriptorPoolCreateFlagsBitIndices[5] = {
+    2, // FREE_DESCRIPTOR_SET
+    3, // UPDATE_AFTER_BIND
+    5, // HOST_ONLY_BIT_EXT
+    6, // ALLOW_OVERALLOCATION_SETS_BIT_NV
+    7, // ALLOW_OVERALLOCATION_POOLS_BIT_NV
+};
+
 static char const *const VkDependencyFlagsStrings[12] = {
     "VIEW_LOCAL_BIT_KHR",                                     // 0x00000002
     "DEVICE_GROUP_BIT_KHR",                                   // 0x00000004
@@ -1741,6 +2432,16 @@ static uint32_t const VkDependencyFlagsValues[12] = {
     0x00000040, // ASYMMETRIC_EVENT_BIT_KHR
 };
 
+static uint16_t const VkDependencyFlagsBitIndices[7] = {
+    2,  // BY_REGION
+    4,  // VIEW_LOCAL
+    3,  // DEVICE_GROUP
+    6,  // FEEDBACK_LOOP_BIT_EXT
+    7,  // EXTENSION_586_BIT_IMG
+    9,  // QUEUE_FAMILY_OWNERSHIP_TRANSFER_USE_ALL_STAGES_BIT_KHR
+    11, // ASYMMETRIC_EVENT_BIT_KHR
+};
+
 static char const *const VkSubgroupFeatureFlagsStrings[14] = {
     "PARTITIONED_BIT_NV",       // 0x00000100
     "ROTATE_BIT_KHR",           // 0x00000200
@@ -1775,6 +2476,20 @@ static uint32_t const VkSubgroupFeatureFlagsValues[14] = {
     0x00000100, // PARTITIONED_BIT_EXT
 };
 
+static uint16_t const VkSubgroupFeatureFlagsBitIndices[11] = {
+    3,  // BASIC
+    4,  // VOTE
+    5,  // ARITHMETIC
+    6,  // BALLOT
+    7,  // SHUFFLE
+    8,  // SHUFFLE_RELATIVE
+    9,  // CLUSTERED
+    10, // QUAD
+    13, // PARTITIONED_BIT_EXT
+    11, // ROTATE
+    12, // ROTATE_CLUSTERED
+};
+
 static char const *const VkIndirectCommandsLayoutUsageFlagsNVStrings[3] = {
     "EXPLICIT_PREPROCESS", // 0x00000001
     "INDEXED_SEQUENCES",   // 0x00000002
@@ -1787,6 +2502,12 @@ static uint32_t const VkIndirectCommandsLayoutUsageFlagsNVValues[3] = {
     0x00000004, // UNORDERED_SEQUENCES
 };
 
+static uint16_t const VkIndirectCommandsLayoutUsageFlagsNVBitIndices[3] = {
+    0, // EXPLICIT_PREPROCESS
+    1, // INDEXED_SEQUENCES
+    2, // UNORDERED_SEQUENCES
+};
+
 static char const *const VkIndirectStateFlagsNVStrings[1] = {
     "FLAG_FRONTFACE", // 0x00000001
 };
@@ -1795,6 +2516,10 @@ static uint32_t const VkIndirectStateFlagsNVValues[1] = {
     0x00000001, // FLAG_FRONTFACE
 };
 
+static uint16_t const VkIndirectStateFlagsNVBitIndices[1] = {
+    0, // FLAG_FRONTFACE
+};
+
 static char const *const VkGeometryFlagsKHRStrings[4] = {
     "OPAQUE_BIT_NV",                          // 0x00000001
     "NO_DUPLICATE_ANY_HIT_INVOCATION_BIT_NV", // 0x00000002
@@ -1809,6 +2534,11 @@ static uint32_t const VkGeometryFlagsKHRValues[4] = {
     0x00000002, // NO_DUPLICATE_ANY_HIT_INVOCATION
 };
 
+static uint16_t const VkGeometryFlagsKHRBitIndices[2] = {
+    2, // OPAQUE
+    3, // NO_DUPLICATE_ANY_HIT_INVOCATION
+};
+
 static char const *const VkGeometryInstanceFlagsKHRStrings[17] = {
     "TRIANGLE_FRONT_COUNTERCLOCKWISE",        // 0x00000002
     "TRIANGLE_CULL_DISABLE_BIT_NV",           // 0x00000001
@@ -1849,6 +2579,15 @@ static uint32_t const VkGeometryInstanceFlagsKHRValues[17] = {
     0x00000020, // DISABLE_OPACITY_MICROMAPS
 };
 
+static uint16_t const VkGeometryInstanceFlagsKHRBitIndices[6] = {
+    9,  // TRIANGLE_FACING_CULL_DISABLE
+    12, // TRIANGLE_FLIP_FACING
+    10, // FORCE_OPAQUE
+    11, // FORCE_NO_OPAQUE
+    15, // FORCE_OPACITY_MICROMAP_2_STATE
+    16, // DISABLE_OPACITY_MICROMAPS
+};
+
 static char const *const VkClusterAccelerationStructureGeometryFlagsNVStrings[3] = {
     "CULL_DISABLE",                   // 0x00000001
     "NO_DUPLICATE_ANYHIT_INVOCATION", // 0x00000002
@@ -1861,6 +2600,12 @@ static uint32_t const VkClusterAccelerationStructureGeometryFlagsNVValues[3] = {
     0x00000004, // OPAQUE
 };
 
+static uint16_t const VkClusterAccelerationStructureGeometryFlagsNVBitIndices[3] = {
+    0, // CULL_DISABLE
+    1, // NO_DUPLICATE_ANYHIT_INVOCATION
+    2, // OPAQUE
+};
+
 static char const *const VkClusterAccelerationStructureClusterFlagsNVStrings[1] = {
     "ALLOW_DISABLE_OPACITY_MICROMAPS", // 0x00000001
 };
@@ -1869,6 +2614,10 @@ static uint32_t const VkClusterAccelerationStructureClusterFlagsNVValues[1] = {
     0x00000001, // ALLOW_DISABLE_OPACITY_MICROMAPS
 };
 
+static uint16_t const VkClusterAccelerationStructureClusterFlagsNVBitIndices[1] = {
+    0, // ALLOW_DISABLE_OPACITY_MICROMAPS
+};
+
 static char const *const VkClusterAccelerationStructureAddressResolutionFlagsNVStrings[7] = {
     "INDIRECTED_DST_IMPLICIT_DATA", // 0x00000001
     "INDIRECTED_SCRATCH_DATA",      // 0x00000002
@@ -1889,6 +2638,19 @@ static uint32_t const VkClusterAccelerationStructureAddressResolutionFlagsNVValu
     0,          // NONE
 };
 
+static uint16_t const VkClusterAccelerationStructureAddressResolutionFlagsNVBitIndices[6] = {
+    0, // INDIRECTED_DST_IMPLICIT_DATA
+    1, // INDIRECTED_SCRATCH_DATA
+    2, // INDIRECTED_DST_ADDRESS_ARRAY
+    3, // INDIRECTED_DST_SIZES_ARRAY
+    4, // INDIRECTED_SRC_INFOS_ARRAY
+    5, // INDIRECTED_SRC_INFOS_COUNT
+};
+
+static uint16_t const VkClusterAccelerationStructureAddressResolutionFlagsNVCombinedIndices[1] = {
+    6, // NONE
+};
+
 static char const *const VkBuildAccelerationStructureFlagsKHRStrings[34] = {
     "ALLOW_UPDATE_BIT_NV",                        // 0x00000001
     "ALLOW_COMPACTION_BIT_NV",                    // 0x00000002
@@ -1963,6 +2725,25 @@ static uint32_t const VkBuildAccelerationStructureFlagsKHRValues[34] = {
     0x00008000, // RESERVED_15_BIT_EXT
 };
 
+static uint16_t const VkBuildAccelerationStructureFlagsKHRBitIndices[16] = {
+    12, // ALLOW_UPDATE
+    13, // ALLOW_COMPACTION
+    14, // PREFER_FAST_TRACE
+    15, // PREFER_FAST_BUILD
+    16, // LOW_MEMORY
+    18, // MOTION_BIT_NV
+    28, // ALLOW_OPACITY_MICROMAP_UPDATE
+    29, // ALLOW_DISABLE_OPACITY_MICROMAPS
+    23, // ALLOW_OPACITY_MICROMAP_DATA_UPDATE_BIT_EXT
+    24, // ALLOW_DISPLACEMENT_MICROMAP_UPDATE_BIT_NV
+    30, // MICROMAP_LOSSY
+    25, // ALLOW_DATA_ACCESS
+    26, // ALLOW_CLUSTER_OPACITY_MICROMAPS_BIT_NV
+    32, // RESERVED_13_BIT_AMD
+    31, // RESERVED_14_BIT_EXT
+    33, // RESERVED_15_BIT_EXT
+};
+
 static char const *const VkPrivateDataSlotCreateFlagsStrings[1] = {
     "RESERVED_0_BIT_NV", // 0x00000001
 };
@@ -1971,6 +2752,10 @@ static uint32_t const VkPrivateDataSlotCreateFlagsValues[1] = {
     0x00000001, // RESERVED_0_BIT_NV
 };
 
+static uint16_t const VkPrivateDataSlotCreateFlagsBitIndices[1] = {
+    0, // RESERVED_0_BIT_NV
+};
+
 static char const *const VkAccelerationStructureCreateFlagsKHRStrings[5] = {
     "DEVICE_ADDRESS_CAPTURE_REPLAY",            // 0x00000001
     "RESERVED_BIT_2_NV",                        // 0x00000004
@@ -1987,6 +2772,13 @@ static uint32_t const VkAccelerationStructureCreateFlagsKHRValues[5] = {
     0x00000008, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
 };
 
+static uint16_t const VkAccelerationStructureCreateFlagsKHRBitIndices[4] = {
+    0,             // DEVICE_ADDRESS_CAPTURE_REPLAY
+    cNoValueIndex, // bit 1
+    2,             // MOTION_BIT_NV
+    4,             // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
+};
+
 static char const *const VkPipelineCreationFeedbackFlagsStrings[6] = {
     "VALID_BIT_EXT",                          // 0x00000001
     "APPLICATION_PIPELINE_CACHE_HIT_BIT_EXT", // 0x00000002
@@ -2005,6 +2797,12 @@ static uint32_t const VkPipelineCreationFeedbackFlagsValues[6] = {
     0x00000004, // BASE_PIPELINE_ACCELERATION
 };
 
+static uint16_t const VkPipelineCreationFeedbackFlagsBitIndices[3] = {
+    3, // VALID
+    4, // APPLICATION_PIPELINE_CACHE_HIT
+    5, // BASE_PIPELINE_ACCELERATION
+};
+
 static char const *const VkPerformanceCounterDescriptionFlagsKHRStrings[4] = {
     "PERFORMANCE_IMPACTING", // 0x00000001
     "CONCURRENTLY_IMPACTED", // 0x00000002
@@ -2019,6 +2817,11 @@ static uint32_t const VkPerformanceCounterDescriptionFlagsKHRValues[4] = {
     0x00000002, // CONCURRENTLY_IMPACTED
 };
 
+static uint16_t const VkPerformanceCounterDescriptionFlagsKHRBitIndices[2] = {
+    2, // PERFORMANCE_IMPACTING
+    3, // CONCURRENTLY_IMPACTED
+};
+
 static char const *const VkSemaphoreWaitFlagsStrings[2] = {
     "ANY_BIT_KHR", // 0x00000001
     "ANY",         // 0x00000001
@@ -2029,6 +2832,10 @@ static uint32_t const VkSemaphoreWaitFlagsValues[2] = {
     0x00000001, // ANY
 };
 
+static uint16_t const VkSemaphoreWaitFlagsBitIndices[1] = {
+    1, // ANY
+};
+
 static char const *const VkDeviceDiagnosticsConfigFlagsNVStrings[4] = {
     "ENABLE_SHADER_DEBUG_INFO",      // 0x00000001
     "ENABLE_RESOURCE_TRACKING",      // 0x00000002
@@ -2043,6 +2850,13 @@ static uint32_t const VkDeviceDiagnosticsConfigFlagsNVValues[4] = {
     0x00000008, // ENABLE_SHADER_ERROR_REPORTING
 };
 
+static uint16_t const VkDeviceDiagnosticsConfigFlagsNVBitIndices[4] = {
+    0, // ENABLE_SHADER_DEBUG_INFO
+    1, // ENABLE_RESOURCE_TRACKING
+    2, // ENABLE_AUTOMATIC_CHECKPOINTS
+    3, // ENABLE_SHADER_ERROR_REPORTING
+};
+
 static char const *const VkAccessFlags2Strings[106] = {
     "NONE_KHR",                                      // 0
     "INDIRECT_COMMAND_READ_BIT_KHR",                 // 0x00000001
@@ -2261,6 +3075,78 @@ static uint64_t const VkAccessFlags2Values[106] = {
     0x40000000000000,   // RESERVED_54_BIT_KHR
 };
 
+static uint16_t const VkAccessFlags2BitIndices[64] = {
+    27,            // INDIRECT_COMMAND_READ
+    28,            // INDEX_READ
+    29,            // VERTEX_ATTRIBUTE_READ
+    30,            // UNIFORM_READ
+    31,            // INPUT_ATTACHMENT_READ
+    32,            // SHADER_READ
+    33,            // SHADER_WRITE
+    34,            // COLOR_ATTACHMENT_READ
+    35,            // COLOR_ATTACHMENT_WRITE
+    36,            // DEPTH_STENCIL_ATTACHMENT_READ
+    37,            // DEPTH_STENCIL_ATTACHMENT_WRITE
+    38,            // TRANSFER_READ
+    39,            // TRANSFER_WRITE
+    40,            // HOST_READ
+    41,            // HOST_WRITE
+    42,            // MEMORY_READ
+    43,            // MEMORY_WRITE
+    88,            // COMMAND_PREPROCESS_READ_BIT_EXT
+    89,            // COMMAND_PREPROCESS_WRITE_BIT_EXT
+    59,            // COLOR_ATTACHMENT_READ_NONCOHERENT_BIT_EXT
+    54,            // CONDITIONAL_RENDERING_READ_BIT_EXT
+    56,            // ACCELERATION_STRUCTURE_READ_BIT_KHR
+    57,            // ACCELERATION_STRUCTURE_WRITE_BIT_KHR
+    55,            // FRAGMENT_SHADING_RATE_ATTACHMENT_READ_BIT_KHR
+    58,            // FRAGMENT_DENSITY_MAP_READ_BIT_EXT
+    51,            // TRANSFORM_FEEDBACK_WRITE_BIT_EXT
+    52,            // TRANSFORM_FEEDBACK_COUNTER_READ_BIT_EXT
+    53,            // TRANSFORM_FEEDBACK_COUNTER_WRITE_BIT_EXT
+    102,           // RESERVED_28_BIT_AMD
+    103,           // RESERVED_29_BIT_AMD
+    cNoValueIndex, // bit 30
+    cNoValueIndex, // bit 31
+    44,            // SHADER_SAMPLED_READ
+    45,            // SHADER_STORAGE_READ
+    46,            // SHADER_STORAGE_WRITE
+    47,            // VIDEO_DECODE_READ_BIT_KHR
+    48,            // VIDEO_DECODE_WRITE_BIT_KHR
+    49,            // VIDEO_ENCODE_READ_BIT_KHR
+    50,            // VIDEO_ENCODE_WRITE_BIT_KHR
+    60,            // INVOCATION_MASK_READ_BIT_HUAWEI
+    67,            // SHADER_BINDING_TABLE_READ_BIT_KHR
+    73,            // DESCRIPTOR_BUFFER_READ_BIT_EXT
+    71,            // OPTICAL_FLOW_READ_BIT_NV
+    72,            // OPTICAL_FLOW_WRITE_BIT_NV
+    69,            // MICROMAP_READ_BIT_EXT
+    70,            // MICROMAP_WRITE_BIT_EXT
+    78,            // RESERVED_46_BIT_INTEL
+    92,            // DATA_GRAPH_READ_BIT_ARM
+    93,            // DATA_GRAPH_WRITE_BIT_ARM
+    74,            // RESERVED_49_BIT_ARM
+    75,            // RESERVED_50_BIT_ARM
+    90,            // SHADER_TILE_ATTACHMENT_READ_BIT_QCOM
+    91,            // SHADER_TILE_ATTACHMENT_WRITE_BIT_QCOM
+    104,           // RESERVED_53_BIT_KHR
+    105,           // RESERVED_54_BIT_KHR
+    96,            // MEMORY_DECOMPRESSION_READ_BIT_EXT
+    97,            // MEMORY_DECOMPRESSION_WRITE_BIT_EXT
+    100,           // SAMPLER_HEAP_READ_BIT_EXT
+    101,           // RESOURCE_HEAP_READ_BIT_EXT
+    87,            // RESERVED_59_BIT_KHR
+    94,            // RESERVED_60_BIT_KHR
+    95,            // RESERVED_61_BIT_KHR
+    98,            // RESERVED_62_BIT_EXT
+    99,            // RESERVED_63_BIT_EXT
+};
+
+static uint16_t const VkAccessFlags2CombinedIndices[2] = {
+    26, // NONE
+    0,  // NONE_KHR
+};
+
 static char const *const VkPipelineStageFlags2Strings[94] = {
     "TRANSFER",                                 // 0x00001000
     "NONE_KHR",                                 // 0
@@ -2455,6 +3341,65 @@ static uint64_t const VkPipelineStageFlags2Values[94] = {
     0x4000000000000, // RESERVED_50_BIT_KHR
 };
 
+static uint16_t const VkPipelineStageFlags2BitIndices[51] = {
+    35, // TOP_OF_PIPE
+    36, // DRAW_INDIRECT
+    37, // VERTEX_INPUT
+    38, // VERTEX_SHADER
+    39, // TESSELLATION_CONTROL_SHADER
+    40, // TESSELLATION_EVALUATION_SHADER
+    41, // GEOMETRY_SHADER
+    42, // FRAGMENT_SHADER
+    43, // EARLY_FRAGMENT_TESTS
+    44, // LATE_FRAGMENT_TESTS
+    45, // COLOR_ATTACHMENT_OUTPUT
+    46, // COMPUTE_SHADER
+    47, // ALL_TRANSFER
+    48, // BOTTOM_OF_PIPE
+    49, // HOST
+    50, // ALL_GRAPHICS
+    51, // ALL_COMMANDS
+    83, // COMMAND_PREPROCESS_BIT_EXT
+    62, // CONDITIONAL_RENDERING_BIT_EXT
+    72, // TASK_SHADER_BIT_EXT
+    73, // MESH_SHADER_BIT_EXT
+    65, // RAY_TRACING_SHADER_BIT_KHR
+    63, // FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    66, // FRAGMENT_DENSITY_PROCESS_BIT_EXT
+    61, // TRANSFORM_FEEDBACK_BIT_EXT
+    64, // ACCELERATION_STRUCTURE_BUILD_BIT_KHR
+    59, // VIDEO_DECODE_BIT_KHR
+    60, // VIDEO_ENCODE_BIT_KHR
+    71, // ACCELERATION_STRUCTURE_COPY_BIT_KHR
+    75, // OPTICAL_FLOW_BIT_NV
+    74, // MICROMAP_BUILD_BIT_EXT
+    92, // RESERVED_31_BIT_AMD
+    52, // COPY
+    53, // RESOLVE
+    54, // BLIT
+    55, // CLEAR
+    56, // INDEX_INPUT
+    57, // VERTEX_ATTRIBUTE_INPUT
+    58, // PRE_RASTERIZATION_SHADERS
+    80, // SUBPASS_SHADER_BIT_HUAWEI
+    67, // INVOCATION_MASK_BIT_HUAWEI
+    77, // CLUSTER_CULLING_SHADER_BIT_HUAWEI
+    86, // DATA_GRAPH_BIT_ARM
+    78, // RESERVED_43_BIT_ARM
+    85, // CONVERT_COOPERATIVE_VECTOR_MATRIX_BIT_NV
+    89, // MEMORY_DECOMPRESSION_BIT_EXT
+    88, // COPY_INDIRECT_BIT_KHR
+    87, // RESERVED_47_BIT_KHR
+    90, // RESERVED_48_BIT_HUAWEI
+    91, // RESERVED_49_BIT_EXT
+    93, // RESERVED_50_BIT_KHR
+};
+
+static uint16_t const VkPipelineStageFlags2CombinedIndices[2] = {
+    34, // NONE
+    1,  // NONE_KHR
+};
+
 static char const *const VkFormatFeatureFlags2Strings[117] = {
     "SAMPLED_IMAGE_BIT_KHR",                                                           // 0x00000001
     "STORAGE_IMAGE_BIT_KHR",                                                           // 0x00000002
@@ -2695,6 +3640,71 @@ static uint64_t const VkFormatFeatureFlags2Values[117] = {
     0x200000000000,     // SAMPLED_IMAGE_FILTER_LINEAR_2D_BIT_IMG
 };
 
+static uint16_t const VkFormatFeatureFlags2BitIndices[62] = {
+    28,  // SAMPLED_IMAGE
+    29,  // STORAGE_IMAGE
+    30,  // STORAGE_IMAGE_ATOMIC
+    31,  // UNIFORM_TEXEL_BUFFER
+    32,  // STORAGE_TEXEL_BUFFER
+    33,  // STORAGE_TEXEL_BUFFER_ATOMIC
+    34,  // VERTEX_BUFFER
+    35,  // COLOR_ATTACHMENT
+    36,  // COLOR_ATTACHMENT_BLEND
+    37,  // DEPTH_STENCIL_ATTACHMENT
+    38,  // BLIT_SRC
+    39,  // BLIT_DST
+    40,  // SAMPLED_IMAGE_FILTER_LINEAR
+    54,  // SAMPLED_IMAGE_FILTER_CUBIC
+    41,  // TRANSFER_SRC
+    42,  // TRANSFER_DST
+    43,  // SAMPLED_IMAGE_FILTER_MINMAX
+    44,  // MIDPOINT_CHROMA_SAMPLES
+    45,  // SAMPLED_IMAGE_YCBCR_CONVERSION_LINEAR_FILTER
+    46,  // SAMPLED_IMAGE_YCBCR_CONVERSION_SEPARATE_RECONSTRUCTION_FILTER
+    47,  // SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT
+    48,  // SAMPLED_IMAGE_YCBCR_CONVERSION_CHROMA_RECONSTRUCTION_EXPLICIT_FORCEABLE
+    49,  // DISJOINT
+    50,  // COSITED_CHROMA_SAMPLES
+    58,  // FRAGMENT_DENSITY_MAP_BIT_EXT
+    55,  // VIDEO_DECODE_OUTPUT_BIT_KHR
+    56,  // VIDEO_DECODE_DPB_BIT_KHR
+    60,  // VIDEO_ENCODE_INPUT_BIT_KHR
+    61,  // VIDEO_ENCODE_DPB_BIT_KHR
+    57,  // ACCELERATION_STRUCTURE_VERTEX_BUFFER_BIT_KHR
+    59,  // FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    51,  // STORAGE_READ_WITHOUT_FORMAT
+    52,  // STORAGE_WRITE_WITHOUT_FORMAT
+    53,  // SAMPLED_IMAGE_DEPTH_COMPARISON
+    72,  // WEIGHT_IMAGE_BIT_QCOM
+    73,  // WEIGHT_SAMPLED_IMAGE_BIT_QCOM
+    74,  // BLOCK_MATCHING_BIT_QCOM
+    75,  // BOX_FILTER_SAMPLED_BIT_QCOM
+    62,  // LINEAR_COLOR_ATTACHMENT_BIT_NV
+    93,  // TENSOR_SHADER_BIT_ARM
+    78,  // OPTICAL_FLOW_IMAGE_BIT_NV
+    79,  // OPTICAL_FLOW_VECTOR_BIT_NV
+    80,  // OPTICAL_FLOW_COST_BIT_NV
+    94,  // TENSOR_IMAGE_ALIASING_BIT_ARM
+    115, // BLOCK_MATCHING_SXD_BIT_QCOM
+    116, // SAMPLED_IMAGE_FILTER_LINEAR_2D_BIT_IMG
+    90,  // HOST_IMAGE_TRANSFER
+    82,  // RESERVED_47_BIT_ARM
+    102, // TENSOR_DATA_GRAPH_BIT_ARM
+    88,  // VIDEO_ENCODE_QUANTIZATION_DELTA_MAP_BIT_KHR
+    89,  // VIDEO_ENCODE_EMPHASIS_MAP_BIT_KHR
+    91,  // ACCELERATION_STRUCTURE_RADIUS_BUFFER_BIT_NV
+    106, // DEPTH_COPY_ON_COMPUTE_QUEUE_BIT_KHR
+    107, // DEPTH_COPY_ON_TRANSFER_QUEUE_BIT_KHR
+    108, // STENCIL_COPY_ON_COMPUTE_QUEUE_BIT_KHR
+    109, // STENCIL_COPY_ON_TRANSFER_QUEUE_BIT_KHR
+    112, // DATA_GRAPH_OPTICAL_FLOW_IMAGE_BIT_ARM
+    113, // DATA_GRAPH_OPTICAL_FLOW_VECTOR_BIT_ARM
+    114, // DATA_GRAPH_OPTICAL_FLOW_COST_BIT_ARM
+    105, // COPY_IMAGE_INDIRECT_DST_BIT_KHR
+    104, // RESERVED_60_BIT_EXT
+    110, // RESERVED_61_BIT_HUAWEI
+};
+
 static char const *const VkRenderingFlagsStrings[23] = {
     "CONTENTS_SECONDARY_COMMAND_BUFFERS_BIT_KHR",   // 0x00000001
     "SUSPENDING_BIT_KHR",                           // 0x00000002
@@ -2747,6 +3757,22 @@ static uint32_t const VkRenderingFlagsValues[23] = {
     0x00001000, // RESERVED_12_BIT_VALVE
 };
 
+static uint16_t const VkRenderingFlagsBitIndices[13] = {
+    4,  // CONTENTS_SECONDARY_COMMAND_BUFFERS
+    5,  // SUSPENDING
+    6,  // RESUMING
+    8,  // ENABLE_LEGACY_DITHERING_BIT_EXT
+    9,  // CONTENTS_INLINE_BIT_KHR
+    14, // PER_LAYER_FRAGMENT_DENSITY_BIT_VALVE
+    18, // FRAGMENT_REGION_BIT_EXT
+    19, // CUSTOM_RESOLVE_BIT_EXT
+    17, // LOCAL_READ_CONCURRENT_ACCESS_CONTROL_BIT_KHR
+    16, // RESERVED_9_BIT_IMG
+    20, // RESERVED_10_BIT_VALVE
+    21, // RESERVED_11_BIT_VALVE
+    22, // RESERVED_12_BIT_VALVE
+};
+
 static char const *const VkMemoryDecompressionMethodFlagsEXTStrings[2] = {
     "GDEFLATE_1_0_BIT_NV", // 0x00000001
     "GDEFLATE_1_0",        // 0x00000001
@@ -2757,6 +3783,10 @@ static uint64_t const VkMemoryDecompressionMethodFlagsEXTValues[2] = {
     0x00000001, // GDEFLATE_1_0
 };
 
+static uint16_t const VkMemoryDecompressionMethodFlagsEXTBitIndices[1] = {
+    1, // GDEFLATE_1_0
+};
+
 static char const *const VkDeviceFaultFlagsKHRStrings[6] = {
     "FLAG_DEVICE_LOST",         // 0x00000001
     "FLAG_MEMORY_ADDRESS",      // 0x00000002
@@ -2775,6 +3805,15 @@ static uint32_t const VkDeviceFaultFlagsKHRValues[6] = {
     0x00000020, // FLAG_OVERFLOW
 };
 
+static uint16_t const VkDeviceFaultFlagsKHRBitIndices[6] = {
+    0, // FLAG_DEVICE_LOST
+    1, // FLAG_MEMORY_ADDRESS
+    2, // FLAG_INSTRUCTION_ADDRESS
+    3, // FLAG_VENDOR
+    4, // FLAG_WATCHDOG_TIMEOUT
+    5, // FLAG_OVERFLOW
+};
+
 static char const *const VkBuildMicromapFlagsEXTStrings[3] = {
     "PREFER_FAST_TRACE", // 0x00000001
     "PREFER_FAST_BUILD", // 0x00000002
@@ -2787,6 +3826,12 @@ static uint32_t const VkBuildMicromapFlagsEXTValues[3] = {
     0x00000004, // ALLOW_COMPACTION
 };
 
+static uint16_t const VkBuildMicromapFlagsEXTBitIndices[3] = {
+    0, // PREFER_FAST_TRACE
+    1, // PREFER_FAST_BUILD
+    2, // ALLOW_COMPACTION
+};
+
 static char const *const VkMicromapCreateFlagsEXTStrings[1] = {
     "DEVICE_ADDRESS_CAPTURE_REPLAY", // 0x00000001
 };
@@ -2795,6 +3840,10 @@ static uint32_t const VkMicromapCreateFlagsEXTValues[1] = {
     0x00000001, // DEVICE_ADDRESS_CAPTURE_REPLAY
 };
 
+static uint16_t const VkMicromapCreateFlagsEXTBitIndices[1] = {
+    0, // DEVICE_ADDRESS_CAPTURE_REPLAY
+};
+
 static char const *const VkIndirectCommandsLayoutUsageFlagsEXTStrings[2] = {
     "EXPLICIT_PREPROCESS", // 0x00000001
     "UNORDERED_SEQUENCES", // 0x00000002
@@ -2805,6 +3854,11 @@ static uint32_t const VkIndirectCommandsLayoutUsageFlagsEXTValues[2] = {
     0x00000002, // UNORDERED_SEQUENCES
 };
 
+static uint16_t const VkIndirectCommandsLayoutUsageFlagsEXTBitIndices[2] = {
+    0, // EXPLICIT_PREPROCESS
+    1, // UNORDERED_SEQUENCES
+};
+
 static char const *const VkIndirectCommandsInputModeFlagsEXTStrings[2] = {
     "VULKAN_INDEX_BUFFER", // 0x00000001
     "DXGI_INDEX_BUFFER",   // 0x00000002
@@ -2815,6 +3869,11 @@ static uint32_t const VkIndirectCommandsInputModeFlagsEXTValues[2] = {
     0x00000002, // DXGI_INDEX_BUFFER
 };
 
+static uint16_t const VkIndirectCommandsInputModeFlagsEXTBitIndices[2] = {
+    0, // VULKAN_INDEX_BUFFER
+    1, // DXGI_INDEX_BUFFER
+};
+
 static char const *const VkPipelineCreateFlags2Strings[68] = {
     "RAY_TRACING_OPACITY_MICROMAP_BIT_EXT",                      // 0x01000000
     "DISABLE_OPTIMIZATION_BIT_KHR",                              // 0x00000001
@@ -2957,6 +4016,58 @@ static uint64_t const VkPipelineCreateFlags2Values[68] = {
     0x20000000000,   // OPACITY_MICROMAP_DISALLOW_MIXED_SPECIAL_INDEX_BIT_KHR
 };
 
+static uint16_t const VkPipelineCreateFlags2BitIndices[49] = {
+    11, // DISABLE_OPTIMIZATION
+    12, // ALLOW_DERIVATIVES
+    13, // DERIVATIVE
+    14, // VIEW_INDEX_FROM_DEVICE_INDEX
+    15, // DISPATCH_BASE
+    22, // DEFER_COMPILE_BIT_NV
+    23, // CAPTURE_STATISTICS_BIT_KHR
+    24, // CAPTURE_INTERNAL_REPRESENTATIONS_BIT_KHR
+    16, // FAIL_ON_PIPELINE_COMPILE_REQUIRED
+    17, // EARLY_RETURN_ON_FAILURE
+    25, // LINK_TIME_OPTIMIZATION_BIT_EXT
+    27, // LIBRARY_BIT_KHR
+    28, // RAY_TRACING_SKIP_TRIANGLES_BIT_KHR
+    29, // RAY_TRACING_SKIP_AABBS_BIT_KHR
+    30, // RAY_TRACING_NO_NULL_ANY_HIT_SHADERS_BIT_KHR
+    31, // RAY_TRACING_NO_NULL_CLOSEST_HIT_SHADERS_BIT_KHR
+    32, // RAY_TRACING_NO_NULL_MISS_SHADERS_BIT_KHR
+    33, // RAY_TRACING_NO_NULL_INTERSECTION_SHADERS_BIT_KHR
+    35, // INDIRECT_BINDABLE_BIT_NV
+    34, // RAY_TRACING_SHADER_GROUP_HANDLE_CAPTURE_REPLAY_BIT_KHR
+    36, // RAY_TRACING_ALLOW_MOTION_BIT_NV
+    37, // RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_BIT_KHR
+    38, // RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_BIT_EXT
+    26, // RETAIN_LINK_TIME_OPTIMIZATION_INFO_BIT_EXT
+    66, // RAY_TRACING_OPACITY_MICROMAP_BIT_KHR
+    39, // COLOR_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    40, // DEPTH_STENCIL_ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    18, // NO_PROTECTED_ACCESS
+    41, // RAY_TRACING_DISPLACEMENT_MICROMAP_BIT_NV
+    42, // DESCRIPTOR_BUFFER_BIT_EXT
+    19, // PROTECTED_ACCESS_ONLY
+    43, // CAPTURE_DATA_BIT_KHR
+    20, // EXECUTION_GRAPH_BIT_AMDX
+    51, // RAY_TRACING_ALLOW_SPHERES_AND_LINEAR_SWEPT_SPHERES_BIT_NV
+    21, // ENABLE_LEGACY_DITHERING_BIT_EXT
+    45, // RESERVED_35_BIT_KHR
+    63, // DESCRIPTOR_HEAP_BIT_EXT
+    50, // DISALLOW_OPACITY_MICROMAP_BIT_ARM
+    44, // INDIRECT_BINDABLE_BIT_EXT
+    65, // INSTRUMENT_SHADERS_BIT_ARM
+    56, // PER_LAYER_FRAGMENT_DENSITY_BIT_VALVE
+    67, // OPACITY_MICROMAP_DISALLOW_MIXED_SPECIAL_INDEX_BIT_KHR
+    54, // RESERVED_42_BIT_KHR
+    61, // 64_BIT_INDEXING_BIT_EXT
+    57, // VK_PIPELINE_CREATE_RESERVED_44_BIT_KHR
+    58, // RESERVED_45_BIT_EXT
+    59, // RESERVED_46_BIT_IMG
+    60, // RESERVED_47_BIT_AMD
+    62, // RESERVED_48_BIT_HUAWEI
+};
+
 static char const *const VkBufferUsageFlags2Strings[55] = {
     "TRANSFER_SRC_BIT_KHR",                                 // 0x00000001
     "TRANSFER_DST_BIT_KHR",                                 // 0x00000002
@@ -3073,6 +4184,47 @@ static uint64_t const VkBufferUsageFlags2Values[55] = {
     0x40000000,   // RESERVED_30_BIT_EXT
 };
 
+static uint16_t const VkBufferUsageFlags2BitIndices[38] = {
+    11, // TRANSFER_SRC
+    12, // TRANSFER_DST
+    13, // UNIFORM_TEXEL_BUFFER
+    14, // STORAGE_TEXEL_BUFFER
+    15, // UNIFORM_BUFFER
+    16, // STORAGE_BUFFER
+    17, // INDEX_BUFFER
+    18, // VERTEX_BUFFER
+    19, // INDIRECT_BUFFER
+    24, // CONDITIONAL_RENDERING_BIT_EXT
+    25, // SHADER_BINDING_TABLE_BIT_KHR
+    26, // TRANSFORM_FEEDBACK_BUFFER_BIT_EXT
+    27, // TRANSFORM_FEEDBACK_COUNTER_BUFFER_BIT_EXT
+    28, // VIDEO_DECODE_SRC_BIT_KHR
+    29, // VIDEO_DECODE_DST_BIT_KHR
+    30, // VIDEO_ENCODE_DST_BIT_KHR
+    31, // VIDEO_ENCODE_SRC_BIT_KHR
+    20, // SHADER_DEVICE_ADDRESS
+    53, // RESERVED_18_BIT_EXT
+    32, // ACCELERATION_STRUCTURE_BUILD_INPUT_READ_ONLY_BIT_KHR
+    33, // ACCELERATION_STRUCTURE_STORAGE_BIT_KHR
+    34, // SAMPLER_DESCRIPTOR_BUFFER_BIT_EXT
+    35, // RESOURCE_DESCRIPTOR_BUFFER_BIT_EXT
+    22, // MICROMAP_BUILD_INPUT_READ_ONLY_BIT_EXT
+    23, // MICROMAP_STORAGE_BIT_EXT
+    21, // EXECUTION_GRAPH_SCRATCH_BIT_AMDX
+    36, // PUSH_DESCRIPTORS_DESCRIPTOR_BUFFER_BIT_EXT
+    42, // TILE_MEMORY_BIT_QCOM
+    52, // DESCRIPTOR_HEAP_BIT_EXT
+    45, // DATA_GRAPH_FOREIGN_DESCRIPTOR_BIT_ARM
+    54, // RESERVED_30_BIT_EXT
+    37, // PREPROCESS_BUFFER_BIT_EXT
+    50, // MEMORY_DECOMPRESSION_BIT_EXT
+    46, // COMPRESSED_DATA_DGF1_BIT_AMDX
+    47, // RESERVED_34_BIT_EXT
+    48, // RESERVED_35_BIT_KHR
+    49, // RESERVED_36_BIT_KHR
+    51, // RESERVED_37_BIT_HUAWEI
+};
+
 static char const *const VkImageUsageFlags2KHRStrings[32] = {
     "TRANSFER_SRC",                        // 0x00000001
     "TRANSFER_DST",                        // 0x00000002
@@ -3143,6 +4295,41 @@ static uint64_t const VkImageUsageFlags2KHRValues[32] = {
     0x08000000, // TILE_MEMORY_BIT_QCOM
 };
 
+static uint16_t const VkImageUsageFlags2KHRBitIndices[32] = {
+    0,  // TRANSFER_SRC
+    1,  // TRANSFER_DST
+    2,  // SAMPLED
+    3,  // STORAGE
+    4,  // COLOR_ATTACHMENT
+    5,  // DEPTH_STENCIL_ATTACHMENT
+    6,  // TRANSIENT_ATTACHMENT
+    7,  // INPUT_ATTACHMENT
+    15, // FRAGMENT_SHADING_RATE_ATTACHMENT
+    16, // FRAGMENT_DENSITY_MAP_BIT_EXT
+    17, // VIDEO_DECODE_DST
+    18, // VIDEO_DECODE_SRC
+    19, // VIDEO_DECODE_DPB
+    20, // VIDEO_ENCODE_DST
+    21, // VIDEO_ENCODE_SRC
+    22, // VIDEO_ENCODE_DPB
+    13, // RESERVED_16_BIT_HUAWEI
+    14, // RESERVED_27_BIT_HUAWEI
+    23, // INVOCATION_MASK_BIT_HUAWEI
+    24, // ATTACHMENT_FEEDBACK_LOOP_BIT_EXT
+    25, // SAMPLE_WEIGHT_BIT_QCOM
+    26, // SAMPLE_BLOCK_MATCH_BIT_QCOM
+    27, // HOST_TRANSFER
+    28, // TENSOR_ALIASING_BIT_ARM
+    9,  // RESERVED_24_BIT_COREAVI
+    29, // VIDEO_ENCODE_QUANTIZATION_DELTA_MAP
+    30, // VIDEO_ENCODE_EMPHASIS_MAP
+    31, // TILE_MEMORY_BIT_QCOM
+    10, // RESERVED_28_BIT_EXT
+    11, // RESERVED_29
+    12, // RESERVED_30
+    8,  // RESERVED_31_BIT_EXT
+};
+
 static char const *const VkImageCreateFlags2KHRStrings[23] = {
     "SPARSE_BINDING",                                // 0x00000001
     "SPARSE_RESIDENCY",                              // 0x00000002
@@ -3195,6 +4382,32 @@ static uint64_t const VkImageCreateFlags2KHRValues[23] = {
     0x00080000, // RESERVED_19_BIT_NV
 };
 
+static uint16_t const VkImageCreateFlags2KHRBitIndices[23] = {
+    0,  // SPARSE_BINDING
+    1,  // SPARSE_RESIDENCY
+    2,  // SPARSE_ALIASED
+    3,  // MUTABLE_FORMAT
+    4,  // CUBE_COMPATIBLE
+    7,  // 2D_ARRAY_COMPATIBLE
+    8,  // SPLIT_INSTANCE_BIND_REGIONS
+    9,  // BLOCK_TEXEL_VIEW_COMPATIBLE
+    10, // EXTENDED_USAGE
+    11, // DISJOINT
+    12, // ALIAS
+    13, // PROTECTED
+    14, // SAMPLE_LOCATIONS_COMPATIBLE_DEPTH_BIT_EXT
+    15, // CORNER_SAMPLED_BIT_NV
+    16, // SUBSAMPLED_BIT_EXT
+    17, // FRAGMENT_DENSITY_MAP_OFFSET_BIT_EXT
+    18, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY_BIT_EXT
+    19, // 2D_VIEW_COMPATIBLE_BIT_EXT
+    20, // MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT
+    22, // RESERVED_19_BIT_NV
+    21, // VIDEO_PROFILE_INDEPENDENT
+    5,  // RESERVED_21_BIT_IMG
+    6,  // ALIAS_SINGLE_LAYER_DESCRIPTOR
+};
+
 static char const *const VkAddressCopyFlagsKHRStrings[3] = {
     "DEVICE_LOCAL", // 0x00000001
     "SPARSE",       // 0x00000002
@@ -3207,6 +4420,12 @@ static uint32_t const VkAddressCopyFlagsKHRValues[3] = {
     0x00000004, // PROTECTED
 };
 
+static uint16_t const VkAddressCopyFlagsKHRBitIndices[3] = {
+    0, // DEVICE_LOCAL
+    1, // SPARSE
+    2, // PROTECTED
+};
+
 static char const *const VkTensorCreateFlagsARMStrings[5] = {
     "MUTABLE_FORMAT",                   // 0x00000001
     "PROTECTED",                        // 0x00000002
@@ -3223,6 +4442,13 @@ static uint64_t const VkTensorCreateFlagsARMValues[5] = {
     0x00000008, // DESCRIPTOR_HEAP_CAPTURE_REPLAY
 };
 
+static uint16_t const VkTensorCreateFlagsARMBitIndices[4] = {
+    0, // MUTABLE_FORMAT
+    1, // PROTECTED
+    2, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY
+    4, // DESCRIPTOR_HEAP_CAPTURE_REPLAY
+};
+
 static char const *const VkTensorUsageFlagsARMStrings[5] = {
     "SHADER",         // 0x00000002
     "TRANSFER_SRC",   // 0x00000004
@@ -3239,6 +4465,15 @@ static uint64_t const VkTensorUsageFlagsARMValues[5] = {
     0x00000020, // DATA_GRAPH
 };
 
+static uint16_t const VkTensorUsageFlagsARMBitIndices[6] = {
+    cNoValueIndex, // bit 0
+    0,             // SHADER
+    1,             // TRANSFER_SRC
+    2,             // TRANSFER_DST
+    3,             // IMAGE_ALIASING
+    4,             // DATA_GRAPH
+};
+
 static char const *const VkTensorViewCreateFlagsARMStrings[1] = {
     "DESCRIPTOR_BUFFER_CAPTURE_REPLAY", // 0x00000001
 };
@@ -3247,6 +4482,10 @@ static uint64_t const VkTensorViewCreateFlagsARMValues[1] = {
     0x00000001, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY
 };
 
+static uint16_t const VkTensorViewCreateFlagsARMBitIndices[1] = {
+    0, // DESCRIPTOR_BUFFER_CAPTURE_REPLAY
+};
+
 static char const *const VkDataGraphPipelineSessionCreateFlagsARMStrings[2] = {
     "PROTECTED",          // 0x00000001
     "OPTICAL_FLOW_CACHE", // 0x00000002
@@ -3257,6 +4496,11 @@ static uint64_t const VkDataGraphPipelineSessionCreateFlagsARMValues[2] = {
     0x00000002, // OPTICAL_FLOW_CACHE
 };
 
+static uint16_t const VkDataGraphPipelineSessionCreateFlagsARMBitIndices[2] = {
+    0, // PROTECTED
+    1, // OPTICAL_FLOW_CACHE
+};
+
 static char const *const VkVideoEncodeRgbModelConversionFlagsVALVEStrings[5] = {
     "RGB_IDENTITY",   // 0x00000001
     "YCBCR_IDENTITY", // 0x00000002
@@ -3273,6 +4517,14 @@ static uint32_t const VkVideoEncodeRgbModelConversionFlagsVALVEValues[5] = {
     0x00000010, // YCBCR_2020
 };
 
+static uint16_t const VkVideoEncodeRgbModelConversionFlagsVALVEBitIndices[5] = {
+    0, // RGB_IDENTITY
+    1, // YCBCR_IDENTITY
+    2, // YCBCR_709
+    3, // YCBCR_601
+    4, // YCBCR_2020
+};
+
 static char const *const VkVideoEncodeRgbRangeCompressionFlagsVALVEStrings[2] = {
     "FULL_RANGE",   // 0x00000001
     "NARROW_RANGE", // 0x00000002
@@ -3283,6 +4535,11 @@ static uint32_t const VkVideoEncodeRgbRangeCompressionFlagsVALVEValues[2] = {
     0x00000002, // NARROW_RANGE
 };
 
+static uint16_t const VkVideoEncodeRgbRangeCompressionFlagsVALVEBitIndices[2] = {
+    0, // FULL_RANGE
+    1, // NARROW_RANGE
+};
+
 static char const *const VkVideoEncodeRgbChromaOffsetFlagsVALVEStrings[2] = {
     "COSITED_EVEN", // 0x00000001
     "MIDPOINT",     // 0x00000002
@@ -3293,6 +4550,11 @@ static uint32_t const VkVideoEncodeRgbChromaOffsetFlagsVALVEValues[2] = {
     0x00000002, // MIDPOINT
 };
 
+static uint16_t const VkVideoEncodeRgbChromaOffsetFlagsVALVEBitIndices[2] = {
+    0, // COSITED_EVEN
+    1, // MIDPOINT
+};
+
 static char const *const VkSpirvResourceTypeFlagsEXTStrings[11] = {
     "ALL",                       // 0x7FFFFFFF
     "SAMPLER",                   // 0x00000001
@@ -3321,6 +4583,23 @@ static uint32_t const VkSpirvResourceTypeFlagsEXTValues[11] = {
     0x00000200, // TENSOR_BIT_ARM
 };
 
+static uint16_t const VkSpirvResourceTypeFlagsEXTBitIndices[10] = {
+    1,  // SAMPLER
+    2,  // SAMPLED_IMAGE
+    3,  // READ_ONLY_IMAGE
+    4,  // READ_WRITE_IMAGE
+    5,  // COMBINED_SAMPLED_IMAGE
+    6,  // UNIFORM_BUFFER
+    7,  // READ_ONLY_STORAGE_BUFFER
+    8,  // READ_WRITE_STORAGE_BUFFER
+    9,  // ACCELERATION_STRUCTURE
+    10, // TENSOR_BIT_ARM
+};
+
+static uint16_t const VkSpirvResourceTypeFlagsEXTCombinedIndices[1] = {
+    0, // ALL
+};
+
 static char const *const VkGpaSqShaderStageFlagsAMDStrings[7] = {
     "PS", // 0x00000001
     "VS", // 0x00000002
@@ -3341,6 +4620,16 @@ static uint32_t const VkGpaSqShaderStageFlagsAMDValues[7] = {
     0x00000040, // CS
 };
 
+static uint16_t const VkGpaSqShaderStageFlagsAMDBitIndices[7] = {
+    0, // PS
+    1, // VS
+    2, // GS
+    3, // ES
+    4, // HS
+    5, // LS
+    6, // CS
+};
+
 static char const *const VkAddressCommandFlagsKHRStrings[6] = {
     "PROTECTED",                               // 0x00000001
     "FULLY_BOUND",                             // 0x00000002
@@ -3359,6 +4648,15 @@ static uint32_t const VkAddressCommandFlagsKHRValues[6] = {
     0x00000020, // UNKNOWN_TRANSFORM_FEEDBACK_BUFFER_USAGE
 };
 
+static uint16_t const VkAddressCommandFlagsKHRBitIndices[6] = {
+    0, // PROTECTED
+    1, // FULLY_BOUND
+    2, // STORAGE_BUFFER_USAGE
+    3, // UNKNOWN_STORAGE_BUFFER_USAGE
+    4, // TRANSFORM_FEEDBACK_BUFFER_USAGE
+    5, // UNKNOWN_TRANSFORM_FEEDBACK_BUFFER_USAGE
+};
+
 static char const *const VkCompositeAlphaFlagsKHRStrings[4] = {
     "OPAQUE",          // 0x00000001
     "PRE_MULTIPLIED",  // 0x00000002
@@ -3373,6 +4671,13 @@ static uint32_t const VkCompositeAlphaFlagsKHRValues[4] = {
     0x00000008, // INHERIT
 };
 
+static uint16_t const VkCompositeAlphaFlagsKHRBitIndices[4] = {
+    0, // OPAQUE
+    1, // PRE_MULTIPLIED
+    2, // POST_MULTIPLIED
+    3, // INHERIT
+};
+
 static char const *const VkDisplayPlaneAlphaFlagsKHRStrings[4] = {
     "OPAQUE",                  // 0x00000001
     "GLOBAL",                  // 0x00000002
@@ -3387,6 +4692,13 @@ static uint32_t const VkDisplayPlaneAlphaFlagsKHRValues[4] = {
     0x00000008, // PER_PIXEL_PREMULTIPLIED
 };
 
+static uint16_t const VkDisplayPlaneAlphaFlagsKHRBitIndices[4] = {
+    0, // OPAQUE
+    1, // GLOBAL
+    2, // PER_PIXEL
+    3, // PER_PIXEL_PREMULTIPLIED
+};
+
 static char const *const VkSurfaceTransformFlagsKHRStrings[9] = {
     "IDENTITY",                     // 0x00000001
     "ROTATE_90",                    // 0x00000002
@@ -3411,6 +4723,18 @@ static uint32_t const VkSurfaceTransformFlagsKHRValues[9] = {
     0x00000100, // INHERIT
 };
 
+static uint16_t const VkSurfaceTransformFlagsKHRBitIndices[9] = {
+    0, // IDENTITY
+    1, // ROTATE_90
+    2, // ROTATE_180
+    3, // ROTATE_270
+    4, // HORIZONTAL_MIRROR
+    5, // HORIZONTAL_MIRROR_ROTATE_90
+    6, // HORIZONTAL_MIRROR_ROTATE_180
+    7, // HORIZONTAL_MIRROR_ROTATE_270
+    8, // INHERIT
+};
+
 static char const *const VkSwapchainCreateFlagsKHRStrings[15] = {
     "DEFERRED_MEMORY_ALLOCATION_BIT_EXT",            // 0x00000008
     "SPLIT_INSTANCE_BIND_REGIONS",                   // 0x00000001
@@ -3447,6 +4771,20 @@ static uint32_t const VkSwapchainCreateFlagsKHRValues[15] = {
     0x00000400, // RESERVED_10_BIT_HUAWEI
 };
 
+static uint16_t const VkSwapchainCreateFlagsKHRBitIndices[11] = {
+    1,  // SPLIT_INSTANCE_BIND_REGIONS
+    2,  // PROTECTED
+    3,  // MUTABLE_FORMAT
+    9,  // DEFERRED_MEMORY_ALLOCATION
+    5,  // RESERVED_4_BIT_EXT
+    6,  // RESERVED_5_BIT_EXT
+    7,  // PRESENT_ID_2
+    8,  // PRESENT_WAIT_2
+    13, // MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_BIT_EXT
+    12, // PRESENT_TIMING_BIT_EXT
+    14, // RESERVED_10_BIT_HUAWEI
+};
+
 static char const *const VkWaylandSurfaceCreateFlagsKHRStrings[1] = {
     "DISABLE_COLOR_MANAGEMENT", // 0x00000001
 };
@@ -3455,6 +4793,10 @@ static uint32_t const VkWaylandSurfaceCreateFlagsKHRValues[1] = {
     0x00000001, // DISABLE_COLOR_MANAGEMENT
 };
 
+static uint16_t const VkWaylandSurfaceCreateFlagsKHRBitIndices[1] = {
+    0, // DISABLE_COLOR_MANAGEMENT
+};
+
 static char const *const VkPeerMemoryFeatureFlagsStrings[8] = {
     "COPY_SRC_BIT_KHR",    // 0x00000001
     "COPY_DST_BIT_KHR",    // 0x00000002
@@ -3477,6 +4819,13 @@ static uint32_t const VkPeerMemoryFeatureFlagsValues[8] = {
     0x00000008, // GENERIC_DST
 };
 
+static uint16_t const VkPeerMemoryFeatureFlagsBitIndices[4] = {
+    4, // COPY_SRC
+    5, // COPY_DST
+    6, // GENERIC_SRC
+    7, // GENERIC_DST
+};
+
 static char const *const VkMemoryAllocateFlagsStrings[8] = {
     "DEVICE_MASK_BIT_KHR",                   // 0x00000001
     "DEVICE_ADDRESS_BIT_KHR",                // 0x00000002
@@ -3499,6 +4848,13 @@ static uint32_t const VkMemoryAllocateFlagsValues[8] = {
     0x00000008, // ZERO_INITIALIZE_BIT_EXT
 };
 
+static uint16_t const VkMemoryAllocateFlagsBitIndices[4] = {
+    3, // DEVICE_MASK
+    4, // DEVICE_ADDRESS
+    5, // DEVICE_ADDRESS_CAPTURE_REPLAY
+    7, // ZERO_INITIALIZE_BIT_EXT
+};
+
 static char const *const VkDeviceGroupPresentModeFlagsKHRStrings[4] = {
     "LOCAL",              // 0x00000001
     "REMOTE",             // 0x00000002
@@ -3513,6 +4869,13 @@ static uint32_t const VkDeviceGroupPresentModeFlagsKHRValues[4] = {
     0x00000008, // LOCAL_MULTI_DEVICE
 };
 
+static uint16_t const VkDeviceGroupPresentModeFlagsKHRBitIndices[4] = {
+    0, // LOCAL
+    1, // REMOTE
+    2, // SUM
+    3, // LOCAL_MULTI_DEVICE
+};
+
 static char const *const VkDebugReportFlagsEXTStrings[5] = {
     "INFORMATION",         // 0x00000001
     "WARNING",             // 0x00000002
@@ -3529,6 +4892,14 @@ static uint32_t const VkDebugReportFlagsEXTValues[5] = {
     0x00000010, // DEBUG
 };
 
+static uint16_t const VkDebugReportFlagsEXTBitIndices[5] = {
+    0, // INFORMATION
+    1, // WARNING
+    2, // PERFORMANCE_WARNING
+    3, // ERROR
+    4, // DEBUG
+};
+
 static char const *const VkExternalMemoryHandleTypeFlagsNVStrings[4] = {
     "OPAQUE_WIN32",     // 0x00000001
     "OPAQUE_WIN32_KMT", // 0x00000002
@@ -3543,6 +4914,13 @@ static uint32_t const VkExternalMemoryHandleTypeFlagsNVValues[4] = {
     0x00000008, // D3D11_IMAGE_KMT
 };
 
+static uint16_t const VkExternalMemoryHandleTypeFlagsNVBitIndices[4] = {
+    0, // OPAQUE_WIN32
+    1, // OPAQUE_WIN32_KMT
+    2, // D3D11_IMAGE
+    3, // D3D11_IMAGE_KMT
+};
+
 static char const *const VkClusterAccelerationStructureIndexFormatFlagsNVStrings[3] = {
     "8BIT",  // 0x00000001
     "16BIT", // 0x00000002
@@ -3555,6 +4933,12 @@ static uint32_t const VkClusterAccelerationStructureIndexFormatFlagsNVValues[3]
     0x00000004, // 32BIT
 };
 
+static uint16_t const VkClusterAccelerationStructureIndexFormatFlagsNVBitIndices[3] = {
+    0, // 8BIT
+    1, // 16BIT
+    2, // 32BIT
+};
+
 static char const *const VkExternalMemoryFeatureFlagsNVStrings[3] = {
     "DEDICATED_ONLY", // 0x00000001
     "EXPORTABLE",     // 0x00000002
@@ -3567,6 +4951,12 @@ static uint32_t const VkExternalMemoryFeatureFlagsNVValues[3] = {
     0x00000004, // IMPORTABLE
 };
 
+static uint16_t const VkExternalMemoryFeatureFlagsNVBitIndices[3] = {
+    0, // DEDICATED_ONLY
+    1, // EXPORTABLE
+    2, // IMPORTABLE
+};
+
 static char const *const VkExternalMemoryHandleTypeFlagsStrings[32] = {
     "OPAQUE_FD_BIT_KHR",                   // 0x00000001
     "OPAQUE_WIN32_BIT_KHR",                // 0x00000002
@@ -3637,6 +5027,28 @@ static uint32_t const VkExternalMemoryHandleTypeFlagsValues[32] = {
     0x00008000, // OH_NATIVE_BUFFER_BIT_OHOS
 };
 
+static uint16_t const VkExternalMemoryHandleTypeFlagsBitIndices[19] = {
+    7,  // OPAQUE_FD
+    8,  // OPAQUE_WIN32
+    9,  // OPAQUE_WIN32_KMT
+    10, // D3D11_TEXTURE
+    11, // D3D11_TEXTURE_KMT
+    12, // D3D12_HEAP
+    13, // D3D12_RESOURCE
+    16, // HOST_ALLOCATION_BIT_EXT
+    17, // HOST_MAPPED_FOREIGN_MEMORY_BIT_EXT
+    14, // DMA_BUF_BIT_EXT
+    15, // ANDROID_HARDWARE_BUFFER_BIT_ANDROID
+    18, // ZIRCON_VMO_BIT_FUCHSIA
+    21, // RDMA_ADDRESS_BIT_NV
+    22, // SCI_BUF_BIT_NV
+    24, // SCREEN_BUFFER_BIT_QNX
+    31, // OH_NATIVE_BUFFER_BIT_OHOS
+    28, // MTLBUFFER_BIT_EXT
+    29, // MTLTEXTURE_BIT_EXT
+    30, // MTLHEAP_BIT_EXT
+};
+
 static char const *const VkExternalMemoryFeatureFlagsStrings[6] = {
     "DEDICATED_ONLY_BIT_KHR", // 0x00000001
     "EXPORTABLE_BIT_KHR",     // 0x00000002
@@ -3655,6 +5067,12 @@ static uint32_t const VkExternalMemoryFeatureFlagsValues[6] = {
     0x00000004, // IMPORTABLE
 };
 
+static uint16_t const VkExternalMemoryFeatureFlagsBitIndices[3] = {
+    3, // DEDICATED_ONLY
+    4, // EXPORTABLE
+    5, // IMPORTABLE
+};
+
 static char const *const VkExternalSemaphoreHandleTypeFlagsStrings[15] = {
     "OPAQUE_FD_BIT_KHR",        // 0x00000001
     "OPAQUE_WIN32_BIT_KHR",     // 0x00000002
@@ -3691,6 +5109,17 @@ static uint32_t const VkExternalSemaphoreHandleTypeFlagsValues[15] = {
     0x00000020, // SCI_SYNC_OBJ_BIT_NV
 };
 
+static uint16_t const VkExternalSemaphoreHandleTypeFlagsBitIndices[8] = {
+    6,  // OPAQUE_FD
+    7,  // OPAQUE_WIN32
+    8,  // OPAQUE_WIN32_KMT
+    9,  // D3D12_FENCE
+    10, // SYNC_FD
+    14, // SCI_SYNC_OBJ_BIT_NV
+    12, // RESERVED_6_BIT_NV
+    13, // ZIRCON_EVENT_BIT_FUCHSIA
+};
+
 static char const *const VkExternalSemaphoreFeatureFlagsStrings[4] = {
     "EXPORTABLE_BIT_KHR", // 0x00000001
     "IMPORTABLE_BIT_KHR", // 0x00000002
@@ -3705,6 +5134,11 @@ static uint32_t const VkExternalSemaphoreFeatureFlagsValues[4] = {
     0x00000002, // IMPORTABLE
 };
 
+static uint16_t const VkExternalSemaphoreFeatureFlagsBitIndices[2] = {
+    2, // EXPORTABLE
+    3, // IMPORTABLE
+};
+
 static char const *const VkSemaphoreImportFlagsStrings[2] = {
     "TEMPORARY_BIT_KHR", // 0x00000001
     "TEMPORARY",         // 0x00000001
@@ -3715,6 +5149,10 @@ static uint32_t const VkSemaphoreImportFlagsValues[2] = {
     0x00000001, // TEMPORARY
 };
 
+static uint16_t const VkSemaphoreImportFlagsBitIndices[1] = {
+    1, // TEMPORARY
+};
+
 static char const *const VkExternalFenceHandleTypeFlagsStrings[12] = {
     "OPAQUE_FD_BIT_KHR",        // 0x00000001
     "OPAQUE_WIN32_BIT_KHR",     // 0x00000002
@@ -3745,6 +5183,15 @@ static uint32_t const VkExternalFenceHandleTypeFlagsValues[12] = {
     0x00000020, // SCI_SYNC_FENCE_BIT_NV
 };
 
+static uint16_t const VkExternalFenceHandleTypeFlagsBitIndices[6] = {
+    4,  // OPAQUE_FD
+    5,  // OPAQUE_WIN32
+    6,  // OPAQUE_WIN32_KMT
+    7,  // SYNC_FD
+    10, // SCI_SYNC_OBJ_BIT_NV
+    11, // SCI_SYNC_FENCE_BIT_NV
+};
+
 static char const *const VkExternalFenceFeatureFlagsStrings[4] = {
     "EXPORTABLE_BIT_KHR", // 0x00000001
     "IMPORTABLE_BIT_KHR", // 0x00000002
@@ -3759,6 +5206,11 @@ static uint32_t const VkExternalFenceFeatureFlagsValues[4] = {
     0x00000002, // IMPORTABLE
 };
 
+static uint16_t const VkExternalFenceFeatureFlagsBitIndices[2] = {
+    2, // EXPORTABLE
+    3, // IMPORTABLE
+};
+
 static char const *const VkFenceImportFlagsStrings[2] = {
     "TEMPORARY_BIT_KHR", // 0x00000001
     "TEMPORARY",         // 0x00000001
@@ -3769,6 +5221,10 @@ static uint32_t const VkFenceImportFlagsValues[2] = {
     0x00000001, // TEMPORARY
 };
 
+static uint16_t const VkFenceImportFlagsBitIndices[1] = {
+    1, // TEMPORARY
+};
+
 static char const *const VkSurfaceCounterFlagsEXTStrings[2] = {
     "VBLANK", // 0x00000001
     "VBLANK", // 0x00000001
@@ -3779,6 +5235,10 @@ static uint32_t const VkSurfaceCounterFlagsEXTValues[2] = {
     0x00000001, // VBLANK
 };
 
+static uint16_t const VkSurfaceCounterFlagsEXTBitIndices[1] = {
+    1, // VBLANK
+};
+
 static char const *const VkDebugUtilsMessageSeverityFlagsEXTStrings[4] = {
     "VERBOSE", // 0x00000001
     "INFO",    // 0x00000010
@@ -3793,6 +5253,22 @@ static uint32_t const VkDebugUtilsMessageSeverityFlagsEXTValues[4] = {
     0x00001000, // ERROR
 };
 
+static uint16_t const VkDebugUtilsMessageSeverityFlagsEXTBitIndices[13] = {
+    0,             // VERBOSE
+    cNoValueIndex, // bit 1
+    cNoValueIndex, // bit 2
+    cNoValueIndex, // bit 3
+    1,             // INFO
+    cNoValueIndex, // bit 5
+    cNoValueIndex, // bit 6
+    cNoValueIndex, // bit 7
+    2,             // WARNING
+    cNoValueIndex, // bit 9
+    cNoValueIndex, // bit 10
+    cNoValueIndex, // bit 11
+    3,             // ERROR
+};
+
 static char const *const VkDebugUtilsMessageTypeFlagsEXTStrings[4] = {
     "GENERAL",                // 0x00000001
     "VALIDATION",             // 0x00000002
@@ -3807,6 +5283,13 @@ static uint32_t const VkDebugUtilsMessageTypeFlagsEXTValues[4] = {
     0x00000008, // DEVICE_ADDRESS_BINDING
 };
 
+static uint16_t const VkDebugUtilsMessageTypeFlagsEXTBitIndices[4] = {
+    0, // GENERAL
+    1, // VALIDATION
+    2, // PERFORMANCE
+    3, // DEVICE_ADDRESS_BINDING
+};
+
 static char const *const VkDescriptorBindingFlagsStrings[9] = {
     "UPDATE_AFTER_BIND_BIT_EXT",           // 0x00000001
     "UPDATE_UNUSED_WHILE_PENDING_BIT_EXT", // 0x00000002
@@ -3831,6 +5314,14 @@ static uint32_t const VkDescriptorBindingFlagsValues[9] = {
     0x00000010, // RESERVED_4_BIT_QCOM
 };
 
+static uint16_t const VkDescriptorBindingFlagsBitIndices[5] = {
+    4, // UPDATE_AFTER_BIND
+    5, // UPDATE_UNUSED_WHILE_PENDING
+    6, // PARTIALLY_BOUND
+    7, // VARIABLE_DESCRIPTOR_COUNT
+    8, // RESERVED_4_BIT_QCOM
+};
+
 static char const *const VkConditionalRenderingFlagsEXTStrings[1] = {
     "INVERTED", // 0x00000001
 };
@@ -3839,6 +5330,10 @@ static uint32_t const VkConditionalRenderingFlagsEXTValues[1] = {
     0x00000001, // INVERTED
 };
 
+static uint16_t const VkConditionalRenderingFlagsEXTBitIndices[1] = {
+    0, // INVERTED
+};
+
 static char const *const VkResolveModeFlagsStrings[16] = {
     "NONE_KHR",                               // 0
     "SAMPLE_ZERO_BIT_KHR",                    // 0x00000001
@@ -3877,6 +5372,20 @@ static uint32_t const VkResolveModeFlagsValues[16] = {
     0x00000020, // CUSTOM_BIT_EXT
 };
 
+static uint16_t const VkResolveModeFlagsBitIndices[6] = {
+    7,  // SAMPLE_ZERO
+    8,  // AVERAGE
+    9,  // MIN
+    10, // MAX
+    14, // EXTERNAL_FORMAT_DOWNSAMPLE_BIT_ANDROID
+    15, // CUSTOM_BIT_EXT
+};
+
+static uint16_t const VkResolveModeFlagsCombinedIndices[2] = {
+    6, // NONE
+    0, // NONE_KHR
+};
+
 static char const *const VkSwapchainImageUsageFlagsANDROIDStrings[1] = {
     "SHARED", // 0x00000001
 };
@@ -3885,6 +5394,10 @@ static uint32_t const VkSwapchainImageUsageFlagsANDROIDValues[1] = {
     0x00000001, // SHARED
 };
 
+static uint16_t const VkSwapchainImageUsageFlagsANDROIDBitIndices[1] = {
+    0, // SHARED
+};
+
 static char const *const VkToolPurposeFlagsStrings[12] = {
     "VALIDATION_BIT_EXT",          // 0x00000001
     "PROFILING_BIT_EXT",           // 0x00000002
@@ -3915,6 +5428,16 @@ static uint32_t const VkToolPurposeFlagsValues[12] = {
     0x00000040, // DEBUG_MARKERS_BIT_EXT
 };
 
+static uint16_t const VkToolPurposeFlagsBitIndices[7] = {
+    5,  // VALIDATION
+    6,  // PROFILING
+    7,  // TRACING
+    8,  // ADDITIONAL_FEATURES
+    9,  // MODIFYING_FEATURES
+    10, // DEBUG_REPORTING_BIT_EXT
+    11, // DEBUG_MARKERS_BIT_EXT
+};
+
 static char const *const VkSubmitFlagsStrings[2] = {
     "PROTECTED_BIT_KHR", // 0x00000001
     "PROTECTED",         // 0x00000001
@@ -3925,6 +5448,10 @@ static uint32_t const VkSubmitFlagsValues[2] = {
     0x00000001, // PROTECTED
 };
 
+static uint16_t const VkSubmitFlagsBitIndices[1] = {
+    1, // PROTECTED
+};
+
 static char const *const VkHostImageCopyFlagsStrings[4] = {
     "MEMCPY",         // 0x00000001
     "MEMCPY_EXT",     // 0x00000001
@@ -3939,6 +5466,10 @@ static uint32_t const VkHostImageCopyFlagsValues[4] = {
     0x00000001, // MEMCPY
 };
 
+static uint16_t const VkHostImageCopyFlagsBitIndices[1] = {
+    3, // MEMCPY
+};
+
 static char const *const VkPartitionedAccelerationStructureInstanceFlagsNVStrings[5] = {
     "FLAG_TRIANGLE_FACING_CULL_DISABLE", // 0x00000001
     "FLAG_TRIANGLE_FLIP_FACING",         // 0x00000002
@@ -3955,6 +5486,14 @@ static uint32_t const VkPartitionedAccelerationStructureInstanceFlagsNVValues[5]
     0x00000010, // FLAG_ENABLE_EXPLICIT_BOUNDING_BOX
 };
 
+static uint16_t const VkPartitionedAccelerationStructureInstanceFlagsNVBitIndices[5] = {
+    0, // FLAG_TRIANGLE_FACING_CULL_DISABLE
+    1, // FLAG_TRIANGLE_FLIP_FACING
+    2, // FLAG_FORCE_OPAQUE
+    3, // FLAG_FORCE_NO_OPAQUE
+    4, // FLAG_ENABLE_EXPLICIT_BOUNDING_BOX
+};
+
 static char const *const VkImageConstraintsInfoFlagsFUCHSIAStrings[5] = {
     "CPU_READ_RARELY",    // 0x00000001
     "CPU_READ_OFTEN",     // 0x00000002
@@ -3971,6 +5510,14 @@ static uint32_t const VkImageConstraintsInfoFlagsFUCHSIAValues[5] = {
     0x00000010, // PROTECTED_OPTIONAL
 };
 
+static uint16_t const VkImageConstraintsInfoFlagsFUCHSIABitIndices[5] = {
+    0, // CPU_READ_RARELY
+    1, // CPU_READ_OFTEN
+    2, // CPU_WRITE_RARELY
+    3, // CPU_WRITE_OFTEN
+    4, // PROTECTED_OPTIONAL
+};
+
 static char const *const VkGraphicsPipelineLibraryFlagsEXTStrings[4] = {
     "VERTEX_INPUT_INTERFACE",    // 0x00000001
     "PRE_RASTERIZATION_SHADERS", // 0x00000002
@@ -3985,6 +5532,13 @@ static uint32_t const VkGraphicsPipelineLibraryFlagsEXTValues[4] = {
     0x00000008, // FRAGMENT_OUTPUT_INTERFACE
 };
 
+static uint16_t const VkGraphicsPipelineLibraryFlagsEXTBitIndices[4] = {
+    0, // VERTEX_INPUT_INTERFACE
+    1, // PRE_RASTERIZATION_SHADERS
+    2, // FRAGMENT_SHADER
+    3, // FRAGMENT_OUTPUT_INTERFACE
+};
+
 static char const *const VkImageCompressionFlagsEXTStrings[4] = {
     "DEFAULT",             // 0
     "FIXED_RATE_DEFAULT",  // 0x00000001
@@ -3999,6 +5553,16 @@ static uint32_t const VkImageCompressionFlagsEXTValues[4] = {
     0x00000004, // DISABLED
 };
 
+static uint16_t const VkImageCompressionFlagsEXTBitIndices[3] = {
+    1, // FIXED_RATE_DEFAULT
+    2, // FIXED_RATE_EXPLICIT
+    3, // DISABLED
+};
+
+static uint16_t const VkImageCompressionFlagsEXTCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkImageCompressionFixedRateFlagsEXTStrings[25] = {
     "NONE",  // 0
     "1BPC",  // 0x00000001
@@ -4055,6 +5619,37 @@ static uint32_t const VkImageCompressionFixedRateFlagsEXTValues[25] = {
     0x00800000, // 24BPC
 };
 
+static uint16_t const VkImageCompressionFixedRateFlagsEXTBitIndices[24] = {
+    1,  // 1BPC
+    2,  // 2BPC
+    3,  // 3BPC
+    4,  // 4BPC
+    5,  // 5BPC
+    6,  // 6BPC
+    7,  // 7BPC
+    8,  // 8BPC
+    9,  // 9BPC
+    10, // 10BPC
+    11, // 11BPC
+    12, // 12BPC
+    13, // 13BPC
+    14, // 14BPC
+    15, // 15BPC
+    16, // 16BPC
+    17, // 17BPC
+    18, // 18BPC
+    19, // 19BPC
+    20, // 20BPC
+    21, // 21BPC
+    22, // 22BPC
+    23, // 23BPC
+    24, // 24BPC
+};
+
+static uint16_t const VkImageCompressionFixedRateFlagsEXTCombinedIndices[1] = {
+    0, // NONE
+};
+
 static char const *const VkExportMetalObjectTypeFlagsEXTStrings[6] = {
     "METAL_DEVICE",        // 0x00000001
     "METAL_COMMAND_QUEUE", // 0x00000002
@@ -4073,6 +5668,15 @@ static uint32_t const VkExportMetalObjectTypeFlagsEXTValues[6] = {
     0x00000020, // METAL_SHARED_EVENT
 };
 
+static uint16_t const VkExportMetalObjectTypeFlagsEXTBitIndices[6] = {
+    0, // METAL_DEVICE
+    1, // METAL_COMMAND_QUEUE
+    2, // METAL_BUFFER
+    3, // METAL_TEXTURE
+    4, // METAL_IOSURFACE
+    5, // METAL_SHARED_EVENT
+};
+
 static char const *const VkRenderingAttachmentFlagsKHRStrings[3] = {
     "INPUT_ATTACHMENT_FEEDBACK",        // 0x00000001
     "RESOLVE_SKIP_TRANSFER_FUNCTION",   // 0x00000002
@@ -4085,6 +5689,12 @@ static uint32_t const VkRenderingAttachmentFlagsKHRValues[3] = {
     0x00000004, // RESOLVE_ENABLE_TRANSFER_FUNCTION
 };
 
+static uint16_t const VkRenderingAttachmentFlagsKHRBitIndices[3] = {
+    0, // INPUT_ATTACHMENT_FEEDBACK
+    1, // RESOLVE_SKIP_TRANSFER_FUNCTION
+    2, // RESOLVE_ENABLE_TRANSFER_FUNCTION
+};
+
 static char const *const VkResolveImageFlagsKHRStrings[2] = {
     "SKIP_TRANSFER_FUNCTION",   // 0x00000001
     "ENABLE_TRANSFER_FUNCTION", // 0x00000002
@@ -4095,6 +5705,11 @@ static uint32_t const VkResolveImageFlagsKHRValues[2] = {
     0x00000002, // ENABLE_TRANSFER_FUNCTION
 };
 
+static uint16_t const VkResolveImageFlagsKHRBitIndices[2] = {
+    0, // SKIP_TRANSFER_FUNCTION
+    1, // ENABLE_TRANSFER_FUNCTION
+};
+
 static char const *const VkDeviceAddressBindingFlagsEXTStrings[1] = {
     "INTERNAL_OBJECT", // 0x00000001
 };
@@ -4103,6 +5718,10 @@ static uint32_t const VkDeviceAddressBindingFlagsEXTValues[1] = {
     0x00000001, // INTERNAL_OBJECT
 };
 
+static uint16_t const VkDeviceAddressBindingFlagsEXTBitIndices[1] = {
+    0, // INTERNAL_OBJECT
+};
+
 static char const *const VkOpticalFlowGridSizeFlagsNVStrings[5] = {
     "UNKNOWN", // 0
     "1X1",     // 0x00000001
@@ -4119,6 +5738,17 @@ static uint32_t const VkOpticalFlowGridSizeFlagsNVValues[5] = {
     0x00000008, // 8X8
 };
 
+static uint16_t const VkOpticalFlowGridSizeFlagsNVBitIndices[4] = {
+    1, // 1X1
+    2, // 2X2
+    3, // 4X4
+    4, // 8X8
+};
+
+static uint16_t const VkOpticalFlowGridSizeFlagsNVCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkOpticalFlowUsageFlagsNVStrings[6] = {
     "UNKNOWN",     // 0
     "INPUT",       // 0x00000001
@@ -4137,6 +5767,18 @@ static uint32_t const VkOpticalFlowUsageFlagsNVValues[6] = {
     0x00000010, // GLOBAL_FLOW
 };
 
+static uint16_t const VkOpticalFlowUsageFlagsNVBitIndices[5] = {
+    1, // INPUT
+    2, // OUTPUT
+    3, // HINT
+    4, // COST
+    5, // GLOBAL_FLOW
+};
+
+static uint16_t const VkOpticalFlowUsageFlagsNVCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkOpticalFlowSessionCreateFlagsNVStrings[5] = {
     "ENABLE_HINT",        // 0x00000001
     "ENABLE_COST",        // 0x00000002
@@ -4153,6 +5795,14 @@ static uint32_t const VkOpticalFlowSessionCreateFlagsNVValues[5] = {
     0x00000010, // BOTH_DIRECTIONS
 };
 
+static uint16_t const VkOpticalFlowSessionCreateFlagsNVBitIndices[5] = {
+    0, // ENABLE_HINT
+    1, // ENABLE_COST
+    2, // ENABLE_GLOBAL_FLOW
+    3, // ALLOW_REGIONS
+    4, // BOTH_DIRECTIONS
+};
+
 static char const *const VkOpticalFlowExecuteFlagsNVStrings[1] = {
     "DISABLE_TEMPORAL_HINTS", // 0x00000001
 };
@@ -4161,6 +5811,10 @@ static uint32_t const VkOpticalFlowExecuteFlagsNVValues[1] = {
     0x00000001, // DISABLE_TEMPORAL_HINTS
 };
 
+static uint16_t const VkOpticalFlowExecuteFlagsNVBitIndices[1] = {
+    0, // DISABLE_TEMPORAL_HINTS
+};
+
 static char const *const VkFrameBoundaryFlagsEXTStrings[1] = {
     "FRAME_END", // 0x00000001
 };
@@ -4169,6 +5823,10 @@ static uint32_t const VkFrameBoundaryFlagsEXTValues[1] = {
     0x00000001, // FRAME_END
 };
 
+static uint16_t const VkFrameBoundaryFlagsEXTBitIndices[1] = {
+    0, // FRAME_END
+};
+
 static char const *const VkPresentScalingFlagsKHRStrings[6] = {
     "ONE_TO_ONE_BIT_EXT",           // 0x00000001
     "ASPECT_RATIO_STRETCH_BIT_EXT", // 0x00000002
@@ -4187,6 +5845,12 @@ static uint32_t const VkPresentScalingFlagsKHRValues[6] = {
     0x00000004, // STRETCH
 };
 
+static uint16_t const VkPresentScalingFlagsKHRBitIndices[3] = {
+    3, // ONE_TO_ONE
+    4, // ASPECT_RATIO_STRETCH
+    5, // STRETCH
+};
+
 static char const *const VkPresentGravityFlagsKHRStrings[6] = {
     "MIN_BIT_EXT",      // 0x00000001
     "MAX_BIT_EXT",      // 0x00000002
@@ -4205,6 +5869,12 @@ static uint32_t const VkPresentGravityFlagsKHRValues[6] = {
     0x00000004, // CENTERED
 };
 
+static uint16_t const VkPresentGravityFlagsKHRBitIndices[3] = {
+    3, // MIN
+    4, // MAX
+    5, // CENTERED
+};
+
 static char const *const VkShaderCreateFlagsEXTStrings[26] = {
     "LINK_STAGE",                                    // 0x00000001
     "ALLOW_VARYING_SUBGROUP_SIZE",                   // 0x00000002
@@ -4263,6 +5933,28 @@ static uint32_t const VkShaderCreateFlagsEXTValues[26] = {
     0x00001000, // OPACITY_MICROMAP_DISALLOW_MIXED_SPECIAL_INDEX
 };
 
+static uint16_t const VkShaderCreateFlagsEXTBitIndices[19] = {
+    0,  // LINK_STAGE
+    1,  // ALLOW_VARYING_SUBGROUP_SIZE
+    2,  // REQUIRE_FULL_SUBGROUPS
+    3,  // NO_TASK_SHADER
+    4,  // DISPATCH_BASE
+    5,  // FRAGMENT_SHADING_RATE_ATTACHMENT
+    6,  // FRAGMENT_DENSITY_MAP_ATTACHMENT
+    11, // INDIRECT_BINDABLE
+    8,  // RESERVED_8
+    9,  // RESERVED_9
+    21, // DESCRIPTOR_HEAP
+    23, // INSTRUMENT_SHADER_BIT_ARM
+    25, // OPACITY_MICROMAP_DISALLOW_MIXED_SPECIAL_INDEX
+    14, // RESERVED_13
+    15, // RESERVED_14
+    20, // 64_BIT_INDEXING
+    17, // RESERVED_16_BIT_KHR
+    18, // RESERVED_17_BIT_IMG
+    24, // INDEPENDENT_SETS_BIT_KHR
+};
+
 static char const *const VkTileShadingRenderPassFlagsQCOMStrings[2] = {
     "ENABLE",             // 0x00000001
     "PER_TILE_EXECUTION", // 0x00000002
@@ -4273,6 +5965,11 @@ static uint32_t const VkTileShadingRenderPassFlagsQCOMValues[2] = {
     0x00000002, // PER_TILE_EXECUTION
 };
 
+static uint16_t const VkTileShadingRenderPassFlagsQCOMBitIndices[2] = {
+    0, // ENABLE
+    1, // PER_TILE_EXECUTION
+};
+
 static char const *const VkPhysicalDeviceSchedulingControlsFlagsARMStrings[2] = {
     "SHADER_CORE_COUNT",   // 0x00000001
     "DISPATCH_PARAMETERS", // 0x00000002
@@ -4283,6 +5980,11 @@ static uint64_t const VkPhysicalDeviceSchedulingControlsFlagsARMValues[2] = {
     0x00000002, // DISPATCH_PARAMETERS
 };
 
+static uint16_t const VkPhysicalDeviceSchedulingControlsFlagsARMBitIndices[2] = {
+    0, // SHADER_CORE_COUNT
+    1, // DISPATCH_PARAMETERS
+};
+
 static char const *const VkPresentStageFlagsEXTStrings[4] = {
     "QUEUE_OPERATIONS_END",      // 0x00000001
     "REQUEST_DEQUEUED",          // 0x00000002
@@ -4297,6 +5999,13 @@ static uint32_t const VkPresentStageFlagsEXTValues[4] = {
     0x00000008, // IMAGE_FIRST_PIXEL_VISIBLE
 };
 
+static uint16_t const VkPresentStageFlagsEXTBitIndices[4] = {
+    0, // QUEUE_OPERATIONS_END
+    1, // REQUEST_DEQUEUED
+    2, // IMAGE_FIRST_PIXEL_OUT
+    3, // IMAGE_FIRST_PIXEL_VISIBLE
+};
+
 static char const *const VkPastPresentationTimingFlagsEXTStrings[2] = {
     "ALLOW_PARTIAL_RESULTS",      // 0x00000001
     "ALLOW_OUT_OF_ORDER_RESULTS", // 0x00000002
@@ -4307,6 +6016,11 @@ static uint32_t const VkPastPresentationTimingFlagsEXTValues[2] = {
     0x00000002, // ALLOW_OUT_OF_ORDER_RESULTS
 };
 
+static uint16_t const VkPastPresentationTimingFlagsEXTBitIndices[2] = {
+    0, // ALLOW_PARTIAL_RESULTS
+    1, // ALLOW_OUT_OF_ORDER_RESULTS
+};
+
 static char const *const VkPresentTimingInfoFlagsEXTStrings[2] = {
     "PRESENT_AT_RELATIVE_TIME",         // 0x00000001
     "PRESENT_AT_NEAREST_REFRESH_CYCLE", // 0x00000002
@@ -4317,6 +6031,11 @@ static uint32_t const VkPresentTimingInfoFlagsEXTValues[2] = {
     0x00000002, // PRESENT_AT_NEAREST_REFRESH_CYCLE
 };
 
+static uint16_t const VkPresentTimingInfoFlagsEXTBitIndices[2] = {
+    0, // PRESENT_AT_RELATIVE_TIME
+    1, // PRESENT_AT_NEAREST_REFRESH_CYCLE
+};
+
 static char const *const VkSwapchainImageUsageFlagsOHOSStrings[1] = {
     "SHARED", // 0x00000001
 };
@@ -4325,6 +6044,10 @@ static uint32_t const VkSwapchainImageUsageFlagsOHOSValues[1] = {
     0x00000001, // SHARED
 };
 
+static uint16_t const VkSwapchainImageUsageFlagsOHOSBitIndices[1] = {
+    0, // SHARED
+};
+
 static char const *const VkDataGraphTOSAQualityFlagsARMStrings[4] = {
     "VK_DATA_GRAPH_TOSA_QUALITY_ACCELERATED",  // 0x00000001
     "VK_DATA_GRAPH_TOSA_QUALITY_CONFORMANT",   // 0x00000002
@@ -4339,6 +6062,13 @@ static uint32_t const VkDataGraphTOSAQualityFlagsARMValues[4] = {
     0x00000008, // VK_DATA_GRAPH_TOSA_QUALITY_DEPRECATED
 };
 
+static uint16_t const VkDataGraphTOSAQualityFlagsARMBitIndices[4] = {
+    0, // VK_DATA_GRAPH_TOSA_QUALITY_ACCELERATED
+    1, // VK_DATA_GRAPH_TOSA_QUALITY_CONFORMANT
+    2, // VK_DATA_GRAPH_TOSA_QUALITY_EXPERIMENTAL
+    3, // VK_DATA_GRAPH_TOSA_QUALITY_DEPRECATED
+};
+
 static char const *const VkDataGraphOpticalFlowGridSizeFlagsARMStrings[5] = {
     "UNKNOWN", // 0
     "1X1",     // 0x00000001
@@ -4355,6 +6085,17 @@ static uint32_t const VkDataGraphOpticalFlowGridSizeFlagsARMValues[5] = {
     0x00000008, // 8X8
 };
 
+static uint16_t const VkDataGraphOpticalFlowGridSizeFlagsARMBitIndices[4] = {
+    1, // 1X1
+    2, // 2X2
+    3, // 4X4
+    4, // 8X8
+};
+
+static uint16_t const VkDataGraphOpticalFlowGridSizeFlagsARMCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkDataGraphOpticalFlowImageUsageFlagsARMStrings[5] = {
     "UNKNOWN", // 0
     "INPUT",   // 0x00000001
@@ -4371,6 +6112,17 @@ static uint32_t const VkDataGraphOpticalFlowImageUsageFlagsARMValues[5] = {
     0x00000008, // COST
 };
 
+static uint16_t const VkDataGraphOpticalFlowImageUsageFlagsARMBitIndices[4] = {
+    1, // INPUT
+    2, // OUTPUT
+    3, // HINT
+    4, // COST
+};
+
+static uint16_t const VkDataGraphOpticalFlowImageUsageFlagsARMCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkDataGraphOpticalFlowCreateFlagsARMStrings[3] = {
     "ENABLE_HINT", // 0x00000001
     "ENABLE_COST", // 0x00000002
@@ -4383,6 +6135,40 @@ static uint32_t const VkDataGraphOpticalFlowCreateFlagsARMValues[3] = {
     0x40000000, // RESERVED_30
 };
 
+static uint16_t const VkDataGraphOpticalFlowCreateFlagsARMBitIndices[31] = {
+    0,             // ENABLE_HINT
+    1,             // ENABLE_COST
+    cNoValueIndex, // bit 2
+    cNoValueIndex, // bit 3
+    cNoValueIndex, // bit 4
+    cNoValueIndex, // bit 5
+    cNoValueIndex, // bit 6
+    cNoValueIndex, // bit 7
+    cNoValueIndex, // bit 8
+    cNoValueIndex, // bit 9
+    cNoValueIndex, // bit 10
+    cNoValueIndex, // bit 11
+    cNoValueIndex, // bit 12
+    cNoValueIndex, // bit 13
+    cNoValueIndex, // bit 14
+    cNoValueIndex, // bit 15
+    cNoValueIndex, // bit 16
+    cNoValueIndex, // bit 17
+    cNoValueIndex, // bit 18
+    cNoValueIndex, // bit 19
+    cNoValueIndex, // bit 20
+    cNoValueIndex, // bit 21
+    cNoValueIndex, // bit 22
+    cNoValueIndex, // bit 23
+    cNoValueIndex, // bit 24
+    cNoValueIndex, // bit 25
+    cNoValueIndex, // bit 26
+    cNoValueIndex, // bit 27
+    cNoValueIndex, // bit 28
+    cNoValueIndex, // bit 29
+    2,             // RESERVED_30
+};
+
 static char const *const VkDataGraphOpticalFlowExecuteFlagsARMStrings[5] = {
     "DISABLE_TEMPORAL_HINTS",      // 0x00000001
     "INPUT_UNCHANGED",             // 0x00000002
@@ -4399,6 +6185,14 @@ static uint32_t const VkDataGraphOpticalFlowExecuteFlagsARMValues[5] = {
     0x00000010, // REFERENCE_IS_PREVIOUS_INPUT
 };
 
+static uint16_t const VkDataGraphOpticalFlowExecuteFlagsARMBitIndices[5] = {
+    0, // DISABLE_TEMPORAL_HINTS
+    1, // INPUT_UNCHANGED
+    2, // REFERENCE_UNCHANGED
+    3, // INPUT_IS_PREVIOUS_REFERENCE
+    4, // REFERENCE_IS_PREVIOUS_INPUT
+};
+
 static char const *const VkVideoCodecOperationFlagsKHRStrings[13] = {
     "ENCODE_H264_BIT_EXT", // 0x00010000
     "DECODE_H264_BIT_EXT", // 0x00000001
@@ -4431,6 +6225,33 @@ static uint32_t const VkVideoCodecOperationFlagsKHRValues[13] = {
     0x00000008, // DECODE_VP9
 };
 
+static uint16_t const VkVideoCodecOperationFlagsKHRBitIndices[19] = {
+    6,             // DECODE_H264
+    7,             // DECODE_H265
+    10,            // DECODE_AV1
+    12,            // DECODE_VP9
+    cNoValueIndex, // bit 4
+    cNoValueIndex, // bit 5
+    cNoValueIndex, // bit 6
+    cNoValueIndex, // bit 7
+    cNoValueIndex, // bit 8
+    cNoValueIndex, // bit 9
+    cNoValueIndex, // bit 10
+    cNoValueIndex, // bit 11
+    cNoValueIndex, // bit 12
+    cNoValueIndex, // bit 13
+    cNoValueIndex, // bit 14
+    cNoValueIndex, // bit 15
+    8,             // ENCODE_H264
+    9,             // ENCODE_H265
+    11,            // ENCODE_AV1
+};
+
+static uint16_t const VkVideoCodecOperationFlagsKHRCombinedIndices[2] = {
+    5, // NONE
+    3, // INVALID
+};
+
 static char const *const VkVideoCapabilityFlagsKHRStrings[2] = {
     "PROTECTED_CONTENT",         // 0x00000001
     "SEPARATE_REFERENCE_IMAGES", // 0x00000002
@@ -4441,6 +6262,11 @@ static uint32_t const VkVideoCapabilityFlagsKHRValues[2] = {
     0x00000002, // SEPARATE_REFERENCE_IMAGES
 };
 
+static uint16_t const VkVideoCapabilityFlagsKHRBitIndices[2] = {
+    0, // PROTECTED_CONTENT
+    1, // SEPARATE_REFERENCE_IMAGES
+};
+
 static char const *const VkVideoSessionCreateFlagsKHRStrings[11] = {
     "PROTECTED_CONTENT",                    // 0x00000001
     "DEFAULT",                              // 0
@@ -4469,6 +6295,20 @@ static uint32_t const VkVideoSessionCreateFlagsKHRValues[11] = {
     0x00000020, // INLINE_SESSION_PARAMETERS
 };
 
+static uint16_t const VkVideoSessionCreateFlagsKHRBitIndices[7] = {
+    0,  // PROTECTED_CONTENT
+    2,  // ALLOW_ENCODE_PARAMETER_OPTIMIZATIONS
+    3,  // INLINE_QUERIES
+    8,  // ALLOW_ENCODE_QUANTIZATION_DELTA_MAP
+    9,  // ALLOW_ENCODE_EMPHASIS_MAP
+    10, // INLINE_SESSION_PARAMETERS
+    7,  // RESERVED_6
+};
+
+static uint16_t const VkVideoSessionCreateFlagsKHRCombinedIndices[1] = {
+    1, // DEFAULT
+};
+
 static char const *const VkVideoSessionParametersCreateFlagsKHRStrings[1] = {
     "QUANTIZATION_MAP_COMPATIBLE", // 0x00000001
 };
@@ -4477,6 +6317,10 @@ static uint32_t const VkVideoSessionParametersCreateFlagsKHRValues[1] = {
     0x00000001, // QUANTIZATION_MAP_COMPATIBLE
 };
 
+static uint16_t const VkVideoSessionParametersCreateFlagsKHRBitIndices[1] = {
+    0, // QUANTIZATION_MAP_COMPATIBLE
+};
+
 static char const *const VkVideoCodingControlFlagsKHRStrings[5] = {
     "RESET",                     // 0x00000001
     "DEFAULT",                   // 0
@@ -4493,6 +6337,16 @@ static uint32_t const VkVideoCodingControlFlagsKHRValues[5] = {
     0x00000004, // ENCODE_QUALITY_LEVEL
 };
 
+static uint16_t const VkVideoCodingControlFlagsKHRBitIndices[3] = {
+    0, // RESET
+    2, // ENCODE_RATE_CONTROL
+    4, // ENCODE_QUALITY_LEVEL
+};
+
+static uint16_t const VkVideoCodingControlFlagsKHRCombinedIndices[1] = {
+    1, // DEFAULT
+};
+
 static char const *const VkVideoDecodeUsageFlagsKHRStrings[4] = {
     "DEFAULT",     // 0
     "TRANSCODING", // 0x00000001
@@ -4507,6 +6361,16 @@ static uint32_t const VkVideoDecodeUsageFlagsKHRValues[4] = {
     0x00000004, // STREAMING
 };
 
+static uint16_t const VkVideoDecodeUsageFlagsKHRBitIndices[3] = {
+    1, // TRANSCODING
+    2, // OFFLINE
+    3, // STREAMING
+};
+
+static uint16_t const VkVideoDecodeUsageFlagsKHRCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoDecodeCapabilityFlagsKHRStrings[3] = {
     "DPB_AND_OUTPUT_COINCIDE", // 0x00000001
     "DPB_AND_OUTPUT_DISTINCT", // 0x00000002
@@ -4519,6 +6383,15 @@ static uint32_t const VkVideoDecodeCapabilityFlagsKHRValues[3] = {
     0,          // DEFAULT
 };
 
+static uint16_t const VkVideoDecodeCapabilityFlagsKHRBitIndices[2] = {
+    0, // DPB_AND_OUTPUT_COINCIDE
+    1, // DPB_AND_OUTPUT_DISTINCT
+};
+
+static uint16_t const VkVideoDecodeCapabilityFlagsKHRCombinedIndices[1] = {
+    2, // DEFAULT
+};
+
 static char const *const VkVideoDecodeFlagsKHRStrings[2] = {
     "DEFAULT",    // 0
     "RESERVED_0", // 0x00000001
@@ -4529,6 +6402,14 @@ static uint32_t const VkVideoDecodeFlagsKHRValues[2] = {
     0x00000001, // RESERVED_0
 };
 
+static uint16_t const VkVideoDecodeFlagsKHRBitIndices[1] = {
+    1, // RESERVED_0
+};
+
+static uint16_t const VkVideoDecodeFlagsKHRCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoDecodeH264PictureLayoutFlagsKHRStrings[3] = {
     "PROGRESSIVE",                  // 0
     "INTERLACED_INTERLEAVED_LINES", // 0x00000001
@@ -4541,6 +6422,15 @@ static uint32_t const VkVideoDecodeH264PictureLayoutFlagsKHRValues[3] = {
     0x00000002, // INTERLACED_SEPARATE_PLANES
 };
 
+static uint16_t const VkVideoDecodeH264PictureLayoutFlagsKHRBitIndices[2] = {
+    1, // INTERLACED_INTERLEAVED_LINES
+    2, // INTERLACED_SEPARATE_PLANES
+};
+
+static uint16_t const VkVideoDecodeH264PictureLayoutFlagsKHRCombinedIndices[1] = {
+    0, // PROGRESSIVE
+};
+
 static char const *const VkVideoEncodeFlagsKHRStrings[7] = {
     "RESERVED_0",                  // 0x00000001
     "DEFAULT",                     // 0
@@ -4561,6 +6451,16 @@ static uint32_t const VkVideoEncodeFlagsKHRValues[7] = {
     0x00000004, // INTRA_REFRESH
 };
 
+static uint16_t const VkVideoEncodeFlagsKHRBitIndices[3] = {
+    3, // WITH_QUANTIZATION_DELTA_MAP
+    4, // WITH_EMPHASIS_MAP
+    6, // INTRA_REFRESH
+};
+
+static uint16_t const VkVideoEncodeFlagsKHRCombinedIndices[1] = {
+    1, // DEFAULT
+};
+
 static char const *const VkVideoEncodeUsageFlagsKHRStrings[5] = {
     "DEFAULT",      // 0
     "TRANSCODING",  // 0x00000001
@@ -4577,6 +6477,17 @@ static uint32_t const VkVideoEncodeUsageFlagsKHRValues[5] = {
     0x00000008, // CONFERENCING
 };
 
+static uint16_t const VkVideoEncodeUsageFlagsKHRBitIndices[4] = {
+    1, // TRANSCODING
+    2, // STREAMING
+    3, // RECORDING
+    4, // CONFERENCING
+};
+
+static uint16_t const VkVideoEncodeUsageFlagsKHRCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoEncodeContentFlagsKHRStrings[4] = {
     "DEFAULT",  // 0
     "CAMERA",   // 0x00000001
@@ -4591,6 +6502,16 @@ static uint32_t const VkVideoEncodeContentFlagsKHRValues[4] = {
     0x00000004, // RENDERED
 };
 
+static uint16_t const VkVideoEncodeContentFlagsKHRBitIndices[3] = {
+    1, // CAMERA
+    2, // DESKTOP
+    3, // RENDERED
+};
+
+static uint16_t const VkVideoEncodeContentFlagsKHRCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoEncodeCapabilityFlagsKHRStrings[7] = {
     "PRECEDING_EXTERNALLY_ENCODED_BYTES",            // 0x00000001
     "DEFAULT",                                       // 0
@@ -4611,6 +6532,17 @@ static uint32_t const VkVideoEncodeCapabilityFlagsKHRValues[7] = {
     0x00000008, // EMPHASIS_MAP
 };
 
+static uint16_t const VkVideoEncodeCapabilityFlagsKHRBitIndices[4] = {
+    0, // PRECEDING_EXTERNALLY_ENCODED_BYTES
+    2, // INSUFFICIENT_BITSTREAM_BUFFER_RANGE_DETECTION
+    5, // QUANTIZATION_DELTA_MAP
+    6, // EMPHASIS_MAP
+};
+
+static uint16_t const VkVideoEncodeCapabilityFlagsKHRCombinedIndices[1] = {
+    1, // DEFAULT
+};
+
 static char const *const VkVideoEncodeFeedbackFlagsKHRStrings[17] = {
     "BITSTREAM_BUFFER_OFFSET", // 0x00000001
     "BITSTREAM_BYTES_WRITTEN", // 0x00000002
@@ -4651,6 +6583,19 @@ static uint32_t const VkVideoEncodeFeedbackFlagsKHRValues[17] = {
     0x00000200, // PICTURE_PARTITION_COUNT
 };
 
+static uint16_t const VkVideoEncodeFeedbackFlagsKHRBitIndices[10] = {
+    0,  // BITSTREAM_BUFFER_OFFSET
+    1,  // BITSTREAM_BYTES_WRITTEN
+    2,  // BITSTREAM_HAS_OVERRIDES
+    10, // AVERAGE_QUANTIZATION
+    11, // MIN_QUANTIZATION
+    12, // MAX_QUANTIZATION
+    13, // INTRA_PIXELS
+    14, // INTER_PIXELS
+    15, // SKIPPED_PIXELS
+    16, // PICTURE_PARTITION_COUNT
+};
+
 static char const *const VkVideoEncodePerPartitionFeedbackFlagsKHRStrings[3] = {
     "STATUS",                  // 0x00000001
     "BITSTREAM_BUFFER_OFFSET", // 0x00000002
@@ -4663,6 +6608,12 @@ static uint32_t const VkVideoEncodePerPartitionFeedbackFlagsKHRValues[3] = {
     0x00000004, // BITSTREAM_BYTES_WRITTEN
 };
 
+static uint16_t const VkVideoEncodePerPartitionFeedbackFlagsKHRBitIndices[3] = {
+    0, // STATUS
+    1, // BITSTREAM_BUFFER_OFFSET
+    2, // BITSTREAM_BYTES_WRITTEN
+};
+
 static char const *const VkVideoEncodeRateControlFlagsKHRStrings[3] = {
     "DEFAULT",    // 0
     "RESET",      // 0x00000001
@@ -4675,6 +6626,14 @@ static uint32_t const VkVideoEncodeRateControlFlagsKHRValues[3] = {
     0x00000001, // RESERVED_0
 };
 
+static uint16_t const VkVideoEncodeRateControlFlagsKHRBitIndices[1] = {
+    2, // RESERVED_0
+};
+
+static uint16_t const VkVideoEncodeRateControlFlagsKHRCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoEncodeRateControlModeFlagsKHRStrings[5] = {
     "CBR",      // 0x00000002
     "VBR",      // 0x00000004
@@ -4691,6 +6650,17 @@ static uint32_t const VkVideoEncodeRateControlModeFlagsKHRValues[5] = {
     0x00000001, // DISABLED
 };
 
+static uint16_t const VkVideoEncodeRateControlModeFlagsKHRBitIndices[3] = {
+    4, // DISABLED
+    0, // CBR
+    1, // VBR
+};
+
+static uint16_t const VkVideoEncodeRateControlModeFlagsKHRCombinedIndices[2] = {
+    3, // DEFAULT
+    2, // NONE
+};
+
 static char const *const VkVideoEncodeIntraRefreshModeFlagsKHRStrings[5] = {
     "NONE",                  // 0
     "PER_PICTURE_PARTITION", // 0x00000001
@@ -4707,6 +6677,17 @@ static uint32_t const VkVideoEncodeIntraRefreshModeFlagsKHRValues[5] = {
     0x00000008, // BLOCK_COLUMN_BASED
 };
 
+static uint16_t const VkVideoEncodeIntraRefreshModeFlagsKHRBitIndices[4] = {
+    1, // PER_PICTURE_PARTITION
+    2, // BLOCK_BASED
+    3, // BLOCK_ROW_BASED
+    4, // BLOCK_COLUMN_BASED
+};
+
+static uint16_t const VkVideoEncodeIntraRefreshModeFlagsKHRCombinedIndices[1] = {
+    0, // NONE
+};
+
 static char const *const VkVideoChromaSubsamplingFlagsKHRStrings[6] = {
     "MONOCHROME", // 0x00000001
     "420",        // 0x00000002
@@ -4725,6 +6706,18 @@ static uint32_t const VkVideoChromaSubsamplingFlagsKHRValues[6] = {
     0,          // INVALID
 };
 
+static uint16_t const VkVideoChromaSubsamplingFlagsKHRBitIndices[4] = {
+    0, // MONOCHROME
+    1, // 420
+    2, // 422
+    3, // 444
+};
+
+static uint16_t const VkVideoChromaSubsamplingFlagsKHRCombinedIndices[2] = {
+    5, // INVALID
+    4, // INVALID
+};
+
 static char const *const VkVideoComponentBitDepthFlagsKHRStrings[4] = {
     "INVALID", // 0
     "8",       // 0x00000001
@@ -4739,6 +6732,18 @@ static uint32_t const VkVideoComponentBitDepthFlagsKHRValues[4] = {
     0x00000010, // 12
 };
 
+static uint16_t const VkVideoComponentBitDepthFlagsKHRBitIndices[5] = {
+    1,             // 8
+    cNoValueIndex, // bit 1
+    2,             // 10
+    cNoValueIndex, // bit 3
+    3,             // 12
+};
+
+static uint16_t const VkVideoComponentBitDepthFlagsKHRCombinedIndices[1] = {
+    0, // INVALID
+};
+
 static char const *const VkVideoEncodeH264CapabilityFlagsKHRStrings[13] = {
     "HRD_COMPLIANCE",                    // 0x00000001
     "PREDICTION_WEIGHT_TABLE_GENERATED", // 0x00000002
@@ -4771,6 +6776,20 @@ static uint32_t const VkVideoEncodeH264CapabilityFlagsKHRValues[13] = {
     0x00000400, // B_PICTURE_INTRA_REFRESH
 };
 
+static uint16_t const VkVideoEncodeH264CapabilityFlagsKHRBitIndices[11] = {
+    0,  // HRD_COMPLIANCE
+    1,  // PREDICTION_WEIGHT_TABLE_GENERATED
+    2,  // ROW_UNALIGNED_SLICE
+    3,  // DIFFERENT_SLICE_TYPE
+    4,  // B_FRAME_IN_L0_LIST
+    5,  // B_FRAME_IN_L1_LIST
+    6,  // PER_PICTURE_TYPE_MIN_MAX_QP
+    7,  // PER_SLICE_CONSTANT_QP
+    8,  // GENERATE_PREFIX_NALU
+    10, // MB_QP_DIFF_WRAPAROUND
+    12, // B_PICTURE_INTRA_REFRESH
+};
+
 static char const *const VkVideoEncodeH264StdFlagsKHRStrings[20] = {
     "SEPARATE_COLOR_PLANE_FLAG_SET",            // 0x00000001
     "QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET", // 0x00000002
@@ -4817,6 +6836,30 @@ static uint32_t const VkVideoEncodeH264StdFlagsKHRValues[20] = {
     0x00100000, // DIFFERENT_SLICE_QP_DELTA
 };
 
+static uint16_t const VkVideoEncodeH264StdFlagsKHRBitIndices[21] = {
+    0,             // SEPARATE_COLOR_PLANE_FLAG_SET
+    1,             // QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET
+    2,             // SCALING_MATRIX_PRESENT_FLAG_SET
+    3,             // CHROMA_QP_INDEX_OFFSET
+    4,             // SECOND_CHROMA_QP_INDEX_OFFSET
+    5,             // PIC_INIT_QP_MINUS26
+    6,             // WEIGHTED_PRED_FLAG_SET
+    7,             // WEIGHTED_BIPRED_IDC_EXPLICIT
+    8,             // WEIGHTED_BIPRED_IDC_IMPLICIT
+    9,             // TRANSFORM_8X8_MODE_FLAG_SET
+    10,            // DIRECT_SPATIAL_MV_PRED_FLAG_UNSET
+    11,            // ENTROPY_CODING_MODE_FLAG_UNSET
+    12,            // ENTROPY_CODING_MODE_FLAG_SET
+    13,            // DIRECT_8X8_INFERENCE_FLAG_UNSET
+    14,            // CONSTRAINED_INTRA_PRED_FLAG_SET
+    15,            // DEBLOCKING_FILTER_DISABLED
+    16,            // DEBLOCKING_FILTER_ENABLED
+    17,            // DEBLOCKING_FILTER_PARTIAL
+    cNoValueIndex, // bit 18
+    18,            // SLICE_QP_DELTA
+    19,            // DIFFERENT_SLICE_QP_DELTA
+};
+
 static char const *const VkVideoEncodeH264RateControlFlagsKHRStrings[5] = {
     "ATTEMPT_HRD_COMPLIANCE",        // 0x00000001
     "REGULAR_GOP",                   // 0x00000002
@@ -4833,6 +6876,14 @@ static uint32_t const VkVideoEncodeH264RateControlFlagsKHRValues[5] = {
     0x00000010, // TEMPORAL_LAYER_PATTERN_DYADIC
 };
 
+static uint16_t const VkVideoEncodeH264RateControlFlagsKHRBitIndices[5] = {
+    0, // ATTEMPT_HRD_COMPLIANCE
+    1, // REGULAR_GOP
+    2, // REFERENCE_PATTERN_FLAT
+    3, // REFERENCE_PATTERN_DYADIC
+    4, // TEMPORAL_LAYER_PATTERN_DYADIC
+};
+
 static char const *const VkVideoEncodeH265CapabilityFlagsKHRStrings[14] = {
     "HRD_COMPLIANCE",                    // 0x00000001
     "PREDICTION_WEIGHT_TABLE_GENERATED", // 0x00000002
@@ -4867,6 +6918,21 @@ static uint32_t const VkVideoEncodeH265CapabilityFlagsKHRValues[14] = {
     0x00000800, // B_PICTURE_INTRA_REFRESH
 };
 
+static uint16_t const VkVideoEncodeH265CapabilityFlagsKHRBitIndices[12] = {
+    0,  // HRD_COMPLIANCE
+    1,  // PREDICTION_WEIGHT_TABLE_GENERATED
+    2,  // ROW_UNALIGNED_SLICE_SEGMENT
+    3,  // DIFFERENT_SLICE_SEGMENT_TYPE
+    4,  // B_FRAME_IN_L0_LIST
+    5,  // B_FRAME_IN_L1_LIST
+    6,  // PER_PICTURE_TYPE_MIN_MAX_QP
+    7,  // PER_SLICE_SEGMENT_CONSTANT_QP
+    8,  // MULTIPLE_TILES_PER_SLICE_SEGMENT
+    9,  // MULTIPLE_SLICE_SEGMENTS_PER_TILE
+    11, // CU_QP_DIFF_WRAPAROUND
+    13, // B_PICTURE_INTRA_REFRESH
+};
+
 static char const *const VkVideoEncodeH265StdFlagsKHRStrings[21] = {
     "SEPARATE_COLOR_PLANE_FLAG_SET",                // 0x00000001
     "SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET",      // 0x00000002
@@ -4915,6 +6981,30 @@ static uint32_t const VkVideoEncodeH265StdFlagsKHRValues[21] = {
     0x00100000, // DIFFERENT_SLICE_QP_DELTA
 };
 
+static uint16_t const VkVideoEncodeH265StdFlagsKHRBitIndices[21] = {
+    0,  // SEPARATE_COLOR_PLANE_FLAG_SET
+    1,  // SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET
+    2,  // SCALING_LIST_DATA_PRESENT_FLAG_SET
+    3,  // PCM_ENABLED_FLAG_SET
+    4,  // SPS_TEMPORAL_MVP_ENABLED_FLAG_SET
+    5,  // INIT_QP_MINUS26
+    6,  // WEIGHTED_PRED_FLAG_SET
+    7,  // WEIGHTED_BIPRED_FLAG_SET
+    8,  // LOG2_PARALLEL_MERGE_LEVEL_MINUS2
+    9,  // SIGN_DATA_HIDING_ENABLED_FLAG_SET
+    10, // TRANSFORM_SKIP_ENABLED_FLAG_SET
+    11, // TRANSFORM_SKIP_ENABLED_FLAG_UNSET
+    12, // PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET
+    13, // TRANSQUANT_BYPASS_ENABLED_FLAG_SET
+    14, // CONSTRAINED_INTRA_PRED_FLAG_SET
+    15, // ENTROPY_CODING_SYNC_ENABLED_FLAG_SET
+    16, // DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET
+    17, // DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET
+    18, // DEPENDENT_SLICE_SEGMENT_FLAG_SET
+    19, // SLICE_QP_DELTA
+    20, // DIFFERENT_SLICE_QP_DELTA
+};
+
 static char const *const VkVideoEncodeH265RateControlFlagsKHRStrings[5] = {
     "ATTEMPT_HRD_COMPLIANCE",            // 0x00000001
     "REGULAR_GOP",                       // 0x00000002
@@ -4931,6 +7021,14 @@ static uint32_t const VkVideoEncodeH265RateControlFlagsKHRValues[5] = {
     0x00000010, // TEMPORAL_SUB_LAYER_PATTERN_DYADIC
 };
 
+static uint16_t const VkVideoEncodeH265RateControlFlagsKHRBitIndices[5] = {
+    0, // ATTEMPT_HRD_COMPLIANCE
+    1, // REGULAR_GOP
+    2, // REFERENCE_PATTERN_FLAT
+    3, // REFERENCE_PATTERN_DYADIC
+    4, // TEMPORAL_SUB_LAYER_PATTERN_DYADIC
+};
+
 static char const *const VkVideoEncodeH265CtbSizeFlagsKHRStrings[3] = {
     "16", // 0x00000001
     "32", // 0x00000002
@@ -4943,6 +7041,12 @@ static uint32_t const VkVideoEncodeH265CtbSizeFlagsKHRValues[3] = {
     0x00000004, // 64
 };
 
+static uint16_t const VkVideoEncodeH265CtbSizeFlagsKHRBitIndices[3] = {
+    0, // 16
+    1, // 32
+    2, // 64
+};
+
 static char const *const VkVideoEncodeH265TransformBlockSizeFlagsKHRStrings[4] = {
     "4",  // 0x00000001
     "8",  // 0x00000002
@@ -4957,6 +7061,13 @@ static uint32_t const VkVideoEncodeH265TransformBlockSizeFlagsKHRValues[4] = {
     0x00000008, // 32
 };
 
+static uint16_t const VkVideoEncodeH265TransformBlockSizeFlagsKHRBitIndices[4] = {
+    0, // 4
+    1, // 8
+    2, // 16
+    3, // 32
+};
+
 static char const *const VkVideoEncodeAV1CapabilityFlagsKHRStrings[7] = {
     "VK_VIDEO_ENCODE_AV1_CAPABILITY_PER_RATE_CONTROL_GROUP_MIN_MAX_Q_INDEX", // 0x00000001
     "VK_VIDEO_ENCODE_AV1_CAPABILITY_GENERATE_OBU_EXTENSION_HEADER",          // 0x00000002
@@ -4977,6 +7088,15 @@ static uint32_t const VkVideoEncodeAV1CapabilityFlagsKHRValues[7] = {
     0x00000020, // VK_VIDEO_ENCODE_AV1_CAPABILITY_COMPOUND_PREDICTION_INTRA_REFRESH
 };
 
+static uint16_t const VkVideoEncodeAV1CapabilityFlagsKHRBitIndices[6] = {
+    0, // VK_VIDEO_ENCODE_AV1_CAPABILITY_PER_RATE_CONTROL_GROUP_MIN_MAX_Q_INDEX
+    1, // VK_VIDEO_ENCODE_AV1_CAPABILITY_GENERATE_OBU_EXTENSION_HEADER
+    2, // VK_VIDEO_ENCODE_AV1_CAPABILITY_PRIMARY_REFERENCE_CDF_ONLY
+    3, // VK_VIDEO_ENCODE_AV1_CAPABILITY_FRAME_SIZE_OVERRIDE
+    4, // VK_VIDEO_ENCODE_AV1_CAPABILITY_MOTION_VECTOR_SCALING
+    6, // VK_VIDEO_ENCODE_AV1_CAPABILITY_COMPOUND_PREDICTION_INTRA_REFRESH
+};
+
 static char const *const VkVideoEncodeAV1StdFlagsKHRStrings[4] = {
     "VK_VIDEO_ENCODE_AV1_STD_UNIFORM_TILE_SPACING_FLAG_SET", // 0x00000001
     "VK_VIDEO_ENCODE_AV1_STD_SKIP_MODE_PRESENT_UNSET",       // 0x00000002
@@ -4991,6 +7111,13 @@ static uint32_t const VkVideoEncodeAV1StdFlagsKHRValues[4] = {
     0x00000008, // VK_VIDEO_ENCODE_AV1_STD_DELTA_Q
 };
 
+static uint16_t const VkVideoEncodeAV1StdFlagsKHRBitIndices[4] = {
+    0, // VK_VIDEO_ENCODE_AV1_STD_UNIFORM_TILE_SPACING_FLAG_SET
+    1, // VK_VIDEO_ENCODE_AV1_STD_SKIP_MODE_PRESENT_UNSET
+    2, // VK_VIDEO_ENCODE_AV1_STD_PRIMARY_REF_FRAME
+    3, // VK_VIDEO_ENCODE_AV1_STD_DELTA_Q
+};
+
 static char const *const VkVideoEncodeAV1RateControlFlagsKHRStrings[4] = {
     "VK_VIDEO_ENCODE_AV1_RATE_CONTROL_REGULAR_GOP",                   // 0x00000001
     "VK_VIDEO_ENCODE_AV1_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC", // 0x00000002
@@ -5005,6 +7132,13 @@ static uint32_t const VkVideoEncodeAV1RateControlFlagsKHRValues[4] = {
     0x00000008, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_REFERENCE_PATTERN_DYADIC
 };
 
+static uint16_t const VkVideoEncodeAV1RateControlFlagsKHRBitIndices[4] = {
+    0, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_REGULAR_GOP
+    1, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_TEMPORAL_LAYER_PATTERN_DYADIC
+    2, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_REFERENCE_PATTERN_FLAT
+    3, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_REFERENCE_PATTERN_DYADIC
+};
+
 static char const *const VkVideoEncodeAV1SuperblockSizeFlagsKHRStrings[2] = {
     "VK_VIDEO_ENCODE_AV1_SUPERBLOCK_SIZE_64",  // 0x00000001
     "VK_VIDEO_ENCODE_AV1_SUPERBLOCK_SIZE_128", // 0x00000002
@@ -5015,6 +7149,11 @@ static uint32_t const VkVideoEncodeAV1SuperblockSizeFlagsKHRValues[2] = {
     0x00000002, // VK_VIDEO_ENCODE_AV1_SUPERBLOCK_SIZE_128
 };
 
+static uint16_t const VkVideoEncodeAV1SuperblockSizeFlagsKHRBitIndices[2] = {
+    0, // VK_VIDEO_ENCODE_AV1_SUPERBLOCK_SIZE_64
+    1, // VK_VIDEO_ENCODE_AV1_SUPERBLOCK_SIZE_128
+};
+
 static char const *const VkAccessFlags3KHRStrings[1] = {
     "NONE", // 0
 };
@@ -5023,6 +7162,10 @@ static uint64_t const VkAccessFlags3KHRValues[1] = {
     0, // NONE
 };
 
+static uint16_t const VkAccessFlags3KHRCombinedIndices[1] = {
+    0, // NONE
+};
+
 static char const *const VkAttachmentLoadOpStrings[6] = {
     "NONE_EXT",  // 1000400000
     "NONE_KHR",  // 1000400000
@@ -5041,6 +7184,20 @@ static int32_t const VkAttachmentLoadOpValues[6] = {
     1000400000, // NONE
 };
 
+static uint16_t const VkAttachmentLoadOpValueIndices[3] = {
+    2, // LOAD
+    3, // CLEAR
+    4, // DONT_CARE
+};
+
+static int32_t const VkAttachmentLoadOpSortedValues[1] = {
+    1000400000, // NONE_EXT
+};
+
+static uint16_t const VkAttachmentLoadOpSortedIndices[1] = {
+    0, // NONE_EXT
+};
+
 static char const *const VkAttachmentStoreOpStrings[6] = {
     "NONE_QCOM", // 1000301000
     "NONE_EXT",  // 1000301000
@@ -5059,11 +7216,24 @@ static int32_t const VkAttachmentStoreOpValues[6] = {
     1000301000, // NONE
 };
 
-static char const *const VkBlendFactorStrings[19] = {
-    "ZERO",                     // 0
-    "ONE",                      // 1
-    "SRC_COLOR",                // 2
-    "ONE_MINUS_SRC_COLOR",      // 3
+static uint16_t const VkAttachmentStoreOpValueIndices[2] = {
+    3, // STORE
+    4, // DONT_CARE
+};
+
+static int32_t const VkAttachmentStoreOpSortedValues[1] = {
+    1000301000, // NONE_QCOM
+};
+
+static uint16_t const VkAttachmentStoreOpSortedIndices[1] = {
+    0, // NONE_QCOM
+};
+
+static char const *const VkBlendFactorStrings[19] = {
+    "ZERO",                     // 0
+    "ONE",                      // 1
+    "SRC_COLOR",                // 2
+    "ONE_MINUS_SRC_COLOR",      // 3
     "DST_COLOR",                // 4
     "ONE_MINUS_DST_COLOR",      // 5
     "SRC_ALPHA",                // 6
@@ -5103,6 +7273,28 @@ static int32_t const VkBlendFactorValues[19] = {
     18, // ONE_MINUS_SRC1_ALPHA
 };
 
+static uint16_t const VkBlendFactorValueIndices[19] = {
+    0,  // ZERO
+    1,  // ONE
+    2,  // SRC_COLOR
+    3,  // ONE_MINUS_SRC_COLOR
+    4,  // DST_COLOR
+    5,  // ONE_MINUS_DST_COLOR
+    6,  // SRC_ALPHA
+    7,  // ONE_MINUS_SRC_ALPHA
+    8,  // DST_ALPHA
+    9,  // ONE_MINUS_DST_ALPHA
+    10, // CONSTANT_COLOR
+    11, // ONE_MINUS_CONSTANT_COLOR
+    12, // CONSTANT_ALPHA
+    13, // ONE_MINUS_CONSTANT_ALPHA
+    14, // SRC_ALPHA_SATURATE
+    15, // SRC1_COLOR
+    16, // ONE_MINUS_SRC1_COLOR
+    17, // SRC1_ALPHA
+    18, // ONE_MINUS_SRC1_ALPHA
+};
+
 static char const *const VkBlendOpStrings[51] = {
     "ADD",                    // 0
     "SUBTRACT",               // 1
@@ -5211,6 +7403,112 @@ static int32_t const VkBlendOpValues[51] = {
     1000148045, // BLUE_EXT
 };
 
+static uint16_t const VkBlendOpValueIndices[5] = {
+    0, // ADD
+    1, // SUBTRACT
+    2, // REVERSE_SUBTRACT
+    3, // MIN
+    4, // MAX
+};
+
+static int32_t const VkBlendOpSortedValues[46] = {
+    1000148000, // ZERO_EXT
+    1000148001, // SRC_EXT
+    1000148002, // DST_EXT
+    1000148003, // SRC_OVER_EXT
+    1000148004, // DST_OVER_EXT
+    1000148005, // SRC_IN_EXT
+    1000148006, // DST_IN_EXT
+    1000148007, // SRC_OUT_EXT
+    1000148008, // DST_OUT_EXT
+    1000148009, // SRC_ATOP_EXT
+    1000148010, // DST_ATOP_EXT
+    1000148011, // XOR_EXT
+    1000148012, // MULTIPLY_EXT
+    1000148013, // SCREEN_EXT
+    1000148014, // OVERLAY_EXT
+    1000148015, // DARKEN_EXT
+    1000148016, // LIGHTEN_EXT
+    1000148017, // COLORDODGE_EXT
+    1000148018, // COLORBURN_EXT
+    1000148019, // HARDLIGHT_EXT
+    1000148020, // SOFTLIGHT_EXT
+    1000148021, // DIFFERENCE_EXT
+    1000148022, // EXCLUSION_EXT
+    1000148023, // INVERT_EXT
+    1000148024, // INVERT_RGB_EXT
+    1000148025, // LINEARDODGE_EXT
+    1000148026, // LINEARBURN_EXT
+    1000148027, // VIVIDLIGHT_EXT
+    1000148028, // LINEARLIGHT_EXT
+    1000148029, // PINLIGHT_EXT
+    1000148030, // HARDMIX_EXT
+    1000148031, // HSL_HUE_EXT
+    1000148032, // HSL_SATURATION_EXT
+    1000148033, // HSL_COLOR_EXT
+    1000148034, // HSL_LUMINOSITY_EXT
+    1000148035, // PLUS_EXT
+    1000148036, // PLUS_CLAMPED_EXT
+    1000148037, // PLUS_CLAMPED_ALPHA_EXT
+    1000148038, // PLUS_DARKER_EXT
+    1000148039, // MINUS_EXT
+    1000148040, // MINUS_CLAMPED_EXT
+    1000148041, // CONTRAST_EXT
+    1000148042, // INVERT_OVG_EXT
+    1000148043, // RED_EXT
+    1000148044, // GREEN_EXT
+    1000148045, // BLUE_EXT
+};
+
+static uint16_t const VkBlendOpSortedIndices[46] = {
+    5,  // ZERO_EXT
+    6,  // SRC_EXT
+    7,  // DST_EXT
+    8,  // SRC_OVER_EXT
+    9,  // DST_OVER_EXT
+    10, // SRC_IN_EXT
+    11, // DST_IN_EXT
+    12, // SRC_OUT_EXT
+    13, // DST_OUT_EXT
+    14, // SRC_ATOP_EXT
+    15, // DST_ATOP_EXT
+    16, // XOR_EXT
+    17, // MULTIPLY_EXT
+    18, // SCREEN_EXT
+    19, // OVERLAY_EXT
+    20, // DARKEN_EXT
+    21, // LIGHTEN_EXT
+    22, // COLORDODGE_EXT
+    23, // COLORBURN_EXT
+    24, // HARDLIGHT_EXT
+    25, // SOFTLIGHT_EXT
+    26, // DIFFERENCE_EXT
+    27, // EXCLUSION_EXT
+    28, // INVERT_EXT
+    29, // INVERT_RGB_EXT
+    30, // LINEARDODGE_EXT
+    31, // LINEARBURN_EXT
+    32, // VIVIDLIGHT_EXT
+    33, // LINEARLIGHT_EXT
+    34, // PINLIGHT_EXT
+    35, // HARDMIX_EXT
+    36, // HSL_HUE_EXT
+    37, // HSL_SATURATION_EXT
+    38, // HSL_COLOR_EXT
+    39, // HSL_LUMINOSITY_EXT
+    40, // PLUS_EXT
+    41, // PLUS_CLAMPED_EXT
+    42, // PLUS_CLAMPED_ALPHA_EXT
+    43, // PLUS_DARKER_EXT
+    44, // MINUS_EXT
+    45, // MINUS_CLAMPED_EXT
+    46, // CONTRAST_EXT
+    47, // INVERT_OVG_EXT
+    48, // RED_EXT
+    49, // GREEN_EXT
+    50, // BLUE_EXT
+};
+
 static char const *const VkBorderColorStrings[8] = {
     "FLOAT_TRANSPARENT_BLACK", // 0
     "INT_TRANSPARENT_BLACK",   // 1
@@ -5233,6 +7531,25 @@ static int32_t const VkBorderColorValues[8] = {
     1000287004, // INT_CUSTOM_EXT
 };
 
+static uint16_t const VkBorderColorValueIndices[6] = {
+    0, // FLOAT_TRANSPARENT_BLACK
+    1, // INT_TRANSPARENT_BLACK
+    2, // FLOAT_OPAQUE_BLACK
+    3, // INT_OPAQUE_BLACK
+    4, // FLOAT_OPAQUE_WHITE
+    5, // INT_OPAQUE_WHITE
+};
+
+static int32_t const VkBorderColorSortedValues[2] = {
+    1000287003, // FLOAT_CUSTOM_EXT
+    1000287004, // INT_CUSTOM_EXT
+};
+
+static uint16_t const VkBorderColorSortedIndices[2] = {
+    6, // FLOAT_CUSTOM_EXT
+    7, // INT_CUSTOM_EXT
+};
+
 static char const *const VkPipelineCacheHeaderVersionStrings[2] = {
     "ONE",             // 1
     "DATA_GRAPH_QCOM", // 1000629000
@@ -5243,6 +7560,19 @@ static int32_t const VkPipelineCacheHeaderVersionValues[2] = {
     1000629000, // DATA_GRAPH_QCOM
 };
 
+static uint16_t const VkPipelineCacheHeaderVersionValueIndices[2] = {
+    cNoValueIndex, // 0
+    0,             // ONE
+};
+
+static int32_t const VkPipelineCacheHeaderVersionSortedValues[1] = {
+    1000629000, // DATA_GRAPH_QCOM
+};
+
+static uint16_t const VkPipelineCacheHeaderVersionSortedIndices[1] = {
+    1, // DATA_GRAPH_QCOM
+};
+
 static char const *const VkComponentSwizzleStrings[7] = {
     "IDENTITY", // 0
     "ZERO",     // 1
@@ -5263,6 +7593,16 @@ static int32_t const VkComponentSwizzleValues[7] = {
     6, // A
 };
 
+static uint16_t const VkComponentSwizzleValueIndices[7] = {
+    0, // IDENTITY
+    1, // ZERO
+    2, // ONE
+    3, // R
+    4, // G
+    5, // B
+    6, // A
+};
+
 static char const *const VkCommandBufferLevelStrings[2] = {
     "PRIMARY",   // 0
     "SECONDARY", // 1
@@ -5273,6 +7613,11 @@ static int32_t const VkCommandBufferLevelValues[2] = {
     1, // SECONDARY
 };
 
+static uint16_t const VkCommandBufferLevelValueIndices[2] = {
+    0, // PRIMARY
+    1, // SECONDARY
+};
+
 static char const *const VkCompareOpStrings[8] = {
     "NEVER",            // 0
     "LESS",             // 1
@@ -5295,6 +7640,17 @@ static int32_t const VkCompareOpValues[8] = {
     7, // ALWAYS
 };
 
+static uint16_t const VkCompareOpValueIndices[8] = {
+    0, // NEVER
+    1, // LESS
+    2, // EQUAL
+    3, // LESS_OR_EQUAL
+    4, // GREATER
+    5, // NOT_EQUAL
+    6, // GREATER_OR_EQUAL
+    7, // ALWAYS
+};
+
 static char const *const VkDescriptorTypeStrings[22] = {
     "INLINE_UNIFORM_BLOCK_EXT",              // 1000138000
     "MUTABLE_VALVE",                         // 1000351000
@@ -5345,6 +7701,42 @@ static int32_t const VkDescriptorTypeValues[22] = {
     1000460000, // TENSOR_ARM
 };
 
+static uint16_t const VkDescriptorTypeValueIndices[11] = {
+    2,  // SAMPLER
+    3,  // COMBINED_IMAGE_SAMPLER
+    4,  // SAMPLED_IMAGE
+    5,  // STORAGE_IMAGE
+    6,  // UNIFORM_TEXEL_BUFFER
+    7,  // STORAGE_TEXEL_BUFFER
+    8,  // UNIFORM_BUFFER
+    9,  // STORAGE_BUFFER
+    10, // UNIFORM_BUFFER_DYNAMIC
+    11, // STORAGE_BUFFER_DYNAMIC
+    12, // INPUT_ATTACHMENT
+};
+
+static int32_t const VkDescriptorTypeSortedValues[8] = {
+    1000138000, // INLINE_UNIFORM_BLOCK_EXT
+    1000150000, // ACCELERATION_STRUCTURE_KHR
+    1000165000, // ACCELERATION_STRUCTURE_NVX
+    1000351000, // MUTABLE_VALVE
+    1000440000, // SAMPLE_WEIGHT_IMAGE_QCOM
+    1000440001, // BLOCK_MATCH_IMAGE_QCOM
+    1000460000, // TENSOR_ARM
+    1000570000, // PARTITIONED_ACCELERATION_STRUCTURE_NV
+};
+
+static uint16_t const VkDescriptorTypeSortedIndices[8] = {
+    0,  // INLINE_UNIFORM_BLOCK_EXT
+    15, // ACCELERATION_STRUCTURE_KHR
+    13, // ACCELERATION_STRUCTURE_NVX
+    1,  // MUTABLE_VALVE
+    17, // SAMPLE_WEIGHT_IMAGE_QCOM
+    18, // BLOCK_MATCH_IMAGE_QCOM
+    21, // TENSOR_ARM
+    20, // PARTITIONED_ACCELERATION_STRUCTURE_NV
+};
+
 static char const *const VkDynamicStateStrings[90] = {
     "LINE_STIPPLE_EXT",                        // 1000259000
     "CULL_MODE_EXT",                           // 1000267000
@@ -5531,6 +7923,152 @@ static int32_t const VkDynamicStateValues[90] = {
     1000259000, // LINE_STIPPLE
 };
 
+static uint16_t const VkDynamicStateValueIndices[9] = {
+    17, // VIEWPORT
+    18, // SCISSOR
+    19, // LINE_WIDTH
+    20, // DEPTH_BIAS
+    21, // BLEND_CONSTANTS
+    22, // DEPTH_BOUNDS
+    23, // STENCIL_COMPARE_MASK
+    24, // STENCIL_WRITE_MASK
+    25, // STENCIL_REFERENCE
+};
+
+static int32_t const VkDynamicStateSortedValues[64] = {
+    1000087000, // VIEWPORT_W_SCALING_NV
+    1000099000, // DISCARD_RECTANGLE_EXT
+    1000099001, // DISCARD_RECTANGLE_ENABLE_EXT
+    1000099002, // DISCARD_RECTANGLE_MODE_EXT
+    1000143000, // SAMPLE_LOCATIONS_EXT
+    1000164004, // VIEWPORT_SHADING_RATE_PALETTE_NV
+    1000164006, // VIEWPORT_COARSE_SAMPLE_ORDER_NV
+    1000205000, // EXCLUSIVE_SCISSOR_ENABLE_NV
+    1000205001, // EXCLUSIVE_SCISSOR_NV
+    1000226000, // FRAGMENT_SHADING_RATE_KHR
+    1000259000, // LINE_STIPPLE_EXT
+    1000267000, // CULL_MODE_EXT
+    1000267001, // FRONT_FACE_EXT
+    1000267002, // PRIMITIVE_TOPOLOGY_EXT
+    1000267003, // VIEWPORT_WITH_COUNT_EXT
+    1000267004, // SCISSOR_WITH_COUNT_EXT
+    1000267005, // VERTEX_INPUT_BINDING_STRIDE_EXT
+    1000267006, // DEPTH_TEST_ENABLE_EXT
+    1000267007, // DEPTH_WRITE_ENABLE_EXT
+    1000267008, // DEPTH_COMPARE_OP_EXT
+    1000267009, // DEPTH_BOUNDS_TEST_ENABLE_EXT
+    1000267010, // STENCIL_TEST_ENABLE_EXT
+    1000267011, // STENCIL_OP_EXT
+    1000347000, // RAY_TRACING_PIPELINE_STACK_SIZE_KHR
+    1000352000, // VERTEX_INPUT_EXT
+    1000377000, // PATCH_CONTROL_POINTS_EXT
+    1000377001, // RASTERIZER_DISCARD_ENABLE_EXT
+    1000377002, // DEPTH_BIAS_ENABLE_EXT
+    1000377003, // LOGIC_OP_EXT
+    1000377004, // PRIMITIVE_RESTART_ENABLE_EXT
+    1000381000, // COLOR_WRITE_ENABLE_EXT
+    1000455002, // TESSELLATION_DOMAIN_ORIGIN_EXT
+    1000455003, // DEPTH_CLAMP_ENABLE_EXT
+    1000455004, // POLYGON_MODE_EXT
+    1000455005, // RASTERIZATION_SAMPLES_EXT
+    1000455006, // SAMPLE_MASK_EXT
+    1000455007, // ALPHA_TO_COVERAGE_ENABLE_EXT
+    1000455008, // ALPHA_TO_ONE_ENABLE_EXT
+    1000455009, // LOGIC_OP_ENABLE_EXT
+    1000455010, // COLOR_BLEND_ENABLE_EXT
+    1000455011, // COLOR_BLEND_EQUATION_EXT
+    1000455012, // COLOR_WRITE_MASK_EXT
+    1000455013, // RASTERIZATION_STREAM_EXT
+    1000455014, // CONSERVATIVE_RASTERIZATION_MODE_EXT
+    1000455015, // EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT
+    1000455016, // DEPTH_CLIP_ENABLE_EXT
+    1000455017, // SAMPLE_LOCATIONS_ENABLE_EXT
+    1000455018, // COLOR_BLEND_ADVANCED_EXT
+    1000455019, // PROVOKING_VERTEX_MODE_EXT
+    1000455020, // LINE_RASTERIZATION_MODE_EXT
+    1000455021, // LINE_STIPPLE_ENABLE_EXT
+    1000455022, // DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT
+    1000455023, // VIEWPORT_W_SCALING_ENABLE_NV
+    1000455024, // VIEWPORT_SWIZZLE_NV
+    1000455025, // COVERAGE_TO_COLOR_ENABLE_NV
+    1000455026, // COVERAGE_TO_COLOR_LOCATION_NV
+    1000455027, // COVERAGE_MODULATION_MODE_NV
+    1000455028, // COVERAGE_MODULATION_TABLE_ENABLE_NV
+    1000455029, // COVERAGE_MODULATION_TABLE_NV
+    1000455030, // SHADING_RATE_IMAGE_ENABLE_NV
+    1000455031, // REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV
+    1000455032, // COVERAGE_REDUCTION_MODE_NV
+    1000524000, // ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT
+    1000582000, // DEPTH_CLAMP_RANGE_EXT
+};
+
+static uint16_t const VkDynamicStateSortedIndices[64] = {
+    26, // VIEWPORT_W_SCALING_NV
+    27, // DISCARD_RECTANGLE_EXT
+    84, // DISCARD_RECTANGLE_ENABLE_EXT
+    85, // DISCARD_RECTANGLE_MODE_EXT
+    28, // SAMPLE_LOCATIONS_EXT
+    29, // VIEWPORT_SHADING_RATE_PALETTE_NV
+    30, // VIEWPORT_COARSE_SAMPLE_ORDER_NV
+    86, // EXCLUSIVE_SCISSOR_ENABLE_NV
+    31, // EXCLUSIVE_SCISSOR_NV
+    32, // FRAGMENT_SHADING_RATE_KHR
+    0,  // LINE_STIPPLE_EXT
+    1,  // CULL_MODE_EXT
+    2,  // FRONT_FACE_EXT
+    3,  // PRIMITIVE_TOPOLOGY_EXT
+    4,  // VIEWPORT_WITH_COUNT_EXT
+    5,  // SCISSOR_WITH_COUNT_EXT
+    6,  // VERTEX_INPUT_BINDING_STRIDE_EXT
+    7,  // DEPTH_TEST_ENABLE_EXT
+    8,  // DEPTH_WRITE_ENABLE_EXT
+    9,  // DEPTH_COMPARE_OP_EXT
+    10, // DEPTH_BOUNDS_TEST_ENABLE_EXT
+    11, // STENCIL_TEST_ENABLE_EXT
+    12, // STENCIL_OP_EXT
+    33, // RAY_TRACING_PIPELINE_STACK_SIZE_KHR
+    34, // VERTEX_INPUT_EXT
+    36, // PATCH_CONTROL_POINTS_EXT
+    13, // RASTERIZER_DISCARD_ENABLE_EXT
+    14, // DEPTH_BIAS_ENABLE_EXT
+    37, // LOGIC_OP_EXT
+    15, // PRIMITIVE_RESTART_ENABLE_EXT
+    35, // COLOR_WRITE_ENABLE_EXT
+    63, // TESSELLATION_DOMAIN_ORIGIN_EXT
+    53, // DEPTH_CLAMP_ENABLE_EXT
+    54, // POLYGON_MODE_EXT
+    55, // RASTERIZATION_SAMPLES_EXT
+    56, // SAMPLE_MASK_EXT
+    57, // ALPHA_TO_COVERAGE_ENABLE_EXT
+    58, // ALPHA_TO_ONE_ENABLE_EXT
+    59, // LOGIC_OP_ENABLE_EXT
+    60, // COLOR_BLEND_ENABLE_EXT
+    61, // COLOR_BLEND_EQUATION_EXT
+    62, // COLOR_WRITE_MASK_EXT
+    64, // RASTERIZATION_STREAM_EXT
+    65, // CONSERVATIVE_RASTERIZATION_MODE_EXT
+    66, // EXTRA_PRIMITIVE_OVERESTIMATION_SIZE_EXT
+    67, // DEPTH_CLIP_ENABLE_EXT
+    68, // SAMPLE_LOCATIONS_ENABLE_EXT
+    69, // COLOR_BLEND_ADVANCED_EXT
+    70, // PROVOKING_VERTEX_MODE_EXT
+    71, // LINE_RASTERIZATION_MODE_EXT
+    72, // LINE_STIPPLE_ENABLE_EXT
+    73, // DEPTH_CLIP_NEGATIVE_ONE_TO_ONE_EXT
+    74, // VIEWPORT_W_SCALING_ENABLE_NV
+    75, // VIEWPORT_SWIZZLE_NV
+    76, // COVERAGE_TO_COLOR_ENABLE_NV
+    77, // COVERAGE_TO_COLOR_LOCATION_NV
+    78, // COVERAGE_MODULATION_MODE_NV
+    79, // COVERAGE_MODULATION_TABLE_ENABLE_NV
+    80, // COVERAGE_MODULATION_TABLE_NV
+    81, // SHADING_RATE_IMAGE_ENABLE_NV
+    82, // REPRESENTATIVE_FRAGMENT_TEST_ENABLE_NV
+    83, // COVERAGE_REDUCTION_MODE_NV
+    87, // ATTACHMENT_FEEDBACK_LOOP_ENABLE_EXT
+    88, // DEPTH_CLAMP_RANGE_EXT
+};
+
 static char const *const VkPolygonModeStrings[4] = {
     "FILL",              // 0
     "LINE",              // 1
@@ -5545,6 +8083,20 @@ static int32_t const VkPolygonModeValues[4] = {
     1000153000, // FILL_RECTANGLE_NV
 };
 
+static uint16_t const VkPolygonModeValueIndices[3] = {
+    0, // FILL
+    1, // LINE
+    2, // POINT
+};
+
+static int32_t const VkPolygonModeSortedValues[1] = {
+    1000153000, // FILL_RECTANGLE_NV
+};
+
+static uint16_t const VkPolygonModeSortedIndices[1] = {
+    3, // FILL_RECTANGLE_NV
+};
+
 static char const *const VkFormatStrings[355] = {
     "G8B8G8R8_422_UNORM_KHR",                         // 1000156000
     "B8G8R8G8_422_UNORM_KHR",                         // 1000156001
@@ -6261,48 +8813,473 @@ static int32_t const VkFormatValues[355] = {
     1000460003, // R8_SFLOAT_FPENCODING_FLOAT8E5M2_ARM
 };
 
-static char const *const VkFrontFaceStrings[2] = {
-    "COUNTER_CLOCKWISE", // 0
-    "CLOCKWISE",         // 1
-};
-
-static int32_t const VkFrontFaceValues[2] = {
-    0, // COUNTER_CLOCKWISE
-    1, // CLOCKWISE
-};
-
-static char const *const VkImageLayoutStrings[42] = {
-    "DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR", // 1000117000
-    "DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR", // 1000117001
-    "SHADING_RATE_OPTIMAL_NV",                        // 1000164003
-    "DEPTH_ATTACHMENT_OPTIMAL_KHR",                   // 1000241000
-    "DEPTH_READ_ONLY_OPTIMAL_KHR",                    // 1000241001
-    "STENCIL_ATTACHMENT_OPTIMAL_KHR",                 // 1000241002
-    "STENCIL_READ_ONLY_OPTIMAL_KHR",                  // 1000241003
-    "READ_ONLY_OPTIMAL_KHR",                          // 1000314000
-    "ATTACHMENT_OPTIMAL_KHR",                         // 1000314001
-    "RENDERING_LOCAL_READ_KHR",                       // 1000232000
-    "UNDEFINED",                                      // 0
-    "GENERAL",                                        // 1
-    "COLOR_ATTACHMENT_OPTIMAL",                       // 2
-    "DEPTH_STENCIL_ATTACHMENT_OPTIMAL",               // 3
-    "DEPTH_STENCIL_READ_ONLY_OPTIMAL",                // 4
-    "SHADER_READ_ONLY_OPTIMAL",                       // 5
-    "TRANSFER_SRC_OPTIMAL",                           // 6
-    "TRANSFER_DST_OPTIMAL",                           // 7
-    "PREINITIALIZED",                                 // 8
-    "DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL",     // 1000117000
-    "DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL",     // 1000117001
-    "PRESENT_SRC_KHR",                                // 1000001002
-    "SHARED_PRESENT_KHR",                             // 1000111000
-    "FRAGMENT_DENSITY_MAP_OPTIMAL_EXT",               // 1000218000
-    "DEPTH_ATTACHMENT_OPTIMAL",                       // 1000241000
-    "DEPTH_READ_ONLY_OPTIMAL",                        // 1000241001
-    "STENCIL_ATTACHMENT_OPTIMAL",                     // 1000241002
-    "STENCIL_READ_ONLY_OPTIMAL",                      // 1000241003
-    "FRAGMENT_SHADING_RATE_ATTACHMENT_OPTIMAL_KHR",   // 1000164003
-    "VIDEO_DECODE_DST_KHR",                           // 1000024000
-    "VIDEO_DECODE_SRC_KHR",                           // 1000024001
+static uint16_t const VkFormatValueIndices[185] = {
+    57,  // UNDEFINED
+    58,  // R4G4_UNORM_PACK8
+    59,  // R4G4B4A4_UNORM_PACK16
+    60,  // B4G4R4A4_UNORM_PACK16
+    61,  // R5G6B5_UNORM_PACK16
+    62,  // B5G6R5_UNORM_PACK16
+    63,  // R5G5B5A1_UNORM_PACK16
+    64,  // B5G5R5A1_UNORM_PACK16
+    65,  // A1R5G5B5_UNORM_PACK16
+    66,  // R8_UNORM
+    67,  // R8_SNORM
+    68,  // R8_USCALED
+    69,  // R8_SSCALED
+    70,  // R8_UINT
+    71,  // R8_SINT
+    72,  // R8_SRGB
+    73,  // R8G8_UNORM
+    74,  // R8G8_SNORM
+    75,  // R8G8_USCALED
+    76,  // R8G8_SSCALED
+    77,  // R8G8_UINT
+    78,  // R8G8_SINT
+    79,  // R8G8_SRGB
+    80,  // R8G8B8_UNORM
+    81,  // R8G8B8_SNORM
+    82,  // R8G8B8_USCALED
+    83,  // R8G8B8_SSCALED
+    84,  // R8G8B8_UINT
+    85,  // R8G8B8_SINT
+    86,  // R8G8B8_SRGB
+    87,  // B8G8R8_UNORM
+    88,  // B8G8R8_SNORM
+    89,  // B8G8R8_USCALED
+    90,  // B8G8R8_SSCALED
+    91,  // B8G8R8_UINT
+    92,  // B8G8R8_SINT
+    93,  // B8G8R8_SRGB
+    94,  // R8G8B8A8_UNORM
+    95,  // R8G8B8A8_SNORM
+    96,  // R8G8B8A8_USCALED
+    97,  // R8G8B8A8_SSCALED
+    98,  // R8G8B8A8_UINT
+    99,  // R8G8B8A8_SINT
+    100, // R8G8B8A8_SRGB
+    101, // B8G8R8A8_UNORM
+    102, // B8G8R8A8_SNORM
+    103, // B8G8R8A8_USCALED
+    104, // B8G8R8A8_SSCALED
+    105, // B8G8R8A8_UINT
+    106, // B8G8R8A8_SINT
+    107, // B8G8R8A8_SRGB
+    108, // A8B8G8R8_UNORM_PACK32
+    109, // A8B8G8R8_SNORM_PACK32
+    110, // A8B8G8R8_USCALED_PACK32
+    111, // A8B8G8R8_SSCALED_PACK32
+    112, // A8B8G8R8_UINT_PACK32
+    113, // A8B8G8R8_SINT_PACK32
+    114, // A8B8G8R8_SRGB_PACK32
+    115, // A2R10G10B10_UNORM_PACK32
+    116, // A2R10G10B10_SNORM_PACK32
+    117, // A2R10G10B10_USCALED_PACK32
+    118, // A2R10G10B10_SSCALED_PACK32
+    119, // A2R10G10B10_UINT_PACK32
+    120, // A2R10G10B10_SINT_PACK32
+    121, // A2B10G10R10_UNORM_PACK32
+    122, // A2B10G10R10_SNORM_PACK32
+    123, // A2B10G10R10_USCALED_PACK32
+    124, // A2B10G10R10_SSCALED_PACK32
+    125, // A2B10G10R10_UINT_PACK32
+    126, // A2B10G10R10_SINT_PACK32
+    127, // R16_UNORM
+    128, // R16_SNORM
+    129, // R16_USCALED
+    130, // R16_SSCALED
+    131, // R16_UINT
+    132, // R16_SINT
+    133, // R16_SFLOAT
+    134, // R16G16_UNORM
+    135, // R16G16_SNORM
+    136, // R16G16_USCALED
+    137, // R16G16_SSCALED
+    138, // R16G16_UINT
+    139, // R16G16_SINT
+    140, // R16G16_SFLOAT
+    141, // R16G16B16_UNORM
+    142, // R16G16B16_SNORM
+    143, // R16G16B16_USCALED
+    144, // R16G16B16_SSCALED
+    145, // R16G16B16_UINT
+    146, // R16G16B16_SINT
+    147, // R16G16B16_SFLOAT
+    148, // R16G16B16A16_UNORM
+    149, // R16G16B16A16_SNORM
+    150, // R16G16B16A16_USCALED
+    151, // R16G16B16A16_SSCALED
+    152, // R16G16B16A16_UINT
+    153, // R16G16B16A16_SINT
+    154, // R16G16B16A16_SFLOAT
+    155, // R32_UINT
+    156, // R32_SINT
+    157, // R32_SFLOAT
+    158, // R32G32_UINT
+    159, // R32G32_SINT
+    160, // R32G32_SFLOAT
+    161, // R32G32B32_UINT
+    162, // R32G32B32_SINT
+    163, // R32G32B32_SFLOAT
+    164, // R32G32B32A32_UINT
+    165, // R32G32B32A32_SINT
+    166, // R32G32B32A32_SFLOAT
+    167, // R64_UINT
+    168, // R64_SINT
+    169, // R64_SFLOAT
+    170, // R64G64_UINT
+    171, // R64G64_SINT
+    172, // R64G64_SFLOAT
+    173, // R64G64B64_UINT
+    174, // R64G64B64_SINT
+    175, // R64G64B64_SFLOAT
+    176, // R64G64B64A64_UINT
+    177, // R64G64B64A64_SINT
+    178, // R64G64B64A64_SFLOAT
+    179, // B10G11R11_UFLOAT_PACK32
+    180, // E5B9G9R9_UFLOAT_PACK32
+    181, // D16_UNORM
+    182, // X8_D24_UNORM_PACK32
+    183, // D32_SFLOAT
+    184, // S8_UINT
+    185, // D16_UNORM_S8_UINT
+    186, // D24_UNORM_S8_UINT
+    187, // D32_SFLOAT_S8_UINT
+    188, // BC1_RGB_UNORM_BLOCK
+    189, // BC1_RGB_SRGB_BLOCK
+    190, // BC1_RGBA_UNORM_BLOCK
+    191, // BC1_RGBA_SRGB_BLOCK
+    192, // BC2_UNORM_BLOCK
+    193, // BC2_SRGB_BLOCK
+    194, // BC3_UNORM_BLOCK
+    195, // BC3_SRGB_BLOCK
+    196, // BC4_UNORM_BLOCK
+    197, // BC4_SNORM_BLOCK
+    198, // BC5_UNORM_BLOCK
+    199, // BC5_SNORM_BLOCK
+    200, // BC6H_UFLOAT_BLOCK
+    201, // BC6H_SFLOAT_BLOCK
+    202, // BC7_UNORM_BLOCK
+    203, // BC7_SRGB_BLOCK
+    204, // ETC2_R8G8B8_UNORM_BLOCK
+    205, // ETC2_R8G8B8_SRGB_BLOCK
+    206, // ETC2_R8G8B8A1_UNORM_BLOCK
+    207, // ETC2_R8G8B8A1_SRGB_BLOCK
+    208, // ETC2_R8G8B8A8_UNORM_BLOCK
+    209, // ETC2_R8G8B8A8_SRGB_BLOCK
+    210, // EAC_R11_UNORM_BLOCK
+    211, // EAC_R11_SNORM_BLOCK
+    212, // EAC_R11G11_UNORM_BLOCK
+    213, // EAC_R11G11_SNORM_BLOCK
+    214, // ASTC_4x4_UNORM_BLOCK
+    215, // ASTC_4x4_SRGB_BLOCK
+    216, // ASTC_5x4_UNORM_BLOCK
+    217, // ASTC_5x4_SRGB_BLOCK
+    218, // ASTC_5x5_UNORM_BLOCK
+    219, // ASTC_5x5_SRGB_BLOCK
+    220, // ASTC_6x5_UNORM_BLOCK
+    221, // ASTC_6x5_SRGB_BLOCK
+    222, // ASTC_6x6_UNORM_BLOCK
+    223, // ASTC_6x6_SRGB_BLOCK
+    224, // ASTC_8x5_UNORM_BLOCK
+    225, // ASTC_8x5_SRGB_BLOCK
+    226, // ASTC_8x6_UNORM_BLOCK
+    227, // ASTC_8x6_SRGB_BLOCK
+    228, // ASTC_8x8_UNORM_BLOCK
+    229, // ASTC_8x8_SRGB_BLOCK
+    230, // ASTC_10x5_UNORM_BLOCK
+    231, // ASTC_10x5_SRGB_BLOCK
+    232, // ASTC_10x6_UNORM_BLOCK
+    233, // ASTC_10x6_SRGB_BLOCK
+    234, // ASTC_10x8_UNORM_BLOCK
+    235, // ASTC_10x8_SRGB_BLOCK
+    236, // ASTC_10x10_UNORM_BLOCK
+    237, // ASTC_10x10_SRGB_BLOCK
+    238, // ASTC_12x10_UNORM_BLOCK
+    239, // ASTC_12x10_SRGB_BLOCK
+    240, // ASTC_12x12_UNORM_BLOCK
+    241, // ASTC_12x12_SRGB_BLOCK
+};
+
+static int32_t const VkFormatSortedValues[113] = {
+    1000054000, // PVRTC1_2BPP_UNORM_BLOCK_IMG
+    1000054001, // PVRTC1_4BPP_UNORM_BLOCK_IMG
+    1000054002, // PVRTC2_2BPP_UNORM_BLOCK_IMG
+    1000054003, // PVRTC2_4BPP_UNORM_BLOCK_IMG
+    1000054004, // PVRTC1_2BPP_SRGB_BLOCK_IMG
+    1000054005, // PVRTC1_4BPP_SRGB_BLOCK_IMG
+    1000054006, // PVRTC2_2BPP_SRGB_BLOCK_IMG
+    1000054007, // PVRTC2_4BPP_SRGB_BLOCK_IMG
+    1000066000, // ASTC_4x4_SFLOAT_BLOCK_EXT
+    1000066001, // ASTC_5x4_SFLOAT_BLOCK_EXT
+    1000066002, // ASTC_5x5_SFLOAT_BLOCK_EXT
+    1000066003, // ASTC_6x5_SFLOAT_BLOCK_EXT
+    1000066004, // ASTC_6x6_SFLOAT_BLOCK_EXT
+    1000066005, // ASTC_8x5_SFLOAT_BLOCK_EXT
+    1000066006, // ASTC_8x6_SFLOAT_BLOCK_EXT
+    1000066007, // ASTC_8x8_SFLOAT_BLOCK_EXT
+    1000066008, // ASTC_10x5_SFLOAT_BLOCK_EXT
+    1000066009, // ASTC_10x6_SFLOAT_BLOCK_EXT
+    1000066010, // ASTC_10x8_SFLOAT_BLOCK_EXT
+    1000066011, // ASTC_10x10_SFLOAT_BLOCK_EXT
+    1000066012, // ASTC_12x10_SFLOAT_BLOCK_EXT
+    1000066013, // ASTC_12x12_SFLOAT_BLOCK_EXT
+    1000156000, // G8B8G8R8_422_UNORM_KHR
+    1000156001, // B8G8R8G8_422_UNORM_KHR
+    1000156002, // G8_B8_R8_3PLANE_420_UNORM_KHR
+    1000156003, // G8_B8R8_2PLANE_420_UNORM_KHR
+    1000156004, // G8_B8_R8_3PLANE_422_UNORM_KHR
+    1000156005, // G8_B8R8_2PLANE_422_UNORM_KHR
+    1000156006, // G8_B8_R8_3PLANE_444_UNORM_KHR
+    1000156007, // R10X6_UNORM_PACK16_KHR
+    1000156008, // R10X6G10X6_UNORM_2PACK16_KHR
+    1000156009, // R10X6G10X6B10X6A10X6_UNORM_4PACK16_KHR
+    1000156010, // G10X6B10X6G10X6R10X6_422_UNORM_4PACK16_KHR
+    1000156011, // B10X6G10X6R10X6G10X6_422_UNORM_4PACK16_KHR
+    1000156012, // G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16_KHR
+    1000156013, // G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16_KHR
+    1000156014, // G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16_KHR
+    1000156015, // G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16_KHR
+    1000156016, // G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16_KHR
+    1000156017, // R12X4_UNORM_PACK16_KHR
+    1000156018, // R12X4G12X4_UNORM_2PACK16_KHR
+    1000156019, // R12X4G12X4B12X4A12X4_UNORM_4PACK16_KHR
+    1000156020, // G12X4B12X4G12X4R12X4_422_UNORM_4PACK16_KHR
+    1000156021, // B12X4G12X4R12X4G12X4_422_UNORM_4PACK16_KHR
+    1000156022, // G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16_KHR
+    1000156023, // G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16_KHR
+    1000156024, // G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16_KHR
+    1000156025, // G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16_KHR
+    1000156026, // G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16_KHR
+    1000156027, // G16B16G16R16_422_UNORM_KHR
+    1000156028, // B16G16R16G16_422_UNORM_KHR
+    1000156029, // G16_B16_R16_3PLANE_420_UNORM_KHR
+    1000156030, // G16_B16R16_2PLANE_420_UNORM_KHR
+    1000156031, // G16_B16_R16_3PLANE_422_UNORM_KHR
+    1000156032, // G16_B16R16_2PLANE_422_UNORM_KHR
+    1000156033, // G16_B16_R16_3PLANE_444_UNORM_KHR
+    1000288000, // ASTC_3x3x3_UNORM_BLOCK_EXT
+    1000288001, // ASTC_3x3x3_SRGB_BLOCK_EXT
+    1000288002, // ASTC_3x3x3_SFLOAT_BLOCK_EXT
+    1000288003, // ASTC_4x3x3_UNORM_BLOCK_EXT
+    1000288004, // ASTC_4x3x3_SRGB_BLOCK_EXT
+    1000288005, // ASTC_4x3x3_SFLOAT_BLOCK_EXT
+    1000288006, // ASTC_4x4x3_UNORM_BLOCK_EXT
+    1000288007, // ASTC_4x4x3_SRGB_BLOCK_EXT
+    1000288008, // ASTC_4x4x3_SFLOAT_BLOCK_EXT
+    1000288009, // ASTC_4x4x4_UNORM_BLOCK_EXT
+    1000288010, // ASTC_4x4x4_SRGB_BLOCK_EXT
+    1000288011, // ASTC_4x4x4_SFLOAT_BLOCK_EXT
+    1000288012, // ASTC_5x4x4_UNORM_BLOCK_EXT
+    1000288013, // ASTC_5x4x4_SRGB_BLOCK_EXT
+    1000288014, // ASTC_5x4x4_SFLOAT_BLOCK_EXT
+    1000288015, // ASTC_5x5x4_UNORM_BLOCK_EXT
+    1000288016, // ASTC_5x5x4_SRGB_BLOCK_EXT
+    1000288017, // ASTC_5x5x4_SFLOAT_BLOCK_EXT
+    1000288018, // ASTC_5x5x5_UNORM_BLOCK_EXT
+    1000288019, // ASTC_5x5x5_SRGB_BLOCK_EXT
+    1000288020, // ASTC_5x5x5_SFLOAT_BLOCK_EXT
+    1000288021, // ASTC_6x5x5_UNORM_BLOCK_EXT
+    1000288022, // ASTC_6x5x5_SRGB_BLOCK_EXT
+    1000288023, // ASTC_6x5x5_SFLOAT_BLOCK_EXT
+    1000288024, // ASTC_6x6x5_UNORM_BLOCK_EXT
+    1000288025, // ASTC_6x6x5_SRGB_BLOCK_EXT
+    1000288026, // ASTC_6x6x5_SFLOAT_BLOCK_EXT
+    1000288027, // ASTC_6x6x6_UNORM_BLOCK_EXT
+    1000288028, // ASTC_6x6x6_SRGB_BLOCK_EXT
+    1000288029, // ASTC_6x6x6_SFLOAT_BLOCK_EXT
+    1000330000, // G8_B8R8_2PLANE_444_UNORM_EXT
+    1000330001, // G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16_EXT
+    1000330002, // G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16_EXT
+    1000330003, // G16_B16R16_2PLANE_444_UNORM_EXT
+    1000340000, // A4R4G4B4_UNORM_PACK16_EXT
+    1000340001, // A4B4G4R4_UNORM_PACK16_EXT
+    1000460000, // R8_BOOL_ARM
+    1000460001, // R16_SFLOAT_FPENCODING_BFLOAT16_ARM
+    1000460002, // R8_SFLOAT_FPENCODING_FLOAT8E4M3_ARM
+    1000460003, // R8_SFLOAT_FPENCODING_FLOAT8E5M2_ARM
+    1000464000, // R16G16_S10_5_NV
+    1000470000, // A1B5G5R5_UNORM_PACK16_KHR
+    1000470001, // A8_UNORM_KHR
+    1000609000, // R10X6_UINT_PACK16_ARM
+    1000609001, // R10X6G10X6_UINT_2PACK16_ARM
+    1000609002, // R10X6G10X6B10X6A10X6_UINT_4PACK16_ARM
+    1000609003, // R12X4_UINT_PACK16_ARM
+    1000609004, // R12X4G12X4_UINT_2PACK16_ARM
+    1000609005, // R12X4G12X4B12X4A12X4_UINT_4PACK16_ARM
+    1000609006, // R14X2_UINT_PACK16_ARM
+    1000609007, // R14X2G14X2_UINT_2PACK16_ARM
+    1000609008, // R14X2G14X2B14X2A14X2_UINT_4PACK16_ARM
+    1000609009, // R14X2_UNORM_PACK16_ARM
+    1000609010, // R14X2G14X2_UNORM_2PACK16_ARM
+    1000609011, // R14X2G14X2B14X2A14X2_UNORM_4PACK16_ARM
+    1000609012, // G14X2_B14X2R14X2_2PLANE_420_UNORM_3PACK16_ARM
+    1000609013, // G14X2_B14X2R14X2_2PLANE_422_UNORM_3PACK16_ARM
+};
+
+static uint16_t const VkFormatSortedIndices[113] = {
+    276, // PVRTC1_2BPP_UNORM_BLOCK_IMG
+    277, // PVRTC1_4BPP_UNORM_BLOCK_IMG
+    278, // PVRTC2_2BPP_UNORM_BLOCK_IMG
+    279, // PVRTC2_4BPP_UNORM_BLOCK_IMG
+    280, // PVRTC1_2BPP_SRGB_BLOCK_IMG
+    281, // PVRTC1_4BPP_SRGB_BLOCK_IMG
+    282, // PVRTC2_2BPP_SRGB_BLOCK_IMG
+    283, // PVRTC2_4BPP_SRGB_BLOCK_IMG
+    34,  // ASTC_4x4_SFLOAT_BLOCK_EXT
+    35,  // ASTC_5x4_SFLOAT_BLOCK_EXT
+    36,  // ASTC_5x5_SFLOAT_BLOCK_EXT
+    37,  // ASTC_6x5_SFLOAT_BLOCK_EXT
+    38,  // ASTC_6x6_SFLOAT_BLOCK_EXT
+    39,  // ASTC_8x5_SFLOAT_BLOCK_EXT
+    40,  // ASTC_8x6_SFLOAT_BLOCK_EXT
+    41,  // ASTC_8x8_SFLOAT_BLOCK_EXT
+    42,  // ASTC_10x5_SFLOAT_BLOCK_EXT
+    43,  // ASTC_10x6_SFLOAT_BLOCK_EXT
+    44,  // ASTC_10x8_SFLOAT_BLOCK_EXT
+    45,  // ASTC_10x10_SFLOAT_BLOCK_EXT
+    46,  // ASTC_12x10_SFLOAT_BLOCK_EXT
+    47,  // ASTC_12x12_SFLOAT_BLOCK_EXT
+    0,   // G8B8G8R8_422_UNORM_KHR
+    1,   // B8G8R8G8_422_UNORM_KHR
+    2,   // G8_B8_R8_3PLANE_420_UNORM_KHR
+    3,   // G8_B8R8_2PLANE_420_UNORM_KHR
+    4,   // G8_B8_R8_3PLANE_422_UNORM_KHR
+    5,   // G8_B8R8_2PLANE_422_UNORM_KHR
+    6,   // G8_B8_R8_3PLANE_444_UNORM_KHR
+    7,   // R10X6_UNORM_PACK16_KHR
+    8,   // R10X6G10X6_UNORM_2PACK16_KHR
+    9,   // R10X6G10X6B10X6A10X6_UNORM_4PACK16_KHR
+    10,  // G10X6B10X6G10X6R10X6_422_UNORM_4PACK16_KHR
+    11,  // B10X6G10X6R10X6G10X6_422_UNORM_4PACK16_KHR
+    12,  // G10X6_B10X6_R10X6_3PLANE_420_UNORM_3PACK16_KHR
+    13,  // G10X6_B10X6R10X6_2PLANE_420_UNORM_3PACK16_KHR
+    14,  // G10X6_B10X6_R10X6_3PLANE_422_UNORM_3PACK16_KHR
+    15,  // G10X6_B10X6R10X6_2PLANE_422_UNORM_3PACK16_KHR
+    16,  // G10X6_B10X6_R10X6_3PLANE_444_UNORM_3PACK16_KHR
+    17,  // R12X4_UNORM_PACK16_KHR
+    18,  // R12X4G12X4_UNORM_2PACK16_KHR
+    19,  // R12X4G12X4B12X4A12X4_UNORM_4PACK16_KHR
+    20,  // G12X4B12X4G12X4R12X4_422_UNORM_4PACK16_KHR
+    21,  // B12X4G12X4R12X4G12X4_422_UNORM_4PACK16_KHR
+    22,  // G12X4_B12X4_R12X4_3PLANE_420_UNORM_3PACK16_KHR
+    23,  // G12X4_B12X4R12X4_2PLANE_420_UNORM_3PACK16_KHR
+    24,  // G12X4_B12X4_R12X4_3PLANE_422_UNORM_3PACK16_KHR
+    25,  // G12X4_B12X4R12X4_2PLANE_422_UNORM_3PACK16_KHR
+    26,  // G12X4_B12X4_R12X4_3PLANE_444_UNORM_3PACK16_KHR
+    27,  // G16B16G16R16_422_UNORM_KHR
+    28,  // B16G16R16G16_422_UNORM_KHR
+    29,  // G16_B16_R16_3PLANE_420_UNORM_KHR
+    30,  // G16_B16R16_2PLANE_420_UNORM_KHR
+    31,  // G16_B16_R16_3PLANE_422_UNORM_KHR
+    32,  // G16_B16R16_2PLANE_422_UNORM_KHR
+    33,  // G16_B16_R16_3PLANE_444_UNORM_KHR
+    284, // ASTC_3x3x3_UNORM_BLOCK_EXT
+    285, // ASTC_3x3x3_SRGB_BLOCK_EXT
+    286, // ASTC_3x3x3_SFLOAT_BLOCK_EXT
+    287, // ASTC_4x3x3_UNORM_BLOCK_EXT
+    288, // ASTC_4x3x3_SRGB_BLOCK_EXT
+    289, // ASTC_4x3x3_SFLOAT_BLOCK_EXT
+    290, // ASTC_4x4x3_UNORM_BLOCK_EXT
+    291, // ASTC_4x4x3_SRGB_BLOCK_EXT
+    292, // ASTC_4x4x3_SFLOAT_BLOCK_EXT
+    293, // ASTC_4x4x4_UNORM_BLOCK_EXT
+    294, // ASTC_4x4x4_SRGB_BLOCK_EXT
+    295, // ASTC_4x4x4_SFLOAT_BLOCK_EXT
+    296, // ASTC_5x4x4_UNORM_BLOCK_EXT
+    297, // ASTC_5x4x4_SRGB_BLOCK_EXT
+    298, // ASTC_5x4x4_SFLOAT_BLOCK_EXT
+    299, // ASTC_5x5x4_UNORM_BLOCK_EXT
+    300, // ASTC_5x5x4_SRGB_BLOCK_EXT
+    301, // ASTC_5x5x4_SFLOAT_BLOCK_EXT
+    302, // ASTC_5x5x5_UNORM_BLOCK_EXT
+    303, // ASTC_5x5x5_SRGB_BLOCK_EXT
+    304, // ASTC_5x5x5_SFLOAT_BLOCK_EXT
+    305, // ASTC_6x5x5_UNORM_BLOCK_EXT
+    306, // ASTC_6x5x5_SRGB_BLOCK_EXT
+    307, // ASTC_6x5x5_SFLOAT_BLOCK_EXT
+    308, // ASTC_6x6x5_UNORM_BLOCK_EXT
+    309, // ASTC_6x6x5_SRGB_BLOCK_EXT
+    310, // ASTC_6x6x5_SFLOAT_BLOCK_EXT
+    311, // ASTC_6x6x6_UNORM_BLOCK_EXT
+    312, // ASTC_6x6x6_SRGB_BLOCK_EXT
+    313, // ASTC_6x6x6_SFLOAT_BLOCK_EXT
+    50,  // G8_B8R8_2PLANE_444_UNORM_EXT
+    51,  // G10X6_B10X6R10X6_2PLANE_444_UNORM_3PACK16_EXT
+    52,  // G12X4_B12X4R12X4_2PLANE_444_UNORM_3PACK16_EXT
+    53,  // G16_B16R16_2PLANE_444_UNORM_EXT
+    48,  // A4R4G4B4_UNORM_PACK16_EXT
+    49,  // A4B4G4R4_UNORM_PACK16_EXT
+    351, // R8_BOOL_ARM
+    352, // R16_SFLOAT_FPENCODING_BFLOAT16_ARM
+    353, // R8_SFLOAT_FPENCODING_FLOAT8E4M3_ARM
+    354, // R8_SFLOAT_FPENCODING_FLOAT8E5M2_ARM
+    54,  // R16G16_S10_5_NV
+    55,  // A1B5G5R5_UNORM_PACK16_KHR
+    56,  // A8_UNORM_KHR
+    337, // R10X6_UINT_PACK16_ARM
+    338, // R10X6G10X6_UINT_2PACK16_ARM
+    339, // R10X6G10X6B10X6A10X6_UINT_4PACK16_ARM
+    340, // R12X4_UINT_PACK16_ARM
+    341, // R12X4G12X4_UINT_2PACK16_ARM
+    342, // R12X4G12X4B12X4A12X4_UINT_4PACK16_ARM
+    343, // R14X2_UINT_PACK16_ARM
+    344, // R14X2G14X2_UINT_2PACK16_ARM
+    345, // R14X2G14X2B14X2A14X2_UINT_4PACK16_ARM
+    346, // R14X2_UNORM_PACK16_ARM
+    347, // R14X2G14X2_UNORM_2PACK16_ARM
+    348, // R14X2G14X2B14X2A14X2_UNORM_4PACK16_ARM
+    349, // G14X2_B14X2R14X2_2PLANE_420_UNORM_3PACK16_ARM
+    350, // G14X2_B14X2R14X2_2PLANE_422_UNORM_3PACK16_ARM
+};
+
+static char const *const VkFrontFaceStrings[2] = {
+    "COUNTER_CLOCKWISE", // 0
+    "CLOCKWISE",         // 1
+};
+
+static int32_t const VkFrontFaceValues[2] = {
+    0, // COUNTER_CLOCKWISE
+    1, // CLOCKWISE
+};
+
+static uint16_t const VkFrontFaceValueIndices[2] = {
+    0, // COUNTER_CLOCKWISE
+    1, // CLOCKWISE
+};
+
+static char const *const VkImageLayoutStrings[42] = {
+    "DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR", // 1000117000
+    "DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR", // 1000117001
+    "SHADING_RATE_OPTIMAL_NV",                        // 1000164003
+    "DEPTH_ATTACHMENT_OPTIMAL_KHR",                   // 1000241000
+    "DEPTH_READ_ONLY_OPTIMAL_KHR",                    // 1000241001
+    "STENCIL_ATTACHMENT_OPTIMAL_KHR",                 // 1000241002
+    "STENCIL_READ_ONLY_OPTIMAL_KHR",                  // 1000241003
+    "READ_ONLY_OPTIMAL_KHR",                          // 1000314000
+    "ATTACHMENT_OPTIMAL_KHR",                         // 1000314001
+    "RENDERING_LOCAL_READ_KHR",                       // 1000232000
+    "UNDEFINED",                                      // 0
+    "GENERAL",                                        // 1
+    "COLOR_ATTACHMENT_OPTIMAL",                       // 2
+    "DEPTH_STENCIL_ATTACHMENT_OPTIMAL",               // 3
+    "DEPTH_STENCIL_READ_ONLY_OPTIMAL",                // 4
+    "SHADER_READ_ONLY_OPTIMAL",                       // 5
+    "TRANSFER_SRC_OPTIMAL",                           // 6
+    "TRANSFER_DST_OPTIMAL",                           // 7
+    "PREINITIALIZED",                                 // 8
+    "DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL",     // 1000117000
+    "DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL",     // 1000117001
+    "PRESENT_SRC_KHR",                                // 1000001002
+    "SHARED_PRESENT_KHR",                             // 1000111000
+    "FRAGMENT_DENSITY_MAP_OPTIMAL_EXT",               // 1000218000
+    "DEPTH_ATTACHMENT_OPTIMAL",                       // 1000241000
+    "DEPTH_READ_ONLY_OPTIMAL",                        // 1000241001
+    "STENCIL_ATTACHMENT_OPTIMAL",                     // 1000241002
+    "STENCIL_READ_ONLY_OPTIMAL",                      // 1000241003
+    "FRAGMENT_SHADING_RATE_ATTACHMENT_OPTIMAL_KHR",   // 1000164003
+    "VIDEO_DECODE_DST_KHR",                           // 1000024000
+    "VIDEO_DECODE_SRC_KHR",                           // 1000024001
     "VIDEO_DECODE_DPB_KHR",                           // 1000024002
     "VIDEO_ENCODE_DST_KHR",                           // 1000299000
     "VIDEO_ENCODE_SRC_KHR",                           // 1000299001
@@ -6361,6 +9338,70 @@ static int32_t const VkImageLayoutValues[42] = {
     1000460000, // TENSOR_ALIASING_ARM
 };
 
+static uint16_t const VkImageLayoutValueIndices[9] = {
+    10, // UNDEFINED
+    11, // GENERAL
+    12, // COLOR_ATTACHMENT_OPTIMAL
+    13, // DEPTH_STENCIL_ATTACHMENT_OPTIMAL
+    14, // DEPTH_STENCIL_READ_ONLY_OPTIMAL
+    15, // SHADER_READ_ONLY_OPTIMAL
+    16, // TRANSFER_SRC_OPTIMAL
+    17, // TRANSFER_DST_OPTIMAL
+    18, // PREINITIALIZED
+};
+
+static int32_t const VkImageLayoutSortedValues[23] = {
+    1000001002, // PRESENT_SRC_KHR
+    1000024000, // VIDEO_DECODE_DST_KHR
+    1000024001, // VIDEO_DECODE_SRC_KHR
+    1000024002, // VIDEO_DECODE_DPB_KHR
+    1000111000, // SHARED_PRESENT_KHR
+    1000117000, // DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR
+    1000117001, // DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR
+    1000164003, // SHADING_RATE_OPTIMAL_NV
+    1000218000, // FRAGMENT_DENSITY_MAP_OPTIMAL_EXT
+    1000232000, // RENDERING_LOCAL_READ_KHR
+    1000241000, // DEPTH_ATTACHMENT_OPTIMAL_KHR
+    1000241001, // DEPTH_READ_ONLY_OPTIMAL_KHR
+    1000241002, // STENCIL_ATTACHMENT_OPTIMAL_KHR
+    1000241003, // STENCIL_READ_ONLY_OPTIMAL_KHR
+    1000299000, // VIDEO_ENCODE_DST_KHR
+    1000299001, // VIDEO_ENCODE_SRC_KHR
+    1000299002, // VIDEO_ENCODE_DPB_KHR
+    1000314000, // READ_ONLY_OPTIMAL_KHR
+    1000314001, // ATTACHMENT_OPTIMAL_KHR
+    1000339000, // ATTACHMENT_FEEDBACK_LOOP_OPTIMAL_EXT
+    1000460000, // TENSOR_ALIASING_ARM
+    1000553000, // VIDEO_ENCODE_QUANTIZATION_MAP_KHR
+    1000620000, // ZERO_INITIALIZED_EXT
+};
+
+static uint16_t const VkImageLayoutSortedIndices[23] = {
+    21, // PRESENT_SRC_KHR
+    29, // VIDEO_DECODE_DST_KHR
+    30, // VIDEO_DECODE_SRC_KHR
+    31, // VIDEO_DECODE_DPB_KHR
+    22, // SHARED_PRESENT_KHR
+    0,  // DEPTH_READ_ONLY_STENCIL_ATTACHMENT_OPTIMAL_KHR
+    1,  // DEPTH_ATTACHMENT_STENCIL_READ_ONLY_OPTIMAL_KHR
+    2,  // SHADING_RATE_OPTIMAL_NV
+    23, // FRAGMENT_DENSITY_MAP_OPTIMAL_EXT
+    9,  // RENDERING_LOCAL_READ_KHR
+    3,  // DEPTH_ATTACHMENT_OPTIMAL_KHR
+    4,  // DEPTH_READ_ONLY_OPTIMAL_KHR
+    5,  // STENCIL_ATTACHMENT_OPTIMAL_KHR
+    6,  // STENCIL_READ_ONLY_OPTIMAL_KHR
+    32, // VIDEO_ENCODE_DST_KHR
+    33, // VIDEO_ENCODE_SRC_KHR
+    34, // VIDEO_ENCODE_DPB_KHR
+    7,  // READ_ONLY_OPTIMAL_KHR
+    8,  // ATTACHMENT_OPTIMAL_KHR
+    37, // ATTACHMENT_FEEDBACK_LOOP_OPTIMAL_EXT
+    41, // TENSOR_ALIASING_ARM
+    38, // VIDEO_ENCODE_QUANTIZATION_MAP_KHR
+    40, // ZERO_INITIALIZED_EXT
+};
+
 static char const *const VkImageTilingStrings[3] = {
     "OPTIMAL",                 // 0
     "LINEAR",                  // 1
@@ -6373,6 +9414,19 @@ static int32_t const VkImageTilingValues[3] = {
     1000158000, // DRM_FORMAT_MODIFIER_EXT
 };
 
+static uint16_t const VkImageTilingValueIndices[2] = {
+    0, // OPTIMAL
+    1, // LINEAR
+};
+
+static int32_t const VkImageTilingSortedValues[1] = {
+    1000158000, // DRM_FORMAT_MODIFIER_EXT
+};
+
+static uint16_t const VkImageTilingSortedIndices[1] = {
+    2, // DRM_FORMAT_MODIFIER_EXT
+};
+
 static char const *const VkImageTypeStrings[3] = {
     "1D", // 0
     "2D", // 1
@@ -6385,6 +9439,12 @@ static int32_t const VkImageTypeValues[3] = {
     2, // 3D
 };
 
+static uint16_t const VkImageTypeValueIndices[3] = {
+    0, // 1D
+    1, // 2D
+    2, // 3D
+};
+
 static char const *const VkImageViewTypeStrings[7] = {
     "1D",         // 0
     "2D",         // 1
@@ -6405,6 +9465,16 @@ static int32_t const VkImageViewTypeValues[7] = {
     6, // CUBE_ARRAY
 };
 
+static uint16_t const VkImageViewTypeValueIndices[7] = {
+    0, // 1D
+    1, // 2D
+    2, // 3D
+    3, // CUBE
+    4, // 1D_ARRAY
+    5, // 2D_ARRAY
+    6, // CUBE_ARRAY
+};
+
 static char const *const VkIndirectCommandsTokenTypeEXTStrings[17] = {
     "EXECUTION_SET",            // 0
     "PUSH_CONSTANT",            // 1
@@ -6445,6 +9515,39 @@ static int32_t const VkIndirectCommandsTokenTypeEXTValues[17] = {
     1000135001, // PUSH_DATA_SEQUENCE_INDEX
 };
 
+static uint16_t const VkIndirectCommandsTokenTypeEXTValueIndices[10] = {
+    0, // EXECUTION_SET
+    1, // PUSH_CONSTANT
+    2, // SEQUENCE_INDEX
+    3, // INDEX_BUFFER
+    4, // VERTEX_BUFFER
+    5, // DRAW_INDEXED
+    6, // DRAW
+    7, // DRAW_INDEXED_COUNT
+    8, // DRAW_COUNT
+    9, // DISPATCH
+};
+
+static int32_t const VkIndirectCommandsTokenTypeEXTSortedValues[7] = {
+    1000135000, // PUSH_DATA
+    1000135001, // PUSH_DATA_SEQUENCE_INDEX
+    1000202002, // DRAW_MESH_TASKS_NV
+    1000202003, // DRAW_MESH_TASKS_COUNT_NV
+    1000328000, // DRAW_MESH_TASKS
+    1000328001, // DRAW_MESH_TASKS_COUNT
+    1000386004, // TRACE_RAYS2
+};
+
+static uint16_t const VkIndirectCommandsTokenTypeEXTSortedIndices[7] = {
+    15, // PUSH_DATA
+    16, // PUSH_DATA_SEQUENCE_INDEX
+    10, // DRAW_MESH_TASKS_NV
+    11, // DRAW_MESH_TASKS_COUNT_NV
+    12, // DRAW_MESH_TASKS
+    13, // DRAW_MESH_TASKS_COUNT
+    14, // TRACE_RAYS2
+};
+
 static char const *const VkSharingModeStrings[2] = {
     "EXCLUSIVE",  // 0
     "CONCURRENT", // 1
@@ -6455,6 +9558,11 @@ static int32_t const VkSharingModeValues[2] = {
     1, // CONCURRENT
 };
 
+static uint16_t const VkSharingModeValueIndices[2] = {
+    0, // EXCLUSIVE
+    1, // CONCURRENT
+};
+
 static char const *const VkIndexTypeStrings[7] = {
     "NONE_NV",   // 1000165000
     "UINT8_EXT", // 1000265000
@@ -6475,6 +9583,21 @@ static int32_t const VkIndexTypeValues[7] = {
     1000265000, // UINT8
 };
 
+static uint16_t const VkIndexTypeValueIndices[2] = {
+    3, // UINT16
+    4, // UINT32
+};
+
+static int32_t const VkIndexTypeSortedValues[2] = {
+    1000165000, // NONE_NV
+    1000265000, // UINT8_EXT
+};
+
+static uint16_t const VkIndexTypeSortedIndices[2] = {
+    0, // NONE_NV
+    1, // UINT8_EXT
+};
+
 static char const *const VkLogicOpStrings[16] = {
     "CLEAR",         // 0
     "AND",           // 1
@@ -6513,6 +9636,25 @@ static int32_t const VkLogicOpValues[16] = {
     15, // SET
 };
 
+static uint16_t const VkLogicOpValueIndices[16] = {
+    0,  // CLEAR
+    1,  // AND
+    2,  // AND_REVERSE
+    3,  // COPY
+    4,  // AND_INVERTED
+    5,  // NO_OP
+    6,  // XOR
+    7,  // OR
+    8,  // NOR
+    9,  // EQUIVALENT
+    10, // INVERT
+    11, // OR_REVERSE
+    12, // COPY_INVERTED
+    13, // OR_INVERTED
+    14, // NAND
+    15, // SET
+};
+
 static char const *const VkPhysicalDeviceTypeStrings[5] = {
     "OTHER",          // 0
     "INTEGRATED_GPU", // 1
@@ -6529,6 +9671,14 @@ static int32_t const VkPhysicalDeviceTypeValues[5] = {
     4, // CPU
 };
 
+static uint16_t const VkPhysicalDeviceTypeValueIndices[5] = {
+    0, // OTHER
+    1, // INTEGRATED_GPU
+    2, // DISCRETE_GPU
+    3, // VIRTUAL_GPU
+    4, // CPU
+};
+
 static char const *const VkPipelineBindPointStrings[8] = {
     "RAY_TRACING_NV",         // 1000165000
     "GRAPHICS",               // 0
@@ -6551,6 +9701,25 @@ static int32_t const VkPipelineBindPointValues[8] = {
     1000507000, // DATA_GRAPH_ARM
 };
 
+static uint16_t const VkPipelineBindPointValueIndices[2] = {
+    1, // GRAPHICS
+    2, // COMPUTE
+};
+
+static int32_t const VkPipelineBindPointSortedValues[4] = {
+    1000134000, // EXECUTION_GRAPH_AMDX
+    1000165000, // RAY_TRACING_NV
+    1000369003, // SUBPASS_SHADING_HUAWEI
+    1000507000, // DATA_GRAPH_ARM
+};
+
+static uint16_t const VkPipelineBindPointSortedIndices[4] = {
+    6, // EXECUTION_GRAPH_AMDX
+    0, // RAY_TRACING_NV
+    5, // SUBPASS_SHADING_HUAWEI
+    7, // DATA_GRAPH_ARM
+};
+
 static char const *const VkPrimitiveTopologyStrings[11] = {
     "POINT_LIST",                    // 0
     "LINE_LIST",                     // 1
@@ -6579,6 +9748,20 @@ static int32_t const VkPrimitiveTopologyValues[11] = {
     10, // PATCH_LIST
 };
 
+static uint16_t const VkPrimitiveTopologyValueIndices[11] = {
+    0,  // POINT_LIST
+    1,  // LINE_LIST
+    2,  // LINE_STRIP
+    3,  // TRIANGLE_LIST
+    4,  // TRIANGLE_STRIP
+    5,  // TRIANGLE_FAN
+    6,  // LINE_LIST_WITH_ADJACENCY
+    7,  // LINE_STRIP_WITH_ADJACENCY
+    8,  // TRIANGLE_LIST_WITH_ADJACENCY
+    9,  // TRIANGLE_STRIP_WITH_ADJACENCY
+    10, // PATCH_LIST
+};
+
 static char const *const VkQueryTypeStrings[22] = {
     "OCCLUSION",                                                      // 0
     "PIPELINE_STATISTICS",                                            // 1
@@ -6629,6 +9812,52 @@ static int32_t const VkQueryTypeValues[22] = {
     1000173000, // TIME_ELAPSED_QCOM
 };
 
+static uint16_t const VkQueryTypeValueIndices[3] = {
+    0, // OCCLUSION
+    1, // PIPELINE_STATISTICS
+    2, // TIMESTAMP
+};
+
+static int32_t const VkQueryTypeSortedValues[17] = {
+    1000023000, // RESULT_STATUS_ONLY_KHR
+    1000023008, // RESERVED_8
+    1000024004, // RESERVED_4
+    1000028004, // TRANSFORM_FEEDBACK_STREAM_EXT
+    1000116000, // PERFORMANCE_QUERY_KHR
+    1000150000, // ACCELERATION_STRUCTURE_COMPACTED_SIZE_KHR
+    1000150001, // ACCELERATION_STRUCTURE_SERIALIZATION_SIZE_KHR
+    1000165000, // COMPACTED_SIZE_NVX
+    1000173000, // TIME_ELAPSED_QCOM
+    1000210000, // PERFORMANCE_QUERY_INTEL
+    1000299000, // VIDEO_ENCODE_BITSTREAM_BUFFER_RANGE_KHR
+    1000328000, // MESH_PRIMITIVES_GENERATED_EXT
+    1000382000, // PRIMITIVES_GENERATED_EXT
+    1000386000, // ACCELERATION_STRUCTURE_SERIALIZATION_BOTTOM_LEVEL_POINTERS_KHR
+    1000386001, // ACCELERATION_STRUCTURE_SIZE_KHR
+    1000396000, // MICROMAP_SERIALIZATION_SIZE_EXT
+    1000396001, // MICROMAP_COMPACTED_SIZE_EXT
+};
+
+static uint16_t const VkQueryTypeSortedIndices[17] = {
+    12, // RESULT_STATUS_ONLY_KHR
+    6,  // RESERVED_8
+    7,  // RESERVED_4
+    4,  // TRANSFORM_FEEDBACK_STREAM_EXT
+    9,  // PERFORMANCE_QUERY_KHR
+    10, // ACCELERATION_STRUCTURE_COMPACTED_SIZE_KHR
+    11, // ACCELERATION_STRUCTURE_SERIALIZATION_SIZE_KHR
+    3,  // COMPACTED_SIZE_NVX
+    21, // TIME_ELAPSED_QCOM
+    8,  // PERFORMANCE_QUERY_INTEL
+    13, // VIDEO_ENCODE_BITSTREAM_BUFFER_RANGE_KHR
+    17, // MESH_PRIMITIVES_GENERATED_EXT
+    14, // PRIMITIVES_GENERATED_EXT
+    15, // ACCELERATION_STRUCTURE_SERIALIZATION_BOTTOM_LEVEL_POINTERS_KHR
+    16, // ACCELERATION_STRUCTURE_SIZE_KHR
+    18, // MICROMAP_SERIALIZATION_SIZE_EXT
+    19, // MICROMAP_COMPACTED_SIZE_EXT
+};
+
 static char const *const VkSubpassContentsStrings[4] = {
     "INLINE_AND_SECONDARY_COMMAND_BUFFERS_EXT", // 1000451000
     "INLINE",                                   // 0
@@ -6643,6 +9872,19 @@ static int32_t const VkSubpassContentsValues[4] = {
     1000451000, // INLINE_AND_SECONDARY_COMMAND_BUFFERS_KHR
 };
 
+static uint16_t const VkSubpassContentsValueIndices[2] = {
+    1, // INLINE
+    2, // SECONDARY_COMMAND_BUFFERS
+};
+
+static int32_t const VkSubpassContentsSortedValues[1] = {
+    1000451000, // INLINE_AND_SECONDARY_COMMAND_BUFFERS_EXT
+};
+
+static uint16_t const VkSubpassContentsSortedIndices[1] = {
+    0, // INLINE_AND_SECONDARY_COMMAND_BUFFERS_EXT
+};
+
 static char const *const VkStencilOpStrings[8] = {
     "KEEP",                // 0
     "ZERO",                // 1
@@ -6665,6 +9907,5640 @@ static int32_t const VkStencilOpValues[8] = {
     7, // DECREMENT_AND_WRAP
 };
 
+static uint16_t const VkStencilOpValueIndices[8] = {
+    0, // KEEP
+    1, // ZERO
+    2, // REPLACE
+    3, // INCREMENT_AND_CLAMP
+    4, // DECREMENT_AND_CLAMP
+    5, // INVERT
+    6, // INCREMENT_AND_WRAP
+    7, // DECREMENT_AND_WRAP
+};
+
+static char const *const VkStructureTypeStrings[1581] = {
+    "PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES",                              // 1000120000
+    "PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES",                         // 1000063000
+    "DEBUG_REPORT_CREATE_INFO_EXT",                                           // 1000011000
+    "RENDER_PASS_MULTIVIEW_CREATE_INFO_KHR",                                  // 1000053000
+    "PHYSICAL_DEVICE_MULTIVIEW_FEATURES_KHR",                                 // 1000053001
+    "PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES_KHR",                               // 1000053002
+    "PHYSICAL_DEVICE_FEATURES_2_KHR",                                         // 1000059000
+    "PHYSICAL_DEVICE_PROPERTIES_2_KHR",                                       // 1000059001
+    "FORMAT_PROPERTIES_2_KHR",                                                // 1000059002
+    "IMAGE_FORMAT_PROPERTIES_2_KHR",                                          // 1000059003
+    "PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2_KHR",                                // 1000059004
+    "QUEUE_FAMILY_PROPERTIES_2_KHR",                                          // 1000059005
+    "PHYSICAL_DEVICE_MEMORY_PROPERTIES_2_KHR",                                // 1000059006
+    "SPARSE_IMAGE_FORMAT_PROPERTIES_2_KHR",                                   // 1000059007
+    "PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2_KHR",                         // 1000059008
+    "MEMORY_ALLOCATE_FLAGS_INFO_KHR",                                         // 1000060000
+    "DEVICE_GROUP_RENDER_PASS_BEGIN_INFO_KHR",                                // 1000060003
+    "DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO_KHR",                             // 1000060004
+    "DEVICE_GROUP_SUBMIT_INFO_KHR",                                           // 1000060005
+    "DEVICE_GROUP_BIND_SPARSE_INFO_KHR",                                      // 1000060006
+    "BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO_KHR",                               // 1000060013
+    "BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO_KHR",                                // 1000060014
+    "PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES_EXT",              // 1000066000
+    "PHYSICAL_DEVICE_GROUP_PROPERTIES_KHR",                                   // 1000070000
+    "DEVICE_GROUP_DEVICE_CREATE_INFO_KHR",                                    // 1000070001
+    "PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO_KHR",                         // 1000071000
+    "EXTERNAL_IMAGE_FORMAT_PROPERTIES_KHR",                                   // 1000071001
+    "PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO_KHR",                               // 1000071002
+    "EXTERNAL_BUFFER_PROPERTIES_KHR",                                         // 1000071003
+    "PHYSICAL_DEVICE_ID_PROPERTIES_KHR",                                      // 1000071004
+    "EXTERNAL_MEMORY_BUFFER_CREATE_INFO_KHR",                                 // 1000072000
+    "EXTERNAL_MEMORY_IMAGE_CREATE_INFO_KHR",                                  // 1000072001
+    "EXPORT_MEMORY_ALLOCATE_INFO_KHR",                                        // 1000072002
+    "PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO_KHR",                            // 1000076000
+    "EXTERNAL_SEMAPHORE_PROPERTIES_KHR",                                      // 1000076001
+    "EXPORT_SEMAPHORE_CREATE_INFO_KHR",                                       // 1000077000
+    "PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR",                         // 1000080000
+    "PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES_KHR",                       // 1000082000
+    "PHYSICAL_DEVICE_FLOAT16_INT8_FEATURES_KHR",                              // 1000082000
+    "PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES_KHR",                             // 1000083000
+    "DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO_KHR",                             // 1000085000
+    "SURFACE_CAPABILITIES2_EXT",                                              // 1000090000
+    "PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES_KHR",                     // 1000108000
+    "FRAMEBUFFER_ATTACHMENTS_CREATE_INFO_KHR",                                // 1000108001
+    "FRAMEBUFFER_ATTACHMENT_IMAGE_INFO_KHR",                                  // 1000108002
+    "RENDER_PASS_ATTACHMENT_BEGIN_INFO_KHR",                                  // 1000108003
+    "ATTACHMENT_DESCRIPTION_2_KHR",                                           // 1000109000
+    "ATTACHMENT_REFERENCE_2_KHR",                                             // 1000109001
+    "SUBPASS_DESCRIPTION_2_KHR",                                              // 1000109002
+    "SUBPASS_DEPENDENCY_2_KHR",                                               // 1000109003
+    "RENDER_PASS_CREATE_INFO_2_KHR",                                          // 1000109004
+    "SUBPASS_BEGIN_INFO_KHR",                                                 // 1000109005
+    "SUBPASS_END_INFO_KHR",                                                   // 1000109006
+    "PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO_KHR",                                // 1000112000
+    "EXTERNAL_FENCE_PROPERTIES_KHR",                                          // 1000112001
+    "EXPORT_FENCE_CREATE_INFO_KHR",                                           // 1000113000
+    "PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES_KHR",                          // 1000117000
+    "RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO_KHR",                    // 1000117001
+    "IMAGE_VIEW_USAGE_CREATE_INFO_KHR",                                       // 1000117002
+    "PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO_KHR",              // 1000117003
+    "PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES_KHR",                         // 1000120000
+    "PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES_KHR",                          // 1000120000
+    "MEMORY_DEDICATED_REQUIREMENTS_KHR",                                      // 1000127000
+    "MEMORY_DEDICATED_ALLOCATE_INFO_KHR",                                     // 1000127001
+    "PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT",                   // 1000130000
+    "SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT",                                 // 1000130001
+    "PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT",                      // 1000138000
+    "PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT",                    // 1000138001
+    "WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT",                          // 1000138002
+    "DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT",                   // 1000138003
+    "BUFFER_MEMORY_REQUIREMENTS_INFO_2_KHR",                                  // 1000146000
+    "IMAGE_MEMORY_REQUIREMENTS_INFO_2_KHR",                                   // 1000146001
+    "IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2_KHR",                            // 1000146002
+    "MEMORY_REQUIREMENTS_2_KHR",                                              // 1000146003
+    "SPARSE_IMAGE_MEMORY_REQUIREMENTS_2_KHR",                                 // 1000146004
+    "IMAGE_FORMAT_LIST_CREATE_INFO_KHR",                                      // 1000147000
+    "SAMPLER_YCBCR_CONVERSION_CREATE_INFO_KHR",                               // 1000156000
+    "SAMPLER_YCBCR_CONVERSION_INFO_KHR",                                      // 1000156001
+    "BIND_IMAGE_PLANE_MEMORY_INFO_KHR",                                       // 1000156002
+    "IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO_KHR",                               // 1000156003
+    "PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES_KHR",                  // 1000156004
+    "SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES_KHR",                   // 1000156005
+    "BIND_BUFFER_MEMORY_INFO_KHR",                                            // 1000157000
+    "BIND_IMAGE_MEMORY_INFO_KHR",                                             // 1000157001
+    "DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT",                    // 1000161000
+    "PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT",                       // 1000161001
+    "PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT",                     // 1000161002
+    "DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT",             // 1000161003
+    "DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT",            // 1000161004
+    "PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES_KHR",                           // 1000168000
+    "DESCRIPTOR_SET_LAYOUT_SUPPORT_KHR",                                      // 1000168001
+    "DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT",                           // 1000174000
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES_KHR",            // 1000175000
+    "PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR",                              // 1000177000
+    "PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR",                       // 1000180000
+    "CALIBRATED_TIMESTAMP_INFO_EXT",                                          // 1000184000
+    "PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT",                    // 1000190001
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT",                  // 1000190002
+    "PIPELINE_CREATION_FEEDBACK_CREATE_INFO_EXT",                             // 1000192000
+    "PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR",                                  // 1000196000
+    "PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES_KHR",                          // 1000197000
+    "PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES_KHR",                   // 1000199000
+    "SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE_KHR",                          // 1000199001
+    "PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV",                 // 1000201000
+    "PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV",                // 1000203000
+    "PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES_KHR",                        // 1000207000
+    "PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES_KHR",                      // 1000207001
+    "SEMAPHORE_TYPE_CREATE_INFO_KHR",                                         // 1000207002
+    "TIMELINE_SEMAPHORE_SUBMIT_INFO_KHR",                                     // 1000207003
+    "SEMAPHORE_WAIT_INFO_KHR",                                                // 1000207004
+    "SEMAPHORE_SIGNAL_INFO_KHR",                                              // 1000207005
+    "QUERY_POOL_CREATE_INFO_INTEL",                                           // 1000210000
+    "PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR",                       // 1000211000
+    "PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES_KHR",               // 1000215000
+    "PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES_EXT",                       // 1000221000
+    "PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES_EXT",                   // 1000225000
+    "PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT",           // 1000225001
+    "PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES_EXT",                     // 1000225002
+    "PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES_KHR",            // 1000241000
+    "ATTACHMENT_REFERENCE_STENCIL_LAYOUT_KHR",                                // 1000241001
+    "ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT_KHR",                              // 1000241002
+    "PHYSICAL_DEVICE_BUFFER_ADDRESS_FEATURES_EXT",                            // 1000244000
+    "BUFFER_DEVICE_ADDRESS_INFO_EXT",                                         // 1000244001
+    "PHYSICAL_DEVICE_TOOL_PROPERTIES_EXT",                                    // 1000245000
+    "IMAGE_STENCIL_USAGE_CREATE_INFO_EXT",                                    // 1000246000
+    "PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES_KHR",            // 1000253000
+    "PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_KHR",                     // 1000257000
+    "BUFFER_DEVICE_ADDRESS_INFO_KHR",                                         // 1000244001
+    "BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO_KHR",                          // 1000257002
+    "MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO_KHR",                        // 1000257003
+    "DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO_KHR",                          // 1000257004
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT",                        // 1000259000
+    "PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT",                      // 1000259001
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT",                      // 1000259002
+    "PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES_EXT",                          // 1000261000
+    "PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT",                          // 1000265000
+    "PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES_EXT",        // 1000276000
+    "PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES_EXT",                  // 1000281001
+    "PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT",                              // 1000286000
+    "PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT",                            // 1000286001
+    "PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES_EXT",                              // 1000295000
+    "DEVICE_PRIVATE_DATA_CREATE_INFO_EXT",                                    // 1000295001
+    "PRIVATE_DATA_SLOT_CREATE_INFO_EXT",                                      // 1000295002
+    "PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES_EXT",           // 1000297000
+    "PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT",                          // 1000335000
+    "COPY_BUFFER_INFO_2_KHR",                                                 // 1000337000
+    "COPY_IMAGE_INFO_2_KHR",                                                  // 1000337001
+    "COPY_BUFFER_TO_IMAGE_INFO_2_KHR",                                        // 1000337002
+    "COPY_IMAGE_TO_BUFFER_INFO_2_KHR",                                        // 1000337003
+    "BLIT_IMAGE_INFO_2_KHR",                                                  // 1000337004
+    "RESOLVE_IMAGE_INFO_2_KHR",                                               // 1000337005
+    "BUFFER_COPY_2_KHR",                                                      // 1000337006
+    "IMAGE_COPY_2_KHR",                                                       // 1000337007
+    "IMAGE_BLIT_2_KHR",                                                       // 1000337008
+    "BUFFER_IMAGE_COPY_2_KHR",                                                // 1000337009
+    "IMAGE_RESOLVE_2_KHR",                                                    // 1000337010
+    "RENDERING_INFO_KHR",                                                     // 1000044000
+    "RENDERING_ATTACHMENT_INFO_KHR",                                          // 1000044001
+    "PIPELINE_RENDERING_CREATE_INFO_KHR",                                     // 1000044002
+    "PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES_KHR",                         // 1000044003
+    "COMMAND_BUFFER_INHERITANCE_RENDERING_INFO_KHR",                          // 1000044004
+    "PIPELINE_ROBUSTNESS_CREATE_INFO_EXT",                                    // 1000068000
+    "PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT",                       // 1000068001
+    "PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT",                     // 1000068002
+    "ATTACHMENT_SAMPLE_COUNT_INFO_NV",                                        // 1000044008
+    "DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR",                           // 1000174000
+    "PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR",                     // 1000388000
+    "QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR",                            // 1000388001
+    "PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES_KHR",                // 1000280000
+    "PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES_KHR",              // 1000280001
+    "MEMORY_BARRIER_2_KHR",                                                   // 1000314000
+    "BUFFER_MEMORY_BARRIER_2_KHR",                                            // 1000314001
+    "IMAGE_MEMORY_BARRIER_2_KHR",                                             // 1000314002
+    "DEPENDENCY_INFO_KHR",                                                    // 1000314003
+    "SUBMIT_INFO_2_KHR",                                                      // 1000314004
+    "SEMAPHORE_SUBMIT_INFO_KHR",                                              // 1000314005
+    "COMMAND_BUFFER_SUBMIT_INFO_KHR",                                         // 1000314006
+    "PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES_KHR",                         // 1000314007
+    "PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES_KHR",          // 1000325000
+    "SUBRESOURCE_LAYOUT_2_EXT",                                               // 1000338002
+    "IMAGE_SUBRESOURCE_2_EXT",                                                // 1000338003
+    "PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_ARM",     // 1000342000
+    "PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_VALVE",                 // 1000351000
+    "MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_VALVE",                              // 1000351002
+    "FORMAT_PROPERTIES_3_KHR",                                                // 1000360000
+    "PIPELINE_INFO_EXT",                                                      // 1000269001
+    "PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_EXT",                     // 1000388000
+    "QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_EXT",                            // 1000388001
+    "PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES_KHR",                             // 1000413000
+    "PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES_KHR",                           // 1000413001
+    "DEVICE_BUFFER_MEMORY_REQUIREMENTS_KHR",                                  // 1000413002
+    "DEVICE_IMAGE_MEMORY_REQUIREMENTS_KHR",                                   // 1000413003
+    "PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT",                      // 1000421000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM",              // 1000425000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM",            // 1000425001
+    "SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM",                      // 1000425002
+    "PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT",                 // 1000466000
+    "SURFACE_PRESENT_MODE_EXT",                                               // 1000274000
+    "SURFACE_PRESENT_SCALING_CAPABILITIES_EXT",                               // 1000274001
+    "SURFACE_PRESENT_MODE_COMPATIBILITY_EXT",                                 // 1000274002
+    "PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT",                   // 1000275000
+    "SWAPCHAIN_PRESENT_FENCE_INFO_EXT",                                       // 1000275001
+    "SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT",                                // 1000275002
+    "SWAPCHAIN_PRESENT_MODE_INFO_EXT",                                        // 1000275003
+    "SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT",                              // 1000275004
+    "RELEASE_SWAPCHAIN_IMAGES_INFO_EXT",                                      // 1000275005
+    "PHYSICAL_DEVICE_EXTERNAL_SCI_BUF_FEATURES_NV",                           // 1000374004
+    "PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV",                     // 1000426001
+    "PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV",                       // 1000427000
+    "PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV",                     // 1000427001
+    "PHYSICAL_DEVICE_DYNAMIC_RENDERING_LOCAL_READ_FEATURES_KHR",              // 1000232000
+    "RENDERING_ATTACHMENT_LOCATION_INFO_KHR",                                 // 1000232001
+    "RENDERING_INPUT_ATTACHMENT_INDEX_INFO_KHR",                              // 1000232002
+    "PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT",                           // 1000270000
+    "PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT",                         // 1000270001
+    "MEMORY_TO_IMAGE_COPY_EXT",                                               // 1000270002
+    "IMAGE_TO_MEMORY_COPY_EXT",                                               // 1000270003
+    "COPY_IMAGE_TO_MEMORY_INFO_EXT",                                          // 1000270004
+    "COPY_MEMORY_TO_IMAGE_INFO_EXT",                                          // 1000270005
+    "HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT",                                  // 1000270006
+    "COPY_IMAGE_TO_IMAGE_INFO_EXT",                                           // 1000270007
+    "SUBRESOURCE_HOST_MEMCPY_SIZE_EXT",                                       // 1000270008
+    "HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT",                           // 1000270009
+    "MEMORY_MAP_INFO_KHR",                                                    // 1000271000
+    "MEMORY_UNMAP_INFO_KHR",                                                  // 1000271001
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_ROTATE_FEATURES_KHR",                    // 1000416000
+    "PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR",                             // 1000470000
+    "PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR",                           // 1000470001
+    "RENDERING_AREA_INFO_KHR",                                                // 1000470003
+    "DEVICE_IMAGE_SUBRESOURCE_INFO_KHR",                                      // 1000470004
+    "SUBRESOURCE_LAYOUT_2_KHR",                                               // 1000338002
+    "IMAGE_SUBRESOURCE_2_KHR",                                                // 1000338003
+    "PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR",                                // 1000470005
+    "BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR",                                   // 1000470006
+    "SHADER_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT",                          // 1000225001
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR",                // 1000525000
+    "PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_KHR",                    // 1000190001
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_KHR",                  // 1000190002
+    "PHYSICAL_DEVICE_SHADER_FLOAT_CONTROLS_2_FEATURES_KHR",                   // 1000528000
+    "PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_KHR",                          // 1000265000
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_KHR",                        // 1000259000
+    "PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_KHR",                      // 1000259001
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_KHR",                      // 1000259002
+    "PHYSICAL_DEVICE_SHADER_EXPECT_ASSUME_FEATURES_KHR",                      // 1000544000
+    "PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR",                             // 1000545000
+    "PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR",                           // 1000545001
+    "BIND_MEMORY_STATUS_KHR",                                                 // 1000545002
+    "BIND_DESCRIPTOR_SETS_INFO_KHR",                                          // 1000545003
+    "PUSH_CONSTANTS_INFO_KHR",                                                // 1000545004
+    "PUSH_DESCRIPTOR_SET_INFO_KHR",                                           // 1000545005
+    "PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR",                             // 1000545006
+    "PHYSICAL_DEVICE_PRESENT_MODE_FIFO_LATEST_READY_FEATURES_EXT",            // 1000361000
+    "RENDERING_END_INFO_EXT",                                                 // 1000619003
+    "OBJECT_TABLE_CREATE_INFO_NVX",                                           // 1000086000
+    "INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NVX",                               // 1000086001
+    "CMD_PROCESS_COMMANDS_INFO_NVX",                                          // 1000086002
+    "CMD_RESERVE_SPACE_FOR_COMMANDS_INFO_NVX",                                // 1000086003
+    "DEVICE_GENERATED_COMMANDS_LIMITS_NVX",                                   // 1000086004
+    "DEVICE_GENERATED_COMMANDS_FEATURES_NVX",                                 // 1000086005
+    "MIR_SURFACE_CREATE_INFO_KHR",                                            // 1000007000
+    "APPLICATION_INFO",                                                       // 0
+    "INSTANCE_CREATE_INFO",                                                   // 1
+    "DEVICE_QUEUE_CREATE_INFO",                                               // 2
+    "DEVICE_CREATE_INFO",                                                     // 3
+    "SUBMIT_INFO",                                                            // 4
+    "MEMORY_ALLOCATE_INFO",                                                   // 5
+    "MAPPED_MEMORY_RANGE",                                                    // 6
+    "BIND_SPARSE_INFO",                                                       // 7
+    "FENCE_CREATE_INFO",                                                      // 8
+    "SEMAPHORE_CREATE_INFO",                                                  // 9
+    "EVENT_CREATE_INFO",                                                      // 10
+    "QUERY_POOL_CREATE_INFO",                                                 // 11
+    "BUFFER_CREATE_INFO",                                                     // 12
+    "BUFFER_VIEW_CREATE_INFO",                                                // 13
+    "IMAGE_CREATE_INFO",                                                      // 14
+    "IMAGE_VIEW_CREATE_INFO",                                                 // 15
+    "SHADER_MODULE_CREATE_INFO",                                              // 16
+    "PIPELINE_CACHE_CREATE_INFO",                                             // 17
+    "PIPELINE_SHADER_STAGE_CREATE_INFO",                                      // 18
+    "PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO",                                // 19
+    "PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO",                              // 20
+    "PIPELINE_TESSELLATION_STATE_CREATE_INFO",                                // 21
+    "PIPELINE_VIEWPORT_STATE_CREATE_INFO",                                    // 22
+    "PIPELINE_RASTERIZATION_STATE_CREATE_INFO",                               // 23
+    "PIPELINE_MULTISAMPLE_STATE_CREATE_INFO",                                 // 24
+    "PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO",                               // 25
+    "PIPELINE_COLOR_BLEND_STATE_CREATE_INFO",                                 // 26
+    "PIPELINE_DYNAMIC_STATE_CREATE_INFO",                                     // 27
+    "GRAPHICS_PIPELINE_CREATE_INFO",                                          // 28
+    "COMPUTE_PIPELINE_CREATE_INFO",                                           // 29
+    "PIPELINE_LAYOUT_CREATE_INFO",                                            // 30
+    "SAMPLER_CREATE_INFO",                                                    // 31
+    "DESCRIPTOR_SET_LAYOUT_CREATE_INFO",                                      // 32
+    "DESCRIPTOR_POOL_CREATE_INFO",                                            // 33
+    "DESCRIPTOR_SET_ALLOCATE_INFO",                                           // 34
+    "WRITE_DESCRIPTOR_SET",                                                   // 35
+    "COPY_DESCRIPTOR_SET",                                                    // 36
+    "FRAMEBUFFER_CREATE_INFO",                                                // 37
+    "RENDER_PASS_CREATE_INFO",                                                // 38
+    "COMMAND_POOL_CREATE_INFO",                                               // 39
+    "COMMAND_BUFFER_ALLOCATE_INFO",                                           // 40
+    "COMMAND_BUFFER_INHERITANCE_INFO",                                        // 41
+    "COMMAND_BUFFER_BEGIN_INFO",                                              // 42
+    "RENDER_PASS_BEGIN_INFO",                                                 // 43
+    "BUFFER_MEMORY_BARRIER",                                                  // 44
+    "IMAGE_MEMORY_BARRIER",                                                   // 45
+    "MEMORY_BARRIER",                                                         // 46
+    "LOADER_INSTANCE_CREATE_INFO",                                            // 47
+    "LOADER_DEVICE_CREATE_INFO",                                              // 48
+    "BIND_BUFFER_MEMORY_INFO",                                                // 1000157000
+    "BIND_IMAGE_MEMORY_INFO",                                                 // 1000157001
+    "MEMORY_DEDICATED_REQUIREMENTS",                                          // 1000127000
+    "MEMORY_DEDICATED_ALLOCATE_INFO",                                         // 1000127001
+    "MEMORY_ALLOCATE_FLAGS_INFO",                                             // 1000060000
+    "DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO",                                 // 1000060004
+    "DEVICE_GROUP_SUBMIT_INFO",                                               // 1000060005
+    "DEVICE_GROUP_BIND_SPARSE_INFO",                                          // 1000060006
+    "BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO",                                   // 1000060013
+    "BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO",                                    // 1000060014
+    "PHYSICAL_DEVICE_GROUP_PROPERTIES",                                       // 1000070000
+    "DEVICE_GROUP_DEVICE_CREATE_INFO",                                        // 1000070001
+    "BUFFER_MEMORY_REQUIREMENTS_INFO_2",                                      // 1000146000
+    "IMAGE_MEMORY_REQUIREMENTS_INFO_2",                                       // 1000146001
+    "IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2",                                // 1000146002
+    "MEMORY_REQUIREMENTS_2",                                                  // 1000146003
+    "SPARSE_IMAGE_MEMORY_REQUIREMENTS_2",                                     // 1000146004
+    "PHYSICAL_DEVICE_FEATURES_2",                                             // 1000059000
+    "PHYSICAL_DEVICE_PROPERTIES_2",                                           // 1000059001
+    "FORMAT_PROPERTIES_2",                                                    // 1000059002
+    "IMAGE_FORMAT_PROPERTIES_2",                                              // 1000059003
+    "PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2",                                    // 1000059004
+    "QUEUE_FAMILY_PROPERTIES_2",                                              // 1000059005
+    "PHYSICAL_DEVICE_MEMORY_PROPERTIES_2",                                    // 1000059006
+    "SPARSE_IMAGE_FORMAT_PROPERTIES_2",                                       // 1000059007
+    "PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2",                             // 1000059008
+    "IMAGE_VIEW_USAGE_CREATE_INFO",                                           // 1000117002
+    "PROTECTED_SUBMIT_INFO",                                                  // 1000145000
+    "PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES",                              // 1000145001
+    "PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES",                            // 1000145002
+    "DEVICE_QUEUE_INFO_2",                                                    // 1000145003
+    "PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO",                             // 1000071000
+    "EXTERNAL_IMAGE_FORMAT_PROPERTIES",                                       // 1000071001
+    "PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO",                                   // 1000071002
+    "EXTERNAL_BUFFER_PROPERTIES",                                             // 1000071003
+    "PHYSICAL_DEVICE_ID_PROPERTIES",                                          // 1000071004
+    "EXTERNAL_MEMORY_BUFFER_CREATE_INFO",                                     // 1000072000
+    "EXTERNAL_MEMORY_IMAGE_CREATE_INFO",                                      // 1000072001
+    "EXPORT_MEMORY_ALLOCATE_INFO",                                            // 1000072002
+    "PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO",                                    // 1000112000
+    "EXTERNAL_FENCE_PROPERTIES",                                              // 1000112001
+    "EXPORT_FENCE_CREATE_INFO",                                               // 1000113000
+    "EXPORT_SEMAPHORE_CREATE_INFO",                                           // 1000077000
+    "PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO",                                // 1000076000
+    "EXTERNAL_SEMAPHORE_PROPERTIES",                                          // 1000076001
+    "PHYSICAL_DEVICE_SUBGROUP_PROPERTIES",                                    // 1000094000
+    "PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES",                                 // 1000083000
+    "PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES",                             // 1000120000
+    "DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO",                                 // 1000085000
+    "PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES",                               // 1000168000
+    "DESCRIPTOR_SET_LAYOUT_SUPPORT",                                          // 1000168001
+    "SAMPLER_YCBCR_CONVERSION_CREATE_INFO",                                   // 1000156000
+    "SAMPLER_YCBCR_CONVERSION_INFO",                                          // 1000156001
+    "BIND_IMAGE_PLANE_MEMORY_INFO",                                           // 1000156002
+    "IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO",                                   // 1000156003
+    "PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES",                      // 1000156004
+    "SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES",                       // 1000156005
+    "DEVICE_GROUP_RENDER_PASS_BEGIN_INFO",                                    // 1000060003
+    "PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES",                              // 1000117000
+    "RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO",                        // 1000117001
+    "PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO",                  // 1000117003
+    "RENDER_PASS_MULTIVIEW_CREATE_INFO",                                      // 1000053000
+    "PHYSICAL_DEVICE_MULTIVIEW_FEATURES",                                     // 1000053001
+    "PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES",                                   // 1000053002
+    "PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES",                        // 1000063000
+    "PHYSICAL_DEVICE_DRIVER_PROPERTIES",                                      // 1000196000
+    "PHYSICAL_DEVICE_VULKAN_1_1_FEATURES",                                    // 49
+    "PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES",                                  // 50
+    "PHYSICAL_DEVICE_VULKAN_1_2_FEATURES",                                    // 51
+    "PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES",                                  // 52
+    "IMAGE_FORMAT_LIST_CREATE_INFO",                                          // 1000147000
+    "PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES",                           // 1000211000
+    "PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES",                              // 1000261000
+    "PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES",                            // 1000207000
+    "PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES",                          // 1000207001
+    "SEMAPHORE_TYPE_CREATE_INFO",                                             // 1000207002
+    "TIMELINE_SEMAPHORE_SUBMIT_INFO",                                         // 1000207003
+    "SEMAPHORE_WAIT_INFO",                                                    // 1000207004
+    "SEMAPHORE_SIGNAL_INFO",                                                  // 1000207005
+    "PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES",                         // 1000257000
+    "BUFFER_DEVICE_ADDRESS_INFO",                                             // 1000244001
+    "BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO",                              // 1000257002
+    "MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO",                            // 1000257003
+    "DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO",                              // 1000257004
+    "PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES",                                  // 1000177000
+    "PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES",                           // 1000180000
+    "PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES",                           // 1000082000
+    "PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES",                              // 1000197000
+    "DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO",                        // 1000161000
+    "PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES",                           // 1000161001
+    "PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES",                         // 1000161002
+    "DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO",                 // 1000161003
+    "DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT",                // 1000161004
+    "PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES",                           // 1000221000
+    "PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES",                       // 1000130000
+    "SAMPLER_REDUCTION_MODE_CREATE_INFO",                                     // 1000130001
+    "PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES",                // 1000253000
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES",                // 1000175000
+    "ATTACHMENT_DESCRIPTION_2",                                               // 1000109000
+    "ATTACHMENT_REFERENCE_2",                                                 // 1000109001
+    "SUBPASS_DESCRIPTION_2",                                                  // 1000109002
+    "SUBPASS_DEPENDENCY_2",                                                   // 1000109003
+    "RENDER_PASS_CREATE_INFO_2",                                              // 1000109004
+    "SUBPASS_BEGIN_INFO",                                                     // 1000109005
+    "SUBPASS_END_INFO",                                                       // 1000109006
+    "PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES",                       // 1000199000
+    "SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE",                              // 1000199001
+    "IMAGE_STENCIL_USAGE_CREATE_INFO",                                        // 1000246000
+    "PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES",                         // 1000108000
+    "FRAMEBUFFER_ATTACHMENTS_CREATE_INFO",                                    // 1000108001
+    "FRAMEBUFFER_ATTACHMENT_IMAGE_INFO",                                      // 1000108002
+    "RENDER_PASS_ATTACHMENT_BEGIN_INFO",                                      // 1000108003
+    "PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES",                // 1000241000
+    "ATTACHMENT_REFERENCE_STENCIL_LAYOUT",                                    // 1000241001
+    "ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT",                                  // 1000241002
+    "SWAPCHAIN_CREATE_INFO_KHR",                                              // 1000001000
+    "PRESENT_INFO_KHR",                                                       // 1000001001
+    "DEVICE_GROUP_PRESENT_CAPABILITIES_KHR",                                  // 1000060007
+    "IMAGE_SWAPCHAIN_CREATE_INFO_KHR",                                        // 1000060008
+    "BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR",                                   // 1000060009
+    "ACQUIRE_NEXT_IMAGE_INFO_KHR",                                            // 1000060010
+    "DEVICE_GROUP_PRESENT_INFO_KHR",                                          // 1000060011
+    "DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR",                                 // 1000060012
+    "DISPLAY_MODE_CREATE_INFO_KHR",                                           // 1000002000
+    "DISPLAY_SURFACE_CREATE_INFO_KHR",                                        // 1000002001
+    "DISPLAY_PRESENT_INFO_KHR",                                               // 1000003000
+    "XLIB_SURFACE_CREATE_INFO_KHR",                                           // 1000004000
+    "XCB_SURFACE_CREATE_INFO_KHR",                                            // 1000005000
+    "WAYLAND_SURFACE_CREATE_INFO_KHR",                                        // 1000006000
+    "ANDROID_SURFACE_CREATE_INFO_KHR",                                        // 1000008000
+    "WIN32_SURFACE_CREATE_INFO_KHR",                                          // 1000009000
+    "NATIVE_BUFFER_ANDROID",                                                  // 1000010000
+    "SWAPCHAIN_IMAGE_CREATE_INFO_ANDROID",                                    // 1000010001
+    "PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_ANDROID",                        // 1000010002
+    "DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT",                                  // 1000011000
+    "PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD",                   // 1000018000
+    "DEBUG_MARKER_OBJECT_NAME_INFO_EXT",                                      // 1000022000
+    "DEBUG_MARKER_OBJECT_TAG_INFO_EXT",                                       // 1000022001
+    "DEBUG_MARKER_MARKER_INFO_EXT",                                           // 1000022002
+    "DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV",                              // 1000026000
+    "DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV",                             // 1000026001
+    "DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV",                           // 1000026002
+    "PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT",                        // 1000028000
+    "PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT",                      // 1000028001
+    "PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT",                    // 1000028002
+    "IMAGE_VIEW_HANDLE_INFO_NVX",                                             // 1000030000
+    "IMAGE_VIEW_ADDRESS_PROPERTIES_NVX",                                      // 1000030001
+    "TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD",                               // 1000041000
+    "STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP",                              // 1000049000
+    "PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV",                       // 1000050000
+    "EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV",                                   // 1000056000
+    "EXPORT_MEMORY_ALLOCATE_INFO_NV",                                         // 1000056001
+    "IMPORT_MEMORY_WIN32_HANDLE_INFO_NV",                                     // 1000057000
+    "EXPORT_MEMORY_WIN32_HANDLE_INFO_NV",                                     // 1000057001
+    "WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV",                              // 1000058000
+    "VALIDATION_FLAGS_EXT",                                                   // 1000061000
+    "VI_SURFACE_CREATE_INFO_NN",                                              // 1000062000
+    "IMAGE_VIEW_ASTC_DECODE_MODE_EXT",                                        // 1000067000
+    "PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT",                               // 1000067001
+    "IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR",                                    // 1000073000
+    "EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR",                                    // 1000073001
+    "MEMORY_WIN32_HANDLE_PROPERTIES_KHR",                                     // 1000073002
+    "MEMORY_GET_WIN32_HANDLE_INFO_KHR",                                       // 1000073003
+    "IMPORT_MEMORY_FD_INFO_KHR",                                              // 1000074000
+    "MEMORY_FD_PROPERTIES_KHR",                                               // 1000074001
+    "MEMORY_GET_FD_INFO_KHR",                                                 // 1000074002
+    "WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR",                             // 1000075000
+    "IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR",                                 // 1000078000
+    "EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR",                                 // 1000078001
+    "D3D12_FENCE_SUBMIT_INFO_KHR",                                            // 1000078002
+    "SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR",                                    // 1000078003
+    "IMPORT_SEMAPHORE_FD_INFO_KHR",                                           // 1000079000
+    "SEMAPHORE_GET_FD_INFO_KHR",                                              // 1000079001
+    "COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT",              // 1000081000
+    "PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT",                     // 1000081001
+    "CONDITIONAL_RENDERING_BEGIN_INFO_EXT",                                   // 1000081002
+    "PRESENT_REGIONS_KHR",                                                    // 1000084000
+    "PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV",                       // 1000087000
+    "SURFACE_CAPABILITIES_2_EXT",                                             // 1000090000
+    "DISPLAY_POWER_INFO_EXT",                                                 // 1000091000
+    "DEVICE_EVENT_INFO_EXT",                                                  // 1000091001
+    "DISPLAY_EVENT_INFO_EXT",                                                 // 1000091002
+    "SWAPCHAIN_COUNTER_CREATE_INFO_EXT",                                      // 1000091003
+    "PRESENT_TIMES_INFO_GOOGLE",                                              // 1000092000
+    "PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX",           // 1000097000
+    "PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV",                         // 1000098000
+    "PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT",                       // 1000099000
+    "PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT",                       // 1000099001
+    "PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT",              // 1000101000
+    "PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT",              // 1000101001
+    "PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT",                         // 1000102000
+    "PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT",                // 1000102001
+    "HDR_METADATA_EXT",                                                       // 1000105000
+    "SHARED_PRESENT_SURFACE_CAPABILITIES_KHR",                                // 1000111000
+    "IMPORT_FENCE_WIN32_HANDLE_INFO_KHR",                                     // 1000114000
+    "EXPORT_FENCE_WIN32_HANDLE_INFO_KHR",                                     // 1000114001
+    "FENCE_GET_WIN32_HANDLE_INFO_KHR",                                        // 1000114002
+    "IMPORT_FENCE_FD_INFO_KHR",                                               // 1000115000
+    "FENCE_GET_FD_INFO_KHR",                                                  // 1000115001
+    "PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR",                         // 1000116000
+    "PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR",                       // 1000116001
+    "QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR",                                 // 1000116002
+    "PERFORMANCE_QUERY_SUBMIT_INFO_KHR",                                      // 1000116003
+    "ACQUIRE_PROFILING_LOCK_INFO_KHR",                                        // 1000116004
+    "PERFORMANCE_COUNTER_KHR",                                                // 1000116005
+    "PERFORMANCE_COUNTER_DESCRIPTION_KHR",                                    // 1000116006
+    "PHYSICAL_DEVICE_SURFACE_INFO_2_KHR",                                     // 1000119000
+    "SURFACE_CAPABILITIES_2_KHR",                                             // 1000119001
+    "SURFACE_FORMAT_2_KHR",                                                   // 1000119002
+    "DISPLAY_PROPERTIES_2_KHR",                                               // 1000121000
+    "DISPLAY_PLANE_PROPERTIES_2_KHR",                                         // 1000121001
+    "DISPLAY_MODE_PROPERTIES_2_KHR",                                          // 1000121002
+    "DISPLAY_PLANE_INFO_2_KHR",                                               // 1000121003
+    "DISPLAY_PLANE_CAPABILITIES_2_KHR",                                       // 1000121004
+    "IOS_SURFACE_CREATE_INFO_MVK",                                            // 1000122000
+    "MACOS_SURFACE_CREATE_INFO_MVK",                                          // 1000123000
+    "DEBUG_UTILS_OBJECT_NAME_INFO_EXT",                                       // 1000128000
+    "DEBUG_UTILS_OBJECT_TAG_INFO_EXT",                                        // 1000128001
+    "DEBUG_UTILS_LABEL_EXT",                                                  // 1000128002
+    "DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT",                                // 1000128003
+    "DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT",                                  // 1000128004
+    "ANDROID_HARDWARE_BUFFER_USAGE_ANDROID",                                  // 1000129000
+    "ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID",                             // 1000129001
+    "ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID",                      // 1000129002
+    "IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID",                            // 1000129003
+    "MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID",                        // 1000129004
+    "EXTERNAL_FORMAT_ANDROID",                                                // 1000129005
+    "SAMPLE_LOCATIONS_INFO_EXT",                                              // 1000143000
+    "RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT",                            // 1000143001
+    "PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT",                        // 1000143002
+    "PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT",                        // 1000143003
+    "MULTISAMPLE_PROPERTIES_EXT",                                             // 1000143004
+    "PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT",                  // 1000148000
+    "PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT",                // 1000148001
+    "PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT",                    // 1000148002
+    "PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV",                        // 1000149000
+    "WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR",                        // 1000150007
+    "ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR",                         // 1000150000
+    "ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR",                         // 1000150002
+    "ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR",                         // 1000150003
+    "ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR",                     // 1000150004
+    "ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR",                     // 1000150005
+    "ACCELERATION_STRUCTURE_GEOMETRY_KHR",                                    // 1000150006
+    "COPY_ACCELERATION_STRUCTURE_INFO_KHR",                                   // 1000150010
+    "COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR",                         // 1000150011
+    "COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR",                         // 1000150012
+    "ACCELERATION_STRUCTURE_CREATE_INFO_KHR",                                 // 1000150017
+    "RAY_TRACING_PIPELINE_CREATE_INFO_KHR",                                   // 1000150015
+    "RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR",                               // 1000150016
+    "RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR",                         // 1000150018
+    "PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV",                      // 1000152000
+    "PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV",                         // 1000154000
+    "PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV",                       // 1000154001
+    "DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT",                                // 1000158000
+    "PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT",                     // 1000158002
+    "IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT",                         // 1000158003
+    "IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT",                     // 1000158004
+    "IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT",                               // 1000158005
+    "VALIDATION_CACHE_CREATE_INFO_EXT",                                       // 1000160000
+    "SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT",                         // 1000160001
+    "PHYSICAL_DEVICE_PORTABILITY_SUBSET_FEATURES_KHR",                        // 1000163000
+    "PHYSICAL_DEVICE_PORTABILITY_SUBSET_PROPERTIES_KHR",                      // 1000163001
+    "PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV",              // 1000164000
+    "PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV",                         // 1000164001
+    "PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV",                       // 1000164002
+    "PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV",             // 1000164005
+    "RAY_TRACING_PIPELINE_CREATE_INFO_NV",                                    // 1000165000
+    "ACCELERATION_STRUCTURE_CREATE_INFO_NV",                                  // 1000165001
+    "GEOMETRY_NV",                                                            // 1000165003
+    "GEOMETRY_TRIANGLES_NV",                                                  // 1000165004
+    "GEOMETRY_AABB_NV",                                                       // 1000165005
+    "BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV",                             // 1000165006
+    "WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV",                         // 1000165007
+    "ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV",                     // 1000165008
+    "PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV",                              // 1000165009
+    "RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV",                                // 1000165011
+    "ACCELERATION_STRUCTURE_INFO_NV",                                         // 1000165012
+    "PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV",               // 1000166000
+    "PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV",             // 1000166001
+    "PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT",                       // 1000170000
+    "FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT",                    // 1000170001
+    "IMPORT_MEMORY_HOST_POINTER_INFO_EXT",                                    // 1000178000
+    "MEMORY_HOST_POINTER_PROPERTIES_EXT",                                     // 1000178001
+    "PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT",                    // 1000178002
+    "PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR",                              // 1000181000
+    "PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD",                              // 1000183000
+    "PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD",                             // 1000185000
+    "DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD",                           // 1000189000
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT",                // 1000190000
+    "PRESENT_FRAME_TOKEN_GGP",                                                // 1000191000
+    "PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV",                                // 1000202000
+    "PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV",                              // 1000202001
+    "PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV",                     // 1000204000
+    "PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV",               // 1000205000
+    "PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV",                          // 1000205002
+    "CHECKPOINT_DATA_NV",                                                     // 1000206000
+    "QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV",                                  // 1000206001
+    "PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL",              // 1000209000
+    "QUERY_POOL_PERFORMANCE_QUERY_CREATE_INFO_INTEL",                         // 1000210000
+    "INITIALIZE_PERFORMANCE_API_INFO_INTEL",                                  // 1000210001
+    "PERFORMANCE_MARKER_INFO_INTEL",                                          // 1000210002
+    "PERFORMANCE_STREAM_MARKER_INFO_INTEL",                                   // 1000210003
+    "PERFORMANCE_OVERRIDE_INFO_INTEL",                                        // 1000210004
+    "PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL",                           // 1000210005
+    "PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT",                            // 1000212000
+    "DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD",                            // 1000213000
+    "SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD",                           // 1000213001
+    "IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA",                                  // 1000214000
+    "METAL_SURFACE_CREATE_INFO_EXT",                                          // 1000217000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT",                      // 1000218000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT",                    // 1000218001
+    "RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT",                       // 1000218002
+    "FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR",                              // 1000226000
+    "PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR",                   // 1000226001
+    "PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR",                   // 1000226002
+    "PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR",                     // 1000226003
+    "PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR",                              // 1000226004
+    "PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD",                           // 1000227000
+    "PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD",                           // 1000229000
+    "PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT",                 // 1000234000
+    "PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT",                           // 1000237000
+    "PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT",                           // 1000238000
+    "MEMORY_PRIORITY_ALLOCATE_INFO_EXT",                                      // 1000238001
+    "SURFACE_PROTECTED_CAPABILITIES_KHR",                                     // 1000239000
+    "PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV",        // 1000240000
+    "PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_EXT",                     // 1000244000
+    "BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT",                                  // 1000244002
+    "VALIDATION_FEATURES_EXT",                                                // 1000247000
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV",                         // 1000249000
+    "COOPERATIVE_MATRIX_PROPERTIES_NV",                                       // 1000249001
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV",                       // 1000249002
+    "PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV",                    // 1000250000
+    "PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV",                       // 1000250001
+    "FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV",                               // 1000250002
+    "PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT",                 // 1000251000
+    "PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT",                        // 1000252000
+    "SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT",                                 // 1000255000
+    "SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT",                         // 1000255002
+    "SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT",                           // 1000255001
+    "HEADLESS_SURFACE_CREATE_INFO_EXT",                                       // 1000256000
+    "PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT",                       // 1000260000
+    "PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT",                    // 1000267000
+    "PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR",            // 1000269000
+    "PIPELINE_INFO_KHR",                                                      // 1000269001
+    "PIPELINE_EXECUTABLE_PROPERTIES_KHR",                                     // 1000269002
+    "PIPELINE_EXECUTABLE_INFO_KHR",                                           // 1000269003
+    "PIPELINE_EXECUTABLE_STATISTIC_KHR",                                      // 1000269004
+    "PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR",                        // 1000269005
+    "PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV",                // 1000277000
+    "GRAPHICS_SHADER_GROUP_CREATE_INFO_NV",                                   // 1000277001
+    "GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV",                         // 1000277002
+    "INDIRECT_COMMANDS_LAYOUT_TOKEN_NV",                                      // 1000277003
+    "INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV",                                // 1000277004
+    "GENERATED_COMMANDS_INFO_NV",                                             // 1000277005
+    "GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV",                         // 1000277006
+    "PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV",                  // 1000277007
+    "PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT",                    // 1000281000
+    "COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM",             // 1000282000
+    "RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM",                                  // 1000282001
+    "PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT",                      // 1000284000
+    "DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT",                            // 1000284001
+    "DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT",                                 // 1000284002
+    "SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT",                            // 1000287000
+    "PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT",                     // 1000287001
+    "PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT",                       // 1000287002
+    "PIPELINE_LIBRARY_CREATE_INFO_KHR",                                       // 1000290000
+    "PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV",                         // 1000300000
+    "DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV",                               // 1000300001
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT",                    // 1000332000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT",                  // 1000332001
+    "PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT",                              // 1000340000
+    "DIRECTFB_SURFACE_CREATE_INFO_EXT",                                       // 1000346000
+    "RESERVED_QCOM",                                                          // 1000309000
+    "BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_KHR",                            // 1000165006
+    "ACCELERATION_STRUCTURE_CREATE_GEOMETRY_TYPE_INFO_KHR",                   // 1000150001
+    "ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_KHR",                    // 1000150008
+    "ACCELERATION_STRUCTURE_VERSION_KHR",                                     // 1000150009
+    "PHYSICAL_DEVICE_RAY_TRACING_FEATURES_KHR",                               // 1000150013
+    "PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_KHR",                             // 1000150014
+    "DEFERRED_OPERATION_INFO_KHR",                                            // 1000268000
+    "PHYSICAL_DEVICE_VULKAN_1_3_FEATURES",                                    // 53
+    "PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES",                                  // 54
+    "PHYSICAL_DEVICE_TOOL_PROPERTIES",                                        // 1000245000
+    "PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES",                                  // 1000295000
+    "DEVICE_PRIVATE_DATA_CREATE_INFO",                                        // 1000295001
+    "PRIVATE_DATA_SLOT_CREATE_INFO",                                          // 1000295002
+    "MEMORY_BARRIER_2",                                                       // 1000314000
+    "BUFFER_MEMORY_BARRIER_2",                                                // 1000314001
+    "IMAGE_MEMORY_BARRIER_2",                                                 // 1000314002
+    "DEPENDENCY_INFO",                                                        // 1000314003
+    "SUBMIT_INFO_2",                                                          // 1000314004
+    "SEMAPHORE_SUBMIT_INFO",                                                  // 1000314005
+    "COMMAND_BUFFER_SUBMIT_INFO",                                             // 1000314006
+    "PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES",                             // 1000314007
+    "COPY_BUFFER_INFO_2",                                                     // 1000337000
+    "COPY_IMAGE_INFO_2",                                                      // 1000337001
+    "COPY_BUFFER_TO_IMAGE_INFO_2",                                            // 1000337002
+    "COPY_IMAGE_TO_BUFFER_INFO_2",                                            // 1000337003
+    "BUFFER_COPY_2",                                                          // 1000337006
+    "IMAGE_COPY_2",                                                           // 1000337007
+    "BUFFER_IMAGE_COPY_2",                                                    // 1000337009
+    "PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES",                  // 1000066000
+    "FORMAT_PROPERTIES_3",                                                    // 1000360000
+    "PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES",                                 // 1000413000
+    "PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES",                               // 1000413001
+    "DEVICE_BUFFER_MEMORY_REQUIREMENTS",                                      // 1000413002
+    "DEVICE_IMAGE_MEMORY_REQUIREMENTS",                                       // 1000413003
+    "PIPELINE_CREATION_FEEDBACK_CREATE_INFO",                                 // 1000192000
+    "PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES",                   // 1000215000
+    "PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES",            // 1000276000
+    "PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES",               // 1000297000
+    "PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES",              // 1000325000
+    "PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES",                              // 1000335000
+    "PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES",                       // 1000225000
+    "PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO",               // 1000225001
+    "PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES",                         // 1000225002
+    "PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES",                          // 1000138000
+    "PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES",                        // 1000138001
+    "WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK",                              // 1000138002
+    "DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO",                       // 1000138003
+    "PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES",                    // 1000280000
+    "PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES",                  // 1000280001
+    "PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES",                      // 1000281001
+    "BLIT_IMAGE_INFO_2",                                                      // 1000337004
+    "RESOLVE_IMAGE_INFO_2",                                                   // 1000337005
+    "IMAGE_BLIT_2",                                                           // 1000337008
+    "IMAGE_RESOLVE_2",                                                        // 1000337010
+    "RENDERING_INFO",                                                         // 1000044000
+    "RENDERING_ATTACHMENT_INFO",                                              // 1000044001
+    "PIPELINE_RENDERING_CREATE_INFO",                                         // 1000044002
+    "PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES",                             // 1000044003
+    "COMMAND_BUFFER_INHERITANCE_RENDERING_INFO",                              // 1000044004
+    "VIDEO_PROFILE_INFO_KHR",                                                 // 1000023000
+    "VIDEO_CAPABILITIES_KHR",                                                 // 1000023001
+    "VIDEO_PICTURE_RESOURCE_INFO_KHR",                                        // 1000023002
+    "VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR",                                  // 1000023003
+    "BIND_VIDEO_SESSION_MEMORY_INFO_KHR",                                     // 1000023004
+    "VIDEO_SESSION_CREATE_INFO_KHR",                                          // 1000023005
+    "VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR",                               // 1000023006
+    "VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR",                               // 1000023007
+    "VIDEO_BEGIN_CODING_INFO_KHR",                                            // 1000023008
+    "VIDEO_END_CODING_INFO_KHR",                                              // 1000023009
+    "VIDEO_CODING_CONTROL_INFO_KHR",                                          // 1000023010
+    "VIDEO_REFERENCE_SLOT_INFO_KHR",                                          // 1000023011
+    "QUEUE_FAMILY_VIDEO_PROPERTIES_KHR",                                      // 1000023012
+    "VIDEO_PROFILE_LIST_INFO_KHR",                                            // 1000023013
+    "PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR",                                  // 1000023014
+    "VIDEO_FORMAT_PROPERTIES_KHR",                                            // 1000023015
+    "QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR",                        // 1000023016
+    "VIDEO_DECODE_INFO_KHR",                                                  // 1000024000
+    "VIDEO_DECODE_CAPABILITIES_KHR",                                          // 1000024001
+    "VIDEO_DECODE_USAGE_INFO_KHR",                                            // 1000024002
+    "CU_MODULE_CREATE_INFO_NVX",                                              // 1000029000
+    "CU_FUNCTION_CREATE_INFO_NVX",                                            // 1000029001
+    "CU_LAUNCH_INFO_NVX",                                                     // 1000029002
+    "MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX",                                 // 1000044009
+    "ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID",                    // 1000129006
+    "ATTACHMENT_SAMPLE_COUNT_INFO_AMD",                                       // 1000044008
+    "ACCELERATION_STRUCTURE_VERSION_INFO_KHR",                                // 1000150009
+    "PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_FEATURES_KHR",                    // 1000150013
+    "PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_PROPERTIES_KHR",                  // 1000150014
+    "ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR",                            // 1000150020
+    "PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR",                      // 1000347000
+    "PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR",                    // 1000347001
+    "PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR",                                 // 1000348013
+    "DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT",                              // 1000158006
+    "QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV",                                // 1000314008
+    "CHECKPOINT_DATA_2_NV",                                                   // 1000314009
+    "RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT",                     // 1000044007
+    "RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR",                    // 1000044006
+    "PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR",                              // 1000248000
+    "PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT",                          // 1000254000
+    "PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT",          // 1000254001
+    "PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT",                        // 1000254002
+    "PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT",                     // 1000273000
+    "PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV",                 // 1000278000
+    "COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV",                    // 1000278001
+    "PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV",                            // 1000292000
+    "SURFACE_CAPABILITIES_PRESENT_BARRIER_NV",                                // 1000292001
+    "SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV",                               // 1000292002
+    "PRESENT_ID_KHR",                                                         // 1000294000
+    "PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR",                                // 1000294001
+    "VIDEO_ENCODE_INFO_KHR",                                                  // 1000299000
+    "VIDEO_ENCODE_RATE_CONTROL_INFO_KHR",                                     // 1000299001
+    "VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR",                               // 1000299002
+    "VIDEO_ENCODE_CAPABILITIES_KHR",                                          // 1000299003
+    "VIDEO_ENCODE_USAGE_INFO_KHR",                                            // 1000299004
+    "EXPORT_METAL_OBJECT_CREATE_INFO_EXT",                                    // 1000311000
+    "EXPORT_METAL_OBJECTS_INFO_EXT",                                          // 1000311001
+    "EXPORT_METAL_DEVICE_INFO_EXT",                                           // 1000311002
+    "EXPORT_METAL_COMMAND_QUEUE_INFO_EXT",                                    // 1000311003
+    "EXPORT_METAL_BUFFER_INFO_EXT",                                           // 1000311004
+    "IMPORT_METAL_BUFFER_INFO_EXT",                                           // 1000311005
+    "EXPORT_METAL_TEXTURE_INFO_EXT",                                          // 1000311006
+    "IMPORT_METAL_TEXTURE_INFO_EXT",                                          // 1000311007
+    "EXPORT_METAL_IO_SURFACE_INFO_EXT",                                       // 1000311008
+    "IMPORT_METAL_IO_SURFACE_INFO_EXT",                                       // 1000311009
+    "EXPORT_METAL_SHARED_EVENT_INFO_EXT",                                     // 1000311010
+    "IMPORT_METAL_SHARED_EVENT_INFO_EXT",                                     // 1000311011
+    "PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT",                 // 1000320000
+    "PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT",               // 1000320001
+    "GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT",                              // 1000320002
+    "PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD",      // 1000321000
+    "PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_KHR",               // 1000203000
+    "PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR",             // 1000322000
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR",      // 1000323000
+    "PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV",              // 1000326000
+    "PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV",                // 1000326001
+    "PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV",               // 1000326002
+    "ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV",               // 1000327000
+    "PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV",                    // 1000327001
+    "ACCELERATION_STRUCTURE_MOTION_INFO_NV",                                  // 1000327002
+    "PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT",                               // 1000328000
+    "PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT",                             // 1000328001
+    "PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT",                 // 1000330000
+    "COPY_COMMAND_TRANSFORM_INFO_QCOM",                                       // 1000333000
+    "PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR",          // 1000336000
+    "PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT",                 // 1000338000
+    "IMAGE_COMPRESSION_CONTROL_EXT",                                          // 1000338001
+    "IMAGE_COMPRESSION_PROPERTIES_EXT",                                       // 1000338004
+    "PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT",           // 1000339000
+    "PHYSICAL_DEVICE_FAULT_FEATURES_EXT",                                     // 1000341000
+    "DEVICE_FAULT_COUNTS_EXT",                                                // 1000341001
+    "DEVICE_FAULT_INFO_EXT",                                                  // 1000341002
+    "PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT",                          // 1000344000
+    "PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT",                // 1000352000
+    "VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT",                                 // 1000352001
+    "VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT",                               // 1000352002
+    "PHYSICAL_DEVICE_DRM_PROPERTIES_EXT",                                     // 1000353000
+    "PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT",                    // 1000354000
+    "DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT",                               // 1000354001
+    "PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT",                        // 1000355000
+    "PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT",                   // 1000355001
+    "PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT",           // 1000356000
+    "IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA",                               // 1000364000
+    "MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA",                                // 1000364001
+    "MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA",                                  // 1000364002
+    "IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA",                            // 1000365000
+    "SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA",                               // 1000365001
+    "BUFFER_COLLECTION_CREATE_INFO_FUCHSIA",                                  // 1000366000
+    "IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA",                                // 1000366001
+    "BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA",                            // 1000366002
+    "BUFFER_COLLECTION_PROPERTIES_FUCHSIA",                                   // 1000366003
+    "BUFFER_CONSTRAINTS_INFO_FUCHSIA",                                        // 1000366004
+    "BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA",                           // 1000366005
+    "IMAGE_CONSTRAINTS_INFO_FUCHSIA",                                         // 1000366006
+    "IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA",                                  // 1000366007
+    "SYSMEM_COLOR_SPACE_FUCHSIA",                                             // 1000366008
+    "BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA",                             // 1000366009
+    "SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI",                            // 1000369000
+    "PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI",                        // 1000369001
+    "PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI",                      // 1000369002
+    "PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI",                        // 1000370000
+    "MEMORY_GET_REMOTE_ADDRESS_INFO_NV",                                      // 1000371000
+    "PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV",                       // 1000371001
+    "PIPELINE_PROPERTIES_IDENTIFIER_EXT",                                     // 1000372000
+    "PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT",                       // 1000372001
+    "PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT",     // 1000376000
+    "SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT",                                  // 1000376001
+    "MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT",                         // 1000376002
+    "PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT",                  // 1000377000
+    "SCREEN_SURFACE_CREATE_INFO_QNX",                                         // 1000378000
+    "PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT",                        // 1000381000
+    "PIPELINE_COLOR_WRITE_CREATE_INFO_EXT",                                   // 1000381001
+    "PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT",                // 1000382000
+    "PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR",                 // 1000386000
+    "PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT",                        // 1000391000
+    "IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT",                                     // 1000391001
+    "PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT",                                // 1000392000
+    "PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT",                              // 1000392001
+    "PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT",                       // 1000393000
+    "MICROMAP_BUILD_INFO_EXT",                                                // 1000396000
+    "MICROMAP_VERSION_INFO_EXT",                                              // 1000396001
+    "COPY_MICROMAP_INFO_EXT",                                                 // 1000396002
+    "COPY_MICROMAP_TO_MEMORY_INFO_EXT",                                       // 1000396003
+    "COPY_MEMORY_TO_MICROMAP_INFO_EXT",                                       // 1000396004
+    "PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT",                          // 1000396005
+    "PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT",                        // 1000396006
+    "MICROMAP_CREATE_INFO_EXT",                                               // 1000396007
+    "MICROMAP_BUILD_SIZES_INFO_EXT",                                          // 1000396008
+    "ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT",                  // 1000396009
+    "PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT",                      // 1000411000
+    "SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT",                 // 1000411001
+    "PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT",              // 1000412000
+    "PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE",             // 1000420000
+    "DESCRIPTOR_SET_BINDING_REFERENCE_VALVE",                                 // 1000420001
+    "DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE",                          // 1000420002
+    "PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT",                     // 1000422000
+    "PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV",                    // 1000430000
+    "PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT",       // 1000437000
+    "PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM",                         // 1000440000
+    "PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM",                       // 1000440001
+    "IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM",                              // 1000440002
+    "PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT",                  // 1000455000
+    "PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT",                // 1000455001
+    "PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT",                    // 1000458000
+    "RENDER_PASS_CREATION_CONTROL_EXT",                                       // 1000458001
+    "RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT",                          // 1000458002
+    "RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT",                           // 1000458003
+    "PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT",                  // 1000462000
+    "PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT",                // 1000462001
+    "PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT",                // 1000462002
+    "SHADER_MODULE_IDENTIFIER_EXT",                                           // 1000462003
+    "PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_EXT",     // 1000342000
+    "PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV",                               // 1000464000
+    "PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV",                             // 1000464001
+    "OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV",                                      // 1000464002
+    "OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV",                                // 1000464003
+    "OPTICAL_FLOW_SESSION_CREATE_INFO_NV",                                    // 1000464004
+    "OPTICAL_FLOW_EXECUTE_INFO_NV",                                           // 1000464005
+    "OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV",                       // 1000464010
+    "PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT",                          // 1000465000
+    "PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM",                          // 1000484000
+    "TILE_PROPERTIES_QCOM",                                                   // 1000484001
+    "PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC",                           // 1000485000
+    "AMIGO_PROFILING_SUBMIT_INFO_SEC",                                        // 1000485001
+    "PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_EXT",                   // 1000351000
+    "MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_EXT",                                // 1000351002
+    "PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM",                      // 1000497000
+    "PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM",                    // 1000497001
+    "VIDEO_ENCODE_H264_CAPABILITIES_EXT",                                     // 1000038000
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT",                   // 1000038001
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT",                      // 1000038002
+    "VIDEO_ENCODE_H264_VCL_FRAME_INFO_EXT",                                   // 1000038003
+    "VIDEO_ENCODE_H264_DPB_SLOT_INFO_EXT",                                    // 1000038004
+    "VIDEO_ENCODE_H264_NALU_SLICE_INFO_EXT",                                  // 1000038005
+    "VIDEO_ENCODE_H264_EMIT_PICTURE_PARAMETERS_INFO_EXT",                     // 1000038006
+    "VIDEO_ENCODE_H264_PROFILE_INFO_EXT",                                     // 1000038007
+    "VIDEO_ENCODE_H264_RATE_CONTROL_INFO_EXT",                                // 1000038008
+    "VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_EXT",                          // 1000038009
+    "VIDEO_ENCODE_H264_REFERENCE_LISTS_INFO_EXT",                             // 1000038010
+    "VIDEO_ENCODE_H265_CAPABILITIES_EXT",                                     // 1000039000
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT",                   // 1000039001
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT",                      // 1000039002
+    "VIDEO_ENCODE_H265_VCL_FRAME_INFO_EXT",                                   // 1000039003
+    "VIDEO_ENCODE_H265_DPB_SLOT_INFO_EXT",                                    // 1000039004
+    "VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_EXT",                          // 1000039005
+    "VIDEO_ENCODE_H265_EMIT_PICTURE_PARAMETERS_INFO_EXT",                     // 1000039006
+    "VIDEO_ENCODE_H265_PROFILE_INFO_EXT",                                     // 1000039007
+    "VIDEO_ENCODE_H265_REFERENCE_LISTS_INFO_EXT",                             // 1000039008
+    "VIDEO_ENCODE_H265_RATE_CONTROL_INFO_EXT",                                // 1000039009
+    "VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_EXT",                          // 1000039010
+    "VIDEO_DECODE_H264_CAPABILITIES_EXT",                                     // 1000040000
+    "VIDEO_DECODE_H264_PICTURE_INFO_EXT",                                     // 1000040001
+    "VIDEO_DECODE_H264_PROFILE_INFO_EXT",                                     // 1000040003
+    "VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT",                   // 1000040004
+    "VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT",                      // 1000040005
+    "VIDEO_DECODE_H264_DPB_SLOT_INFO_EXT",                                    // 1000040006
+    "VIDEO_DECODE_H265_CAPABILITIES_EXT",                                     // 1000187000
+    "VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT",                   // 1000187001
+    "VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT",                      // 1000187002
+    "VIDEO_DECODE_H265_PROFILE_INFO_EXT",                                     // 1000187003
+    "VIDEO_DECODE_H265_PICTURE_INFO_EXT",                                     // 1000187004
+    "VIDEO_DECODE_H265_DPB_SLOT_INFO_EXT",                                    // 1000187005
+    "VIDEO_DECODE_H264_CAPABILITIES_KHR",                                     // 1000040000
+    "VIDEO_DECODE_H264_PICTURE_INFO_KHR",                                     // 1000040001
+    "VIDEO_DECODE_H264_PROFILE_INFO_KHR",                                     // 1000040003
+    "VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR",                   // 1000040004
+    "VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR",                      // 1000040005
+    "VIDEO_DECODE_H264_DPB_SLOT_INFO_KHR",                                    // 1000040006
+    "PERFORMANCE_QUERY_RESERVATION_INFO_KHR",                                 // 1000116007
+    "VIDEO_DECODE_H265_CAPABILITIES_KHR",                                     // 1000187000
+    "VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR",                   // 1000187001
+    "VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR",                      // 1000187002
+    "VIDEO_DECODE_H265_PROFILE_INFO_KHR",                                     // 1000187003
+    "VIDEO_DECODE_H265_PICTURE_INFO_KHR",                                     // 1000187004
+    "VIDEO_DECODE_H265_DPB_SLOT_INFO_KHR",                                    // 1000187005
+    "REFRESH_OBJECT_LIST_KHR",                                                // 1000308000
+    "PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT",                       // 1000316000
+    "PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT",           // 1000316001
+    "PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT",                         // 1000316002
+    "DESCRIPTOR_ADDRESS_INFO_EXT",                                            // 1000316003
+    "DESCRIPTOR_GET_INFO_EXT",                                                // 1000316004
+    "BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT",                                // 1000316005
+    "IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT",                                 // 1000316006
+    "IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT",                            // 1000316007
+    "SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT",                               // 1000316008
+    "OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT",                         // 1000316010
+    "DESCRIPTOR_BUFFER_BINDING_INFO_EXT",                                     // 1000316011
+    "DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT",            // 1000316012
+    "ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT",                // 1000316009
+    "IMPORT_FENCE_SCI_SYNC_INFO_NV",                                          // 1000373000
+    "EXPORT_FENCE_SCI_SYNC_INFO_NV",                                          // 1000373001
+    "FENCE_GET_SCI_SYNC_INFO_NV",                                             // 1000373002
+    "SCI_SYNC_ATTRIBUTES_INFO_NV",                                            // 1000373003
+    "IMPORT_SEMAPHORE_SCI_SYNC_INFO_NV",                                      // 1000373004
+    "EXPORT_SEMAPHORE_SCI_SYNC_INFO_NV",                                      // 1000373005
+    "SEMAPHORE_GET_SCI_SYNC_INFO_NV",                                         // 1000373006
+    "PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_FEATURES_NV",                          // 1000373007
+    "IMPORT_MEMORY_SCI_BUF_INFO_NV",                                          // 1000374000
+    "EXPORT_MEMORY_SCI_BUF_INFO_NV",                                          // 1000374001
+    "MEMORY_GET_SCI_BUF_INFO_NV",                                             // 1000374002
+    "MEMORY_SCI_BUF_PROPERTIES_NV",                                           // 1000374003
+    "PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCI_BUF_FEATURES_NV",                    // 1000374004
+    "PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI",                 // 1000404000
+    "PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI",               // 1000404001
+    "PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM",                             // 1000415000
+    "PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT",                   // 1000418000
+    "IMAGE_VIEW_SLICED_CREATE_INFO_EXT",                                      // 1000418001
+    "PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV",                       // 1000426000
+    "APPLICATION_PARAMETERS_EXT",                                             // 1000435000
+    "DIRECT_DRIVER_LOADING_INFO_LUNARG",                                      // 1000459000
+    "DIRECT_DRIVER_LOADING_LIST_LUNARG",                                      // 1000459001
+    "PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM",             // 1000488000
+    "SEMAPHORE_SCI_SYNC_POOL_CREATE_INFO_NV",                                 // 1000489000
+    "SEMAPHORE_SCI_SYNC_CREATE_INFO_NV",                                      // 1000489001
+    "PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_2_FEATURES_NV",                        // 1000489002
+    "DEVICE_SEMAPHORE_SCI_SYNC_POOL_RESERVATION_CREATE_INFO_NV",              // 1000489003
+    "PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV",             // 1000490000
+    "PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV",           // 1000490001
+    "PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT",            // 1000498000
+    "PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM",          // 1000510000
+    "MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM",            // 1000510001
+    "PRIVATE_VENDOR_INFO_RESERVED_OFFSET_0_NV",                               // 1000051000
+    "VIDEO_ENCODE_H264_CAPABILITIES_KHR",                                     // 1000038000
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR",                   // 1000038001
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR",                      // 1000038002
+    "VIDEO_ENCODE_H264_PICTURE_INFO_KHR",                                     // 1000038003
+    "VIDEO_ENCODE_H264_DPB_SLOT_INFO_KHR",                                    // 1000038004
+    "VIDEO_ENCODE_H264_NALU_SLICE_INFO_KHR",                                  // 1000038005
+    "VIDEO_ENCODE_H264_GOP_REMAINING_FRAME_INFO_KHR",                         // 1000038006
+    "VIDEO_ENCODE_H264_PROFILE_INFO_KHR",                                     // 1000038007
+    "VIDEO_ENCODE_H264_RATE_CONTROL_INFO_KHR",                                // 1000038008
+    "VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_KHR",                          // 1000038009
+    "VIDEO_ENCODE_H264_SESSION_CREATE_INFO_KHR",                              // 1000038010
+    "VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR",                         // 1000038011
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR",                      // 1000038012
+    "VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR",                 // 1000038013
+    "VIDEO_ENCODE_H265_CAPABILITIES_KHR",                                     // 1000039000
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR",                   // 1000039001
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR",                      // 1000039002
+    "VIDEO_ENCODE_H265_PICTURE_INFO_KHR",                                     // 1000039003
+    "VIDEO_ENCODE_H265_DPB_SLOT_INFO_KHR",                                    // 1000039004
+    "VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_KHR",                          // 1000039005
+    "VIDEO_ENCODE_H265_GOP_REMAINING_FRAME_INFO_KHR",                         // 1000039006
+    "VIDEO_ENCODE_H265_PROFILE_INFO_KHR",                                     // 1000039007
+    "VIDEO_ENCODE_H265_RATE_CONTROL_INFO_KHR",                                // 1000039009
+    "VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_KHR",                          // 1000039010
+    "VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR",                              // 1000039011
+    "VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR",                         // 1000039012
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR",                      // 1000039013
+    "VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR",                 // 1000039014
+    "PRIVATE_VENDOR_INFO_PLACEHOLDER_OFFSET_0_NV",                            // 1000051000
+    "PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG",                // 1000110000
+    "PHYSICAL_DEVICE_SHADER_ENQUEUE_FEATURES_AMDX",                           // 1000134000
+    "PHYSICAL_DEVICE_SHADER_ENQUEUE_PROPERTIES_AMDX",                         // 1000134001
+    "EXECUTION_GRAPH_PIPELINE_SCRATCH_SIZE_AMDX",                             // 1000134002
+    "EXECUTION_GRAPH_PIPELINE_CREATE_INFO_AMDX",                              // 1000134003
+    "PIPELINE_SHADER_STAGE_NODE_CREATE_INFO_AMDX",                            // 1000134004
+    "PHYSICAL_DEVICE_SHADER_QUAD_CONTROL_FEATURES_KHR",                       // 1000235000
+    "PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT",                        // 1000283000
+    "DEPTH_BIAS_INFO_EXT",                                                    // 1000283001
+    "DEPTH_BIAS_REPRESENTATION_INFO_EXT",                                     // 1000283002
+    "QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR",                       // 1000299005
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR",                    // 1000299006
+    "VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR",                              // 1000299007
+    "VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR",                                    // 1000299008
+    "VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR",                           // 1000299009
+    "VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR",                      // 1000299010
+    "CUDA_MODULE_CREATE_INFO_NV",                                             // 1000307000
+    "CUDA_FUNCTION_CREATE_INFO_NV",                                           // 1000307001
+    "CUDA_LAUNCH_INFO_NV",                                                    // 1000307002
+    "PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV",                         // 1000307003
+    "PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV",                       // 1000307004
+    "QUERY_LOW_LATENCY_SUPPORT_NV",                                           // 1000310000
+    "PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT",                            // 1000375000
+    "FRAME_BOUNDARY_EXT",                                                     // 1000375001
+    "PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT",                         // 1000395000
+    "PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT",                       // 1000395001
+    "PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_FEATURES_NV",                      // 1000397000
+    "PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_PROPERTIES_NV",                    // 1000397001
+    "ACCELERATION_STRUCTURE_TRIANGLES_DISPLACEMENT_MICROMAP_NV",              // 1000397002
+    "PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI",             // 1000404002
+    "DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM",                       // 1000417000
+    "PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM",                       // 1000417001
+    "PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM",                     // 1000417002
+    "PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM",                       // 1000424000
+    "PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM",                     // 1000424001
+    "RENDER_PASS_STRIPE_BEGIN_INFO_ARM",                                      // 1000424002
+    "RENDER_PASS_STRIPE_INFO_ARM",                                            // 1000424003
+    "RENDER_PASS_STRIPE_SUBMIT_INFO_ARM",                                     // 1000424004
+    "PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV",          // 1000428000
+    "COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV",                               // 1000428001
+    "PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV",                               // 1000428002
+    "PHYSICAL_DEVICE_SHADER_MAXIMAL_RECONVERGENCE_FEATURES_KHR",              // 1000434000
+    "PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT",                     // 1000451000
+    "PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT",                   // 1000451001
+    "EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT",                                 // 1000453000
+    "PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID",               // 1000468000
+    "PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID",             // 1000468001
+    "ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID",              // 1000468002
+    "PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR",                // 1000481000
+    "PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT",                             // 1000482000
+    "PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT",                           // 1000482001
+    "SHADER_CREATE_INFO_EXT",                                                 // 1000482002
+    "PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV",              // 1000492000
+    "PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV",            // 1000492001
+    "LAYER_SETTINGS_CREATE_INFO_EXT",                                         // 1000496000
+    "PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT",      // 1000499000
+    "LATENCY_SLEEP_MODE_INFO_NV",                                             // 1000505000
+    "LATENCY_SLEEP_INFO_NV",                                                  // 1000505001
+    "SET_LATENCY_MARKER_INFO_NV",                                             // 1000505002
+    "GET_LATENCY_MARKER_INFO_NV",                                             // 1000505003
+    "LATENCY_TIMINGS_FRAME_REPORT_NV",                                        // 1000505004
+    "LATENCY_SUBMISSION_PRESENT_ID_NV",                                       // 1000505005
+    "OUT_OF_BAND_QUEUE_TYPE_INFO_NV",                                         // 1000505006
+    "SWAPCHAIN_LATENCY_CREATE_INFO_NV",                                       // 1000505007
+    "LATENCY_SURFACE_CAPABILITIES_NV",                                        // 1000505008
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR",                        // 1000506000
+    "COOPERATIVE_MATRIX_PROPERTIES_KHR",                                      // 1000506001
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR",                      // 1000506002
+    "VIDEO_DECODE_AV1_CAPABILITIES_KHR",                                      // 1000512000
+    "VIDEO_DECODE_AV1_PICTURE_INFO_KHR",                                      // 1000512001
+    "VIDEO_DECODE_AV1_PROFILE_INFO_KHR",                                      // 1000512003
+    "VIDEO_DECODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR",                    // 1000512004
+    "VIDEO_DECODE_AV1_DPB_SLOT_INFO_KHR",                                     // 1000512005
+    "PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR",                       // 1000515000
+    "VIDEO_INLINE_QUERY_INFO_KHR",                                            // 1000515001
+    "PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV",                   // 1000516000
+    "PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM",                       // 1000518000
+    "PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM",                     // 1000518001
+    "SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM",                            // 1000518002
+    "SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM",                                 // 1000519000
+    "PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM",                            // 1000519001
+    "BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM",                                     // 1000519002
+    "PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM",                            // 1000520000
+    "SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM",                // 1000520001
+    "PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM",                              // 1000521000
+    "PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT",    // 1000524000
+    "SCREEN_BUFFER_PROPERTIES_QNX",                                           // 1000529000
+    "SCREEN_BUFFER_FORMAT_PROPERTIES_QNX",                                    // 1000529001
+    "IMPORT_SCREEN_BUFFER_INFO_QNX",                                          // 1000529002
+    "EXTERNAL_FORMAT_QNX",                                                    // 1000529003
+    "PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX",             // 1000529004
+    "PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT",                         // 1000530000
+    "CALIBRATED_TIMESTAMP_INFO_KHR",                                          // 1000184000
+    "SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT",                                 // 1000545007
+    "BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT",                      // 1000545008
+    "PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV",             // 1000546000
+    "PHYSICAL_DEVICE_MAP_MEMORY_PLACED_FEATURES_EXT",                         // 1000272000
+    "PHYSICAL_DEVICE_MAP_MEMORY_PLACED_PROPERTIES_EXT",                       // 1000272001
+    "MEMORY_MAP_PLACED_INFO_EXT",                                             // 1000272002
+    "PHYSICAL_DEVICE_RAW_ACCESS_CHAINS_FEATURES_NV",                          // 1000555000
+    "PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT16_VECTOR_FEATURES_NV",               // 1000563000
+    "PHYSICAL_DEVICE_RAY_TRACING_VALIDATION_FEATURES_NV",                     // 1000568000
+    "PHYSICAL_DEVICE_ANTI_LAG_FEATURES_AMD",                                  // 1000476000
+    "ANTI_LAG_DATA_AMD",                                                      // 1000476001
+    "ANTI_LAG_PRESENTATION_INFO_AMD",                                         // 1000476002
+    "PHYSICAL_DEVICE_PIPELINE_BINARY_FEATURES_KHR",                           // 1000483000
+    "PIPELINE_BINARY_CREATE_INFO_KHR",                                        // 1000483001
+    "PIPELINE_BINARY_INFO_KHR",                                               // 1000483002
+    "PIPELINE_BINARY_KEY_KHR",                                                // 1000483003
+    "PHYSICAL_DEVICE_PIPELINE_BINARY_PROPERTIES_KHR",                         // 1000483004
+    "RELEASE_CAPTURED_PIPELINE_DATA_INFO_KHR",                                // 1000483005
+    "PIPELINE_BINARY_DATA_INFO_KHR",                                          // 1000483006
+    "PIPELINE_CREATE_INFO_KHR",                                               // 1000483007
+    "DEVICE_PIPELINE_BINARY_INTERNAL_CACHE_CONTROL_KHR",                      // 1000483008
+    "PIPELINE_BINARY_HANDLES_INFO_KHR",                                       // 1000483009
+    "PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_FEATURES_EXT",                  // 1000495000
+    "PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_PROPERTIES_EXT",                // 1000495001
+    "PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_KHR",                // 1000201000
+    "PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_PROPERTIES_KHR",              // 1000511000
+    "PHYSICAL_DEVICE_SHADER_RELAXED_EXTENDED_INSTRUCTION_FEATURES_KHR",       // 1000558000
+    "PHYSICAL_DEVICE_COMMAND_BUFFER_INHERITANCE_FEATURES_NV",                 // 1000559000
+    "PHYSICAL_DEVICE_MAINTENANCE_7_FEATURES_KHR",                             // 1000562000
+    "PHYSICAL_DEVICE_MAINTENANCE_7_PROPERTIES_KHR",                           // 1000562001
+    "PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_LIST_KHR",                        // 1000562002
+    "PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_KHR",                             // 1000562003
+    "PHYSICAL_DEVICE_LAYERED_API_VULKAN_PROPERTIES_KHR",                      // 1000562004
+    "PHYSICAL_DEVICE_SHADER_REPLICATED_COMPOSITES_FEATURES_EXT",              // 1000564000
+    "PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_EXT",                 // 1000572000
+    "PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_EXT",               // 1000572001
+    "GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_EXT",                        // 1000572002
+    "INDIRECT_EXECUTION_SET_CREATE_INFO_EXT",                                 // 1000572003
+    "GENERATED_COMMANDS_INFO_EXT",                                            // 1000572004
+    "INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_EXT",                               // 1000572006
+    "INDIRECT_COMMANDS_LAYOUT_TOKEN_EXT",                                     // 1000572007
+    "WRITE_INDIRECT_EXECUTION_SET_PIPELINE_EXT",                              // 1000572008
+    "WRITE_INDIRECT_EXECUTION_SET_SHADER_EXT",                                // 1000572009
+    "INDIRECT_EXECUTION_SET_PIPELINE_INFO_EXT",                               // 1000572010
+    "INDIRECT_EXECUTION_SET_SHADER_INFO_EXT",                                 // 1000572011
+    "INDIRECT_EXECUTION_SET_SHADER_LAYOUT_INFO_EXT",                          // 1000572012
+    "GENERATED_COMMANDS_PIPELINE_INFO_EXT",                                   // 1000572013
+    "GENERATED_COMMANDS_SHADER_INFO_EXT",                                     // 1000572014
+    "PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_FEATURES_MESA",                  // 1000575000
+    "PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_PROPERTIES_MESA",                // 1000575001
+    "IMAGE_ALIGNMENT_CONTROL_CREATE_INFO_MESA",                               // 1000575002
+    "PHYSICAL_DEVICE_DEPTH_CLAMP_CONTROL_FEATURES_EXT",                       // 1000582000
+    "PIPELINE_VIEWPORT_DEPTH_CLAMP_CONTROL_CREATE_INFO_EXT",                  // 1000582001
+    "PHYSICAL_DEVICE_VULKAN_1_4_FEATURES",                                    // 55
+    "PHYSICAL_DEVICE_VULKAN_1_4_PROPERTIES",                                  // 56
+    "DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO",                               // 1000174000
+    "PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES",                         // 1000388000
+    "QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES",                                // 1000388001
+    "PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES",                              // 1000265000
+    "MEMORY_MAP_INFO",                                                        // 1000271000
+    "MEMORY_UNMAP_INFO",                                                      // 1000271001
+    "PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES",                                 // 1000470000
+    "PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES",                               // 1000470001
+    "DEVICE_IMAGE_SUBRESOURCE_INFO",                                          // 1000470004
+    "SUBRESOURCE_LAYOUT_2",                                                   // 1000338002
+    "IMAGE_SUBRESOURCE_2",                                                    // 1000338003
+    "BUFFER_USAGE_FLAGS_2_CREATE_INFO",                                       // 1000470006
+    "PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES",                                 // 1000545000
+    "PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES",                               // 1000545001
+    "BIND_MEMORY_STATUS",                                                     // 1000545002
+    "PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES",                               // 1000270000
+    "PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES",                             // 1000270001
+    "MEMORY_TO_IMAGE_COPY",                                                   // 1000270002
+    "IMAGE_TO_MEMORY_COPY",                                                   // 1000270003
+    "COPY_IMAGE_TO_MEMORY_INFO",                                              // 1000270004
+    "COPY_MEMORY_TO_IMAGE_INFO",                                              // 1000270005
+    "HOST_IMAGE_LAYOUT_TRANSITION_INFO",                                      // 1000270006
+    "COPY_IMAGE_TO_IMAGE_INFO",                                               // 1000270007
+    "SUBRESOURCE_HOST_MEMCPY_SIZE",                                           // 1000270008
+    "HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY",                               // 1000270009
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_ROTATE_FEATURES",                        // 1000416000
+    "PHYSICAL_DEVICE_SHADER_FLOAT_CONTROLS_2_FEATURES",                       // 1000528000
+    "PHYSICAL_DEVICE_SHADER_EXPECT_ASSUME_FEATURES",                          // 1000544000
+    "PIPELINE_CREATE_FLAGS_2_CREATE_INFO",                                    // 1000470005
+    "PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES",                             // 1000080000
+    "BIND_DESCRIPTOR_SETS_INFO",                                              // 1000545003
+    "PUSH_CONSTANTS_INFO",                                                    // 1000545004
+    "PUSH_DESCRIPTOR_SET_INFO",                                               // 1000545005
+    "PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO",                                 // 1000545006
+    "PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES",                     // 1000466000
+    "PIPELINE_ROBUSTNESS_CREATE_INFO",                                        // 1000068000
+    "PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES",                           // 1000068001
+    "PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES",                         // 1000068002
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES",                            // 1000259000
+    "PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO",                          // 1000259001
+    "PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES",                          // 1000259002
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES",                    // 1000525000
+    "PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO",                        // 1000190001
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES",                      // 1000190002
+    "RENDERING_AREA_INFO",                                                    // 1000470003
+    "PHYSICAL_DEVICE_DYNAMIC_RENDERING_LOCAL_READ_FEATURES",                  // 1000232000
+    "RENDERING_ATTACHMENT_LOCATION_INFO",                                     // 1000232001
+    "RENDERING_INPUT_ATTACHMENT_INDEX_INFO",                                  // 1000232002
+    "CU_MODULE_TEXTURING_MODE_CREATE_INFO_NVX",                               // 1000029004
+    "PHYSICAL_DEVICE_SHADER_BFLOAT16_FEATURES_KHR",                           // 1000141000
+    "PHYSICAL_DEVICE_TILE_SHADING_FEATURES_QCOM",                             // 1000309000
+    "PHYSICAL_DEVICE_TILE_SHADING_PROPERTIES_QCOM",                           // 1000309001
+    "RENDER_PASS_TILE_SHADING_CREATE_INFO_QCOM",                              // 1000309002
+    "PER_TILE_BEGIN_INFO_QCOM",                                               // 1000309003
+    "PER_TILE_END_INFO_QCOM",                                                 // 1000309004
+    "DISPATCH_TILE_INFO_QCOM",                                                // 1000309005
+    "PHYSICAL_DEVICE_RAY_TRACING_LINEAR_SWEPT_SPHERES_FEATURES_NV",           // 1000429008
+    "ACCELERATION_STRUCTURE_GEOMETRY_LINEAR_SWEPT_SPHERES_DATA_NV",           // 1000429009
+    "ACCELERATION_STRUCTURE_GEOMETRY_SPHERES_DATA_NV",                        // 1000429010
+    "TENSOR_CREATE_INFO_ARM",                                                 // 1000460000
+    "TENSOR_VIEW_CREATE_INFO_ARM",                                            // 1000460001
+    "BIND_TENSOR_MEMORY_INFO_ARM",                                            // 1000460002
+    "WRITE_DESCRIPTOR_SET_TENSOR_ARM",                                        // 1000460003
+    "PHYSICAL_DEVICE_TENSOR_PROPERTIES_ARM",                                  // 1000460004
+    "TENSOR_FORMAT_PROPERTIES_ARM",                                           // 1000460005
+    "TENSOR_DESCRIPTION_ARM",                                                 // 1000460006
+    "TENSOR_MEMORY_REQUIREMENTS_INFO_ARM",                                    // 1000460007
+    "TENSOR_MEMORY_BARRIER_ARM",                                              // 1000460008
+    "PHYSICAL_DEVICE_TENSOR_FEATURES_ARM",                                    // 1000460009
+    "DEVICE_TENSOR_MEMORY_REQUIREMENTS_ARM",                                  // 1000460010
+    "COPY_TENSOR_INFO_ARM",                                                   // 1000460011
+    "TENSOR_COPY_ARM",                                                        // 1000460012
+    "TENSOR_DEPENDENCY_INFO_ARM",                                             // 1000460013
+    "MEMORY_DEDICATED_ALLOCATE_INFO_TENSOR_ARM",                              // 1000460014
+    "PHYSICAL_DEVICE_EXTERNAL_TENSOR_INFO_ARM",                               // 1000460015
+    "EXTERNAL_TENSOR_PROPERTIES_ARM",                                         // 1000460016
+    "EXTERNAL_MEMORY_TENSOR_CREATE_INFO_ARM",                                 // 1000460017
+    "PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_FEATURES_ARM",                  // 1000460018
+    "PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_PROPERTIES_ARM",                // 1000460019
+    "DESCRIPTOR_GET_TENSOR_INFO_ARM",                                         // 1000460020
+    "TENSOR_CAPTURE_DESCRIPTOR_DATA_INFO_ARM",                                // 1000460021
+    "TENSOR_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_ARM",                           // 1000460022
+    "FRAME_BOUNDARY_TENSORS_ARM",                                             // 1000460023
+    "SURFACE_CAPABILITIES_PRESENT_ID_2_KHR",                                  // 1000479000
+    "PRESENT_ID_2_KHR",                                                       // 1000479001
+    "PHYSICAL_DEVICE_PRESENT_ID_2_FEATURES_KHR",                              // 1000479002
+    "SURFACE_CAPABILITIES_PRESENT_WAIT_2_KHR",                                // 1000480000
+    "PHYSICAL_DEVICE_PRESENT_WAIT_2_FEATURES_KHR",                            // 1000480001
+    "PRESENT_WAIT_2_INFO_KHR",                                                // 1000480002
+    "PHYSICAL_DEVICE_COOPERATIVE_VECTOR_FEATURES_NV",                         // 1000491000
+    "PHYSICAL_DEVICE_COOPERATIVE_VECTOR_PROPERTIES_NV",                       // 1000491001
+    "COOPERATIVE_VECTOR_PROPERTIES_NV",                                       // 1000491002
+    "CONVERT_COOPERATIVE_VECTOR_MATRIX_INFO_NV",                              // 1000491004
+    "DATA_GRAPH_PIPELINE_CREATE_INFO_ARM",                                    // 1000507000
+    "DATA_GRAPH_PIPELINE_SESSION_CREATE_INFO_ARM",                            // 1000507001
+    "DATA_GRAPH_PIPELINE_RESOURCE_INFO_ARM",                                  // 1000507002
+    "DATA_GRAPH_PIPELINE_CONSTANT_ARM",                                       // 1000507003
+    "DATA_GRAPH_PIPELINE_SESSION_MEMORY_REQUIREMENTS_INFO_ARM",               // 1000507004
+    "BIND_DATA_GRAPH_PIPELINE_SESSION_MEMORY_INFO_ARM",                       // 1000507005
+    "PHYSICAL_DEVICE_DATA_GRAPH_FEATURES_ARM",                                // 1000507006
+    "DATA_GRAPH_PIPELINE_SHADER_MODULE_CREATE_INFO_ARM",                      // 1000507007
+    "DATA_GRAPH_PIPELINE_PROPERTY_QUERY_RESULT_ARM",                          // 1000507008
+    "DATA_GRAPH_PIPELINE_INFO_ARM",                                           // 1000507009
+    "DATA_GRAPH_PIPELINE_COMPILER_CONTROL_CREATE_INFO_ARM",                   // 1000507010
+    "DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENTS_INFO_ARM",           // 1000507011
+    "DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENT_ARM",                 // 1000507012
+    "DATA_GRAPH_PIPELINE_IDENTIFIER_CREATE_INFO_ARM",                         // 1000507013
+    "DATA_GRAPH_PIPELINE_DISPATCH_INFO_ARM",                                  // 1000507014
+    "DATA_GRAPH_PROCESSING_ENGINE_CREATE_INFO_ARM",                           // 1000507016
+    "QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_PROPERTIES_ARM",               // 1000507017
+    "QUEUE_FAMILY_DATA_GRAPH_PROPERTIES_ARM",                                 // 1000507018
+    "PHYSICAL_DEVICE_QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_INFO_ARM",     // 1000507019
+    "DATA_GRAPH_PIPELINE_CONSTANT_TENSOR_SEMI_STRUCTURED_SPARSITY_INFO_ARM",  // 1000507015
+    "VIDEO_ENCODE_AV1_CAPABILITIES_KHR",                                      // 1000513000
+    "VIDEO_ENCODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR",                    // 1000513001
+    "VIDEO_ENCODE_AV1_PICTURE_INFO_KHR",                                      // 1000513002
+    "VIDEO_ENCODE_AV1_DPB_SLOT_INFO_KHR",                                     // 1000513003
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_AV1_FEATURES_KHR",                          // 1000513004
+    "VIDEO_ENCODE_AV1_PROFILE_INFO_KHR",                                      // 1000513005
+    "VIDEO_ENCODE_AV1_RATE_CONTROL_INFO_KHR",                                 // 1000513006
+    "VIDEO_ENCODE_AV1_RATE_CONTROL_LAYER_INFO_KHR",                           // 1000513007
+    "VIDEO_ENCODE_AV1_QUALITY_LEVEL_PROPERTIES_KHR",                          // 1000513008
+    "VIDEO_ENCODE_AV1_SESSION_CREATE_INFO_KHR",                               // 1000513009
+    "VIDEO_ENCODE_AV1_GOP_REMAINING_FRAME_INFO_KHR",                          // 1000513010
+    "PHYSICAL_DEVICE_VIDEO_DECODE_VP9_FEATURES_KHR",                          // 1000514000
+    "VIDEO_DECODE_VP9_CAPABILITIES_KHR",                                      // 1000514001
+    "VIDEO_DECODE_VP9_PICTURE_INFO_KHR",                                      // 1000514002
+    "VIDEO_DECODE_VP9_PROFILE_INFO_KHR",                                      // 1000514003
+    "PHYSICAL_DEVICE_UNIFIED_IMAGE_LAYOUTS_FEATURES_KHR",                     // 1000527000
+    "ATTACHMENT_FEEDBACK_LOOP_INFO_EXT",                                      // 1000527001
+    "PHYSICAL_DEVICE_TILE_MEMORY_HEAP_FEATURES_QCOM",                         // 1000547000
+    "PHYSICAL_DEVICE_TILE_MEMORY_HEAP_PROPERTIES_QCOM",                       // 1000547001
+    "TILE_MEMORY_REQUIREMENTS_QCOM",                                          // 1000547002
+    "TILE_MEMORY_BIND_INFO_QCOM",                                             // 1000547003
+    "TILE_MEMORY_SIZE_INFO_QCOM",                                             // 1000547004
+    "DISPLAY_SURFACE_STEREO_CREATE_INFO_NV",                                  // 1000551000
+    "DISPLAY_MODE_STEREO_PROPERTIES_NV",                                      // 1000551001
+    "VIDEO_ENCODE_QUANTIZATION_MAP_CAPABILITIES_KHR",                         // 1000553000
+    "VIDEO_FORMAT_QUANTIZATION_MAP_PROPERTIES_KHR",                           // 1000553001
+    "VIDEO_ENCODE_QUANTIZATION_MAP_INFO_KHR",                                 // 1000553002
+    "VIDEO_ENCODE_QUANTIZATION_MAP_SESSION_PARAMETERS_CREATE_INFO_KHR",       // 1000553005
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_QUANTIZATION_MAP_FEATURES_KHR",             // 1000553009
+    "VIDEO_ENCODE_H264_QUANTIZATION_MAP_CAPABILITIES_KHR",                    // 1000553003
+    "VIDEO_ENCODE_H265_QUANTIZATION_MAP_CAPABILITIES_KHR",                    // 1000553004
+    "VIDEO_FORMAT_H265_QUANTIZATION_MAP_PROPERTIES_KHR",                      // 1000553006
+    "VIDEO_ENCODE_AV1_QUANTIZATION_MAP_CAPABILITIES_KHR",                     // 1000553007
+    "VIDEO_FORMAT_AV1_QUANTIZATION_MAP_PROPERTIES_KHR",                       // 1000553008
+    "EXTERNAL_COMPUTE_QUEUE_DEVICE_CREATE_INFO_NV",                           // 1000556000
+    "EXTERNAL_COMPUTE_QUEUE_CREATE_INFO_NV",                                  // 1000556001
+    "EXTERNAL_COMPUTE_QUEUE_DATA_PARAMS_NV",                                  // 1000556002
+    "PHYSICAL_DEVICE_EXTERNAL_COMPUTE_QUEUE_PROPERTIES_NV",                   // 1000556003
+    "PHYSICAL_DEVICE_SHADER_FLOAT8_FEATURES_EXT",                             // 1000567000
+    "PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_FEATURES_NV",             // 1000569000
+    "PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_PROPERTIES_NV",           // 1000569001
+    "CLUSTER_ACCELERATION_STRUCTURE_CLUSTERS_BOTTOM_LEVEL_INPUT_NV",          // 1000569002
+    "CLUSTER_ACCELERATION_STRUCTURE_TRIANGLE_CLUSTER_INPUT_NV",               // 1000569003
+    "CLUSTER_ACCELERATION_STRUCTURE_MOVE_OBJECTS_INPUT_NV",                   // 1000569004
+    "CLUSTER_ACCELERATION_STRUCTURE_INPUT_INFO_NV",                           // 1000569005
+    "CLUSTER_ACCELERATION_STRUCTURE_COMMANDS_INFO_NV",                        // 1000569006
+    "RAY_TRACING_PIPELINE_CLUSTER_ACCELERATION_STRUCTURE_CREATE_INFO_NV",     // 1000569007
+    "PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_FEATURES_NV",         // 1000570000
+    "PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_PROPERTIES_NV",       // 1000570001
+    "WRITE_DESCRIPTOR_SET_PARTITIONED_ACCELERATION_STRUCTURE_NV",             // 1000570002
+    "PARTITIONED_ACCELERATION_STRUCTURE_INSTANCES_INPUT_NV",                  // 1000570003
+    "BUILD_PARTITIONED_ACCELERATION_STRUCTURE_INFO_NV",                       // 1000570004
+    "PARTITIONED_ACCELERATION_STRUCTURE_FLAGS_NV",                            // 1000570005
+    "PHYSICAL_DEVICE_MAINTENANCE_8_FEATURES_KHR",                             // 1000574000
+    "MEMORY_BARRIER_ACCESS_FLAGS_3_KHR",                                      // 1000574002
+    "PHYSICAL_DEVICE_MAINTENANCE_9_FEATURES_KHR",                             // 1000584000
+    "PHYSICAL_DEVICE_MAINTENANCE_9_PROPERTIES_KHR",                           // 1000584001
+    "QUEUE_FAMILY_OWNERSHIP_TRANSFER_PROPERTIES_KHR",                         // 1000584002
+    "PHYSICAL_DEVICE_VIDEO_MAINTENANCE_2_FEATURES_KHR",                       // 1000586000
+    "VIDEO_DECODE_H264_INLINE_SESSION_PARAMETERS_INFO_KHR",                   // 1000586001
+    "VIDEO_DECODE_H265_INLINE_SESSION_PARAMETERS_INFO_KHR",                   // 1000586002
+    "VIDEO_DECODE_AV1_INLINE_SESSION_PARAMETERS_INFO_KHR",                    // 1000586003
+    "PHYSICAL_DEVICE_HDR_VIVID_FEATURES_HUAWEI",                              // 1000590000
+    "HDR_VIVID_DYNAMIC_METADATA_HUAWEI",                                      // 1000590001
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_FEATURES_NV",                       // 1000593000
+    "COOPERATIVE_MATRIX_FLEXIBLE_DIMENSIONS_PROPERTIES_NV",                   // 1000593001
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_PROPERTIES_NV",                     // 1000593002
+    "PHYSICAL_DEVICE_PIPELINE_OPACITY_MICROMAP_FEATURES_ARM",                 // 1000596000
+    "IMPORT_MEMORY_METAL_HANDLE_INFO_EXT",                                    // 1000602000
+    "MEMORY_METAL_HANDLE_PROPERTIES_EXT",                                     // 1000602001
+    "MEMORY_GET_METAL_HANDLE_INFO_EXT",                                       // 1000602002
+    "PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_KHR",                      // 1000421000
+    "PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_ROBUSTNESS_FEATURES_EXT",               // 1000608000
+    "PHYSICAL_DEVICE_FORMAT_PACK_FEATURES_ARM",                               // 1000609000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_FEATURES_VALVE",            // 1000611000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_PROPERTIES_VALVE",          // 1000611001
+    "PIPELINE_FRAGMENT_DENSITY_MAP_LAYERED_CREATE_INFO_VALVE",                // 1000611002
+    "PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_KHR",                              // 1000286000
+    "PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_KHR",                            // 1000286001
+    "SET_PRESENT_CONFIG_NV",                                                  // 1000613000
+    "PHYSICAL_DEVICE_PRESENT_METERING_FEATURES_NV",                           // 1000613001
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_EXT",               // 1000425000
+    "PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_EXT",             // 1000425001
+    "RENDER_PASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_EXT",                   // 1000425002
+    "PHYSICAL_DEVICE_ZERO_INITIALIZE_DEVICE_MEMORY_FEATURES_EXT",             // 1000620000
+    "OH_SURFACE_CREATE_INFO_OHOS",                                            // 1000587000
+    "SURFACE_PRESENT_MODE_KHR",                                               // 1000274000
+    "SURFACE_PRESENT_SCALING_CAPABILITIES_KHR",                               // 1000274001
+    "SURFACE_PRESENT_MODE_COMPATIBILITY_KHR",                                 // 1000274002
+    "PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_KHR",                   // 1000275000
+    "SWAPCHAIN_PRESENT_FENCE_INFO_KHR",                                       // 1000275001
+    "SWAPCHAIN_PRESENT_MODES_CREATE_INFO_KHR",                                // 1000275002
+    "SWAPCHAIN_PRESENT_MODE_INFO_KHR",                                        // 1000275003
+    "SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_KHR",                              // 1000275004
+    "RELEASE_SWAPCHAIN_IMAGES_INFO_KHR",                                      // 1000275005
+    "VIDEO_ENCODE_INTRA_REFRESH_CAPABILITIES_KHR",                            // 1000552000
+    "VIDEO_ENCODE_SESSION_INTRA_REFRESH_CREATE_INFO_KHR",                     // 1000552001
+    "VIDEO_ENCODE_INTRA_REFRESH_INFO_KHR",                                    // 1000552002
+    "VIDEO_REFERENCE_INTRA_REFRESH_INFO_KHR",                                 // 1000552003
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_INTRA_REFRESH_FEATURES_KHR",                // 1000552004
+    "PHYSICAL_DEVICE_PRESENT_MODE_FIFO_LATEST_READY_FEATURES_KHR",            // 1000361000
+    "PHYSICAL_DEVICE_PIPELINE_CACHE_INCREMENTAL_MODE_FEATURES_SEC",           // 1000637000
+    "PHYSICAL_DEVICE_SHADER_UNTYPED_POINTERS_FEATURES_KHR",                   // 1000387000
+    "PHYSICAL_DEVICE_DENSE_GEOMETRY_FORMAT_FEATURES_AMDX",                    // 1000478000
+    "ACCELERATION_STRUCTURE_DENSE_GEOMETRY_FORMAT_TRIANGLES_DATA_AMDX",       // 1000478001
+    "SURFACE_CREATE_INFO_OHOS",                                               // 1000685000
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_RGB_CONVERSION_FEATURES_VALVE",             // 1000390000
+    "VIDEO_ENCODE_RGB_CONVERSION_CAPABILITIES_VALVE",                         // 1000390001
+    "VIDEO_ENCODE_PROFILE_RGB_CONVERSION_INFO_VALVE",                         // 1000390002
+    "VIDEO_ENCODE_SESSION_RGB_CONVERSION_CREATE_INFO_VALVE",                  // 1000390003
+    "PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_KHR",                      // 1000549000
+    "PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_KHR",                    // 1000426001
+    "COPY_MEMORY_INDIRECT_INFO_KHR",                                          // 1000549002
+    "COPY_MEMORY_TO_IMAGE_INDIRECT_INFO_KHR",                                 // 1000549003
+    "PHYSICAL_DEVICE_SHADER_FMA_FEATURES_KHR",                                // 1000579000
+    "PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_EXT",                      // 1000427000
+    "PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_EXT",                    // 1000427001
+    "DECOMPRESS_MEMORY_INFO_EXT",                                             // 1000550002
+    "NATIVE_BUFFER_OHOS",                                                     // 1000453001
+    "SWAPCHAIN_IMAGE_CREATE_INFO_OHOS",                                       // 1000453002
+    "PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_OHOS",                           // 1000453003
+    "PHYSICAL_DEVICE_SHADER_64_BIT_INDEXING_FEATURES_EXT",                    // 1000627000
+    "PHYSICAL_DEVICE_MAINTENANCE_10_FEATURES_KHR",                            // 1000630000
+    "PHYSICAL_DEVICE_MAINTENANCE_10_PROPERTIES_KHR",                          // 1000630001
+    "RENDERING_ATTACHMENT_FLAGS_INFO_KHR",                                    // 1000630002
+    "RENDERING_END_INFO_KHR",                                                 // 1000619003
+    "RESOLVE_IMAGE_MODE_INFO_KHR",                                            // 1000630004
+    "PHYSICAL_DEVICE_SHADER_UNIFORM_BUFFER_UNSIZED_ARRAY_FEATURES_EXT",       // 1000642000
+    "NATIVE_BUFFER_USAGE_OHOS",                                               // 1000452000
+    "NATIVE_BUFFER_PROPERTIES_OHOS",                                          // 1000452001
+    "NATIVE_BUFFER_FORMAT_PROPERTIES_OHOS",                                   // 1000452002
+    "IMPORT_NATIVE_BUFFER_INFO_OHOS",                                         // 1000452003
+    "MEMORY_GET_NATIVE_BUFFER_INFO_OHOS",                                     // 1000452004
+    "EXTERNAL_FORMAT_OHOS",                                                   // 1000452005
+    "PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_FEATURES_ARM",            // 1000605000
+    "PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_PROPERTIES_ARM",          // 1000605001
+    "PERFORMANCE_COUNTER_ARM",                                                // 1000605002
+    "PERFORMANCE_COUNTER_DESCRIPTION_ARM",                                    // 1000605003
+    "RENDER_PASS_PERFORMANCE_COUNTERS_BY_REGION_BEGIN_INFO_ARM",              // 1000605004
+    "PHYSICAL_DEVICE_DATA_GRAPH_MODEL_FEATURES_QCOM",                         // 1000629000
+    "DATA_GRAPH_PIPELINE_BUILTIN_MODEL_CREATE_INFO_QCOM",                     // 1000629001
+    "PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_EXT",            // 1000581000
+    "PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_EXT",          // 1000581001
+    "PHYSICAL_DEVICE_CUSTOM_RESOLVE_FEATURES_EXT",                            // 1000628000
+    "BEGIN_CUSTOM_RESOLVE_INFO_EXT",                                          // 1000628001
+    "CUSTOM_RESOLVE_CREATE_INFO_EXT",                                         // 1000628002
+    "PHYSICAL_DEVICE_PRESENT_TIMING_FEATURES_EXT",                            // 1000208000
+    "SWAPCHAIN_TIMING_PROPERTIES_EXT",                                        // 1000208001
+    "SWAPCHAIN_TIME_DOMAIN_PROPERTIES_EXT",                                   // 1000208002
+    "PRESENT_TIMINGS_INFO_EXT",                                               // 1000208003
+    "PRESENT_TIMING_INFO_EXT",                                                // 1000208004
+    "PAST_PRESENTATION_TIMING_INFO_EXT",                                      // 1000208005
+    "PAST_PRESENTATION_TIMING_PROPERTIES_EXT",                                // 1000208006
+    "PAST_PRESENTATION_TIMING_EXT",                                           // 1000208007
+    "PRESENT_TIMING_SURFACE_CAPABILITIES_EXT",                                // 1000208008
+    "SWAPCHAIN_CALIBRATED_TIMESTAMP_INFO_EXT",                                // 1000208009
+    "COMPUTE_OCCUPANCY_PRIORITY_PARAMETERS_NV",                               // 1000645000
+    "PHYSICAL_DEVICE_COMPUTE_OCCUPANCY_PRIORITY_FEATURES_NV",                 // 1000645001
+    "PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_3D_FEATURES_EXT",               // 1000288000
+    "PHYSICAL_DEVICE_SHADER_LONG_VECTOR_FEATURES_EXT",                        // 1000635000
+    "PHYSICAL_DEVICE_SHADER_LONG_VECTOR_PROPERTIES_EXT",                      // 1000635001
+    "TEXEL_BUFFER_DESCRIPTOR_INFO_EXT",                                       // 1000135000
+    "IMAGE_DESCRIPTOR_INFO_EXT",                                              // 1000135001
+    "RESOURCE_DESCRIPTOR_INFO_EXT",                                           // 1000135002
+    "BIND_HEAP_INFO_EXT",                                                     // 1000135003
+    "PUSH_DATA_INFO_EXT",                                                     // 1000135004
+    "DESCRIPTOR_SET_AND_BINDING_MAPPING_EXT",                                 // 1000135005
+    "SHADER_DESCRIPTOR_SET_AND_BINDING_MAPPING_INFO_EXT",                     // 1000135006
+    "OPAQUE_CAPTURE_DATA_CREATE_INFO_EXT",                                    // 1000135007
+    "PHYSICAL_DEVICE_DESCRIPTOR_HEAP_PROPERTIES_EXT",                         // 1000135008
+    "PHYSICAL_DEVICE_DESCRIPTOR_HEAP_FEATURES_EXT",                           // 1000135009
+    "COMMAND_BUFFER_INHERITANCE_DESCRIPTOR_HEAP_INFO_EXT",                    // 1000135010
+    "SAMPLER_CUSTOM_BORDER_COLOR_INDEX_CREATE_INFO_EXT",                      // 1000135011
+    "INDIRECT_COMMANDS_LAYOUT_PUSH_DATA_TOKEN_NV",                            // 1000135012
+    "SUBSAMPLED_IMAGE_FORMAT_PROPERTIES_EXT",                                 // 1000135013
+    "PHYSICAL_DEVICE_DESCRIPTOR_HEAP_TENSOR_PROPERTIES_ARM",                  // 1000135014
+    "PHYSICAL_DEVICE_INTERNALLY_SYNCHRONIZED_QUEUES_FEATURES_KHR",            // 1000504000
+    "PUSH_CONSTANT_BANK_INFO_NV",                                             // 1000580000
+    "PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_FEATURES_NV",                         // 1000580001
+    "PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_PROPERTIES_NV",                       // 1000580002
+    "PHYSICAL_DEVICE_SHADER_SUBGROUP_PARTITIONED_FEATURES_EXT",               // 1000662000
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_CONVERSION_FEATURES_QCOM",            // 1000172000
+    "UBM_SURFACE_CREATE_INFO_SEC",                                            // 1000664000
+    "PHYSICAL_DEVICE_SHADER_MIXED_FLOAT_DOT_PRODUCT_FEATURES_VALVE",          // 1000673000
+    "PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_FEATURES_ARM",                    // 1000607000
+    "PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_PROPERTIES_ARM",                  // 1000607001
+    "SHADER_INSTRUMENTATION_CREATE_INFO_ARM",                                 // 1000607002
+    "SHADER_INSTRUMENTATION_METRIC_DESCRIPTION_ARM",                          // 1000607003
+    "DEVICE_MEMORY_COPY_KHR",                                                 // 1000318000
+    "COPY_DEVICE_MEMORY_INFO_KHR",                                            // 1000318001
+    "DEVICE_MEMORY_IMAGE_COPY_KHR",                                           // 1000318002
+    "COPY_DEVICE_MEMORY_IMAGE_INFO_KHR",                                      // 1000318003
+    "MEMORY_RANGE_BARRIERS_INFO_KHR",                                         // 1000318004
+    "MEMORY_RANGE_BARRIER_KHR",                                               // 1000318005
+    "PHYSICAL_DEVICE_DEVICE_ADDRESS_COMMANDS_FEATURES_KHR",                   // 1000318006
+    "BIND_INDEX_BUFFER_3_INFO_KHR",                                           // 1000318007
+    "BIND_VERTEX_BUFFER_3_INFO_KHR",                                          // 1000318008
+    "DRAW_INDIRECT_2_INFO_KHR",                                               // 1000318009
+    "DRAW_INDIRECT_COUNT_2_INFO_KHR",                                         // 1000318010
+    "DISPATCH_INDIRECT_2_INFO_KHR",                                           // 1000318011
+    "CONDITIONAL_RENDERING_BEGIN_INFO_2_EXT",                                 // 1000318012
+    "BIND_TRANSFORM_FEEDBACK_BUFFER_2_INFO_EXT",                              // 1000318013
+    "MEMORY_MARKER_INFO_AMD",                                                 // 1000318014
+    "ACCELERATION_STRUCTURE_CREATE_INFO_2_KHR",                               // 1000318015
+    "PHYSICAL_DEVICE_SHADER_CONSTANT_DATA_FEATURES_KHR",                      // 1000231000
+    "PHYSICAL_DEVICE_SHADER_ABORT_FEATURES_KHR",                              // 1000233000
+    "DEVICE_FAULT_SHADER_ABORT_MESSAGE_INFO_KHR",                             // 1000233001
+    "PHYSICAL_DEVICE_SHADER_ABORT_PROPERTIES_KHR",                            // 1000233002
+    "PHYSICAL_DEVICE_FAULT_FEATURES_KHR",                                     // 1000573000
+    "PHYSICAL_DEVICE_FAULT_PROPERTIES_KHR",                                   // 1000573001
+    "DEVICE_FAULT_INFO_KHR",                                                  // 1000573002
+    "DEVICE_FAULT_DEBUG_INFO_KHR",                                            // 1000573003
+    "PERF_HINT_INFO_QCOM",                                                    // 1000302000
+    "PHYSICAL_DEVICE_QUEUE_PERF_HINT_FEATURES_QCOM",                          // 1000302001
+    "PHYSICAL_DEVICE_QUEUE_PERF_HINT_PROPERTIES_QCOM",                        // 1000302002
+    "DISPATCH_PARAMETERS_ARM",                                                // 1000417003
+    "PHYSICAL_DEVICE_SCHEDULING_CONTROLS_DISPATCH_PARAMETERS_PROPERTIES_ARM", // 1000417004
+    "QUEUE_FAMILY_DATA_GRAPH_TOSA_PROPERTIES_ARM",                            // 1000508000
+    "PHYSICAL_DEVICE_PRIMITIVE_RESTART_INDEX_FEATURES_EXT",                   // 1000678000
+    "PHYSICAL_DEVICE_DATA_GRAPH_OPTICAL_FLOW_FEATURES_ARM",                   // 1000631000
+    "QUEUE_FAMILY_DATA_GRAPH_OPTICAL_FLOW_PROPERTIES_ARM",                    // 1000631001
+    "DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_INFO_ARM",                          // 1000631003
+    "DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_ARM",                    // 1000631004
+    "DATA_GRAPH_PIPELINE_OPTICAL_FLOW_DISPATCH_INFO_ARM",                     // 1000631005
+    "DATA_GRAPH_PIPELINE_OPTICAL_FLOW_CREATE_INFO_ARM",                       // 1000631002
+    "DATA_GRAPH_PIPELINE_RESOURCE_INFO_IMAGE_LAYOUT_ARM",                     // 1000631006
+    "DATA_GRAPH_PIPELINE_SINGLE_NODE_CREATE_INFO_ARM",                        // 1000631007
+    "DATA_GRAPH_PIPELINE_SINGLE_NODE_CONNECTION_ARM",                         // 1000631008
+    "PHYSICAL_DEVICE_MAINTENANCE_11_FEATURES_KHR",                            // 1000657000
+    "QUEUE_FAMILY_OPTIMAL_IMAGE_TRANSFER_GRANULARITY_PROPERTIES_KHR",         // 1000657001
+    "PHYSICAL_DEVICE_THROTTLE_HINT_FEATURES_SEC",                             // 1000674000
+    "THROTTLE_HINT_SUBMIT_INFO_SEC",                                          // 1000674001
+    "DATA_GRAPH_PIPELINE_NEURAL_STATISTICS_CREATE_INFO_ARM",                  // 1000676000
+    "DATA_GRAPH_PIPELINE_SESSION_NEURAL_STATISTICS_CREATE_INFO_ARM",          // 1000676001
+    "PHYSICAL_DEVICE_DATA_GRAPH_NEURAL_ACCELERATOR_STATISTICS_FEATURES_ARM",  // 1000676002
+    "PHYSICAL_DEVICE_GPA_FEATURES_AMD",                                       // 1000133000
+    "PHYSICAL_DEVICE_GPA_PROPERTIES_AMD",                                     // 1000133001
+    "GPA_SAMPLE_BEGIN_INFO_AMD",                                              // 1000133002
+    "GPA_SESSION_CREATE_INFO_AMD",                                            // 1000133003
+    "GPA_DEVICE_CLOCK_MODE_INFO_AMD",                                         // 1000133004
+    "PHYSICAL_DEVICE_GPA_PROPERTIES_2_AMD",                                   // 1000133005
+    "GPA_DEVICE_GET_CLOCK_INFO_AMD",                                          // 1000133006
+    "PHYSICAL_DEVICE_ELAPSED_TIMER_QUERY_FEATURES_QCOM",                      // 1000173000
+    "PHYSICAL_DEVICE_IMAGE_PROCESSING_3_FEATURES_QCOM",                       // 1000303000
+    "PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_FEATURES_QCOM",              // 1000304000
+    "PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_PROPERTIES_QCOM",            // 1000304001
+    "PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_FEATURES_EXT",                      // 1000305000
+    "PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_PROPERTIES_EXT",                    // 1000305001
+    "PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_KHR",                          // 1000623000
+    "PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_KHR",                        // 1000623001
+    "ACCELERATION_STRUCTURE_GEOMETRY_MICROMAP_DATA_KHR",                      // 1000623002
+    "ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_KHR",                  // 1000623003
+    "PHYSICAL_DEVICE_COOPERATIVE_MATRIX_DECODE_VECTOR_FEATURES_NV",           // 1000689000
+    "PHYSICAL_DEVICE_VIDEO_ENCODE_FEEDBACK_2_FEATURES_KHR",                   // 1000598000
+    "VIDEO_ENCODE_FEEDBACK_2_CAPABILITIES_KHR",                               // 1000598001
+    "QUERY_POOL_VIDEO_ENCODE_PER_PARTITION_FEEDBACK_CREATE_INFO_KHR",         // 1000598002
+    "PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SWAPCHAIN_FEATURES_EXT",          // 1000616000
+    "SWAPCHAIN_FLAGS_SURFACE_CAPABILITIES_EXT",                               // 1000616001
+    "FORMAT_PROPERTIES_4_KHR",                                                // 1000668000
+    "IMAGE_CREATE_FLAGS_2_CREATE_INFO_KHR",                                   // 1000668001
+    "IMAGE_USAGE_FLAGS_2_CREATE_INFO_KHR",                                    // 1000668002
+    "IMAGE_VIEW_USAGE_2_CREATE_INFO_KHR",                                     // 1000668003
+    "PHYSICAL_DEVICE_EXTENDED_FLAGS_FEATURES_KHR",                            // 1000668004
+    "IMAGE_STENCIL_USAGE_2_CREATE_INFO_KHR",                                  // 1000668005
+    "SHARED_PRESENT_SURFACE_CAPABILITIES_2_KHR",                              // 1000668006
+    "TENSOR_EXPLICIT_TILING_FORMAT_PROPERTIES_ARM",                           // 1000565000
+    "TENSOR_ROLLING_BACKING_CREATE_INFO_ARM",                                 // 1000565001
+    "PHYSICAL_DEVICE_SHADER_OCP_MICROSCALING_TYPES_FEATURES_EXT",             // 1000672000
+};
+
+static int32_t const VkStructureTypeValues[1581] = {
+    1000120000, // PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES
+    1000063000, // PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES
+    1000011000, // DEBUG_REPORT_CREATE_INFO_EXT
+    1000053000, // RENDER_PASS_MULTIVIEW_CREATE_INFO_KHR
+    1000053001, // PHYSICAL_DEVICE_MULTIVIEW_FEATURES_KHR
+    1000053002, // PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES_KHR
+    1000059000, // PHYSICAL_DEVICE_FEATURES_2_KHR
+    1000059001, // PHYSICAL_DEVICE_PROPERTIES_2_KHR
+    1000059002, // FORMAT_PROPERTIES_2_KHR
+    1000059003, // IMAGE_FORMAT_PROPERTIES_2_KHR
+    1000059004, // PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2_KHR
+    1000059005, // QUEUE_FAMILY_PROPERTIES_2_KHR
+    1000059006, // PHYSICAL_DEVICE_MEMORY_PROPERTIES_2_KHR
+    1000059007, // SPARSE_IMAGE_FORMAT_PROPERTIES_2_KHR
+    1000059008, // PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2_KHR
+    1000060000, // MEMORY_ALLOCATE_FLAGS_INFO_KHR
+    1000060003, // DEVICE_GROUP_RENDER_PASS_BEGIN_INFO_KHR
+    1000060004, // DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO_KHR
+    1000060005, // DEVICE_GROUP_SUBMIT_INFO_KHR
+    1000060006, // DEVICE_GROUP_BIND_SPARSE_INFO_KHR
+    1000060013, // BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO_KHR
+    1000060014, // BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO_KHR
+    1000066000, // PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES_EXT
+    1000070000, // PHYSICAL_DEVICE_GROUP_PROPERTIES_KHR
+    1000070001, // DEVICE_GROUP_DEVICE_CREATE_INFO_KHR
+    1000071000, // PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO_KHR
+    1000071001, // EXTERNAL_IMAGE_FORMAT_PROPERTIES_KHR
+    1000071002, // PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO_KHR
+    1000071003, // EXTERNAL_BUFFER_PROPERTIES_KHR
+    1000071004, // PHYSICAL_DEVICE_ID_PROPERTIES_KHR
+    1000072000, // EXTERNAL_MEMORY_BUFFER_CREATE_INFO_KHR
+    1000072001, // EXTERNAL_MEMORY_IMAGE_CREATE_INFO_KHR
+    1000072002, // EXPORT_MEMORY_ALLOCATE_INFO_KHR
+    1000076000, // PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO_KHR
+    1000076001, // EXTERNAL_SEMAPHORE_PROPERTIES_KHR
+    1000077000, // EXPORT_SEMAPHORE_CREATE_INFO_KHR
+    1000080000, // PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR
+    1000082000, // PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES_KHR
+    1000082000, // PHYSICAL_DEVICE_FLOAT16_INT8_FEATURES_KHR
+    1000083000, // PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES_KHR
+    1000085000, // DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO_KHR
+    1000090000, // SURFACE_CAPABILITIES2_EXT
+    1000108000, // PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES_KHR
+    1000108001, // FRAMEBUFFER_ATTACHMENTS_CREATE_INFO_KHR
+    1000108002, // FRAMEBUFFER_ATTACHMENT_IMAGE_INFO_KHR
+    1000108003, // RENDER_PASS_ATTACHMENT_BEGIN_INFO_KHR
+    1000109000, // ATTACHMENT_DESCRIPTION_2_KHR
+    1000109001, // ATTACHMENT_REFERENCE_2_KHR
+    1000109002, // SUBPASS_DESCRIPTION_2_KHR
+    1000109003, // SUBPASS_DEPENDENCY_2_KHR
+    1000109004, // RENDER_PASS_CREATE_INFO_2_KHR
+    1000109005, // SUBPASS_BEGIN_INFO_KHR
+    1000109006, // SUBPASS_END_INFO_KHR
+    1000112000, // PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO_KHR
+    1000112001, // EXTERNAL_FENCE_PROPERTIES_KHR
+    1000113000, // EXPORT_FENCE_CREATE_INFO_KHR
+    1000117000, // PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES_KHR
+    1000117001, // RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO_KHR
+    1000117002, // IMAGE_VIEW_USAGE_CREATE_INFO_KHR
+    1000117003, // PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO_KHR
+    1000120000, // PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES_KHR
+    1000120000, // PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES_KHR
+    1000127000, // MEMORY_DEDICATED_REQUIREMENTS_KHR
+    1000127001, // MEMORY_DEDICATED_ALLOCATE_INFO_KHR
+    1000130000, // PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT
+    1000130001, // SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT
+    1000138000, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT
+    1000138001, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT
+    1000138002, // WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT
+    1000138003, // DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT
+    1000146000, // BUFFER_MEMORY_REQUIREMENTS_INFO_2_KHR
+    1000146001, // IMAGE_MEMORY_REQUIREMENTS_INFO_2_KHR
+    1000146002, // IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2_KHR
+    1000146003, // MEMORY_REQUIREMENTS_2_KHR
+    1000146004, // SPARSE_IMAGE_MEMORY_REQUIREMENTS_2_KHR
+    1000147000, // IMAGE_FORMAT_LIST_CREATE_INFO_KHR
+    1000156000, // SAMPLER_YCBCR_CONVERSION_CREATE_INFO_KHR
+    1000156001, // SAMPLER_YCBCR_CONVERSION_INFO_KHR
+    1000156002, // BIND_IMAGE_PLANE_MEMORY_INFO_KHR
+    1000156003, // IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO_KHR
+    1000156004, // PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES_KHR
+    1000156005, // SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES_KHR
+    1000157000, // BIND_BUFFER_MEMORY_INFO_KHR
+    1000157001, // BIND_IMAGE_MEMORY_INFO_KHR
+    1000161000, // DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT
+    1000161001, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT
+    1000161002, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT
+    1000161003, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT
+    1000161004, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT
+    1000168000, // PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES_KHR
+    1000168001, // DESCRIPTOR_SET_LAYOUT_SUPPORT_KHR
+    1000174000, // DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT
+    1000175000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES_KHR
+    1000177000, // PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR
+    1000180000, // PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR
+    1000184000, // CALIBRATED_TIMESTAMP_INFO_EXT
+    1000190001, // PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT
+    1000190002, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT
+    1000192000, // PIPELINE_CREATION_FEEDBACK_CREATE_INFO_EXT
+    1000196000, // PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR
+    1000197000, // PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES_KHR
+    1000199000, // PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES_KHR
+    1000199001, // SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE_KHR
+    1000201000, // PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV
+    1000203000, // PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV
+    1000207000, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES_KHR
+    1000207001, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES_KHR
+    1000207002, // SEMAPHORE_TYPE_CREATE_INFO_KHR
+    1000207003, // TIMELINE_SEMAPHORE_SUBMIT_INFO_KHR
+    1000207004, // SEMAPHORE_WAIT_INFO_KHR
+    1000207005, // SEMAPHORE_SIGNAL_INFO_KHR
+    1000210000, // QUERY_POOL_CREATE_INFO_INTEL
+    1000211000, // PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR
+    1000215000, // PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES_KHR
+    1000221000, // PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES_EXT
+    1000225000, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES_EXT
+    1000225001, // PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT
+    1000225002, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES_EXT
+    1000241000, // PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES_KHR
+    1000241001, // ATTACHMENT_REFERENCE_STENCIL_LAYOUT_KHR
+    1000241002, // ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT_KHR
+    1000244000, // PHYSICAL_DEVICE_BUFFER_ADDRESS_FEATURES_EXT
+    1000244001, // BUFFER_DEVICE_ADDRESS_INFO_EXT
+    1000245000, // PHYSICAL_DEVICE_TOOL_PROPERTIES_EXT
+    1000246000, // IMAGE_STENCIL_USAGE_CREATE_INFO_EXT
+    1000253000, // PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES_KHR
+    1000257000, // PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_KHR
+    1000244001, // BUFFER_DEVICE_ADDRESS_INFO_KHR
+    1000257002, // BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO_KHR
+    1000257003, // MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO_KHR
+    1000257004, // DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO_KHR
+    1000259000, // PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT
+    1000259001, // PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT
+    1000259002, // PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT
+    1000261000, // PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES_EXT
+    1000265000, // PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT
+    1000276000, // PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES_EXT
+    1000281001, // PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES_EXT
+    1000286000, // PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT
+    1000286001, // PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT
+    1000295000, // PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES_EXT
+    1000295001, // DEVICE_PRIVATE_DATA_CREATE_INFO_EXT
+    1000295002, // PRIVATE_DATA_SLOT_CREATE_INFO_EXT
+    1000297000, // PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES_EXT
+    1000335000, // PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT
+    1000337000, // COPY_BUFFER_INFO_2_KHR
+    1000337001, // COPY_IMAGE_INFO_2_KHR
+    1000337002, // COPY_BUFFER_TO_IMAGE_INFO_2_KHR
+    1000337003, // COPY_IMAGE_TO_BUFFER_INFO_2_KHR
+    1000337004, // BLIT_IMAGE_INFO_2_KHR
+    1000337005, // RESOLVE_IMAGE_INFO_2_KHR
+    1000337006, // BUFFER_COPY_2_KHR
+    1000337007, // IMAGE_COPY_2_KHR
+    1000337008, // IMAGE_BLIT_2_KHR
+    1000337009, // BUFFER_IMAGE_COPY_2_KHR
+    1000337010, // IMAGE_RESOLVE_2_KHR
+    1000044000, // RENDERING_INFO_KHR
+    1000044001, // RENDERING_ATTACHMENT_INFO_KHR
+    1000044002, // PIPELINE_RENDERING_CREATE_INFO_KHR
+    1000044003, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES_KHR
+    1000044004, // COMMAND_BUFFER_INHERITANCE_RENDERING_INFO_KHR
+    1000068000, // PIPELINE_ROBUSTNESS_CREATE_INFO_EXT
+    1000068001, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT
+    1000068002, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT
+    1000044008, // ATTACHMENT_SAMPLE_COUNT_INFO_NV
+    1000174000, // DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR
+    1000388000, // PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR
+    1000388001, // QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR
+    1000280000, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES_KHR
+    1000280001, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES_KHR
+    1000314000, // MEMORY_BARRIER_2_KHR
+    1000314001, // BUFFER_MEMORY_BARRIER_2_KHR
+    1000314002, // IMAGE_MEMORY_BARRIER_2_KHR
+    1000314003, // DEPENDENCY_INFO_KHR
+    1000314004, // SUBMIT_INFO_2_KHR
+    1000314005, // SEMAPHORE_SUBMIT_INFO_KHR
+    1000314006, // COMMAND_BUFFER_SUBMIT_INFO_KHR
+    1000314007, // PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES_KHR
+    1000325000, // PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES_KHR
+    1000338002, // SUBRESOURCE_LAYOUT_2_EXT
+    1000338003, // IMAGE_SUBRESOURCE_2_EXT
+    1000342000, // PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_ARM
+    1000351000, // PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_VALVE
+    1000351002, // MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_VALVE
+    1000360000, // FORMAT_PROPERTIES_3_KHR
+    1000269001, // PIPELINE_INFO_EXT
+    1000388000, // PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_EXT
+    1000388001, // QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_EXT
+    1000413000, // PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES_KHR
+    1000413001, // PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES_KHR
+    1000413002, // DEVICE_BUFFER_MEMORY_REQUIREMENTS_KHR
+    1000413003, // DEVICE_IMAGE_MEMORY_REQUIREMENTS_KHR
+    1000421000, // PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT
+    1000425000, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM
+    1000425001, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM
+    1000425002, // SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM
+    1000466000, // PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT
+    1000274000, // SURFACE_PRESENT_MODE_EXT
+    1000274001, // SURFACE_PRESENT_SCALING_CAPABILITIES_EXT
+    1000274002, // SURFACE_PRESENT_MODE_COMPATIBILITY_EXT
+    1000275000, // PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT
+    1000275001, // SWAPCHAIN_PRESENT_FENCE_INFO_EXT
+    1000275002, // SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT
+    1000275003, // SWAPCHAIN_PRESENT_MODE_INFO_EXT
+    1000275004, // SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT
+    1000275005, // RELEASE_SWAPCHAIN_IMAGES_INFO_EXT
+    1000374004, // PHYSICAL_DEVICE_EXTERNAL_SCI_BUF_FEATURES_NV
+    1000426001, // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV
+    1000427000, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV
+    1000427001, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV
+    1000232000, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_LOCAL_READ_FEATURES_KHR
+    1000232001, // RENDERING_ATTACHMENT_LOCATION_INFO_KHR
+    1000232002, // RENDERING_INPUT_ATTACHMENT_INDEX_INFO_KHR
+    1000270000, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT
+    1000270001, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT
+    1000270002, // MEMORY_TO_IMAGE_COPY_EXT
+    1000270003, // IMAGE_TO_MEMORY_COPY_EXT
+    1000270004, // COPY_IMAGE_TO_MEMORY_INFO_EXT
+    1000270005, // COPY_MEMORY_TO_IMAGE_INFO_EXT
+    1000270006, // HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT
+    1000270007, // COPY_IMAGE_TO_IMAGE_INFO_EXT
+    1000270008, // SUBRESOURCE_HOST_MEMCPY_SIZE_EXT
+    1000270009, // HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT
+    1000271000, // MEMORY_MAP_INFO_KHR
+    1000271001, // MEMORY_UNMAP_INFO_KHR
+    1000416000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_ROTATE_FEATURES_KHR
+    1000470000, // PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR
+    1000470001, // PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR
+    1000470003, // RENDERING_AREA_INFO_KHR
+    1000470004, // DEVICE_IMAGE_SUBRESOURCE_INFO_KHR
+    1000338002, // SUBRESOURCE_LAYOUT_2_KHR
+    1000338003, // IMAGE_SUBRESOURCE_2_KHR
+    1000470005, // PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR
+    1000470006, // BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR
+    1000225001, // SHADER_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT
+    1000525000, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR
+    1000190001, // PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_KHR
+    1000190002, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_KHR
+    1000528000, // PHYSICAL_DEVICE_SHADER_FLOAT_CONTROLS_2_FEATURES_KHR
+    1000265000, // PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_KHR
+    1000259000, // PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_KHR
+    1000259001, // PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_KHR
+    1000259002, // PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_KHR
+    1000544000, // PHYSICAL_DEVICE_SHADER_EXPECT_ASSUME_FEATURES_KHR
+    1000545000, // PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR
+    1000545001, // PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR
+    1000545002, // BIND_MEMORY_STATUS_KHR
+    1000545003, // BIND_DESCRIPTOR_SETS_INFO_KHR
+    1000545004, // PUSH_CONSTANTS_INFO_KHR
+    1000545005, // PUSH_DESCRIPTOR_SET_INFO_KHR
+    1000545006, // PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR
+    1000361000, // PHYSICAL_DEVICE_PRESENT_MODE_FIFO_LATEST_READY_FEATURES_EXT
+    1000619003, // RENDERING_END_INFO_EXT
+    1000086000, // OBJECT_TABLE_CREATE_INFO_NVX
+    1000086001, // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NVX
+    1000086002, // CMD_PROCESS_COMMANDS_INFO_NVX
+    1000086003, // CMD_RESERVE_SPACE_FOR_COMMANDS_INFO_NVX
+    1000086004, // DEVICE_GENERATED_COMMANDS_LIMITS_NVX
+    1000086005, // DEVICE_GENERATED_COMMANDS_FEATURES_NVX
+    1000007000, // MIR_SURFACE_CREATE_INFO_KHR
+    0,          // APPLICATION_INFO
+    1,          // INSTANCE_CREATE_INFO
+    2,          // DEVICE_QUEUE_CREATE_INFO
+    3,          // DEVICE_CREATE_INFO
+    4,          // SUBMIT_INFO
+    5,          // MEMORY_ALLOCATE_INFO
+    6,          // MAPPED_MEMORY_RANGE
+    7,          // BIND_SPARSE_INFO
+    8,          // FENCE_CREATE_INFO
+    9,          // SEMAPHORE_CREATE_INFO
+    10,         // EVENT_CREATE_INFO
+    11,         // QUERY_POOL_CREATE_INFO
+    12,         // BUFFER_CREATE_INFO
+    13,         // BUFFER_VIEW_CREATE_INFO
+    14,         // IMAGE_CREATE_INFO
+    15,         // IMAGE_VIEW_CREATE_INFO
+    16,         // SHADER_MODULE_CREATE_INFO
+    17,         // PIPELINE_CACHE_CREATE_INFO
+    18,         // PIPELINE_SHADER_STAGE_CREATE_INFO
+    19,         // PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO
+    20,         // PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO
+    21,         // PIPELINE_TESSELLATION_STATE_CREATE_INFO
+    22,         // PIPELINE_VIEWPORT_STATE_CREATE_INFO
+    23,         // PIPELINE_RASTERIZATION_STATE_CREATE_INFO
+    24,         // PIPELINE_MULTISAMPLE_STATE_CREATE_INFO
+    25,         // PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO
+    26,         // PIPELINE_COLOR_BLEND_STATE_CREATE_INFO
+    27,         // PIPELINE_DYNAMIC_STATE_CREATE_INFO
+    28,         // GRAPHICS_PIPELINE_CREATE_INFO
+    29,         // COMPUTE_PIPELINE_CREATE_INFO
+    30,         // PIPELINE_LAYOUT_CREATE_INFO
+    31,         // SAMPLER_CREATE_INFO
+    32,         // DESCRIPTOR_SET_LAYOUT_CREATE_INFO
+    33,         // DESCRIPTOR_POOL_CREATE_INFO
+    34,         // DESCRIPTOR_SET_ALLOCATE_INFO
+    35,         // WRITE_DESCRIPTOR_SET
+    36,         // COPY_DESCRIPTOR_SET
+    37,         // FRAMEBUFFER_CREATE_INFO
+    38,         // RENDER_PASS_CREATE_INFO
+    39,         // COMMAND_POOL_CREATE_INFO
+    40,         // COMMAND_BUFFER_ALLOCATE_INFO
+    41,         // COMMAND_BUFFER_INHERITANCE_INFO
+    42,         // COMMAND_BUFFER_BEGIN_INFO
+    43,         // RENDER_PASS_BEGIN_INFO
+    44,         // BUFFER_MEMORY_BARRIER
+    45,         // IMAGE_MEMORY_BARRIER
+    46,         // MEMORY_BARRIER
+    47,         // LOADER_INSTANCE_CREATE_INFO
+    48,         // LOADER_DEVICE_CREATE_INFO
+    1000157000, // BIND_BUFFER_MEMORY_INFO
+    1000157001, // BIND_IMAGE_MEMORY_INFO
+    1000127000, // MEMORY_DEDICATED_REQUIREMENTS
+    1000127001, // MEMORY_DEDICATED_ALLOCATE_INFO
+    1000060000, // MEMORY_ALLOCATE_FLAGS_INFO
+    1000060004, // DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO
+    1000060005, // DEVICE_GROUP_SUBMIT_INFO
+    1000060006, // DEVICE_GROUP_BIND_SPARSE_INFO
+    1000060013, // BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO
+    1000060014, // BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO
+    1000070000, // PHYSICAL_DEVICE_GROUP_PROPERTIES
+    1000070001, // DEVICE_GROUP_DEVICE_CREATE_INFO
+    1000146000, // BUFFER_MEMORY_REQUIREMENTS_INFO_2
+    1000146001, // IMAGE_MEMORY_REQUIREMENTS_INFO_2
+    1000146002, // IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2
+    1000146003, // MEMORY_REQUIREMENTS_2
+    1000146004, // SPARSE_IMAGE_MEMORY_REQUIREMENTS_2
+    1000059000, // PHYSICAL_DEVICE_FEATURES_2
+    1000059001, // PHYSICAL_DEVICE_PROPERTIES_2
+    1000059002, // FORMAT_PROPERTIES_2
+    1000059003, // IMAGE_FORMAT_PROPERTIES_2
+    1000059004, // PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2
+    1000059005, // QUEUE_FAMILY_PROPERTIES_2
+    1000059006, // PHYSICAL_DEVICE_MEMORY_PROPERTIES_2
+    1000059007, // SPARSE_IMAGE_FORMAT_PROPERTIES_2
+    1000059008, // PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2
+    1000117002, // IMAGE_VIEW_USAGE_CREATE_INFO
+    1000145000, // PROTECTED_SUBMIT_INFO
+    1000145001, // PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES
+    1000145002, // PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES
+    1000145003, // DEVICE_QUEUE_INFO_2
+    1000071000, // PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO
+    1000071001, // EXTERNAL_IMAGE_FORMAT_PROPERTIES
+    1000071002, // PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO
+    1000071003, // EXTERNAL_BUFFER_PROPERTIES
+    1000071004, // PHYSICAL_DEVICE_ID_PROPERTIES
+    1000072000, // EXTERNAL_MEMORY_BUFFER_CREATE_INFO
+    1000072001, // EXTERNAL_MEMORY_IMAGE_CREATE_INFO
+    1000072002, // EXPORT_MEMORY_ALLOCATE_INFO
+    1000112000, // PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO
+    1000112001, // EXTERNAL_FENCE_PROPERTIES
+    1000113000, // EXPORT_FENCE_CREATE_INFO
+    1000077000, // EXPORT_SEMAPHORE_CREATE_INFO
+    1000076000, // PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO
+    1000076001, // EXTERNAL_SEMAPHORE_PROPERTIES
+    1000094000, // PHYSICAL_DEVICE_SUBGROUP_PROPERTIES
+    1000083000, // PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES
+    1000120000, // PHYSICAL_DEVICE_VARIABLE_POINTERS_FEATURES
+    1000085000, // DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO
+    1000168000, // PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES
+    1000168001, // DESCRIPTOR_SET_LAYOUT_SUPPORT
+    1000156000, // SAMPLER_YCBCR_CONVERSION_CREATE_INFO
+    1000156001, // SAMPLER_YCBCR_CONVERSION_INFO
+    1000156002, // BIND_IMAGE_PLANE_MEMORY_INFO
+    1000156003, // IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO
+    1000156004, // PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES
+    1000156005, // SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES
+    1000060003, // DEVICE_GROUP_RENDER_PASS_BEGIN_INFO
+    1000117000, // PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES
+    1000117001, // RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO
+    1000117003, // PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO
+    1000053000, // RENDER_PASS_MULTIVIEW_CREATE_INFO
+    1000053001, // PHYSICAL_DEVICE_MULTIVIEW_FEATURES
+    1000053002, // PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES
+    1000063000, // PHYSICAL_DEVICE_SHADER_DRAW_PARAMETERS_FEATURES
+    1000196000, // PHYSICAL_DEVICE_DRIVER_PROPERTIES
+    49,         // PHYSICAL_DEVICE_VULKAN_1_1_FEATURES
+    50,         // PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES
+    51,         // PHYSICAL_DEVICE_VULKAN_1_2_FEATURES
+    52,         // PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES
+    1000147000, // IMAGE_FORMAT_LIST_CREATE_INFO
+    1000211000, // PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES
+    1000261000, // PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES
+    1000207000, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES
+    1000207001, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES
+    1000207002, // SEMAPHORE_TYPE_CREATE_INFO
+    1000207003, // TIMELINE_SEMAPHORE_SUBMIT_INFO
+    1000207004, // SEMAPHORE_WAIT_INFO
+    1000207005, // SEMAPHORE_SIGNAL_INFO
+    1000257000, // PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES
+    1000244001, // BUFFER_DEVICE_ADDRESS_INFO
+    1000257002, // BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO
+    1000257003, // MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO
+    1000257004, // DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO
+    1000177000, // PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES
+    1000180000, // PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES
+    1000082000, // PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES
+    1000197000, // PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES
+    1000161000, // DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO
+    1000161001, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES
+    1000161002, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES
+    1000161003, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO
+    1000161004, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT
+    1000221000, // PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES
+    1000130000, // PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES
+    1000130001, // SAMPLER_REDUCTION_MODE_CREATE_INFO
+    1000253000, // PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES
+    1000175000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES
+    1000109000, // ATTACHMENT_DESCRIPTION_2
+    1000109001, // ATTACHMENT_REFERENCE_2
+    1000109002, // SUBPASS_DESCRIPTION_2
+    1000109003, // SUBPASS_DEPENDENCY_2
+    1000109004, // RENDER_PASS_CREATE_INFO_2
+    1000109005, // SUBPASS_BEGIN_INFO
+    1000109006, // SUBPASS_END_INFO
+    1000199000, // PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES
+    1000199001, // SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE
+    1000246000, // IMAGE_STENCIL_USAGE_CREATE_INFO
+    1000108000, // PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES
+    1000108001, // FRAMEBUFFER_ATTACHMENTS_CREATE_INFO
+    1000108002, // FRAMEBUFFER_ATTACHMENT_IMAGE_INFO
+    1000108003, // RENDER_PASS_ATTACHMENT_BEGIN_INFO
+    1000241000, // PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES
+    1000241001, // ATTACHMENT_REFERENCE_STENCIL_LAYOUT
+    1000241002, // ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT
+    1000001000, // SWAPCHAIN_CREATE_INFO_KHR
+    1000001001, // PRESENT_INFO_KHR
+    1000060007, // DEVICE_GROUP_PRESENT_CAPABILITIES_KHR
+    1000060008, // IMAGE_SWAPCHAIN_CREATE_INFO_KHR
+    1000060009, // BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR
+    1000060010, // ACQUIRE_NEXT_IMAGE_INFO_KHR
+    1000060011, // DEVICE_GROUP_PRESENT_INFO_KHR
+    1000060012, // DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR
+    1000002000, // DISPLAY_MODE_CREATE_INFO_KHR
+    1000002001, // DISPLAY_SURFACE_CREATE_INFO_KHR
+    1000003000, // DISPLAY_PRESENT_INFO_KHR
+    1000004000, // XLIB_SURFACE_CREATE_INFO_KHR
+    1000005000, // XCB_SURFACE_CREATE_INFO_KHR
+    1000006000, // WAYLAND_SURFACE_CREATE_INFO_KHR
+    1000008000, // ANDROID_SURFACE_CREATE_INFO_KHR
+    1000009000, // WIN32_SURFACE_CREATE_INFO_KHR
+    1000010000, // NATIVE_BUFFER_ANDROID
+    1000010001, // SWAPCHAIN_IMAGE_CREATE_INFO_ANDROID
+    1000010002, // PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_ANDROID
+    1000011000, // DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT
+    1000018000, // PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD
+    1000022000, // DEBUG_MARKER_OBJECT_NAME_INFO_EXT
+    1000022001, // DEBUG_MARKER_OBJECT_TAG_INFO_EXT
+    1000022002, // DEBUG_MARKER_MARKER_INFO_EXT
+    1000026000, // DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV
+    1000026001, // DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV
+    1000026002, // DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV
+    1000028000, // PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT
+    1000028001, // PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT
+    1000028002, // PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT
+    1000030000, // IMAGE_VIEW_HANDLE_INFO_NVX
+    1000030001, // IMAGE_VIEW_ADDRESS_PROPERTIES_NVX
+    1000041000, // TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD
+    1000049000, // STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP
+    1000050000, // PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV
+    1000056000, // EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV
+    1000056001, // EXPORT_MEMORY_ALLOCATE_INFO_NV
+    1000057000, // IMPORT_MEMORY_WIN32_HANDLE_INFO_NV
+    1000057001, // EXPORT_MEMORY_WIN32_HANDLE_INFO_NV
+    1000058000, // WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV
+    1000061000, // VALIDATION_FLAGS_EXT
+    1000062000, // VI_SURFACE_CREATE_INFO_NN
+    1000067000, // IMAGE_VIEW_ASTC_DECODE_MODE_EXT
+    1000067001, // PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT
+    1000073000, // IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR
+    1000073001, // EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR
+    1000073002, // MEMORY_WIN32_HANDLE_PROPERTIES_KHR
+    1000073003, // MEMORY_GET_WIN32_HANDLE_INFO_KHR
+    1000074000, // IMPORT_MEMORY_FD_INFO_KHR
+    1000074001, // MEMORY_FD_PROPERTIES_KHR
+    1000074002, // MEMORY_GET_FD_INFO_KHR
+    1000075000, // WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR
+    1000078000, // IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR
+    1000078001, // EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR
+    1000078002, // D3D12_FENCE_SUBMIT_INFO_KHR
+    1000078003, // SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR
+    1000079000, // IMPORT_SEMAPHORE_FD_INFO_KHR
+    1000079001, // SEMAPHORE_GET_FD_INFO_KHR
+    1000081000, // COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT
+    1000081001, // PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT
+    1000081002, // CONDITIONAL_RENDERING_BEGIN_INFO_EXT
+    1000084000, // PRESENT_REGIONS_KHR
+    1000087000, // PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV
+    1000090000, // SURFACE_CAPABILITIES_2_EXT
+    1000091000, // DISPLAY_POWER_INFO_EXT
+    1000091001, // DEVICE_EVENT_INFO_EXT
+    1000091002, // DISPLAY_EVENT_INFO_EXT
+    1000091003, // SWAPCHAIN_COUNTER_CREATE_INFO_EXT
+    1000092000, // PRESENT_TIMES_INFO_GOOGLE
+    1000097000, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX
+    1000098000, // PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV
+    1000099000, // PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT
+    1000099001, // PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT
+    1000101000, // PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT
+    1000101001, // PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT
+    1000102000, // PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT
+    1000102001, // PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT
+    1000105000, // HDR_METADATA_EXT
+    1000111000, // SHARED_PRESENT_SURFACE_CAPABILITIES_KHR
+    1000114000, // IMPORT_FENCE_WIN32_HANDLE_INFO_KHR
+    1000114001, // EXPORT_FENCE_WIN32_HANDLE_INFO_KHR
+    1000114002, // FENCE_GET_WIN32_HANDLE_INFO_KHR
+    1000115000, // IMPORT_FENCE_FD_INFO_KHR
+    1000115001, // FENCE_GET_FD_INFO_KHR
+    1000116000, // PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR
+    1000116001, // PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR
+    1000116002, // QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR
+    1000116003, // PERFORMANCE_QUERY_SUBMIT_INFO_KHR
+    1000116004, // ACQUIRE_PROFILING_LOCK_INFO_KHR
+    1000116005, // PERFORMANCE_COUNTER_KHR
+    1000116006, // PERFORMANCE_COUNTER_DESCRIPTION_KHR
+    1000119000, // PHYSICAL_DEVICE_SURFACE_INFO_2_KHR
+    1000119001, // SURFACE_CAPABILITIES_2_KHR
+    1000119002, // SURFACE_FORMAT_2_KHR
+    1000121000, // DISPLAY_PROPERTIES_2_KHR
+    1000121001, // DISPLAY_PLANE_PROPERTIES_2_KHR
+    1000121002, // DISPLAY_MODE_PROPERTIES_2_KHR
+    1000121003, // DISPLAY_PLANE_INFO_2_KHR
+    1000121004, // DISPLAY_PLANE_CAPABILITIES_2_KHR
+    1000122000, // IOS_SURFACE_CREATE_INFO_MVK
+    1000123000, // MACOS_SURFACE_CREATE_INFO_MVK
+    1000128000, // DEBUG_UTILS_OBJECT_NAME_INFO_EXT
+    1000128001, // DEBUG_UTILS_OBJECT_TAG_INFO_EXT
+    1000128002, // DEBUG_UTILS_LABEL_EXT
+    1000128003, // DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT
+    1000128004, // DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT
+    1000129000, // ANDROID_HARDWARE_BUFFER_USAGE_ANDROID
+    1000129001, // ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID
+    1000129002, // ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID
+    1000129003, // IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID
+    1000129004, // MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID
+    1000129005, // EXTERNAL_FORMAT_ANDROID
+    1000143000, // SAMPLE_LOCATIONS_INFO_EXT
+    1000143001, // RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT
+    1000143002, // PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT
+    1000143003, // PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT
+    1000143004, // MULTISAMPLE_PROPERTIES_EXT
+    1000148000, // PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT
+    1000148001, // PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT
+    1000148002, // PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT
+    1000149000, // PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV
+    1000150007, // WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR
+    1000150000, // ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR
+    1000150002, // ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR
+    1000150003, // ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR
+    1000150004, // ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR
+    1000150005, // ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR
+    1000150006, // ACCELERATION_STRUCTURE_GEOMETRY_KHR
+    1000150010, // COPY_ACCELERATION_STRUCTURE_INFO_KHR
+    1000150011, // COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR
+    1000150012, // COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR
+    1000150017, // ACCELERATION_STRUCTURE_CREATE_INFO_KHR
+    1000150015, // RAY_TRACING_PIPELINE_CREATE_INFO_KHR
+    1000150016, // RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR
+    1000150018, // RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR
+    1000152000, // PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV
+    1000154000, // PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV
+    1000154001, // PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV
+    1000158000, // DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT
+    1000158002, // PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT
+    1000158003, // IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT
+    1000158004, // IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT
+    1000158005, // IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT
+    1000160000, // VALIDATION_CACHE_CREATE_INFO_EXT
+    1000160001, // SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT
+    1000163000, // PHYSICAL_DEVICE_PORTABILITY_SUBSET_FEATURES_KHR
+    1000163001, // PHYSICAL_DEVICE_PORTABILITY_SUBSET_PROPERTIES_KHR
+    1000164000, // PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV
+    1000164001, // PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV
+    1000164002, // PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV
+    1000164005, // PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV
+    1000165000, // RAY_TRACING_PIPELINE_CREATE_INFO_NV
+    1000165001, // ACCELERATION_STRUCTURE_CREATE_INFO_NV
+    1000165003, // GEOMETRY_NV
+    1000165004, // GEOMETRY_TRIANGLES_NV
+    1000165005, // GEOMETRY_AABB_NV
+    1000165006, // BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV
+    1000165007, // WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV
+    1000165008, // ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV
+    1000165009, // PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV
+    1000165011, // RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV
+    1000165012, // ACCELERATION_STRUCTURE_INFO_NV
+    1000166000, // PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV
+    1000166001, // PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV
+    1000170000, // PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT
+    1000170001, // FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT
+    1000178000, // IMPORT_MEMORY_HOST_POINTER_INFO_EXT
+    1000178001, // MEMORY_HOST_POINTER_PROPERTIES_EXT
+    1000178002, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT
+    1000181000, // PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR
+    1000183000, // PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD
+    1000185000, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD
+    1000189000, // DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD
+    1000190000, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT
+    1000191000, // PRESENT_FRAME_TOKEN_GGP
+    1000202000, // PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV
+    1000202001, // PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV
+    1000204000, // PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV
+    1000205000, // PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV
+    1000205002, // PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV
+    1000206000, // CHECKPOINT_DATA_NV
+    1000206001, // QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV
+    1000209000, // PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL
+    1000210000, // QUERY_POOL_PERFORMANCE_QUERY_CREATE_INFO_INTEL
+    1000210001, // INITIALIZE_PERFORMANCE_API_INFO_INTEL
+    1000210002, // PERFORMANCE_MARKER_INFO_INTEL
+    1000210003, // PERFORMANCE_STREAM_MARKER_INFO_INTEL
+    1000210004, // PERFORMANCE_OVERRIDE_INFO_INTEL
+    1000210005, // PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL
+    1000212000, // PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT
+    1000213000, // DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD
+    1000213001, // SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD
+    1000214000, // IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA
+    1000217000, // METAL_SURFACE_CREATE_INFO_EXT
+    1000218000, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT
+    1000218001, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT
+    1000218002, // RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT
+    1000226000, // FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR
+    1000226001, // PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR
+    1000226002, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR
+    1000226003, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR
+    1000226004, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR
+    1000227000, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD
+    1000229000, // PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD
+    1000234000, // PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT
+    1000237000, // PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT
+    1000238000, // PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT
+    1000238001, // MEMORY_PRIORITY_ALLOCATE_INFO_EXT
+    1000239000, // SURFACE_PROTECTED_CAPABILITIES_KHR
+    1000240000, // PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV
+    1000244000, // PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_EXT
+    1000244002, // BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT
+    1000247000, // VALIDATION_FEATURES_EXT
+    1000249000, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV
+    1000249001, // COOPERATIVE_MATRIX_PROPERTIES_NV
+    1000249002, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV
+    1000250000, // PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV
+    1000250001, // PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV
+    1000250002, // FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV
+    1000251000, // PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT
+    1000252000, // PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT
+    1000255000, // SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT
+    1000255002, // SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT
+    1000255001, // SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT
+    1000256000, // HEADLESS_SURFACE_CREATE_INFO_EXT
+    1000260000, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT
+    1000267000, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT
+    1000269000, // PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR
+    1000269001, // PIPELINE_INFO_KHR
+    1000269002, // PIPELINE_EXECUTABLE_PROPERTIES_KHR
+    1000269003, // PIPELINE_EXECUTABLE_INFO_KHR
+    1000269004, // PIPELINE_EXECUTABLE_STATISTIC_KHR
+    1000269005, // PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR
+    1000277000, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV
+    1000277001, // GRAPHICS_SHADER_GROUP_CREATE_INFO_NV
+    1000277002, // GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV
+    1000277003, // INDIRECT_COMMANDS_LAYOUT_TOKEN_NV
+    1000277004, // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV
+    1000277005, // GENERATED_COMMANDS_INFO_NV
+    1000277006, // GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV
+    1000277007, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV
+    1000281000, // PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT
+    1000282000, // COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM
+    1000282001, // RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM
+    1000284000, // PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT
+    1000284001, // DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT
+    1000284002, // DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT
+    1000287000, // SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT
+    1000287001, // PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT
+    1000287002, // PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT
+    1000290000, // PIPELINE_LIBRARY_CREATE_INFO_KHR
+    1000300000, // PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV
+    1000300001, // DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV
+    1000332000, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT
+    1000332001, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT
+    1000340000, // PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT
+    1000346000, // DIRECTFB_SURFACE_CREATE_INFO_EXT
+    1000309000, // RESERVED_QCOM
+    1000165006, // BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_KHR
+    1000150001, // ACCELERATION_STRUCTURE_CREATE_GEOMETRY_TYPE_INFO_KHR
+    1000150008, // ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_KHR
+    1000150009, // ACCELERATION_STRUCTURE_VERSION_KHR
+    1000150013, // PHYSICAL_DEVICE_RAY_TRACING_FEATURES_KHR
+    1000150014, // PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_KHR
+    1000268000, // DEFERRED_OPERATION_INFO_KHR
+    53,         // PHYSICAL_DEVICE_VULKAN_1_3_FEATURES
+    54,         // PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES
+    1000245000, // PHYSICAL_DEVICE_TOOL_PROPERTIES
+    1000295000, // PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES
+    1000295001, // DEVICE_PRIVATE_DATA_CREATE_INFO
+    1000295002, // PRIVATE_DATA_SLOT_CREATE_INFO
+    1000314000, // MEMORY_BARRIER_2
+    1000314001, // BUFFER_MEMORY_BARRIER_2
+    1000314002, // IMAGE_MEMORY_BARRIER_2
+    1000314003, // DEPENDENCY_INFO
+    1000314004, // SUBMIT_INFO_2
+    1000314005, // SEMAPHORE_SUBMIT_INFO
+    1000314006, // COMMAND_BUFFER_SUBMIT_INFO
+    1000314007, // PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES
+    1000337000, // COPY_BUFFER_INFO_2
+    1000337001, // COPY_IMAGE_INFO_2
+    1000337002, // COPY_BUFFER_TO_IMAGE_INFO_2
+    1000337003, // COPY_IMAGE_TO_BUFFER_INFO_2
+    1000337006, // BUFFER_COPY_2
+    1000337007, // IMAGE_COPY_2
+    1000337009, // BUFFER_IMAGE_COPY_2
+    1000066000, // PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES
+    1000360000, // FORMAT_PROPERTIES_3
+    1000413000, // PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES
+    1000413001, // PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES
+    1000413002, // DEVICE_BUFFER_MEMORY_REQUIREMENTS
+    1000413003, // DEVICE_IMAGE_MEMORY_REQUIREMENTS
+    1000192000, // PIPELINE_CREATION_FEEDBACK_CREATE_INFO
+    1000215000, // PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES
+    1000276000, // PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES
+    1000297000, // PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES
+    1000325000, // PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES
+    1000335000, // PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES
+    1000225000, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES
+    1000225001, // PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO
+    1000225002, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES
+    1000138000, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES
+    1000138001, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES
+    1000138002, // WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK
+    1000138003, // DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO
+    1000280000, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES
+    1000280001, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES
+    1000281001, // PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES
+    1000337004, // BLIT_IMAGE_INFO_2
+    1000337005, // RESOLVE_IMAGE_INFO_2
+    1000337008, // IMAGE_BLIT_2
+    1000337010, // IMAGE_RESOLVE_2
+    1000044000, // RENDERING_INFO
+    1000044001, // RENDERING_ATTACHMENT_INFO
+    1000044002, // PIPELINE_RENDERING_CREATE_INFO
+    1000044003, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES
+    1000044004, // COMMAND_BUFFER_INHERITANCE_RENDERING_INFO
+    1000023000, // VIDEO_PROFILE_INFO_KHR
+    1000023001, // VIDEO_CAPABILITIES_KHR
+    1000023002, // VIDEO_PICTURE_RESOURCE_INFO_KHR
+    1000023003, // VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR
+    1000023004, // BIND_VIDEO_SESSION_MEMORY_INFO_KHR
+    1000023005, // VIDEO_SESSION_CREATE_INFO_KHR
+    1000023006, // VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000023007, // VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR
+    1000023008, // VIDEO_BEGIN_CODING_INFO_KHR
+    1000023009, // VIDEO_END_CODING_INFO_KHR
+    1000023010, // VIDEO_CODING_CONTROL_INFO_KHR
+    1000023011, // VIDEO_REFERENCE_SLOT_INFO_KHR
+    1000023012, // QUEUE_FAMILY_VIDEO_PROPERTIES_KHR
+    1000023013, // VIDEO_PROFILE_LIST_INFO_KHR
+    1000023014, // PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR
+    1000023015, // VIDEO_FORMAT_PROPERTIES_KHR
+    1000023016, // QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR
+    1000024000, // VIDEO_DECODE_INFO_KHR
+    1000024001, // VIDEO_DECODE_CAPABILITIES_KHR
+    1000024002, // VIDEO_DECODE_USAGE_INFO_KHR
+    1000029000, // CU_MODULE_CREATE_INFO_NVX
+    1000029001, // CU_FUNCTION_CREATE_INFO_NVX
+    1000029002, // CU_LAUNCH_INFO_NVX
+    1000044009, // MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX
+    1000129006, // ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID
+    1000044008, // ATTACHMENT_SAMPLE_COUNT_INFO_AMD
+    1000150009, // ACCELERATION_STRUCTURE_VERSION_INFO_KHR
+    1000150013, // PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_FEATURES_KHR
+    1000150014, // PHYSICAL_DEVICE_ACCELERATION_STRUCTURE_PROPERTIES_KHR
+    1000150020, // ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR
+    1000347000, // PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR
+    1000347001, // PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR
+    1000348013, // PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR
+    1000158006, // DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT
+    1000314008, // QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV
+    1000314009, // CHECKPOINT_DATA_2_NV
+    1000044007, // RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT
+    1000044006, // RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR
+    1000248000, // PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR
+    1000254000, // PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT
+    1000254001, // PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT
+    1000254002, // PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT
+    1000273000, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT
+    1000278000, // PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV
+    1000278001, // COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV
+    1000292000, // PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV
+    1000292001, // SURFACE_CAPABILITIES_PRESENT_BARRIER_NV
+    1000292002, // SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV
+    1000294000, // PRESENT_ID_KHR
+    1000294001, // PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR
+    1000299000, // VIDEO_ENCODE_INFO_KHR
+    1000299001, // VIDEO_ENCODE_RATE_CONTROL_INFO_KHR
+    1000299002, // VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR
+    1000299003, // VIDEO_ENCODE_CAPABILITIES_KHR
+    1000299004, // VIDEO_ENCODE_USAGE_INFO_KHR
+    1000311000, // EXPORT_METAL_OBJECT_CREATE_INFO_EXT
+    1000311001, // EXPORT_METAL_OBJECTS_INFO_EXT
+    1000311002, // EXPORT_METAL_DEVICE_INFO_EXT
+    1000311003, // EXPORT_METAL_COMMAND_QUEUE_INFO_EXT
+    1000311004, // EXPORT_METAL_BUFFER_INFO_EXT
+    1000311005, // IMPORT_METAL_BUFFER_INFO_EXT
+    1000311006, // EXPORT_METAL_TEXTURE_INFO_EXT
+    1000311007, // IMPORT_METAL_TEXTURE_INFO_EXT
+    1000311008, // EXPORT_METAL_IO_SURFACE_INFO_EXT
+    1000311009, // IMPORT_METAL_IO_SURFACE_INFO_EXT
+    1000311010, // EXPORT_METAL_SHARED_EVENT_INFO_EXT
+    1000311011, // IMPORT_METAL_SHARED_EVENT_INFO_EXT
+    1000320000, // PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT
+    1000320001, // PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT
+    1000320002, // GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT
+    1000321000, // PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD
+    1000203000, // PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_KHR
+    1000322000, // PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR
+    1000323000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR
+    1000326000, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV
+    1000326001, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV
+    1000326002, // PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV
+    1000327000, // ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV
+    1000327001, // PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV
+    1000327002, // ACCELERATION_STRUCTURE_MOTION_INFO_NV
+    1000328000, // PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT
+    1000328001, // PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT
+    1000330000, // PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT
+    1000333000, // COPY_COMMAND_TRANSFORM_INFO_QCOM
+    1000336000, // PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR
+    1000338000, // PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT
+    1000338001, // IMAGE_COMPRESSION_CONTROL_EXT
+    1000338004, // IMAGE_COMPRESSION_PROPERTIES_EXT
+    1000339000, // PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT
+    1000341000, // PHYSICAL_DEVICE_FAULT_FEATURES_EXT
+    1000341001, // DEVICE_FAULT_COUNTS_EXT
+    1000341002, // DEVICE_FAULT_INFO_EXT
+    1000344000, // PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT
+    1000352000, // PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT
+    1000352001, // VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT
+    1000352002, // VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT
+    1000353000, // PHYSICAL_DEVICE_DRM_PROPERTIES_EXT
+    1000354000, // PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT
+    1000354001, // DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT
+    1000355000, // PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT
+    1000355001, // PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT
+    1000356000, // PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT
+    1000364000, // IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA
+    1000364001, // MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA
+    1000364002, // MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA
+    1000365000, // IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA
+    1000365001, // SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA
+    1000366000, // BUFFER_COLLECTION_CREATE_INFO_FUCHSIA
+    1000366001, // IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA
+    1000366002, // BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA
+    1000366003, // BUFFER_COLLECTION_PROPERTIES_FUCHSIA
+    1000366004, // BUFFER_CONSTRAINTS_INFO_FUCHSIA
+    1000366005, // BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA
+    1000366006, // IMAGE_CONSTRAINTS_INFO_FUCHSIA
+    1000366007, // IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA
+    1000366008, // SYSMEM_COLOR_SPACE_FUCHSIA
+    1000366009, // BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA
+    1000369000, // SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI
+    1000369001, // PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI
+    1000369002, // PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI
+    1000370000, // PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI
+    1000371000, // MEMORY_GET_REMOTE_ADDRESS_INFO_NV
+    1000371001, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV
+    1000372000, // PIPELINE_PROPERTIES_IDENTIFIER_EXT
+    1000372001, // PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT
+    1000376000, // PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT
+    1000376001, // SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT
+    1000376002, // MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT
+    1000377000, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT
+    1000378000, // SCREEN_SURFACE_CREATE_INFO_QNX
+    1000381000, // PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT
+    1000381001, // PIPELINE_COLOR_WRITE_CREATE_INFO_EXT
+    1000382000, // PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT
+    1000386000, // PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR
+    1000391000, // PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT
+    1000391001, // IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT
+    1000392000, // PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT
+    1000392001, // PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT
+    1000393000, // PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT
+    1000396000, // MICROMAP_BUILD_INFO_EXT
+    1000396001, // MICROMAP_VERSION_INFO_EXT
+    1000396002, // COPY_MICROMAP_INFO_EXT
+    1000396003, // COPY_MICROMAP_TO_MEMORY_INFO_EXT
+    1000396004, // COPY_MEMORY_TO_MICROMAP_INFO_EXT
+    1000396005, // PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT
+    1000396006, // PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT
+    1000396007, // MICROMAP_CREATE_INFO_EXT
+    1000396008, // MICROMAP_BUILD_SIZES_INFO_EXT
+    1000396009, // ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT
+    1000411000, // PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT
+    1000411001, // SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT
+    1000412000, // PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT
+    1000420000, // PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE
+    1000420001, // DESCRIPTOR_SET_BINDING_REFERENCE_VALVE
+    1000420002, // DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE
+    1000422000, // PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT
+    1000430000, // PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV
+    1000437000, // PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT
+    1000440000, // PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM
+    1000440001, // PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM
+    1000440002, // IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM
+    1000455000, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT
+    1000455001, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT
+    1000458000, // PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT
+    1000458001, // RENDER_PASS_CREATION_CONTROL_EXT
+    1000458002, // RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT
+    1000458003, // RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT
+    1000462000, // PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT
+    1000462001, // PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT
+    1000462002, // PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT
+    1000462003, // SHADER_MODULE_IDENTIFIER_EXT
+    1000342000, // PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_EXT
+    1000464000, // PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV
+    1000464001, // PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV
+    1000464002, // OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV
+    1000464003, // OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV
+    1000464004, // OPTICAL_FLOW_SESSION_CREATE_INFO_NV
+    1000464005, // OPTICAL_FLOW_EXECUTE_INFO_NV
+    1000464010, // OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV
+    1000465000, // PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT
+    1000484000, // PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM
+    1000484001, // TILE_PROPERTIES_QCOM
+    1000485000, // PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC
+    1000485001, // AMIGO_PROFILING_SUBMIT_INFO_SEC
+    1000351000, // PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_EXT
+    1000351002, // MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_EXT
+    1000497000, // PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM
+    1000497001, // PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM
+    1000038000, // VIDEO_ENCODE_H264_CAPABILITIES_EXT
+    1000038001, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT
+    1000038002, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT
+    1000038003, // VIDEO_ENCODE_H264_VCL_FRAME_INFO_EXT
+    1000038004, // VIDEO_ENCODE_H264_DPB_SLOT_INFO_EXT
+    1000038005, // VIDEO_ENCODE_H264_NALU_SLICE_INFO_EXT
+    1000038006, // VIDEO_ENCODE_H264_EMIT_PICTURE_PARAMETERS_INFO_EXT
+    1000038007, // VIDEO_ENCODE_H264_PROFILE_INFO_EXT
+    1000038008, // VIDEO_ENCODE_H264_RATE_CONTROL_INFO_EXT
+    1000038009, // VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_EXT
+    1000038010, // VIDEO_ENCODE_H264_REFERENCE_LISTS_INFO_EXT
+    1000039000, // VIDEO_ENCODE_H265_CAPABILITIES_EXT
+    1000039001, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT
+    1000039002, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT
+    1000039003, // VIDEO_ENCODE_H265_VCL_FRAME_INFO_EXT
+    1000039004, // VIDEO_ENCODE_H265_DPB_SLOT_INFO_EXT
+    1000039005, // VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_EXT
+    1000039006, // VIDEO_ENCODE_H265_EMIT_PICTURE_PARAMETERS_INFO_EXT
+    1000039007, // VIDEO_ENCODE_H265_PROFILE_INFO_EXT
+    1000039008, // VIDEO_ENCODE_H265_REFERENCE_LISTS_INFO_EXT
+    1000039009, // VIDEO_ENCODE_H265_RATE_CONTROL_INFO_EXT
+    1000039010, // VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_EXT
+    1000040000, // VIDEO_DECODE_H264_CAPABILITIES_EXT
+    1000040001, // VIDEO_DECODE_H264_PICTURE_INFO_EXT
+    1000040003, // VIDEO_DECODE_H264_PROFILE_INFO_EXT
+    1000040004, // VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT
+    1000040005, // VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT
+    1000040006, // VIDEO_DECODE_H264_DPB_SLOT_INFO_EXT
+    1000187000, // VIDEO_DECODE_H265_CAPABILITIES_EXT
+    1000187001, // VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT
+    1000187002, // VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT
+    1000187003, // VIDEO_DECODE_H265_PROFILE_INFO_EXT
+    1000187004, // VIDEO_DECODE_H265_PICTURE_INFO_EXT
+    1000187005, // VIDEO_DECODE_H265_DPB_SLOT_INFO_EXT
+    1000040000, // VIDEO_DECODE_H264_CAPABILITIES_KHR
+    1000040001, // VIDEO_DECODE_H264_PICTURE_INFO_KHR
+    1000040003, // VIDEO_DECODE_H264_PROFILE_INFO_KHR
+    1000040004, // VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000040005, // VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR
+    1000040006, // VIDEO_DECODE_H264_DPB_SLOT_INFO_KHR
+    1000116007, // PERFORMANCE_QUERY_RESERVATION_INFO_KHR
+    1000187000, // VIDEO_DECODE_H265_CAPABILITIES_KHR
+    1000187001, // VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000187002, // VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR
+    1000187003, // VIDEO_DECODE_H265_PROFILE_INFO_KHR
+    1000187004, // VIDEO_DECODE_H265_PICTURE_INFO_KHR
+    1000187005, // VIDEO_DECODE_H265_DPB_SLOT_INFO_KHR
+    1000308000, // REFRESH_OBJECT_LIST_KHR
+    1000316000, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT
+    1000316001, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT
+    1000316002, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT
+    1000316003, // DESCRIPTOR_ADDRESS_INFO_EXT
+    1000316004, // DESCRIPTOR_GET_INFO_EXT
+    1000316005, // BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    1000316006, // IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    1000316007, // IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    1000316008, // SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    1000316010, // OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT
+    1000316011, // DESCRIPTOR_BUFFER_BINDING_INFO_EXT
+    1000316012, // DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT
+    1000316009, // ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    1000373000, // IMPORT_FENCE_SCI_SYNC_INFO_NV
+    1000373001, // EXPORT_FENCE_SCI_SYNC_INFO_NV
+    1000373002, // FENCE_GET_SCI_SYNC_INFO_NV
+    1000373003, // SCI_SYNC_ATTRIBUTES_INFO_NV
+    1000373004, // IMPORT_SEMAPHORE_SCI_SYNC_INFO_NV
+    1000373005, // EXPORT_SEMAPHORE_SCI_SYNC_INFO_NV
+    1000373006, // SEMAPHORE_GET_SCI_SYNC_INFO_NV
+    1000373007, // PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_FEATURES_NV
+    1000374000, // IMPORT_MEMORY_SCI_BUF_INFO_NV
+    1000374001, // EXPORT_MEMORY_SCI_BUF_INFO_NV
+    1000374002, // MEMORY_GET_SCI_BUF_INFO_NV
+    1000374003, // MEMORY_SCI_BUF_PROPERTIES_NV
+    1000374004, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCI_BUF_FEATURES_NV
+    1000404000, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI
+    1000404001, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI
+    1000415000, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM
+    1000418000, // PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT
+    1000418001, // IMAGE_VIEW_SLICED_CREATE_INFO_EXT
+    1000426000, // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV
+    1000435000, // APPLICATION_PARAMETERS_EXT
+    1000459000, // DIRECT_DRIVER_LOADING_INFO_LUNARG
+    1000459001, // DIRECT_DRIVER_LOADING_LIST_LUNARG
+    1000488000, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM
+    1000489000, // SEMAPHORE_SCI_SYNC_POOL_CREATE_INFO_NV
+    1000489001, // SEMAPHORE_SCI_SYNC_CREATE_INFO_NV
+    1000489002, // PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_2_FEATURES_NV
+    1000489003, // DEVICE_SEMAPHORE_SCI_SYNC_POOL_RESERVATION_CREATE_INFO_NV
+    1000490000, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV
+    1000490001, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV
+    1000498000, // PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT
+    1000510000, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM
+    1000510001, // MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM
+    1000051000, // PRIVATE_VENDOR_INFO_RESERVED_OFFSET_0_NV
+    1000038000, // VIDEO_ENCODE_H264_CAPABILITIES_KHR
+    1000038001, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000038002, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_KHR
+    1000038003, // VIDEO_ENCODE_H264_PICTURE_INFO_KHR
+    1000038004, // VIDEO_ENCODE_H264_DPB_SLOT_INFO_KHR
+    1000038005, // VIDEO_ENCODE_H264_NALU_SLICE_INFO_KHR
+    1000038006, // VIDEO_ENCODE_H264_GOP_REMAINING_FRAME_INFO_KHR
+    1000038007, // VIDEO_ENCODE_H264_PROFILE_INFO_KHR
+    1000038008, // VIDEO_ENCODE_H264_RATE_CONTROL_INFO_KHR
+    1000038009, // VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_KHR
+    1000038010, // VIDEO_ENCODE_H264_SESSION_CREATE_INFO_KHR
+    1000038011, // VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR
+    1000038012, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR
+    1000038013, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    1000039000, // VIDEO_ENCODE_H265_CAPABILITIES_KHR
+    1000039001, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000039002, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_KHR
+    1000039003, // VIDEO_ENCODE_H265_PICTURE_INFO_KHR
+    1000039004, // VIDEO_ENCODE_H265_DPB_SLOT_INFO_KHR
+    1000039005, // VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_KHR
+    1000039006, // VIDEO_ENCODE_H265_GOP_REMAINING_FRAME_INFO_KHR
+    1000039007, // VIDEO_ENCODE_H265_PROFILE_INFO_KHR
+    1000039009, // VIDEO_ENCODE_H265_RATE_CONTROL_INFO_KHR
+    1000039010, // VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_KHR
+    1000039011, // VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR
+    1000039012, // VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR
+    1000039013, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR
+    1000039014, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    1000051000, // PRIVATE_VENDOR_INFO_PLACEHOLDER_OFFSET_0_NV
+    1000110000, // PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG
+    1000134000, // PHYSICAL_DEVICE_SHADER_ENQUEUE_FEATURES_AMDX
+    1000134001, // PHYSICAL_DEVICE_SHADER_ENQUEUE_PROPERTIES_AMDX
+    1000134002, // EXECUTION_GRAPH_PIPELINE_SCRATCH_SIZE_AMDX
+    1000134003, // EXECUTION_GRAPH_PIPELINE_CREATE_INFO_AMDX
+    1000134004, // PIPELINE_SHADER_STAGE_NODE_CREATE_INFO_AMDX
+    1000235000, // PHYSICAL_DEVICE_SHADER_QUAD_CONTROL_FEATURES_KHR
+    1000283000, // PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT
+    1000283001, // DEPTH_BIAS_INFO_EXT
+    1000283002, // DEPTH_BIAS_REPRESENTATION_INFO_EXT
+    1000299005, // QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR
+    1000299006, // PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR
+    1000299007, // VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR
+    1000299008, // VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR
+    1000299009, // VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR
+    1000299010, // VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    1000307000, // CUDA_MODULE_CREATE_INFO_NV
+    1000307001, // CUDA_FUNCTION_CREATE_INFO_NV
+    1000307002, // CUDA_LAUNCH_INFO_NV
+    1000307003, // PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV
+    1000307004, // PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV
+    1000310000, // QUERY_LOW_LATENCY_SUPPORT_NV
+    1000375000, // PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT
+    1000375001, // FRAME_BOUNDARY_EXT
+    1000395000, // PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT
+    1000395001, // PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT
+    1000397000, // PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_FEATURES_NV
+    1000397001, // PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_PROPERTIES_NV
+    1000397002, // ACCELERATION_STRUCTURE_TRIANGLES_DISPLACEMENT_MICROMAP_NV
+    1000404002, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI
+    1000417000, // DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM
+    1000417001, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM
+    1000417002, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM
+    1000424000, // PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM
+    1000424001, // PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM
+    1000424002, // RENDER_PASS_STRIPE_BEGIN_INFO_ARM
+    1000424003, // RENDER_PASS_STRIPE_INFO_ARM
+    1000424004, // RENDER_PASS_STRIPE_SUBMIT_INFO_ARM
+    1000428000, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV
+    1000428001, // COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV
+    1000428002, // PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV
+    1000434000, // PHYSICAL_DEVICE_SHADER_MAXIMAL_RECONVERGENCE_FEATURES_KHR
+    1000451000, // PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT
+    1000451001, // PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT
+    1000453000, // EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT
+    1000468000, // PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID
+    1000468001, // PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID
+    1000468002, // ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID
+    1000481000, // PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR
+    1000482000, // PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT
+    1000482001, // PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT
+    1000482002, // SHADER_CREATE_INFO_EXT
+    1000492000, // PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV
+    1000492001, // PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV
+    1000496000, // LAYER_SETTINGS_CREATE_INFO_EXT
+    1000499000, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT
+    1000505000, // LATENCY_SLEEP_MODE_INFO_NV
+    1000505001, // LATENCY_SLEEP_INFO_NV
+    1000505002, // SET_LATENCY_MARKER_INFO_NV
+    1000505003, // GET_LATENCY_MARKER_INFO_NV
+    1000505004, // LATENCY_TIMINGS_FRAME_REPORT_NV
+    1000505005, // LATENCY_SUBMISSION_PRESENT_ID_NV
+    1000505006, // OUT_OF_BAND_QUEUE_TYPE_INFO_NV
+    1000505007, // SWAPCHAIN_LATENCY_CREATE_INFO_NV
+    1000505008, // LATENCY_SURFACE_CAPABILITIES_NV
+    1000506000, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR
+    1000506001, // COOPERATIVE_MATRIX_PROPERTIES_KHR
+    1000506002, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR
+    1000512000, // VIDEO_DECODE_AV1_CAPABILITIES_KHR
+    1000512001, // VIDEO_DECODE_AV1_PICTURE_INFO_KHR
+    1000512003, // VIDEO_DECODE_AV1_PROFILE_INFO_KHR
+    1000512004, // VIDEO_DECODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000512005, // VIDEO_DECODE_AV1_DPB_SLOT_INFO_KHR
+    1000515000, // PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR
+    1000515001, // VIDEO_INLINE_QUERY_INFO_KHR
+    1000516000, // PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV
+    1000518000, // PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM
+    1000518001, // PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM
+    1000518002, // SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM
+    1000519000, // SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM
+    1000519001, // PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM
+    1000519002, // BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM
+    1000520000, // PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM
+    1000520001, // SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM
+    1000521000, // PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM
+    1000524000, // PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT
+    1000529000, // SCREEN_BUFFER_PROPERTIES_QNX
+    1000529001, // SCREEN_BUFFER_FORMAT_PROPERTIES_QNX
+    1000529002, // IMPORT_SCREEN_BUFFER_INFO_QNX
+    1000529003, // EXTERNAL_FORMAT_QNX
+    1000529004, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX
+    1000530000, // PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT
+    1000184000, // CALIBRATED_TIMESTAMP_INFO_KHR
+    1000545007, // SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT
+    1000545008, // BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT
+    1000546000, // PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV
+    1000272000, // PHYSICAL_DEVICE_MAP_MEMORY_PLACED_FEATURES_EXT
+    1000272001, // PHYSICAL_DEVICE_MAP_MEMORY_PLACED_PROPERTIES_EXT
+    1000272002, // MEMORY_MAP_PLACED_INFO_EXT
+    1000555000, // PHYSICAL_DEVICE_RAW_ACCESS_CHAINS_FEATURES_NV
+    1000563000, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT16_VECTOR_FEATURES_NV
+    1000568000, // PHYSICAL_DEVICE_RAY_TRACING_VALIDATION_FEATURES_NV
+    1000476000, // PHYSICAL_DEVICE_ANTI_LAG_FEATURES_AMD
+    1000476001, // ANTI_LAG_DATA_AMD
+    1000476002, // ANTI_LAG_PRESENTATION_INFO_AMD
+    1000483000, // PHYSICAL_DEVICE_PIPELINE_BINARY_FEATURES_KHR
+    1000483001, // PIPELINE_BINARY_CREATE_INFO_KHR
+    1000483002, // PIPELINE_BINARY_INFO_KHR
+    1000483003, // PIPELINE_BINARY_KEY_KHR
+    1000483004, // PHYSICAL_DEVICE_PIPELINE_BINARY_PROPERTIES_KHR
+    1000483005, // RELEASE_CAPTURED_PIPELINE_DATA_INFO_KHR
+    1000483006, // PIPELINE_BINARY_DATA_INFO_KHR
+    1000483007, // PIPELINE_CREATE_INFO_KHR
+    1000483008, // DEVICE_PIPELINE_BINARY_INTERNAL_CACHE_CONTROL_KHR
+    1000483009, // PIPELINE_BINARY_HANDLES_INFO_KHR
+    1000495000, // PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_FEATURES_EXT
+    1000495001, // PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_PROPERTIES_EXT
+    1000201000, // PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_KHR
+    1000511000, // PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_PROPERTIES_KHR
+    1000558000, // PHYSICAL_DEVICE_SHADER_RELAXED_EXTENDED_INSTRUCTION_FEATURES_KHR
+    1000559000, // PHYSICAL_DEVICE_COMMAND_BUFFER_INHERITANCE_FEATURES_NV
+    1000562000, // PHYSICAL_DEVICE_MAINTENANCE_7_FEATURES_KHR
+    1000562001, // PHYSICAL_DEVICE_MAINTENANCE_7_PROPERTIES_KHR
+    1000562002, // PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_LIST_KHR
+    1000562003, // PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_KHR
+    1000562004, // PHYSICAL_DEVICE_LAYERED_API_VULKAN_PROPERTIES_KHR
+    1000564000, // PHYSICAL_DEVICE_SHADER_REPLICATED_COMPOSITES_FEATURES_EXT
+    1000572000, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_EXT
+    1000572001, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_EXT
+    1000572002, // GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_EXT
+    1000572003, // INDIRECT_EXECUTION_SET_CREATE_INFO_EXT
+    1000572004, // GENERATED_COMMANDS_INFO_EXT
+    1000572006, // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_EXT
+    1000572007, // INDIRECT_COMMANDS_LAYOUT_TOKEN_EXT
+    1000572008, // WRITE_INDIRECT_EXECUTION_SET_PIPELINE_EXT
+    1000572009, // WRITE_INDIRECT_EXECUTION_SET_SHADER_EXT
+    1000572010, // INDIRECT_EXECUTION_SET_PIPELINE_INFO_EXT
+    1000572011, // INDIRECT_EXECUTION_SET_SHADER_INFO_EXT
+    1000572012, // INDIRECT_EXECUTION_SET_SHADER_LAYOUT_INFO_EXT
+    1000572013, // GENERATED_COMMANDS_PIPELINE_INFO_EXT
+    1000572014, // GENERATED_COMMANDS_SHADER_INFO_EXT
+    1000575000, // PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_FEATURES_MESA
+    1000575001, // PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_PROPERTIES_MESA
+    1000575002, // IMAGE_ALIGNMENT_CONTROL_CREATE_INFO_MESA
+    1000582000, // PHYSICAL_DEVICE_DEPTH_CLAMP_CONTROL_FEATURES_EXT
+    1000582001, // PIPELINE_VIEWPORT_DEPTH_CLAMP_CONTROL_CREATE_INFO_EXT
+    55,         // PHYSICAL_DEVICE_VULKAN_1_4_FEATURES
+    56,         // PHYSICAL_DEVICE_VULKAN_1_4_PROPERTIES
+    1000174000, // DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO
+    1000388000, // PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES
+    1000388001, // QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES
+    1000265000, // PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES
+    1000271000, // MEMORY_MAP_INFO
+    1000271001, // MEMORY_UNMAP_INFO
+    1000470000, // PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES
+    1000470001, // PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES
+    1000470004, // DEVICE_IMAGE_SUBRESOURCE_INFO
+    1000338002, // SUBRESOURCE_LAYOUT_2
+    1000338003, // IMAGE_SUBRESOURCE_2
+    1000470006, // BUFFER_USAGE_FLAGS_2_CREATE_INFO
+    1000545000, // PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES
+    1000545001, // PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES
+    1000545002, // BIND_MEMORY_STATUS
+    1000270000, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES
+    1000270001, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES
+    1000270002, // MEMORY_TO_IMAGE_COPY
+    1000270003, // IMAGE_TO_MEMORY_COPY
+    1000270004, // COPY_IMAGE_TO_MEMORY_INFO
+    1000270005, // COPY_MEMORY_TO_IMAGE_INFO
+    1000270006, // HOST_IMAGE_LAYOUT_TRANSITION_INFO
+    1000270007, // COPY_IMAGE_TO_IMAGE_INFO
+    1000270008, // SUBRESOURCE_HOST_MEMCPY_SIZE
+    1000270009, // HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY
+    1000416000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_ROTATE_FEATURES
+    1000528000, // PHYSICAL_DEVICE_SHADER_FLOAT_CONTROLS_2_FEATURES
+    1000544000, // PHYSICAL_DEVICE_SHADER_EXPECT_ASSUME_FEATURES
+    1000470005, // PIPELINE_CREATE_FLAGS_2_CREATE_INFO
+    1000080000, // PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES
+    1000545003, // BIND_DESCRIPTOR_SETS_INFO
+    1000545004, // PUSH_CONSTANTS_INFO
+    1000545005, // PUSH_DESCRIPTOR_SET_INFO
+    1000545006, // PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO
+    1000466000, // PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES
+    1000068000, // PIPELINE_ROBUSTNESS_CREATE_INFO
+    1000068001, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES
+    1000068002, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES
+    1000259000, // PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES
+    1000259001, // PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO
+    1000259002, // PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES
+    1000525000, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES
+    1000190001, // PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO
+    1000190002, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES
+    1000470003, // RENDERING_AREA_INFO
+    1000232000, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_LOCAL_READ_FEATURES
+    1000232001, // RENDERING_ATTACHMENT_LOCATION_INFO
+    1000232002, // RENDERING_INPUT_ATTACHMENT_INDEX_INFO
+    1000029004, // CU_MODULE_TEXTURING_MODE_CREATE_INFO_NVX
+    1000141000, // PHYSICAL_DEVICE_SHADER_BFLOAT16_FEATURES_KHR
+    1000309000, // PHYSICAL_DEVICE_TILE_SHADING_FEATURES_QCOM
+    1000309001, // PHYSICAL_DEVICE_TILE_SHADING_PROPERTIES_QCOM
+    1000309002, // RENDER_PASS_TILE_SHADING_CREATE_INFO_QCOM
+    1000309003, // PER_TILE_BEGIN_INFO_QCOM
+    1000309004, // PER_TILE_END_INFO_QCOM
+    1000309005, // DISPATCH_TILE_INFO_QCOM
+    1000429008, // PHYSICAL_DEVICE_RAY_TRACING_LINEAR_SWEPT_SPHERES_FEATURES_NV
+    1000429009, // ACCELERATION_STRUCTURE_GEOMETRY_LINEAR_SWEPT_SPHERES_DATA_NV
+    1000429010, // ACCELERATION_STRUCTURE_GEOMETRY_SPHERES_DATA_NV
+    1000460000, // TENSOR_CREATE_INFO_ARM
+    1000460001, // TENSOR_VIEW_CREATE_INFO_ARM
+    1000460002, // BIND_TENSOR_MEMORY_INFO_ARM
+    1000460003, // WRITE_DESCRIPTOR_SET_TENSOR_ARM
+    1000460004, // PHYSICAL_DEVICE_TENSOR_PROPERTIES_ARM
+    1000460005, // TENSOR_FORMAT_PROPERTIES_ARM
+    1000460006, // TENSOR_DESCRIPTION_ARM
+    1000460007, // TENSOR_MEMORY_REQUIREMENTS_INFO_ARM
+    1000460008, // TENSOR_MEMORY_BARRIER_ARM
+    1000460009, // PHYSICAL_DEVICE_TENSOR_FEATURES_ARM
+    1000460010, // DEVICE_TENSOR_MEMORY_REQUIREMENTS_ARM
+    1000460011, // COPY_TENSOR_INFO_ARM
+    1000460012, // TENSOR_COPY_ARM
+    1000460013, // TENSOR_DEPENDENCY_INFO_ARM
+    1000460014, // MEMORY_DEDICATED_ALLOCATE_INFO_TENSOR_ARM
+    1000460015, // PHYSICAL_DEVICE_EXTERNAL_TENSOR_INFO_ARM
+    1000460016, // EXTERNAL_TENSOR_PROPERTIES_ARM
+    1000460017, // EXTERNAL_MEMORY_TENSOR_CREATE_INFO_ARM
+    1000460018, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_FEATURES_ARM
+    1000460019, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_PROPERTIES_ARM
+    1000460020, // DESCRIPTOR_GET_TENSOR_INFO_ARM
+    1000460021, // TENSOR_CAPTURE_DESCRIPTOR_DATA_INFO_ARM
+    1000460022, // TENSOR_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_ARM
+    1000460023, // FRAME_BOUNDARY_TENSORS_ARM
+    1000479000, // SURFACE_CAPABILITIES_PRESENT_ID_2_KHR
+    1000479001, // PRESENT_ID_2_KHR
+    1000479002, // PHYSICAL_DEVICE_PRESENT_ID_2_FEATURES_KHR
+    1000480000, // SURFACE_CAPABILITIES_PRESENT_WAIT_2_KHR
+    1000480001, // PHYSICAL_DEVICE_PRESENT_WAIT_2_FEATURES_KHR
+    1000480002, // PRESENT_WAIT_2_INFO_KHR
+    1000491000, // PHYSICAL_DEVICE_COOPERATIVE_VECTOR_FEATURES_NV
+    1000491001, // PHYSICAL_DEVICE_COOPERATIVE_VECTOR_PROPERTIES_NV
+    1000491002, // COOPERATIVE_VECTOR_PROPERTIES_NV
+    1000491004, // CONVERT_COOPERATIVE_VECTOR_MATRIX_INFO_NV
+    1000507000, // DATA_GRAPH_PIPELINE_CREATE_INFO_ARM
+    1000507001, // DATA_GRAPH_PIPELINE_SESSION_CREATE_INFO_ARM
+    1000507002, // DATA_GRAPH_PIPELINE_RESOURCE_INFO_ARM
+    1000507003, // DATA_GRAPH_PIPELINE_CONSTANT_ARM
+    1000507004, // DATA_GRAPH_PIPELINE_SESSION_MEMORY_REQUIREMENTS_INFO_ARM
+    1000507005, // BIND_DATA_GRAPH_PIPELINE_SESSION_MEMORY_INFO_ARM
+    1000507006, // PHYSICAL_DEVICE_DATA_GRAPH_FEATURES_ARM
+    1000507007, // DATA_GRAPH_PIPELINE_SHADER_MODULE_CREATE_INFO_ARM
+    1000507008, // DATA_GRAPH_PIPELINE_PROPERTY_QUERY_RESULT_ARM
+    1000507009, // DATA_GRAPH_PIPELINE_INFO_ARM
+    1000507010, // DATA_GRAPH_PIPELINE_COMPILER_CONTROL_CREATE_INFO_ARM
+    1000507011, // DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENTS_INFO_ARM
+    1000507012, // DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENT_ARM
+    1000507013, // DATA_GRAPH_PIPELINE_IDENTIFIER_CREATE_INFO_ARM
+    1000507014, // DATA_GRAPH_PIPELINE_DISPATCH_INFO_ARM
+    1000507016, // DATA_GRAPH_PROCESSING_ENGINE_CREATE_INFO_ARM
+    1000507017, // QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_PROPERTIES_ARM
+    1000507018, // QUEUE_FAMILY_DATA_GRAPH_PROPERTIES_ARM
+    1000507019, // PHYSICAL_DEVICE_QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_INFO_ARM
+    1000507015, // DATA_GRAPH_PIPELINE_CONSTANT_TENSOR_SEMI_STRUCTURED_SPARSITY_INFO_ARM
+    1000513000, // VIDEO_ENCODE_AV1_CAPABILITIES_KHR
+    1000513001, // VIDEO_ENCODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000513002, // VIDEO_ENCODE_AV1_PICTURE_INFO_KHR
+    1000513003, // VIDEO_ENCODE_AV1_DPB_SLOT_INFO_KHR
+    1000513004, // PHYSICAL_DEVICE_VIDEO_ENCODE_AV1_FEATURES_KHR
+    1000513005, // VIDEO_ENCODE_AV1_PROFILE_INFO_KHR
+    1000513006, // VIDEO_ENCODE_AV1_RATE_CONTROL_INFO_KHR
+    1000513007, // VIDEO_ENCODE_AV1_RATE_CONTROL_LAYER_INFO_KHR
+    1000513008, // VIDEO_ENCODE_AV1_QUALITY_LEVEL_PROPERTIES_KHR
+    1000513009, // VIDEO_ENCODE_AV1_SESSION_CREATE_INFO_KHR
+    1000513010, // VIDEO_ENCODE_AV1_GOP_REMAINING_FRAME_INFO_KHR
+    1000514000, // PHYSICAL_DEVICE_VIDEO_DECODE_VP9_FEATURES_KHR
+    1000514001, // VIDEO_DECODE_VP9_CAPABILITIES_KHR
+    1000514002, // VIDEO_DECODE_VP9_PICTURE_INFO_KHR
+    1000514003, // VIDEO_DECODE_VP9_PROFILE_INFO_KHR
+    1000527000, // PHYSICAL_DEVICE_UNIFIED_IMAGE_LAYOUTS_FEATURES_KHR
+    1000527001, // ATTACHMENT_FEEDBACK_LOOP_INFO_EXT
+    1000547000, // PHYSICAL_DEVICE_TILE_MEMORY_HEAP_FEATURES_QCOM
+    1000547001, // PHYSICAL_DEVICE_TILE_MEMORY_HEAP_PROPERTIES_QCOM
+    1000547002, // TILE_MEMORY_REQUIREMENTS_QCOM
+    1000547003, // TILE_MEMORY_BIND_INFO_QCOM
+    1000547004, // TILE_MEMORY_SIZE_INFO_QCOM
+    1000551000, // DISPLAY_SURFACE_STEREO_CREATE_INFO_NV
+    1000551001, // DISPLAY_MODE_STEREO_PROPERTIES_NV
+    1000553000, // VIDEO_ENCODE_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1000553001, // VIDEO_FORMAT_QUANTIZATION_MAP_PROPERTIES_KHR
+    1000553002, // VIDEO_ENCODE_QUANTIZATION_MAP_INFO_KHR
+    1000553005, // VIDEO_ENCODE_QUANTIZATION_MAP_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1000553009, // PHYSICAL_DEVICE_VIDEO_ENCODE_QUANTIZATION_MAP_FEATURES_KHR
+    1000553003, // VIDEO_ENCODE_H264_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1000553004, // VIDEO_ENCODE_H265_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1000553006, // VIDEO_FORMAT_H265_QUANTIZATION_MAP_PROPERTIES_KHR
+    1000553007, // VIDEO_ENCODE_AV1_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1000553008, // VIDEO_FORMAT_AV1_QUANTIZATION_MAP_PROPERTIES_KHR
+    1000556000, // EXTERNAL_COMPUTE_QUEUE_DEVICE_CREATE_INFO_NV
+    1000556001, // EXTERNAL_COMPUTE_QUEUE_CREATE_INFO_NV
+    1000556002, // EXTERNAL_COMPUTE_QUEUE_DATA_PARAMS_NV
+    1000556003, // PHYSICAL_DEVICE_EXTERNAL_COMPUTE_QUEUE_PROPERTIES_NV
+    1000567000, // PHYSICAL_DEVICE_SHADER_FLOAT8_FEATURES_EXT
+    1000569000, // PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_FEATURES_NV
+    1000569001, // PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_PROPERTIES_NV
+    1000569002, // CLUSTER_ACCELERATION_STRUCTURE_CLUSTERS_BOTTOM_LEVEL_INPUT_NV
+    1000569003, // CLUSTER_ACCELERATION_STRUCTURE_TRIANGLE_CLUSTER_INPUT_NV
+    1000569004, // CLUSTER_ACCELERATION_STRUCTURE_MOVE_OBJECTS_INPUT_NV
+    1000569005, // CLUSTER_ACCELERATION_STRUCTURE_INPUT_INFO_NV
+    1000569006, // CLUSTER_ACCELERATION_STRUCTURE_COMMANDS_INFO_NV
+    1000569007, // RAY_TRACING_PIPELINE_CLUSTER_ACCELERATION_STRUCTURE_CREATE_INFO_NV
+    1000570000, // PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_FEATURES_NV
+    1000570001, // PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_PROPERTIES_NV
+    1000570002, // WRITE_DESCRIPTOR_SET_PARTITIONED_ACCELERATION_STRUCTURE_NV
+    1000570003, // PARTITIONED_ACCELERATION_STRUCTURE_INSTANCES_INPUT_NV
+    1000570004, // BUILD_PARTITIONED_ACCELERATION_STRUCTURE_INFO_NV
+    1000570005, // PARTITIONED_ACCELERATION_STRUCTURE_FLAGS_NV
+    1000574000, // PHYSICAL_DEVICE_MAINTENANCE_8_FEATURES_KHR
+    1000574002, // MEMORY_BARRIER_ACCESS_FLAGS_3_KHR
+    1000584000, // PHYSICAL_DEVICE_MAINTENANCE_9_FEATURES_KHR
+    1000584001, // PHYSICAL_DEVICE_MAINTENANCE_9_PROPERTIES_KHR
+    1000584002, // QUEUE_FAMILY_OWNERSHIP_TRANSFER_PROPERTIES_KHR
+    1000586000, // PHYSICAL_DEVICE_VIDEO_MAINTENANCE_2_FEATURES_KHR
+    1000586001, // VIDEO_DECODE_H264_INLINE_SESSION_PARAMETERS_INFO_KHR
+    1000586002, // VIDEO_DECODE_H265_INLINE_SESSION_PARAMETERS_INFO_KHR
+    1000586003, // VIDEO_DECODE_AV1_INLINE_SESSION_PARAMETERS_INFO_KHR
+    1000590000, // PHYSICAL_DEVICE_HDR_VIVID_FEATURES_HUAWEI
+    1000590001, // HDR_VIVID_DYNAMIC_METADATA_HUAWEI
+    1000593000, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_FEATURES_NV
+    1000593001, // COOPERATIVE_MATRIX_FLEXIBLE_DIMENSIONS_PROPERTIES_NV
+    1000593002, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_PROPERTIES_NV
+    1000596000, // PHYSICAL_DEVICE_PIPELINE_OPACITY_MICROMAP_FEATURES_ARM
+    1000602000, // IMPORT_MEMORY_METAL_HANDLE_INFO_EXT
+    1000602001, // MEMORY_METAL_HANDLE_PROPERTIES_EXT
+    1000602002, // MEMORY_GET_METAL_HANDLE_INFO_EXT
+    1000421000, // PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_KHR
+    1000608000, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_ROBUSTNESS_FEATURES_EXT
+    1000609000, // PHYSICAL_DEVICE_FORMAT_PACK_FEATURES_ARM
+    1000611000, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_FEATURES_VALVE
+    1000611001, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_PROPERTIES_VALVE
+    1000611002, // PIPELINE_FRAGMENT_DENSITY_MAP_LAYERED_CREATE_INFO_VALVE
+    1000286000, // PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_KHR
+    1000286001, // PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_KHR
+    1000613000, // SET_PRESENT_CONFIG_NV
+    1000613001, // PHYSICAL_DEVICE_PRESENT_METERING_FEATURES_NV
+    1000425000, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_EXT
+    1000425001, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_EXT
+    1000425002, // RENDER_PASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_EXT
+    1000620000, // PHYSICAL_DEVICE_ZERO_INITIALIZE_DEVICE_MEMORY_FEATURES_EXT
+    1000587000, // OH_SURFACE_CREATE_INFO_OHOS
+    1000274000, // SURFACE_PRESENT_MODE_KHR
+    1000274001, // SURFACE_PRESENT_SCALING_CAPABILITIES_KHR
+    1000274002, // SURFACE_PRESENT_MODE_COMPATIBILITY_KHR
+    1000275000, // PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_KHR
+    1000275001, // SWAPCHAIN_PRESENT_FENCE_INFO_KHR
+    1000275002, // SWAPCHAIN_PRESENT_MODES_CREATE_INFO_KHR
+    1000275003, // SWAPCHAIN_PRESENT_MODE_INFO_KHR
+    1000275004, // SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_KHR
+    1000275005, // RELEASE_SWAPCHAIN_IMAGES_INFO_KHR
+    1000552000, // VIDEO_ENCODE_INTRA_REFRESH_CAPABILITIES_KHR
+    1000552001, // VIDEO_ENCODE_SESSION_INTRA_REFRESH_CREATE_INFO_KHR
+    1000552002, // VIDEO_ENCODE_INTRA_REFRESH_INFO_KHR
+    1000552003, // VIDEO_REFERENCE_INTRA_REFRESH_INFO_KHR
+    1000552004, // PHYSICAL_DEVICE_VIDEO_ENCODE_INTRA_REFRESH_FEATURES_KHR
+    1000361000, // PHYSICAL_DEVICE_PRESENT_MODE_FIFO_LATEST_READY_FEATURES_KHR
+    1000637000, // PHYSICAL_DEVICE_PIPELINE_CACHE_INCREMENTAL_MODE_FEATURES_SEC
+    1000387000, // PHYSICAL_DEVICE_SHADER_UNTYPED_POINTERS_FEATURES_KHR
+    1000478000, // PHYSICAL_DEVICE_DENSE_GEOMETRY_FORMAT_FEATURES_AMDX
+    1000478001, // ACCELERATION_STRUCTURE_DENSE_GEOMETRY_FORMAT_TRIANGLES_DATA_AMDX
+    1000685000, // SURFACE_CREATE_INFO_OHOS
+    1000390000, // PHYSICAL_DEVICE_VIDEO_ENCODE_RGB_CONVERSION_FEATURES_VALVE
+    1000390001, // VIDEO_ENCODE_RGB_CONVERSION_CAPABILITIES_VALVE
+    1000390002, // VIDEO_ENCODE_PROFILE_RGB_CONVERSION_INFO_VALVE
+    1000390003, // VIDEO_ENCODE_SESSION_RGB_CONVERSION_CREATE_INFO_VALVE
+    1000549000, // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_KHR
+    1000426001, // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_KHR
+    1000549002, // COPY_MEMORY_INDIRECT_INFO_KHR
+    1000549003, // COPY_MEMORY_TO_IMAGE_INDIRECT_INFO_KHR
+    1000579000, // PHYSICAL_DEVICE_SHADER_FMA_FEATURES_KHR
+    1000427000, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_EXT
+    1000427001, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_EXT
+    1000550002, // DECOMPRESS_MEMORY_INFO_EXT
+    1000453001, // NATIVE_BUFFER_OHOS
+    1000453002, // SWAPCHAIN_IMAGE_CREATE_INFO_OHOS
+    1000453003, // PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_OHOS
+    1000627000, // PHYSICAL_DEVICE_SHADER_64_BIT_INDEXING_FEATURES_EXT
+    1000630000, // PHYSICAL_DEVICE_MAINTENANCE_10_FEATURES_KHR
+    1000630001, // PHYSICAL_DEVICE_MAINTENANCE_10_PROPERTIES_KHR
+    1000630002, // RENDERING_ATTACHMENT_FLAGS_INFO_KHR
+    1000619003, // RENDERING_END_INFO_KHR
+    1000630004, // RESOLVE_IMAGE_MODE_INFO_KHR
+    1000642000, // PHYSICAL_DEVICE_SHADER_UNIFORM_BUFFER_UNSIZED_ARRAY_FEATURES_EXT
+    1000452000, // NATIVE_BUFFER_USAGE_OHOS
+    1000452001, // NATIVE_BUFFER_PROPERTIES_OHOS
+    1000452002, // NATIVE_BUFFER_FORMAT_PROPERTIES_OHOS
+    1000452003, // IMPORT_NATIVE_BUFFER_INFO_OHOS
+    1000452004, // MEMORY_GET_NATIVE_BUFFER_INFO_OHOS
+    1000452005, // EXTERNAL_FORMAT_OHOS
+    1000605000, // PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_FEATURES_ARM
+    1000605001, // PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_PROPERTIES_ARM
+    1000605002, // PERFORMANCE_COUNTER_ARM
+    1000605003, // PERFORMANCE_COUNTER_DESCRIPTION_ARM
+    1000605004, // RENDER_PASS_PERFORMANCE_COUNTERS_BY_REGION_BEGIN_INFO_ARM
+    1000629000, // PHYSICAL_DEVICE_DATA_GRAPH_MODEL_FEATURES_QCOM
+    1000629001, // DATA_GRAPH_PIPELINE_BUILTIN_MODEL_CREATE_INFO_QCOM
+    1000581000, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_EXT
+    1000581001, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_EXT
+    1000628000, // PHYSICAL_DEVICE_CUSTOM_RESOLVE_FEATURES_EXT
+    1000628001, // BEGIN_CUSTOM_RESOLVE_INFO_EXT
+    1000628002, // CUSTOM_RESOLVE_CREATE_INFO_EXT
+    1000208000, // PHYSICAL_DEVICE_PRESENT_TIMING_FEATURES_EXT
+    1000208001, // SWAPCHAIN_TIMING_PROPERTIES_EXT
+    1000208002, // SWAPCHAIN_TIME_DOMAIN_PROPERTIES_EXT
+    1000208003, // PRESENT_TIMINGS_INFO_EXT
+    1000208004, // PRESENT_TIMING_INFO_EXT
+    1000208005, // PAST_PRESENTATION_TIMING_INFO_EXT
+    1000208006, // PAST_PRESENTATION_TIMING_PROPERTIES_EXT
+    1000208007, // PAST_PRESENTATION_TIMING_EXT
+    1000208008, // PRESENT_TIMING_SURFACE_CAPABILITIES_EXT
+    1000208009, // SWAPCHAIN_CALIBRATED_TIMESTAMP_INFO_EXT
+    1000645000, // COMPUTE_OCCUPANCY_PRIORITY_PARAMETERS_NV
+    1000645001, // PHYSICAL_DEVICE_COMPUTE_OCCUPANCY_PRIORITY_FEATURES_NV
+    1000288000, // PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_3D_FEATURES_EXT
+    1000635000, // PHYSICAL_DEVICE_SHADER_LONG_VECTOR_FEATURES_EXT
+    1000635001, // PHYSICAL_DEVICE_SHADER_LONG_VECTOR_PROPERTIES_EXT
+    1000135000, // TEXEL_BUFFER_DESCRIPTOR_INFO_EXT
+    1000135001, // IMAGE_DESCRIPTOR_INFO_EXT
+    1000135002, // RESOURCE_DESCRIPTOR_INFO_EXT
+    1000135003, // BIND_HEAP_INFO_EXT
+    1000135004, // PUSH_DATA_INFO_EXT
+    1000135005, // DESCRIPTOR_SET_AND_BINDING_MAPPING_EXT
+    1000135006, // SHADER_DESCRIPTOR_SET_AND_BINDING_MAPPING_INFO_EXT
+    1000135007, // OPAQUE_CAPTURE_DATA_CREATE_INFO_EXT
+    1000135008, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_PROPERTIES_EXT
+    1000135009, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_FEATURES_EXT
+    1000135010, // COMMAND_BUFFER_INHERITANCE_DESCRIPTOR_HEAP_INFO_EXT
+    1000135011, // SAMPLER_CUSTOM_BORDER_COLOR_INDEX_CREATE_INFO_EXT
+    1000135012, // INDIRECT_COMMANDS_LAYOUT_PUSH_DATA_TOKEN_NV
+    1000135013, // SUBSAMPLED_IMAGE_FORMAT_PROPERTIES_EXT
+    1000135014, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_TENSOR_PROPERTIES_ARM
+    1000504000, // PHYSICAL_DEVICE_INTERNALLY_SYNCHRONIZED_QUEUES_FEATURES_KHR
+    1000580000, // PUSH_CONSTANT_BANK_INFO_NV
+    1000580001, // PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_FEATURES_NV
+    1000580002, // PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_PROPERTIES_NV
+    1000662000, // PHYSICAL_DEVICE_SHADER_SUBGROUP_PARTITIONED_FEATURES_EXT
+    1000172000, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_CONVERSION_FEATURES_QCOM
+    1000664000, // UBM_SURFACE_CREATE_INFO_SEC
+    1000673000, // PHYSICAL_DEVICE_SHADER_MIXED_FLOAT_DOT_PRODUCT_FEATURES_VALVE
+    1000607000, // PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_FEATURES_ARM
+    1000607001, // PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_PROPERTIES_ARM
+    1000607002, // SHADER_INSTRUMENTATION_CREATE_INFO_ARM
+    1000607003, // SHADER_INSTRUMENTATION_METRIC_DESCRIPTION_ARM
+    1000318000, // DEVICE_MEMORY_COPY_KHR
+    1000318001, // COPY_DEVICE_MEMORY_INFO_KHR
+    1000318002, // DEVICE_MEMORY_IMAGE_COPY_KHR
+    1000318003, // COPY_DEVICE_MEMORY_IMAGE_INFO_KHR
+    1000318004, // MEMORY_RANGE_BARRIERS_INFO_KHR
+    1000318005, // MEMORY_RANGE_BARRIER_KHR
+    1000318006, // PHYSICAL_DEVICE_DEVICE_ADDRESS_COMMANDS_FEATURES_KHR
+    1000318007, // BIND_INDEX_BUFFER_3_INFO_KHR
+    1000318008, // BIND_VERTEX_BUFFER_3_INFO_KHR
+    1000318009, // DRAW_INDIRECT_2_INFO_KHR
+    1000318010, // DRAW_INDIRECT_COUNT_2_INFO_KHR
+    1000318011, // DISPATCH_INDIRECT_2_INFO_KHR
+    1000318012, // CONDITIONAL_RENDERING_BEGIN_INFO_2_EXT
+    1000318013, // BIND_TRANSFORM_FEEDBACK_BUFFER_2_INFO_EXT
+    1000318014, // MEMORY_MARKER_INFO_AMD
+    1000318015, // ACCELERATION_STRUCTURE_CREATE_INFO_2_KHR
+    1000231000, // PHYSICAL_DEVICE_SHADER_CONSTANT_DATA_FEATURES_KHR
+    1000233000, // PHYSICAL_DEVICE_SHADER_ABORT_FEATURES_KHR
+    1000233001, // DEVICE_FAULT_SHADER_ABORT_MESSAGE_INFO_KHR
+    1000233002, // PHYSICAL_DEVICE_SHADER_ABORT_PROPERTIES_KHR
+    1000573000, // PHYSICAL_DEVICE_FAULT_FEATURES_KHR
+    1000573001, // PHYSICAL_DEVICE_FAULT_PROPERTIES_KHR
+    1000573002, // DEVICE_FAULT_INFO_KHR
+    1000573003, // DEVICE_FAULT_DEBUG_INFO_KHR
+    1000302000, // PERF_HINT_INFO_QCOM
+    1000302001, // PHYSICAL_DEVICE_QUEUE_PERF_HINT_FEATURES_QCOM
+    1000302002, // PHYSICAL_DEVICE_QUEUE_PERF_HINT_PROPERTIES_QCOM
+    1000417003, // DISPATCH_PARAMETERS_ARM
+    1000417004, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_DISPATCH_PARAMETERS_PROPERTIES_ARM
+    1000508000, // QUEUE_FAMILY_DATA_GRAPH_TOSA_PROPERTIES_ARM
+    1000678000, // PHYSICAL_DEVICE_PRIMITIVE_RESTART_INDEX_FEATURES_EXT
+    1000631000, // PHYSICAL_DEVICE_DATA_GRAPH_OPTICAL_FLOW_FEATURES_ARM
+    1000631001, // QUEUE_FAMILY_DATA_GRAPH_OPTICAL_FLOW_PROPERTIES_ARM
+    1000631003, // DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_INFO_ARM
+    1000631004, // DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_ARM
+    1000631005, // DATA_GRAPH_PIPELINE_OPTICAL_FLOW_DISPATCH_INFO_ARM
+    1000631002, // DATA_GRAPH_PIPELINE_OPTICAL_FLOW_CREATE_INFO_ARM
+    1000631006, // DATA_GRAPH_PIPELINE_RESOURCE_INFO_IMAGE_LAYOUT_ARM
+    1000631007, // DATA_GRAPH_PIPELINE_SINGLE_NODE_CREATE_INFO_ARM
+    1000631008, // DATA_GRAPH_PIPELINE_SINGLE_NODE_CONNECTION_ARM
+    1000657000, // PHYSICAL_DEVICE_MAINTENANCE_11_FEATURES_KHR
+    1000657001, // QUEUE_FAMILY_OPTIMAL_IMAGE_TRANSFER_GRANULARITY_PROPERTIES_KHR
+    1000674000, // PHYSICAL_DEVICE_THROTTLE_HINT_FEATURES_SEC
+    1000674001, // THROTTLE_HINT_SUBMIT_INFO_SEC
+    1000676000, // DATA_GRAPH_PIPELINE_NEURAL_STATISTICS_CREATE_INFO_ARM
+    1000676001, // DATA_GRAPH_PIPELINE_SESSION_NEURAL_STATISTICS_CREATE_INFO_ARM
+    1000676002, // PHYSICAL_DEVICE_DATA_GRAPH_NEURAL_ACCELERATOR_STATISTICS_FEATURES_ARM
+    1000133000, // PHYSICAL_DEVICE_GPA_FEATURES_AMD
+    1000133001, // PHYSICAL_DEVICE_GPA_PROPERTIES_AMD
+    1000133002, // GPA_SAMPLE_BEGIN_INFO_AMD
+    1000133003, // GPA_SESSION_CREATE_INFO_AMD
+    1000133004, // GPA_DEVICE_CLOCK_MODE_INFO_AMD
+    1000133005, // PHYSICAL_DEVICE_GPA_PROPERTIES_2_AMD
+    1000133006, // GPA_DEVICE_GET_CLOCK_INFO_AMD
+    1000173000, // PHYSICAL_DEVICE_ELAPSED_TIMER_QUERY_FEATURES_QCOM
+    1000303000, // PHYSICAL_DEVICE_IMAGE_PROCESSING_3_FEATURES_QCOM
+    1000304000, // PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_FEATURES_QCOM
+    1000304001, // PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_PROPERTIES_QCOM
+    1000305000, // PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_FEATURES_EXT
+    1000305001, // PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_PROPERTIES_EXT
+    1000623000, // PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_KHR
+    1000623001, // PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_KHR
+    1000623002, // ACCELERATION_STRUCTURE_GEOMETRY_MICROMAP_DATA_KHR
+    1000623003, // ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_KHR
+    1000689000, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_DECODE_VECTOR_FEATURES_NV
+    1000598000, // PHYSICAL_DEVICE_VIDEO_ENCODE_FEEDBACK_2_FEATURES_KHR
+    1000598001, // VIDEO_ENCODE_FEEDBACK_2_CAPABILITIES_KHR
+    1000598002, // QUERY_POOL_VIDEO_ENCODE_PER_PARTITION_FEEDBACK_CREATE_INFO_KHR
+    1000616000, // PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SWAPCHAIN_FEATURES_EXT
+    1000616001, // SWAPCHAIN_FLAGS_SURFACE_CAPABILITIES_EXT
+    1000668000, // FORMAT_PROPERTIES_4_KHR
+    1000668001, // IMAGE_CREATE_FLAGS_2_CREATE_INFO_KHR
+    1000668002, // IMAGE_USAGE_FLAGS_2_CREATE_INFO_KHR
+    1000668003, // IMAGE_VIEW_USAGE_2_CREATE_INFO_KHR
+    1000668004, // PHYSICAL_DEVICE_EXTENDED_FLAGS_FEATURES_KHR
+    1000668005, // IMAGE_STENCIL_USAGE_2_CREATE_INFO_KHR
+    1000668006, // SHARED_PRESENT_SURFACE_CAPABILITIES_2_KHR
+    1000565000, // TENSOR_EXPLICIT_TILING_FORMAT_PROPERTIES_ARM
+    1000565001, // TENSOR_ROLLING_BACKING_CREATE_INFO_ARM
+    1000672000, // PHYSICAL_DEVICE_SHADER_OCP_MICROSCALING_TYPES_FEATURES_EXT
+};
+
+static uint16_t const VkStructureTypeValueIndices[57] = {
+    260,  // APPLICATION_INFO
+    261,  // INSTANCE_CREATE_INFO
+    262,  // DEVICE_QUEUE_CREATE_INFO
+    263,  // DEVICE_CREATE_INFO
+    264,  // SUBMIT_INFO
+    265,  // MEMORY_ALLOCATE_INFO
+    266,  // MAPPED_MEMORY_RANGE
+    267,  // BIND_SPARSE_INFO
+    268,  // FENCE_CREATE_INFO
+    269,  // SEMAPHORE_CREATE_INFO
+    270,  // EVENT_CREATE_INFO
+    271,  // QUERY_POOL_CREATE_INFO
+    272,  // BUFFER_CREATE_INFO
+    273,  // BUFFER_VIEW_CREATE_INFO
+    274,  // IMAGE_CREATE_INFO
+    275,  // IMAGE_VIEW_CREATE_INFO
+    276,  // SHADER_MODULE_CREATE_INFO
+    277,  // PIPELINE_CACHE_CREATE_INFO
+    278,  // PIPELINE_SHADER_STAGE_CREATE_INFO
+    279,  // PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO
+    280,  // PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO
+    281,  // PIPELINE_TESSELLATION_STATE_CREATE_INFO
+    282,  // PIPELINE_VIEWPORT_STATE_CREATE_INFO
+    283,  // PIPELINE_RASTERIZATION_STATE_CREATE_INFO
+    284,  // PIPELINE_MULTISAMPLE_STATE_CREATE_INFO
+    285,  // PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO
+    286,  // PIPELINE_COLOR_BLEND_STATE_CREATE_INFO
+    287,  // PIPELINE_DYNAMIC_STATE_CREATE_INFO
+    288,  // GRAPHICS_PIPELINE_CREATE_INFO
+    289,  // COMPUTE_PIPELINE_CREATE_INFO
+    290,  // PIPELINE_LAYOUT_CREATE_INFO
+    291,  // SAMPLER_CREATE_INFO
+    292,  // DESCRIPTOR_SET_LAYOUT_CREATE_INFO
+    293,  // DESCRIPTOR_POOL_CREATE_INFO
+    294,  // DESCRIPTOR_SET_ALLOCATE_INFO
+    295,  // WRITE_DESCRIPTOR_SET
+    296,  // COPY_DESCRIPTOR_SET
+    297,  // FRAMEBUFFER_CREATE_INFO
+    298,  // RENDER_PASS_CREATE_INFO
+    299,  // COMMAND_POOL_CREATE_INFO
+    300,  // COMMAND_BUFFER_ALLOCATE_INFO
+    301,  // COMMAND_BUFFER_INHERITANCE_INFO
+    302,  // COMMAND_BUFFER_BEGIN_INFO
+    303,  // RENDER_PASS_BEGIN_INFO
+    304,  // BUFFER_MEMORY_BARRIER
+    305,  // IMAGE_MEMORY_BARRIER
+    306,  // MEMORY_BARRIER
+    307,  // LOADER_INSTANCE_CREATE_INFO
+    308,  // LOADER_DEVICE_CREATE_INFO
+    375,  // PHYSICAL_DEVICE_VULKAN_1_1_FEATURES
+    376,  // PHYSICAL_DEVICE_VULKAN_1_1_PROPERTIES
+    377,  // PHYSICAL_DEVICE_VULKAN_1_2_FEATURES
+    378,  // PHYSICAL_DEVICE_VULKAN_1_2_PROPERTIES
+    689,  // PHYSICAL_DEVICE_VULKAN_1_3_FEATURES
+    690,  // PHYSICAL_DEVICE_VULKAN_1_3_PROPERTIES
+    1198, // PHYSICAL_DEVICE_VULKAN_1_4_FEATURES
+    1199, // PHYSICAL_DEVICE_VULKAN_1_4_PROPERTIES
+};
+
+static uint16_t const VkStructureTypeExtensionBlocks[1974] = {
+    691,  // extension 1
+    691,  // extension 2
+    693,  // extension 3
+    695,  // extension 4
+    696,  // extension 5
+    697,  // extension 6
+    698,  // extension 7
+    699,  // extension 8
+    700,  // extension 9
+    701,  // extension 10
+    702,  // extension 11
+    705,  // extension 12
+    706,  // extension 13
+    706,  // extension 14
+    706,  // extension 15
+    706,  // extension 16
+    706,  // extension 17
+    706,  // extension 18
+    706,  // extension 19
+    707,  // extension 20
+    707,  // extension 21
+    707,  // extension 22
+    707,  // extension 23
+    710,  // extension 24
+    727,  // extension 25
+    730,  // extension 26
+    730,  // extension 27
+    733,  // extension 28
+    733,  // extension 29
+    736,  // extension 30
+    741,  // extension 31
+    743,  // extension 32
+    743,  // extension 33
+    743,  // extension 34
+    743,  // extension 35
+    743,  // extension 36
+    743,  // extension 37
+    743,  // extension 38
+    743,  // extension 39
+    757,  // extension 40
+    772,  // extension 41
+    779,  // extension 42
+    780,  // extension 43
+    780,  // extension 44
+    780,  // extension 45
+    790,  // extension 46
+    790,  // extension 47
+    790,  // extension 48
+    790,  // extension 49
+    790,  // extension 50
+    791,  // extension 51
+    792,  // extension 52
+    793,  // extension 53
+    793,  // extension 54
+    796,  // extension 55
+    796,  // extension 56
+    796,  // extension 57
+    798,  // extension 58
+    800,  // extension 59
+    801,  // extension 60
+    810,  // extension 61
+    825,  // extension 62
+    826,  // extension 63
+    827,  // extension 64
+    828,  // extension 65
+    828,  // extension 66
+    828,  // extension 67
+    829,  // extension 68
+    831,  // extension 69
+    834,  // extension 70
+    834,  // extension 71
+    836,  // extension 72
+    841,  // extension 73
+    844,  // extension 74
+    848,  // extension 75
+    851,  // extension 76
+    852,  // extension 77
+    854,  // extension 78
+    855,  // extension 79
+    859,  // extension 80
+    861,  // extension 81
+    862,  // extension 82
+    865,  // extension 83
+    866,  // extension 84
+    867,  // extension 85
+    868,  // extension 86
+    869,  // extension 87
+    875,  // extension 88
+    876,  // extension 89
+    876,  // extension 90
+    876,  // extension 91
+    877,  // extension 92
+    881,  // extension 93
+    882,  // extension 94
+    882,  // extension 95
+    883,  // extension 96
+    883,  // extension 97
+    883,  // extension 98
+    884,  // extension 99
+    885,  // extension 100
+    887,  // extension 101
+    887,  // extension 102
+    889,  // extension 103
+    891,  // extension 104
+    891,  // extension 105
+    891,  // extension 106
+    892,  // extension 107
+    892,  // extension 108
+    892,  // extension 109
+    896,  // extension 110
+    903,  // extension 111
+    904,  // extension 112
+    905,  // extension 113
+    907,  // extension 114
+    908,  // extension 115
+    911,  // extension 116
+    913,  // extension 117
+    921,  // extension 118
+    925,  // extension 119
+    925,  // extension 120
+    928,  // extension 121
+    929,  // extension 122
+    934,  // extension 123
+    935,  // extension 124
+    936,  // extension 125
+    936,  // extension 126
+    936,  // extension 127
+    936,  // extension 128
+    938,  // extension 129
+    943,  // extension 130
+    950,  // extension 131
+    952,  // extension 132
+    952,  // extension 133
+    952,  // extension 134
+    959,  // extension 135
+    964,  // extension 136
+    979,  // extension 137
+    979,  // extension 138
+    979,  // extension 139
+    983,  // extension 140
+    983,  // extension 141
+    983,  // extension 142
+    984,  // extension 143
+    984,  // extension 144
+    989,  // extension 145
+    989,  // extension 146
+    993,  // extension 147
+    998,  // extension 148
+    999,  // extension 149
+    1002, // extension 150
+    1003, // extension 151
+    1024, // extension 152
+    1024, // extension 153
+    1025, // extension 154
+    1025, // extension 155
+    1027, // extension 156
+    1027, // extension 157
+    1033, // extension 158
+    1035, // extension 159
+    1042, // extension 160
+    1042, // extension 161
+    1044, // extension 162
+    1049, // extension 163
+    1049, // extension 164
+    1051, // extension 165
+    1057, // extension 166
+    1070, // extension 167
+    1072, // extension 168
+    1072, // extension 169
+    1074, // extension 170
+    1074, // extension 171
+    1076, // extension 172
+    1076, // extension 173
+    1077, // extension 174
+    1078, // extension 175
+    1079, // extension 176
+    1080, // extension 177
+    1080, // extension 178
+    1081, // extension 179
+    1084, // extension 180
+    1084, // extension 181
+    1085, // extension 182
+    1086, // extension 183
+    1086, // extension 184
+    1087, // extension 185
+    1088, // extension 186
+    1089, // extension 187
+    1089, // extension 188
+    1095, // extension 189
+    1095, // extension 190
+    1096, // extension 191
+    1099, // extension 192
+    1100, // extension 193
+    1101, // extension 194
+    1101, // extension 195
+    1101, // extension 196
+    1101, // extension 197
+    1102, // extension 198
+    1103, // extension 199
+    1103, // extension 200
+    1105, // extension 201
+    1105, // extension 202
+    1106, // extension 203
+    1108, // extension 204
+    1109, // extension 205
+    1110, // extension 206
+    1113, // extension 207
+    1115, // extension 208
+    1121, // extension 209
+    1131, // extension 210
+    1132, // extension 211
+    1138, // extension 212
+    1139, // extension 213
+    1140, // extension 214
+    1142, // extension 215
+    1143, // extension 216
+    1144, // extension 217
+    1144, // extension 218
+    1145, // extension 219
+    1148, // extension 220
+    1148, // extension 221
+    1148, // extension 222
+    1149, // extension 223
+    1149, // extension 224
+    1149, // extension 225
+    1149, // extension 226
+    1152, // extension 227
+    1157, // extension 228
+    1158, // extension 229
+    1158, // extension 230
+    1159, // extension 231
+    1159, // extension 232
+    1160, // extension 233
+    1163, // extension 234
+    1166, // extension 235
+    1167, // extension 236
+    1168, // extension 237
+    1168, // extension 238
+    1169, // extension 239
+    1171, // extension 240
+    1172, // extension 241
+    1173, // extension 242
+    1176, // extension 243
+    1176, // extension 244
+    1176, // extension 245
+    1179, // extension 246
+    1180, // extension 247
+    1181, // extension 248
+    1182, // extension 249
+    1183, // extension 250
+    1186, // extension 251
+    1189, // extension 252
+    1190, // extension 253
+    1191, // extension 254
+    1192, // extension 255
+    1195, // extension 256
+    1198, // extension 257
+    1199, // extension 258
+    1204, // extension 259
+    1204, // extension 260
+    1207, // extension 261
+    1208, // extension 262
+    1209, // extension 263
+    1209, // extension 264
+    1209, // extension 265
+    1209, // extension 266
+    1210, // extension 267
+    1210, // extension 268
+    1211, // extension 269
+    1212, // extension 270
+    1218, // extension 271
+    1228, // extension 272
+    1230, // extension 273
+    1233, // extension 274
+    1234, // extension 275
+    1237, // extension 276
+    1243, // extension 277
+    1244, // extension 278
+    1252, // extension 279
+    1254, // extension 280
+    1254, // extension 281
+    1256, // extension 282
+    1258, // extension 283
+    1260, // extension 284
+    1263, // extension 285
+    1266, // extension 286
+    1266, // extension 287
+    1268, // extension 288
+    1271, // extension 289
+    1272, // extension 290
+    1272, // extension 291
+    1273, // extension 292
+    1273, // extension 293
+    1276, // extension 294
+    1276, // extension 295
+    1278, // extension 296
+    1281, // extension 297
+    1281, // extension 298
+    1282, // extension 299
+    1282, // extension 300
+    1293, // extension 301
+    1295, // extension 302
+    1295, // extension 303
+    1298, // extension 304
+    1299, // extension 305
+    1301, // extension 306
+    1303, // extension 307
+    1303, // extension 308
+    1308, // extension 309
+    1309, // extension 310
+    1315, // extension 311
+    1316, // extension 312
+    1328, // extension 313
+    1328, // extension 314
+    1328, // extension 315
+    1338, // extension 316
+    1338, // extension 317
+    1351, // extension 318
+    1351, // extension 319
+    1367, // extension 320
+    1367, // extension 321
+    1370, // extension 322
+    1371, // extension 323
+    1372, // extension 324
+    1373, // extension 325
+    1373, // extension 326
+    1374, // extension 327
+    1377, // extension 328
+    1380, // extension 329
+    1382, // extension 330
+    1382, // extension 331
+    1383, // extension 332
+    1383, // extension 333
+    1385, // extension 334
+    1386, // extension 335
+    1386, // extension 336
+    1387, // extension 337
+    1388, // extension 338
+    1399, // extension 339
+    1404, // extension 340
+    1405, // extension 341
+    1406, // extension 342
+    1409, // extension 343
+    1410, // extension 344
+    1410, // extension 345
+    1411, // extension 346
+    1411, // extension 347
+    1412, // extension 348
+    1414, // extension 349
+    1428, // extension 350
+    1428, // extension 351
+    1428, // extension 352
+    1431, // extension 353
+    1434, // extension 354
+    1435, // extension 355
+    1437, // extension 356
+    1439, // extension 357
+    1440, // extension 358
+    1440, // extension 359
+    1440, // extension 360
+    1440, // extension 361
+    1441, // extension 362
+    1442, // extension 363
+    1442, // extension 364
+    1442, // extension 365
+    1445, // extension 366
+    1447, // extension 367
+    1457, // extension 368
+    1457, // extension 369
+    1457, // extension 370
+    1460, // extension 371
+    1461, // extension 372
+    1463, // extension 373
+    1465, // extension 374
+    1473, // extension 375
+    1478, // extension 376
+    1480, // extension 377
+    1483, // extension 378
+    1484, // extension 379
+    1485, // extension 380
+    1485, // extension 381
+    1485, // extension 382
+    1487, // extension 383
+    1488, // extension 384
+    1488, // extension 385
+    1488, // extension 386
+    1488, // extension 387
+    1489, // extension 388
+    1490, // extension 389
+    1492, // extension 390
+    1492, // extension 391
+    1496, // extension 392
+    1498, // extension 393
+    1500, // extension 394
+    1501, // extension 395
+    1501, // extension 396
+    1503, // extension 397
+    1513, // extension 398
+    1516, // extension 399
+    1516, // extension 400
+    1516, // extension 401
+    1516, // extension 402
+    1516, // extension 403
+    1516, // extension 404
+    1516, // extension 405
+    1519, // extension 406
+    1519, // extension 407
+    1519, // extension 408
+    1519, // extension 409
+    1519, // extension 410
+    1519, // extension 411
+    1519, // extension 412
+    1521, // extension 413
+    1522, // extension 414
+    1526, // extension 415
+    1526, // extension 416
+    1527, // extension 417
+    1528, // extension 418
+    1533, // extension 419
+    1535, // extension 420
+    1535, // extension 421
+    1538, // extension 422
+    1539, // extension 423
+    1540, // extension 424
+    1540, // extension 425
+    1545, // extension 426
+    1548, // extension 427
+    1550, // extension 428
+    1552, // extension 429
+    1555, // extension 430
+    1566, // extension 431
+    1567, // extension 432
+    1567, // extension 433
+    1567, // extension 434
+    1567, // extension 435
+    1568, // extension 436
+    1569, // extension 437
+    1569, // extension 438
+    1570, // extension 439
+    1570, // extension 440
+    1570, // extension 441
+    1573, // extension 442
+    1573, // extension 443
+    1573, // extension 444
+    1573, // extension 445
+    1573, // extension 446
+    1573, // extension 447
+    1573, // extension 448
+    1573, // extension 449
+    1573, // extension 450
+    1573, // extension 451
+    1573, // extension 452
+    1575, // extension 453
+    1581, // extension 454
+    1585, // extension 455
+    1585, // extension 456
+    1587, // extension 457
+    1587, // extension 458
+    1587, // extension 459
+    1591, // extension 460
+    1593, // extension 461
+    1617, // extension 462
+    1617, // extension 463
+    1621, // extension 464
+    1621, // extension 465
+    1632, // extension 466
+    1633, // extension 467
+    1634, // extension 468
+    1634, // extension 469
+    1637, // extension 470
+    1637, // extension 471
+    1644, // extension 472
+    1644, // extension 473
+    1644, // extension 474
+    1644, // extension 475
+    1644, // extension 476
+    1644, // extension 477
+    1647, // extension 478
+    1647, // extension 479
+    1649, // extension 480
+    1652, // extension 481
+    1655, // extension 482
+    1656, // extension 483
+    1659, // extension 484
+    1669, // extension 485
+    1671, // extension 486
+    1673, // extension 487
+    1673, // extension 488
+    1673, // extension 489
+    1674, // extension 490
+    1678, // extension 491
+    1680, // extension 492
+    1685, // extension 493
+    1687, // extension 494
+    1687, // extension 495
+    1687, // extension 496
+    1689, // extension 497
+    1690, // extension 498
+    1692, // extension 499
+    1693, // extension 500
+    1694, // extension 501
+    1694, // extension 502
+    1694, // extension 503
+    1694, // extension 504
+    1694, // extension 505
+    1695, // extension 506
+    1704, // extension 507
+    1707, // extension 508
+    1727, // extension 509
+    1728, // extension 510
+    1728, // extension 511
+    1730, // extension 512
+    1731, // extension 513
+    1737, // extension 514
+    1748, // extension 515
+    1752, // extension 516
+    1754, // extension 517
+    1755, // extension 518
+    1755, // extension 519
+    1758, // extension 520
+    1761, // extension 521
+    1763, // extension 522
+    1764, // extension 523
+    1764, // extension 524
+    1764, // extension 525
+    1765, // extension 526
+    1766, // extension 527
+    1766, // extension 528
+    1768, // extension 529
+    1769, // extension 530
+    1774, // extension 531
+    1775, // extension 532
+    1775, // extension 533
+    1775, // extension 534
+    1775, // extension 535
+    1775, // extension 536
+    1775, // extension 537
+    1775, // extension 538
+    1775, // extension 539
+    1775, // extension 540
+    1775, // extension 541
+    1775, // extension 542
+    1775, // extension 543
+    1775, // extension 544
+    1775, // extension 545
+    1776, // extension 546
+    1785, // extension 547
+    1786, // extension 548
+    1791, // extension 549
+    1791, // extension 550
+    1795, // extension 551
+    1798, // extension 552
+    1800, // extension 553
+    1805, // extension 554
+    1815, // extension 555
+    1815, // extension 556
+    1816, // extension 557
+    1820, // extension 558
+    1820, // extension 559
+    1821, // extension 560
+    1822, // extension 561
+    1822, // extension 562
+    1822, // extension 563
+    1827, // extension 564
+    1828, // extension 565
+    1829, // extension 566
+    1831, // extension 567
+    1831, // extension 568
+    1832, // extension 569
+    1833, // extension 570
+    1841, // extension 571
+    1847, // extension 572
+    1847, // extension 573
+    1862, // extension 574
+    1866, // extension 575
+    1869, // extension 576
+    1872, // extension 577
+    1872, // extension 578
+    1872, // extension 579
+    1872, // extension 580
+    1873, // extension 581
+    1876, // extension 582
+    1878, // extension 583
+    1880, // extension 584
+    1880, // extension 585
+    1883, // extension 586
+    1883, // extension 587
+    1887, // extension 588
+    1888, // extension 589
+    1888, // extension 590
+    1888, // extension 591
+    1890, // extension 592
+    1890, // extension 593
+    1890, // extension 594
+    1893, // extension 595
+    1893, // extension 596
+    1893, // extension 597
+    1894, // extension 598
+    1894, // extension 599
+    1897, // extension 600
+    1897, // extension 601
+    1897, // extension 602
+    1897, // extension 603
+    1900, // extension 604
+    1900, // extension 605
+    1900, // extension 606
+    1905, // extension 607
+    1905, // extension 608
+    1909, // extension 609
+    1910, // extension 610
+    1911, // extension 611
+    1911, // extension 612
+    1914, // extension 613
+    1914, // extension 614
+    1916, // extension 615
+    1916, // extension 616
+    1916, // extension 617
+    1918, // extension 618
+    1918, // extension 619
+    1918, // extension 620
+    1922, // extension 621
+    1923, // extension 622
+    1923, // extension 623
+    1923, // extension 624
+    1927, // extension 625
+    1927, // extension 626
+    1927, // extension 627
+    1927, // extension 628
+    1928, // extension 629
+    1931, // extension 630
+    1933, // extension 631
+    1938, // extension 632
+    1947, // extension 633
+    1947, // extension 634
+    1947, // extension 635
+    1947, // extension 636
+    1949, // extension 637
+    1949, // extension 638
+    1950, // extension 639
+    1950, // extension 640
+    1950, // extension 641
+    1950, // extension 642
+    1950, // extension 643
+    1951, // extension 644
+    1951, // extension 645
+    1951, // extension 646
+    1953, // extension 647
+    1953, // extension 648
+    1953, // extension 649
+    1953, // extension 650
+    1953, // extension 651
+    1953, // extension 652
+    1953, // extension 653
+    1953, // extension 654
+    1953, // extension 655
+    1953, // extension 656
+    1953, // extension 657
+    1953, // extension 658
+    1955, // extension 659
+    1955, // extension 660
+    1955, // extension 661
+    1955, // extension 662
+    1955, // extension 663
+    1956, // extension 664
+    1956, // extension 665
+    1957, // extension 666
+    1957, // extension 667
+    1957, // extension 668
+    1957, // extension 669
+    1964, // extension 670
+    1964, // extension 671
+    1964, // extension 672
+    1964, // extension 673
+    1965, // extension 674
+    1966, // extension 675
+    1968, // extension 676
+    1968, // extension 677
+    1971, // extension 678
+    1971, // extension 679
+    1972, // extension 680
+    1972, // extension 681
+    1972, // extension 682
+    1972, // extension 683
+    1972, // extension 684
+    1972, // extension 685
+    1972, // extension 686
+    1973, // extension 687
+    1973, // extension 688
+    1973, // extension 689
+    1973, // extension 690
+    1974, // end
+    // extension 2
+    424, // SWAPCHAIN_CREATE_INFO_KHR
+    425, // PRESENT_INFO_KHR
+    // extension 3
+    432, // DISPLAY_MODE_CREATE_INFO_KHR
+    433, // DISPLAY_SURFACE_CREATE_INFO_KHR
+    // extension 4
+    434, // DISPLAY_PRESENT_INFO_KHR
+    // extension 5
+    435, // XLIB_SURFACE_CREATE_INFO_KHR
+    // extension 6
+    436, // XCB_SURFACE_CREATE_INFO_KHR
+    // extension 7
+    437, // WAYLAND_SURFACE_CREATE_INFO_KHR
+    // extension 8
+    259, // MIR_SURFACE_CREATE_INFO_KHR
+    // extension 9
+    438, // ANDROID_SURFACE_CREATE_INFO_KHR
+    // extension 10
+    439, // WIN32_SURFACE_CREATE_INFO_KHR
+    // extension 11
+    440, // NATIVE_BUFFER_ANDROID
+    441, // SWAPCHAIN_IMAGE_CREATE_INFO_ANDROID
+    442, // PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_ANDROID
+    // extension 12
+    2, // DEBUG_REPORT_CREATE_INFO_EXT
+    // extension 19
+    444, // PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD
+    // extension 23
+    445, // DEBUG_MARKER_OBJECT_NAME_INFO_EXT
+    446, // DEBUG_MARKER_OBJECT_TAG_INFO_EXT
+    447, // DEBUG_MARKER_MARKER_INFO_EXT
+    // extension 24
+    741, // VIDEO_PROFILE_INFO_KHR
+    742, // VIDEO_CAPABILITIES_KHR
+    743, // VIDEO_PICTURE_RESOURCE_INFO_KHR
+    744, // VIDEO_SESSION_MEMORY_REQUIREMENTS_KHR
+    745, // BIND_VIDEO_SESSION_MEMORY_INFO_KHR
+    746, // VIDEO_SESSION_CREATE_INFO_KHR
+    747, // VIDEO_SESSION_PARAMETERS_CREATE_INFO_KHR
+    748, // VIDEO_SESSION_PARAMETERS_UPDATE_INFO_KHR
+    749, // VIDEO_BEGIN_CODING_INFO_KHR
+    750, // VIDEO_END_CODING_INFO_KHR
+    751, // VIDEO_CODING_CONTROL_INFO_KHR
+    752, // VIDEO_REFERENCE_SLOT_INFO_KHR
+    753, // QUEUE_FAMILY_VIDEO_PROPERTIES_KHR
+    754, // VIDEO_PROFILE_LIST_INFO_KHR
+    755, // PHYSICAL_DEVICE_VIDEO_FORMAT_INFO_KHR
+    756, // VIDEO_FORMAT_PROPERTIES_KHR
+    757, // QUEUE_FAMILY_QUERY_RESULT_STATUS_PROPERTIES_KHR
+    // extension 25
+    758, // VIDEO_DECODE_INFO_KHR
+    759, // VIDEO_DECODE_CAPABILITIES_KHR
+    760, // VIDEO_DECODE_USAGE_INFO_KHR
+    // extension 27
+    448, // DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV
+    449, // DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV
+    450, // DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV
+    // extension 29
+    451, // PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT
+    452, // PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT
+    453, // PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT
+    // extension 30
+    761,           // CU_MODULE_CREATE_INFO_NVX
+    762,           // CU_FUNCTION_CREATE_INFO_NVX
+    763,           // CU_LAUNCH_INFO_NVX
+    cNoValueIndex, // 1000029003
+    1248,          // CU_MODULE_TEXTURING_MODE_CREATE_INFO_NVX
+    // extension 31
+    454, // IMAGE_VIEW_HANDLE_INFO_NVX
+    455, // IMAGE_VIEW_ADDRESS_PROPERTIES_NVX
+    // extension 39
+    929,  // VIDEO_ENCODE_H264_CAPABILITIES_EXT
+    930,  // VIDEO_ENCODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT
+    931,  // VIDEO_ENCODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT
+    932,  // VIDEO_ENCODE_H264_VCL_FRAME_INFO_EXT
+    933,  // VIDEO_ENCODE_H264_DPB_SLOT_INFO_EXT
+    934,  // VIDEO_ENCODE_H264_NALU_SLICE_INFO_EXT
+    935,  // VIDEO_ENCODE_H264_EMIT_PICTURE_PARAMETERS_INFO_EXT
+    936,  // VIDEO_ENCODE_H264_PROFILE_INFO_EXT
+    937,  // VIDEO_ENCODE_H264_RATE_CONTROL_INFO_EXT
+    938,  // VIDEO_ENCODE_H264_RATE_CONTROL_LAYER_INFO_EXT
+    939,  // VIDEO_ENCODE_H264_REFERENCE_LISTS_INFO_EXT
+    1034, // VIDEO_ENCODE_H264_QUALITY_LEVEL_PROPERTIES_KHR
+    1035, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_GET_INFO_KHR
+    1036, // VIDEO_ENCODE_H264_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    // extension 40
+    940,  // VIDEO_ENCODE_H265_CAPABILITIES_EXT
+    941,  // VIDEO_ENCODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT
+    942,  // VIDEO_ENCODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT
+    943,  // VIDEO_ENCODE_H265_VCL_FRAME_INFO_EXT
+    944,  // VIDEO_ENCODE_H265_DPB_SLOT_INFO_EXT
+    945,  // VIDEO_ENCODE_H265_NALU_SLICE_SEGMENT_INFO_EXT
+    946,  // VIDEO_ENCODE_H265_EMIT_PICTURE_PARAMETERS_INFO_EXT
+    947,  // VIDEO_ENCODE_H265_PROFILE_INFO_EXT
+    948,  // VIDEO_ENCODE_H265_REFERENCE_LISTS_INFO_EXT
+    949,  // VIDEO_ENCODE_H265_RATE_CONTROL_INFO_EXT
+    950,  // VIDEO_ENCODE_H265_RATE_CONTROL_LAYER_INFO_EXT
+    1047, // VIDEO_ENCODE_H265_SESSION_CREATE_INFO_KHR
+    1048, // VIDEO_ENCODE_H265_QUALITY_LEVEL_PROPERTIES_KHR
+    1049, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_GET_INFO_KHR
+    1050, // VIDEO_ENCODE_H265_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    // extension 41
+    951,           // VIDEO_DECODE_H264_CAPABILITIES_EXT
+    952,           // VIDEO_DECODE_H264_PICTURE_INFO_EXT
+    cNoValueIndex, // 1000040002
+    953,           // VIDEO_DECODE_H264_PROFILE_INFO_EXT
+    954,           // VIDEO_DECODE_H264_SESSION_PARAMETERS_CREATE_INFO_EXT
+    955,           // VIDEO_DECODE_H264_SESSION_PARAMETERS_ADD_INFO_EXT
+    956,           // VIDEO_DECODE_H264_DPB_SLOT_INFO_EXT
+    // extension 42
+    456, // TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD
+    // extension 45
+    156,           // RENDERING_INFO_KHR
+    157,           // RENDERING_ATTACHMENT_INFO_KHR
+    158,           // PIPELINE_RENDERING_CREATE_INFO_KHR
+    159,           // PHYSICAL_DEVICE_DYNAMIC_RENDERING_FEATURES_KHR
+    160,           // COMMAND_BUFFER_INHERITANCE_RENDERING_INFO_KHR
+    cNoValueIndex, // 1000044005
+    778,           // RENDERING_FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR
+    777,           // RENDERING_FRAGMENT_DENSITY_MAP_ATTACHMENT_INFO_EXT
+    164,           // ATTACHMENT_SAMPLE_COUNT_INFO_NV
+    764,           // MULTIVIEW_PER_VIEW_ATTRIBUTES_INFO_NVX
+    // extension 50
+    457, // STREAM_DESCRIPTOR_SURFACE_CREATE_INFO_GGP
+    // extension 51
+    458, // PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV
+    // extension 52
+    1022, // PRIVATE_VENDOR_INFO_RESERVED_OFFSET_0_NV
+    // extension 54
+    3, // RENDER_PASS_MULTIVIEW_CREATE_INFO_KHR
+    4, // PHYSICAL_DEVICE_MULTIVIEW_FEATURES_KHR
+    5, // PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES_KHR
+    // extension 57
+    459, // EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV
+    460, // EXPORT_MEMORY_ALLOCATE_INFO_NV
+    // extension 58
+    461, // IMPORT_MEMORY_WIN32_HANDLE_INFO_NV
+    462, // EXPORT_MEMORY_WIN32_HANDLE_INFO_NV
+    // extension 59
+    463, // WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV
+    // extension 60
+    6,  // PHYSICAL_DEVICE_FEATURES_2_KHR
+    7,  // PHYSICAL_DEVICE_PROPERTIES_2_KHR
+    8,  // FORMAT_PROPERTIES_2_KHR
+    9,  // IMAGE_FORMAT_PROPERTIES_2_KHR
+    10, // PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2_KHR
+    11, // QUEUE_FAMILY_PROPERTIES_2_KHR
+    12, // PHYSICAL_DEVICE_MEMORY_PROPERTIES_2_KHR
+    13, // SPARSE_IMAGE_FORMAT_PROPERTIES_2_KHR
+    14, // PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2_KHR
+    // extension 61
+    15,            // MEMORY_ALLOCATE_FLAGS_INFO_KHR
+    cNoValueIndex, // 1000060001
+    cNoValueIndex, // 1000060002
+    16,            // DEVICE_GROUP_RENDER_PASS_BEGIN_INFO_KHR
+    17,            // DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO_KHR
+    18,            // DEVICE_GROUP_SUBMIT_INFO_KHR
+    19,            // DEVICE_GROUP_BIND_SPARSE_INFO_KHR
+    426,           // DEVICE_GROUP_PRESENT_CAPABILITIES_KHR
+    427,           // IMAGE_SWAPCHAIN_CREATE_INFO_KHR
+    428,           // BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR
+    429,           // ACQUIRE_NEXT_IMAGE_INFO_KHR
+    430,           // DEVICE_GROUP_PRESENT_INFO_KHR
+    431,           // DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR
+    20,            // BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO_KHR
+    21,            // BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO_KHR
+    // extension 62
+    464, // VALIDATION_FLAGS_EXT
+    // extension 63
+    465, // VI_SURFACE_CREATE_INFO_NN
+    // extension 64
+    1, // PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES
+    // extension 67
+    22, // PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_HDR_FEATURES_EXT
+    // extension 68
+    466, // IMAGE_VIEW_ASTC_DECODE_MODE_EXT
+    467, // PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT
+    // extension 69
+    161, // PIPELINE_ROBUSTNESS_CREATE_INFO_EXT
+    162, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_FEATURES_EXT
+    163, // PHYSICAL_DEVICE_PIPELINE_ROBUSTNESS_PROPERTIES_EXT
+    // extension 71
+    23, // PHYSICAL_DEVICE_GROUP_PROPERTIES_KHR
+    24, // DEVICE_GROUP_DEVICE_CREATE_INFO_KHR
+    // extension 72
+    25, // PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO_KHR
+    26, // EXTERNAL_IMAGE_FORMAT_PROPERTIES_KHR
+    27, // PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO_KHR
+    28, // EXTERNAL_BUFFER_PROPERTIES_KHR
+    29, // PHYSICAL_DEVICE_ID_PROPERTIES_KHR
+    // extension 73
+    30, // EXTERNAL_MEMORY_BUFFER_CREATE_INFO_KHR
+    31, // EXTERNAL_MEMORY_IMAGE_CREATE_INFO_KHR
+    32, // EXPORT_MEMORY_ALLOCATE_INFO_KHR
+    // extension 74
+    468, // IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR
+    469, // EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR
+    470, // MEMORY_WIN32_HANDLE_PROPERTIES_KHR
+    471, // MEMORY_GET_WIN32_HANDLE_INFO_KHR
+    // extension 75
+    472, // IMPORT_MEMORY_FD_INFO_KHR
+    473, // MEMORY_FD_PROPERTIES_KHR
+    474, // MEMORY_GET_FD_INFO_KHR
+    // extension 76
+    475, // WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR
+    // extension 77
+    33, // PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO_KHR
+    34, // EXTERNAL_SEMAPHORE_PROPERTIES_KHR
+    // extension 78
+    35, // EXPORT_SEMAPHORE_CREATE_INFO_KHR
+    // extension 79
+    476, // IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR
+    477, // EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR
+    478, // D3D12_FENCE_SUBMIT_INFO_KHR
+    479, // SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR
+    // extension 80
+    480, // IMPORT_SEMAPHORE_FD_INFO_KHR
+    481, // SEMAPHORE_GET_FD_INFO_KHR
+    // extension 81
+    36, // PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR
+    // extension 82
+    482, // COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT
+    483, // PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT
+    484, // CONDITIONAL_RENDERING_BEGIN_INFO_EXT
+    // extension 83
+    37, // PHYSICAL_DEVICE_SHADER_FLOAT16_INT8_FEATURES_KHR
+    // extension 84
+    39, // PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES_KHR
+    // extension 85
+    485, // PRESENT_REGIONS_KHR
+    // extension 86
+    40, // DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO_KHR
+    // extension 87
+    253, // OBJECT_TABLE_CREATE_INFO_NVX
+    254, // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NVX
+    255, // CMD_PROCESS_COMMANDS_INFO_NVX
+    256, // CMD_RESERVE_SPACE_FOR_COMMANDS_INFO_NVX
+    257, // DEVICE_GENERATED_COMMANDS_LIMITS_NVX
+    258, // DEVICE_GENERATED_COMMANDS_FEATURES_NVX
+    // extension 88
+    486, // PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV
+    // extension 91
+    41, // SURFACE_CAPABILITIES2_EXT
+    // extension 92
+    488, // DISPLAY_POWER_INFO_EXT
+    489, // DEVICE_EVENT_INFO_EXT
+    490, // DISPLAY_EVENT_INFO_EXT
+    491, // SWAPCHAIN_COUNTER_CREATE_INFO_EXT
+    // extension 93
+    492, // PRESENT_TIMES_INFO_GOOGLE
+    // extension 95
+    354, // PHYSICAL_DEVICE_SUBGROUP_PROPERTIES
+    // extension 98
+    493, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX
+    // extension 99
+    494, // PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV
+    // extension 100
+    495, // PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT
+    496, // PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT
+    // extension 102
+    497, // PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT
+    498, // PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT
+    // extension 103
+    499, // PHYSICAL_DEVICE_DEPTH_CLIP_ENABLE_FEATURES_EXT
+    500, // PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_INFO_EXT
+    // extension 106
+    501, // HDR_METADATA_EXT
+    // extension 109
+    42, // PHYSICAL_DEVICE_IMAGELESS_FRAMEBUFFER_FEATURES_KHR
+    43, // FRAMEBUFFER_ATTACHMENTS_CREATE_INFO_KHR
+    44, // FRAMEBUFFER_ATTACHMENT_IMAGE_INFO_KHR
+    45, // RENDER_PASS_ATTACHMENT_BEGIN_INFO_KHR
+    // extension 110
+    46, // ATTACHMENT_DESCRIPTION_2_KHR
+    47, // ATTACHMENT_REFERENCE_2_KHR
+    48, // SUBPASS_DESCRIPTION_2_KHR
+    49, // SUBPASS_DEPENDENCY_2_KHR
+    50, // RENDER_PASS_CREATE_INFO_2_KHR
+    51, // SUBPASS_BEGIN_INFO_KHR
+    52, // SUBPASS_END_INFO_KHR
+    // extension 111
+    1052, // PHYSICAL_DEVICE_RELAXED_LINE_RASTERIZATION_FEATURES_IMG
+    // extension 112
+    502, // SHARED_PRESENT_SURFACE_CAPABILITIES_KHR
+    // extension 113
+    53, // PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO_KHR
+    54, // EXTERNAL_FENCE_PROPERTIES_KHR
+    // extension 114
+    55, // EXPORT_FENCE_CREATE_INFO_KHR
+    // extension 115
+    503, // IMPORT_FENCE_WIN32_HANDLE_INFO_KHR
+    504, // EXPORT_FENCE_WIN32_HANDLE_INFO_KHR
+    505, // FENCE_GET_WIN32_HANDLE_INFO_KHR
+    // extension 116
+    506, // IMPORT_FENCE_FD_INFO_KHR
+    507, // FENCE_GET_FD_INFO_KHR
+    // extension 117
+    508, // PHYSICAL_DEVICE_PERFORMANCE_QUERY_FEATURES_KHR
+    509, // PHYSICAL_DEVICE_PERFORMANCE_QUERY_PROPERTIES_KHR
+    510, // QUERY_POOL_PERFORMANCE_CREATE_INFO_KHR
+    511, // PERFORMANCE_QUERY_SUBMIT_INFO_KHR
+    512, // ACQUIRE_PROFILING_LOCK_INFO_KHR
+    513, // PERFORMANCE_COUNTER_KHR
+    514, // PERFORMANCE_COUNTER_DESCRIPTION_KHR
+    969, // PERFORMANCE_QUERY_RESERVATION_INFO_KHR
+    // extension 118
+    56, // PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES_KHR
+    57, // RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO_KHR
+    58, // IMAGE_VIEW_USAGE_CREATE_INFO_KHR
+    59, // PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO_KHR
+    // extension 120
+    515, // PHYSICAL_DEVICE_SURFACE_INFO_2_KHR
+    516, // SURFACE_CAPABILITIES_2_KHR
+    517, // SURFACE_FORMAT_2_KHR
+    // extension 121
+    0, // PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES
+    // extension 122
+    518, // DISPLAY_PROPERTIES_2_KHR
+    519, // DISPLAY_PLANE_PROPERTIES_2_KHR
+    520, // DISPLAY_MODE_PROPERTIES_2_KHR
+    521, // DISPLAY_PLANE_INFO_2_KHR
+    522, // DISPLAY_PLANE_CAPABILITIES_2_KHR
+    // extension 123
+    523, // IOS_SURFACE_CREATE_INFO_MVK
+    // extension 124
+    524, // MACOS_SURFACE_CREATE_INFO_MVK
+    // extension 128
+    62, // MEMORY_DEDICATED_REQUIREMENTS_KHR
+    63, // MEMORY_DEDICATED_ALLOCATE_INFO_KHR
+    // extension 129
+    525, // DEBUG_UTILS_OBJECT_NAME_INFO_EXT
+    526, // DEBUG_UTILS_OBJECT_TAG_INFO_EXT
+    527, // DEBUG_UTILS_LABEL_EXT
+    528, // DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT
+    529, // DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT
+    // extension 130
+    530, // ANDROID_HARDWARE_BUFFER_USAGE_ANDROID
+    531, // ANDROID_HARDWARE_BUFFER_PROPERTIES_ANDROID
+    532, // ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_ANDROID
+    533, // IMPORT_ANDROID_HARDWARE_BUFFER_INFO_ANDROID
+    534, // MEMORY_GET_ANDROID_HARDWARE_BUFFER_INFO_ANDROID
+    535, // EXTERNAL_FORMAT_ANDROID
+    765, // ANDROID_HARDWARE_BUFFER_FORMAT_PROPERTIES_2_ANDROID
+    // extension 131
+    64, // PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT
+    65, // SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT
+    // extension 134
+    1548, // PHYSICAL_DEVICE_GPA_FEATURES_AMD
+    1549, // PHYSICAL_DEVICE_GPA_PROPERTIES_AMD
+    1550, // GPA_SAMPLE_BEGIN_INFO_AMD
+    1551, // GPA_SESSION_CREATE_INFO_AMD
+    1552, // GPA_DEVICE_CLOCK_MODE_INFO_AMD
+    1553, // PHYSICAL_DEVICE_GPA_PROPERTIES_2_AMD
+    1554, // GPA_DEVICE_GET_CLOCK_INFO_AMD
+    // extension 135
+    1053, // PHYSICAL_DEVICE_SHADER_ENQUEUE_FEATURES_AMDX
+    1054, // PHYSICAL_DEVICE_SHADER_ENQUEUE_PROPERTIES_AMDX
+    1055, // EXECUTION_GRAPH_PIPELINE_SCRATCH_SIZE_AMDX
+    1056, // EXECUTION_GRAPH_PIPELINE_CREATE_INFO_AMDX
+    1057, // PIPELINE_SHADER_STAGE_NODE_CREATE_INFO_AMDX
+    // extension 136
+    1474, // TEXEL_BUFFER_DESCRIPTOR_INFO_EXT
+    1475, // IMAGE_DESCRIPTOR_INFO_EXT
+    1476, // RESOURCE_DESCRIPTOR_INFO_EXT
+    1477, // BIND_HEAP_INFO_EXT
+    1478, // PUSH_DATA_INFO_EXT
+    1479, // DESCRIPTOR_SET_AND_BINDING_MAPPING_EXT
+    1480, // SHADER_DESCRIPTOR_SET_AND_BINDING_MAPPING_INFO_EXT
+    1481, // OPAQUE_CAPTURE_DATA_CREATE_INFO_EXT
+    1482, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_PROPERTIES_EXT
+    1483, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_FEATURES_EXT
+    1484, // COMMAND_BUFFER_INHERITANCE_DESCRIPTOR_HEAP_INFO_EXT
+    1485, // SAMPLER_CUSTOM_BORDER_COLOR_INDEX_CREATE_INFO_EXT
+    1486, // INDIRECT_COMMANDS_LAYOUT_PUSH_DATA_TOKEN_NV
+    1487, // SUBSAMPLED_IMAGE_FORMAT_PROPERTIES_EXT
+    1488, // PHYSICAL_DEVICE_DESCRIPTOR_HEAP_TENSOR_PROPERTIES_ARM
+    // extension 139
+    66, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT
+    67, // PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT
+    68, // WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT
+    69, // DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT
+    // extension 142
+    1249, // PHYSICAL_DEVICE_SHADER_BFLOAT16_FEATURES_KHR
+    // extension 144
+    536, // SAMPLE_LOCATIONS_INFO_EXT
+    537, // RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT
+    538, // PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT
+    539, // PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT
+    540, // MULTISAMPLE_PROPERTIES_EXT
+    // extension 146
+    336, // PROTECTED_SUBMIT_INFO
+    337, // PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES
+    338, // PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES
+    339, // DEVICE_QUEUE_INFO_2
+    // extension 147
+    70, // BUFFER_MEMORY_REQUIREMENTS_INFO_2_KHR
+    71, // IMAGE_MEMORY_REQUIREMENTS_INFO_2_KHR
+    72, // IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2_KHR
+    73, // MEMORY_REQUIREMENTS_2_KHR
+    74, // SPARSE_IMAGE_MEMORY_REQUIREMENTS_2_KHR
+    // extension 148
+    75, // IMAGE_FORMAT_LIST_CREATE_INFO_KHR
+    // extension 149
+    541, // PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT
+    542, // PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT
+    543, // PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT
+    // extension 150
+    544, // PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV
+    // extension 151
+    546,           // ACCELERATION_STRUCTURE_BUILD_GEOMETRY_INFO_KHR
+    683,           // ACCELERATION_STRUCTURE_CREATE_GEOMETRY_TYPE_INFO_KHR
+    547,           // ACCELERATION_STRUCTURE_DEVICE_ADDRESS_INFO_KHR
+    548,           // ACCELERATION_STRUCTURE_GEOMETRY_AABBS_DATA_KHR
+    549,           // ACCELERATION_STRUCTURE_GEOMETRY_INSTANCES_DATA_KHR
+    550,           // ACCELERATION_STRUCTURE_GEOMETRY_TRIANGLES_DATA_KHR
+    551,           // ACCELERATION_STRUCTURE_GEOMETRY_KHR
+    545,           // WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR
+    684,           // ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_KHR
+    685,           // ACCELERATION_STRUCTURE_VERSION_KHR
+    552,           // COPY_ACCELERATION_STRUCTURE_INFO_KHR
+    553,           // COPY_ACCELERATION_STRUCTURE_TO_MEMORY_INFO_KHR
+    554,           // COPY_MEMORY_TO_ACCELERATION_STRUCTURE_INFO_KHR
+    686,           // PHYSICAL_DEVICE_RAY_TRACING_FEATURES_KHR
+    687,           // PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_KHR
+    556,           // RAY_TRACING_PIPELINE_CREATE_INFO_KHR
+    557,           // RAY_TRACING_SHADER_GROUP_CREATE_INFO_KHR
+    555,           // ACCELERATION_STRUCTURE_CREATE_INFO_KHR
+    558,           // RAY_TRACING_PIPELINE_INTERFACE_CREATE_INFO_KHR
+    cNoValueIndex, // 1000150019
+    770,           // ACCELERATION_STRUCTURE_BUILD_SIZES_INFO_KHR
+    // extension 153
+    559, // PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV
+    // extension 155
+    560, // PHYSICAL_DEVICE_SHADER_SM_BUILTINS_FEATURES_NV
+    561, // PHYSICAL_DEVICE_SHADER_SM_BUILTINS_PROPERTIES_NV
+    // extension 157
+    76, // SAMPLER_YCBCR_CONVERSION_CREATE_INFO_KHR
+    77, // SAMPLER_YCBCR_CONVERSION_INFO_KHR
+    78, // BIND_IMAGE_PLANE_MEMORY_INFO_KHR
+    79, // IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO_KHR
+    80, // PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES_KHR
+    81, // SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES_KHR
+    // extension 158
+    82, // BIND_BUFFER_MEMORY_INFO_KHR
+    83, // BIND_IMAGE_MEMORY_INFO_KHR
+    // extension 159
+    562,           // DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT
+    cNoValueIndex, // 1000158001
+    563,           // PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT
+    564,           // IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT
+    565,           // IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT
+    566,           // IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT
+    774,           // DRM_FORMAT_MODIFIER_PROPERTIES_LIST_2_EXT
+    // extension 161
+    567, // VALIDATION_CACHE_CREATE_INFO_EXT
+    568, // SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT
+    // extension 162
+    84, // DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT
+    85, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT
+    86, // PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT
+    87, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT
+    88, // DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT
+    // extension 164
+    569, // PHYSICAL_DEVICE_PORTABILITY_SUBSET_FEATURES_KHR
+    570, // PHYSICAL_DEVICE_PORTABILITY_SUBSET_PROPERTIES_KHR
+    // extension 165
+    571,           // PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV
+    572,           // PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV
+    573,           // PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV
+    cNoValueIndex, // 1000164003
+    cNoValueIndex, // 1000164004
+    574,           // PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV
+    // extension 166
+    575,           // RAY_TRACING_PIPELINE_CREATE_INFO_NV
+    576,           // ACCELERATION_STRUCTURE_CREATE_INFO_NV
+    cNoValueIndex, // 1000165002
+    577,           // GEOMETRY_NV
+    578,           // GEOMETRY_TRIANGLES_NV
+    579,           // GEOMETRY_AABB_NV
+    580,           // BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV
+    581,           // WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV
+    582,           // ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV
+    583,           // PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV
+    cNoValueIndex, // 1000165010
+    584,           // RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV
+    585,           // ACCELERATION_STRUCTURE_INFO_NV
+    // extension 167
+    586, // PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV
+    587, // PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV
+    // extension 169
+    89, // PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES_KHR
+    90, // DESCRIPTOR_SET_LAYOUT_SUPPORT_KHR
+    // extension 171
+    588, // PHYSICAL_DEVICE_IMAGE_VIEW_IMAGE_FORMAT_INFO_EXT
+    589, // FILTER_CUBIC_IMAGE_VIEW_IMAGE_FORMAT_PROPERTIES_EXT
+    // extension 173
+    1494, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_CONVERSION_FEATURES_QCOM
+    // extension 174
+    1555, // PHYSICAL_DEVICE_ELAPSED_TIMER_QUERY_FEATURES_QCOM
+    // extension 175
+    91, // DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT
+    // extension 176
+    92, // PHYSICAL_DEVICE_SHADER_SUBGROUP_EXTENDED_TYPES_FEATURES_KHR
+    // extension 178
+    93, // PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR
+    // extension 179
+    590, // IMPORT_MEMORY_HOST_POINTER_INFO_EXT
+    591, // MEMORY_HOST_POINTER_PROPERTIES_EXT
+    592, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT
+    // extension 181
+    94, // PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR
+    // extension 182
+    593, // PHYSICAL_DEVICE_SHADER_CLOCK_FEATURES_KHR
+    // extension 184
+    594, // PIPELINE_COMPILER_CONTROL_CREATE_INFO_AMD
+    // extension 185
+    95, // CALIBRATED_TIMESTAMP_INFO_EXT
+    // extension 186
+    595, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD
+    // extension 188
+    957, // VIDEO_DECODE_H265_CAPABILITIES_EXT
+    958, // VIDEO_DECODE_H265_SESSION_PARAMETERS_CREATE_INFO_EXT
+    959, // VIDEO_DECODE_H265_SESSION_PARAMETERS_ADD_INFO_EXT
+    960, // VIDEO_DECODE_H265_PROFILE_INFO_EXT
+    961, // VIDEO_DECODE_H265_PICTURE_INFO_EXT
+    962, // VIDEO_DECODE_H265_DPB_SLOT_INFO_EXT
+    // extension 190
+    596, // DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD
+    // extension 191
+    597, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT
+    96,  // PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT
+    97,  // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT
+    // extension 192
+    598, // PRESENT_FRAME_TOKEN_GGP
+    // extension 193
+    98, // PIPELINE_CREATION_FEEDBACK_CREATE_INFO_EXT
+    // extension 197
+    99, // PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR
+    // extension 198
+    100, // PHYSICAL_DEVICE_FLOAT_CONTROLS_PROPERTIES_KHR
+    // extension 200
+    101, // PHYSICAL_DEVICE_DEPTH_STENCIL_RESOLVE_PROPERTIES_KHR
+    102, // SUBPASS_DESCRIPTION_DEPTH_STENCIL_RESOLVE_KHR
+    // extension 202
+    103, // PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV
+    // extension 203
+    599, // PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV
+    600, // PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV
+    // extension 204
+    104, // PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV
+    // extension 205
+    601, // PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV
+    // extension 206
+    602,           // PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV
+    cNoValueIndex, // 1000205001
+    603,           // PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV
+    // extension 207
+    604, // CHECKPOINT_DATA_NV
+    605, // QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV
+    // extension 208
+    105, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_FEATURES_KHR
+    106, // PHYSICAL_DEVICE_TIMELINE_SEMAPHORE_PROPERTIES_KHR
+    107, // SEMAPHORE_TYPE_CREATE_INFO_KHR
+    108, // TIMELINE_SEMAPHORE_SUBMIT_INFO_KHR
+    109, // SEMAPHORE_WAIT_INFO_KHR
+    110, // SEMAPHORE_SIGNAL_INFO_KHR
+    // extension 209
+    1459, // PHYSICAL_DEVICE_PRESENT_TIMING_FEATURES_EXT
+    1460, // SWAPCHAIN_TIMING_PROPERTIES_EXT
+    1461, // SWAPCHAIN_TIME_DOMAIN_PROPERTIES_EXT
+    1462, // PRESENT_TIMINGS_INFO_EXT
+    1463, // PRESENT_TIMING_INFO_EXT
+    1464, // PAST_PRESENTATION_TIMING_INFO_EXT
+    1465, // PAST_PRESENTATION_TIMING_PROPERTIES_EXT
+    1466, // PAST_PRESENTATION_TIMING_EXT
+    1467, // PRESENT_TIMING_SURFACE_CAPABILITIES_EXT
+    1468, // SWAPCHAIN_CALIBRATED_TIMESTAMP_INFO_EXT
+    // extension 210
+    606, // PHYSICAL_DEVICE_SHADER_INTEGER_FUNCTIONS_2_FEATURES_INTEL
+    // extension 211
+    111, // QUERY_POOL_CREATE_INFO_INTEL
+    608, // INITIALIZE_PERFORMANCE_API_INFO_INTEL
+    609, // PERFORMANCE_MARKER_INFO_INTEL
+    610, // PERFORMANCE_STREAM_MARKER_INFO_INTEL
+    611, // PERFORMANCE_OVERRIDE_INFO_INTEL
+    612, // PERFORMANCE_CONFIGURATION_ACQUIRE_INFO_INTEL
+    // extension 212
+    112, // PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR
+    // extension 213
+    613, // PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT
+    // extension 214
+    614, // DISPLAY_NATIVE_HDR_SURFACE_CAPABILITIES_AMD
+    615, // SWAPCHAIN_DISPLAY_NATIVE_HDR_CREATE_INFO_AMD
+    // extension 215
+    616, // IMAGEPIPE_SURFACE_CREATE_INFO_FUCHSIA
+    // extension 216
+    113, // PHYSICAL_DEVICE_SHADER_TERMINATE_INVOCATION_FEATURES_KHR
+    // extension 218
+    617, // METAL_SURFACE_CREATE_INFO_EXT
+    // extension 219
+    618, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_FEATURES_EXT
+    619, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_PROPERTIES_EXT
+    620, // RENDER_PASS_FRAGMENT_DENSITY_MAP_CREATE_INFO_EXT
+    // extension 222
+    114, // PHYSICAL_DEVICE_SCALAR_BLOCK_LAYOUT_FEATURES_EXT
+    // extension 226
+    115, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_PROPERTIES_EXT
+    116, // PIPELINE_SHADER_STAGE_REQUIRED_SUBGROUP_SIZE_CREATE_INFO_EXT
+    117, // PHYSICAL_DEVICE_SUBGROUP_SIZE_CONTROL_FEATURES_EXT
+    // extension 227
+    621, // FRAGMENT_SHADING_RATE_ATTACHMENT_INFO_KHR
+    622, // PIPELINE_FRAGMENT_SHADING_RATE_STATE_CREATE_INFO_KHR
+    623, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_PROPERTIES_KHR
+    624, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_FEATURES_KHR
+    625, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_KHR
+    // extension 228
+    626, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_2_AMD
+    // extension 230
+    627, // PHYSICAL_DEVICE_COHERENT_MEMORY_FEATURES_AMD
+    // extension 232
+    1517, // PHYSICAL_DEVICE_SHADER_CONSTANT_DATA_FEATURES_KHR
+    // extension 233
+    210, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_LOCAL_READ_FEATURES_KHR
+    211, // RENDERING_ATTACHMENT_LOCATION_INFO_KHR
+    212, // RENDERING_INPUT_ATTACHMENT_INDEX_INFO_KHR
+    // extension 234
+    1518, // PHYSICAL_DEVICE_SHADER_ABORT_FEATURES_KHR
+    1519, // DEVICE_FAULT_SHADER_ABORT_MESSAGE_INFO_KHR
+    1520, // PHYSICAL_DEVICE_SHADER_ABORT_PROPERTIES_KHR
+    // extension 235
+    628, // PHYSICAL_DEVICE_SHADER_IMAGE_ATOMIC_INT64_FEATURES_EXT
+    // extension 236
+    1058, // PHYSICAL_DEVICE_SHADER_QUAD_CONTROL_FEATURES_KHR
+    // extension 238
+    629, // PHYSICAL_DEVICE_MEMORY_BUDGET_PROPERTIES_EXT
+    // extension 239
+    630, // PHYSICAL_DEVICE_MEMORY_PRIORITY_FEATURES_EXT
+    631, // MEMORY_PRIORITY_ALLOCATE_INFO_EXT
+    // extension 240
+    632, // SURFACE_PROTECTED_CAPABILITIES_KHR
+    // extension 241
+    633, // PHYSICAL_DEVICE_DEDICATED_ALLOCATION_IMAGE_ALIASING_FEATURES_NV
+    // extension 242
+    118, // PHYSICAL_DEVICE_SEPARATE_DEPTH_STENCIL_LAYOUTS_FEATURES_KHR
+    119, // ATTACHMENT_REFERENCE_STENCIL_LAYOUT_KHR
+    120, // ATTACHMENT_DESCRIPTION_STENCIL_LAYOUT_KHR
+    // extension 245
+    121, // PHYSICAL_DEVICE_BUFFER_ADDRESS_FEATURES_EXT
+    122, // BUFFER_DEVICE_ADDRESS_INFO_EXT
+    635, // BUFFER_DEVICE_ADDRESS_CREATE_INFO_EXT
+    // extension 246
+    123, // PHYSICAL_DEVICE_TOOL_PROPERTIES_EXT
+    // extension 247
+    124, // IMAGE_STENCIL_USAGE_CREATE_INFO_EXT
+    // extension 248
+    636, // VALIDATION_FEATURES_EXT
+    // extension 249
+    779, // PHYSICAL_DEVICE_PRESENT_WAIT_FEATURES_KHR
+    // extension 250
+    637, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_NV
+    638, // COOPERATIVE_MATRIX_PROPERTIES_NV
+    639, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_NV
+    // extension 251
+    640, // PHYSICAL_DEVICE_COVERAGE_REDUCTION_MODE_FEATURES_NV
+    641, // PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_INFO_NV
+    642, // FRAMEBUFFER_MIXED_SAMPLES_COMBINATION_NV
+    // extension 252
+    643, // PHYSICAL_DEVICE_FRAGMENT_SHADER_INTERLOCK_FEATURES_EXT
+    // extension 253
+    644, // PHYSICAL_DEVICE_YCBCR_IMAGE_ARRAYS_FEATURES_EXT
+    // extension 254
+    125, // PHYSICAL_DEVICE_UNIFORM_BUFFER_STANDARD_LAYOUT_FEATURES_KHR
+    // extension 255
+    780, // PHYSICAL_DEVICE_PROVOKING_VERTEX_FEATURES_EXT
+    781, // PIPELINE_RASTERIZATION_PROVOKING_VERTEX_STATE_CREATE_INFO_EXT
+    782, // PHYSICAL_DEVICE_PROVOKING_VERTEX_PROPERTIES_EXT
+    // extension 256
+    645, // SURFACE_FULL_SCREEN_EXCLUSIVE_INFO_EXT
+    647, // SURFACE_FULL_SCREEN_EXCLUSIVE_WIN32_INFO_EXT
+    646, // SURFACE_CAPABILITIES_FULL_SCREEN_EXCLUSIVE_EXT
+    // extension 257
+    648, // HEADLESS_SURFACE_CREATE_INFO_EXT
+    // extension 258
+    126,           // PHYSICAL_DEVICE_BUFFER_DEVICE_ADDRESS_FEATURES_KHR
+    cNoValueIndex, // 1000257001
+    128,           // BUFFER_OPAQUE_CAPTURE_ADDRESS_CREATE_INFO_KHR
+    129,           // MEMORY_OPAQUE_CAPTURE_ADDRESS_ALLOCATE_INFO_KHR
+    130,           // DEVICE_MEMORY_OPAQUE_CAPTURE_ADDRESS_INFO_KHR
+    // extension 260
+    131, // PHYSICAL_DEVICE_LINE_RASTERIZATION_FEATURES_EXT
+    132, // PIPELINE_RASTERIZATION_LINE_STATE_CREATE_INFO_EXT
+    133, // PHYSICAL_DEVICE_LINE_RASTERIZATION_PROPERTIES_EXT
+    // extension 261
+    649, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_FEATURES_EXT
+    // extension 262
+    134, // PHYSICAL_DEVICE_HOST_QUERY_RESET_FEATURES_EXT
+    // extension 266
+    135, // PHYSICAL_DEVICE_INDEX_TYPE_UINT8_FEATURES_EXT
+    // extension 268
+    650, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_FEATURES_EXT
+    // extension 269
+    688, // DEFERRED_OPERATION_INFO_KHR
+    // extension 270
+    651, // PHYSICAL_DEVICE_PIPELINE_EXECUTABLE_PROPERTIES_FEATURES_KHR
+    185, // PIPELINE_INFO_EXT
+    653, // PIPELINE_EXECUTABLE_PROPERTIES_KHR
+    654, // PIPELINE_EXECUTABLE_INFO_KHR
+    655, // PIPELINE_EXECUTABLE_STATISTIC_KHR
+    656, // PIPELINE_EXECUTABLE_INTERNAL_REPRESENTATION_KHR
+    // extension 271
+    213, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_FEATURES_EXT
+    214, // PHYSICAL_DEVICE_HOST_IMAGE_COPY_PROPERTIES_EXT
+    215, // MEMORY_TO_IMAGE_COPY_EXT
+    216, // IMAGE_TO_MEMORY_COPY_EXT
+    217, // COPY_IMAGE_TO_MEMORY_INFO_EXT
+    218, // COPY_MEMORY_TO_IMAGE_INFO_EXT
+    219, // HOST_IMAGE_LAYOUT_TRANSITION_INFO_EXT
+    220, // COPY_IMAGE_TO_IMAGE_INFO_EXT
+    221, // SUBRESOURCE_HOST_MEMCPY_SIZE_EXT
+    222, // HOST_IMAGE_COPY_DEVICE_PERFORMANCE_QUERY_EXT
+    // extension 272
+    223, // MEMORY_MAP_INFO_KHR
+    224, // MEMORY_UNMAP_INFO_KHR
+    // extension 273
+    1148, // PHYSICAL_DEVICE_MAP_MEMORY_PLACED_FEATURES_EXT
+    1149, // PHYSICAL_DEVICE_MAP_MEMORY_PLACED_PROPERTIES_EXT
+    1150, // MEMORY_MAP_PLACED_INFO_EXT
+    // extension 274
+    783, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT_2_FEATURES_EXT
+    // extension 275
+    197, // SURFACE_PRESENT_MODE_EXT
+    198, // SURFACE_PRESENT_SCALING_CAPABILITIES_EXT
+    199, // SURFACE_PRESENT_MODE_COMPATIBILITY_EXT
+    // extension 276
+    200, // PHYSICAL_DEVICE_SWAPCHAIN_MAINTENANCE_1_FEATURES_EXT
+    201, // SWAPCHAIN_PRESENT_FENCE_INFO_EXT
+    202, // SWAPCHAIN_PRESENT_MODES_CREATE_INFO_EXT
+    203, // SWAPCHAIN_PRESENT_MODE_INFO_EXT
+    204, // SWAPCHAIN_PRESENT_SCALING_CREATE_INFO_EXT
+    205, // RELEASE_SWAPCHAIN_IMAGES_INFO_EXT
+    // extension 277
+    136, // PHYSICAL_DEVICE_SHADER_DEMOTE_TO_HELPER_INVOCATION_FEATURES_EXT
+    // extension 278
+    657, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_NV
+    658, // GRAPHICS_SHADER_GROUP_CREATE_INFO_NV
+    659, // GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV
+    660, // INDIRECT_COMMANDS_LAYOUT_TOKEN_NV
+    661, // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NV
+    662, // GENERATED_COMMANDS_INFO_NV
+    663, // GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_NV
+    664, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_NV
+    // extension 279
+    784, // PHYSICAL_DEVICE_INHERITED_VIEWPORT_SCISSOR_FEATURES_NV
+    785, // COMMAND_BUFFER_INHERITANCE_VIEWPORT_SCISSOR_INFO_NV
+    // extension 281
+    168, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_FEATURES_KHR
+    169, // PHYSICAL_DEVICE_SHADER_INTEGER_DOT_PRODUCT_PROPERTIES_KHR
+    // extension 282
+    665, // PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_FEATURES_EXT
+    137, // PHYSICAL_DEVICE_TEXEL_BUFFER_ALIGNMENT_PROPERTIES_EXT
+    // extension 283
+    666, // COMMAND_BUFFER_INHERITANCE_RENDER_PASS_TRANSFORM_INFO_QCOM
+    667, // RENDER_PASS_TRANSFORM_BEGIN_INFO_QCOM
+    // extension 284
+    1059, // PHYSICAL_DEVICE_DEPTH_BIAS_CONTROL_FEATURES_EXT
+    1060, // DEPTH_BIAS_INFO_EXT
+    1061, // DEPTH_BIAS_REPRESENTATION_INFO_EXT
+    // extension 285
+    668, // PHYSICAL_DEVICE_DEVICE_MEMORY_REPORT_FEATURES_EXT
+    669, // DEVICE_DEVICE_MEMORY_REPORT_CREATE_INFO_EXT
+    670, // DEVICE_MEMORY_REPORT_CALLBACK_DATA_EXT
+    // extension 287
+    138, // PHYSICAL_DEVICE_ROBUSTNESS_2_FEATURES_EXT
+    139, // PHYSICAL_DEVICE_ROBUSTNESS_2_PROPERTIES_EXT
+    // extension 288
+    671, // SAMPLER_CUSTOM_BORDER_COLOR_CREATE_INFO_EXT
+    672, // PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_PROPERTIES_EXT
+    673, // PHYSICAL_DEVICE_CUSTOM_BORDER_COLOR_FEATURES_EXT
+    // extension 289
+    1471, // PHYSICAL_DEVICE_TEXTURE_COMPRESSION_ASTC_3D_FEATURES_EXT
+    // extension 291
+    674, // PIPELINE_LIBRARY_CREATE_INFO_KHR
+    // extension 293
+    786, // PHYSICAL_DEVICE_PRESENT_BARRIER_FEATURES_NV
+    787, // SURFACE_CAPABILITIES_PRESENT_BARRIER_NV
+    788, // SWAPCHAIN_PRESENT_BARRIER_CREATE_INFO_NV
+    // extension 295
+    789, // PRESENT_ID_KHR
+    790, // PHYSICAL_DEVICE_PRESENT_ID_FEATURES_KHR
+    // extension 296
+    140, // PHYSICAL_DEVICE_PRIVATE_DATA_FEATURES_EXT
+    141, // DEVICE_PRIVATE_DATA_CREATE_INFO_EXT
+    142, // PRIVATE_DATA_SLOT_CREATE_INFO_EXT
+    // extension 298
+    143, // PHYSICAL_DEVICE_PIPELINE_CREATION_CACHE_CONTROL_FEATURES_EXT
+    // extension 300
+    791,  // VIDEO_ENCODE_INFO_KHR
+    792,  // VIDEO_ENCODE_RATE_CONTROL_INFO_KHR
+    793,  // VIDEO_ENCODE_RATE_CONTROL_LAYER_INFO_KHR
+    794,  // VIDEO_ENCODE_CAPABILITIES_KHR
+    795,  // VIDEO_ENCODE_USAGE_INFO_KHR
+    1062, // QUERY_POOL_VIDEO_ENCODE_FEEDBACK_CREATE_INFO_KHR
+    1063, // PHYSICAL_DEVICE_VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR
+    1064, // VIDEO_ENCODE_QUALITY_LEVEL_PROPERTIES_KHR
+    1065, // VIDEO_ENCODE_QUALITY_LEVEL_INFO_KHR
+    1066, // VIDEO_ENCODE_SESSION_PARAMETERS_GET_INFO_KHR
+    1067, // VIDEO_ENCODE_SESSION_PARAMETERS_FEEDBACK_INFO_KHR
+    // extension 301
+    675, // PHYSICAL_DEVICE_DIAGNOSTICS_CONFIG_FEATURES_NV
+    676, // DEVICE_DIAGNOSTICS_CONFIG_CREATE_INFO_NV
+    // extension 303
+    1525, // PERF_HINT_INFO_QCOM
+    1526, // PHYSICAL_DEVICE_QUEUE_PERF_HINT_FEATURES_QCOM
+    1527, // PHYSICAL_DEVICE_QUEUE_PERF_HINT_PROPERTIES_QCOM
+    // extension 304
+    1556, // PHYSICAL_DEVICE_IMAGE_PROCESSING_3_FEATURES_QCOM
+    // extension 305
+    1557, // PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_FEATURES_QCOM
+    1558, // PHYSICAL_DEVICE_SHADER_MULTIPLE_WAIT_QUEUES_PROPERTIES_QCOM
+    // extension 306
+    1559, // PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_FEATURES_EXT
+    1560, // PHYSICAL_DEVICE_SHADER_SPLIT_BARRIER_PROPERTIES_EXT
+    // extension 308
+    1068, // CUDA_MODULE_CREATE_INFO_NV
+    1069, // CUDA_FUNCTION_CREATE_INFO_NV
+    1070, // CUDA_LAUNCH_INFO_NV
+    1071, // PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_FEATURES_NV
+    1072, // PHYSICAL_DEVICE_CUDA_KERNEL_LAUNCH_PROPERTIES_NV
+    // extension 309
+    976, // REFRESH_OBJECT_LIST_KHR
+    // extension 310
+    681,  // RESERVED_QCOM
+    1251, // PHYSICAL_DEVICE_TILE_SHADING_PROPERTIES_QCOM
+    1252, // RENDER_PASS_TILE_SHADING_CREATE_INFO_QCOM
+    1253, // PER_TILE_BEGIN_INFO_QCOM
+    1254, // PER_TILE_END_INFO_QCOM
+    1255, // DISPATCH_TILE_INFO_QCOM
+    // extension 311
+    1073, // QUERY_LOW_LATENCY_SUPPORT_NV
+    // extension 312
+    796, // EXPORT_METAL_OBJECT_CREATE_INFO_EXT
+    797, // EXPORT_METAL_OBJECTS_INFO_EXT
+    798, // EXPORT_METAL_DEVICE_INFO_EXT
+    799, // EXPORT_METAL_COMMAND_QUEUE_INFO_EXT
+    800, // EXPORT_METAL_BUFFER_INFO_EXT
+    801, // IMPORT_METAL_BUFFER_INFO_EXT
+    802, // EXPORT_METAL_TEXTURE_INFO_EXT
+    803, // IMPORT_METAL_TEXTURE_INFO_EXT
+    804, // EXPORT_METAL_IO_SURFACE_INFO_EXT
+    805, // IMPORT_METAL_IO_SURFACE_INFO_EXT
+    806, // EXPORT_METAL_SHARED_EVENT_INFO_EXT
+    807, // IMPORT_METAL_SHARED_EVENT_INFO_EXT
+    // extension 315
+    170, // MEMORY_BARRIER_2_KHR
+    171, // BUFFER_MEMORY_BARRIER_2_KHR
+    172, // IMAGE_MEMORY_BARRIER_2_KHR
+    173, // DEPENDENCY_INFO_KHR
+    174, // SUBMIT_INFO_2_KHR
+    175, // SEMAPHORE_SUBMIT_INFO_KHR
+    176, // COMMAND_BUFFER_SUBMIT_INFO_KHR
+    177, // PHYSICAL_DEVICE_SYNCHRONIZATION_2_FEATURES_KHR
+    775, // QUEUE_FAMILY_CHECKPOINT_PROPERTIES_2_NV
+    776, // CHECKPOINT_DATA_2_NV
+    // extension 317
+    977, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_PROPERTIES_EXT
+    978, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_DENSITY_MAP_PROPERTIES_EXT
+    979, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_FEATURES_EXT
+    980, // DESCRIPTOR_ADDRESS_INFO_EXT
+    981, // DESCRIPTOR_GET_INFO_EXT
+    982, // BUFFER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    983, // IMAGE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    984, // IMAGE_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    985, // SAMPLER_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    989, // ACCELERATION_STRUCTURE_CAPTURE_DESCRIPTOR_DATA_INFO_EXT
+    986, // OPAQUE_CAPTURE_DESCRIPTOR_DATA_CREATE_INFO_EXT
+    987, // DESCRIPTOR_BUFFER_BINDING_INFO_EXT
+    988, // DESCRIPTOR_BUFFER_BINDING_PUSH_DESCRIPTOR_BUFFER_HANDLE_EXT
+    // extension 319
+    1501, // DEVICE_MEMORY_COPY_KHR
+    1502, // COPY_DEVICE_MEMORY_INFO_KHR
+    1503, // DEVICE_MEMORY_IMAGE_COPY_KHR
+    1504, // COPY_DEVICE_MEMORY_IMAGE_INFO_KHR
+    1505, // MEMORY_RANGE_BARRIERS_INFO_KHR
+    1506, // MEMORY_RANGE_BARRIER_KHR
+    1507, // PHYSICAL_DEVICE_DEVICE_ADDRESS_COMMANDS_FEATURES_KHR
+    1508, // BIND_INDEX_BUFFER_3_INFO_KHR
+    1509, // BIND_VERTEX_BUFFER_3_INFO_KHR
+    1510, // DRAW_INDIRECT_2_INFO_KHR
+    1511, // DRAW_INDIRECT_COUNT_2_INFO_KHR
+    1512, // DISPATCH_INDIRECT_2_INFO_KHR
+    1513, // CONDITIONAL_RENDERING_BEGIN_INFO_2_EXT
+    1514, // BIND_TRANSFORM_FEEDBACK_BUFFER_2_INFO_EXT
+    1515, // MEMORY_MARKER_INFO_AMD
+    1516, // ACCELERATION_STRUCTURE_CREATE_INFO_2_KHR
+    // extension 321
+    808, // PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_FEATURES_EXT
+    809, // PHYSICAL_DEVICE_GRAPHICS_PIPELINE_LIBRARY_PROPERTIES_EXT
+    810, // GRAPHICS_PIPELINE_LIBRARY_CREATE_INFO_EXT
+    // extension 322
+    811, // PHYSICAL_DEVICE_SHADER_EARLY_AND_LATE_FRAGMENT_TESTS_FEATURES_AMD
+    // extension 323
+    813, // PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_PROPERTIES_KHR
+    // extension 324
+    814, // PHYSICAL_DEVICE_SHADER_SUBGROUP_UNIFORM_CONTROL_FLOW_FEATURES_KHR
+    // extension 326
+    178, // PHYSICAL_DEVICE_ZERO_INITIALIZE_WORKGROUP_MEMORY_FEATURES_KHR
+    // extension 327
+    815, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_PROPERTIES_NV
+    816, // PHYSICAL_DEVICE_FRAGMENT_SHADING_RATE_ENUMS_FEATURES_NV
+    817, // PIPELINE_FRAGMENT_SHADING_RATE_ENUM_STATE_CREATE_INFO_NV
+    // extension 328
+    818, // ACCELERATION_STRUCTURE_GEOMETRY_MOTION_TRIANGLES_DATA_NV
+    819, // PHYSICAL_DEVICE_RAY_TRACING_MOTION_BLUR_FEATURES_NV
+    820, // ACCELERATION_STRUCTURE_MOTION_INFO_NV
+    // extension 329
+    821, // PHYSICAL_DEVICE_MESH_SHADER_FEATURES_EXT
+    822, // PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_EXT
+    // extension 331
+    823, // PHYSICAL_DEVICE_YCBCR_2_PLANE_444_FORMATS_FEATURES_EXT
+    // extension 333
+    677, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_FEATURES_EXT
+    678, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_2_PROPERTIES_EXT
+    // extension 334
+    824, // COPY_COMMAND_TRANSFORM_INFO_QCOM
+    // extension 336
+    144, // PHYSICAL_DEVICE_IMAGE_ROBUSTNESS_FEATURES_EXT
+    // extension 337
+    825, // PHYSICAL_DEVICE_WORKGROUP_MEMORY_EXPLICIT_LAYOUT_FEATURES_KHR
+    // extension 338
+    145, // COPY_BUFFER_INFO_2_KHR
+    146, // COPY_IMAGE_INFO_2_KHR
+    147, // COPY_BUFFER_TO_IMAGE_INFO_2_KHR
+    148, // COPY_IMAGE_TO_BUFFER_INFO_2_KHR
+    149, // BLIT_IMAGE_INFO_2_KHR
+    150, // RESOLVE_IMAGE_INFO_2_KHR
+    151, // BUFFER_COPY_2_KHR
+    152, // IMAGE_COPY_2_KHR
+    153, // IMAGE_BLIT_2_KHR
+    154, // BUFFER_IMAGE_COPY_2_KHR
+    155, // IMAGE_RESOLVE_2_KHR
+    // extension 339
+    826, // PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_FEATURES_EXT
+    827, // IMAGE_COMPRESSION_CONTROL_EXT
+    179, // SUBRESOURCE_LAYOUT_2_EXT
+    180, // IMAGE_SUBRESOURCE_2_EXT
+    828, // IMAGE_COMPRESSION_PROPERTIES_EXT
+    // extension 340
+    829, // PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_LAYOUT_FEATURES_EXT
+    // extension 341
+    679, // PHYSICAL_DEVICE_4444_FORMATS_FEATURES_EXT
+    // extension 342
+    830, // PHYSICAL_DEVICE_FAULT_FEATURES_EXT
+    831, // DEVICE_FAULT_COUNTS_EXT
+    832, // DEVICE_FAULT_INFO_EXT
+    // extension 343
+    181, // PHYSICAL_DEVICE_RASTERIZATION_ORDER_ATTACHMENT_ACCESS_FEATURES_ARM
+    // extension 345
+    833, // PHYSICAL_DEVICE_RGBA10X6_FORMATS_FEATURES_EXT
+    // extension 347
+    680, // DIRECTFB_SURFACE_CREATE_INFO_EXT
+    // extension 348
+    771, // PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_FEATURES_KHR
+    772, // PHYSICAL_DEVICE_RAY_TRACING_PIPELINE_PROPERTIES_KHR
+    // extension 349
+    cNoValueIndex, // 1000348000
+    cNoValueIndex, // 1000348001
+    cNoValueIndex, // 1000348002
+    cNoValueIndex, // 1000348003
+    cNoValueIndex, // 1000348004
+    cNoValueIndex, // 1000348005
+    cNoValueIndex, // 1000348006
+    cNoValueIndex, // 1000348007
+    cNoValueIndex, // 1000348008
+    cNoValueIndex, // 1000348009
+    cNoValueIndex, // 1000348010
+    cNoValueIndex, // 1000348011
+    cNoValueIndex, // 1000348012
+    773,           // PHYSICAL_DEVICE_RAY_QUERY_FEATURES_KHR
+    // extension 352
+    182,           // PHYSICAL_DEVICE_MUTABLE_DESCRIPTOR_TYPE_FEATURES_VALVE
+    cNoValueIndex, // 1000351001
+    183,           // MUTABLE_DESCRIPTOR_TYPE_CREATE_INFO_VALVE
+    // extension 353
+    834, // PHYSICAL_DEVICE_VERTEX_INPUT_DYNAMIC_STATE_FEATURES_EXT
+    835, // VERTEX_INPUT_BINDING_DESCRIPTION_2_EXT
+    836, // VERTEX_INPUT_ATTRIBUTE_DESCRIPTION_2_EXT
+    // extension 354
+    837, // PHYSICAL_DEVICE_DRM_PROPERTIES_EXT
+    // extension 355
+    838, // PHYSICAL_DEVICE_ADDRESS_BINDING_REPORT_FEATURES_EXT
+    839, // DEVICE_ADDRESS_BINDING_CALLBACK_DATA_EXT
+    // extension 356
+    840, // PHYSICAL_DEVICE_DEPTH_CLIP_CONTROL_FEATURES_EXT
+    841, // PIPELINE_VIEWPORT_DEPTH_CLIP_CONTROL_CREATE_INFO_EXT
+    // extension 357
+    842, // PHYSICAL_DEVICE_PRIMITIVE_TOPOLOGY_LIST_RESTART_FEATURES_EXT
+    // extension 361
+    184, // FORMAT_PROPERTIES_3_KHR
+    // extension 362
+    251, // PHYSICAL_DEVICE_PRESENT_MODE_FIFO_LATEST_READY_FEATURES_EXT
+    // extension 365
+    843, // IMPORT_MEMORY_ZIRCON_HANDLE_INFO_FUCHSIA
+    844, // MEMORY_ZIRCON_HANDLE_PROPERTIES_FUCHSIA
+    845, // MEMORY_GET_ZIRCON_HANDLE_INFO_FUCHSIA
+    // extension 366
+    846, // IMPORT_SEMAPHORE_ZIRCON_HANDLE_INFO_FUCHSIA
+    847, // SEMAPHORE_GET_ZIRCON_HANDLE_INFO_FUCHSIA
+    // extension 367
+    848, // BUFFER_COLLECTION_CREATE_INFO_FUCHSIA
+    849, // IMPORT_MEMORY_BUFFER_COLLECTION_FUCHSIA
+    850, // BUFFER_COLLECTION_IMAGE_CREATE_INFO_FUCHSIA
+    851, // BUFFER_COLLECTION_PROPERTIES_FUCHSIA
+    852, // BUFFER_CONSTRAINTS_INFO_FUCHSIA
+    853, // BUFFER_COLLECTION_BUFFER_CREATE_INFO_FUCHSIA
+    854, // IMAGE_CONSTRAINTS_INFO_FUCHSIA
+    855, // IMAGE_FORMAT_CONSTRAINTS_INFO_FUCHSIA
+    856, // SYSMEM_COLOR_SPACE_FUCHSIA
+    857, // BUFFER_COLLECTION_CONSTRAINTS_INFO_FUCHSIA
+    // extension 370
+    858, // SUBPASS_SHADING_PIPELINE_CREATE_INFO_HUAWEI
+    859, // PHYSICAL_DEVICE_SUBPASS_SHADING_FEATURES_HUAWEI
+    860, // PHYSICAL_DEVICE_SUBPASS_SHADING_PROPERTIES_HUAWEI
+    // extension 371
+    861, // PHYSICAL_DEVICE_INVOCATION_MASK_FEATURES_HUAWEI
+    // extension 372
+    862, // MEMORY_GET_REMOTE_ADDRESS_INFO_NV
+    863, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_RDMA_FEATURES_NV
+    // extension 373
+    864, // PIPELINE_PROPERTIES_IDENTIFIER_EXT
+    865, // PHYSICAL_DEVICE_PIPELINE_PROPERTIES_FEATURES_EXT
+    // extension 374
+    990, // IMPORT_FENCE_SCI_SYNC_INFO_NV
+    991, // EXPORT_FENCE_SCI_SYNC_INFO_NV
+    992, // FENCE_GET_SCI_SYNC_INFO_NV
+    993, // SCI_SYNC_ATTRIBUTES_INFO_NV
+    994, // IMPORT_SEMAPHORE_SCI_SYNC_INFO_NV
+    995, // EXPORT_SEMAPHORE_SCI_SYNC_INFO_NV
+    996, // SEMAPHORE_GET_SCI_SYNC_INFO_NV
+    997, // PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_FEATURES_NV
+    // extension 375
+    998,  // IMPORT_MEMORY_SCI_BUF_INFO_NV
+    999,  // EXPORT_MEMORY_SCI_BUF_INFO_NV
+    1000, // MEMORY_GET_SCI_BUF_INFO_NV
+    1001, // MEMORY_SCI_BUF_PROPERTIES_NV
+    206,  // PHYSICAL_DEVICE_EXTERNAL_SCI_BUF_FEATURES_NV
+    // extension 376
+    1074, // PHYSICAL_DEVICE_FRAME_BOUNDARY_FEATURES_EXT
+    1075, // FRAME_BOUNDARY_EXT
+    // extension 377
+    866, // PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_FEATURES_EXT
+    867, // SUBPASS_RESOLVE_PERFORMANCE_QUERY_EXT
+    868, // MULTISAMPLED_RENDER_TO_SINGLE_SAMPLED_INFO_EXT
+    // extension 378
+    869, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_2_FEATURES_EXT
+    // extension 379
+    870, // SCREEN_SURFACE_CREATE_INFO_QNX
+    // extension 382
+    871, // PHYSICAL_DEVICE_COLOR_WRITE_ENABLE_FEATURES_EXT
+    872, // PIPELINE_COLOR_WRITE_CREATE_INFO_EXT
+    // extension 383
+    873, // PHYSICAL_DEVICE_PRIMITIVES_GENERATED_QUERY_FEATURES_EXT
+    // extension 387
+    874, // PHYSICAL_DEVICE_RAY_TRACING_MAINTENANCE_1_FEATURES_KHR
+    // extension 388
+    1415, // PHYSICAL_DEVICE_SHADER_UNTYPED_POINTERS_FEATURES_KHR
+    // extension 389
+    166, // PHYSICAL_DEVICE_GLOBAL_PRIORITY_QUERY_FEATURES_KHR
+    167, // QUEUE_FAMILY_GLOBAL_PRIORITY_PROPERTIES_KHR
+    // extension 391
+    1419, // PHYSICAL_DEVICE_VIDEO_ENCODE_RGB_CONVERSION_FEATURES_VALVE
+    1420, // VIDEO_ENCODE_RGB_CONVERSION_CAPABILITIES_VALVE
+    1421, // VIDEO_ENCODE_PROFILE_RGB_CONVERSION_INFO_VALVE
+    1422, // VIDEO_ENCODE_SESSION_RGB_CONVERSION_CREATE_INFO_VALVE
+    // extension 392
+    875, // PHYSICAL_DEVICE_IMAGE_VIEW_MIN_LOD_FEATURES_EXT
+    876, // IMAGE_VIEW_MIN_LOD_CREATE_INFO_EXT
+    // extension 393
+    877, // PHYSICAL_DEVICE_MULTI_DRAW_FEATURES_EXT
+    878, // PHYSICAL_DEVICE_MULTI_DRAW_PROPERTIES_EXT
+    // extension 394
+    879, // PHYSICAL_DEVICE_IMAGE_2D_VIEW_OF_3D_FEATURES_EXT
+    // extension 396
+    1076, // PHYSICAL_DEVICE_SHADER_TILE_IMAGE_FEATURES_EXT
+    1077, // PHYSICAL_DEVICE_SHADER_TILE_IMAGE_PROPERTIES_EXT
+    // extension 397
+    880, // MICROMAP_BUILD_INFO_EXT
+    881, // MICROMAP_VERSION_INFO_EXT
+    882, // COPY_MICROMAP_INFO_EXT
+    883, // COPY_MICROMAP_TO_MEMORY_INFO_EXT
+    884, // COPY_MEMORY_TO_MICROMAP_INFO_EXT
+    885, // PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_EXT
+    886, // PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_EXT
+    887, // MICROMAP_CREATE_INFO_EXT
+    888, // MICROMAP_BUILD_SIZES_INFO_EXT
+    889, // ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_EXT
+    // extension 398
+    1078, // PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_FEATURES_NV
+    1079, // PHYSICAL_DEVICE_DISPLACEMENT_MICROMAP_PROPERTIES_NV
+    1080, // ACCELERATION_STRUCTURE_TRIANGLES_DISPLACEMENT_MICROMAP_NV
+    // extension 405
+    1003, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_FEATURES_HUAWEI
+    1004, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_PROPERTIES_HUAWEI
+    1081, // PHYSICAL_DEVICE_CLUSTER_CULLING_SHADER_VRS_FEATURES_HUAWEI
+    // extension 412
+    890, // PHYSICAL_DEVICE_BORDER_COLOR_SWIZZLE_FEATURES_EXT
+    891, // SAMPLER_BORDER_COLOR_COMPONENT_MAPPING_CREATE_INFO_EXT
+    // extension 413
+    892, // PHYSICAL_DEVICE_PAGEABLE_DEVICE_LOCAL_MEMORY_FEATURES_EXT
+    // extension 414
+    188, // PHYSICAL_DEVICE_MAINTENANCE_4_FEATURES_KHR
+    189, // PHYSICAL_DEVICE_MAINTENANCE_4_PROPERTIES_KHR
+    190, // DEVICE_BUFFER_MEMORY_REQUIREMENTS_KHR
+    191, // DEVICE_IMAGE_MEMORY_REQUIREMENTS_KHR
+    // extension 416
+    1005, // PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_ARM
+    // extension 417
+    225, // PHYSICAL_DEVICE_SHADER_SUBGROUP_ROTATE_FEATURES_KHR
+    // extension 418
+    1082, // DEVICE_QUEUE_SHADER_CORE_CONTROL_CREATE_INFO_ARM
+    1083, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_FEATURES_ARM
+    1084, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_PROPERTIES_ARM
+    1528, // DISPATCH_PARAMETERS_ARM
+    1529, // PHYSICAL_DEVICE_SCHEDULING_CONTROLS_DISPATCH_PARAMETERS_PROPERTIES_ARM
+    // extension 419
+    1006, // PHYSICAL_DEVICE_IMAGE_SLICED_VIEW_OF_3D_FEATURES_EXT
+    1007, // IMAGE_VIEW_SLICED_CREATE_INFO_EXT
+    // extension 421
+    893, // PHYSICAL_DEVICE_DESCRIPTOR_SET_HOST_MAPPING_FEATURES_VALVE
+    894, // DESCRIPTOR_SET_BINDING_REFERENCE_VALVE
+    895, // DESCRIPTOR_SET_LAYOUT_HOST_MAPPING_INFO_VALVE
+    // extension 422
+    192, // PHYSICAL_DEVICE_DEPTH_CLAMP_ZERO_ONE_FEATURES_EXT
+    // extension 423
+    896, // PHYSICAL_DEVICE_NON_SEAMLESS_CUBE_MAP_FEATURES_EXT
+    // extension 425
+    1085, // PHYSICAL_DEVICE_RENDER_PASS_STRIPED_FEATURES_ARM
+    1086, // PHYSICAL_DEVICE_RENDER_PASS_STRIPED_PROPERTIES_ARM
+    1087, // RENDER_PASS_STRIPE_BEGIN_INFO_ARM
+    1088, // RENDER_PASS_STRIPE_INFO_ARM
+    1089, // RENDER_PASS_STRIPE_SUBMIT_INFO_ARM
+    // extension 426
+    193, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_FEATURES_QCOM
+    194, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_OFFSET_PROPERTIES_QCOM
+    195, // SUBPASS_FRAGMENT_DENSITY_MAP_OFFSET_END_INFO_QCOM
+    // extension 427
+    1008, // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_NV
+    207,  // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_PROPERTIES_NV
+    // extension 428
+    208, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_FEATURES_NV
+    209, // PHYSICAL_DEVICE_MEMORY_DECOMPRESSION_PROPERTIES_NV
+    // extension 429
+    1090, // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_COMPUTE_FEATURES_NV
+    1091, // COMPUTE_PIPELINE_INDIRECT_BUFFER_INFO_NV
+    1092, // PIPELINE_INDIRECT_DEVICE_ADDRESS_INFO_NV
+    // extension 430
+    cNoValueIndex, // 1000429000
+    cNoValueIndex, // 1000429001
+    cNoValueIndex, // 1000429002
+    cNoValueIndex, // 1000429003
+    cNoValueIndex, // 1000429004
+    cNoValueIndex, // 1000429005
+    cNoValueIndex, // 1000429006
+    cNoValueIndex, // 1000429007
+    1256,          // PHYSICAL_DEVICE_RAY_TRACING_LINEAR_SWEPT_SPHERES_FEATURES_NV
+    1257,          // ACCELERATION_STRUCTURE_GEOMETRY_LINEAR_SWEPT_SPHERES_DATA_NV
+    1258,          // ACCELERATION_STRUCTURE_GEOMETRY_SPHERES_DATA_NV
+    // extension 431
+    897, // PHYSICAL_DEVICE_LINEAR_COLOR_ATTACHMENT_FEATURES_NV
+    // extension 435
+    1093, // PHYSICAL_DEVICE_SHADER_MAXIMAL_RECONVERGENCE_FEATURES_KHR
+    // extension 436
+    1009, // APPLICATION_PARAMETERS_EXT
+    // extension 438
+    898, // PHYSICAL_DEVICE_IMAGE_COMPRESSION_CONTROL_SWAPCHAIN_FEATURES_EXT
+    // extension 441
+    899, // PHYSICAL_DEVICE_IMAGE_PROCESSING_FEATURES_QCOM
+    900, // PHYSICAL_DEVICE_IMAGE_PROCESSING_PROPERTIES_QCOM
+    901, // IMAGE_VIEW_SAMPLE_WEIGHT_CREATE_INFO_QCOM
+    // extension 452
+    1094, // PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_FEATURES_EXT
+    1095, // PHYSICAL_DEVICE_NESTED_COMMAND_BUFFER_PROPERTIES_EXT
+    // extension 453
+    1441, // NATIVE_BUFFER_USAGE_OHOS
+    1442, // NATIVE_BUFFER_PROPERTIES_OHOS
+    1443, // NATIVE_BUFFER_FORMAT_PROPERTIES_OHOS
+    1444, // IMPORT_NATIVE_BUFFER_INFO_OHOS
+    1445, // MEMORY_GET_NATIVE_BUFFER_INFO_OHOS
+    1446, // EXTERNAL_FORMAT_OHOS
+    // extension 454
+    1096, // EXTERNAL_MEMORY_ACQUIRE_UNMODIFIED_EXT
+    1431, // NATIVE_BUFFER_OHOS
+    1432, // SWAPCHAIN_IMAGE_CREATE_INFO_OHOS
+    1433, // PHYSICAL_DEVICE_PRESENTATION_PROPERTIES_OHOS
+    // extension 456
+    902, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_FEATURES_EXT
+    903, // PHYSICAL_DEVICE_EXTENDED_DYNAMIC_STATE_3_PROPERTIES_EXT
+    // extension 459
+    904, // PHYSICAL_DEVICE_SUBPASS_MERGE_FEEDBACK_FEATURES_EXT
+    905, // RENDER_PASS_CREATION_CONTROL_EXT
+    906, // RENDER_PASS_CREATION_FEEDBACK_CREATE_INFO_EXT
+    907, // RENDER_PASS_SUBPASS_FEEDBACK_CREATE_INFO_EXT
+    // extension 460
+    1010, // DIRECT_DRIVER_LOADING_INFO_LUNARG
+    1011, // DIRECT_DRIVER_LOADING_LIST_LUNARG
+    // extension 461
+    1259, // TENSOR_CREATE_INFO_ARM
+    1260, // TENSOR_VIEW_CREATE_INFO_ARM
+    1261, // BIND_TENSOR_MEMORY_INFO_ARM
+    1262, // WRITE_DESCRIPTOR_SET_TENSOR_ARM
+    1263, // PHYSICAL_DEVICE_TENSOR_PROPERTIES_ARM
+    1264, // TENSOR_FORMAT_PROPERTIES_ARM
+    1265, // TENSOR_DESCRIPTION_ARM
+    1266, // TENSOR_MEMORY_REQUIREMENTS_INFO_ARM
+    1267, // TENSOR_MEMORY_BARRIER_ARM
+    1268, // PHYSICAL_DEVICE_TENSOR_FEATURES_ARM
+    1269, // DEVICE_TENSOR_MEMORY_REQUIREMENTS_ARM
+    1270, // COPY_TENSOR_INFO_ARM
+    1271, // TENSOR_COPY_ARM
+    1272, // TENSOR_DEPENDENCY_INFO_ARM
+    1273, // MEMORY_DEDICATED_ALLOCATE_INFO_TENSOR_ARM
+    1274, // PHYSICAL_DEVICE_EXTERNAL_TENSOR_INFO_ARM
+    1275, // EXTERNAL_TENSOR_PROPERTIES_ARM
+    1276, // EXTERNAL_MEMORY_TENSOR_CREATE_INFO_ARM
+    1277, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_FEATURES_ARM
+    1278, // PHYSICAL_DEVICE_DESCRIPTOR_BUFFER_TENSOR_PROPERTIES_ARM
+    1279, // DESCRIPTOR_GET_TENSOR_INFO_ARM
+    1280, // TENSOR_CAPTURE_DESCRIPTOR_DATA_INFO_ARM
+    1281, // TENSOR_VIEW_CAPTURE_DESCRIPTOR_DATA_INFO_ARM
+    1282, // FRAME_BOUNDARY_TENSORS_ARM
+    // extension 463
+    908, // PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_FEATURES_EXT
+    909, // PHYSICAL_DEVICE_SHADER_MODULE_IDENTIFIER_PROPERTIES_EXT
+    910, // PIPELINE_SHADER_STAGE_MODULE_IDENTIFIER_CREATE_INFO_EXT
+    911, // SHADER_MODULE_IDENTIFIER_EXT
+    // extension 465
+    913,           // PHYSICAL_DEVICE_OPTICAL_FLOW_FEATURES_NV
+    914,           // PHYSICAL_DEVICE_OPTICAL_FLOW_PROPERTIES_NV
+    915,           // OPTICAL_FLOW_IMAGE_FORMAT_INFO_NV
+    916,           // OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_NV
+    917,           // OPTICAL_FLOW_SESSION_CREATE_INFO_NV
+    918,           // OPTICAL_FLOW_EXECUTE_INFO_NV
+    cNoValueIndex, // 1000464006
+    cNoValueIndex, // 1000464007
+    cNoValueIndex, // 1000464008
+    cNoValueIndex, // 1000464009
+    919,           // OPTICAL_FLOW_SESSION_CREATE_PRIVATE_DATA_INFO_NV
+    // extension 466
+    920, // PHYSICAL_DEVICE_LEGACY_DITHERING_FEATURES_EXT
+    // extension 467
+    196, // PHYSICAL_DEVICE_PIPELINE_PROTECTED_ACCESS_FEATURES_EXT
+    // extension 469
+    1097, // PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_FEATURES_ANDROID
+    1098, // PHYSICAL_DEVICE_EXTERNAL_FORMAT_RESOLVE_PROPERTIES_ANDROID
+    1099, // ANDROID_HARDWARE_BUFFER_FORMAT_RESOLVE_PROPERTIES_ANDROID
+    // extension 471
+    226,           // PHYSICAL_DEVICE_MAINTENANCE_5_FEATURES_KHR
+    227,           // PHYSICAL_DEVICE_MAINTENANCE_5_PROPERTIES_KHR
+    cNoValueIndex, // 1000470002
+    228,           // RENDERING_AREA_INFO_KHR
+    229,           // DEVICE_IMAGE_SUBRESOURCE_INFO_KHR
+    232,           // PIPELINE_CREATE_FLAGS_2_CREATE_INFO_KHR
+    233,           // BUFFER_USAGE_FLAGS_2_CREATE_INFO_KHR
+    // extension 477
+    1154, // PHYSICAL_DEVICE_ANTI_LAG_FEATURES_AMD
+    1155, // ANTI_LAG_DATA_AMD
+    1156, // ANTI_LAG_PRESENTATION_INFO_AMD
+    // extension 479
+    1416, // PHYSICAL_DEVICE_DENSE_GEOMETRY_FORMAT_FEATURES_AMDX
+    1417, // ACCELERATION_STRUCTURE_DENSE_GEOMETRY_FORMAT_TRIANGLES_DATA_AMDX
+    // extension 480
+    1283, // SURFACE_CAPABILITIES_PRESENT_ID_2_KHR
+    1284, // PRESENT_ID_2_KHR
+    1285, // PHYSICAL_DEVICE_PRESENT_ID_2_FEATURES_KHR
+    // extension 481
+    1286, // SURFACE_CAPABILITIES_PRESENT_WAIT_2_KHR
+    1287, // PHYSICAL_DEVICE_PRESENT_WAIT_2_FEATURES_KHR
+    1288, // PRESENT_WAIT_2_INFO_KHR
+    // extension 482
+    1100, // PHYSICAL_DEVICE_RAY_TRACING_POSITION_FETCH_FEATURES_KHR
+    // extension 483
+    1101, // PHYSICAL_DEVICE_SHADER_OBJECT_FEATURES_EXT
+    1102, // PHYSICAL_DEVICE_SHADER_OBJECT_PROPERTIES_EXT
+    1103, // SHADER_CREATE_INFO_EXT
+    // extension 484
+    1157, // PHYSICAL_DEVICE_PIPELINE_BINARY_FEATURES_KHR
+    1158, // PIPELINE_BINARY_CREATE_INFO_KHR
+    1159, // PIPELINE_BINARY_INFO_KHR
+    1160, // PIPELINE_BINARY_KEY_KHR
+    1161, // PHYSICAL_DEVICE_PIPELINE_BINARY_PROPERTIES_KHR
+    1162, // RELEASE_CAPTURED_PIPELINE_DATA_INFO_KHR
+    1163, // PIPELINE_BINARY_DATA_INFO_KHR
+    1164, // PIPELINE_CREATE_INFO_KHR
+    1165, // DEVICE_PIPELINE_BINARY_INTERNAL_CACHE_CONTROL_KHR
+    1166, // PIPELINE_BINARY_HANDLES_INFO_KHR
+    // extension 485
+    921, // PHYSICAL_DEVICE_TILE_PROPERTIES_FEATURES_QCOM
+    922, // TILE_PROPERTIES_QCOM
+    // extension 486
+    923, // PHYSICAL_DEVICE_AMIGO_PROFILING_FEATURES_SEC
+    924, // AMIGO_PROFILING_SUBMIT_INFO_SEC
+    // extension 489
+    1012, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_VIEWPORTS_FEATURES_QCOM
+    // extension 490
+    1013, // SEMAPHORE_SCI_SYNC_POOL_CREATE_INFO_NV
+    1014, // SEMAPHORE_SCI_SYNC_CREATE_INFO_NV
+    1015, // PHYSICAL_DEVICE_EXTERNAL_SCI_SYNC_2_FEATURES_NV
+    1016, // DEVICE_SEMAPHORE_SCI_SYNC_POOL_RESERVATION_CREATE_INFO_NV
+    // extension 491
+    1017, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_NV
+    1018, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_NV
+    // extension 492
+    1289,          // PHYSICAL_DEVICE_COOPERATIVE_VECTOR_FEATURES_NV
+    1290,          // PHYSICAL_DEVICE_COOPERATIVE_VECTOR_PROPERTIES_NV
+    1291,          // COOPERATIVE_VECTOR_PROPERTIES_NV
+    cNoValueIndex, // 1000491003
+    1292,          // CONVERT_COOPERATIVE_VECTOR_MATRIX_INFO_NV
+    // extension 493
+    1104, // PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_FEATURES_NV
+    1105, // PHYSICAL_DEVICE_EXTENDED_SPARSE_ADDRESS_SPACE_PROPERTIES_NV
+    // extension 496
+    1167, // PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_FEATURES_EXT
+    1168, // PHYSICAL_DEVICE_LEGACY_VERTEX_ATTRIBUTES_PROPERTIES_EXT
+    // extension 497
+    1106, // LAYER_SETTINGS_CREATE_INFO_EXT
+    // extension 498
+    927, // PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_FEATURES_ARM
+    928, // PHYSICAL_DEVICE_SHADER_CORE_BUILTINS_PROPERTIES_ARM
+    // extension 499
+    1019, // PHYSICAL_DEVICE_PIPELINE_LIBRARY_GROUP_HANDLES_FEATURES_EXT
+    // extension 500
+    1107, // PHYSICAL_DEVICE_DYNAMIC_RENDERING_UNUSED_ATTACHMENTS_FEATURES_EXT
+    // extension 505
+    1489, // PHYSICAL_DEVICE_INTERNALLY_SYNCHRONIZED_QUEUES_FEATURES_KHR
+    // extension 506
+    1108, // LATENCY_SLEEP_MODE_INFO_NV
+    1109, // LATENCY_SLEEP_INFO_NV
+    1110, // SET_LATENCY_MARKER_INFO_NV
+    1111, // GET_LATENCY_MARKER_INFO_NV
+    1112, // LATENCY_TIMINGS_FRAME_REPORT_NV
+    1113, // LATENCY_SUBMISSION_PRESENT_ID_NV
+    1114, // OUT_OF_BAND_QUEUE_TYPE_INFO_NV
+    1115, // SWAPCHAIN_LATENCY_CREATE_INFO_NV
+    1116, // LATENCY_SURFACE_CAPABILITIES_NV
+    // extension 507
+    1117, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_FEATURES_KHR
+    1118, // COOPERATIVE_MATRIX_PROPERTIES_KHR
+    1119, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_PROPERTIES_KHR
+    // extension 508
+    1293, // DATA_GRAPH_PIPELINE_CREATE_INFO_ARM
+    1294, // DATA_GRAPH_PIPELINE_SESSION_CREATE_INFO_ARM
+    1295, // DATA_GRAPH_PIPELINE_RESOURCE_INFO_ARM
+    1296, // DATA_GRAPH_PIPELINE_CONSTANT_ARM
+    1297, // DATA_GRAPH_PIPELINE_SESSION_MEMORY_REQUIREMENTS_INFO_ARM
+    1298, // BIND_DATA_GRAPH_PIPELINE_SESSION_MEMORY_INFO_ARM
+    1299, // PHYSICAL_DEVICE_DATA_GRAPH_FEATURES_ARM
+    1300, // DATA_GRAPH_PIPELINE_SHADER_MODULE_CREATE_INFO_ARM
+    1301, // DATA_GRAPH_PIPELINE_PROPERTY_QUERY_RESULT_ARM
+    1302, // DATA_GRAPH_PIPELINE_INFO_ARM
+    1303, // DATA_GRAPH_PIPELINE_COMPILER_CONTROL_CREATE_INFO_ARM
+    1304, // DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENTS_INFO_ARM
+    1305, // DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_REQUIREMENT_ARM
+    1306, // DATA_GRAPH_PIPELINE_IDENTIFIER_CREATE_INFO_ARM
+    1307, // DATA_GRAPH_PIPELINE_DISPATCH_INFO_ARM
+    1312, // DATA_GRAPH_PIPELINE_CONSTANT_TENSOR_SEMI_STRUCTURED_SPARSITY_INFO_ARM
+    1308, // DATA_GRAPH_PROCESSING_ENGINE_CREATE_INFO_ARM
+    1309, // QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_PROPERTIES_ARM
+    1310, // QUEUE_FAMILY_DATA_GRAPH_PROPERTIES_ARM
+    1311, // PHYSICAL_DEVICE_QUEUE_FAMILY_DATA_GRAPH_PROCESSING_ENGINE_INFO_ARM
+    // extension 509
+    1530, // QUEUE_FAMILY_DATA_GRAPH_TOSA_PROPERTIES_ARM
+    // extension 511
+    1020, // PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_RENDER_AREAS_FEATURES_QCOM
+    1021, // MULTIVIEW_PER_VIEW_RENDER_AREAS_RENDER_PASS_BEGIN_INFO_QCOM
+    // extension 512
+    1170, // PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_PROPERTIES_KHR
+    // extension 513
+    1120,          // VIDEO_DECODE_AV1_CAPABILITIES_KHR
+    1121,          // VIDEO_DECODE_AV1_PICTURE_INFO_KHR
+    cNoValueIndex, // 1000512002
+    1122,          // VIDEO_DECODE_AV1_PROFILE_INFO_KHR
+    1123,          // VIDEO_DECODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1124,          // VIDEO_DECODE_AV1_DPB_SLOT_INFO_KHR
+    // extension 514
+    1313, // VIDEO_ENCODE_AV1_CAPABILITIES_KHR
+    1314, // VIDEO_ENCODE_AV1_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1315, // VIDEO_ENCODE_AV1_PICTURE_INFO_KHR
+    1316, // VIDEO_ENCODE_AV1_DPB_SLOT_INFO_KHR
+    1317, // PHYSICAL_DEVICE_VIDEO_ENCODE_AV1_FEATURES_KHR
+    1318, // VIDEO_ENCODE_AV1_PROFILE_INFO_KHR
+    1319, // VIDEO_ENCODE_AV1_RATE_CONTROL_INFO_KHR
+    1320, // VIDEO_ENCODE_AV1_RATE_CONTROL_LAYER_INFO_KHR
+    1321, // VIDEO_ENCODE_AV1_QUALITY_LEVEL_PROPERTIES_KHR
+    1322, // VIDEO_ENCODE_AV1_SESSION_CREATE_INFO_KHR
+    1323, // VIDEO_ENCODE_AV1_GOP_REMAINING_FRAME_INFO_KHR
+    // extension 515
+    1324, // PHYSICAL_DEVICE_VIDEO_DECODE_VP9_FEATURES_KHR
+    1325, // VIDEO_DECODE_VP9_CAPABILITIES_KHR
+    1326, // VIDEO_DECODE_VP9_PICTURE_INFO_KHR
+    1327, // VIDEO_DECODE_VP9_PROFILE_INFO_KHR
+    // extension 516
+    1125, // PHYSICAL_DEVICE_VIDEO_MAINTENANCE_1_FEATURES_KHR
+    1126, // VIDEO_INLINE_QUERY_INFO_KHR
+    // extension 517
+    1127, // PHYSICAL_DEVICE_PER_STAGE_DESCRIPTOR_SET_FEATURES_NV
+    // extension 519
+    1128, // PHYSICAL_DEVICE_IMAGE_PROCESSING_2_FEATURES_QCOM
+    1129, // PHYSICAL_DEVICE_IMAGE_PROCESSING_2_PROPERTIES_QCOM
+    1130, // SAMPLER_BLOCK_MATCH_WINDOW_CREATE_INFO_QCOM
+    // extension 520
+    1131, // SAMPLER_CUBIC_WEIGHTS_CREATE_INFO_QCOM
+    1132, // PHYSICAL_DEVICE_CUBIC_WEIGHTS_FEATURES_QCOM
+    1133, // BLIT_IMAGE_CUBIC_WEIGHTS_INFO_QCOM
+    // extension 521
+    1134, // PHYSICAL_DEVICE_YCBCR_DEGAMMA_FEATURES_QCOM
+    1135, // SAMPLER_YCBCR_CONVERSION_YCBCR_DEGAMMA_CREATE_INFO_QCOM
+    // extension 522
+    1136, // PHYSICAL_DEVICE_CUBIC_CLAMP_FEATURES_QCOM
+    // extension 525
+    1137, // PHYSICAL_DEVICE_ATTACHMENT_FEEDBACK_LOOP_DYNAMIC_STATE_FEATURES_EXT
+    // extension 526
+    235, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_KHR
+    // extension 528
+    1328, // PHYSICAL_DEVICE_UNIFIED_IMAGE_LAYOUTS_FEATURES_KHR
+    1329, // ATTACHMENT_FEEDBACK_LOOP_INFO_EXT
+    // extension 529
+    238, // PHYSICAL_DEVICE_SHADER_FLOAT_CONTROLS_2_FEATURES_KHR
+    // extension 530
+    1138, // SCREEN_BUFFER_PROPERTIES_QNX
+    1139, // SCREEN_BUFFER_FORMAT_PROPERTIES_QNX
+    1140, // IMPORT_SCREEN_BUFFER_INFO_QNX
+    1141, // EXTERNAL_FORMAT_QNX
+    1142, // PHYSICAL_DEVICE_EXTERNAL_MEMORY_SCREEN_BUFFER_FEATURES_QNX
+    // extension 531
+    1143, // PHYSICAL_DEVICE_LAYERED_DRIVER_PROPERTIES_MSFT
+    // extension 545
+    243, // PHYSICAL_DEVICE_SHADER_EXPECT_ASSUME_FEATURES_KHR
+    // extension 546
+    244,  // PHYSICAL_DEVICE_MAINTENANCE_6_FEATURES_KHR
+    245,  // PHYSICAL_DEVICE_MAINTENANCE_6_PROPERTIES_KHR
+    246,  // BIND_MEMORY_STATUS_KHR
+    247,  // BIND_DESCRIPTOR_SETS_INFO_KHR
+    248,  // PUSH_CONSTANTS_INFO_KHR
+    249,  // PUSH_DESCRIPTOR_SET_INFO_KHR
+    250,  // PUSH_DESCRIPTOR_SET_WITH_TEMPLATE_INFO_KHR
+    1145, // SET_DESCRIPTOR_BUFFER_OFFSETS_INFO_EXT
+    1146, // BIND_DESCRIPTOR_BUFFER_EMBEDDED_SAMPLERS_INFO_EXT
+    // extension 547
+    1147, // PHYSICAL_DEVICE_DESCRIPTOR_POOL_OVERALLOCATION_FEATURES_NV
+    // extension 548
+    1330, // PHYSICAL_DEVICE_TILE_MEMORY_HEAP_FEATURES_QCOM
+    1331, // PHYSICAL_DEVICE_TILE_MEMORY_HEAP_PROPERTIES_QCOM
+    1332, // TILE_MEMORY_REQUIREMENTS_QCOM
+    1333, // TILE_MEMORY_BIND_INFO_QCOM
+    1334, // TILE_MEMORY_SIZE_INFO_QCOM
+    // extension 550
+    1423,          // PHYSICAL_DEVICE_COPY_MEMORY_INDIRECT_FEATURES_KHR
+    cNoValueIndex, // 1000549001
+    1425,          // COPY_MEMORY_INDIRECT_INFO_KHR
+    1426,          // COPY_MEMORY_TO_IMAGE_INDIRECT_INFO_KHR
+    // extension 551
+    cNoValueIndex, // 1000550000
+    cNoValueIndex, // 1000550001
+    1430,          // DECOMPRESS_MEMORY_INFO_EXT
+    // extension 552
+    1335, // DISPLAY_SURFACE_STEREO_CREATE_INFO_NV
+    1336, // DISPLAY_MODE_STEREO_PROPERTIES_NV
+    // extension 553
+    1408, // VIDEO_ENCODE_INTRA_REFRESH_CAPABILITIES_KHR
+    1409, // VIDEO_ENCODE_SESSION_INTRA_REFRESH_CREATE_INFO_KHR
+    1410, // VIDEO_ENCODE_INTRA_REFRESH_INFO_KHR
+    1411, // VIDEO_REFERENCE_INTRA_REFRESH_INFO_KHR
+    1412, // PHYSICAL_DEVICE_VIDEO_ENCODE_INTRA_REFRESH_FEATURES_KHR
+    // extension 554
+    1337, // VIDEO_ENCODE_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1338, // VIDEO_FORMAT_QUANTIZATION_MAP_PROPERTIES_KHR
+    1339, // VIDEO_ENCODE_QUANTIZATION_MAP_INFO_KHR
+    1342, // VIDEO_ENCODE_H264_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1343, // VIDEO_ENCODE_H265_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1340, // VIDEO_ENCODE_QUANTIZATION_MAP_SESSION_PARAMETERS_CREATE_INFO_KHR
+    1344, // VIDEO_FORMAT_H265_QUANTIZATION_MAP_PROPERTIES_KHR
+    1345, // VIDEO_ENCODE_AV1_QUANTIZATION_MAP_CAPABILITIES_KHR
+    1346, // VIDEO_FORMAT_AV1_QUANTIZATION_MAP_PROPERTIES_KHR
+    1341, // PHYSICAL_DEVICE_VIDEO_ENCODE_QUANTIZATION_MAP_FEATURES_KHR
+    // extension 556
+    1151, // PHYSICAL_DEVICE_RAW_ACCESS_CHAINS_FEATURES_NV
+    // extension 557
+    1347, // EXTERNAL_COMPUTE_QUEUE_DEVICE_CREATE_INFO_NV
+    1348, // EXTERNAL_COMPUTE_QUEUE_CREATE_INFO_NV
+    1349, // EXTERNAL_COMPUTE_QUEUE_DATA_PARAMS_NV
+    1350, // PHYSICAL_DEVICE_EXTERNAL_COMPUTE_QUEUE_PROPERTIES_NV
+    // extension 559
+    1171, // PHYSICAL_DEVICE_SHADER_RELAXED_EXTENDED_INSTRUCTION_FEATURES_KHR
+    // extension 560
+    1172, // PHYSICAL_DEVICE_COMMAND_BUFFER_INHERITANCE_FEATURES_NV
+    // extension 563
+    1173, // PHYSICAL_DEVICE_MAINTENANCE_7_FEATURES_KHR
+    1174, // PHYSICAL_DEVICE_MAINTENANCE_7_PROPERTIES_KHR
+    1175, // PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_LIST_KHR
+    1176, // PHYSICAL_DEVICE_LAYERED_API_PROPERTIES_KHR
+    1177, // PHYSICAL_DEVICE_LAYERED_API_VULKAN_PROPERTIES_KHR
+    // extension 564
+    1152, // PHYSICAL_DEVICE_SHADER_ATOMIC_FLOAT16_VECTOR_FEATURES_NV
+    // extension 565
+    1178, // PHYSICAL_DEVICE_SHADER_REPLICATED_COMPOSITES_FEATURES_EXT
+    // extension 566
+    1578, // TENSOR_EXPLICIT_TILING_FORMAT_PROPERTIES_ARM
+    1579, // TENSOR_ROLLING_BACKING_CREATE_INFO_ARM
+    // extension 568
+    1351, // PHYSICAL_DEVICE_SHADER_FLOAT8_FEATURES_EXT
+    // extension 569
+    1153, // PHYSICAL_DEVICE_RAY_TRACING_VALIDATION_FEATURES_NV
+    // extension 570
+    1352, // PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_FEATURES_NV
+    1353, // PHYSICAL_DEVICE_CLUSTER_ACCELERATION_STRUCTURE_PROPERTIES_NV
+    1354, // CLUSTER_ACCELERATION_STRUCTURE_CLUSTERS_BOTTOM_LEVEL_INPUT_NV
+    1355, // CLUSTER_ACCELERATION_STRUCTURE_TRIANGLE_CLUSTER_INPUT_NV
+    1356, // CLUSTER_ACCELERATION_STRUCTURE_MOVE_OBJECTS_INPUT_NV
+    1357, // CLUSTER_ACCELERATION_STRUCTURE_INPUT_INFO_NV
+    1358, // CLUSTER_ACCELERATION_STRUCTURE_COMMANDS_INFO_NV
+    1359, // RAY_TRACING_PIPELINE_CLUSTER_ACCELERATION_STRUCTURE_CREATE_INFO_NV
+    // extension 571
+    1360, // PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_FEATURES_NV
+    1361, // PHYSICAL_DEVICE_PARTITIONED_ACCELERATION_STRUCTURE_PROPERTIES_NV
+    1362, // WRITE_DESCRIPTOR_SET_PARTITIONED_ACCELERATION_STRUCTURE_NV
+    1363, // PARTITIONED_ACCELERATION_STRUCTURE_INSTANCES_INPUT_NV
+    1364, // BUILD_PARTITIONED_ACCELERATION_STRUCTURE_INFO_NV
+    1365, // PARTITIONED_ACCELERATION_STRUCTURE_FLAGS_NV
+    // extension 573
+    1179,          // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_FEATURES_EXT
+    1180,          // PHYSICAL_DEVICE_DEVICE_GENERATED_COMMANDS_PROPERTIES_EXT
+    1181,          // GENERATED_COMMANDS_MEMORY_REQUIREMENTS_INFO_EXT
+    1182,          // INDIRECT_EXECUTION_SET_CREATE_INFO_EXT
+    1183,          // GENERATED_COMMANDS_INFO_EXT
+    cNoValueIndex, // 1000572005
+    1184,          // INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_EXT
+    1185,          // INDIRECT_COMMANDS_LAYOUT_TOKEN_EXT
+    1186,          // WRITE_INDIRECT_EXECUTION_SET_PIPELINE_EXT
+    1187,          // WRITE_INDIRECT_EXECUTION_SET_SHADER_EXT
+    1188,          // INDIRECT_EXECUTION_SET_PIPELINE_INFO_EXT
+    1189,          // INDIRECT_EXECUTION_SET_SHADER_INFO_EXT
+    1190,          // INDIRECT_EXECUTION_SET_SHADER_LAYOUT_INFO_EXT
+    1191,          // GENERATED_COMMANDS_PIPELINE_INFO_EXT
+    1192,          // GENERATED_COMMANDS_SHADER_INFO_EXT
+    // extension 574
+    1521, // PHYSICAL_DEVICE_FAULT_FEATURES_KHR
+    1522, // PHYSICAL_DEVICE_FAULT_PROPERTIES_KHR
+    1523, // DEVICE_FAULT_INFO_KHR
+    1524, // DEVICE_FAULT_DEBUG_INFO_KHR
+    // extension 575
+    1366,          // PHYSICAL_DEVICE_MAINTENANCE_8_FEATURES_KHR
+    cNoValueIndex, // 1000574001
+    1367,          // MEMORY_BARRIER_ACCESS_FLAGS_3_KHR
+    // extension 576
+    1193, // PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_FEATURES_MESA
+    1194, // PHYSICAL_DEVICE_IMAGE_ALIGNMENT_CONTROL_PROPERTIES_MESA
+    1195, // IMAGE_ALIGNMENT_CONTROL_CREATE_INFO_MESA
+    // extension 580
+    1427, // PHYSICAL_DEVICE_SHADER_FMA_FEATURES_KHR
+    // extension 581
+    1490, // PUSH_CONSTANT_BANK_INFO_NV
+    1491, // PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_FEATURES_NV
+    1492, // PHYSICAL_DEVICE_PUSH_CONSTANT_BANK_PROPERTIES_NV
+    // extension 582
+    1454, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_FEATURES_EXT
+    1455, // PHYSICAL_DEVICE_RAY_TRACING_INVOCATION_REORDER_PROPERTIES_EXT
+    // extension 583
+    1196, // PHYSICAL_DEVICE_DEPTH_CLAMP_CONTROL_FEATURES_EXT
+    1197, // PIPELINE_VIEWPORT_DEPTH_CLAMP_CONTROL_CREATE_INFO_EXT
+    // extension 585
+    1368, // PHYSICAL_DEVICE_MAINTENANCE_9_FEATURES_KHR
+    1369, // PHYSICAL_DEVICE_MAINTENANCE_9_PROPERTIES_KHR
+    1370, // QUEUE_FAMILY_OWNERSHIP_TRANSFER_PROPERTIES_KHR
+    // extension 587
+    1371, // PHYSICAL_DEVICE_VIDEO_MAINTENANCE_2_FEATURES_KHR
+    1372, // VIDEO_DECODE_H264_INLINE_SESSION_PARAMETERS_INFO_KHR
+    1373, // VIDEO_DECODE_H265_INLINE_SESSION_PARAMETERS_INFO_KHR
+    1374, // VIDEO_DECODE_AV1_INLINE_SESSION_PARAMETERS_INFO_KHR
+    // extension 588
+    1398, // OH_SURFACE_CREATE_INFO_OHOS
+    // extension 591
+    1375, // PHYSICAL_DEVICE_HDR_VIVID_FEATURES_HUAWEI
+    1376, // HDR_VIVID_DYNAMIC_METADATA_HUAWEI
+    // extension 594
+    1377, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_FEATURES_NV
+    1378, // COOPERATIVE_MATRIX_FLEXIBLE_DIMENSIONS_PROPERTIES_NV
+    1379, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_2_PROPERTIES_NV
+    // extension 597
+    1380, // PHYSICAL_DEVICE_PIPELINE_OPACITY_MICROMAP_FEATURES_ARM
+    // extension 599
+    1566, // PHYSICAL_DEVICE_VIDEO_ENCODE_FEEDBACK_2_FEATURES_KHR
+    1567, // VIDEO_ENCODE_FEEDBACK_2_CAPABILITIES_KHR
+    1568, // QUERY_POOL_VIDEO_ENCODE_PER_PARTITION_FEEDBACK_CREATE_INFO_KHR
+    // extension 603
+    1381, // IMPORT_MEMORY_METAL_HANDLE_INFO_EXT
+    1382, // MEMORY_METAL_HANDLE_PROPERTIES_EXT
+    1383, // MEMORY_GET_METAL_HANDLE_INFO_EXT
+    // extension 606
+    1447, // PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_FEATURES_ARM
+    1448, // PHYSICAL_DEVICE_PERFORMANCE_COUNTERS_BY_REGION_PROPERTIES_ARM
+    1449, // PERFORMANCE_COUNTER_ARM
+    1450, // PERFORMANCE_COUNTER_DESCRIPTION_ARM
+    1451, // RENDER_PASS_PERFORMANCE_COUNTERS_BY_REGION_BEGIN_INFO_ARM
+    // extension 608
+    1497, // PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_FEATURES_ARM
+    1498, // PHYSICAL_DEVICE_SHADER_INSTRUMENTATION_PROPERTIES_ARM
+    1499, // SHADER_INSTRUMENTATION_CREATE_INFO_ARM
+    1500, // SHADER_INSTRUMENTATION_METRIC_DESCRIPTION_ARM
+    // extension 609
+    1385, // PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_ROBUSTNESS_FEATURES_EXT
+    // extension 610
+    1386, // PHYSICAL_DEVICE_FORMAT_PACK_FEATURES_ARM
+    // extension 612
+    1387, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_FEATURES_VALVE
+    1388, // PHYSICAL_DEVICE_FRAGMENT_DENSITY_MAP_LAYERED_PROPERTIES_VALVE
+    1389, // PIPELINE_FRAGMENT_DENSITY_MAP_LAYERED_CREATE_INFO_VALVE
+    // extension 614
+    1392, // SET_PRESENT_CONFIG_NV
+    1393, // PHYSICAL_DEVICE_PRESENT_METERING_FEATURES_NV
+    // extension 617
+    1569, // PHYSICAL_DEVICE_MULTISAMPLED_RENDER_TO_SWAPCHAIN_FEATURES_EXT
+    1570, // SWAPCHAIN_FLAGS_SURFACE_CAPABILITIES_EXT
+    // extension 620
+    cNoValueIndex, // 1000619000
+    cNoValueIndex, // 1000619001
+    cNoValueIndex, // 1000619002
+    252,           // RENDERING_END_INFO_EXT
+    // extension 621
+    1397, // PHYSICAL_DEVICE_ZERO_INITIALIZE_DEVICE_MEMORY_FEATURES_EXT
+    // extension 624
+    1561, // PHYSICAL_DEVICE_OPACITY_MICROMAP_FEATURES_KHR
+    1562, // PHYSICAL_DEVICE_OPACITY_MICROMAP_PROPERTIES_KHR
+    1563, // ACCELERATION_STRUCTURE_GEOMETRY_MICROMAP_DATA_KHR
+    1564, // ACCELERATION_STRUCTURE_TRIANGLES_OPACITY_MICROMAP_KHR
+    // extension 628
+    1434, // PHYSICAL_DEVICE_SHADER_64_BIT_INDEXING_FEATURES_EXT
+    // extension 629
+    1456, // PHYSICAL_DEVICE_CUSTOM_RESOLVE_FEATURES_EXT
+    1457, // BEGIN_CUSTOM_RESOLVE_INFO_EXT
+    1458, // CUSTOM_RESOLVE_CREATE_INFO_EXT
+    // extension 630
+    1452, // PHYSICAL_DEVICE_DATA_GRAPH_MODEL_FEATURES_QCOM
+    1453, // DATA_GRAPH_PIPELINE_BUILTIN_MODEL_CREATE_INFO_QCOM
+    // extension 631
+    1435,          // PHYSICAL_DEVICE_MAINTENANCE_10_FEATURES_KHR
+    1436,          // PHYSICAL_DEVICE_MAINTENANCE_10_PROPERTIES_KHR
+    1437,          // RENDERING_ATTACHMENT_FLAGS_INFO_KHR
+    cNoValueIndex, // 1000630003
+    1439,          // RESOLVE_IMAGE_MODE_INFO_KHR
+    // extension 632
+    1532, // PHYSICAL_DEVICE_DATA_GRAPH_OPTICAL_FLOW_FEATURES_ARM
+    1533, // QUEUE_FAMILY_DATA_GRAPH_OPTICAL_FLOW_PROPERTIES_ARM
+    1537, // DATA_GRAPH_PIPELINE_OPTICAL_FLOW_CREATE_INFO_ARM
+    1534, // DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_INFO_ARM
+    1535, // DATA_GRAPH_OPTICAL_FLOW_IMAGE_FORMAT_PROPERTIES_ARM
+    1536, // DATA_GRAPH_PIPELINE_OPTICAL_FLOW_DISPATCH_INFO_ARM
+    1538, // DATA_GRAPH_PIPELINE_RESOURCE_INFO_IMAGE_LAYOUT_ARM
+    1539, // DATA_GRAPH_PIPELINE_SINGLE_NODE_CREATE_INFO_ARM
+    1540, // DATA_GRAPH_PIPELINE_SINGLE_NODE_CONNECTION_ARM
+    // extension 636
+    1472, // PHYSICAL_DEVICE_SHADER_LONG_VECTOR_FEATURES_EXT
+    1473, // PHYSICAL_DEVICE_SHADER_LONG_VECTOR_PROPERTIES_EXT
+    // extension 638
+    1414, // PHYSICAL_DEVICE_PIPELINE_CACHE_INCREMENTAL_MODE_FEATURES_SEC
+    // extension 643
+    1440, // PHYSICAL_DEVICE_SHADER_UNIFORM_BUFFER_UNSIZED_ARRAY_FEATURES_EXT
+    // extension 646
+    1469, // COMPUTE_OCCUPANCY_PRIORITY_PARAMETERS_NV
+    1470, // PHYSICAL_DEVICE_COMPUTE_OCCUPANCY_PRIORITY_FEATURES_NV
+    // extension 658
+    1541, // PHYSICAL_DEVICE_MAINTENANCE_11_FEATURES_KHR
+    1542, // QUEUE_FAMILY_OPTIMAL_IMAGE_TRANSFER_GRANULARITY_PROPERTIES_KHR
+    // extension 663
+    1493, // PHYSICAL_DEVICE_SHADER_SUBGROUP_PARTITIONED_FEATURES_EXT
+    // extension 665
+    1495, // UBM_SURFACE_CREATE_INFO_SEC
+    // extension 669
+    1571, // FORMAT_PROPERTIES_4_KHR
+    1572, // IMAGE_CREATE_FLAGS_2_CREATE_INFO_KHR
+    1573, // IMAGE_USAGE_FLAGS_2_CREATE_INFO_KHR
+    1574, // IMAGE_VIEW_USAGE_2_CREATE_INFO_KHR
+    1575, // PHYSICAL_DEVICE_EXTENDED_FLAGS_FEATURES_KHR
+    1576, // IMAGE_STENCIL_USAGE_2_CREATE_INFO_KHR
+    1577, // SHARED_PRESENT_SURFACE_CAPABILITIES_2_KHR
+    // extension 673
+    1580, // PHYSICAL_DEVICE_SHADER_OCP_MICROSCALING_TYPES_FEATURES_EXT
+    // extension 674
+    1496, // PHYSICAL_DEVICE_SHADER_MIXED_FLOAT_DOT_PRODUCT_FEATURES_VALVE
+    // extension 675
+    1543, // PHYSICAL_DEVICE_THROTTLE_HINT_FEATURES_SEC
+    1544, // THROTTLE_HINT_SUBMIT_INFO_SEC
+    // extension 677
+    1545, // DATA_GRAPH_PIPELINE_NEURAL_STATISTICS_CREATE_INFO_ARM
+    1546, // DATA_GRAPH_PIPELINE_SESSION_NEURAL_STATISTICS_CREATE_INFO_ARM
+    1547, // PHYSICAL_DEVICE_DATA_GRAPH_NEURAL_ACCELERATOR_STATISTICS_FEATURES_ARM
+    // extension 679
+    1531, // PHYSICAL_DEVICE_PRIMITIVE_RESTART_INDEX_FEATURES_EXT
+    // extension 686
+    1418, // SURFACE_CREATE_INFO_OHOS
+    // extension 690
+    1565, // PHYSICAL_DEVICE_COOPERATIVE_MATRIX_DECODE_VECTOR_FEATURES_NV
+};
+
 static char const *const VkSystemAllocationScopeStrings[5] = {
     "COMMAND",  // 0
     "OBJECT",   // 1
@@ -6681,6 +15557,14 @@ static int32_t const VkSystemAllocationScopeValues[5] = {
     4, // INSTANCE
 };
 
+static uint16_t const VkSystemAllocationScopeValueIndices[5] = {
+    0, // COMMAND
+    1, // OBJECT
+    2, // CACHE
+    3, // DEVICE
+    4, // INSTANCE
+};
+
 static char const *const VkInternalAllocationTypeStrings[1] = {
     "EXECUTABLE", // 0
 };
@@ -6689,6 +15573,10 @@ static int32_t const VkInternalAllocationTypeValues[1] = {
     0, // EXECUTABLE
 };
 
+static uint16_t const VkInternalAllocationTypeValueIndices[1] = {
+    0, // EXECUTABLE
+};
+
 static char const *const VkSamplerAddressModeStrings[6] = {
     "MIRROR_CLAMP_TO_EDGE_KHR", // 4
     "REPEAT",                   // 0
@@ -6707,6 +15595,14 @@ static int32_t const VkSamplerAddressModeValues[6] = {
     4, // MIRROR_CLAMP_TO_EDGE
 };
 
+static uint16_t const VkSamplerAddressModeValueIndices[5] = {
+    1, // REPEAT
+    2, // MIRRORED_REPEAT
+    3, // CLAMP_TO_EDGE
+    4, // CLAMP_TO_BORDER
+    0, // MIRROR_CLAMP_TO_EDGE_KHR
+};
+
 static char const *const VkFilterStrings[4] = {
     "CUBIC_IMG", // 1000015000
     "NEAREST",   // 0
@@ -6721,6 +15617,19 @@ static int32_t const VkFilterValues[4] = {
     1000015000, // CUBIC_EXT
 };
 
+static uint16_t const VkFilterValueIndices[2] = {
+    1, // NEAREST
+    2, // LINEAR
+};
+
+static int32_t const VkFilterSortedValues[1] = {
+    1000015000, // CUBIC_IMG
+};
+
+static uint16_t const VkFilterSortedIndices[1] = {
+    0, // CUBIC_IMG
+};
+
 static char const *const VkSamplerMipmapModeStrings[2] = {
     "NEAREST", // 0
     "LINEAR",  // 1
@@ -6731,6 +15640,11 @@ static int32_t const VkSamplerMipmapModeValues[2] = {
     1, // LINEAR
 };
 
+static uint16_t const VkSamplerMipmapModeValueIndices[2] = {
+    0, // NEAREST
+    1, // LINEAR
+};
+
 static char const *const VkVertexInputRateStrings[2] = {
     "VERTEX",   // 0
     "INSTANCE", // 1
@@ -6741,6 +15655,11 @@ static int32_t const VkVertexInputRateValues[2] = {
     1, // INSTANCE
 };
 
+static uint16_t const VkVertexInputRateValueIndices[2] = {
+    0, // VERTEX
+    1, // INSTANCE
+};
+
 static char const *const VkClusterAccelerationStructureTypeNVStrings[3] = {
     "CLUSTERS_BOTTOM_LEVEL",     // 0
     "TRIANGLE_CLUSTER",          // 1
@@ -6753,6 +15672,12 @@ static int32_t const VkClusterAccelerationStructureTypeNVValues[3] = {
     2, // TRIANGLE_CLUSTER_TEMPLATE
 };
 
+static uint16_t const VkClusterAccelerationStructureTypeNVValueIndices[3] = {
+    0, // CLUSTERS_BOTTOM_LEVEL
+    1, // TRIANGLE_CLUSTER
+    2, // TRIANGLE_CLUSTER_TEMPLATE
+};
+
 static char const *const VkClusterAccelerationStructureOpTypeNVStrings[6] = {
     "MOVE_OBJECTS",                    // 0
     "BUILD_CLUSTERS_BOTTOM_LEVEL",     // 1
@@ -6771,6 +15696,15 @@ static int32_t const VkClusterAccelerationStructureOpTypeNVValues[6] = {
     5, // GET_CLUSTER_TEMPLATE_INDICES
 };
 
+static uint16_t const VkClusterAccelerationStructureOpTypeNVValueIndices[6] = {
+    0, // MOVE_OBJECTS
+    1, // BUILD_CLUSTERS_BOTTOM_LEVEL
+    2, // BUILD_TRIANGLE_CLUSTER
+    3, // BUILD_TRIANGLE_CLUSTER_TEMPLATE
+    4, // INSTANTIATE_TRIANGLE_CLUSTER
+    5, // GET_CLUSTER_TEMPLATE_INDICES
+};
+
 static char const *const VkClusterAccelerationStructureOpModeNVStrings[3] = {
     "IMPLICIT_DESTINATIONS", // 0
     "EXPLICIT_DESTINATIONS", // 1
@@ -6783,6 +15717,12 @@ static int32_t const VkClusterAccelerationStructureOpModeNVValues[3] = {
     2, // COMPUTE_SIZES
 };
 
+static uint16_t const VkClusterAccelerationStructureOpModeNVValueIndices[3] = {
+    0, // IMPLICIT_DESTINATIONS
+    1, // EXPLICIT_DESTINATIONS
+    2, // COMPUTE_SIZES
+};
+
 static char const *const VkObjectTypeStrings[67] = {
     "DESCRIPTOR_UPDATE_TEMPLATE_KHR",  // 1000085000
     "SAMPLER_YCBCR_CONVERSION_KHR",    // 1000156000
@@ -6923,6 +15863,115 @@ static int32_t const VkObjectTypeValues[67] = {
     1000133000, // GPA_SESSION_AMD
 };
 
+static uint16_t const VkObjectTypeValueIndices[26] = {
+    3,  // UNKNOWN
+    4,  // INSTANCE
+    5,  // PHYSICAL_DEVICE
+    6,  // DEVICE
+    7,  // QUEUE
+    8,  // SEMAPHORE
+    9,  // COMMAND_BUFFER
+    10, // FENCE
+    11, // DEVICE_MEMORY
+    12, // BUFFER
+    13, // IMAGE
+    14, // EVENT
+    15, // QUERY_POOL
+    16, // BUFFER_VIEW
+    17, // IMAGE_VIEW
+    18, // SHADER_MODULE
+    19, // PIPELINE_CACHE
+    20, // PIPELINE_LAYOUT
+    21, // RENDER_PASS
+    22, // PIPELINE
+    23, // DESCRIPTOR_SET_LAYOUT
+    24, // SAMPLER
+    25, // DESCRIPTOR_POOL
+    26, // DESCRIPTOR_SET
+    27, // FRAMEBUFFER
+    28, // COMMAND_POOL
+};
+
+static int32_t const VkObjectTypeSortedValues[37] = {
+    1000000000, // SURFACE_KHR
+    1000001000, // SWAPCHAIN_KHR
+    1000002000, // DISPLAY_KHR
+    1000002001, // DISPLAY_MODE_KHR
+    1000011000, // DEBUG_REPORT_CALLBACK_EXT
+    1000023000, // VIDEO_SESSION_KHR
+    1000023001, // VIDEO_SESSION_PARAMETERS_KHR
+    1000029000, // CU_MODULE_NVX
+    1000029001, // CU_FUNCTION_NVX
+    1000085000, // DESCRIPTOR_UPDATE_TEMPLATE_KHR
+    1000086000, // OBJECT_TABLE_NVX
+    1000086001, // INDIRECT_COMMANDS_LAYOUT_NVX
+    1000128000, // DEBUG_UTILS_MESSENGER_EXT
+    1000133000, // GPA_SESSION_AMD
+    1000150000, // ACCELERATION_STRUCTURE_KHR
+    1000156000, // SAMPLER_YCBCR_CONVERSION_KHR
+    1000160000, // VALIDATION_CACHE_EXT
+    1000165000, // ACCELERATION_STRUCTURE_NVX
+    1000210000, // PERFORMANCE_CONFIGURATION_INTEL
+    1000268000, // DEFERRED_OPERATION_KHR
+    1000277000, // INDIRECT_COMMANDS_LAYOUT_NV
+    1000295000, // PRIVATE_DATA_SLOT_EXT
+    1000307000, // CUDA_MODULE_NV
+    1000307001, // CUDA_FUNCTION_NV
+    1000366000, // BUFFER_COLLECTION_FUCHSIA
+    1000396000, // MICROMAP_EXT
+    1000460000, // TENSOR_ARM
+    1000460001, // TENSOR_VIEW_ARM
+    1000464000, // OPTICAL_FLOW_SESSION_NV
+    1000482000, // SHADER_EXT
+    1000483000, // PIPELINE_BINARY_KHR
+    1000489000, // SEMAPHORE_SCI_SYNC_POOL_NV
+    1000507000, // DATA_GRAPH_PIPELINE_SESSION_ARM
+    1000556000, // EXTERNAL_COMPUTE_QUEUE_NV
+    1000572000, // INDIRECT_COMMANDS_LAYOUT_EXT
+    1000572001, // INDIRECT_EXECUTION_SET_EXT
+    1000607000, // SHADER_INSTRUMENTATION_ARM
+};
+
+static uint16_t const VkObjectTypeSortedIndices[37] = {
+    31, // SURFACE_KHR
+    32, // SWAPCHAIN_KHR
+    33, // DISPLAY_KHR
+    34, // DISPLAY_MODE_KHR
+    35, // DEBUG_REPORT_CALLBACK_EXT
+    46, // VIDEO_SESSION_KHR
+    47, // VIDEO_SESSION_PARAMETERS_KHR
+    48, // CU_MODULE_NVX
+    49, // CU_FUNCTION_NVX
+    0,  // DESCRIPTOR_UPDATE_TEMPLATE_KHR
+    38, // OBJECT_TABLE_NVX
+    39, // INDIRECT_COMMANDS_LAYOUT_NVX
+    36, // DEBUG_UTILS_MESSENGER_EXT
+    66, // GPA_SESSION_AMD
+    43, // ACCELERATION_STRUCTURE_KHR
+    1,  // SAMPLER_YCBCR_CONVERSION_KHR
+    37, // VALIDATION_CACHE_EXT
+    40, // ACCELERATION_STRUCTURE_NVX
+    42, // PERFORMANCE_CONFIGURATION_INTEL
+    44, // DEFERRED_OPERATION_KHR
+    45, // INDIRECT_COMMANDS_LAYOUT_NV
+    2,  // PRIVATE_DATA_SLOT_EXT
+    56, // CUDA_MODULE_NV
+    57, // CUDA_FUNCTION_NV
+    50, // BUFFER_COLLECTION_FUCHSIA
+    52, // MICROMAP_EXT
+    62, // TENSOR_ARM
+    63, // TENSOR_VIEW_ARM
+    53, // OPTICAL_FLOW_SESSION_NV
+    55, // SHADER_EXT
+    58, // PIPELINE_BINARY_KHR
+    54, // SEMAPHORE_SCI_SYNC_POOL_NV
+    64, // DATA_GRAPH_PIPELINE_SESSION_ARM
+    61, // EXTERNAL_COMPUTE_QUEUE_NV
+    59, // INDIRECT_COMMANDS_LAYOUT_EXT
+    60, // INDIRECT_EXECUTION_SET_EXT
+    65, // SHADER_INSTRUMENTATION_ARM
+};
+
 static char const *const VkRayTracingInvocationReorderModeEXTStrings[4] = {
     "NONE_NV",    // 0
     "REORDER_NV", // 1
@@ -6937,6 +15986,11 @@ static int32_t const VkRayTracingInvocationReorderModeEXTValues[4] = {
     1, // REORDER
 };
 
+static uint16_t const VkRayTracingInvocationReorderModeEXTValueIndices[2] = {
+    0, // NONE_NV
+    1, // REORDER_NV
+};
+
 static char const *const VkIndirectCommandsTokenTypeNVStrings[12] = {
     "SHADER_GROUP",    // 0
     "STATE_FLAGS",     // 1
@@ -6967,6 +16021,31 @@ static int32_t const VkIndirectCommandsTokenTypeNVValues[12] = {
     1000135000, // PUSH_DATA
 };
 
+static uint16_t const VkIndirectCommandsTokenTypeNVValueIndices[8] = {
+    0, // SHADER_GROUP
+    1, // STATE_FLAGS
+    2, // INDEX_BUFFER
+    3, // VERTEX_BUFFER
+    4, // PUSH_CONSTANT
+    5, // DRAW_INDEXED
+    6, // DRAW
+    7, // DRAW_TASKS
+};
+
+static int32_t const VkIndirectCommandsTokenTypeNVSortedValues[4] = {
+    1000135000, // PUSH_DATA
+    1000328000, // DRAW_MESH_TASKS
+    1000428003, // PIPELINE
+    1000428004, // DISPATCH
+};
+
+static uint16_t const VkIndirectCommandsTokenTypeNVSortedIndices[4] = {
+    11, // PUSH_DATA
+    8,  // DRAW_MESH_TASKS
+    9,  // PIPELINE
+    10, // DISPATCH
+};
+
 static char const *const VkDescriptorUpdateTemplateTypeStrings[4] = {
     "PUSH_DESCRIPTORS_KHR", // 1
     "DESCRIPTOR_SET_KHR",   // 0
@@ -6981,6 +16060,11 @@ static int32_t const VkDescriptorUpdateTemplateTypeValues[4] = {
     1, // PUSH_DESCRIPTORS
 };
 
+static uint16_t const VkDescriptorUpdateTemplateTypeValueIndices[2] = {
+    1, // DESCRIPTOR_SET_KHR
+    0, // PUSH_DESCRIPTORS_KHR
+};
+
 static char const *const VkViewportCoordinateSwizzleNVStrings[8] = {
     "POSITIVE_X", // 0
     "NEGATIVE_X", // 1
@@ -7003,6 +16087,17 @@ static int32_t const VkViewportCoordinateSwizzleNVValues[8] = {
     7, // NEGATIVE_W
 };
 
+static uint16_t const VkViewportCoordinateSwizzleNVValueIndices[8] = {
+    0, // POSITIVE_X
+    1, // NEGATIVE_X
+    2, // POSITIVE_Y
+    3, // NEGATIVE_Y
+    4, // POSITIVE_Z
+    5, // NEGATIVE_Z
+    6, // POSITIVE_W
+    7, // NEGATIVE_W
+};
+
 static char const *const VkDiscardRectangleModeEXTStrings[2] = {
     "INCLUSIVE", // 0
     "EXCLUSIVE", // 1
@@ -7013,6 +16108,11 @@ static int32_t const VkDiscardRectangleModeEXTValues[2] = {
     1, // EXCLUSIVE
 };
 
+static uint16_t const VkDiscardRectangleModeEXTValueIndices[2] = {
+    0, // INCLUSIVE
+    1, // EXCLUSIVE
+};
+
 static char const *const VkPointClippingBehaviorStrings[4] = {
     "ALL_CLIP_PLANES_KHR",       // 0
     "USER_CLIP_PLANES_ONLY_KHR", // 1
@@ -7027,6 +16127,11 @@ static int32_t const VkPointClippingBehaviorValues[4] = {
     1, // USER_CLIP_PLANES_ONLY
 };
 
+static uint16_t const VkPointClippingBehaviorValueIndices[2] = {
+    0, // ALL_CLIP_PLANES_KHR
+    1, // USER_CLIP_PLANES_ONLY_KHR
+};
+
 static char const *const VkCoverageModulationModeNVStrings[4] = {
     "NONE",  // 0
     "RGB",   // 1
@@ -7041,6 +16146,13 @@ static int32_t const VkCoverageModulationModeNVValues[4] = {
     3, // RGBA
 };
 
+static uint16_t const VkCoverageModulationModeNVValueIndices[4] = {
+    0, // NONE
+    1, // RGB
+    2, // ALPHA
+    3, // RGBA
+};
+
 static char const *const VkCoverageReductionModeNVStrings[2] = {
     "MERGE",    // 0
     "TRUNCATE", // 1
@@ -7051,6 +16163,11 @@ static int32_t const VkCoverageReductionModeNVValues[2] = {
     1, // TRUNCATE
 };
 
+static uint16_t const VkCoverageReductionModeNVValueIndices[2] = {
+    0, // MERGE
+    1, // TRUNCATE
+};
+
 static char const *const VkValidationCacheHeaderVersionEXTStrings[1] = {
     "ONE", // 1
 };
@@ -7059,6 +16176,11 @@ static int32_t const VkValidationCacheHeaderVersionEXTValues[1] = {
     1, // ONE
 };
 
+static uint16_t const VkValidationCacheHeaderVersionEXTValueIndices[2] = {
+    cNoValueIndex, // 0
+    0,             // ONE
+};
+
 static char const *const VkShaderInfoTypeAMDStrings[3] = {
     "STATISTICS",  // 0
     "BINARY",      // 1
@@ -7071,6 +16193,12 @@ static int32_t const VkShaderInfoTypeAMDValues[3] = {
     2, // DISASSEMBLY
 };
 
+static uint16_t const VkShaderInfoTypeAMDValueIndices[3] = {
+    0, // STATISTICS
+    1, // BINARY
+    2, // DISASSEMBLY
+};
+
 static char const *const VkQueueGlobalPriorityStrings[12] = {
     "LOW_EXT",      // 128
     "MEDIUM_EXT",   // 256
@@ -7101,6 +16229,20 @@ static int32_t const VkQueueGlobalPriorityValues[12] = {
     1024, // REALTIME
 };
 
+static int32_t const VkQueueGlobalPrioritySortedValues[4] = {
+    128,  // LOW_EXT
+    256,  // MEDIUM_EXT
+    512,  // HIGH_EXT
+    1024, // REALTIME_EXT
+};
+
+static uint16_t const VkQueueGlobalPrioritySortedIndices[4] = {
+    0, // LOW_EXT
+    1, // MEDIUM_EXT
+    2, // HIGH_EXT
+    3, // REALTIME_EXT
+};
+
 static char const *const VkTimeDomainKHRStrings[10] = {
     "DEVICE_EXT",                    // 0
     "CLOCK_MONOTONIC_EXT",           // 1
@@ -7127,6 +16269,23 @@ static int32_t const VkTimeDomainKHRValues[10] = {
     1000208001, // SWAPCHAIN_LOCAL_EXT
 };
 
+static uint16_t const VkTimeDomainKHRValueIndices[4] = {
+    0, // DEVICE_EXT
+    1, // CLOCK_MONOTONIC_EXT
+    2, // CLOCK_MONOTONIC_RAW_EXT
+    3, // QUERY_PERFORMANCE_COUNTER_EXT
+};
+
+static int32_t const VkTimeDomainKHRSortedValues[2] = {
+    1000208000, // PRESENT_STAGE_LOCAL_EXT
+    1000208001, // SWAPCHAIN_LOCAL_EXT
+};
+
+static uint16_t const VkTimeDomainKHRSortedIndices[2] = {
+    8, // PRESENT_STAGE_LOCAL_EXT
+    9, // SWAPCHAIN_LOCAL_EXT
+};
+
 static char const *const VkConservativeRasterizationModeEXTStrings[3] = {
     "DISABLED",      // 0
     "OVERESTIMATE",  // 1
@@ -7139,6 +16298,12 @@ static int32_t const VkConservativeRasterizationModeEXTValues[3] = {
     2, // UNDERESTIMATE
 };
 
+static uint16_t const VkConservativeRasterizationModeEXTValueIndices[3] = {
+    0, // DISABLED
+    1, // OVERESTIMATE
+    2, // UNDERESTIMATE
+};
+
 static char const *const VkSemaphoreTypeStrings[4] = {
     "BINARY_KHR",   // 0
     "TIMELINE_KHR", // 1
@@ -7153,6 +16318,11 @@ static int32_t const VkSemaphoreTypeValues[4] = {
     1, // TIMELINE
 };
 
+static uint16_t const VkSemaphoreTypeValueIndices[2] = {
+    0, // BINARY_KHR
+    1, // TIMELINE_KHR
+};
+
 static char const *const VkBuildAccelerationStructureModeKHRStrings[2] = {
     "BUILD",  // 0
     "UPDATE", // 1
@@ -7163,6 +16333,11 @@ static int32_t const VkBuildAccelerationStructureModeKHRValues[2] = {
     1, // UPDATE
 };
 
+static uint16_t const VkBuildAccelerationStructureModeKHRValueIndices[2] = {
+    0, // BUILD
+    1, // UPDATE
+};
+
 static char const *const VkCopyAccelerationStructureModeKHRStrings[6] = {
     "CLONE_NV",    // 0
     "COMPACT_NV",  // 1
@@ -7181,6 +16356,13 @@ static int32_t const VkCopyAccelerationStructureModeKHRValues[6] = {
     3, // DESERIALIZE
 };
 
+static uint16_t const VkCopyAccelerationStructureModeKHRValueIndices[4] = {
+    0, // CLONE_NV
+    1, // COMPACT_NV
+    4, // SERIALIZE
+    5, // DESERIALIZE
+};
+
 static char const *const VkAccelerationStructureTypeKHRStrings[6] = {
     "TOP_LEVEL_NV",     // 0
     "BOTTOM_LEVEL_NV",  // 1
@@ -7199,6 +16381,20 @@ static int32_t const VkAccelerationStructureTypeKHRValues[6] = {
     1000623000, // OPACITY_MICROMAP
 };
 
+static uint16_t const VkAccelerationStructureTypeKHRValueIndices[3] = {
+    0, // TOP_LEVEL_NV
+    1, // BOTTOM_LEVEL_NV
+    4, // GENERIC
+};
+
+static int32_t const VkAccelerationStructureTypeKHRSortedValues[1] = {
+    1000623000, // OPACITY_MICROMAP
+};
+
+static uint16_t const VkAccelerationStructureTypeKHRSortedIndices[1] = {
+    5, // OPACITY_MICROMAP
+};
+
 static char const *const VkGeometryTypeKHRStrings[9] = {
     "TRIANGLES_NV",                         // 0
     "AABBS_NV",                             // 1
@@ -7223,6 +16419,26 @@ static int32_t const VkGeometryTypeKHRValues[9] = {
     1000623000, // MICROMAP
 };
 
+static uint16_t const VkGeometryTypeKHRValueIndices[3] = {
+    0, // TRIANGLES_NV
+    1, // AABBS_NV
+    4, // INSTANCES
+};
+
+static int32_t const VkGeometryTypeKHRSortedValues[4] = {
+    1000429004, // SPHERES_NV
+    1000429005, // LINEAR_SWEPT_SPHERES_NV
+    1000478000, // DENSE_GEOMETRY_FORMAT_TRIANGLES_AMDX
+    1000623000, // MICROMAP
+};
+
+static uint16_t const VkGeometryTypeKHRSortedIndices[4] = {
+    5, // SPHERES_NV
+    6, // LINEAR_SWEPT_SPHERES_NV
+    7, // DENSE_GEOMETRY_FORMAT_TRIANGLES_AMDX
+    8, // MICROMAP
+};
+
 static char const *const VkRayTracingShaderGroupTypeKHRStrings[6] = {
     "GENERAL_NV",              // 0
     "TRIANGLES_HIT_GROUP_NV",  // 1
@@ -7241,6 +16457,12 @@ static int32_t const VkRayTracingShaderGroupTypeKHRValues[6] = {
     2, // PROCEDURAL_HIT_GROUP
 };
 
+static uint16_t const VkRayTracingShaderGroupTypeKHRValueIndices[3] = {
+    0, // GENERAL_NV
+    1, // TRIANGLES_HIT_GROUP_NV
+    2, // PROCEDURAL_HIT_GROUP_NV
+};
+
 static char const *const VkAccelerationStructureBuildTypeKHRStrings[3] = {
     "HOST",           // 0
     "DEVICE",         // 1
@@ -7253,6 +16475,12 @@ static int32_t const VkAccelerationStructureBuildTypeKHRValues[3] = {
     2, // HOST_OR_DEVICE
 };
 
+static uint16_t const VkAccelerationStructureBuildTypeKHRValueIndices[3] = {
+    0, // HOST
+    1, // DEVICE
+    2, // HOST_OR_DEVICE
+};
+
 static char const *const VkAccelerationStructureCompatibilityKHRStrings[2] = {
     "COMPATIBLE",   // 0
     "INCOMPATIBLE", // 1
@@ -7263,6 +16491,11 @@ static int32_t const VkAccelerationStructureCompatibilityKHRValues[2] = {
     1, // INCOMPATIBLE
 };
 
+static uint16_t const VkAccelerationStructureCompatibilityKHRValueIndices[2] = {
+    0, // COMPATIBLE
+    1, // INCOMPATIBLE
+};
+
 static char const *const VkRayTracingLssIndexingModeNVStrings[2] = {
     "LIST",       // 0
     "SUCCESSIVE", // 1
@@ -7273,6 +16506,11 @@ static int32_t const VkRayTracingLssIndexingModeNVValues[2] = {
     1, // SUCCESSIVE
 };
 
+static uint16_t const VkRayTracingLssIndexingModeNVValueIndices[2] = {
+    0, // LIST
+    1, // SUCCESSIVE
+};
+
 static char const *const VkRayTracingLssPrimitiveEndCapsModeNVStrings[2] = {
     "NONE",    // 0
     "CHAINED", // 1
@@ -7283,6 +16521,11 @@ static int32_t const VkRayTracingLssPrimitiveEndCapsModeNVValues[2] = {
     1, // CHAINED
 };
 
+static uint16_t const VkRayTracingLssPrimitiveEndCapsModeNVValueIndices[2] = {
+    0, // NONE
+    1, // CHAINED
+};
+
 static char const *const VkShaderGroupShaderKHRStrings[4] = {
     "GENERAL",      // 0
     "CLOSEST_HIT",  // 1
@@ -7297,6 +16540,13 @@ static int32_t const VkShaderGroupShaderKHRValues[4] = {
     3, // INTERSECTION
 };
 
+static uint16_t const VkShaderGroupShaderKHRValueIndices[4] = {
+    0, // GENERAL
+    1, // CLOSEST_HIT
+    2, // ANY_HIT
+    3, // INTERSECTION
+};
+
 static char const *const VkMemoryOverallocationBehaviorAMDStrings[3] = {
     "DEFAULT",    // 0
     "ALLOWED",    // 1
@@ -7309,6 +16559,12 @@ static int32_t const VkMemoryOverallocationBehaviorAMDValues[3] = {
     2, // DISALLOWED
 };
 
+static uint16_t const VkMemoryOverallocationBehaviorAMDValueIndices[3] = {
+    0, // DEFAULT
+    1, // ALLOWED
+    2, // DISALLOWED
+};
+
 static char const *const VkPerformanceCounterScopeKHRStrings[6] = {
     "VK_QUERY_SCOPE_COMMAND_BUFFER", // 0
     "VK_QUERY_SCOPE_RENDER_PASS",    // 1
@@ -7327,6 +16583,12 @@ static int32_t const VkPerformanceCounterScopeKHRValues[6] = {
     2, // COMMAND
 };
 
+static uint16_t const VkPerformanceCounterScopeKHRValueIndices[3] = {
+    0, // VK_QUERY_SCOPE_COMMAND_BUFFER
+    1, // VK_QUERY_SCOPE_RENDER_PASS
+    2, // VK_QUERY_SCOPE_COMMAND
+};
+
 static char const *const VkPerformanceCounterUnitKHRStrings[11] = {
     "GENERIC",          // 0
     "PERCENTAGE",       // 1
@@ -7341,7 +16603,21 @@ static char const *const VkPerformanceCounterUnitKHRStrings[11] = {
     "CYCLES",           // 10
 };
 
-static int32_t const VkPerformanceCounterUnitKHRValues[11] = {
+static int32_t const VkPerformanceCounterUnitKHRValues[11] = {
+    0,  // GENERIC
+    1,  // PERCENTAGE
+    2,  // NANOSECONDS
+    3,  // BYTES
+    4,  // BYTES_PER_SECOND
+    5,  // KELVIN
+    6,  // WATTS
+    7,  // VOLTS
+    8,  // AMPS
+    9,  // HERTZ
+    10, // CYCLES
+};
+
+static uint16_t const VkPerformanceCounterUnitKHRValueIndices[11] = {
     0,  // GENERIC
     1,  // PERCENTAGE
     2,  // NANOSECONDS
@@ -7373,6 +16649,15 @@ static int32_t const VkPerformanceCounterStorageKHRValues[6] = {
     5, // FLOAT64
 };
 
+static uint16_t const VkPerformanceCounterStorageKHRValueIndices[6] = {
+    0, // INT32
+    1, // INT64
+    2, // UINT32
+    3, // UINT64
+    4, // FLOAT32
+    5, // FLOAT64
+};
+
 static char const *const VkPerformanceConfigurationTypeINTELStrings[1] = {
     "COMMAND_QUEUE_METRICS_DISCOVERY_ACTIVATED", // 0
 };
@@ -7381,6 +16666,10 @@ static int32_t const VkPerformanceConfigurationTypeINTELValues[1] = {
     0, // COMMAND_QUEUE_METRICS_DISCOVERY_ACTIVATED
 };
 
+static uint16_t const VkPerformanceConfigurationTypeINTELValueIndices[1] = {
+    0, // COMMAND_QUEUE_METRICS_DISCOVERY_ACTIVATED
+};
+
 static char const *const VkQueryPoolSamplingModeINTELStrings[1] = {
     "MANUAL", // 0
 };
@@ -7389,6 +16678,10 @@ static int32_t const VkQueryPoolSamplingModeINTELValues[1] = {
     0, // MANUAL
 };
 
+static uint16_t const VkQueryPoolSamplingModeINTELValueIndices[1] = {
+    0, // MANUAL
+};
+
 static char const *const VkPerformanceOverrideTypeINTELStrings[2] = {
     "NULL_HARDWARE",    // 0
     "FLUSH_GPU_CACHES", // 1
@@ -7399,6 +16692,11 @@ static int32_t const VkPerformanceOverrideTypeINTELValues[2] = {
     1, // FLUSH_GPU_CACHES
 };
 
+static uint16_t const VkPerformanceOverrideTypeINTELValueIndices[2] = {
+    0, // NULL_HARDWARE
+    1, // FLUSH_GPU_CACHES
+};
+
 static char const *const VkPerformanceParameterTypeINTELStrings[2] = {
     "HW_COUNTERS_SUPPORTED",    // 0
     "STREAM_MARKER_VALID_BITS", // 1
@@ -7409,6 +16707,11 @@ static int32_t const VkPerformanceParameterTypeINTELValues[2] = {
     1, // STREAM_MARKER_VALID_BITS
 };
 
+static uint16_t const VkPerformanceParameterTypeINTELValueIndices[2] = {
+    0, // HW_COUNTERS_SUPPORTED
+    1, // STREAM_MARKER_VALID_BITS
+};
+
 static char const *const VkPerformanceValueTypeINTELStrings[5] = {
     "UINT32", // 0
     "UINT64", // 1
@@ -7425,6 +16728,14 @@ static int32_t const VkPerformanceValueTypeINTELValues[5] = {
     4, // STRING
 };
 
+static uint16_t const VkPerformanceValueTypeINTELValueIndices[5] = {
+    0, // UINT32
+    1, // UINT64
+    2, // FLOAT
+    3, // BOOL
+    4, // STRING
+};
+
 static char const *const VkLineRasterizationModeStrings[12] = {
     "DEFAULT_EXT",            // 0
     "RECTANGULAR_EXT",        // 1
@@ -7455,6 +16766,13 @@ static int32_t const VkLineRasterizationModeValues[12] = {
     3, // RECTANGULAR_SMOOTH
 };
 
+static uint16_t const VkLineRasterizationModeValueIndices[4] = {
+    0, // DEFAULT_EXT
+    1, // RECTANGULAR_EXT
+    2, // BRESENHAM_EXT
+    3, // RECTANGULAR_SMOOTH_EXT
+};
+
 static char const *const VkFaultLevelStrings[4] = {
     "UNASSIGNED",  // 0
     "CRITICAL",    // 1
@@ -7469,6 +16787,13 @@ static int32_t const VkFaultLevelValues[4] = {
     3, // WARNING
 };
 
+static uint16_t const VkFaultLevelValueIndices[4] = {
+    0, // UNASSIGNED
+    1, // CRITICAL
+    2, // RECOVERABLE
+    3, // WARNING
+};
+
 static char const *const VkFaultTypeStrings[7] = {
     "INVALID",             // 0
     "UNASSIGNED",          // 1
@@ -7489,6 +16814,16 @@ static int32_t const VkFaultTypeValues[7] = {
     6, // INVALID_API_USAGE
 };
 
+static uint16_t const VkFaultTypeValueIndices[7] = {
+    0, // INVALID
+    1, // UNASSIGNED
+    2, // IMPLEMENTATION
+    3, // SYSTEM
+    4, // PHYSICAL_DEVICE
+    5, // COMMAND_BUFFER_FULL
+    6, // INVALID_API_USAGE
+};
+
 static char const *const VkFaultQueryBehaviorStrings[1] = {
     "GET_AND_CLEAR_ALL_FAULTS", // 0
 };
@@ -7497,6 +16832,10 @@ static int32_t const VkFaultQueryBehaviorValues[1] = {
     0, // GET_AND_CLEAR_ALL_FAULTS
 };
 
+static uint16_t const VkFaultQueryBehaviorValueIndices[1] = {
+    0, // GET_AND_CLEAR_ALL_FAULTS
+};
+
 static char const *const VkPipelineMatchControlStrings[1] = {
     "APPLICATION_UUID_EXACT_MATCH", // 0
 };
@@ -7505,6 +16844,10 @@ static int32_t const VkPipelineMatchControlValues[1] = {
     0, // APPLICATION_UUID_EXACT_MATCH
 };
 
+static uint16_t const VkPipelineMatchControlValueIndices[1] = {
+    0, // APPLICATION_UUID_EXACT_MATCH
+};
+
 static char const *const VkSciSyncClientTypeNVStrings[3] = {
     "SIGNALER",        // 0
     "WAITER",          // 1
@@ -7517,6 +16860,12 @@ static int32_t const VkSciSyncClientTypeNVValues[3] = {
     2, // SIGNALER_WAITER
 };
 
+static uint16_t const VkSciSyncClientTypeNVValueIndices[3] = {
+    0, // SIGNALER
+    1, // WAITER
+    2, // SIGNALER_WAITER
+};
+
 static char const *const VkSciSyncPrimitiveTypeNVStrings[2] = {
     "FENCE",     // 0
     "SEMAPHORE", // 1
@@ -7527,6 +16876,11 @@ static int32_t const VkSciSyncPrimitiveTypeNVValues[2] = {
     1, // SEMAPHORE
 };
 
+static uint16_t const VkSciSyncPrimitiveTypeNVValueIndices[2] = {
+    0, // FENCE
+    1, // SEMAPHORE
+};
+
 static char const *const VkFragmentShadingRateNVStrings[12] = {
     "1_INVOCATION_PER_PIXEL",      // 0
     "1_INVOCATION_PER_1X2_PIXELS", // 1
@@ -7557,6 +16911,25 @@ static int32_t const VkFragmentShadingRateNVValues[12] = {
     15, // NO_INVOCATIONS
 };
 
+static uint16_t const VkFragmentShadingRateNVValueIndices[16] = {
+    0,             // 1_INVOCATION_PER_PIXEL
+    1,             // 1_INVOCATION_PER_1X2_PIXELS
+    cNoValueIndex, // 2
+    cNoValueIndex, // 3
+    2,             // 1_INVOCATION_PER_2X1_PIXELS
+    3,             // 1_INVOCATION_PER_2X2_PIXELS
+    4,             // 1_INVOCATION_PER_2X4_PIXELS
+    cNoValueIndex, // 7
+    cNoValueIndex, // 8
+    5,             // 1_INVOCATION_PER_4X2_PIXELS
+    6,             // 1_INVOCATION_PER_4X4_PIXELS
+    7,             // 2_INVOCATIONS_PER_PIXEL
+    8,             // 4_INVOCATIONS_PER_PIXEL
+    9,             // 8_INVOCATIONS_PER_PIXEL
+    10,            // 16_INVOCATIONS_PER_PIXEL
+    11,            // NO_INVOCATIONS
+};
+
 static char const *const VkFragmentShadingRateTypeNVStrings[2] = {
     "FRAGMENT_SIZE", // 0
     "ENUMS",         // 1
@@ -7567,6 +16940,11 @@ static int32_t const VkFragmentShadingRateTypeNVValues[2] = {
     1, // ENUMS
 };
 
+static uint16_t const VkFragmentShadingRateTypeNVValueIndices[2] = {
+    0, // FRAGMENT_SIZE
+    1, // ENUMS
+};
+
 static char const *const VkSubpassMergeStatusEXTStrings[14] = {
     "MERGED",                                   // 0
     "DISALLOWED",                               // 1
@@ -7601,6 +16979,23 @@ static int32_t const VkSubpassMergeStatusEXTValues[14] = {
     13, // NOT_MERGED_UNSPECIFIED
 };
 
+static uint16_t const VkSubpassMergeStatusEXTValueIndices[14] = {
+    0,  // MERGED
+    1,  // DISALLOWED
+    2,  // NOT_MERGED_SIDE_EFFECTS
+    3,  // NOT_MERGED_SAMPLES_MISMATCH
+    4,  // NOT_MERGED_VIEWS_MISMATCH
+    5,  // NOT_MERGED_ALIASING
+    6,  // NOT_MERGED_DEPENDENCIES
+    7,  // NOT_MERGED_INCOMPATIBLE_INPUT_ATTACHMENT
+    8,  // NOT_MERGED_TOO_MANY_ATTACHMENTS
+    9,  // NOT_MERGED_INSUFFICIENT_STORAGE
+    10, // NOT_MERGED_DEPTH_STENCIL_COUNT
+    11, // NOT_MERGED_RESOLVE_ATTACHMENT_REUSE
+    12, // NOT_MERGED_SINGLE_SUBPASS
+    13, // NOT_MERGED_UNSPECIFIED
+};
+
 static char const *const VkProvokingVertexModeEXTStrings[2] = {
     "FIRST_VERTEX", // 0
     "LAST_VERTEX",  // 1
@@ -7611,6 +17006,11 @@ static int32_t const VkProvokingVertexModeEXTValues[2] = {
     1, // LAST_VERTEX
 };
 
+static uint16_t const VkProvokingVertexModeEXTValueIndices[2] = {
+    0, // FIRST_VERTEX
+    1, // LAST_VERTEX
+};
+
 static char const *const VkPipelineCacheValidationVersionStrings[1] = {
     "SAFETY_CRITICAL_ONE", // 1
 };
@@ -7619,6 +17019,11 @@ static int32_t const VkPipelineCacheValidationVersionValues[1] = {
     1, // SAFETY_CRITICAL_ONE
 };
 
+static uint16_t const VkPipelineCacheValidationVersionValueIndices[2] = {
+    cNoValueIndex, // 0
+    0,             // SAFETY_CRITICAL_ONE
+};
+
 static char const *const VkPipelineRobustnessBufferBehaviorStrings[8] = {
     "DEVICE_DEFAULT_EXT",         // 0
     "DISABLED_EXT",               // 1
@@ -7641,6 +17046,13 @@ static int32_t const VkPipelineRobustnessBufferBehaviorValues[8] = {
     3, // ROBUST_BUFFER_ACCESS_2
 };
 
+static uint16_t const VkPipelineRobustnessBufferBehaviorValueIndices[4] = {
+    0, // DEVICE_DEFAULT_EXT
+    1, // DISABLED_EXT
+    2, // ROBUST_BUFFER_ACCESS_EXT
+    3, // ROBUST_BUFFER_ACCESS_2_EXT
+};
+
 static char const *const VkPipelineRobustnessImageBehaviorStrings[8] = {
     "DEVICE_DEFAULT_EXT",        // 0
     "DISABLED_EXT",              // 1
@@ -7663,6 +17075,13 @@ static int32_t const VkPipelineRobustnessImageBehaviorValues[8] = {
     3, // ROBUST_IMAGE_ACCESS_2
 };
 
+static uint16_t const VkPipelineRobustnessImageBehaviorValueIndices[4] = {
+    0, // DEVICE_DEFAULT_EXT
+    1, // DISABLED_EXT
+    2, // ROBUST_IMAGE_ACCESS_EXT
+    3, // ROBUST_IMAGE_ACCESS_2_EXT
+};
+
 static char const *const VkDeviceAddressBindingTypeEXTStrings[2] = {
     "BIND",   // 0
     "UNBIND", // 1
@@ -7673,6 +17092,11 @@ static int32_t const VkDeviceAddressBindingTypeEXTValues[2] = {
     1, // UNBIND
 };
 
+static uint16_t const VkDeviceAddressBindingTypeEXTValueIndices[2] = {
+    0, // BIND
+    1, // UNBIND
+};
+
 static char const *const VkMicromapTypeEXTStrings[2] = {
     "OPACITY_MICROMAP",         // 0
     "DISPLACEMENT_MICROMAP_NV", // 1000397000
@@ -7683,6 +17107,18 @@ static int32_t const VkMicromapTypeEXTValues[2] = {
     1000397000, // DISPLACEMENT_MICROMAP_NV
 };
 
+static uint16_t const VkMicromapTypeEXTValueIndices[1] = {
+    0, // OPACITY_MICROMAP
+};
+
+static int32_t const VkMicromapTypeEXTSortedValues[1] = {
+    1000397000, // DISPLACEMENT_MICROMAP_NV
+};
+
+static uint16_t const VkMicromapTypeEXTSortedIndices[1] = {
+    1, // DISPLACEMENT_MICROMAP_NV
+};
+
 static char const *const VkBuildMicromapModeEXTStrings[1] = {
     "BUILD", // 0
 };
@@ -7691,6 +17127,10 @@ static int32_t const VkBuildMicromapModeEXTValues[1] = {
     0, // BUILD
 };
 
+static uint16_t const VkBuildMicromapModeEXTValueIndices[1] = {
+    0, // BUILD
+};
+
 static char const *const VkCopyMicromapModeEXTStrings[4] = {
     "CLONE",       // 0
     "SERIALIZE",   // 1
@@ -7705,6 +17145,13 @@ static int32_t const VkCopyMicromapModeEXTValues[4] = {
     3, // COMPACT
 };
 
+static uint16_t const VkCopyMicromapModeEXTValueIndices[4] = {
+    0, // CLONE
+    1, // SERIALIZE
+    2, // DESERIALIZE
+    3, // COMPACT
+};
+
 static char const *const VkOpacityMicromapFormatKHRStrings[4] = {
     "2_STATE_EXT", // 1
     "4_STATE_EXT", // 2
@@ -7719,6 +17166,12 @@ static int32_t const VkOpacityMicromapFormatKHRValues[4] = {
     2, // 4_STATE
 };
 
+static uint16_t const VkOpacityMicromapFormatKHRValueIndices[3] = {
+    cNoValueIndex, // 0
+    0,             // 2_STATE_EXT
+    1,             // 4_STATE_EXT
+};
+
 static char const *const VkOpacityMicromapSpecialIndexKHRStrings[9] = {
     "FULLY_TRANSPARENT_EXT",                        // -1
     "FULLY_OPAQUE_EXT",                             // -2
@@ -7743,6 +17196,22 @@ static int32_t const VkOpacityMicromapSpecialIndexKHRValues[9] = {
     -5, // CLUSTER_GEOMETRY_DISABLE_OPACITY_MICROMAP_NV
 };
 
+static int32_t const VkOpacityMicromapSpecialIndexKHRSortedValues[5] = {
+    -5, // CLUSTER_GEOMETRY_DISABLE_OPACITY_MICROMAP_NV
+    -4, // FULLY_UNKNOWN_OPAQUE_EXT
+    -3, // FULLY_UNKNOWN_TRANSPARENT_EXT
+    -2, // FULLY_OPAQUE_EXT
+    -1, // FULLY_TRANSPARENT_EXT
+};
+
+static uint16_t const VkOpacityMicromapSpecialIndexKHRSortedIndices[5] = {
+    8, // CLUSTER_GEOMETRY_DISABLE_OPACITY_MICROMAP_NV
+    3, // FULLY_UNKNOWN_OPAQUE_EXT
+    2, // FULLY_UNKNOWN_TRANSPARENT_EXT
+    1, // FULLY_OPAQUE_EXT
+    0, // FULLY_TRANSPARENT_EXT
+};
+
 static char const *const VkAccelerationStructureSerializedBlockTypeKHRStrings[1] = {
     "OPACITY_MICROMAP", // 0
 };
@@ -7751,6 +17220,10 @@ static int32_t const VkAccelerationStructureSerializedBlockTypeKHRValues[1] = {
     0, // OPACITY_MICROMAP
 };
 
+static uint16_t const VkAccelerationStructureSerializedBlockTypeKHRValueIndices[1] = {
+    0, // OPACITY_MICROMAP
+};
+
 static char const *const VkIndirectExecutionSetInfoTypeEXTStrings[2] = {
     "PIPELINES",      // 0
     "SHADER_OBJECTS", // 1
@@ -7761,6 +17234,11 @@ static int32_t const VkIndirectExecutionSetInfoTypeEXTValues[2] = {
     1, // SHADER_OBJECTS
 };
 
+static uint16_t const VkIndirectExecutionSetInfoTypeEXTValueIndices[2] = {
+    0, // PIPELINES
+    1, // SHADER_OBJECTS
+};
+
 static char const *const VkDeviceFaultVendorBinaryHeaderVersionKHRStrings[2] = {
     "ONE_EXT", // 1
     "ONE",     // 1
@@ -7771,6 +17249,11 @@ static int32_t const VkDeviceFaultVendorBinaryHeaderVersionKHRValues[2] = {
     1, // ONE
 };
 
+static uint16_t const VkDeviceFaultVendorBinaryHeaderVersionKHRValueIndices[2] = {
+    cNoValueIndex, // 0
+    0,             // ONE_EXT
+};
+
 static char const *const VkDepthBiasRepresentationEXTStrings[3] = {
     "LEAST_REPRESENTABLE_VALUE_FORMAT",      // 0
     "LEAST_REPRESENTABLE_VALUE_FORCE_UNORM", // 1
@@ -7783,6 +17266,12 @@ static int32_t const VkDepthBiasRepresentationEXTValues[3] = {
     2, // FLOAT
 };
 
+static uint16_t const VkDepthBiasRepresentationEXTValueIndices[3] = {
+    0, // LEAST_REPRESENTABLE_VALUE_FORMAT
+    1, // LEAST_REPRESENTABLE_VALUE_FORCE_UNORM
+    2, // FLOAT
+};
+
 static char const *const VkDirectDriverLoadingModeLUNARGStrings[2] = {
     "EXCLUSIVE", // 0
     "INCLUSIVE", // 1
@@ -7793,6 +17282,11 @@ static int32_t const VkDirectDriverLoadingModeLUNARGValues[2] = {
     1, // INCLUSIVE
 };
 
+static uint16_t const VkDirectDriverLoadingModeLUNARGValueIndices[2] = {
+    0, // EXCLUSIVE
+    1, // INCLUSIVE
+};
+
 static char const *const VkPartitionedAccelerationStructureOpTypeNVStrings[3] = {
     "WRITE_INSTANCE",              // 0
     "UPDATE_INSTANCE",             // 1
@@ -7805,6 +17299,12 @@ static int32_t const VkPartitionedAccelerationStructureOpTypeNVValues[3] = {
     2, // WRITE_PARTITION_TRANSLATION
 };
 
+static uint16_t const VkPartitionedAccelerationStructureOpTypeNVValueIndices[3] = {
+    0, // WRITE_INSTANCE
+    1, // UPDATE_INSTANCE
+    2, // WRITE_PARTITION_TRANSLATION
+};
+
 static char const *const VkAntiLagModeAMDStrings[3] = {
     "DRIVER_CONTROL", // 0
     "ON",             // 1
@@ -7817,6 +17317,12 @@ static int32_t const VkAntiLagModeAMDValues[3] = {
     2, // OFF
 };
 
+static uint16_t const VkAntiLagModeAMDValueIndices[3] = {
+    0, // DRIVER_CONTROL
+    1, // ON
+    2, // OFF
+};
+
 static char const *const VkAntiLagStageAMDStrings[2] = {
     "INPUT",   // 0
     "PRESENT", // 1
@@ -7827,6 +17333,11 @@ static int32_t const VkAntiLagStageAMDValues[2] = {
     1, // PRESENT
 };
 
+static uint16_t const VkAntiLagStageAMDValueIndices[2] = {
+    0, // INPUT
+    1, // PRESENT
+};
+
 static char const *const VkDisplacementMicromapFormatNVStrings[3] = {
     "64_TRIANGLES_64_BYTES",    // 1
     "256_TRIANGLES_128_BYTES",  // 2
@@ -7839,6 +17350,13 @@ static int32_t const VkDisplacementMicromapFormatNVValues[3] = {
     3, // 1024_TRIANGLES_128_BYTES
 };
 
+static uint16_t const VkDisplacementMicromapFormatNVValueIndices[4] = {
+    cNoValueIndex, // 0
+    0,             // 64_TRIANGLES_64_BYTES
+    1,             // 256_TRIANGLES_128_BYTES
+    2,             // 1024_TRIANGLES_128_BYTES
+};
+
 static char const *const VkShaderCodeTypeEXTStrings[2] = {
     "BINARY", // 0
     "SPIRV",  // 1
@@ -7849,6 +17367,11 @@ static int32_t const VkShaderCodeTypeEXTValues[2] = {
     1, // SPIRV
 };
 
+static uint16_t const VkShaderCodeTypeEXTValueIndices[2] = {
+    0, // BINARY
+    1, // SPIRV
+};
+
 static char const *const VkScopeKHRStrings[8] = {
     "DEVICE_NV",       // 1
     "WORKGROUP_NV",    // 2
@@ -7871,6 +17394,15 @@ static int32_t const VkScopeKHRValues[8] = {
     5, // QUEUE_FAMILY
 };
 
+static uint16_t const VkScopeKHRValueIndices[6] = {
+    cNoValueIndex, // 0
+    0,             // DEVICE_NV
+    1,             // WORKGROUP_NV
+    2,             // SUBGROUP_NV
+    cNoValueIndex, // 4
+    3,             // QUEUE_FAMILY_NV
+};
+
 static char const *const VkComponentTypeKHRStrings[34] = {
     "FLOAT16_NV",               // 0
     "FLOAT32_NV",               // 1
@@ -7945,6 +17477,46 @@ static int32_t const VkComponentTypeKHRValues[34] = {
     1000672004, // MXINT8_EXT
 };
 
+static uint16_t const VkComponentTypeKHRValueIndices[11] = {
+    0,  // FLOAT16_NV
+    1,  // FLOAT32_NV
+    2,  // FLOAT64_NV
+    3,  // SINT8_NV
+    4,  // SINT16_NV
+    5,  // SINT32_NV
+    6,  // SINT64_NV
+    7,  // UINT8_NV
+    8,  // UINT16_NV
+    9,  // UINT32_NV
+    10, // UINT64_NV
+};
+
+static int32_t const VkComponentTypeKHRSortedValues[10] = {
+    1000141000, // BFLOAT16
+    1000491000, // SINT8_PACKED_NV
+    1000491001, // UINT8_PACKED_NV
+    1000491002, // FLOAT_E4M3_NV
+    1000491003, // FLOAT_E5M2_NV
+    1000672000, // FLOAT6_E2M3_EXT
+    1000672001, // FLOAT6_E3M2_EXT
+    1000672002, // FLOAT4_E2M1_EXT
+    1000672003, // FLOAT8_UNSIGNED_E8M0_EXT
+    1000672004, // MXINT8_EXT
+};
+
+static uint16_t const VkComponentTypeKHRSortedIndices[10] = {
+    26, // BFLOAT16
+    24, // SINT8_PACKED_NV
+    25, // UINT8_PACKED_NV
+    11, // FLOAT_E4M3_NV
+    12, // FLOAT_E5M2_NV
+    29, // FLOAT6_E2M3_EXT
+    30, // FLOAT6_E3M2_EXT
+    31, // FLOAT4_E2M1_EXT
+    32, // FLOAT8_UNSIGNED_E8M0_EXT
+    33, // MXINT8_EXT
+};
+
 static char const *const VkCubicFilterWeightsQCOMStrings[4] = {
     "CATMULL_ROM",           // 0
     "ZERO_TANGENT_CARDINAL", // 1
@@ -7959,6 +17531,13 @@ static int32_t const VkCubicFilterWeightsQCOMValues[4] = {
     3, // MITCHELL_NETRAVALI
 };
 
+static uint16_t const VkCubicFilterWeightsQCOMValueIndices[4] = {
+    0, // CATMULL_ROM
+    1, // ZERO_TANGENT_CARDINAL
+    2, // B_SPLINE
+    3, // MITCHELL_NETRAVALI
+};
+
 static char const *const VkBlockMatchWindowCompareModeQCOMStrings[2] = {
     "MIN", // 0
     "MAX", // 1
@@ -7969,6 +17548,11 @@ static int32_t const VkBlockMatchWindowCompareModeQCOMValues[2] = {
     1, // MAX
 };
 
+static uint16_t const VkBlockMatchWindowCompareModeQCOMValueIndices[2] = {
+    0, // MIN
+    1, // MAX
+};
+
 static char const *const VkLayeredDriverUnderlyingApiMSFTStrings[2] = {
     "NONE",  // 0
     "D3D12", // 1
@@ -7979,6 +17563,11 @@ static int32_t const VkLayeredDriverUnderlyingApiMSFTValues[2] = {
     1, // D3D12
 };
 
+static uint16_t const VkLayeredDriverUnderlyingApiMSFTValueIndices[2] = {
+    0, // NONE
+    1, // D3D12
+};
+
 static char const *const VkPhysicalDeviceLayeredApiKHRStrings[5] = {
     "VULKAN",   // 0
     "D3D12",    // 1
@@ -7995,6 +17584,14 @@ static int32_t const VkPhysicalDeviceLayeredApiKHRValues[5] = {
     4, // OPENGLES
 };
 
+static uint16_t const VkPhysicalDeviceLayeredApiKHRValueIndices[5] = {
+    0, // VULKAN
+    1, // D3D12
+    2, // METAL
+    3, // OPENGL
+    4, // OPENGLES
+};
+
 static char const *const VkCompressedTriangleFormatAMDXStrings[1] = {
     "DGF1", // 0
 };
@@ -8003,6 +17600,10 @@ static int32_t const VkCompressedTriangleFormatAMDXValues[1] = {
     0, // DGF1
 };
 
+static uint16_t const VkCompressedTriangleFormatAMDXValueIndices[1] = {
+    0, // DGF1
+};
+
 static char const *const VkDepthClampModeEXTStrings[2] = {
     "VIEWPORT_RANGE",     // 0
     "USER_DEFINED_RANGE", // 1
@@ -8013,6 +17614,11 @@ static int32_t const VkDepthClampModeEXTValues[2] = {
     1, // USER_DEFINED_RANGE
 };
 
+static uint16_t const VkDepthClampModeEXTValueIndices[2] = {
+    0, // VIEWPORT_RANGE
+    1, // USER_DEFINED_RANGE
+};
+
 static char const *const VkCooperativeVectorMatrixLayoutNVStrings[4] = {
     "ROW_MAJOR",           // 0
     "COLUMN_MAJOR",        // 1
@@ -8027,6 +17633,13 @@ static int32_t const VkCooperativeVectorMatrixLayoutNVValues[4] = {
     3, // TRAINING_OPTIMAL
 };
 
+static uint16_t const VkCooperativeVectorMatrixLayoutNVValueIndices[4] = {
+    0, // ROW_MAJOR
+    1, // COLUMN_MAJOR
+    2, // INFERENCING_OPTIMAL
+    3, // TRAINING_OPTIMAL
+};
+
 static char const *const VkTensorTilingARMStrings[7] = {
     "OPTIMAL",                 // 0
     "LINEAR",                  // 1
@@ -8047,6 +17660,27 @@ static int32_t const VkTensorTilingARMValues[7] = {
     1000565004, // BLOCK_U_INTERLEAVED_64K
 };
 
+static uint16_t const VkTensorTilingARMValueIndices[2] = {
+    0, // OPTIMAL
+    1, // LINEAR
+};
+
+static int32_t const VkTensorTilingARMSortedValues[5] = {
+    1000565000, // BRICK_16_WIDE
+    1000565001, // BRICK_8_WIDE
+    1000565002, // BRICK_4_WIDE
+    1000565003, // BLOCK_U_INTERLEAVED
+    1000565004, // BLOCK_U_INTERLEAVED_64K
+};
+
+static uint16_t const VkTensorTilingARMSortedIndices[5] = {
+    2, // BRICK_16_WIDE
+    3, // BRICK_8_WIDE
+    4, // BRICK_4_WIDE
+    5, // BLOCK_U_INTERLEAVED
+    6, // BLOCK_U_INTERLEAVED_64K
+};
+
 static char const *const VkDataGraphPipelinePropertyARMStrings[4] = {
     "CREATION_LOG",                       // 0
     "IDENTIFIER",                         // 1
@@ -8061,18 +17695,47 @@ static int32_t const VkDataGraphPipelinePropertyARMValues[4] = {
     1000676001, // NEURAL_ACCELERATOR_STATISTICS_INFO
 };
 
+static uint16_t const VkDataGraphPipelinePropertyARMValueIndices[2] = {
+    0, // CREATION_LOG
+    1, // IDENTIFIER
+};
+
+static int32_t const VkDataGraphPipelinePropertyARMSortedValues[2] = {
+    1000676000, // NEURAL_ACCELERATOR_DEBUG_DATABASE
+    1000676001, // NEURAL_ACCELERATOR_STATISTICS_INFO
+};
+
+static uint16_t const VkDataGraphPipelinePropertyARMSortedIndices[2] = {
+    2, // NEURAL_ACCELERATOR_DEBUG_DATABASE
+    3, // NEURAL_ACCELERATOR_STATISTICS_INFO
+};
+
 static char const *const VkDataGraphPipelineSessionBindPointARMStrings[3] = {
     "TRANSIENT",                     // 0
     "OPTICAL_FLOW_CACHE",            // 1000631001
     "NEURAL_ACCELERATOR_STATISTICS", // 1000676000
 };
 
-static int32_t const VkDataGraphPipelineSessionBindPointARMValues[3] = {
-    0,          // TRANSIENT
+static int32_t const VkDataGraphPipelineSessionBindPointARMValues[3] = {
+    0,          // TRANSIENT
+    1000631001, // OPTICAL_FLOW_CACHE
+    1000676000, // NEURAL_ACCELERATOR_STATISTICS
+};
+
+static uint16_t const VkDataGraphPipelineSessionBindPointARMValueIndices[1] = {
+    0, // TRANSIENT
+};
+
+static int32_t const VkDataGraphPipelineSessionBindPointARMSortedValues[2] = {
     1000631001, // OPTICAL_FLOW_CACHE
     1000676000, // NEURAL_ACCELERATOR_STATISTICS
 };
 
+static uint16_t const VkDataGraphPipelineSessionBindPointARMSortedIndices[2] = {
+    1, // OPTICAL_FLOW_CACHE
+    2, // NEURAL_ACCELERATOR_STATISTICS
+};
+
 static char const *const VkDataGraphPipelineSessionBindPointTypeARMStrings[1] = {
     "MEMORY", // 0
 };
@@ -8081,6 +17744,10 @@ static int32_t const VkDataGraphPipelineSessionBindPointTypeARMValues[1] = {
     0, // MEMORY
 };
 
+static uint16_t const VkDataGraphPipelineSessionBindPointTypeARMValueIndices[1] = {
+    0, // MEMORY
+};
+
 static char const *const VkPhysicalDeviceDataGraphProcessingEngineTypeARMStrings[3] = {
     "DEFAULT",      // 0
     "NEURAL_QCOM",  // 1000629000
@@ -8093,6 +17760,20 @@ static int32_t const VkPhysicalDeviceDataGraphProcessingEngineTypeARMValues[3] =
     1000629001, // COMPUTE_QCOM
 };
 
+static uint16_t const VkPhysicalDeviceDataGraphProcessingEngineTypeARMValueIndices[1] = {
+    0, // DEFAULT
+};
+
+static int32_t const VkPhysicalDeviceDataGraphProcessingEngineTypeARMSortedValues[2] = {
+    1000629000, // NEURAL_QCOM
+    1000629001, // COMPUTE_QCOM
+};
+
+static uint16_t const VkPhysicalDeviceDataGraphProcessingEngineTypeARMSortedIndices[2] = {
+    1, // NEURAL_QCOM
+    2, // COMPUTE_QCOM
+};
+
 static char const *const VkPhysicalDeviceDataGraphOperationTypeARMStrings[4] = {
     "SPIRV_EXTENDED_INSTRUCTION_SET", // 0
     "NEURAL_MODEL_QCOM",              // 1000629000
@@ -8107,6 +17788,22 @@ static int32_t const VkPhysicalDeviceDataGraphOperationTypeARMValues[4] = {
     1000631000, // OPTICAL_FLOW
 };
 
+static uint16_t const VkPhysicalDeviceDataGraphOperationTypeARMValueIndices[1] = {
+    0, // SPIRV_EXTENDED_INSTRUCTION_SET
+};
+
+static int32_t const VkPhysicalDeviceDataGraphOperationTypeARMSortedValues[3] = {
+    1000629000, // NEURAL_MODEL_QCOM
+    1000629001, // BUILTIN_MODEL_QCOM
+    1000631000, // OPTICAL_FLOW
+};
+
+static uint16_t const VkPhysicalDeviceDataGraphOperationTypeARMSortedIndices[3] = {
+    1, // NEURAL_MODEL_QCOM
+    2, // BUILTIN_MODEL_QCOM
+    3, // OPTICAL_FLOW
+};
+
 static char const *const VkDataGraphModelCacheTypeQCOMStrings[1] = {
     "GENERIC_BINARY", // 0
 };
@@ -8115,6 +17812,10 @@ static int32_t const VkDataGraphModelCacheTypeQCOMValues[1] = {
     0, // GENERIC_BINARY
 };
 
+static uint16_t const VkDataGraphModelCacheTypeQCOMValueIndices[1] = {
+    0, // GENERIC_BINARY
+};
+
 static char const *const VkPerfHintTypeQCOMStrings[4] = {
     "DEFAULT",          // 0
     "FREQUENCY_MIN",    // 1
@@ -8129,6 +17830,13 @@ static int32_t const VkPerfHintTypeQCOMValues[4] = {
     3, // FREQUENCY_SCALED
 };
 
+static uint16_t const VkPerfHintTypeQCOMValueIndices[4] = {
+    0, // DEFAULT
+    1, // FREQUENCY_MIN
+    2, // FREQUENCY_MAX
+    3, // FREQUENCY_SCALED
+};
+
 static char const *const VkDescriptorMappingSourceEXTStrings[11] = {
     "HEAP_WITH_CONSTANT_OFFSET",      // 0
     "HEAP_WITH_PUSH_INDEX",           // 1
@@ -8157,6 +17865,20 @@ static int32_t const VkDescriptorMappingSourceEXTValues[11] = {
     10, // SHADER_RECORD_ADDRESS
 };
 
+static uint16_t const VkDescriptorMappingSourceEXTValueIndices[11] = {
+    0,  // HEAP_WITH_CONSTANT_OFFSET
+    1,  // HEAP_WITH_PUSH_INDEX
+    2,  // HEAP_WITH_INDIRECT_INDEX
+    3,  // HEAP_WITH_INDIRECT_INDEX_ARRAY
+    4,  // RESOURCE_HEAP_DATA
+    5,  // PUSH_DATA
+    6,  // PUSH_ADDRESS
+    7,  // INDIRECT_ADDRESS
+    8,  // HEAP_WITH_SHADER_RECORD_INDEX
+    9,  // SHADER_RECORD_DATA
+    10, // SHADER_RECORD_ADDRESS
+};
+
 static char const *const VkGpaPerfBlockAMDStrings[59] = {
     "GE1",      // 33
     "RLCLOCAL", // 56
@@ -8281,6 +18003,66 @@ static int32_t const VkGpaPerfBlockAMDValues[59] = {
     56, // RLCUSER
 };
 
+static uint16_t const VkGpaPerfBlockAMDValueIndices[57] = {
+    2,  // CPF
+    3,  // IA
+    4,  // VGT
+    5,  // PA
+    6,  // SC
+    7,  // SPI
+    8,  // SQ
+    9,  // SX
+    10, // TA
+    11, // TD
+    12, // TCP
+    13, // TCC
+    14, // TCA
+    15, // DB
+    16, // CB
+    17, // GDS
+    18, // SRBM
+    19, // GRBM
+    20, // GRBM_SE
+    21, // RLC
+    22, // DMA
+    23, // MC
+    24, // CPG
+    25, // CPC
+    26, // WD
+    27, // TCS
+    28, // ATC
+    29, // ATC_L2
+    30, // MC_VM_L2
+    31, // EA
+    32, // RPB
+    33, // RMI
+    34, // UMCCH
+    0,  // GE1
+    36, // GL1A
+    37, // GL1C
+    38, // GL1CG
+    39, // GL2A
+    40, // GL2C
+    41, // CHA
+    42, // CHC
+    43, // CHCG
+    44, // GUS
+    45, // GCR
+    46, // PH
+    47, // UTCL1
+    48, // GE_DIST
+    49, // GE_SE
+    50, // DF_MALL
+    51, // SQ_WGP
+    52, // PC
+    53, // GL1XA
+    54, // GL1XC
+    55, // WGS
+    56, // EACPWD
+    57, // EASE
+    1,  // RLCLOCAL
+};
+
 static char const *const VkGpaSampleTypeAMDStrings[3] = {
     "CUMULATIVE", // 0
     "TRACE",      // 1
@@ -8293,6 +18075,12 @@ static int32_t const VkGpaSampleTypeAMDValues[3] = {
     2, // TIMING
 };
 
+static uint16_t const VkGpaSampleTypeAMDValueIndices[3] = {
+    0, // CUMULATIVE
+    1, // TRACE
+    2, // TIMING
+};
+
 static char const *const VkGpaDeviceClockModeAMDStrings[6] = {
     "DEFAULT",    // 0
     "QUERY",      // 1
@@ -8311,6 +18099,15 @@ static int32_t const VkGpaDeviceClockModeAMDValues[6] = {
     5, // PEAK
 };
 
+static uint16_t const VkGpaDeviceClockModeAMDValueIndices[6] = {
+    0, // DEFAULT
+    1, // QUERY
+    2, // PROFILING
+    3, // MIN_MEMORY
+    4, // MIN_ENGINE
+    5, // PEAK
+};
+
 static char const *const VkDataGraphTOSALevelARMStrings[2] = {
     "VK_DATA_GRAPH_TOSA_LEVEL_NONE", // 0
     "VK_DATA_GRAPH_TOSA_LEVEL_8K",   // 1
@@ -8321,6 +18118,11 @@ static int32_t const VkDataGraphTOSALevelARMValues[2] = {
     1, // VK_DATA_GRAPH_TOSA_LEVEL_8K
 };
 
+static uint16_t const VkDataGraphTOSALevelARMValueIndices[2] = {
+    0, // VK_DATA_GRAPH_TOSA_LEVEL_NONE
+    1, // VK_DATA_GRAPH_TOSA_LEVEL_8K
+};
+
 static char const *const VkDataGraphOpticalFlowPerformanceLevelARMStrings[4] = {
     "UNKNOWN", // 0
     "SLOW",    // 1
@@ -8335,6 +18137,13 @@ static int32_t const VkDataGraphOpticalFlowPerformanceLevelARMValues[4] = {
     3, // FAST
 };
 
+static uint16_t const VkDataGraphOpticalFlowPerformanceLevelARMValueIndices[4] = {
+    0, // UNKNOWN
+    1, // SLOW
+    2, // MEDIUM
+    3, // FAST
+};
+
 static char const *const VkDataGraphPipelineNodeConnectionTypeARMStrings[5] = {
     "OPTICAL_FLOW_INPUT",       // 1000631000
     "OPTICAL_FLOW_REFERENCE",   // 1000631001
@@ -8351,6 +18160,22 @@ static int32_t const VkDataGraphPipelineNodeConnectionTypeARMValues[5] = {
     1000631004, // OPTICAL_FLOW_COST
 };
 
+static int32_t const VkDataGraphPipelineNodeConnectionTypeARMSortedValues[5] = {
+    1000631000, // OPTICAL_FLOW_INPUT
+    1000631001, // OPTICAL_FLOW_REFERENCE
+    1000631002, // OPTICAL_FLOW_HINT
+    1000631003, // OPTICAL_FLOW_FLOW_VECTOR
+    1000631004, // OPTICAL_FLOW_COST
+};
+
+static uint16_t const VkDataGraphPipelineNodeConnectionTypeARMSortedIndices[5] = {
+    0, // OPTICAL_FLOW_INPUT
+    1, // OPTICAL_FLOW_REFERENCE
+    2, // OPTICAL_FLOW_HINT
+    3, // OPTICAL_FLOW_FLOW_VECTOR
+    4, // OPTICAL_FLOW_COST
+};
+
 static char const *const VkDataGraphPipelineNodeTypeARMStrings[1] = {
     "OPTICAL_FLOW", // 1000631000
 };
@@ -8359,6 +18184,14 @@ static int32_t const VkDataGraphPipelineNodeTypeARMValues[1] = {
     1000631000, // OPTICAL_FLOW
 };
 
+static int32_t const VkDataGraphPipelineNodeTypeARMSortedValues[1] = {
+    1000631000, // OPTICAL_FLOW
+};
+
+static uint16_t const VkDataGraphPipelineNodeTypeARMSortedIndices[1] = {
+    0, // OPTICAL_FLOW
+};
+
 static char const *const VkNeuralAcceleratorStatisticsModeARMStrings[3] = {
     "DISABLED",    // 0
     "STATISTICS0", // 1
@@ -8371,6 +18204,12 @@ static int32_t const VkNeuralAcceleratorStatisticsModeARMValues[3] = {
     2, // STATISTICS1
 };
 
+static uint16_t const VkNeuralAcceleratorStatisticsModeARMValueIndices[3] = {
+    0, // DISABLED
+    1, // STATISTICS0
+    2, // STATISTICS1
+};
+
 static char const *const VkThrottleHintTypeSECStrings[3] = {
     "DEFAULT", // 0
     "LOW",     // 1
@@ -8383,6 +18222,12 @@ static int32_t const VkThrottleHintTypeSECValues[3] = {
     2, // HIGH
 };
 
+static uint16_t const VkThrottleHintTypeSECValueIndices[3] = {
+    0, // DEFAULT
+    1, // LOW
+    2, // HIGH
+};
+
 static char const *const VkColorSpaceKHRStrings[18] = {
     "DCI_P3_LINEAR_EXT",            // 1000104003
     "VK_COLORSPACE_SRGB_NONLINEAR", // 0
@@ -8425,6 +18270,46 @@ static int32_t const VkColorSpaceKHRValues[18] = {
     1000104003, // DISPLAY_P3_LINEAR_EXT
 };
 
+static uint16_t const VkColorSpaceKHRValueIndices[1] = {
+    1, // VK_COLORSPACE_SRGB_NONLINEAR
+};
+
+static int32_t const VkColorSpaceKHRSortedValues[15] = {
+    1000104001, // DISPLAY_P3_NONLINEAR_EXT
+    1000104002, // EXTENDED_SRGB_LINEAR_EXT
+    1000104003, // DCI_P3_LINEAR_EXT
+    1000104004, // DCI_P3_NONLINEAR_EXT
+    1000104005, // BT709_LINEAR_EXT
+    1000104006, // BT709_NONLINEAR_EXT
+    1000104007, // BT2020_LINEAR_EXT
+    1000104008, // HDR10_ST2084_EXT
+    1000104009, // DOLBYVISION_EXT
+    1000104010, // HDR10_HLG_EXT
+    1000104011, // ADOBERGB_LINEAR_EXT
+    1000104012, // ADOBERGB_NONLINEAR_EXT
+    1000104013, // PASS_THROUGH_EXT
+    1000104014, // EXTENDED_SRGB_NONLINEAR_EXT
+    1000213000, // DISPLAY_NATIVE_AMD
+};
+
+static uint16_t const VkColorSpaceKHRSortedIndices[15] = {
+    3,  // DISPLAY_P3_NONLINEAR_EXT
+    4,  // EXTENDED_SRGB_LINEAR_EXT
+    0,  // DCI_P3_LINEAR_EXT
+    5,  // DCI_P3_NONLINEAR_EXT
+    6,  // BT709_LINEAR_EXT
+    7,  // BT709_NONLINEAR_EXT
+    8,  // BT2020_LINEAR_EXT
+    9,  // HDR10_ST2084_EXT
+    10, // DOLBYVISION_EXT
+    11, // HDR10_HLG_EXT
+    12, // ADOBERGB_LINEAR_EXT
+    13, // ADOBERGB_NONLINEAR_EXT
+    14, // PASS_THROUGH_EXT
+    15, // EXTENDED_SRGB_NONLINEAR_EXT
+    16, // DISPLAY_NATIVE_AMD
+};
+
 static char const *const VkPresentModeKHRStrings[8] = {
     "FIFO_LATEST_READY_EXT",     // 1000361000
     "IMMEDIATE",                 // 0
@@ -8447,6 +18332,25 @@ static int32_t const VkPresentModeKHRValues[8] = {
     1000361000, // FIFO_LATEST_READY
 };
 
+static uint16_t const VkPresentModeKHRValueIndices[4] = {
+    1, // IMMEDIATE
+    2, // MAILBOX
+    3, // FIFO
+    4, // FIFO_RELAXED
+};
+
+static int32_t const VkPresentModeKHRSortedValues[3] = {
+    1000111000, // SHARED_DEMAND_REFRESH
+    1000111001, // SHARED_CONTINUOUS_REFRESH
+    1000361000, // FIFO_LATEST_READY_EXT
+};
+
+static uint16_t const VkPresentModeKHRSortedIndices[3] = {
+    5, // SHARED_DEMAND_REFRESH
+    6, // SHARED_CONTINUOUS_REFRESH
+    0, // FIFO_LATEST_READY_EXT
+};
+
 static char const *const VkDisplaySurfaceStereoTypeNVStrings[4] = {
     "NONE",               // 0
     "ONBOARD_DIN",        // 1
@@ -8461,6 +18365,13 @@ static int32_t const VkDisplaySurfaceStereoTypeNVValues[4] = {
     3, // INBAND_DISPLAYPORT
 };
 
+static uint16_t const VkDisplaySurfaceStereoTypeNVValueIndices[4] = {
+    0, // NONE
+    1, // ONBOARD_DIN
+    2, // HDMI_3D
+    3, // INBAND_DISPLAYPORT
+};
+
 static char const *const VkDebugReportObjectTypeEXTStrings[50] = {
     "DESCRIPTOR_UPDATE_TEMPLATE_KHR", // 1000085000
     "SAMPLER_YCBCR_CONVERSION_KHR",   // 1000156000
@@ -8567,6 +18478,67 @@ static int32_t const VkDebugReportObjectTypeEXTValues[50] = {
     1000307001, // CUDA_FUNCTION_NV
 };
 
+static uint16_t const VkDebugReportObjectTypeEXTValueIndices[34] = {
+    4,  // UNKNOWN
+    5,  // INSTANCE
+    6,  // PHYSICAL_DEVICE
+    7,  // DEVICE
+    8,  // QUEUE
+    9,  // SEMAPHORE
+    10, // COMMAND_BUFFER
+    11, // FENCE
+    12, // DEVICE_MEMORY
+    13, // BUFFER
+    14, // IMAGE
+    15, // EVENT
+    16, // QUERY_POOL
+    17, // BUFFER_VIEW
+    18, // IMAGE_VIEW
+    19, // SHADER_MODULE
+    20, // PIPELINE_CACHE
+    21, // PIPELINE_LAYOUT
+    22, // RENDER_PASS
+    23, // PIPELINE
+    24, // DESCRIPTOR_SET_LAYOUT
+    25, // SAMPLER
+    26, // DESCRIPTOR_POOL
+    27, // DESCRIPTOR_SET
+    28, // FRAMEBUFFER
+    29, // COMMAND_POOL
+    30, // SURFACE_KHR
+    31, // SWAPCHAIN_KHR
+    2,  // DEBUG_REPORT
+    33, // DISPLAY_KHR
+    34, // DISPLAY_MODE_KHR
+    38, // OBJECT_TABLE_NVX
+    39, // INDIRECT_COMMANDS_LAYOUT_NVX
+    3,  // VALIDATION_CACHE
+};
+
+static int32_t const VkDebugReportObjectTypeEXTSortedValues[9] = {
+    1000029000, // CU_MODULE_NVX
+    1000029001, // CU_FUNCTION_NVX
+    1000085000, // DESCRIPTOR_UPDATE_TEMPLATE_KHR
+    1000150000, // ACCELERATION_STRUCTURE_KHR
+    1000156000, // SAMPLER_YCBCR_CONVERSION_KHR
+    1000165000, // ACCELERATION_STRUCTURE_NVX
+    1000307000, // CUDA_MODULE_NV
+    1000307001, // CUDA_FUNCTION_NV
+    1000366000, // BUFFER_COLLECTION_FUCHSIA
+};
+
+static uint16_t const VkDebugReportObjectTypeEXTSortedIndices[9] = {
+    43, // CU_MODULE_NVX
+    44, // CU_FUNCTION_NVX
+    0,  // DESCRIPTOR_UPDATE_TEMPLATE_KHR
+    42, // ACCELERATION_STRUCTURE_KHR
+    1,  // SAMPLER_YCBCR_CONVERSION_KHR
+    40, // ACCELERATION_STRUCTURE_NVX
+    46, // CUDA_MODULE_NV
+    47, // CUDA_FUNCTION_NV
+    45, // BUFFER_COLLECTION_FUCHSIA
+};
+
 static char const *const VkDeviceMemoryReportEventTypeEXTStrings[5] = {
     "ALLOCATE",          // 0
     "FREE",              // 1
@@ -8583,6 +18555,14 @@ static int32_t const VkDeviceMemoryReportEventTypeEXTValues[5] = {
     4, // ALLOCATION_FAILED
 };
 
+static uint16_t const VkDeviceMemoryReportEventTypeEXTValueIndices[5] = {
+    0, // ALLOCATE
+    1, // FREE
+    2, // IMPORT
+    3, // UNIMPORT
+    4, // ALLOCATION_FAILED
+};
+
 static char const *const VkRasterizationOrderAMDStrings[2] = {
     "STRICT",  // 0
     "RELAXED", // 1
@@ -8593,6 +18573,11 @@ static int32_t const VkRasterizationOrderAMDValues[2] = {
     1, // RELAXED
 };
 
+static uint16_t const VkRasterizationOrderAMDValueIndices[2] = {
+    0, // STRICT
+    1, // RELAXED
+};
+
 static char const *const VkValidationCheckEXTStrings[2] = {
     "ALL",     // 0
     "SHADERS", // 1
@@ -8603,6 +18588,11 @@ static int32_t const VkValidationCheckEXTValues[2] = {
     1, // SHADERS
 };
 
+static uint16_t const VkValidationCheckEXTValueIndices[2] = {
+    0, // ALL
+    1, // SHADERS
+};
+
 static char const *const VkValidationFeatureEnableEXTStrings[5] = {
     "GPU_ASSISTED",                      // 0
     "GPU_ASSISTED_RESERVE_BINDING_SLOT", // 1
@@ -8619,6 +18609,14 @@ static int32_t const VkValidationFeatureEnableEXTValues[5] = {
     4, // SYNCHRONIZATION_VALIDATION
 };
 
+static uint16_t const VkValidationFeatureEnableEXTValueIndices[5] = {
+    0, // GPU_ASSISTED
+    1, // GPU_ASSISTED_RESERVE_BINDING_SLOT
+    2, // BEST_PRACTICES
+    3, // DEBUG_PRINTF
+    4, // SYNCHRONIZATION_VALIDATION
+};
+
 static char const *const VkValidationFeatureDisableEXTStrings[8] = {
     "ALL",                     // 0
     "SHADERS",                 // 1
@@ -8641,6 +18639,17 @@ static int32_t const VkValidationFeatureDisableEXTValues[8] = {
     7, // SHADER_VALIDATION_CACHE
 };
 
+static uint16_t const VkValidationFeatureDisableEXTValueIndices[8] = {
+    0, // ALL
+    1, // SHADERS
+    2, // THREAD_SAFETY
+    3, // API_PARAMETERS
+    4, // OBJECT_LIFETIMES
+    5, // CORE_CHECKS
+    6, // UNIQUE_HANDLES
+    7, // SHADER_VALIDATION_CACHE
+};
+
 static char const *const VkDisplayPowerStateEXTStrings[3] = {
     "OFF",     // 0
     "SUSPEND", // 1
@@ -8653,6 +18662,12 @@ static int32_t const VkDisplayPowerStateEXTValues[3] = {
     2, // ON
 };
 
+static uint16_t const VkDisplayPowerStateEXTValueIndices[3] = {
+    0, // OFF
+    1, // SUSPEND
+    2, // ON
+};
+
 static char const *const VkDeviceEventTypeEXTStrings[1] = {
     "DISPLAY_HOTPLUG", // 0
 };
@@ -8661,6 +18676,10 @@ static int32_t const VkDeviceEventTypeEXTValues[1] = {
     0, // DISPLAY_HOTPLUG
 };
 
+static uint16_t const VkDeviceEventTypeEXTValueIndices[1] = {
+    0, // DISPLAY_HOTPLUG
+};
+
 static char const *const VkDisplayEventTypeEXTStrings[1] = {
     "FIRST_PIXEL_OUT", // 0
 };
@@ -8669,6 +18688,10 @@ static int32_t const VkDisplayEventTypeEXTValues[1] = {
     0, // FIRST_PIXEL_OUT
 };
 
+static uint16_t const VkDisplayEventTypeEXTValueIndices[1] = {
+    0, // FIRST_PIXEL_OUT
+};
+
 static char const *const VkTessellationDomainOriginStrings[4] = {
     "UPPER_LEFT_KHR", // 0
     "LOWER_LEFT_KHR", // 1
@@ -8683,6 +18706,11 @@ static int32_t const VkTessellationDomainOriginValues[4] = {
     1, // LOWER_LEFT
 };
 
+static uint16_t const VkTessellationDomainOriginValueIndices[2] = {
+    0, // UPPER_LEFT_KHR
+    1, // LOWER_LEFT_KHR
+};
+
 static char const *const VkSamplerYcbcrModelConversionStrings[10] = {
     "RGB_IDENTITY_KHR",   // 0
     "YCBCR_IDENTITY_KHR", // 1
@@ -8709,6 +18737,14 @@ static int32_t const VkSamplerYcbcrModelConversionValues[10] = {
     4, // YCBCR_2020
 };
 
+static uint16_t const VkSamplerYcbcrModelConversionValueIndices[5] = {
+    0, // RGB_IDENTITY_KHR
+    1, // YCBCR_IDENTITY_KHR
+    2, // YCBCR_709_KHR
+    3, // YCBCR_601_KHR
+    4, // YCBCR_2020_KHR
+};
+
 static char const *const VkSamplerYcbcrRangeStrings[4] = {
     "ITU_FULL_KHR",   // 0
     "ITU_NARROW_KHR", // 1
@@ -8723,6 +18759,11 @@ static int32_t const VkSamplerYcbcrRangeValues[4] = {
     1, // ITU_NARROW
 };
 
+static uint16_t const VkSamplerYcbcrRangeValueIndices[2] = {
+    0, // ITU_FULL_KHR
+    1, // ITU_NARROW_KHR
+};
+
 static char const *const VkChromaLocationStrings[4] = {
     "COSITED_EVEN_KHR", // 0
     "MIDPOINT_KHR",     // 1
@@ -8737,6 +18778,11 @@ static int32_t const VkChromaLocationValues[4] = {
     1, // MIDPOINT
 };
 
+static uint16_t const VkChromaLocationValueIndices[2] = {
+    0, // COSITED_EVEN_KHR
+    1, // MIDPOINT_KHR
+};
+
 static char const *const VkSamplerReductionModeStrings[7] = {
     "WEIGHTED_AVERAGE_EXT",             // 0
     "MIN_EXT",                          // 1
@@ -8757,6 +18803,20 @@ static int32_t const VkSamplerReductionModeValues[7] = {
     1000521000, // WEIGHTED_AVERAGE_RANGECLAMP_QCOM
 };
 
+static uint16_t const VkSamplerReductionModeValueIndices[3] = {
+    0, // WEIGHTED_AVERAGE_EXT
+    1, // MIN_EXT
+    2, // MAX_EXT
+};
+
+static int32_t const VkSamplerReductionModeSortedValues[1] = {
+    1000521000, // WEIGHTED_AVERAGE_RANGECLAMP_QCOM
+};
+
+static uint16_t const VkSamplerReductionModeSortedIndices[1] = {
+    6, // WEIGHTED_AVERAGE_RANGECLAMP_QCOM
+};
+
 static char const *const VkBlendOverlapEXTStrings[3] = {
     "UNCORRELATED", // 0
     "DISJOINT",     // 1
@@ -8769,6 +18829,12 @@ static int32_t const VkBlendOverlapEXTValues[3] = {
     2, // CONJOINT
 };
 
+static uint16_t const VkBlendOverlapEXTValueIndices[3] = {
+    0, // UNCORRELATED
+    1, // DISJOINT
+    2, // CONJOINT
+};
+
 static char const *const VkFullScreenExclusiveEXTStrings[4] = {
     "DEFAULT",                // 0
     "ALLOWED",                // 1
@@ -8783,6 +18849,13 @@ static int32_t const VkFullScreenExclusiveEXTValues[4] = {
     3, // APPLICATION_CONTROLLED
 };
 
+static uint16_t const VkFullScreenExclusiveEXTValueIndices[4] = {
+    0, // DEFAULT
+    1, // ALLOWED
+    2, // DISALLOWED
+    3, // APPLICATION_CONTROLLED
+};
+
 static char const *const VkShaderFloatControlsIndependenceStrings[6] = {
     "32_BIT_ONLY_KHR", // 0
     "ALL_KHR",         // 1
@@ -8801,6 +18874,12 @@ static int32_t const VkShaderFloatControlsIndependenceValues[6] = {
     2, // NONE
 };
 
+static uint16_t const VkShaderFloatControlsIndependenceValueIndices[3] = {
+    0, // 32_BIT_ONLY_KHR
+    1, // ALL_KHR
+    2, // NONE_KHR
+};
+
 static char const *const VkFragmentShadingRateCombinerOpKHRStrings[5] = {
     "KEEP",    // 0
     "REPLACE", // 1
@@ -8817,6 +18896,14 @@ static int32_t const VkFragmentShadingRateCombinerOpKHRValues[5] = {
     4, // MUL
 };
 
+static uint16_t const VkFragmentShadingRateCombinerOpKHRValueIndices[5] = {
+    0, // KEEP
+    1, // REPLACE
+    2, // MIN
+    3, // MAX
+    4, // MUL
+};
+
 static char const *const VkOpticalFlowPerformanceLevelNVStrings[4] = {
     "UNKNOWN", // 0
     "SLOW",    // 1
@@ -8831,6 +18918,13 @@ static int32_t const VkOpticalFlowPerformanceLevelNVValues[4] = {
     3, // FAST
 };
 
+static uint16_t const VkOpticalFlowPerformanceLevelNVValueIndices[4] = {
+    0, // UNKNOWN
+    1, // SLOW
+    2, // MEDIUM
+    3, // FAST
+};
+
 static char const *const VkOpticalFlowSessionBindingPointNVStrings[9] = {
     "UNKNOWN",              // 0
     "INPUT",                // 1
@@ -8843,7 +18937,19 @@ static char const *const VkOpticalFlowSessionBindingPointNVStrings[9] = {
     "GLOBAL_FLOW",          // 8
 };
 
-static int32_t const VkOpticalFlowSessionBindingPointNVValues[9] = {
+static int32_t const VkOpticalFlowSessionBindingPointNVValues[9] = {
+    0, // UNKNOWN
+    1, // INPUT
+    2, // REFERENCE
+    3, // HINT
+    4, // FLOW_VECTOR
+    5, // BACKWARD_FLOW_VECTOR
+    6, // COST
+    7, // BACKWARD_COST
+    8, // GLOBAL_FLOW
+};
+
+static uint16_t const VkOpticalFlowSessionBindingPointNVValueIndices[9] = {
     0, // UNKNOWN
     1, // INPUT
     2, // REFERENCE
@@ -8889,6 +18995,16 @@ static int32_t const VkDeviceFaultAddressTypeKHRValues[14] = {
     6, // INSTRUCTION_POINTER_FAULT
 };
 
+static uint16_t const VkDeviceFaultAddressTypeKHRValueIndices[7] = {
+    0, // NONE_EXT
+    1, // READ_INVALID_EXT
+    2, // WRITE_INVALID_EXT
+    3, // EXECUTE_INVALID_EXT
+    4, // INSTRUCTION_POINTER_UNKNOWN_EXT
+    5, // INSTRUCTION_POINTER_INVALID_EXT
+    6, // INSTRUCTION_POINTER_FAULT_EXT
+};
+
 static char const *const VkLayerSettingTypeEXTStrings[8] = {
     "BOOL32",  // 0
     "INT32",   // 1
@@ -8911,6 +19027,17 @@ static int32_t const VkLayerSettingTypeEXTValues[8] = {
     7, // STRING
 };
 
+static uint16_t const VkLayerSettingTypeEXTValueIndices[8] = {
+    0, // BOOL32
+    1, // INT32
+    2, // INT64
+    3, // UINT32
+    4, // UINT64
+    5, // FLOAT32
+    6, // FLOAT64
+    7, // STRING
+};
+
 static char const *const VkLatencyMarkerNVStrings[12] = {
     "SIMULATION_START",               // 0
     "SIMULATION_END",                 // 1
@@ -8941,6 +19068,21 @@ static int32_t const VkLatencyMarkerNVValues[12] = {
     11, // OUT_OF_BAND_PRESENT_END
 };
 
+static uint16_t const VkLatencyMarkerNVValueIndices[12] = {
+    0,  // SIMULATION_START
+    1,  // SIMULATION_END
+    2,  // RENDERSUBMIT_START
+    3,  // RENDERSUBMIT_END
+    4,  // PRESENT_START
+    5,  // PRESENT_END
+    6,  // INPUT_SAMPLE
+    7,  // TRIGGER_FLASH
+    8,  // OUT_OF_BAND_RENDERSUBMIT_START
+    9,  // OUT_OF_BAND_RENDERSUBMIT_END
+    10, // OUT_OF_BAND_PRESENT_START
+    11, // OUT_OF_BAND_PRESENT_END
+};
+
 static char const *const VkOutOfBandQueueTypeNVStrings[2] = {
     "RENDER",  // 0
     "PRESENT", // 1
@@ -8951,6 +19093,11 @@ static int32_t const VkOutOfBandQueueTypeNVValues[2] = {
     1, // PRESENT
 };
 
+static uint16_t const VkOutOfBandQueueTypeNVValueIndices[2] = {
+    0, // RENDER
+    1, // PRESENT
+};
+
 static char const *const VkVendorIdStrings[9] = {
     "VIV",      // 0x10001
     "VSI",      // 0x10002
@@ -8975,6 +19122,30 @@ static int32_t const VkVendorIdValues[9] = {
     0x10008, // APE
 };
 
+static int32_t const VkVendorIdSortedValues[9] = {
+    65536, // KHRONOS
+    65537, // VIV
+    65538, // VSI
+    65539, // KAZAN
+    65540, // CODEPLAY
+    65541, // MESA
+    65542, // POCL
+    65543, // MOBILEYE
+    65544, // APE
+};
+
+static uint16_t const VkVendorIdSortedIndices[9] = {
+    7, // KHRONOS
+    0, // VIV
+    1, // VSI
+    2, // KAZAN
+    3, // CODEPLAY
+    4, // MESA
+    5, // POCL
+    6, // MOBILEYE
+    8, // APE
+};
+
 static char const *const VkDriverIdStrings[44] = {
     "AMD_PROPRIETARY_KHR",           // 1
     "AMD_OPEN_SOURCE_KHR",           // 2
@@ -9069,6 +19240,40 @@ static int32_t const VkDriverIdValues[44] = {
     30, // APE_SOFT
 };
 
+static uint16_t const VkDriverIdValueIndices[31] = {
+    cNoValueIndex, // 0
+    0,             // AMD_PROPRIETARY_KHR
+    1,             // AMD_OPEN_SOURCE_KHR
+    2,             // MESA_RADV_KHR
+    3,             // NVIDIA_PROPRIETARY_KHR
+    4,             // INTEL_PROPRIETARY_WINDOWS_KHR
+    5,             // INTEL_OPEN_SOURCE_MESA_KHR
+    6,             // IMAGINATION_PROPRIETARY_KHR
+    7,             // QUALCOMM_PROPRIETARY_KHR
+    8,             // ARM_PROPRIETARY_KHR
+    9,             // GOOGLE_SWIFTSHADER_KHR
+    10,            // GGP_PROPRIETARY_KHR
+    11,            // BROADCOM_PROPRIETARY_KHR
+    24,            // MESA_LLVMPIPE
+    25,            // MOLTENVK
+    26,            // COREAVI_PROPRIETARY
+    27,            // JUICE_PROPRIETARY
+    28,            // VERISILICON_PROPRIETARY
+    29,            // MESA_TURNIP
+    30,            // MESA_V3DV
+    31,            // MESA_PANVK
+    32,            // SAMSUNG_PROPRIETARY
+    33,            // MESA_VENUS
+    34,            // MESA_DOZEN
+    35,            // MESA_NVK
+    36,            // IMAGINATION_OPEN_SOURCE_MESA
+    37,            // MESA_AGXV
+    38,            // RESERVED_27
+    41,            // MESA_KOSMICKRISP
+    42,            // MESA_GFXSTREAM
+    43,            // APE_SOFT
+};
+
 static char const *const VkShadingRatePaletteEntryNVStrings[12] = {
     "NO_INVOCATIONS",              // 0
     "16_INVOCATIONS_PER_PIXEL",    // 1
@@ -9099,6 +19304,21 @@ static int32_t const VkShadingRatePaletteEntryNVValues[12] = {
     11, // 1_INVOCATION_PER_4X4_PIXELS
 };
 
+static uint16_t const VkShadingRatePaletteEntryNVValueIndices[12] = {
+    0,  // NO_INVOCATIONS
+    1,  // 16_INVOCATIONS_PER_PIXEL
+    2,  // 8_INVOCATIONS_PER_PIXEL
+    3,  // 4_INVOCATIONS_PER_PIXEL
+    4,  // 2_INVOCATIONS_PER_PIXEL
+    5,  // 1_INVOCATION_PER_PIXEL
+    6,  // 1_INVOCATION_PER_2X1_PIXELS
+    7,  // 1_INVOCATION_PER_1X2_PIXELS
+    8,  // 1_INVOCATION_PER_2X2_PIXELS
+    9,  // 1_INVOCATION_PER_4X2_PIXELS
+    10, // 1_INVOCATION_PER_2X4_PIXELS
+    11, // 1_INVOCATION_PER_4X4_PIXELS
+};
+
 static char const *const VkCoarseSampleOrderTypeNVStrings[4] = {
     "DEFAULT",      // 0
     "CUSTOM",       // 1
@@ -9113,6 +19333,13 @@ static int32_t const VkCoarseSampleOrderTypeNVValues[4] = {
     3, // SAMPLE_MAJOR
 };
 
+static uint16_t const VkCoarseSampleOrderTypeNVValueIndices[4] = {
+    0, // DEFAULT
+    1, // CUSTOM
+    2, // PIXEL_MAJOR
+    3, // SAMPLE_MAJOR
+};
+
 static char const *const VkPipelineExecutableStatisticFormatKHRStrings[4] = {
     "BOOL32",  // 0
     "INT64",   // 1
@@ -9127,6 +19354,13 @@ static int32_t const VkPipelineExecutableStatisticFormatKHRValues[4] = {
     3, // FLOAT64
 };
 
+static uint16_t const VkPipelineExecutableStatisticFormatKHRValueIndices[4] = {
+    0, // BOOL32
+    1, // INT64
+    2, // UINT64
+    3, // FLOAT64
+};
+
 static char const *const VkQueryResultStatusKHRStrings[4] = {
     "ERROR",                               // -1
     "NOT_READY",                           // 0
@@ -9141,6 +19375,21 @@ static int32_t const VkQueryResultStatusKHRValues[4] = {
     -1000299000, // INSUFFICIENT_BITSTREAM_BUFFER_RANGE
 };
 
+static uint16_t const VkQueryResultStatusKHRValueIndices[2] = {
+    1, // NOT_READY
+    2, // COMPLETE
+};
+
+static int32_t const VkQueryResultStatusKHRSortedValues[2] = {
+    -1000299000, // INSUFFICIENT_BITSTREAM_BUFFER_RANGE
+    -1,          // ERROR
+};
+
+static uint16_t const VkQueryResultStatusKHRSortedIndices[2] = {
+    3, // INSUFFICIENT_BITSTREAM_BUFFER_RANGE
+    0, // ERROR
+};
+
 static char const *const VkVideoEncodeTuningModeKHRStrings[5] = {
     "DEFAULT",           // 0
     "HIGH_QUALITY",      // 1
@@ -9157,6 +19406,14 @@ static int32_t const VkVideoEncodeTuningModeKHRValues[5] = {
     4, // LOSSLESS
 };
 
+static uint16_t const VkVideoEncodeTuningModeKHRValueIndices[5] = {
+    0, // DEFAULT
+    1, // HIGH_QUALITY
+    2, // LOW_LATENCY
+    3, // ULTRA_LOW_LATENCY
+    4, // LOSSLESS
+};
+
 static char const *const VkVideoEncodeAV1PredictionModeKHRStrings[4] = {
     "VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_INTRA_ONLY",              // 0
     "VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_SINGLE_REFERENCE",        // 1
@@ -9171,6 +19428,13 @@ static int32_t const VkVideoEncodeAV1PredictionModeKHRValues[4] = {
     3, // VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_BIDIRECTIONAL_COMPOUND
 };
 
+static uint16_t const VkVideoEncodeAV1PredictionModeKHRValueIndices[4] = {
+    0, // VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_INTRA_ONLY
+    1, // VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_SINGLE_REFERENCE
+    2, // VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_UNIDIRECTIONAL_COMPOUND
+    3, // VK_VIDEO_ENCODE_AV1_PREDICTION_MODE_BIDIRECTIONAL_COMPOUND
+};
+
 static char const *const VkVideoEncodeAV1RateControlGroupKHRStrings[3] = {
     "VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_INTRA",        // 0
     "VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_PREDICTIVE",   // 1
@@ -9183,6 +19447,12 @@ static int32_t const VkVideoEncodeAV1RateControlGroupKHRValues[3] = {
     2, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_BIPREDICTIVE
 };
 
+static uint16_t const VkVideoEncodeAV1RateControlGroupKHRValueIndices[3] = {
+    0, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_INTRA
+    1, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_PREDICTIVE
+    2, // VK_VIDEO_ENCODE_AV1_RATE_CONTROL_GROUP_BIPREDICTIVE
+};
+
 static char const *const VkDefaultVertexAttributeValueKHRStrings[2] = {
     "ZERO_ZERO_ZERO_ZERO", // 0
     "ZERO_ZERO_ZERO_ONE",  // 1
@@ -9193,6 +19463,11 @@ static int32_t const VkDefaultVertexAttributeValueKHRValues[2] = {
     1, // ZERO_ZERO_ZERO_ONE
 };
 
+static uint16_t const VkDefaultVertexAttributeValueKHRValueIndices[2] = {
+    0, // ZERO_ZERO_ZERO_ZERO
+    1, // ZERO_ZERO_ZERO_ONE
+};
+
 static char const *const VkAccelerationStructureMotionInstanceTypeNVStrings[3] = {
     "STATIC",        // 0
     "MATRIX_MOTION", // 1
@@ -9205,6 +19480,12 @@ static int32_t const VkAccelerationStructureMotionInstanceTypeNVValues[3] = {
     2, // SRT_MOTION
 };
 
+static uint16_t const VkAccelerationStructureMotionInstanceTypeNVValueIndices[3] = {
+    0, // STATIC
+    1, // MATRIX_MOTION
+    2, // SRT_MOTION
+};
+
 static char const *const VkVideoEncodeH264CapabilityFlagsEXTStrings[35] = {
     "CHROMA_QP_OFFSET",                  // 0x00000040
     "SECOND_CHROMA_QP_OFFSET",           // 0x00000080
@@ -9281,6 +19562,35 @@ static uint32_t const VkVideoEncodeH264CapabilityFlagsEXTValues[35] = {
     0x00000100, // GENERATE_PREFIX_NALU
 };
 
+static uint16_t const VkVideoEncodeH264CapabilityFlagsEXTBitIndices[26] = {
+    27,            // DIRECT_8X8_INFERENCE_ENABLED
+    30,            // PREDICTION_WEIGHT_TABLE_GENERATED
+    15,            // SEPARATE_COLOUR_PLANE
+    16,            // QPPRIME_Y_ZERO_TRANSFORM_BYPASS
+    31,            // B_FRAME_IN_L0_LIST
+    26,            // B_FRAME_IN_L1_LIST
+    32,            // PER_PICTURE_TYPE_MIN_MAX_QP
+    33,            // PER_SLICE_CONSTANT_QP
+    34,            // GENERATE_PREFIX_NALU
+    19,            // WEIGHTED_PRED
+    20,            // WEIGHTED_BIPRED_EXPLICIT
+    21,            // WEIGHTED_BIPRED_IMPLICIT
+    22,            // WEIGHTED_PRED_NO_TABLE
+    2,             // TRANSFORM_8X8
+    3,             // CABAC
+    4,             // CAVLC
+    5,             // DEBLOCKING_FILTER_DISABLED
+    6,             // DEBLOCKING_FILTER_ENABLED
+    7,             // DEBLOCKING_FILTER_PARTIAL
+    23,            // DISABLE_DIRECT_SPATIAL_MV_PRED
+    8,             // MULTIPLE_SLICE_PER_FRAME
+    24,            // SLICE_MB_COUNT
+    cNoValueIndex, // bit 22
+    cNoValueIndex, // bit 23
+    cNoValueIndex, // bit 24
+    29,            // DIFFERENT_REFERENCE_FINAL_LISTS
+};
+
 static char const *const VkVideoEncodeH264StdFlagsEXTStrings[20] = {
     "SEPARATE_COLOR_PLANE_FLAG_SET",            // 0x00000001
     "QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET", // 0x00000002
@@ -9327,6 +19637,30 @@ static uint32_t const VkVideoEncodeH264StdFlagsEXTValues[20] = {
     0x00100000, // DIFFERENT_SLICE_QP_DELTA
 };
 
+static uint16_t const VkVideoEncodeH264StdFlagsEXTBitIndices[21] = {
+    0,             // SEPARATE_COLOR_PLANE_FLAG_SET
+    1,             // QPPRIME_Y_ZERO_TRANSFORM_BYPASS_FLAG_SET
+    2,             // SCALING_MATRIX_PRESENT_FLAG_SET
+    3,             // CHROMA_QP_INDEX_OFFSET
+    4,             // SECOND_CHROMA_QP_INDEX_OFFSET
+    5,             // PIC_INIT_QP_MINUS26
+    6,             // WEIGHTED_PRED_FLAG_SET
+    7,             // WEIGHTED_BIPRED_IDC_EXPLICIT
+    8,             // WEIGHTED_BIPRED_IDC_IMPLICIT
+    9,             // TRANSFORM_8X8_MODE_FLAG_SET
+    10,            // DIRECT_SPATIAL_MV_PRED_FLAG_UNSET
+    11,            // ENTROPY_CODING_MODE_FLAG_UNSET
+    12,            // ENTROPY_CODING_MODE_FLAG_SET
+    13,            // DIRECT_8X8_INFERENCE_FLAG_UNSET
+    14,            // CONSTRAINED_INTRA_PRED_FLAG_SET
+    15,            // DEBLOCKING_FILTER_DISABLED
+    16,            // DEBLOCKING_FILTER_ENABLED
+    17,            // DEBLOCKING_FILTER_PARTIAL
+    cNoValueIndex, // bit 18
+    18,            // SLICE_QP_DELTA
+    19,            // DIFFERENT_SLICE_QP_DELTA
+};
+
 static char const *const VkVideoEncodeH264RateControlFlagsEXTStrings[5] = {
     "ATTEMPT_HRD_COMPLIANCE",        // 0x00000001
     "REGULAR_GOP",                   // 0x00000002
@@ -9343,6 +19677,14 @@ static uint32_t const VkVideoEncodeH264RateControlFlagsEXTValues[5] = {
     0x00000010, // TEMPORAL_LAYER_PATTERN_DYADIC
 };
 
+static uint16_t const VkVideoEncodeH264RateControlFlagsEXTBitIndices[5] = {
+    0, // ATTEMPT_HRD_COMPLIANCE
+    1, // REGULAR_GOP
+    2, // REFERENCE_PATTERN_FLAT
+    3, // REFERENCE_PATTERN_DYADIC
+    4, // TEMPORAL_LAYER_PATTERN_DYADIC
+};
+
 static char const *const VkVideoEncodeH265CapabilityFlagsEXTStrings[43] = {
     "WEIGHTED_BI_PRED_IMPLICIT",           // 0x00000001
     "TRANSFORM_8X8",                       // 0x00000002
@@ -9435,6 +19777,36 @@ static uint32_t const VkVideoEncodeH265CapabilityFlagsEXTValues[43] = {
     0x00000200, // MULTIPLE_SLICE_SEGMENTS_PER_TILE
 };
 
+static uint16_t const VkVideoEncodeH265CapabilityFlagsEXTBitIndices[27] = {
+    11,            // SEPARATE_COLOUR_PLANE
+    36,            // PREDICTION_WEIGHT_TABLE_GENERATED
+    13,            // SAMPLE_ADAPTIVE_OFFSET_ENABLED
+    37,            // DIFFERENT_SLICE_SEGMENT_TYPE
+    38,            // B_FRAME_IN_L0_LIST
+    33,            // B_FRAME_IN_L1_LIST
+    39,            // PER_PICTURE_TYPE_MIN_MAX_QP
+    40,            // PER_SLICE_SEGMENT_CONSTANT_QP
+    41,            // MULTIPLE_TILES_PER_SLICE_SEGMENT
+    42,            // MULTIPLE_SLICE_SEGMENTS_PER_TILE
+    34,            // TRANSFORM_SKIP_DISABLED
+    20,            // PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT
+    21,            // WEIGHTED_PRED
+    22,            // WEIGHTED_BIPRED
+    23,            // WEIGHTED_PRED_NO_TABLE
+    24,            // TRANSQUANT_BYPASS_ENABLED
+    25,            // ENTROPY_CODING_SYNC_ENABLED
+    26,            // DEBLOCKING_FILTER_OVERRIDE_ENABLED
+    27,            // MULTIPLE_TILE_PER_FRAME
+    28,            // MULTIPLE_SLICE_PER_TILE
+    29,            // MULTIPLE_TILE_PER_SLICE
+    30,            // SLICE_SEGMENT_CTB_COUNT
+    cNoValueIndex, // bit 22
+    31,            // DEPENDENT_SLICE_SEGMENT
+    32,            // DIFFERENT_SLICE_TYPE
+    cNoValueIndex, // bit 25
+    35,            // DIFFERENT_REFERENCE_FINAL_LISTS
+};
+
 static char const *const VkVideoEncodeH265StdFlagsEXTStrings[21] = {
     "SEPARATE_COLOR_PLANE_FLAG_SET",                // 0x00000001
     "SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET",      // 0x00000002
@@ -9483,6 +19855,30 @@ static uint32_t const VkVideoEncodeH265StdFlagsEXTValues[21] = {
     0x00100000, // DIFFERENT_SLICE_QP_DELTA
 };
 
+static uint16_t const VkVideoEncodeH265StdFlagsEXTBitIndices[21] = {
+    0,  // SEPARATE_COLOR_PLANE_FLAG_SET
+    1,  // SAMPLE_ADAPTIVE_OFFSET_ENABLED_FLAG_SET
+    2,  // SCALING_LIST_DATA_PRESENT_FLAG_SET
+    3,  // PCM_ENABLED_FLAG_SET
+    4,  // SPS_TEMPORAL_MVP_ENABLED_FLAG_SET
+    5,  // INIT_QP_MINUS26
+    6,  // WEIGHTED_PRED_FLAG_SET
+    7,  // WEIGHTED_BIPRED_FLAG_SET
+    8,  // LOG2_PARALLEL_MERGE_LEVEL_MINUS2
+    9,  // SIGN_DATA_HIDING_ENABLED_FLAG_SET
+    10, // TRANSFORM_SKIP_ENABLED_FLAG_SET
+    11, // TRANSFORM_SKIP_ENABLED_FLAG_UNSET
+    12, // PPS_SLICE_CHROMA_QP_OFFSETS_PRESENT_FLAG_SET
+    13, // TRANSQUANT_BYPASS_ENABLED_FLAG_SET
+    14, // CONSTRAINED_INTRA_PRED_FLAG_SET
+    15, // ENTROPY_CODING_SYNC_ENABLED_FLAG_SET
+    16, // DEBLOCKING_FILTER_OVERRIDE_ENABLED_FLAG_SET
+    17, // DEPENDENT_SLICE_SEGMENTS_ENABLED_FLAG_SET
+    18, // DEPENDENT_SLICE_SEGMENT_FLAG_SET
+    19, // SLICE_QP_DELTA
+    20, // DIFFERENT_SLICE_QP_DELTA
+};
+
 static char const *const VkVideoEncodeH265RateControlFlagsEXTStrings[5] = {
     "ATTEMPT_HRD_COMPLIANCE",            // 0x00000001
     "REGULAR_GOP",                       // 0x00000002
@@ -9499,6 +19895,14 @@ static uint32_t const VkVideoEncodeH265RateControlFlagsEXTValues[5] = {
     0x00000010, // TEMPORAL_SUB_LAYER_PATTERN_DYADIC
 };
 
+static uint16_t const VkVideoEncodeH265RateControlFlagsEXTBitIndices[5] = {
+    0, // ATTEMPT_HRD_COMPLIANCE
+    1, // REGULAR_GOP
+    2, // REFERENCE_PATTERN_FLAT
+    3, // REFERENCE_PATTERN_DYADIC
+    4, // TEMPORAL_SUB_LAYER_PATTERN_DYADIC
+};
+
 static char const *const VkVideoEncodeH265CtbSizeFlagsEXTStrings[4] = {
     "16", // 0x00000001
     "32", // 0x00000002
@@ -9513,6 +19917,12 @@ static uint32_t const VkVideoEncodeH265CtbSizeFlagsEXTValues[4] = {
     0x00000001, // 8
 };
 
+static uint16_t const VkVideoEncodeH265CtbSizeFlagsEXTBitIndices[3] = {
+    3, // 8
+    1, // 32
+    2, // 64
+};
+
 static char const *const VkVideoEncodeH265TransformBlockSizeFlagsEXTStrings[4] = {
     "4",  // 0x00000001
     "8",  // 0x00000002
@@ -9527,6 +19937,13 @@ static uint32_t const VkVideoEncodeH265TransformBlockSizeFlagsEXTValues[4] = {
     0x00000008, // 32
 };
 
+static uint16_t const VkVideoEncodeH265TransformBlockSizeFlagsEXTBitIndices[4] = {
+    0, // 4
+    1, // 8
+    2, // 16
+    3, // 32
+};
+
 static char const *const VkVideoEncodeH264RateControlStructureEXTStrings[3] = {
     "UNKNOWN", // 0
     "FLAT",    // 1
@@ -9539,6 +19956,12 @@ static int32_t const VkVideoEncodeH264RateControlStructureEXTValues[3] = {
     2, // DYADIC
 };
 
+static uint16_t const VkVideoEncodeH264RateControlStructureEXTValueIndices[3] = {
+    0, // UNKNOWN
+    1, // FLAT
+    2, // DYADIC
+};
+
 static char const *const VkVideoEncodeH265RateControlStructureEXTStrings[3] = {
     "UNKNOWN", // 0
     "FLAT",    // 1
@@ -9551,6 +19974,12 @@ static int32_t const VkVideoEncodeH265RateControlStructureEXTValues[3] = {
     2, // DYADIC
 };
 
+static uint16_t const VkVideoEncodeH265RateControlStructureEXTValueIndices[3] = {
+    0, // UNKNOWN
+    1, // FLAT
+    2, // DYADIC
+};
+
 static char const *const VkVideoEncodeH264InputModeFlagsEXTStrings[3] = {
     "FRAME",   // 0x00000001
     "SLICE",   // 0x00000002
@@ -9563,6 +19992,12 @@ static uint32_t const VkVideoEncodeH264InputModeFlagsEXTValues[3] = {
     0x00000004, // NON_VCL
 };
 
+static uint16_t const VkVideoEncodeH264InputModeFlagsEXTBitIndices[3] = {
+    0, // FRAME
+    1, // SLICE
+    2, // NON_VCL
+};
+
 static char const *const VkVideoEncodeH264OutputModeFlagsEXTStrings[3] = {
     "FRAME",   // 0x00000001
     "SLICE",   // 0x00000002
@@ -9575,6 +20010,12 @@ static uint32_t const VkVideoEncodeH264OutputModeFlagsEXTValues[3] = {
     0x00000004, // NON_VCL
 };
 
+static uint16_t const VkVideoEncodeH264OutputModeFlagsEXTBitIndices[3] = {
+    0, // FRAME
+    1, // SLICE
+    2, // NON_VCL
+};
+
 static char const *const VkVideoEncodeH265InputModeFlagsEXTStrings[4] = {
     "FRAME",         // 0x00000001
     "NON_VCL",       // 0x00000004
@@ -9589,6 +20030,12 @@ static uint32_t const VkVideoEncodeH265InputModeFlagsEXTValues[4] = {
     0x00000002, // SLICE_SEGMENT
 };
 
+static uint16_t const VkVideoEncodeH265InputModeFlagsEXTBitIndices[3] = {
+    0, // FRAME
+    3, // SLICE_SEGMENT
+    1, // NON_VCL
+};
+
 static char const *const VkVideoEncodeH265OutputModeFlagsEXTStrings[4] = {
     "FRAME",         // 0x00000001
     "NON_VCL",       // 0x00000004
@@ -9603,6 +20050,12 @@ static uint32_t const VkVideoEncodeH265OutputModeFlagsEXTValues[4] = {
     0x00000002, // SLICE_SEGMENT
 };
 
+static uint16_t const VkVideoEncodeH265OutputModeFlagsEXTBitIndices[3] = {
+    0, // FRAME
+    3, // SLICE_SEGMENT
+    1, // NON_VCL
+};
+
 static char const *const VkVideoDecodeH264PictureLayoutFlagsEXTStrings[3] = {
     "PROGRESSIVE",                  // 0
     "INTERLACED_INTERLEAVED_LINES", // 0x00000001
@@ -9615,6 +20068,15 @@ static uint32_t const VkVideoDecodeH264PictureLayoutFlagsEXTValues[3] = {
     0x00000002, // INTERLACED_SEPARATE_PLANES
 };
 
+static uint16_t const VkVideoDecodeH264PictureLayoutFlagsEXTBitIndices[2] = {
+    1, // INTERLACED_INTERLEAVED_LINES
+    2, // INTERLACED_SEPARATE_PLANES
+};
+
+static uint16_t const VkVideoDecodeH264PictureLayoutFlagsEXTCombinedIndices[1] = {
+    0, // PROGRESSIVE
+};
+
 static char const *const VkVideoCodingQualityPresetFlagsKHRStrings[4] = {
     "NORMAL",  // 0x00000001
     "POWER",   // 0x00000002
@@ -9629,6 +20091,16 @@ static uint32_t const VkVideoCodingQualityPresetFlagsKHRValues[4] = {
     0,          // DEFAULT
 };
 
+static uint16_t const VkVideoCodingQualityPresetFlagsKHRBitIndices[3] = {
+    0, // NORMAL
+    1, // POWER
+    2, // QUALITY
+};
+
+static uint16_t const VkVideoCodingQualityPresetFlagsKHRCombinedIndices[1] = {
+    3, // DEFAULT
+};
+
 static char const *const VkVideoEncodeH264RateControlStructureFlagsEXTStrings[3] = {
     "UNKNOWN", // 0
     "FLAT",    // 0x00000001
@@ -9641,6 +20113,15 @@ static uint32_t const VkVideoEncodeH264RateControlStructureFlagsEXTValues[3] = {
     0x00000002, // DYADIC
 };
 
+static uint16_t const VkVideoEncodeH264RateControlStructureFlagsEXTBitIndices[2] = {
+    1, // FLAT
+    2, // DYADIC
+};
+
+static uint16_t const VkVideoEncodeH264RateControlStructureFlagsEXTCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkVideoEncodeH265RateControlStructureFlagsEXTStrings[3] = {
     "UNKNOWN", // 0
     "FLAT",    // 0x00000001
@@ -9653,6 +20134,15 @@ static uint32_t const VkVideoEncodeH265RateControlStructureFlagsEXTValues[3] = {
     0x00000002, // DYADIC
 };
 
+static uint16_t const VkVideoEncodeH265RateControlStructureFlagsEXTBitIndices[2] = {
+    1, // FLAT
+    2, // DYADIC
+};
+
+static uint16_t const VkVideoEncodeH265RateControlStructureFlagsEXTCombinedIndices[1] = {
+    0, // UNKNOWN
+};
+
 static char const *const VkVideoEncodeH264CreateFlagsEXTStrings[2] = {
     "DEFAULT",    // 0
     "RESERVED_0", // 0x00000001
@@ -9663,6 +20153,14 @@ static uint32_t const VkVideoEncodeH264CreateFlagsEXTValues[2] = {
     0x00000001, // RESERVED_0
 };
 
+static uint16_t const VkVideoEncodeH264CreateFlagsEXTBitIndices[1] = {
+    1, // RESERVED_0
+};
+
+static uint16_t const VkVideoEncodeH264CreateFlagsEXTCombinedIndices[1] = {
+    0, // DEFAULT
+};
+
 static char const *const VkVideoCapabilitiesFlagsKHRStrings[2] = {
     "PROTECTED_CONTENT",         // 0x00000001
     "SEPARATE_REFERENCE_IMAGES", // 0x00000002
@@ -9673,6 +20171,11 @@ static uint32_t const VkVideoCapabilitiesFlagsKHRValues[2] = {
     0x00000002, // SEPARATE_REFERENCE_IMAGES
 };
 
+static uint16_t const VkVideoCapabilitiesFlagsKHRBitIndices[2] = {
+    0, // PROTECTED_CONTENT
+    1, // SEPARATE_REFERENCE_IMAGES
+};
+
 static char const *const VkVideoDecodeH264FieldLayoutFlagsEXTStrings[3] = {
     "VK_VIDEO_DECODE_H264_PROGRESSIVE_PICTURES_ONLY", // 0
     "LINE_INTERLACED_PLANE",                          // 0x00000001
@@ -9685,6 +20188,15 @@ static uint32_t const VkVideoDecodeH264FieldLayoutFlagsEXTValues[3] = {
     0x00000002, // SEPARATE_INTERLACED_PLANE
 };
 
+static uint16_t const VkVideoDecodeH264FieldLayoutFlagsEXTBitIndices[2] = {
+    1, // LINE_INTERLACED_PLANE
+    2, // SEPARATE_INTERLACED_PLANE
+};
+
+static uint16_t const VkVideoDecodeH264FieldLayoutFlagsEXTCombinedIndices[1] = {
+    0, // VK_VIDEO_DECODE_H264_PROGRESSIVE_PICTURES_ONLY
+};
+
 static char const *const VkVideoEncodeH264CapabilitiesFlagsEXTStrings[11] = {
     "VK_VIDEO_ENCODE_H264_CAPABILITY_CABAC",                         // 0x00000001
     "VK_VIDEO_ENCODE_H264_CAPABILITY_CAVLC",                         // 0x00000002
@@ -9713,6 +20225,20 @@ static uint32_t const VkVideoEncodeH264CapabilitiesFlagsEXTValues[11] = {
     0x00000400, // VK_VIDEO_ENCODE_H264_CAPABILITY_EVENLY_DISTRIBUTED_SLICE_SIZE
 };
 
+static uint16_t const VkVideoEncodeH264CapabilitiesFlagsEXTBitIndices[11] = {
+    0,  // VK_VIDEO_ENCODE_H264_CAPABILITY_CABAC
+    1,  // VK_VIDEO_ENCODE_H264_CAPABILITY_CAVLC
+    2,  // VK_VIDEO_ENCODE_H264_CAPABILITY_WEIGHTED_BI_PRED_IMPLICIT
+    3,  // VK_VIDEO_ENCODE_H264_CAPABILITY_TRANSFORM_8X8
+    4,  // VK_VIDEO_ENCODE_H264_CAPABILITY_CHROMA_QP_OFFSET
+    5,  // VK_VIDEO_ENCODE_H264_CAPABILITY_SECOND_CHROMA_QP_OFFSET
+    6,  // VK_VIDEO_ENCODE_H264_CAPABILITY_DEBLOCKING_FILTER_DISABLED
+    7,  // VK_VIDEO_ENCODE_H264_CAPABILITY_DEBLOCKING_FILTER_ENABLED
+    8,  // VK_VIDEO_ENCODE_H264_CAPABILITY_DEBLOCKING_FILTER_PARTIAL
+    9,  // VK_VIDEO_ENCODE_H264_CAPABILITY_MULTIPLE_SLICE_PER_FRAME
+    10, // VK_VIDEO_ENCODE_H264_CAPABILITY_EVENLY_DISTRIBUTED_SLICE_SIZE
+};
+
 static char const *const VkAccelerationStructureMemoryRequirementsTypeKHRStrings[6] = {
     "OBJECT_NV",         // 0
     "BUILD_SCRATCH_NV",  // 1
@@ -9731,6 +20257,12 @@ static int32_t const VkAccelerationStructureMemoryRequirementsTypeKHRValues[6] =
     2, // UPDATE_SCRATCH
 };
 
+static uint16_t const VkAccelerationStructureMemoryRequirementsTypeKHRValueIndices[3] = {
+    0, // OBJECT_NV
+    1, // BUILD_SCRATCH_NV
+    2, // UPDATE_SCRATCH_NV
+};
+
 static char const *const VkIndirectCommandsLayoutUsageFlagsNVXStrings[4] = {
     "UNORDERED_SEQUENCES", // 0x00000001
     "SPARSE_SEQUENCES",    // 0x00000002
@@ -9745,6 +20277,13 @@ static uint32_t const VkIndirectCommandsLayoutUsageFlagsNVXValues[4] = {
     0x00000008, // INDEXED_SEQUENCES
 };
 
+static uint16_t const VkIndirectCommandsLayoutUsageFlagsNVXBitIndices[4] = {
+    0, // UNORDERED_SEQUENCES
+    1, // SPARSE_SEQUENCES
+    2, // EMPTY_EXECUTIONS
+    3, // INDEXED_SEQUENCES
+};
+
 static char const *const VkObjectEntryUsageFlagsNVXStrings[2] = {
     "GRAPHICS", // 0x00000001
     "COMPUTE",  // 0x00000002
@@ -9755,6 +20294,11 @@ static uint32_t const VkObjectEntryUsageFlagsNVXValues[2] = {
     0x00000002, // COMPUTE
 };
 
+static uint16_t const VkObjectEntryUsageFlagsNVXBitIndices[2] = {
+    0, // GRAPHICS
+    1, // COMPUTE
+};
+
 static char const *const VkIndirectCommandsTokenTypeNVXStrings[8] = {
     "PIPELINE",       // 0
     "DESCRIPTOR_SET", // 1
@@ -9777,6 +20321,17 @@ static int32_t const VkIndirectCommandsTokenTypeNVXValues[8] = {
     7, // DISPATCH
 };
 
+static uint16_t const VkIndirectCommandsTokenTypeNVXValueIndices[8] = {
+    0, // PIPELINE
+    1, // DESCRIPTOR_SET
+    2, // INDEX_BUFFER
+    3, // VERTEX_BUFFER
+    4, // PUSH_CONSTANT
+    5, // DRAW_INDEXED
+    6, // DRAW
+    7, // DISPATCH
+};
+
 static char const *const VkObjectEntryTypeNVXStrings[5] = {
     "DESCRIPTOR_SET", // 0
     "PIPELINE",       // 1
@@ -9793,6 +20348,14 @@ static int32_t const VkObjectEntryTypeNVXValues[5] = {
     4, // PUSH_CONSTANT
 };
 
+static uint16_t const VkObjectEntryTypeNVXValueIndices[5] = {
+    0, // DESCRIPTOR_SET
+    1, // PIPELINE
+    2, // INDEX_BUFFER
+    3, // VERTEX_BUFFER
+    4, // PUSH_CONSTANT
+};
+
 static char const *const VkGeometryFlagsNVXStrings[2] = {
     "OPAQUE",                          // 0x00000001
     "NO_DUPLICATE_ANY_HIT_INVOCATION", // 0x00000002
@@ -9803,6 +20366,11 @@ static uint32_t const VkGeometryFlagsNVXValues[2] = {
     0x00000002, // NO_DUPLICATE_ANY_HIT_INVOCATION
 };
 
+static uint16_t const VkGeometryFlagsNVXBitIndices[2] = {
+    0, // OPAQUE
+    1, // NO_DUPLICATE_ANY_HIT_INVOCATION
+};
+
 static char const *const VkGeometryInstanceFlagsNVXStrings[4] = {
     "TRIANGLE_CULL_DISABLE",      // 0x00000001
     "TRIANGLE_CULL_FLIP_WINDING", // 0x00000002
@@ -9817,6 +20385,13 @@ static uint32_t const VkGeometryInstanceFlagsNVXValues[4] = {
     0x00000008, // FORCE_NO_OPAQUE
 };
 
+static uint16_t const VkGeometryInstanceFlagsNVXBitIndices[4] = {
+    0, // TRIANGLE_CULL_DISABLE
+    1, // TRIANGLE_CULL_FLIP_WINDING
+    2, // FORCE_OPAQUE
+    3, // FORCE_NO_OPAQUE
+};
+
 static char const *const VkBuildAccelerationStructureFlagsNVXStrings[5] = {
     "ALLOW_UPDATE",      // 0x00000001
     "ALLOW_COMPACTION",  // 0x00000002
@@ -9833,6 +20408,14 @@ static uint32_t const VkBuildAccelerationStructureFlagsNVXValues[5] = {
     0x00000010, // LOW_MEMORY
 };
 
+static uint16_t const VkBuildAccelerationStructureFlagsNVXBitIndices[5] = {
+    0, // ALLOW_UPDATE
+    1, // ALLOW_COMPACTION
+    2, // PREFER_FAST_TRACE
+    3, // PREFER_FAST_BUILD
+    4, // LOW_MEMORY
+};
+
 static char const *const VkCopyAccelerationStructureModeNVXStrings[2] = {
     "CLONE",   // 0
     "COMPACT", // 1
@@ -9843,6 +20426,11 @@ static int32_t const VkCopyAccelerationStructureModeNVXValues[2] = {
     1, // COMPACT
 };
 
+static uint16_t const VkCopyAccelerationStructureModeNVXValueIndices[2] = {
+    0, // CLONE
+    1, // COMPACT
+};
+
 static char const *const VkAccelerationStructureTypeNVXStrings[2] = {
     "TOP_LEVEL",    // 0
     "BOTTOM_LEVEL", // 1
@@ -9853,6 +20441,11 @@ static int32_t const VkAccelerationStructureTypeNVXValues[2] = {
     1, // BOTTOM_LEVEL
 };
 
+static uint16_t const VkAccelerationStructureTypeNVXValueIndices[2] = {
+    0, // TOP_LEVEL
+    1, // BOTTOM_LEVEL
+};
+
 static char const *const VkGeometryTypeNVXStrings[2] = {
     "TRIANGLES", // 0
     "AABBS",     // 1
@@ -9863,802 +20456,1586 @@ static int32_t const VkGeometryTypeNVXValues[2] = {
     1, // AABBS
 };
 
+static uint16_t const VkGeometryTypeNVXValueIndices[2] = {
+    0, // TRIANGLES
+    1, // AABBS
+};
+
+struct VendorGroup {
+  uint8_t length;
+  uint16_t first;
+  uint16_t count;
+};
+
+#define cVendorGroupCount sizeof(cVendorGroups) / sizeof(struct VendorGroup)
+static struct VendorGroup const cVendorGroups[9] = {
+    {10, 0, 2},  // FREDEMMOTT - RASTERGRID
+    {9, 2, 1},   // RENDERDOC
+    {8, 3, 1},   // CHROMIUM
+    {7, 4, 3},   // ANDROID - SAMSUNG
+    {6, 7, 4},   // GOOGLE - OPENXR
+    {5, 11, 5},  // INTEL - VALVE
+    {4, 16, 8},  // AMDX - QCOM
+    {3, 24, 16}, // AMD - VSI
+    {2, 40, 3},  // FB - NV
+};
+
 typedef enum EnumType {
   ENUM_TYPE_ENUM,
   ENUM_TYPE_FLAG32,
   ENUM_TYPE_FLAG64,
 } EnumType;
 
-typedef struct ValueSet {
+struct STecVkValueSet {
   char const *name;
+  char const *prefix;
   char const *const *valueNames;
   void const *values;
   uint32_t count;
   EnumType type;
-} ValueSet;
-
-static const uint32_t cValueSetCount = 440;
-static ValueSet const cValueSets[440] = {
-    {"VkFramebufferCreateFlags", VkFramebufferCreateFlagsStrings, VkFramebufferCreateFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkQueryPoolCreateFlags", VkQueryPoolCreateFlagsStrings, VkQueryPoolCreateFlagsValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkRenderPassCreateFlags", VkRenderPassCreateFlagsStrings, VkRenderPassCreateFlagsValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkSamplerCreateFlags", VkSamplerCreateFlagsStrings, VkSamplerCreateFlagsValues, 7,
-     ENUM_TYPE_FLAG32},
-    {"VkPipelineLayoutCreateFlags", VkPipelineLayoutCreateFlagsStrings,
-     VkPipelineLayoutCreateFlagsValues, 4, ENUM_TYPE_FLAG32},
-    {"VkPipelineCacheCreateFlags", VkPipelineCacheCreateFlagsStrings,
-     VkPipelineCacheCreateFlagsValues, 8, ENUM_TYPE_FLAG32},
-    {"VkPipelineDepthStencilStateCreateFlags", VkPipelineDepthStencilStateCreateFlagsStrings,
-     VkPipelineDepthStencilStateCreateFlagsValues, 4, ENUM_TYPE_FLAG32},
-    {"VkPipelineDynamicStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineColorBlendStateCreateFlags", VkPipelineColorBlendStateCreateFlagsStrings,
-     VkPipelineColorBlendStateCreateFlagsValues, 2, ENUM_TYPE_FLAG32},
-    {"VkPipelineMultisampleStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineRasterizationStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineViewportStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineTessellationStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineInputAssemblyStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineVertexInputStateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineShaderStageCreateFlags", VkPipelineShaderStageCreateFlagsStrings,
-     VkPipelineShaderStageCreateFlagsValues, 6, ENUM_TYPE_FLAG32},
-    {"VkDescriptorSetLayoutCreateFlags", VkDescriptorSetLayoutCreateFlagsStrings,
-     VkDescriptorSetLayoutCreateFlagsValues, 15, ENUM_TYPE_FLAG32},
-    {"VkBufferViewCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkInstanceCreateFlags", VkInstanceCreateFlagsStrings, VkInstanceCreateFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkDeviceCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDeviceQueueCreateFlags", VkDeviceQueueCreateFlagsStrings, VkDeviceQueueCreateFlagsValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkQueueFlags", VkQueueFlagsStrings, VkQueueFlagsValues, 18, ENUM_TYPE_FLAG32},
-    {"VkMemoryPropertyFlags", VkMemoryPropertyFlagsStrings, VkMemoryPropertyFlagsValues, 11,
-     ENUM_TYPE_FLAG32},
-    {"VkMemoryHeapFlags", VkMemoryHeapFlagsStrings, VkMemoryHeapFlagsValues, 6, ENUM_TYPE_FLAG32},
-    {"VkAccessFlags", VkAccessFlagsStrings, VkAccessFlagsValues, 47, ENUM_TYPE_FLAG32},
-    {"VkBufferUsageFlags", VkBufferUsageFlagsStrings, VkBufferUsageFlagsValues, 51,
-     ENUM_TYPE_FLAG32},
-    {"VkBufferCreateFlags", VkBufferCreateFlagsStrings, VkBufferCreateFlagsValues, 13,
-     ENUM_TYPE_FLAG32},
-    {"VkShaderStageFlags", VkShaderStageFlagsStrings, VkShaderStageFlagsValues, 46,
-     ENUM_TYPE_FLAG32},
-    {"VkImageUsageFlags", VkImageUsageFlagsStrings, VkImageUsageFlagsValues, 54, ENUM_TYPE_FLAG32},
-    {"VkImageCreateFlags", VkImageCreateFlagsStrings, VkImageCreateFlagsValues, 41,
-     ENUM_TYPE_FLAG32},
-    {"VkImageViewCreateFlags", VkImageViewCreateFlagsStrings, VkImageViewCreateFlagsValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkPipelineCreateFlags", VkPipelineCreateFlagsStrings, VkPipelineCreateFlagsValues, 69,
-     ENUM_TYPE_FLAG32},
-    {"VkColorComponentFlags", VkColorComponentFlagsStrings, VkColorComponentFlagsValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkFenceCreateFlags", VkFenceCreateFlagsStrings, VkFenceCreateFlagsValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkSemaphoreCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkFormatFeatureFlags", VkFormatFeatureFlagsStrings, VkFormatFeatureFlagsValues, 49,
-     ENUM_TYPE_FLAG32},
-    {"VkQueryControlFlags", VkQueryControlFlagsStrings, VkQueryControlFlagsValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkQueryResultFlags", VkQueryResultFlagsStrings, VkQueryResultFlagsValues, 5,
-     ENUM_TYPE_FLAG32},
-    {"VkShaderModuleCreateFlags", VkShaderModuleCreateFlagsStrings, VkShaderModuleCreateFlagsValues,
-     1, ENUM_TYPE_FLAG32},
-    {"VkEventCreateFlags", VkEventCreateFlagsStrings, VkEventCreateFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkCommandPoolCreateFlags", VkCommandPoolCreateFlagsStrings, VkCommandPoolCreateFlagsValues, 3,
-     ENUM_TYPE_FLAG32},
-    {"VkCommandPoolResetFlags", VkCommandPoolResetFlagsStrings, VkCommandPoolResetFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkCommandBufferResetFlags", VkCommandBufferResetFlagsStrings, VkCommandBufferResetFlagsValues,
-     1, ENUM_TYPE_FLAG32},
-    {"VkCommandBufferUsageFlags", VkCommandBufferUsageFlagsStrings, VkCommandBufferUsageFlagsValues,
-     5, ENUM_TYPE_FLAG32},
-    {"VkQueryPipelineStatisticFlags", VkQueryPipelineStatisticFlagsStrings,
-     VkQueryPipelineStatisticFlagsValues, 14, ENUM_TYPE_FLAG32},
-    {"VkMemoryMapFlags", VkMemoryMapFlagsStrings, VkMemoryMapFlagsValues, 1, ENUM_TYPE_FLAG32},
-    {"VkMemoryUnmapFlags", VkMemoryUnmapFlagsStrings, VkMemoryUnmapFlagsValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkImageAspectFlags", VkImageAspectFlagsStrings, VkImageAspectFlagsValues, 17,
-     ENUM_TYPE_FLAG32},
-    {"VkSparseMemoryBindFlags", VkSparseMemoryBindFlagsStrings, VkSparseMemoryBindFlagsValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkSparseImageFormatFlags", VkSparseImageFormatFlagsStrings, VkSparseImageFormatFlagsValues, 3,
-     ENUM_TYPE_FLAG32},
-    {"VkSubpassDescriptionFlags", VkSubpassDescriptionFlagsStrings, VkSubpassDescriptionFlagsValues,
-     17, ENUM_TYPE_FLAG32},
-    {"VkPipelineStageFlags", VkPipelineStageFlagsStrings, VkPipelineStageFlagsValues, 43,
-     ENUM_TYPE_FLAG32},
-    {"VkSampleCountFlags", VkSampleCountFlagsStrings, VkSampleCountFlagsValues, 7,
-     ENUM_TYPE_FLAG32},
-    {"VkAttachmentDescriptionFlags", VkAttachmentDescriptionFlagsStrings,
-     VkAttachmentDescriptionFlagsValues, 5, ENUM_TYPE_FLAG32},
-    {"VkStencilFaceFlags", VkStencilFaceFlagsStrings, VkStencilFaceFlagsValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkCullModeFlags", VkCullModeFlagsStrings, VkCullModeFlagsValues, 4, ENUM_TYPE_FLAG32},
-    {"VkDescriptorPoolCreateFlags", VkDescriptorPoolCreateFlagsStrings,
-     VkDescriptorPoolCreateFlagsValues, 8, ENUM_TYPE_FLAG32},
-    {"VkDescriptorPoolResetFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDependencyFlags", VkDependencyFlagsStrings, VkDependencyFlagsValues, 12, ENUM_TYPE_FLAG32},
-    {"VkSubgroupFeatureFlags", VkSubgroupFeatureFlagsStrings, VkSubgroupFeatureFlagsValues, 14,
-     ENUM_TYPE_FLAG32},
-    {"VkIndirectCommandsLayoutUsageFlagsNV", VkIndirectCommandsLayoutUsageFlagsNVStrings,
-     VkIndirectCommandsLayoutUsageFlagsNVValues, 3, ENUM_TYPE_FLAG32},
-    {"VkIndirectStateFlagsNV", VkIndirectStateFlagsNVStrings, VkIndirectStateFlagsNVValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkGeometryFlagsKHR", VkGeometryFlagsKHRStrings, VkGeometryFlagsKHRValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkGeometryInstanceFlagsKHR", VkGeometryInstanceFlagsKHRStrings,
-     VkGeometryInstanceFlagsKHRValues, 17, ENUM_TYPE_FLAG32},
-    {"VkClusterAccelerationStructureGeometryFlagsNV",
+  uint16_t const *bitIndices;
+  uint32_t bitIndexCount;
+  uint16_t const *combinedIndices;
+  uint32_t combinedCount;
+  uint16_t const *valueIndices;
+  uint32_t valueIndexCount;
+  int32_t const *sortedValues;
+  uint16_t const *sortedIndices;
+  uint32_t sortedCount;
+  uint16_t const *extensionBlocks;
+  uint32_t extensionBlockCount;
+};
+
+typedef struct STecVkValueSet ValueSet;
+
+static char const *getVendor(size_t index) { return cVendorList[index]; }
+
+static char const *getValueSetName(ValueSet const *pValueSet) { return pValueSet->name; }
+
+static char const *getValueSetPrefix(ValueSet const *pValueSet) { return pValueSet->prefix; }
+
+static char const *getValueName(ValueSet const *pValueSet, size_t index) {
+  return pValueSet->valueNames[index];
+}
+
+static uint32_t getValueNameLength(ValueSet const *pValueSet, size_t index) {
+  return (uint32_t)strlen(pValueSet->valueNames[index]);
+}
+
+static void const *getValues(ValueSet const *pValueSet) { return pValueSet->values; }
+
+static uint16_t const *getBitIndices(ValueSet const *pValueSet) { return pValueSet->bitIndices; }
+
+static uint16_t const *getCombinedIndices(ValueSet const *pValueSet) {
+  return pValueSet->combinedIndices;
+}
+
+static uint16_t const *getValueIndices(ValueSet const *pValueSet) {
+  return pValueSet->valueIndices;
+}
+
+static int32_t const *getSortedValues(ValueSet const *pValueSet) { return pValueSet->sortedValues; }
+
+static uint16_t const *getSortedIndices(ValueSet const *pValueSet) {
+  return pValueSet->sortedIndices;
+}
+
+static uint16_t const *getExtensionBlocks(ValueSet const *pValueSet) {
+  return pValueSet->extensionBlocks;
+}
+
+static const uint32_t cValueSetCount = 441;
+static ValueSet const cValueSets[441] = {
+    {"VkFramebufferCreateFlags", "VK_FRAMEBUFFER_CREATE_", VkFramebufferCreateFlagsStrings,
+     VkFramebufferCreateFlagsValues, 2, ENUM_TYPE_FLAG32, VkFramebufferCreateFlagsBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkQueryPoolCreateFlags", "VK_QUERY_POOL_CREATE_", VkQueryPoolCreateFlagsStrings,
+     VkQueryPoolCreateFlagsValues, 1, ENUM_TYPE_FLAG32, VkQueryPoolCreateFlagsBitIndices, 1, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkRenderPassCreateFlags", "VK_RENDER_PASS_CREATE_", VkRenderPassCreateFlagsStrings,
+     VkRenderPassCreateFlagsValues, 6, ENUM_TYPE_FLAG32, VkRenderPassCreateFlagsBitIndices, 4, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSamplerCreateFlags", "VK_SAMPLER_CREATE_", VkSamplerCreateFlagsStrings,
+     VkSamplerCreateFlagsValues, 7, ENUM_TYPE_FLAG32, VkSamplerCreateFlagsBitIndices, 5, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineLayoutCreateFlags", "VK_PIPELINE_LAYOUT_CREATE_",
+     VkPipelineLayoutCreateFlagsStrings, VkPipelineLayoutCreateFlagsValues, 4, ENUM_TYPE_FLAG32,
+     VkPipelineLayoutCreateFlagsBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCacheCreateFlags", "VK_PIPELINE_CACHE_CREATE_", VkPipelineCacheCreateFlagsStrings,
+     VkPipelineCacheCreateFlagsValues, 7, ENUM_TYPE_FLAG32, VkPipelineCacheCreateFlagsBitIndices, 4,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineDepthStencilStateCreateFlags", "VK_PIPELINE_DEPTH_STENCIL_STATE_CREATE_",
+     VkPipelineDepthStencilStateCreateFlagsStrings, VkPipelineDepthStencilStateCreateFlagsValues, 4,
+     ENUM_TYPE_FLAG32, VkPipelineDepthStencilStateCreateFlagsBitIndices, 2, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkPipelineDynamicStateCreateFlags", "VK_PIPELINE_DYNAMIC_STATE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineColorBlendStateCreateFlags", "VK_PIPELINE_COLOR_BLEND_STATE_CREATE_",
+     VkPipelineColorBlendStateCreateFlagsStrings, VkPipelineColorBlendStateCreateFlagsValues, 2,
+     ENUM_TYPE_FLAG32, VkPipelineColorBlendStateCreateFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkPipelineMultisampleStateCreateFlags", "VK_PIPELINE_MULTISAMPLE_STATE_CREATE_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineRasterizationStateCreateFlags", "VK_PIPELINE_RASTERIZATION_STATE_CREATE_", NULL,
+     NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineViewportStateCreateFlags", "VK_PIPELINE_VIEWPORT_STATE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineTessellationStateCreateFlags", "VK_PIPELINE_TESSELLATION_STATE_CREATE_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineInputAssemblyStateCreateFlags", "VK_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_", NULL,
+     NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineVertexInputStateCreateFlags", "VK_PIPELINE_VERTEX_INPUT_STATE_CREATE_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineShaderStageCreateFlags", "VK_PIPELINE_SHADER_STAGE_CREATE_",
+     VkPipelineShaderStageCreateFlagsStrings, VkPipelineShaderStageCreateFlagsValues, 6,
+     ENUM_TYPE_FLAG32, VkPipelineShaderStageCreateFlagsBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkDescriptorSetLayoutCreateFlags", "VK_DESCRIPTOR_SET_LAYOUT_CREATE_",
+     VkDescriptorSetLayoutCreateFlagsStrings, VkDescriptorSetLayoutCreateFlagsValues, 15,
+     ENUM_TYPE_FLAG32, VkDescriptorSetLayoutCreateFlagsBitIndices, 8, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkBufferViewCreateFlags", "VK_BUFFER_VIEW_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkInstanceCreateFlags", "VK_INSTANCE_CREATE_", VkInstanceCreateFlagsStrings,
+     VkInstanceCreateFlagsValues, 2, ENUM_TYPE_FLAG32, VkInstanceCreateFlagsBitIndices, 2, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceCreateFlags", "VK_DEVICE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceQueueCreateFlags", "VK_DEVICE_QUEUE_CREATE_", VkDeviceQueueCreateFlagsStrings,
+     VkDeviceQueueCreateFlagsValues, 4, ENUM_TYPE_FLAG32, VkDeviceQueueCreateFlagsBitIndices, 3,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkQueueFlags", "VK_QUEUE_", VkQueueFlagsStrings, VkQueueFlagsValues, 18, ENUM_TYPE_FLAG32,
+     VkQueueFlagsBitIndices, 14, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryPropertyFlags", "VK_MEMORY_PROPERTY_", VkMemoryPropertyFlagsStrings,
+     VkMemoryPropertyFlagsValues, 11, ENUM_TYPE_FLAG32, VkMemoryPropertyFlagsBitIndices, 10, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryHeapFlags", "VK_MEMORY_HEAP_", VkMemoryHeapFlagsStrings, VkMemoryHeapFlagsValues, 6,
+     ENUM_TYPE_FLAG32, VkMemoryHeapFlagsBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAccessFlags", "VK_ACCESS_", VkAccessFlagsStrings, VkAccessFlagsValues, 47, ENUM_TYPE_FLAG32,
+     VkAccessFlagsBitIndices, 32, VkAccessFlagsCombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkBufferUsageFlags", "VK_BUFFER_USAGE_", VkBufferUsageFlagsStrings, VkBufferUsageFlagsValues,
+     51, ENUM_TYPE_FLAG32, VkBufferUsageFlagsBitIndices, 31, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkBufferCreateFlags", "VK_BUFFER_CREATE_", VkBufferCreateFlagsStrings,
+     VkBufferCreateFlagsValues, 13, ENUM_TYPE_FLAG32, VkBufferCreateFlagsBitIndices, 8, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkShaderStageFlags", "VK_SHADER_STAGE_", VkShaderStageFlagsStrings, VkShaderStageFlagsValues,
+     46, ENUM_TYPE_FLAG32, VkShaderStageFlagsBitIndices, 20, VkShaderStageFlagsCombinedIndices, 2,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageUsageFlags", "VK_IMAGE_USAGE_", VkImageUsageFlagsStrings, VkImageUsageFlagsValues, 54,
+     ENUM_TYPE_FLAG32, VkImageUsageFlagsBitIndices, 31, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageCreateFlags", "VK_IMAGE_CREATE_", VkImageCreateFlagsStrings, VkImageCreateFlagsValues,
+     41, ENUM_TYPE_FLAG32, VkImageCreateFlagsBitIndices, 23, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkImageViewCreateFlags", "VK_IMAGE_VIEW_CREATE_", VkImageViewCreateFlagsStrings,
+     VkImageViewCreateFlagsValues, 6, ENUM_TYPE_FLAG32, VkImageViewCreateFlagsBitIndices, 4, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCreateFlags", "VK_PIPELINE_CREATE_", VkPipelineCreateFlagsStrings,
+     VkPipelineCreateFlagsValues, 69, ENUM_TYPE_FLAG32, VkPipelineCreateFlagsBitIndices, 31, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkColorComponentFlags", "VK_COLOR_COMPONENT_", VkColorComponentFlagsStrings,
+     VkColorComponentFlagsValues, 4, ENUM_TYPE_FLAG32, VkColorComponentFlagsBitIndices, 4, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFenceCreateFlags", "VK_FENCE_CREATE_", VkFenceCreateFlagsStrings, VkFenceCreateFlagsValues,
+     1, ENUM_TYPE_FLAG32, VkFenceCreateFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkSemaphoreCreateFlags", "VK_SEMAPHORE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFormatFeatureFlags", "VK_FORMAT_FEATURE_", VkFormatFeatureFlagsStrings,
+     VkFormatFeatureFlagsValues, 49, ENUM_TYPE_FLAG32, VkFormatFeatureFlagsBitIndices, 31, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkQueryControlFlags", "VK_QUERY_CONTROL_", VkQueryControlFlagsStrings,
+     VkQueryControlFlagsValues, 1, ENUM_TYPE_FLAG32, VkQueryControlFlagsBitIndices, 1, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkQueryResultFlags", "VK_QUERY_RESULT_", VkQueryResultFlagsStrings, VkQueryResultFlagsValues,
+     5, ENUM_TYPE_FLAG32, VkQueryResultFlagsBitIndices, 5, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkShaderModuleCreateFlags", "VK_SHADER_MODULE_CREATE_", VkShaderModuleCreateFlagsStrings,
+     VkShaderModuleCreateFlagsValues, 1, ENUM_TYPE_FLAG32, VkShaderModuleCreateFlagsBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkEventCreateFlags", "VK_EVENT_CREATE_", VkEventCreateFlagsStrings, VkEventCreateFlagsValues,
+     2, ENUM_TYPE_FLAG32, VkEventCreateFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkCommandPoolCreateFlags", "VK_COMMAND_POOL_CREATE_", VkCommandPoolCreateFlagsStrings,
+     VkCommandPoolCreateFlagsValues, 3, ENUM_TYPE_FLAG32, VkCommandPoolCreateFlagsBitIndices, 3,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCommandPoolResetFlags", "VK_COMMAND_POOL_RESET_", VkCommandPoolResetFlagsStrings,
+     VkCommandPoolResetFlagsValues, 2, ENUM_TYPE_FLAG32, VkCommandPoolResetFlagsBitIndices, 2, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCommandBufferResetFlags", "VK_COMMAND_BUFFER_RESET_", VkCommandBufferResetFlagsStrings,
+     VkCommandBufferResetFlagsValues, 1, ENUM_TYPE_FLAG32, VkCommandBufferResetFlagsBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCommandBufferUsageFlags", "VK_COMMAND_BUFFER_USAGE_", VkCommandBufferUsageFlagsStrings,
+     VkCommandBufferUsageFlagsValues, 5, ENUM_TYPE_FLAG32, VkCommandBufferUsageFlagsBitIndices, 5,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkQueryPipelineStatisticFlags", "VK_QUERY_PIPELINE_STATISTIC_",
+     VkQueryPipelineStatisticFlagsStrings, VkQueryPipelineStatisticFlagsValues, 14,
+     ENUM_TYPE_FLAG32, VkQueryPipelineStatisticFlagsBitIndices, 14, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkMemoryMapFlags", "VK_MEMORY_MAP_", VkMemoryMapFlagsStrings, VkMemoryMapFlagsValues, 1,
+     ENUM_TYPE_FLAG32, VkMemoryMapFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryUnmapFlags", "VK_MEMORY_UNMAP_", VkMemoryUnmapFlagsStrings, VkMemoryUnmapFlagsValues,
+     1, ENUM_TYPE_FLAG32, VkMemoryUnmapFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkImageAspectFlags", "VK_IMAGE_ASPECT_", VkImageAspectFlagsStrings, VkImageAspectFlagsValues,
+     17, ENUM_TYPE_FLAG32, VkImageAspectFlagsBitIndices, 12, VkImageAspectFlagsCombinedIndices, 2,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSparseMemoryBindFlags", "VK_SPARSE_MEMORY_BIND_", VkSparseMemoryBindFlagsStrings,
+     VkSparseMemoryBindFlagsValues, 1, ENUM_TYPE_FLAG32, VkSparseMemoryBindFlagsBitIndices, 1, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSparseImageFormatFlags", "VK_SPARSE_IMAGE_FORMAT_", VkSparseImageFormatFlagsStrings,
+     VkSparseImageFormatFlagsValues, 3, ENUM_TYPE_FLAG32, VkSparseImageFormatFlagsBitIndices, 3,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSubpassDescriptionFlags", "VK_SUBPASS_DESCRIPTION_", VkSubpassDescriptionFlagsStrings,
+     VkSubpassDescriptionFlagsValues, 17, ENUM_TYPE_FLAG32, VkSubpassDescriptionFlagsBitIndices, 9,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineStageFlags", "VK_PIPELINE_STAGE_", VkPipelineStageFlagsStrings,
+     VkPipelineStageFlagsValues, 43, ENUM_TYPE_FLAG32, VkPipelineStageFlagsBitIndices, 28,
+     VkPipelineStageFlagsCombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSampleCountFlags", "VK_SAMPLE_COUNT_", VkSampleCountFlagsStrings, VkSampleCountFlagsValues,
+     7, ENUM_TYPE_FLAG32, VkSampleCountFlagsBitIndices, 7, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkAttachmentDescriptionFlags", "VK_ATTACHMENT_DESCRIPTION_",
+     VkAttachmentDescriptionFlagsStrings, VkAttachmentDescriptionFlagsValues, 5, ENUM_TYPE_FLAG32,
+     VkAttachmentDescriptionFlagsBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkStencilFaceFlags", "VK_STENCIL_FACE_", VkStencilFaceFlagsStrings, VkStencilFaceFlagsValues,
+     4, ENUM_TYPE_FLAG32, VkStencilFaceFlagsBitIndices, 2, VkStencilFaceFlagsCombinedIndices, 2,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCullModeFlags", "VK_CULL_MODE_", VkCullModeFlagsStrings, VkCullModeFlagsValues, 4,
+     ENUM_TYPE_FLAG32, VkCullModeFlagsBitIndices, 2, VkCullModeFlagsCombinedIndices, 2, NULL, 0,
+     NULL, NULL, 0, NULL, 0},
+    {"VkDescriptorPoolCreateFlags", "VK_DESCRIPTOR_POOL_CREATE_",
+     VkDescriptorPoolCreateFlagsStrings, VkDescriptorPoolCreateFlagsValues, 8, ENUM_TYPE_FLAG32,
+     VkDescriptorPoolCreateFlagsBitIndices, 5, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDescriptorPoolResetFlags", "VK_DESCRIPTOR_POOL_RESET_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDependencyFlags", "VK_DEPENDENCY_", VkDependencyFlagsStrings, VkDependencyFlagsValues, 12,
+     ENUM_TYPE_FLAG32, VkDependencyFlagsBitIndices, 7, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSubgroupFeatureFlags", "VK_SUBGROUP_FEATURE_", VkSubgroupFeatureFlagsStrings,
+     VkSubgroupFeatureFlagsValues, 14, ENUM_TYPE_FLAG32, VkSubgroupFeatureFlagsBitIndices, 11, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectCommandsLayoutUsageFlagsNV", "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_",
+     VkIndirectCommandsLayoutUsageFlagsNVStrings, VkIndirectCommandsLayoutUsageFlagsNVValues, 3,
+     ENUM_TYPE_FLAG32, VkIndirectCommandsLayoutUsageFlagsNVBitIndices, 3, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkIndirectStateFlagsNV", "VK_INDIRECT_STATE_", VkIndirectStateFlagsNVStrings,
+     VkIndirectStateFlagsNVValues, 1, ENUM_TYPE_FLAG32, VkIndirectStateFlagsNVBitIndices, 1, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkGeometryFlagsKHR", "VK_GEOMETRY_", VkGeometryFlagsKHRStrings, VkGeometryFlagsKHRValues, 4,
+     ENUM_TYPE_FLAG32, VkGeometryFlagsKHRBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkGeometryInstanceFlagsKHR", "VK_GEOMETRY_INSTANCE_", VkGeometryInstanceFlagsKHRStrings,
+     VkGeometryInstanceFlagsKHRValues, 17, ENUM_TYPE_FLAG32, VkGeometryInstanceFlagsKHRBitIndices,
+     6, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkClusterAccelerationStructureGeometryFlagsNV", "VK_CLUSTER_ACCELERATION_STRUCTURE_GEOMETRY_",
      VkClusterAccelerationStructureGeometryFlagsNVStrings,
-     VkClusterAccelerationStructureGeometryFlagsNVValues, 3, ENUM_TYPE_FLAG32},
-    {"VkClusterAccelerationStructureClusterFlagsNV",
+     VkClusterAccelerationStructureGeometryFlagsNVValues, 3, ENUM_TYPE_FLAG32,
+     VkClusterAccelerationStructureGeometryFlagsNVBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkClusterAccelerationStructureClusterFlagsNV", "VK_CLUSTER_ACCELERATION_STRUCTURE_CLUSTER_",
      VkClusterAccelerationStructureClusterFlagsNVStrings,
-     VkClusterAccelerationStructureClusterFlagsNVValues, 1, ENUM_TYPE_FLAG32},
+     VkClusterAccelerationStructureClusterFlagsNVValues, 1, ENUM_TYPE_FLAG32,
+     VkClusterAccelerationStructureClusterFlagsNVBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
     {"VkClusterAccelerationStructureAddressResolutionFlagsNV",
+     "VK_CLUSTER_ACCELERATION_STRUCTURE_ADDRESS_RESOLUTION_",
      VkClusterAccelerationStructureAddressResolutionFlagsNVStrings,
-     VkClusterAccelerationStructureAddressResolutionFlagsNVValues, 7, ENUM_TYPE_FLAG32},
-    {"VkBuildAccelerationStructureFlagsKHR", VkBuildAccelerationStructureFlagsKHRStrings,
-     VkBuildAccelerationStructureFlagsKHRValues, 34, ENUM_TYPE_FLAG32},
-    {"VkPrivateDataSlotCreateFlags", VkPrivateDataSlotCreateFlagsStrings,
-     VkPrivateDataSlotCreateFlagsValues, 1, ENUM_TYPE_FLAG32},
-    {"VkAccelerationStructureCreateFlagsKHR", VkAccelerationStructureCreateFlagsKHRStrings,
-     VkAccelerationStructureCreateFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkDescriptorUpdateTemplateCreateFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineCreationFeedbackFlags", VkPipelineCreationFeedbackFlagsStrings,
-     VkPipelineCreationFeedbackFlagsValues, 6, ENUM_TYPE_FLAG32},
-    {"VkPerformanceCounterDescriptionFlagsKHR", VkPerformanceCounterDescriptionFlagsKHRStrings,
-     VkPerformanceCounterDescriptionFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkAcquireProfilingLockFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkSemaphoreWaitFlags", VkSemaphoreWaitFlagsStrings, VkSemaphoreWaitFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkPipelineCompilerControlFlagsAMD", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkShaderCorePropertiesFlagsAMD", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDeviceDiagnosticsConfigFlagsNV", VkDeviceDiagnosticsConfigFlagsNVStrings,
-     VkDeviceDiagnosticsConfigFlagsNVValues, 4, ENUM_TYPE_FLAG32},
-    {"VkRefreshObjectFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkAccessFlags2", VkAccessFlags2Strings, VkAccessFlags2Values, 106, ENUM_TYPE_FLAG64},
-    {"VkPipelineStageFlags2", VkPipelineStageFlags2Strings, VkPipelineStageFlags2Values, 94,
-     ENUM_TYPE_FLAG64},
-    {"VkAccelerationStructureMotionInfoFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkAccelerationStructureMotionInstanceFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkFormatFeatureFlags2", VkFormatFeatureFlags2Strings, VkFormatFeatureFlags2Values, 117,
-     ENUM_TYPE_FLAG64},
-    {"VkFormatFeatureFlags4KHR", NULL, NULL, 0, ENUM_TYPE_FLAG64},
-    {"VkRenderingFlags", VkRenderingFlagsStrings, VkRenderingFlagsValues, 23, ENUM_TYPE_FLAG32},
-    {"VkMemoryDecompressionMethodFlagsEXT", VkMemoryDecompressionMethodFlagsEXTStrings,
-     VkMemoryDecompressionMethodFlagsEXTValues, 2, ENUM_TYPE_FLAG64},
-    {"VkDeviceFaultFlagsKHR", VkDeviceFaultFlagsKHRStrings, VkDeviceFaultFlagsKHRValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkBuildMicromapFlagsEXT", VkBuildMicromapFlagsEXTStrings, VkBuildMicromapFlagsEXTValues, 3,
-     ENUM_TYPE_FLAG32},
-    {"VkMicromapCreateFlagsEXT", VkMicromapCreateFlagsEXTStrings, VkMicromapCreateFlagsEXTValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkIndirectCommandsLayoutUsageFlagsEXT", VkIndirectCommandsLayoutUsageFlagsEXTStrings,
-     VkIndirectCommandsLayoutUsageFlagsEXTValues, 2, ENUM_TYPE_FLAG32},
-    {"VkIndirectCommandsInputModeFlagsEXT", VkIndirectCommandsInputModeFlagsEXTStrings,
-     VkIndirectCommandsInputModeFlagsEXTValues, 2, ENUM_TYPE_FLAG32},
-    {"VkDirectDriverLoadingFlagsLUNARG", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineCreateFlags2", VkPipelineCreateFlags2Strings, VkPipelineCreateFlags2Values, 68,
-     ENUM_TYPE_FLAG64},
-    {"VkBufferUsageFlags2", VkBufferUsageFlags2Strings, VkBufferUsageFlags2Values, 55,
-     ENUM_TYPE_FLAG64},
-    {"VkImageUsageFlags2KHR", VkImageUsageFlags2KHRStrings, VkImageUsageFlags2KHRValues, 32,
-     ENUM_TYPE_FLAG64},
-    {"VkImageCreateFlags2KHR", VkImageCreateFlags2KHRStrings, VkImageCreateFlags2KHRValues, 23,
-     ENUM_TYPE_FLAG64},
-    {"VkAddressCopyFlagsKHR", VkAddressCopyFlagsKHRStrings, VkAddressCopyFlagsKHRValues, 3,
-     ENUM_TYPE_FLAG32},
-    {"VkTensorCreateFlagsARM", VkTensorCreateFlagsARMStrings, VkTensorCreateFlagsARMValues, 5,
-     ENUM_TYPE_FLAG64},
-    {"VkTensorUsageFlagsARM", VkTensorUsageFlagsARMStrings, VkTensorUsageFlagsARMValues, 5,
-     ENUM_TYPE_FLAG64},
-    {"VkTensorViewCreateFlagsARM", VkTensorViewCreateFlagsARMStrings,
-     VkTensorViewCreateFlagsARMValues, 1, ENUM_TYPE_FLAG64},
-    {"VkDataGraphPipelineSessionCreateFlagsARM", VkDataGraphPipelineSessionCreateFlagsARMStrings,
-     VkDataGraphPipelineSessionCreateFlagsARMValues, 2, ENUM_TYPE_FLAG64},
-    {"VkDataGraphPipelineDispatchFlagsARM", NULL, NULL, 0, ENUM_TYPE_FLAG64},
-    {"VkVideoEncodeRgbModelConversionFlagsVALVE", VkVideoEncodeRgbModelConversionFlagsVALVEStrings,
-     VkVideoEncodeRgbModelConversionFlagsVALVEValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeRgbRangeCompressionFlagsVALVE",
+     VkClusterAccelerationStructureAddressResolutionFlagsNVValues, 7, ENUM_TYPE_FLAG32,
+     VkClusterAccelerationStructureAddressResolutionFlagsNVBitIndices, 6,
+     VkClusterAccelerationStructureAddressResolutionFlagsNVCombinedIndices, 1, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkBuildAccelerationStructureFlagsKHR", "VK_BUILD_ACCELERATION_STRUCTURE_",
+     VkBuildAccelerationStructureFlagsKHRStrings, VkBuildAccelerationStructureFlagsKHRValues, 34,
+     ENUM_TYPE_FLAG32, VkBuildAccelerationStructureFlagsKHRBitIndices, 16, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkPrivateDataSlotCreateFlags", "VK_PRIVATE_DATA_SLOT_CREATE_",
+     VkPrivateDataSlotCreateFlagsStrings, VkPrivateDataSlotCreateFlagsValues, 1, ENUM_TYPE_FLAG32,
+     VkPrivateDataSlotCreateFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAccelerationStructureCreateFlagsKHR", "VK_ACCELERATION_STRUCTURE_CREATE_",
+     VkAccelerationStructureCreateFlagsKHRStrings, VkAccelerationStructureCreateFlagsKHRValues, 5,
+     ENUM_TYPE_FLAG32, VkAccelerationStructureCreateFlagsKHRBitIndices, 4, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDescriptorUpdateTemplateCreateFlags", "VK_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCreationFeedbackFlags", "VK_PIPELINE_CREATION_FEEDBACK_",
+     VkPipelineCreationFeedbackFlagsStrings, VkPipelineCreationFeedbackFlagsValues, 6,
+     ENUM_TYPE_FLAG32, VkPipelineCreationFeedbackFlagsBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkPerformanceCounterDescriptionFlagsKHR", "VK_PERFORMANCE_COUNTER_DESCRIPTION_",
+     VkPerformanceCounterDescriptionFlagsKHRStrings, VkPerformanceCounterDescriptionFlagsKHRValues,
+     4, ENUM_TYPE_FLAG32, VkPerformanceCounterDescriptionFlagsKHRBitIndices, 2, NULL, 0, NULL, 0,
+     NULL, NULL, 0, NULL, 0},
+    {"VkAcquireProfilingLockFlagsKHR", "VK_ACQUIRE_PROFILING_LOCK_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSemaphoreWaitFlags", "VK_SEMAPHORE_WAIT_", VkSemaphoreWaitFlagsStrings,
+     VkSemaphoreWaitFlagsValues, 2, ENUM_TYPE_FLAG32, VkSemaphoreWaitFlagsBitIndices, 1, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCompilerControlFlagsAMD", "VK_PIPELINE_COMPILER_CONTROL_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkShaderCorePropertiesFlagsAMD", "VK_SHADER_CORE_PROPERTIES_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceDiagnosticsConfigFlagsNV", "VK_DEVICE_DIAGNOSTICS_CONFIG_",
+     VkDeviceDiagnosticsConfigFlagsNVStrings, VkDeviceDiagnosticsConfigFlagsNVValues, 4,
+     ENUM_TYPE_FLAG32, VkDeviceDiagnosticsConfigFlagsNVBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkRefreshObjectFlagsKHR", "VK_REFRESH_OBJECT_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAccessFlags2", "VK_ACCESS_2_", VkAccessFlags2Strings, VkAccessFlags2Values, 106,
+     ENUM_TYPE_FLAG64, VkAccessFlags2BitIndices, 64, VkAccessFlags2CombinedIndices, 2, NULL, 0,
+     NULL, NULL, 0, NULL, 0},
+    {"VkPipelineStageFlags2", "VK_PIPELINE_STAGE_2_", VkPipelineStageFlags2Strings,
+     VkPipelineStageFlags2Values, 94, ENUM_TYPE_FLAG64, VkPipelineStageFlags2BitIndices, 51,
+     VkPipelineStageFlags2CombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAccelerationStructureMotionInfoFlagsNV", "VK_ACCELERATION_STRUCTURE_MOTION_INFO_", NULL,
+     NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAccelerationStructureMotionInstanceFlagsNV", "VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_",
+     NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFormatFeatureFlags2", "VK_FORMAT_FEATURE_2_", VkFormatFeatureFlags2Strings,
+     VkFormatFeatureFlags2Values, 117, ENUM_TYPE_FLAG64, VkFormatFeatureFlags2BitIndices, 62, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFormatFeatureFlags4KHR", "VK_FORMAT_FEATURE_4_", NULL, NULL, 0, ENUM_TYPE_FLAG64, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkRenderingFlags", "VK_RENDERING_", VkRenderingFlagsStrings, VkRenderingFlagsValues, 23,
+     ENUM_TYPE_FLAG32, VkRenderingFlagsBitIndices, 13, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryDecompressionMethodFlagsEXT", "VK_MEMORY_DECOMPRESSION_METHOD_",
+     VkMemoryDecompressionMethodFlagsEXTStrings, VkMemoryDecompressionMethodFlagsEXTValues, 2,
+     ENUM_TYPE_FLAG64, VkMemoryDecompressionMethodFlagsEXTBitIndices, 1, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDeviceFaultFlagsKHR", "VK_DEVICE_FAULT_", VkDeviceFaultFlagsKHRStrings,
+     VkDeviceFaultFlagsKHRValues, 6, ENUM_TYPE_FLAG32, VkDeviceFaultFlagsKHRBitIndices, 6, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkBuildMicromapFlagsEXT", "VK_BUILD_MICROMAP_", VkBuildMicromapFlagsEXTStrings,
+     VkBuildMicromapFlagsEXTValues, 3, ENUM_TYPE_FLAG32, VkBuildMicromapFlagsEXTBitIndices, 3, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMicromapCreateFlagsEXT", "VK_MICROMAP_CREATE_", VkMicromapCreateFlagsEXTStrings,
+     VkMicromapCreateFlagsEXTValues, 1, ENUM_TYPE_FLAG32, VkMicromapCreateFlagsEXTBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectCommandsLayoutUsageFlagsEXT", "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_",
+     VkIndirectCommandsLayoutUsageFlagsEXTStrings, VkIndirectCommandsLayoutUsageFlagsEXTValues, 2,
+     ENUM_TYPE_FLAG32, VkIndirectCommandsLayoutUsageFlagsEXTBitIndices, 2, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkIndirectCommandsInputModeFlagsEXT", "VK_INDIRECT_COMMANDS_INPUT_MODE_",
+     VkIndirectCommandsInputModeFlagsEXTStrings, VkIndirectCommandsInputModeFlagsEXTValues, 2,
+     ENUM_TYPE_FLAG32, VkIndirectCommandsInputModeFlagsEXTBitIndices, 2, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDirectDriverLoadingFlagsLUNARG", "VK_DIRECT_DRIVER_LOADING_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCreateFlags2", "VK_PIPELINE_CREATE_2_", VkPipelineCreateFlags2Strings,
+     VkPipelineCreateFlags2Values, 68, ENUM_TYPE_FLAG64, VkPipelineCreateFlags2BitIndices, 49, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkBufferUsageFlags2", "VK_BUFFER_USAGE_2_", VkBufferUsageFlags2Strings,
+     VkBufferUsageFlags2Values, 55, ENUM_TYPE_FLAG64, VkBufferUsageFlags2BitIndices, 38, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageUsageFlags2KHR", "VK_IMAGE_USAGE_2_", VkImageUsageFlags2KHRStrings,
+     VkImageUsageFlags2KHRValues, 32, ENUM_TYPE_FLAG64, VkImageUsageFlags2KHRBitIndices, 32, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageCreateFlags2KHR", "VK_IMAGE_CREATE_2_", VkImageCreateFlags2KHRStrings,
+     VkImageCreateFlags2KHRValues, 23, ENUM_TYPE_FLAG64, VkImageCreateFlags2KHRBitIndices, 23, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAddressCopyFlagsKHR", "VK_ADDRESS_COPY_", VkAddressCopyFlagsKHRStrings,
+     VkAddressCopyFlagsKHRValues, 3, ENUM_TYPE_FLAG32, VkAddressCopyFlagsKHRBitIndices, 3, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkTensorCreateFlagsARM", "VK_TENSOR_CREATE_", VkTensorCreateFlagsARMStrings,
+     VkTensorCreateFlagsARMValues, 5, ENUM_TYPE_FLAG64, VkTensorCreateFlagsARMBitIndices, 4, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkTensorUsageFlagsARM", "VK_TENSOR_USAGE_", VkTensorUsageFlagsARMStrings,
+     VkTensorUsageFlagsARMValues, 5, ENUM_TYPE_FLAG64, VkTensorUsageFlagsARMBitIndices, 6, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkTensorViewCreateFlagsARM", "VK_TENSOR_VIEW_CREATE_", VkTensorViewCreateFlagsARMStrings,
+     VkTensorViewCreateFlagsARMValues, 1, ENUM_TYPE_FLAG64, VkTensorViewCreateFlagsARMBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphPipelineSessionCreateFlagsARM", "VK_DATA_GRAPH_PIPELINE_SESSION_CREATE_",
+     VkDataGraphPipelineSessionCreateFlagsARMStrings,
+     VkDataGraphPipelineSessionCreateFlagsARMValues, 2, ENUM_TYPE_FLAG64,
+     VkDataGraphPipelineSessionCreateFlagsARMBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkDataGraphPipelineDispatchFlagsARM", "VK_DATA_GRAPH_PIPELINE_DISPATCH_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG64, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeRgbModelConversionFlagsVALVE", "VK_VIDEO_ENCODE_RGB_MODEL_CONVERSION_",
+     VkVideoEncodeRgbModelConversionFlagsVALVEStrings,
+     VkVideoEncodeRgbModelConversionFlagsVALVEValues, 5, ENUM_TYPE_FLAG32,
+     VkVideoEncodeRgbModelConversionFlagsVALVEBitIndices, 5, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkVideoEncodeRgbRangeCompressionFlagsVALVE", "VK_VIDEO_ENCODE_RGB_RANGE_COMPRESSION_",
      VkVideoEncodeRgbRangeCompressionFlagsVALVEStrings,
-     VkVideoEncodeRgbRangeCompressionFlagsVALVEValues, 2, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeRgbChromaOffsetFlagsVALVE", VkVideoEncodeRgbChromaOffsetFlagsVALVEStrings,
-     VkVideoEncodeRgbChromaOffsetFlagsVALVEValues, 2, ENUM_TYPE_FLAG32},
-    {"VkSpirvResourceTypeFlagsEXT", VkSpirvResourceTypeFlagsEXTStrings,
-     VkSpirvResourceTypeFlagsEXTValues, 11, ENUM_TYPE_FLAG32},
-    {"VkGpaSqShaderStageFlagsAMD", VkGpaSqShaderStageFlagsAMDStrings,
-     VkGpaSqShaderStageFlagsAMDValues, 7, ENUM_TYPE_FLAG32},
-    {"VkGpaPerfBlockPropertiesFlagsAMD", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPhysicalDeviceGpaPropertiesFlagsAMD", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkAddressCommandFlagsKHR", VkAddressCommandFlagsKHRStrings, VkAddressCommandFlagsKHRValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkCompositeAlphaFlagsKHR", VkCompositeAlphaFlagsKHRStrings, VkCompositeAlphaFlagsKHRValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkDisplayPlaneAlphaFlagsKHR", VkDisplayPlaneAlphaFlagsKHRStrings,
-     VkDisplayPlaneAlphaFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkSurfaceTransformFlagsKHR", VkSurfaceTransformFlagsKHRStrings,
-     VkSurfaceTransformFlagsKHRValues, 9, ENUM_TYPE_FLAG32},
-    {"VkSwapchainCreateFlagsKHR", VkSwapchainCreateFlagsKHRStrings, VkSwapchainCreateFlagsKHRValues,
-     15, ENUM_TYPE_FLAG32},
-    {"VkDisplayModeCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDisplaySurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkAndroidSurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkViSurfaceCreateFlagsNN", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkWaylandSurfaceCreateFlagsKHR", VkWaylandSurfaceCreateFlagsKHRStrings,
-     VkWaylandSurfaceCreateFlagsKHRValues, 1, ENUM_TYPE_FLAG32},
-    {"VkUbmSurfaceCreateFlagsSEC", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkWin32SurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkXlibSurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkXcbSurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDirectFBSurfaceCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkIOSSurfaceCreateFlagsMVK", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkMacOSSurfaceCreateFlagsMVK", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkMetalSurfaceCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkImagePipeSurfaceCreateFlagsFUCHSIA", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkStreamDescriptorSurfaceCreateFlagsGGP", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkHeadlessSurfaceCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkScreenSurfaceCreateFlagsQNX", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPeerMemoryFeatureFlags", VkPeerMemoryFeatureFlagsStrings, VkPeerMemoryFeatureFlagsValues, 8,
-     ENUM_TYPE_FLAG32},
-    {"VkMemoryAllocateFlags", VkMemoryAllocateFlagsStrings, VkMemoryAllocateFlagsValues, 8,
-     ENUM_TYPE_FLAG32},
-    {"VkDeviceGroupPresentModeFlagsKHR", VkDeviceGroupPresentModeFlagsKHRStrings,
-     VkDeviceGroupPresentModeFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkDebugReportFlagsEXT", VkDebugReportFlagsEXTStrings, VkDebugReportFlagsEXTValues, 5,
-     ENUM_TYPE_FLAG32},
-    {"VkCommandPoolTrimFlags", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkExternalMemoryHandleTypeFlagsNV", VkExternalMemoryHandleTypeFlagsNVStrings,
-     VkExternalMemoryHandleTypeFlagsNVValues, 4, ENUM_TYPE_FLAG32},
+     VkVideoEncodeRgbRangeCompressionFlagsVALVEValues, 2, ENUM_TYPE_FLAG32,
+     VkVideoEncodeRgbRangeCompressionFlagsVALVEBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkVideoEncodeRgbChromaOffsetFlagsVALVE", "VK_VIDEO_ENCODE_RGB_CHROMA_OFFSET_",
+     VkVideoEncodeRgbChromaOffsetFlagsVALVEStrings, VkVideoEncodeRgbChromaOffsetFlagsVALVEValues, 2,
+     ENUM_TYPE_FLAG32, VkVideoEncodeRgbChromaOffsetFlagsVALVEBitIndices, 2, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkSpirvResourceTypeFlagsEXT", "VK_SPIRV_RESOURCE_TYPE_", VkSpirvResourceTypeFlagsEXTStrings,
+     VkSpirvResourceTypeFlagsEXTValues, 11, ENUM_TYPE_FLAG32, VkSpirvResourceTypeFlagsEXTBitIndices,
+     10, VkSpirvResourceTypeFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkGpaSqShaderStageFlagsAMD", "VK_GPA_SQ_SHADER_STAGE_", VkGpaSqShaderStageFlagsAMDStrings,
+     VkGpaSqShaderStageFlagsAMDValues, 7, ENUM_TYPE_FLAG32, VkGpaSqShaderStageFlagsAMDBitIndices, 7,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkGpaPerfBlockPropertiesFlagsAMD", "VK_GPA_PERF_BLOCK_PROPERTIES_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPhysicalDeviceGpaPropertiesFlagsAMD", "VK_PHYSICAL_DEVICE_GPA_PROPERTIES_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAddressCommandFlagsKHR", "VK_ADDRESS_COMMAND_", VkAddressCommandFlagsKHRStrings,
+     VkAddressCommandFlagsKHRValues, 6, ENUM_TYPE_FLAG32, VkAddressCommandFlagsKHRBitIndices, 6,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCompositeAlphaFlagsKHR", "VK_COMPOSITE_ALPHA_", VkCompositeAlphaFlagsKHRStrings,
+     VkCompositeAlphaFlagsKHRValues, 4, ENUM_TYPE_FLAG32, VkCompositeAlphaFlagsKHRBitIndices, 4,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDisplayPlaneAlphaFlagsKHR", "VK_DISPLAY_PLANE_ALPHA_", VkDisplayPlaneAlphaFlagsKHRStrings,
+     VkDisplayPlaneAlphaFlagsKHRValues, 4, ENUM_TYPE_FLAG32, VkDisplayPlaneAlphaFlagsKHRBitIndices,
+     4, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSurfaceTransformFlagsKHR", "VK_SURFACE_TRANSFORM_", VkSurfaceTransformFlagsKHRStrings,
+     VkSurfaceTransformFlagsKHRValues, 9, ENUM_TYPE_FLAG32, VkSurfaceTransformFlagsKHRBitIndices, 9,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSwapchainCreateFlagsKHR", "VK_SWAPCHAIN_CREATE_", VkSwapchainCreateFlagsKHRStrings,
+     VkSwapchainCreateFlagsKHRValues, 15, ENUM_TYPE_FLAG32, VkSwapchainCreateFlagsKHRBitIndices, 11,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDisplayModeCreateFlagsKHR", "VK_DISPLAY_MODE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDisplaySurfaceCreateFlagsKHR", "VK_DISPLAY_SURFACE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkAndroidSurfaceCreateFlagsKHR", "VK_ANDROID_SURFACE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkViSurfaceCreateFlagsNN", "VK_VI_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkWaylandSurfaceCreateFlagsKHR", "VK_WAYLAND_SURFACE_CREATE_",
+     VkWaylandSurfaceCreateFlagsKHRStrings, VkWaylandSurfaceCreateFlagsKHRValues, 1,
+     ENUM_TYPE_FLAG32, VkWaylandSurfaceCreateFlagsKHRBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkUbmSurfaceCreateFlagsSEC", "VK_UBM_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL,
+     0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkWin32SurfaceCreateFlagsKHR", "VK_WIN_3_2_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkXlibSurfaceCreateFlagsKHR", "VK_XLIB_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkXcbSurfaceCreateFlagsKHR", "VK_XCB_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL,
+     0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDirectFBSurfaceCreateFlagsEXT", "VK_DIRECT_F_B_SURFACE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkIOSSurfaceCreateFlagsMVK", "VK_I_O_S_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMacOSSurfaceCreateFlagsMVK", "VK_MAC_O_S_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMetalSurfaceCreateFlagsEXT", "VK_METAL_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImagePipeSurfaceCreateFlagsFUCHSIA", "VK_IMAGE_PIPE_SURFACE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkStreamDescriptorSurfaceCreateFlagsGGP", "VK_STREAM_DESCRIPTOR_SURFACE_CREATE_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkHeadlessSurfaceCreateFlagsEXT", "VK_HEADLESS_SURFACE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkScreenSurfaceCreateFlagsQNX", "VK_SCREEN_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPeerMemoryFeatureFlags", "VK_PEER_MEMORY_FEATURE_", VkPeerMemoryFeatureFlagsStrings,
+     VkPeerMemoryFeatureFlagsValues, 8, ENUM_TYPE_FLAG32, VkPeerMemoryFeatureFlagsBitIndices, 4,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryAllocateFlags", "VK_MEMORY_ALLOCATE_", VkMemoryAllocateFlagsStrings,
+     VkMemoryAllocateFlagsValues, 8, ENUM_TYPE_FLAG32, VkMemoryAllocateFlagsBitIndices, 4, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceGroupPresentModeFlagsKHR", "VK_DEVICE_GROUP_PRESENT_MODE_",
+     VkDeviceGroupPresentModeFlagsKHRStrings, VkDeviceGroupPresentModeFlagsKHRValues, 4,
+     ENUM_TYPE_FLAG32, VkDeviceGroupPresentModeFlagsKHRBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkDebugReportFlagsEXT", "VK_DEBUG_REPORT_", VkDebugReportFlagsEXTStrings,
+     VkDebugReportFlagsEXTValues, 5, ENUM_TYPE_FLAG32, VkDebugReportFlagsEXTBitIndices, 5, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCommandPoolTrimFlags", "VK_COMMAND_POOL_TRIM_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkExternalMemoryHandleTypeFlagsNV", "VK_EXTERNAL_MEMORY_HANDLE_TYPE_",
+     VkExternalMemoryHandleTypeFlagsNVStrings, VkExternalMemoryHandleTypeFlagsNVValues, 4,
+     ENUM_TYPE_FLAG32, VkExternalMemoryHandleTypeFlagsNVBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
     {"VkClusterAccelerationStructureIndexFormatFlagsNV",
+     "VK_CLUSTER_ACCELERATION_STRUCTURE_INDEX_FORMAT_",
      VkClusterAccelerationStructureIndexFormatFlagsNVStrings,
-     VkClusterAccelerationStructureIndexFormatFlagsNVValues, 3, ENUM_TYPE_FLAG32},
-    {"VkExternalMemoryFeatureFlagsNV", VkExternalMemoryFeatureFlagsNVStrings,
-     VkExternalMemoryFeatureFlagsNVValues, 3, ENUM_TYPE_FLAG32},
-    {"VkExternalMemoryHandleTypeFlags", VkExternalMemoryHandleTypeFlagsStrings,
-     VkExternalMemoryHandleTypeFlagsValues, 32, ENUM_TYPE_FLAG32},
-    {"VkExternalMemoryFeatureFlags", VkExternalMemoryFeatureFlagsStrings,
-     VkExternalMemoryFeatureFlagsValues, 6, ENUM_TYPE_FLAG32},
-    {"VkExternalSemaphoreHandleTypeFlags", VkExternalSemaphoreHandleTypeFlagsStrings,
-     VkExternalSemaphoreHandleTypeFlagsValues, 15, ENUM_TYPE_FLAG32},
-    {"VkExternalSemaphoreFeatureFlags", VkExternalSemaphoreFeatureFlagsStrings,
-     VkExternalSemaphoreFeatureFlagsValues, 4, ENUM_TYPE_FLAG32},
-    {"VkSemaphoreImportFlags", VkSemaphoreImportFlagsStrings, VkSemaphoreImportFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkExternalFenceHandleTypeFlags", VkExternalFenceHandleTypeFlagsStrings,
-     VkExternalFenceHandleTypeFlagsValues, 12, ENUM_TYPE_FLAG32},
-    {"VkExternalFenceFeatureFlags", VkExternalFenceFeatureFlagsStrings,
-     VkExternalFenceFeatureFlagsValues, 4, ENUM_TYPE_FLAG32},
-    {"VkFenceImportFlags", VkFenceImportFlagsStrings, VkFenceImportFlagsValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkSurfaceCounterFlagsEXT", VkSurfaceCounterFlagsEXTStrings, VkSurfaceCounterFlagsEXTValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkPipelineViewportSwizzleStateCreateFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineDiscardRectangleStateCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineCoverageToColorStateCreateFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineCoverageModulationStateCreateFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineCoverageReductionStateCreateFlagsNV", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkValidationCacheCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDebugUtilsMessageSeverityFlagsEXT", VkDebugUtilsMessageSeverityFlagsEXTStrings,
-     VkDebugUtilsMessageSeverityFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkDebugUtilsMessageTypeFlagsEXT", VkDebugUtilsMessageTypeFlagsEXTStrings,
-     VkDebugUtilsMessageTypeFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkDebugUtilsMessengerCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDebugUtilsMessengerCallbackDataFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDeviceMemoryReportFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineRasterizationConservativeStateCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDescriptorBindingFlags", VkDescriptorBindingFlagsStrings, VkDescriptorBindingFlagsValues, 9,
-     ENUM_TYPE_FLAG32},
-    {"VkConditionalRenderingFlagsEXT", VkConditionalRenderingFlagsEXTStrings,
-     VkConditionalRenderingFlagsEXTValues, 1, ENUM_TYPE_FLAG32},
-    {"VkResolveModeFlags", VkResolveModeFlagsStrings, VkResolveModeFlagsValues, 16,
-     ENUM_TYPE_FLAG32},
-    {"VkPipelineRasterizationStateStreamCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPipelineRasterizationDepthClipStateCreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkSwapchainImageUsageFlagsANDROID", VkSwapchainImageUsageFlagsANDROIDStrings,
-     VkSwapchainImageUsageFlagsANDROIDValues, 1, ENUM_TYPE_FLAG32},
-    {"VkToolPurposeFlags", VkToolPurposeFlagsStrings, VkToolPurposeFlagsValues, 12,
-     ENUM_TYPE_FLAG32},
-    {"VkSubmitFlags", VkSubmitFlagsStrings, VkSubmitFlagsValues, 2, ENUM_TYPE_FLAG32},
-    {"VkImageFormatConstraintsFlagsFUCHSIA", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkHostImageCopyFlags", VkHostImageCopyFlagsStrings, VkHostImageCopyFlagsValues, 4,
-     ENUM_TYPE_FLAG32},
+     VkClusterAccelerationStructureIndexFormatFlagsNVValues, 3, ENUM_TYPE_FLAG32,
+     VkClusterAccelerationStructureIndexFormatFlagsNVBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkExternalMemoryFeatureFlagsNV", "VK_EXTERNAL_MEMORY_FEATURE_",
+     VkExternalMemoryFeatureFlagsNVStrings, VkExternalMemoryFeatureFlagsNVValues, 3,
+     ENUM_TYPE_FLAG32, VkExternalMemoryFeatureFlagsNVBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkExternalMemoryHandleTypeFlags", "VK_EXTERNAL_MEMORY_HANDLE_TYPE_",
+     VkExternalMemoryHandleTypeFlagsStrings, VkExternalMemoryHandleTypeFlagsValues, 32,
+     ENUM_TYPE_FLAG32, VkExternalMemoryHandleTypeFlagsBitIndices, 19, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkExternalMemoryFeatureFlags", "VK_EXTERNAL_MEMORY_FEATURE_",
+     VkExternalMemoryFeatureFlagsStrings, VkExternalMemoryFeatureFlagsValues, 6, ENUM_TYPE_FLAG32,
+     VkExternalMemoryFeatureFlagsBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkExternalSemaphoreHandleTypeFlags", "VK_EXTERNAL_SEMAPHORE_HANDLE_TYPE_",
+     VkExternalSemaphoreHandleTypeFlagsStrings, VkExternalSemaphoreHandleTypeFlagsValues, 15,
+     ENUM_TYPE_FLAG32, VkExternalSemaphoreHandleTypeFlagsBitIndices, 8, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkExternalSemaphoreFeatureFlags", "VK_EXTERNAL_SEMAPHORE_FEATURE_",
+     VkExternalSemaphoreFeatureFlagsStrings, VkExternalSemaphoreFeatureFlagsValues, 4,
+     ENUM_TYPE_FLAG32, VkExternalSemaphoreFeatureFlagsBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkSemaphoreImportFlags", "VK_SEMAPHORE_IMPORT_", VkSemaphoreImportFlagsStrings,
+     VkSemaphoreImportFlagsValues, 2, ENUM_TYPE_FLAG32, VkSemaphoreImportFlagsBitIndices, 1, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkExternalFenceHandleTypeFlags", "VK_EXTERNAL_FENCE_HANDLE_TYPE_",
+     VkExternalFenceHandleTypeFlagsStrings, VkExternalFenceHandleTypeFlagsValues, 12,
+     ENUM_TYPE_FLAG32, VkExternalFenceHandleTypeFlagsBitIndices, 6, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkExternalFenceFeatureFlags", "VK_EXTERNAL_FENCE_FEATURE_",
+     VkExternalFenceFeatureFlagsStrings, VkExternalFenceFeatureFlagsValues, 4, ENUM_TYPE_FLAG32,
+     VkExternalFenceFeatureFlagsBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFenceImportFlags", "VK_FENCE_IMPORT_", VkFenceImportFlagsStrings, VkFenceImportFlagsValues,
+     2, ENUM_TYPE_FLAG32, VkFenceImportFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkSurfaceCounterFlagsEXT", "VK_SURFACE_COUNTER_", VkSurfaceCounterFlagsEXTStrings,
+     VkSurfaceCounterFlagsEXTValues, 2, ENUM_TYPE_FLAG32, VkSurfaceCounterFlagsEXTBitIndices, 1,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineViewportSwizzleStateCreateFlagsNV", "VK_PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_",
+     NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineDiscardRectangleStateCreateFlagsEXT", "VK_PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_",
+     NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCoverageToColorStateCreateFlagsNV", "VK_PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_",
+     NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCoverageModulationStateCreateFlagsNV",
+     "VK_PIPELINE_COVERAGE_MODULATION_STATE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCoverageReductionStateCreateFlagsNV",
+     "VK_PIPELINE_COVERAGE_REDUCTION_STATE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkValidationCacheCreateFlagsEXT", "VK_VALIDATION_CACHE_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDebugUtilsMessageSeverityFlagsEXT", "VK_DEBUG_UTILS_MESSAGE_SEVERITY_",
+     VkDebugUtilsMessageSeverityFlagsEXTStrings, VkDebugUtilsMessageSeverityFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkDebugUtilsMessageSeverityFlagsEXTBitIndices, 13, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDebugUtilsMessageTypeFlagsEXT", "VK_DEBUG_UTILS_MESSAGE_TYPE_",
+     VkDebugUtilsMessageTypeFlagsEXTStrings, VkDebugUtilsMessageTypeFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkDebugUtilsMessageTypeFlagsEXTBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkDebugUtilsMessengerCreateFlagsEXT", "VK_DEBUG_UTILS_MESSENGER_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDebugUtilsMessengerCallbackDataFlagsEXT", "VK_DEBUG_UTILS_MESSENGER_CALLBACK_DATA_", NULL,
+     NULL, 0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceMemoryReportFlagsEXT", "VK_DEVICE_MEMORY_REPORT_", NULL, NULL, 0, ENUM_TYPE_FLAG32,
+     NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineRasterizationConservativeStateCreateFlagsEXT",
+     "VK_PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL,
+     0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDescriptorBindingFlags", "VK_DESCRIPTOR_BINDING_", VkDescriptorBindingFlagsStrings,
+     VkDescriptorBindingFlagsValues, 9, ENUM_TYPE_FLAG32, VkDescriptorBindingFlagsBitIndices, 5,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkConditionalRenderingFlagsEXT", "VK_CONDITIONAL_RENDERING_",
+     VkConditionalRenderingFlagsEXTStrings, VkConditionalRenderingFlagsEXTValues, 1,
+     ENUM_TYPE_FLAG32, VkConditionalRenderingFlagsEXTBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkResolveModeFlags", "VK_RESOLVE_MODE_", VkResolveModeFlagsStrings, VkResolveModeFlagsValues,
+     16, ENUM_TYPE_FLAG32, VkResolveModeFlagsBitIndices, 6, VkResolveModeFlagsCombinedIndices, 2,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineRasterizationStateStreamCreateFlagsEXT",
+     "VK_PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineRasterizationDepthClipStateCreateFlagsEXT",
+     "VK_PIPELINE_RASTERIZATION_DEPTH_CLIP_STATE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSwapchainImageUsageFlagsANDROID", "VK_SWAPCHAIN_IMAGE_USAGE_",
+     VkSwapchainImageUsageFlagsANDROIDStrings, VkSwapchainImageUsageFlagsANDROIDValues, 1,
+     ENUM_TYPE_FLAG32, VkSwapchainImageUsageFlagsANDROIDBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkToolPurposeFlags", "VK_TOOL_PURPOSE_", VkToolPurposeFlagsStrings, VkToolPurposeFlagsValues,
+     12, ENUM_TYPE_FLAG32, VkToolPurposeFlagsBitIndices, 7, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkSubmitFlags", "VK_SUBMIT_", VkSubmitFlagsStrings, VkSubmitFlagsValues, 2, ENUM_TYPE_FLAG32,
+     VkSubmitFlagsBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageFormatConstraintsFlagsFUCHSIA", "VK_IMAGE_FORMAT_CONSTRAINTS_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkHostImageCopyFlags", "VK_HOST_IMAGE_COPY_", VkHostImageCopyFlagsStrings,
+     VkHostImageCopyFlagsValues, 4, ENUM_TYPE_FLAG32, VkHostImageCopyFlagsBitIndices, 1, NULL, 0,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
     {"VkPartitionedAccelerationStructureInstanceFlagsNV",
+     "VK_PARTITIONED_ACCELERATION_STRUCTURE_INSTANCE_",
      VkPartitionedAccelerationStructureInstanceFlagsNVStrings,
-     VkPartitionedAccelerationStructureInstanceFlagsNVValues, 5, ENUM_TYPE_FLAG32},
-    {"VkImageConstraintsInfoFlagsFUCHSIA", VkImageConstraintsInfoFlagsFUCHSIAStrings,
-     VkImageConstraintsInfoFlagsFUCHSIAValues, 5, ENUM_TYPE_FLAG32},
-    {"VkGraphicsPipelineLibraryFlagsEXT", VkGraphicsPipelineLibraryFlagsEXTStrings,
-     VkGraphicsPipelineLibraryFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkImageCompressionFlagsEXT", VkImageCompressionFlagsEXTStrings,
-     VkImageCompressionFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkImageCompressionFixedRateFlagsEXT", VkImageCompressionFixedRateFlagsEXTStrings,
-     VkImageCompressionFixedRateFlagsEXTValues, 25, ENUM_TYPE_FLAG32},
-    {"VkExportMetalObjectTypeFlagsEXT", VkExportMetalObjectTypeFlagsEXTStrings,
-     VkExportMetalObjectTypeFlagsEXTValues, 6, ENUM_TYPE_FLAG32},
-    {"VkRenderingAttachmentFlagsKHR", VkRenderingAttachmentFlagsKHRStrings,
-     VkRenderingAttachmentFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkResolveImageFlagsKHR", VkResolveImageFlagsKHRStrings, VkResolveImageFlagsKHRValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkDeviceAddressBindingFlagsEXT", VkDeviceAddressBindingFlagsEXTStrings,
-     VkDeviceAddressBindingFlagsEXTValues, 1, ENUM_TYPE_FLAG32},
-    {"VkOpticalFlowGridSizeFlagsNV", VkOpticalFlowGridSizeFlagsNVStrings,
-     VkOpticalFlowGridSizeFlagsNVValues, 5, ENUM_TYPE_FLAG32},
-    {"VkOpticalFlowUsageFlagsNV", VkOpticalFlowUsageFlagsNVStrings, VkOpticalFlowUsageFlagsNVValues,
-     6, ENUM_TYPE_FLAG32},
-    {"VkOpticalFlowSessionCreateFlagsNV", VkOpticalFlowSessionCreateFlagsNVStrings,
-     VkOpticalFlowSessionCreateFlagsNVValues, 5, ENUM_TYPE_FLAG32},
-    {"VkOpticalFlowExecuteFlagsNV", VkOpticalFlowExecuteFlagsNVStrings,
-     VkOpticalFlowExecuteFlagsNVValues, 1, ENUM_TYPE_FLAG32},
-    {"VkFrameBoundaryFlagsEXT", VkFrameBoundaryFlagsEXTStrings, VkFrameBoundaryFlagsEXTValues, 1,
-     ENUM_TYPE_FLAG32},
-    {"VkPresentScalingFlagsKHR", VkPresentScalingFlagsKHRStrings, VkPresentScalingFlagsKHRValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkPresentGravityFlagsKHR", VkPresentGravityFlagsKHRStrings, VkPresentGravityFlagsKHRValues, 6,
-     ENUM_TYPE_FLAG32},
-    {"VkShaderCreateFlagsEXT", VkShaderCreateFlagsEXTStrings, VkShaderCreateFlagsEXTValues, 26,
-     ENUM_TYPE_FLAG32},
-    {"VkTileShadingRenderPassFlagsQCOM", VkTileShadingRenderPassFlagsQCOMStrings,
-     VkTileShadingRenderPassFlagsQCOMValues, 2, ENUM_TYPE_FLAG32},
-    {"VkPhysicalDeviceSchedulingControlsFlagsARM",
+     VkPartitionedAccelerationStructureInstanceFlagsNVValues, 5, ENUM_TYPE_FLAG32,
+     VkPartitionedAccelerationStructureInstanceFlagsNVBitIndices, 5, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkImageConstraintsInfoFlagsFUCHSIA", "VK_IMAGE_CONSTRAINTS_INFO_",
+     VkImageConstraintsInfoFlagsFUCHSIAStrings, VkImageConstraintsInfoFlagsFUCHSIAValues, 5,
+     ENUM_TYPE_FLAG32, VkImageConstraintsInfoFlagsFUCHSIABitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkGraphicsPipelineLibraryFlagsEXT", "VK_GRAPHICS_PIPELINE_LIBRARY_",
+     VkGraphicsPipelineLibraryFlagsEXTStrings, VkGraphicsPipelineLibraryFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkGraphicsPipelineLibraryFlagsEXTBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkImageCompressionFlagsEXT", "VK_IMAGE_COMPRESSION_", VkImageCompressionFlagsEXTStrings,
+     VkImageCompressionFlagsEXTValues, 4, ENUM_TYPE_FLAG32, VkImageCompressionFlagsEXTBitIndices, 3,
+     VkImageCompressionFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkImageCompressionFixedRateFlagsEXT", "VK_IMAGE_COMPRESSION_FIXED_RATE_",
+     VkImageCompressionFixedRateFlagsEXTStrings, VkImageCompressionFixedRateFlagsEXTValues, 25,
+     ENUM_TYPE_FLAG32, VkImageCompressionFixedRateFlagsEXTBitIndices, 24,
+     VkImageCompressionFixedRateFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkExportMetalObjectTypeFlagsEXT", "VK_EXPORT_METAL_OBJECT_TYPE_",
+     VkExportMetalObjectTypeFlagsEXTStrings, VkExportMetalObjectTypeFlagsEXTValues, 6,
+     ENUM_TYPE_FLAG32, VkExportMetalObjectTypeFlagsEXTBitIndices, 6, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkRenderingAttachmentFlagsKHR", "VK_RENDERING_ATTACHMENT_",
+     VkRenderingAttachmentFlagsKHRStrings, VkRenderingAttachmentFlagsKHRValues, 3, ENUM_TYPE_FLAG32,
+     VkRenderingAttachmentFlagsKHRBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkResolveImageFlagsKHR", "VK_RESOLVE_IMAGE_", VkResolveImageFlagsKHRStrings,
+     VkResolveImageFlagsKHRValues, 2, ENUM_TYPE_FLAG32, VkResolveImageFlagsKHRBitIndices, 2, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceAddressBindingFlagsEXT", "VK_DEVICE_ADDRESS_BINDING_",
+     VkDeviceAddressBindingFlagsEXTStrings, VkDeviceAddressBindingFlagsEXTValues, 1,
+     ENUM_TYPE_FLAG32, VkDeviceAddressBindingFlagsEXTBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkOpticalFlowGridSizeFlagsNV", "VK_OPTICAL_FLOW_GRID_SIZE_",
+     VkOpticalFlowGridSizeFlagsNVStrings, VkOpticalFlowGridSizeFlagsNVValues, 5, ENUM_TYPE_FLAG32,
+     VkOpticalFlowGridSizeFlagsNVBitIndices, 4, VkOpticalFlowGridSizeFlagsNVCombinedIndices, 1,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkOpticalFlowUsageFlagsNV", "VK_OPTICAL_FLOW_USAGE_", VkOpticalFlowUsageFlagsNVStrings,
+     VkOpticalFlowUsageFlagsNVValues, 6, ENUM_TYPE_FLAG32, VkOpticalFlowUsageFlagsNVBitIndices, 5,
+     VkOpticalFlowUsageFlagsNVCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkOpticalFlowSessionCreateFlagsNV", "VK_OPTICAL_FLOW_SESSION_CREATE_",
+     VkOpticalFlowSessionCreateFlagsNVStrings, VkOpticalFlowSessionCreateFlagsNVValues, 5,
+     ENUM_TYPE_FLAG32, VkOpticalFlowSessionCreateFlagsNVBitIndices, 5, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkOpticalFlowExecuteFlagsNV", "VK_OPTICAL_FLOW_EXECUTE_", VkOpticalFlowExecuteFlagsNVStrings,
+     VkOpticalFlowExecuteFlagsNVValues, 1, ENUM_TYPE_FLAG32, VkOpticalFlowExecuteFlagsNVBitIndices,
+     1, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkFrameBoundaryFlagsEXT", "VK_FRAME_BOUNDARY_", VkFrameBoundaryFlagsEXTStrings,
+     VkFrameBoundaryFlagsEXTValues, 1, ENUM_TYPE_FLAG32, VkFrameBoundaryFlagsEXTBitIndices, 1, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPresentScalingFlagsKHR", "VK_PRESENT_SCALING_", VkPresentScalingFlagsKHRStrings,
+     VkPresentScalingFlagsKHRValues, 6, ENUM_TYPE_FLAG32, VkPresentScalingFlagsKHRBitIndices, 3,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPresentGravityFlagsKHR", "VK_PRESENT_GRAVITY_", VkPresentGravityFlagsKHRStrings,
+     VkPresentGravityFlagsKHRValues, 6, ENUM_TYPE_FLAG32, VkPresentGravityFlagsKHRBitIndices, 3,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkShaderCreateFlagsEXT", "VK_SHADER_CREATE_", VkShaderCreateFlagsEXTStrings,
+     VkShaderCreateFlagsEXTValues, 26, ENUM_TYPE_FLAG32, VkShaderCreateFlagsEXTBitIndices, 19, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkTileShadingRenderPassFlagsQCOM", "VK_TILE_SHADING_RENDER_PASS_",
+     VkTileShadingRenderPassFlagsQCOMStrings, VkTileShadingRenderPassFlagsQCOMValues, 2,
+     ENUM_TYPE_FLAG32, VkTileShadingRenderPassFlagsQCOMBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkPhysicalDeviceSchedulingControlsFlagsARM", "VK_PHYSICAL_DEVICE_SCHEDULING_CONTROLS_",
      VkPhysicalDeviceSchedulingControlsFlagsARMStrings,
-     VkPhysicalDeviceSchedulingControlsFlagsARMValues, 2, ENUM_TYPE_FLAG64},
-    {"VkSurfaceCreateFlagsOHOS", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkPresentStageFlagsEXT", VkPresentStageFlagsEXTStrings, VkPresentStageFlagsEXTValues, 4,
-     ENUM_TYPE_FLAG32},
-    {"VkPastPresentationTimingFlagsEXT", VkPastPresentationTimingFlagsEXTStrings,
-     VkPastPresentationTimingFlagsEXTValues, 2, ENUM_TYPE_FLAG32},
-    {"VkPresentTimingInfoFlagsEXT", VkPresentTimingInfoFlagsEXTStrings,
-     VkPresentTimingInfoFlagsEXTValues, 2, ENUM_TYPE_FLAG32},
-    {"VkSwapchainImageUsageFlagsOHOS", VkSwapchainImageUsageFlagsOHOSStrings,
-     VkSwapchainImageUsageFlagsOHOSValues, 1, ENUM_TYPE_FLAG32},
-    {"VkPerformanceCounterDescriptionFlagsARM", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkShaderInstrumentationValuesFlagsARM", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkDataGraphTOSAQualityFlagsARM", VkDataGraphTOSAQualityFlagsARMStrings,
-     VkDataGraphTOSAQualityFlagsARMValues, 4, ENUM_TYPE_FLAG32},
-    {"VkDataGraphOpticalFlowGridSizeFlagsARM", VkDataGraphOpticalFlowGridSizeFlagsARMStrings,
-     VkDataGraphOpticalFlowGridSizeFlagsARMValues, 5, ENUM_TYPE_FLAG32},
-    {"VkDataGraphOpticalFlowImageUsageFlagsARM", VkDataGraphOpticalFlowImageUsageFlagsARMStrings,
-     VkDataGraphOpticalFlowImageUsageFlagsARMValues, 5, ENUM_TYPE_FLAG32},
-    {"VkDataGraphOpticalFlowCreateFlagsARM", VkDataGraphOpticalFlowCreateFlagsARMStrings,
-     VkDataGraphOpticalFlowCreateFlagsARMValues, 3, ENUM_TYPE_FLAG32},
-    {"VkDataGraphOpticalFlowExecuteFlagsARM", VkDataGraphOpticalFlowExecuteFlagsARMStrings,
-     VkDataGraphOpticalFlowExecuteFlagsARMValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoCodecOperationFlagsKHR", VkVideoCodecOperationFlagsKHRStrings,
-     VkVideoCodecOperationFlagsKHRValues, 13, ENUM_TYPE_FLAG32},
-    {"VkVideoCapabilityFlagsKHR", VkVideoCapabilityFlagsKHRStrings, VkVideoCapabilityFlagsKHRValues,
-     2, ENUM_TYPE_FLAG32},
-    {"VkVideoSessionCreateFlagsKHR", VkVideoSessionCreateFlagsKHRStrings,
-     VkVideoSessionCreateFlagsKHRValues, 11, ENUM_TYPE_FLAG32},
-    {"VkVideoSessionParametersCreateFlagsKHR", VkVideoSessionParametersCreateFlagsKHRStrings,
-     VkVideoSessionParametersCreateFlagsKHRValues, 1, ENUM_TYPE_FLAG32},
-    {"VkVideoBeginCodingFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkVideoEndCodingFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkVideoCodingControlFlagsKHR", VkVideoCodingControlFlagsKHRStrings,
-     VkVideoCodingControlFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeUsageFlagsKHR", VkVideoDecodeUsageFlagsKHRStrings,
-     VkVideoDecodeUsageFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeCapabilityFlagsKHR", VkVideoDecodeCapabilityFlagsKHRStrings,
-     VkVideoDecodeCapabilityFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeFlagsKHR", VkVideoDecodeFlagsKHRStrings, VkVideoDecodeFlagsKHRValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeH264PictureLayoutFlagsKHR", VkVideoDecodeH264PictureLayoutFlagsKHRStrings,
-     VkVideoDecodeH264PictureLayoutFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeFlagsKHR", VkVideoEncodeFlagsKHRStrings, VkVideoEncodeFlagsKHRValues, 7,
-     ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeUsageFlagsKHR", VkVideoEncodeUsageFlagsKHRStrings,
-     VkVideoEncodeUsageFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeContentFlagsKHR", VkVideoEncodeContentFlagsKHRStrings,
-     VkVideoEncodeContentFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeCapabilityFlagsKHR", VkVideoEncodeCapabilityFlagsKHRStrings,
-     VkVideoEncodeCapabilityFlagsKHRValues, 7, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeFeedbackFlagsKHR", VkVideoEncodeFeedbackFlagsKHRStrings,
-     VkVideoEncodeFeedbackFlagsKHRValues, 17, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodePerPartitionFeedbackFlagsKHR", VkVideoEncodePerPartitionFeedbackFlagsKHRStrings,
-     VkVideoEncodePerPartitionFeedbackFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeRateControlFlagsKHR", VkVideoEncodeRateControlFlagsKHRStrings,
-     VkVideoEncodeRateControlFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeRateControlModeFlagsKHR", VkVideoEncodeRateControlModeFlagsKHRStrings,
-     VkVideoEncodeRateControlModeFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeIntraRefreshModeFlagsKHR", VkVideoEncodeIntraRefreshModeFlagsKHRStrings,
-     VkVideoEncodeIntraRefreshModeFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoChromaSubsamplingFlagsKHR", VkVideoChromaSubsamplingFlagsKHRStrings,
-     VkVideoChromaSubsamplingFlagsKHRValues, 6, ENUM_TYPE_FLAG32},
-    {"VkVideoComponentBitDepthFlagsKHR", VkVideoComponentBitDepthFlagsKHRStrings,
-     VkVideoComponentBitDepthFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264CapabilityFlagsKHR", VkVideoEncodeH264CapabilityFlagsKHRStrings,
-     VkVideoEncodeH264CapabilityFlagsKHRValues, 13, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264StdFlagsKHR", VkVideoEncodeH264StdFlagsKHRStrings,
-     VkVideoEncodeH264StdFlagsKHRValues, 20, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264RateControlFlagsKHR", VkVideoEncodeH264RateControlFlagsKHRStrings,
-     VkVideoEncodeH264RateControlFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265CapabilityFlagsKHR", VkVideoEncodeH265CapabilityFlagsKHRStrings,
-     VkVideoEncodeH265CapabilityFlagsKHRValues, 14, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265StdFlagsKHR", VkVideoEncodeH265StdFlagsKHRStrings,
-     VkVideoEncodeH265StdFlagsKHRValues, 21, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265RateControlFlagsKHR", VkVideoEncodeH265RateControlFlagsKHRStrings,
-     VkVideoEncodeH265RateControlFlagsKHRValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265CtbSizeFlagsKHR", VkVideoEncodeH265CtbSizeFlagsKHRStrings,
-     VkVideoEncodeH265CtbSizeFlagsKHRValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265TransformBlockSizeFlagsKHR",
+     VkPhysicalDeviceSchedulingControlsFlagsARMValues, 2, ENUM_TYPE_FLAG64,
+     VkPhysicalDeviceSchedulingControlsFlagsARMBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkSurfaceCreateFlagsOHOS", "VK_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPresentStageFlagsEXT", "VK_PRESENT_STAGE_", VkPresentStageFlagsEXTStrings,
+     VkPresentStageFlagsEXTValues, 4, ENUM_TYPE_FLAG32, VkPresentStageFlagsEXTBitIndices, 4, NULL,
+     0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkPastPresentationTimingFlagsEXT", "VK_PAST_PRESENTATION_TIMING_",
+     VkPastPresentationTimingFlagsEXTStrings, VkPastPresentationTimingFlagsEXTValues, 2,
+     ENUM_TYPE_FLAG32, VkPastPresentationTimingFlagsEXTBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkPresentTimingInfoFlagsEXT", "VK_PRESENT_TIMING_INFO_", VkPresentTimingInfoFlagsEXTStrings,
+     VkPresentTimingInfoFlagsEXTValues, 2, ENUM_TYPE_FLAG32, VkPresentTimingInfoFlagsEXTBitIndices,
+     2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkSwapchainImageUsageFlagsOHOS", "VK_SWAPCHAIN_IMAGE_USAGE_",
+     VkSwapchainImageUsageFlagsOHOSStrings, VkSwapchainImageUsageFlagsOHOSValues, 1,
+     ENUM_TYPE_FLAG32, VkSwapchainImageUsageFlagsOHOSBitIndices, 1, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkPerformanceCounterDescriptionFlagsARM", "VK_PERFORMANCE_COUNTER_DESCRIPTION_", NULL, NULL,
+     0, ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkShaderInstrumentationValuesFlagsARM", "VK_SHADER_INSTRUMENTATION_VALUES_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphTOSAQualityFlagsARM", "VK_DATA_GRAPH_T_O_S_A_QUALITY_",
+     VkDataGraphTOSAQualityFlagsARMStrings, VkDataGraphTOSAQualityFlagsARMValues, 4,
+     ENUM_TYPE_FLAG32, VkDataGraphTOSAQualityFlagsARMBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkDataGraphOpticalFlowGridSizeFlagsARM", "VK_DATA_GRAPH_OPTICAL_FLOW_GRID_SIZE_",
+     VkDataGraphOpticalFlowGridSizeFlagsARMStrings, VkDataGraphOpticalFlowGridSizeFlagsARMValues, 5,
+     ENUM_TYPE_FLAG32, VkDataGraphOpticalFlowGridSizeFlagsARMBitIndices, 4,
+     VkDataGraphOpticalFlowGridSizeFlagsARMCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphOpticalFlowImageUsageFlagsARM", "VK_DATA_GRAPH_OPTICAL_FLOW_IMAGE_USAGE_",
+     VkDataGraphOpticalFlowImageUsageFlagsARMStrings,
+     VkDataGraphOpticalFlowImageUsageFlagsARMValues, 5, ENUM_TYPE_FLAG32,
+     VkDataGraphOpticalFlowImageUsageFlagsARMBitIndices, 4,
+     VkDataGraphOpticalFlowImageUsageFlagsARMCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphOpticalFlowCreateFlagsARM", "VK_DATA_GRAPH_OPTICAL_FLOW_CREATE_",
+     VkDataGraphOpticalFlowCreateFlagsARMStrings, VkDataGraphOpticalFlowCreateFlagsARMValues, 3,
+     ENUM_TYPE_FLAG32, VkDataGraphOpticalFlowCreateFlagsARMBitIndices, 31, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDataGraphOpticalFlowExecuteFlagsARM", "VK_DATA_GRAPH_OPTICAL_FLOW_EXECUTE_",
+     VkDataGraphOpticalFlowExecuteFlagsARMStrings, VkDataGraphOpticalFlowExecuteFlagsARMValues, 5,
+     ENUM_TYPE_FLAG32, VkDataGraphOpticalFlowExecuteFlagsARMBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoCodecOperationFlagsKHR", "VK_VIDEO_CODEC_OPERATION_",
+     VkVideoCodecOperationFlagsKHRStrings, VkVideoCodecOperationFlagsKHRValues, 13,
+     ENUM_TYPE_FLAG32, VkVideoCodecOperationFlagsKHRBitIndices, 19,
+     VkVideoCodecOperationFlagsKHRCombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoCapabilityFlagsKHR", "VK_VIDEO_CAPABILITY_", VkVideoCapabilityFlagsKHRStrings,
+     VkVideoCapabilityFlagsKHRValues, 2, ENUM_TYPE_FLAG32, VkVideoCapabilityFlagsKHRBitIndices, 2,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoSessionCreateFlagsKHR", "VK_VIDEO_SESSION_CREATE_",
+     VkVideoSessionCreateFlagsKHRStrings, VkVideoSessionCreateFlagsKHRValues, 11, ENUM_TYPE_FLAG32,
+     VkVideoSessionCreateFlagsKHRBitIndices, 7, VkVideoSessionCreateFlagsKHRCombinedIndices, 1,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoSessionParametersCreateFlagsKHR", "VK_VIDEO_SESSION_PARAMETERS_CREATE_",
+     VkVideoSessionParametersCreateFlagsKHRStrings, VkVideoSessionParametersCreateFlagsKHRValues, 1,
+     ENUM_TYPE_FLAG32, VkVideoSessionParametersCreateFlagsKHRBitIndices, 1, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoBeginCodingFlagsKHR", "VK_VIDEO_BEGIN_CODING_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL,
+     0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEndCodingFlagsKHR", "VK_VIDEO_END_CODING_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL, 0,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoCodingControlFlagsKHR", "VK_VIDEO_CODING_CONTROL_",
+     VkVideoCodingControlFlagsKHRStrings, VkVideoCodingControlFlagsKHRValues, 5, ENUM_TYPE_FLAG32,
+     VkVideoCodingControlFlagsKHRBitIndices, 3, VkVideoCodingControlFlagsKHRCombinedIndices, 1,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeUsageFlagsKHR", "VK_VIDEO_DECODE_USAGE_", VkVideoDecodeUsageFlagsKHRStrings,
+     VkVideoDecodeUsageFlagsKHRValues, 4, ENUM_TYPE_FLAG32, VkVideoDecodeUsageFlagsKHRBitIndices, 3,
+     VkVideoDecodeUsageFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeCapabilityFlagsKHR", "VK_VIDEO_DECODE_CAPABILITY_",
+     VkVideoDecodeCapabilityFlagsKHRStrings, VkVideoDecodeCapabilityFlagsKHRValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoDecodeCapabilityFlagsKHRBitIndices, 2,
+     VkVideoDecodeCapabilityFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeFlagsKHR", "VK_VIDEO_DECODE_", VkVideoDecodeFlagsKHRStrings,
+     VkVideoDecodeFlagsKHRValues, 2, ENUM_TYPE_FLAG32, VkVideoDecodeFlagsKHRBitIndices, 1,
+     VkVideoDecodeFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeH264PictureLayoutFlagsKHR", "VK_VIDEO_DECODE_H_2_6_4_PICTURE_LAYOUT_",
+     VkVideoDecodeH264PictureLayoutFlagsKHRStrings, VkVideoDecodeH264PictureLayoutFlagsKHRValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoDecodeH264PictureLayoutFlagsKHRBitIndices, 2,
+     VkVideoDecodeH264PictureLayoutFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeFlagsKHR", "VK_VIDEO_ENCODE_", VkVideoEncodeFlagsKHRStrings,
+     VkVideoEncodeFlagsKHRValues, 7, ENUM_TYPE_FLAG32, VkVideoEncodeFlagsKHRBitIndices, 3,
+     VkVideoEncodeFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeUsageFlagsKHR", "VK_VIDEO_ENCODE_USAGE_", VkVideoEncodeUsageFlagsKHRStrings,
+     VkVideoEncodeUsageFlagsKHRValues, 5, ENUM_TYPE_FLAG32, VkVideoEncodeUsageFlagsKHRBitIndices, 4,
+     VkVideoEncodeUsageFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeContentFlagsKHR", "VK_VIDEO_ENCODE_CONTENT_",
+     VkVideoEncodeContentFlagsKHRStrings, VkVideoEncodeContentFlagsKHRValues, 4, ENUM_TYPE_FLAG32,
+     VkVideoEncodeContentFlagsKHRBitIndices, 3, VkVideoEncodeContentFlagsKHRCombinedIndices, 1,
+     NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeCapabilityFlagsKHR", "VK_VIDEO_ENCODE_CAPABILITY_",
+     VkVideoEncodeCapabilityFlagsKHRStrings, VkVideoEncodeCapabilityFlagsKHRValues, 7,
+     ENUM_TYPE_FLAG32, VkVideoEncodeCapabilityFlagsKHRBitIndices, 4,
+     VkVideoEncodeCapabilityFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeFeedbackFlagsKHR", "VK_VIDEO_ENCODE_FEEDBACK_",
+     VkVideoEncodeFeedbackFlagsKHRStrings, VkVideoEncodeFeedbackFlagsKHRValues, 17,
+     ENUM_TYPE_FLAG32, VkVideoEncodeFeedbackFlagsKHRBitIndices, 10, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkVideoEncodePerPartitionFeedbackFlagsKHR", "VK_VIDEO_ENCODE_PER_PARTITION_FEEDBACK_",
+     VkVideoEncodePerPartitionFeedbackFlagsKHRStrings,
+     VkVideoEncodePerPartitionFeedbackFlagsKHRValues, 3, ENUM_TYPE_FLAG32,
+     VkVideoEncodePerPartitionFeedbackFlagsKHRBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkVideoEncodeRateControlFlagsKHR", "VK_VIDEO_ENCODE_RATE_CONTROL_",
+     VkVideoEncodeRateControlFlagsKHRStrings, VkVideoEncodeRateControlFlagsKHRValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoEncodeRateControlFlagsKHRBitIndices, 1,
+     VkVideoEncodeRateControlFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeRateControlModeFlagsKHR", "VK_VIDEO_ENCODE_RATE_CONTROL_MODE_",
+     VkVideoEncodeRateControlModeFlagsKHRStrings, VkVideoEncodeRateControlModeFlagsKHRValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeRateControlModeFlagsKHRBitIndices, 3,
+     VkVideoEncodeRateControlModeFlagsKHRCombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeIntraRefreshModeFlagsKHR", "VK_VIDEO_ENCODE_INTRA_REFRESH_MODE_",
+     VkVideoEncodeIntraRefreshModeFlagsKHRStrings, VkVideoEncodeIntraRefreshModeFlagsKHRValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeIntraRefreshModeFlagsKHRBitIndices, 4,
+     VkVideoEncodeIntraRefreshModeFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoChromaSubsamplingFlagsKHR", "VK_VIDEO_CHROMA_SUBSAMPLING_",
+     VkVideoChromaSubsamplingFlagsKHRStrings, VkVideoChromaSubsamplingFlagsKHRValues, 6,
+     ENUM_TYPE_FLAG32, VkVideoChromaSubsamplingFlagsKHRBitIndices, 4,
+     VkVideoChromaSubsamplingFlagsKHRCombinedIndices, 2, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoComponentBitDepthFlagsKHR", "VK_VIDEO_COMPONENT_BIT_DEPTH_",
+     VkVideoComponentBitDepthFlagsKHRStrings, VkVideoComponentBitDepthFlagsKHRValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoComponentBitDepthFlagsKHRBitIndices, 5,
+     VkVideoComponentBitDepthFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264CapabilityFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_4_CAPABILITY_",
+     VkVideoEncodeH264CapabilityFlagsKHRStrings, VkVideoEncodeH264CapabilityFlagsKHRValues, 13,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264CapabilityFlagsKHRBitIndices, 11, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264StdFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_4_STD_",
+     VkVideoEncodeH264StdFlagsKHRStrings, VkVideoEncodeH264StdFlagsKHRValues, 20, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH264StdFlagsKHRBitIndices, 21, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264RateControlFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_4_RATE_CONTROL_",
+     VkVideoEncodeH264RateControlFlagsKHRStrings, VkVideoEncodeH264RateControlFlagsKHRValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264RateControlFlagsKHRBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265CapabilityFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_5_CAPABILITY_",
+     VkVideoEncodeH265CapabilityFlagsKHRStrings, VkVideoEncodeH265CapabilityFlagsKHRValues, 14,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265CapabilityFlagsKHRBitIndices, 12, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265StdFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_5_STD_",
+     VkVideoEncodeH265StdFlagsKHRStrings, VkVideoEncodeH265StdFlagsKHRValues, 21, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH265StdFlagsKHRBitIndices, 21, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265RateControlFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_5_RATE_CONTROL_",
+     VkVideoEncodeH265RateControlFlagsKHRStrings, VkVideoEncodeH265RateControlFlagsKHRValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265RateControlFlagsKHRBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265CtbSizeFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_5_CTB_SIZE_",
+     VkVideoEncodeH265CtbSizeFlagsKHRStrings, VkVideoEncodeH265CtbSizeFlagsKHRValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265CtbSizeFlagsKHRBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkVideoEncodeH265TransformBlockSizeFlagsKHR", "VK_VIDEO_ENCODE_H_2_6_5_TRANSFORM_BLOCK_SIZE_",
      VkVideoEncodeH265TransformBlockSizeFlagsKHRStrings,
-     VkVideoEncodeH265TransformBlockSizeFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeAV1CapabilityFlagsKHR", VkVideoEncodeAV1CapabilityFlagsKHRStrings,
-     VkVideoEncodeAV1CapabilityFlagsKHRValues, 7, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeAV1StdFlagsKHR", VkVideoEncodeAV1StdFlagsKHRStrings,
-     VkVideoEncodeAV1StdFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeAV1RateControlFlagsKHR", VkVideoEncodeAV1RateControlFlagsKHRStrings,
-     VkVideoEncodeAV1RateControlFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeAV1SuperblockSizeFlagsKHR", VkVideoEncodeAV1SuperblockSizeFlagsKHRStrings,
-     VkVideoEncodeAV1SuperblockSizeFlagsKHRValues, 2, ENUM_TYPE_FLAG32},
-    {"VkAccessFlags3KHR", VkAccessFlags3KHRStrings, VkAccessFlags3KHRValues, 1, ENUM_TYPE_FLAG64},
-    {"VkAttachmentLoadOp", VkAttachmentLoadOpStrings, VkAttachmentLoadOpValues, 6, ENUM_TYPE_ENUM},
-    {"VkAttachmentStoreOp", VkAttachmentStoreOpStrings, VkAttachmentStoreOpValues, 6,
-     ENUM_TYPE_ENUM},
-    {"VkBlendFactor", VkBlendFactorStrings, VkBlendFactorValues, 19, ENUM_TYPE_ENUM},
-    {"VkBlendOp", VkBlendOpStrings, VkBlendOpValues, 51, ENUM_TYPE_ENUM},
-    {"VkBorderColor", VkBorderColorStrings, VkBorderColorValues, 8, ENUM_TYPE_ENUM},
-    {"VkPipelineCacheHeaderVersion", VkPipelineCacheHeaderVersionStrings,
-     VkPipelineCacheHeaderVersionValues, 2, ENUM_TYPE_ENUM},
-    {"VkComponentSwizzle", VkComponentSwizzleStrings, VkComponentSwizzleValues, 7, ENUM_TYPE_ENUM},
-    {"VkCommandBufferLevel", VkCommandBufferLevelStrings, VkCommandBufferLevelValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkCompareOp", VkCompareOpStrings, VkCompareOpValues, 8, ENUM_TYPE_ENUM},
-    {"VkDescriptorType", VkDescriptorTypeStrings, VkDescriptorTypeValues, 22, ENUM_TYPE_ENUM},
-    {"VkDynamicState", VkDynamicStateStrings, VkDynamicStateValues, 90, ENUM_TYPE_ENUM},
-    {"VkPolygonMode", VkPolygonModeStrings, VkPolygonModeValues, 4, ENUM_TYPE_ENUM},
-    {"VkFormat", VkFormatStrings, VkFormatValues, 355, ENUM_TYPE_ENUM},
-    {"VkFrontFace", VkFrontFaceStrings, VkFrontFaceValues, 2, ENUM_TYPE_ENUM},
-    {"VkImageLayout", VkImageLayoutStrings, VkImageLayoutValues, 42, ENUM_TYPE_ENUM},
-    {"VkImageTiling", VkImageTilingStrings, VkImageTilingValues, 3, ENUM_TYPE_ENUM},
-    {"VkImageType", VkImageTypeStrings, VkImageTypeValues, 3, ENUM_TYPE_ENUM},
-    {"VkImageViewType", VkImageViewTypeStrings, VkImageViewTypeValues, 7, ENUM_TYPE_ENUM},
-    {"VkIndirectCommandsTokenTypeEXT", VkIndirectCommandsTokenTypeEXTStrings,
-     VkIndirectCommandsTokenTypeEXTValues, 17, ENUM_TYPE_ENUM},
-    {"VkSharingMode", VkSharingModeStrings, VkSharingModeValues, 2, ENUM_TYPE_ENUM},
-    {"VkIndexType", VkIndexTypeStrings, VkIndexTypeValues, 7, ENUM_TYPE_ENUM},
-    {"VkLogicOp", VkLogicOpStrings, VkLogicOpValues, 16, ENUM_TYPE_ENUM},
-    {"VkPhysicalDeviceType", VkPhysicalDeviceTypeStrings, VkPhysicalDeviceTypeValues, 5,
-     ENUM_TYPE_ENUM},
-    {"VkPipelineBindPoint", VkPipelineBindPointStrings, VkPipelineBindPointValues, 8,
-     ENUM_TYPE_ENUM},
-    {"VkPrimitiveTopology", VkPrimitiveTopologyStrings, VkPrimitiveTopologyValues, 11,
-     ENUM_TYPE_ENUM},
-    {"VkQueryType", VkQueryTypeStrings, VkQueryTypeValues, 22, ENUM_TYPE_ENUM},
-    {"VkSubpassContents", VkSubpassContentsStrings, VkSubpassContentsValues, 4, ENUM_TYPE_ENUM},
-    {"VkStencilOp", VkStencilOpStrings, VkStencilOpValues, 8, ENUM_TYPE_ENUM},
-    {"VkSystemAllocationScope", VkSystemAllocationScopeStrings, VkSystemAllocationScopeValues, 5,
-     ENUM_TYPE_ENUM},
-    {"VkInternalAllocationType", VkInternalAllocationTypeStrings, VkInternalAllocationTypeValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkSamplerAddressMode", VkSamplerAddressModeStrings, VkSamplerAddressModeValues, 6,
-     ENUM_TYPE_ENUM},
-    {"VkFilter", VkFilterStrings, VkFilterValues, 4, ENUM_TYPE_ENUM},
-    {"VkSamplerMipmapMode", VkSamplerMipmapModeStrings, VkSamplerMipmapModeValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkVertexInputRate", VkVertexInputRateStrings, VkVertexInputRateValues, 2, ENUM_TYPE_ENUM},
-    {"VkClusterAccelerationStructureTypeNV", VkClusterAccelerationStructureTypeNVStrings,
-     VkClusterAccelerationStructureTypeNVValues, 3, ENUM_TYPE_ENUM},
-    {"VkClusterAccelerationStructureOpTypeNV", VkClusterAccelerationStructureOpTypeNVStrings,
-     VkClusterAccelerationStructureOpTypeNVValues, 6, ENUM_TYPE_ENUM},
-    {"VkClusterAccelerationStructureOpModeNV", VkClusterAccelerationStructureOpModeNVStrings,
-     VkClusterAccelerationStructureOpModeNVValues, 3, ENUM_TYPE_ENUM},
-    {"VkObjectType", VkObjectTypeStrings, VkObjectTypeValues, 67, ENUM_TYPE_ENUM},
-    {"VkRayTracingInvocationReorderModeEXT", VkRayTracingInvocationReorderModeEXTStrings,
-     VkRayTracingInvocationReorderModeEXTValues, 4, ENUM_TYPE_ENUM},
-    {"VkIndirectCommandsTokenTypeNV", VkIndirectCommandsTokenTypeNVStrings,
-     VkIndirectCommandsTokenTypeNVValues, 12, ENUM_TYPE_ENUM},
-    {"VkDescriptorUpdateTemplateType", VkDescriptorUpdateTemplateTypeStrings,
-     VkDescriptorUpdateTemplateTypeValues, 4, ENUM_TYPE_ENUM},
-    {"VkViewportCoordinateSwizzleNV", VkViewportCoordinateSwizzleNVStrings,
-     VkViewportCoordinateSwizzleNVValues, 8, ENUM_TYPE_ENUM},
-    {"VkDiscardRectangleModeEXT", VkDiscardRectangleModeEXTStrings, VkDiscardRectangleModeEXTValues,
-     2, ENUM_TYPE_ENUM},
-    {"VkPointClippingBehavior", VkPointClippingBehaviorStrings, VkPointClippingBehaviorValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkCoverageModulationModeNV", VkCoverageModulationModeNVStrings,
-     VkCoverageModulationModeNVValues, 4, ENUM_TYPE_ENUM},
-    {"VkCoverageReductionModeNV", VkCoverageReductionModeNVStrings, VkCoverageReductionModeNVValues,
-     2, ENUM_TYPE_ENUM},
-    {"VkValidationCacheHeaderVersionEXT", VkValidationCacheHeaderVersionEXTStrings,
-     VkValidationCacheHeaderVersionEXTValues, 1, ENUM_TYPE_ENUM},
-    {"VkShaderInfoTypeAMD", VkShaderInfoTypeAMDStrings, VkShaderInfoTypeAMDValues, 3,
-     ENUM_TYPE_ENUM},
-    {"VkQueueGlobalPriority", VkQueueGlobalPriorityStrings, VkQueueGlobalPriorityValues, 12,
-     ENUM_TYPE_ENUM},
-    {"VkTimeDomainKHR", VkTimeDomainKHRStrings, VkTimeDomainKHRValues, 10, ENUM_TYPE_ENUM},
-    {"VkConservativeRasterizationModeEXT", VkConservativeRasterizationModeEXTStrings,
-     VkConservativeRasterizationModeEXTValues, 3, ENUM_TYPE_ENUM},
-    {"VkSemaphoreType", VkSemaphoreTypeStrings, VkSemaphoreTypeValues, 4, ENUM_TYPE_ENUM},
-    {"VkBuildAccelerationStructureModeKHR", VkBuildAccelerationStructureModeKHRStrings,
-     VkBuildAccelerationStructureModeKHRValues, 2, ENUM_TYPE_ENUM},
-    {"VkCopyAccelerationStructureModeKHR", VkCopyAccelerationStructureModeKHRStrings,
-     VkCopyAccelerationStructureModeKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkAccelerationStructureTypeKHR", VkAccelerationStructureTypeKHRStrings,
-     VkAccelerationStructureTypeKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkGeometryTypeKHR", VkGeometryTypeKHRStrings, VkGeometryTypeKHRValues, 9, ENUM_TYPE_ENUM},
-    {"VkRayTracingShaderGroupTypeKHR", VkRayTracingShaderGroupTypeKHRStrings,
-     VkRayTracingShaderGroupTypeKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkAccelerationStructureBuildTypeKHR", VkAccelerationStructureBuildTypeKHRStrings,
-     VkAccelerationStructureBuildTypeKHRValues, 3, ENUM_TYPE_ENUM},
-    {"VkAccelerationStructureCompatibilityKHR", VkAccelerationStructureCompatibilityKHRStrings,
-     VkAccelerationStructureCompatibilityKHRValues, 2, ENUM_TYPE_ENUM},
-    {"VkRayTracingLssIndexingModeNV", VkRayTracingLssIndexingModeNVStrings,
-     VkRayTracingLssIndexingModeNVValues, 2, ENUM_TYPE_ENUM},
-    {"VkRayTracingLssPrimitiveEndCapsModeNV", VkRayTracingLssPrimitiveEndCapsModeNVStrings,
-     VkRayTracingLssPrimitiveEndCapsModeNVValues, 2, ENUM_TYPE_ENUM},
-    {"VkShaderGroupShaderKHR", VkShaderGroupShaderKHRStrings, VkShaderGroupShaderKHRValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkMemoryOverallocationBehaviorAMD", VkMemoryOverallocationBehaviorAMDStrings,
-     VkMemoryOverallocationBehaviorAMDValues, 3, ENUM_TYPE_ENUM},
-    {"VkPerformanceCounterScopeKHR", VkPerformanceCounterScopeKHRStrings,
-     VkPerformanceCounterScopeKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkPerformanceCounterUnitKHR", VkPerformanceCounterUnitKHRStrings,
-     VkPerformanceCounterUnitKHRValues, 11, ENUM_TYPE_ENUM},
-    {"VkPerformanceCounterStorageKHR", VkPerformanceCounterStorageKHRStrings,
-     VkPerformanceCounterStorageKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkPerformanceConfigurationTypeINTEL", VkPerformanceConfigurationTypeINTELStrings,
-     VkPerformanceConfigurationTypeINTELValues, 1, ENUM_TYPE_ENUM},
-    {"VkQueryPoolSamplingModeINTEL", VkQueryPoolSamplingModeINTELStrings,
-     VkQueryPoolSamplingModeINTELValues, 1, ENUM_TYPE_ENUM},
-    {"VkPerformanceOverrideTypeINTEL", VkPerformanceOverrideTypeINTELStrings,
-     VkPerformanceOverrideTypeINTELValues, 2, ENUM_TYPE_ENUM},
-    {"VkPerformanceParameterTypeINTEL", VkPerformanceParameterTypeINTELStrings,
-     VkPerformanceParameterTypeINTELValues, 2, ENUM_TYPE_ENUM},
-    {"VkPerformanceValueTypeINTEL", VkPerformanceValueTypeINTELStrings,
-     VkPerformanceValueTypeINTELValues, 5, ENUM_TYPE_ENUM},
-    {"VkLineRasterizationMode", VkLineRasterizationModeStrings, VkLineRasterizationModeValues, 12,
-     ENUM_TYPE_ENUM},
-    {"VkFaultLevel", VkFaultLevelStrings, VkFaultLevelValues, 4, ENUM_TYPE_ENUM},
-    {"VkFaultType", VkFaultTypeStrings, VkFaultTypeValues, 7, ENUM_TYPE_ENUM},
-    {"VkFaultQueryBehavior", VkFaultQueryBehaviorStrings, VkFaultQueryBehaviorValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkPipelineMatchControl", VkPipelineMatchControlStrings, VkPipelineMatchControlValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkSciSyncClientTypeNV", VkSciSyncClientTypeNVStrings, VkSciSyncClientTypeNVValues, 3,
-     ENUM_TYPE_ENUM},
-    {"VkSciSyncPrimitiveTypeNV", VkSciSyncPrimitiveTypeNVStrings, VkSciSyncPrimitiveTypeNVValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkFragmentShadingRateNV", VkFragmentShadingRateNVStrings, VkFragmentShadingRateNVValues, 12,
-     ENUM_TYPE_ENUM},
-    {"VkFragmentShadingRateTypeNV", VkFragmentShadingRateTypeNVStrings,
-     VkFragmentShadingRateTypeNVValues, 2, ENUM_TYPE_ENUM},
-    {"VkSubpassMergeStatusEXT", VkSubpassMergeStatusEXTStrings, VkSubpassMergeStatusEXTValues, 14,
-     ENUM_TYPE_ENUM},
-    {"VkProvokingVertexModeEXT", VkProvokingVertexModeEXTStrings, VkProvokingVertexModeEXTValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkPipelineCacheValidationVersion", VkPipelineCacheValidationVersionStrings,
-     VkPipelineCacheValidationVersionValues, 1, ENUM_TYPE_ENUM},
-    {"VkPipelineRobustnessBufferBehavior", VkPipelineRobustnessBufferBehaviorStrings,
-     VkPipelineRobustnessBufferBehaviorValues, 8, ENUM_TYPE_ENUM},
-    {"VkPipelineRobustnessImageBehavior", VkPipelineRobustnessImageBehaviorStrings,
-     VkPipelineRobustnessImageBehaviorValues, 8, ENUM_TYPE_ENUM},
-    {"VkDeviceAddressBindingTypeEXT", VkDeviceAddressBindingTypeEXTStrings,
-     VkDeviceAddressBindingTypeEXTValues, 2, ENUM_TYPE_ENUM},
-    {"VkMicromapTypeEXT", VkMicromapTypeEXTStrings, VkMicromapTypeEXTValues, 2, ENUM_TYPE_ENUM},
-    {"VkBuildMicromapModeEXT", VkBuildMicromapModeEXTStrings, VkBuildMicromapModeEXTValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkCopyMicromapModeEXT", VkCopyMicromapModeEXTStrings, VkCopyMicromapModeEXTValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkOpacityMicromapFormatKHR", VkOpacityMicromapFormatKHRStrings,
-     VkOpacityMicromapFormatKHRValues, 4, ENUM_TYPE_ENUM},
-    {"VkOpacityMicromapSpecialIndexKHR", VkOpacityMicromapSpecialIndexKHRStrings,
-     VkOpacityMicromapSpecialIndexKHRValues, 9, ENUM_TYPE_ENUM},
+     VkVideoEncodeH265TransformBlockSizeFlagsKHRValues, 4, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH265TransformBlockSizeFlagsKHRBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkVideoEncodeAV1CapabilityFlagsKHR", "VK_VIDEO_ENCODE_A_V_1_CAPABILITY_",
+     VkVideoEncodeAV1CapabilityFlagsKHRStrings, VkVideoEncodeAV1CapabilityFlagsKHRValues, 7,
+     ENUM_TYPE_FLAG32, VkVideoEncodeAV1CapabilityFlagsKHRBitIndices, 6, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeAV1StdFlagsKHR", "VK_VIDEO_ENCODE_A_V_1_STD_",
+     VkVideoEncodeAV1StdFlagsKHRStrings, VkVideoEncodeAV1StdFlagsKHRValues, 4, ENUM_TYPE_FLAG32,
+     VkVideoEncodeAV1StdFlagsKHRBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeAV1RateControlFlagsKHR", "VK_VIDEO_ENCODE_A_V_1_RATE_CONTROL_",
+     VkVideoEncodeAV1RateControlFlagsKHRStrings, VkVideoEncodeAV1RateControlFlagsKHRValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoEncodeAV1RateControlFlagsKHRBitIndices, 4, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeAV1SuperblockSizeFlagsKHR", "VK_VIDEO_ENCODE_A_V_1_SUPERBLOCK_SIZE_",
+     VkVideoEncodeAV1SuperblockSizeFlagsKHRStrings, VkVideoEncodeAV1SuperblockSizeFlagsKHRValues, 2,
+     ENUM_TYPE_FLAG32, VkVideoEncodeAV1SuperblockSizeFlagsKHRBitIndices, 2, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkAccessFlags3KHR", "VK_ACCESS_3_", VkAccessFlags3KHRStrings, VkAccessFlags3KHRValues, 1,
+     ENUM_TYPE_FLAG64, NULL, 0, VkAccessFlags3KHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkAttachmentLoadOp", "VK_ATTACHMENT_LOAD_OP_", VkAttachmentLoadOpStrings,
+     VkAttachmentLoadOpValues, 6, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkAttachmentLoadOpValueIndices,
+     3, VkAttachmentLoadOpSortedValues, VkAttachmentLoadOpSortedIndices, 1, NULL, 0},
+    {"VkAttachmentStoreOp", "VK_ATTACHMENT_STORE_OP_", VkAttachmentStoreOpStrings,
+     VkAttachmentStoreOpValues, 6, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkAttachmentStoreOpValueIndices, 2, VkAttachmentStoreOpSortedValues,
+     VkAttachmentStoreOpSortedIndices, 1, NULL, 0},
+    {"VkBlendFactor", "VK_BLEND_FACTOR_", VkBlendFactorStrings, VkBlendFactorValues, 19,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkBlendFactorValueIndices, 19, NULL, NULL, 0, NULL, 0},
+    {"VkBlendOp", "VK_BLEND_OP_", VkBlendOpStrings, VkBlendOpValues, 51, ENUM_TYPE_ENUM, NULL, 0,
+     NULL, 0, VkBlendOpValueIndices, 5, VkBlendOpSortedValues, VkBlendOpSortedIndices, 46, NULL, 0},
+    {"VkBorderColor", "VK_BORDER_COLOR_", VkBorderColorStrings, VkBorderColorValues, 8,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkBorderColorValueIndices, 6, VkBorderColorSortedValues,
+     VkBorderColorSortedIndices, 2, NULL, 0},
+    {"VkPipelineCacheHeaderVersion", "VK_PIPELINE_CACHE_HEADER_VERSION_",
+     VkPipelineCacheHeaderVersionStrings, VkPipelineCacheHeaderVersionValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPipelineCacheHeaderVersionValueIndices, 2,
+     VkPipelineCacheHeaderVersionSortedValues, VkPipelineCacheHeaderVersionSortedIndices, 1, NULL,
+     0},
+    {"VkComponentSwizzle", "VK_COMPONENT_SWIZZLE_", VkComponentSwizzleStrings,
+     VkComponentSwizzleValues, 7, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkComponentSwizzleValueIndices,
+     7, NULL, NULL, 0, NULL, 0},
+    {"VkCommandBufferLevel", "VK_COMMAND_BUFFER_LEVEL_", VkCommandBufferLevelStrings,
+     VkCommandBufferLevelValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkCommandBufferLevelValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkCompareOp", "VK_COMPARE_OP_", VkCompareOpStrings, VkCompareOpValues, 8, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkCompareOpValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkDescriptorType", "VK_DESCRIPTOR_TYPE_", VkDescriptorTypeStrings, VkDescriptorTypeValues, 22,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDescriptorTypeValueIndices, 11,
+     VkDescriptorTypeSortedValues, VkDescriptorTypeSortedIndices, 8, NULL, 0},
+    {"VkDynamicState", "VK_DYNAMIC_STATE_", VkDynamicStateStrings, VkDynamicStateValues, 90,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDynamicStateValueIndices, 9, VkDynamicStateSortedValues,
+     VkDynamicStateSortedIndices, 64, NULL, 0},
+    {"VkPolygonMode", "VK_POLYGON_MODE_", VkPolygonModeStrings, VkPolygonModeValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPolygonModeValueIndices, 3, VkPolygonModeSortedValues,
+     VkPolygonModeSortedIndices, 1, NULL, 0},
+    {"VkFormat", "VK_FORMAT_", VkFormatStrings, VkFormatValues, 355, ENUM_TYPE_ENUM, NULL, 0, NULL,
+     0, VkFormatValueIndices, 185, VkFormatSortedValues, VkFormatSortedIndices, 113, NULL, 0},
+    {"VkFrontFace", "VK_FRONT_FACE_", VkFrontFaceStrings, VkFrontFaceValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkFrontFaceValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkImageLayout", "VK_IMAGE_LAYOUT_", VkImageLayoutStrings, VkImageLayoutValues, 42,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkImageLayoutValueIndices, 9, VkImageLayoutSortedValues,
+     VkImageLayoutSortedIndices, 23, NULL, 0},
+    {"VkImageTiling", "VK_IMAGE_TILING_", VkImageTilingStrings, VkImageTilingValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkImageTilingValueIndices, 2, VkImageTilingSortedValues,
+     VkImageTilingSortedIndices, 1, NULL, 0},
+    {"VkImageType", "VK_IMAGE_TYPE_", VkImageTypeStrings, VkImageTypeValues, 3, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkImageTypeValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkImageViewType", "VK_IMAGE_VIEW_TYPE_", VkImageViewTypeStrings, VkImageViewTypeValues, 7,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkImageViewTypeValueIndices, 7, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectCommandsTokenTypeEXT", "VK_INDIRECT_COMMANDS_TOKEN_TYPE_",
+     VkIndirectCommandsTokenTypeEXTStrings, VkIndirectCommandsTokenTypeEXTValues, 17,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkIndirectCommandsTokenTypeEXTValueIndices, 10,
+     VkIndirectCommandsTokenTypeEXTSortedValues, VkIndirectCommandsTokenTypeEXTSortedIndices, 7,
+     NULL, 0},
+    {"VkSharingMode", "VK_SHARING_MODE_", VkSharingModeStrings, VkSharingModeValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkSharingModeValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkIndexType", "VK_INDEX_TYPE_", VkIndexTypeStrings, VkIndexTypeValues, 7, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkIndexTypeValueIndices, 2, VkIndexTypeSortedValues,
+     VkIndexTypeSortedIndices, 2, NULL, 0},
+    {"VkLogicOp", "VK_LOGIC_OP_", VkLogicOpStrings, VkLogicOpValues, 16, ENUM_TYPE_ENUM, NULL, 0,
+     NULL, 0, VkLogicOpValueIndices, 16, NULL, NULL, 0, NULL, 0},
+    {"VkPhysicalDeviceType", "VK_PHYSICAL_DEVICE_TYPE_", VkPhysicalDeviceTypeStrings,
+     VkPhysicalDeviceTypeValues, 5, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPhysicalDeviceTypeValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineBindPoint", "VK_PIPELINE_BIND_POINT_", VkPipelineBindPointStrings,
+     VkPipelineBindPointValues, 8, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPipelineBindPointValueIndices, 2, VkPipelineBindPointSortedValues,
+     VkPipelineBindPointSortedIndices, 4, NULL, 0},
+    {"VkPrimitiveTopology", "VK_PRIMITIVE_TOPOLOGY_", VkPrimitiveTopologyStrings,
+     VkPrimitiveTopologyValues, 11, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPrimitiveTopologyValueIndices, 11, NULL, NULL, 0, NULL, 0},
+    {"VkQueryType", "VK_QUERY_TYPE_", VkQueryTypeStrings, VkQueryTypeValues, 22, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkQueryTypeValueIndices, 3, VkQueryTypeSortedValues,
+     VkQueryTypeSortedIndices, 17, NULL, 0},
+    {"VkSubpassContents", "VK_SUBPASS_CONTENTS_", VkSubpassContentsStrings, VkSubpassContentsValues,
+     4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkSubpassContentsValueIndices, 2,
+     VkSubpassContentsSortedValues, VkSubpassContentsSortedIndices, 1, NULL, 0},
+    {"VkStencilOp", "VK_STENCIL_OP_", VkStencilOpStrings, VkStencilOpValues, 8, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkStencilOpValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkStructureType", "VK_STRUCTURE_TYPE_", VkStructureTypeStrings, VkStructureTypeValues, 1581,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkStructureTypeValueIndices, 57, NULL, NULL, 0,
+     VkStructureTypeExtensionBlocks, 690},
+    {"VkSystemAllocationScope", "VK_SYSTEM_ALLOCATION_SCOPE_", VkSystemAllocationScopeStrings,
+     VkSystemAllocationScopeValues, 5, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSystemAllocationScopeValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkInternalAllocationType", "VK_INTERNAL_ALLOCATION_TYPE_", VkInternalAllocationTypeStrings,
+     VkInternalAllocationTypeValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkInternalAllocationTypeValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkSamplerAddressMode", "VK_SAMPLER_ADDRESS_MODE_", VkSamplerAddressModeStrings,
+     VkSamplerAddressModeValues, 6, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSamplerAddressModeValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkFilter", "VK_FILTER_", VkFilterStrings, VkFilterValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkFilterValueIndices, 2, VkFilterSortedValues, VkFilterSortedIndices, 1, NULL, 0},
+    {"VkSamplerMipmapMode", "VK_SAMPLER_MIPMAP_MODE_", VkSamplerMipmapModeStrings,
+     VkSamplerMipmapModeValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSamplerMipmapModeValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkVertexInputRate", "VK_VERTEX_INPUT_RATE_", VkVertexInputRateStrings,
+     VkVertexInputRateValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkVertexInputRateValueIndices, 2,
+     NULL, NULL, 0, NULL, 0},
+    {"VkClusterAccelerationStructureTypeNV", "VK_CLUSTER_ACCELERATION_STRUCTURE_TYPE_",
+     VkClusterAccelerationStructureTypeNVStrings, VkClusterAccelerationStructureTypeNVValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkClusterAccelerationStructureTypeNVValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkClusterAccelerationStructureOpTypeNV", "VK_CLUSTER_ACCELERATION_STRUCTURE_OP_TYPE_",
+     VkClusterAccelerationStructureOpTypeNVStrings, VkClusterAccelerationStructureOpTypeNVValues, 6,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkClusterAccelerationStructureOpTypeNVValueIndices, 6, NULL,
+     NULL, 0, NULL, 0},
+    {"VkClusterAccelerationStructureOpModeNV", "VK_CLUSTER_ACCELERATION_STRUCTURE_OP_MODE_",
+     VkClusterAccelerationStructureOpModeNVStrings, VkClusterAccelerationStructureOpModeNVValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkClusterAccelerationStructureOpModeNVValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkObjectType", "VK_OBJECT_TYPE_", VkObjectTypeStrings, VkObjectTypeValues, 67, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkObjectTypeValueIndices, 26, VkObjectTypeSortedValues,
+     VkObjectTypeSortedIndices, 37, NULL, 0},
+    {"VkRayTracingInvocationReorderModeEXT", "VK_RAY_TRACING_INVOCATION_REORDER_MODE_",
+     VkRayTracingInvocationReorderModeEXTStrings, VkRayTracingInvocationReorderModeEXTValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkRayTracingInvocationReorderModeEXTValueIndices, 2, NULL,
+     NULL, 0, NULL, 0},
+    {"VkIndirectCommandsTokenTypeNV", "VK_INDIRECT_COMMANDS_TOKEN_TYPE_",
+     VkIndirectCommandsTokenTypeNVStrings, VkIndirectCommandsTokenTypeNVValues, 12, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkIndirectCommandsTokenTypeNVValueIndices, 8,
+     VkIndirectCommandsTokenTypeNVSortedValues, VkIndirectCommandsTokenTypeNVSortedIndices, 4, NULL,
+     0},
+    {"VkDescriptorUpdateTemplateType", "VK_DESCRIPTOR_UPDATE_TEMPLATE_TYPE_",
+     VkDescriptorUpdateTemplateTypeStrings, VkDescriptorUpdateTemplateTypeValues, 4, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDescriptorUpdateTemplateTypeValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkViewportCoordinateSwizzleNV", "VK_VIEWPORT_COORDINATE_SWIZZLE_",
+     VkViewportCoordinateSwizzleNVStrings, VkViewportCoordinateSwizzleNVValues, 8, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkViewportCoordinateSwizzleNVValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkDiscardRectangleModeEXT", "VK_DISCARD_RECTANGLE_MODE_", VkDiscardRectangleModeEXTStrings,
+     VkDiscardRectangleModeEXTValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDiscardRectangleModeEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkPointClippingBehavior", "VK_POINT_CLIPPING_BEHAVIOR_", VkPointClippingBehaviorStrings,
+     VkPointClippingBehaviorValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPointClippingBehaviorValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkCoverageModulationModeNV", "VK_COVERAGE_MODULATION_MODE_",
+     VkCoverageModulationModeNVStrings, VkCoverageModulationModeNVValues, 4, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkCoverageModulationModeNVValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkCoverageReductionModeNV", "VK_COVERAGE_REDUCTION_MODE_", VkCoverageReductionModeNVStrings,
+     VkCoverageReductionModeNVValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkCoverageReductionModeNVValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkValidationCacheHeaderVersionEXT", "VK_VALIDATION_CACHE_HEADER_VERSION_",
+     VkValidationCacheHeaderVersionEXTStrings, VkValidationCacheHeaderVersionEXTValues, 1,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkValidationCacheHeaderVersionEXTValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkShaderInfoTypeAMD", "VK_SHADER_INFO_TYPE_", VkShaderInfoTypeAMDStrings,
+     VkShaderInfoTypeAMDValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkShaderInfoTypeAMDValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkQueueGlobalPriority", "VK_QUEUE_GLOBAL_PRIORITY_", VkQueueGlobalPriorityStrings,
+     VkQueueGlobalPriorityValues, 12, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, NULL, 0,
+     VkQueueGlobalPrioritySortedValues, VkQueueGlobalPrioritySortedIndices, 4, NULL, 0},
+    {"VkTimeDomainKHR", "VK_TIME_DOMAIN_", VkTimeDomainKHRStrings, VkTimeDomainKHRValues, 10,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkTimeDomainKHRValueIndices, 4, VkTimeDomainKHRSortedValues,
+     VkTimeDomainKHRSortedIndices, 2, NULL, 0},
+    {"VkConservativeRasterizationModeEXT", "VK_CONSERVATIVE_RASTERIZATION_MODE_",
+     VkConservativeRasterizationModeEXTStrings, VkConservativeRasterizationModeEXTValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkConservativeRasterizationModeEXTValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkSemaphoreType", "VK_SEMAPHORE_TYPE_", VkSemaphoreTypeStrings, VkSemaphoreTypeValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkSemaphoreTypeValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkBuildAccelerationStructureModeKHR", "VK_BUILD_ACCELERATION_STRUCTURE_MODE_",
+     VkBuildAccelerationStructureModeKHRStrings, VkBuildAccelerationStructureModeKHRValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkBuildAccelerationStructureModeKHRValueIndices, 2, NULL,
+     NULL, 0, NULL, 0},
+    {"VkCopyAccelerationStructureModeKHR", "VK_COPY_ACCELERATION_STRUCTURE_MODE_",
+     VkCopyAccelerationStructureModeKHRStrings, VkCopyAccelerationStructureModeKHRValues, 6,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkCopyAccelerationStructureModeKHRValueIndices, 4, NULL,
+     NULL, 0, NULL, 0},
+    {"VkAccelerationStructureTypeKHR", "VK_ACCELERATION_STRUCTURE_TYPE_",
+     VkAccelerationStructureTypeKHRStrings, VkAccelerationStructureTypeKHRValues, 6, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkAccelerationStructureTypeKHRValueIndices, 3,
+     VkAccelerationStructureTypeKHRSortedValues, VkAccelerationStructureTypeKHRSortedIndices, 1,
+     NULL, 0},
+    {"VkGeometryTypeKHR", "VK_GEOMETRY_TYPE_", VkGeometryTypeKHRStrings, VkGeometryTypeKHRValues, 9,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkGeometryTypeKHRValueIndices, 3,
+     VkGeometryTypeKHRSortedValues, VkGeometryTypeKHRSortedIndices, 4, NULL, 0},
+    {"VkRayTracingShaderGroupTypeKHR", "VK_RAY_TRACING_SHADER_GROUP_TYPE_",
+     VkRayTracingShaderGroupTypeKHRStrings, VkRayTracingShaderGroupTypeKHRValues, 6, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkRayTracingShaderGroupTypeKHRValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkAccelerationStructureBuildTypeKHR", "VK_ACCELERATION_STRUCTURE_BUILD_TYPE_",
+     VkAccelerationStructureBuildTypeKHRStrings, VkAccelerationStructureBuildTypeKHRValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkAccelerationStructureBuildTypeKHRValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkAccelerationStructureCompatibilityKHR", "VK_ACCELERATION_STRUCTURE_COMPATIBILITY_",
+     VkAccelerationStructureCompatibilityKHRStrings, VkAccelerationStructureCompatibilityKHRValues,
+     2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkAccelerationStructureCompatibilityKHRValueIndices, 2,
+     NULL, NULL, 0, NULL, 0},
+    {"VkRayTracingLssIndexingModeNV", "VK_RAY_TRACING_LSS_INDEXING_MODE_",
+     VkRayTracingLssIndexingModeNVStrings, VkRayTracingLssIndexingModeNVValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkRayTracingLssIndexingModeNVValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkRayTracingLssPrimitiveEndCapsModeNV", "VK_RAY_TRACING_LSS_PRIMITIVE_END_CAPS_MODE_",
+     VkRayTracingLssPrimitiveEndCapsModeNVStrings, VkRayTracingLssPrimitiveEndCapsModeNVValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkRayTracingLssPrimitiveEndCapsModeNVValueIndices, 2, NULL,
+     NULL, 0, NULL, 0},
+    {"VkShaderGroupShaderKHR", "VK_SHADER_GROUP_SHADER_", VkShaderGroupShaderKHRStrings,
+     VkShaderGroupShaderKHRValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkShaderGroupShaderKHRValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkMemoryOverallocationBehaviorAMD", "VK_MEMORY_OVERALLOCATION_BEHAVIOR_",
+     VkMemoryOverallocationBehaviorAMDStrings, VkMemoryOverallocationBehaviorAMDValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkMemoryOverallocationBehaviorAMDValueIndices, 3, NULL, NULL,
+     0, NULL, 0},
+    {"VkPerformanceCounterScopeKHR", "VK_PERFORMANCE_COUNTER_SCOPE_",
+     VkPerformanceCounterScopeKHRStrings, VkPerformanceCounterScopeKHRValues, 6, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPerformanceCounterScopeKHRValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkPerformanceCounterUnitKHR", "VK_PERFORMANCE_COUNTER_UNIT_",
+     VkPerformanceCounterUnitKHRStrings, VkPerformanceCounterUnitKHRValues, 11, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPerformanceCounterUnitKHRValueIndices, 11, NULL, NULL, 0, NULL, 0},
+    {"VkPerformanceCounterStorageKHR", "VK_PERFORMANCE_COUNTER_STORAGE_",
+     VkPerformanceCounterStorageKHRStrings, VkPerformanceCounterStorageKHRValues, 6, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPerformanceCounterStorageKHRValueIndices, 6, NULL, NULL, 0, NULL, 0},
+    {"VkPerformanceConfigurationTypeINTEL", "VK_PERFORMANCE_CONFIGURATION_TYPE_",
+     VkPerformanceConfigurationTypeINTELStrings, VkPerformanceConfigurationTypeINTELValues, 1,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPerformanceConfigurationTypeINTELValueIndices, 1, NULL,
+     NULL, 0, NULL, 0},
+    {"VkQueryPoolSamplingModeINTEL", "VK_QUERY_POOL_SAMPLING_MODE_",
+     VkQueryPoolSamplingModeINTELStrings, VkQueryPoolSamplingModeINTELValues, 1, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkQueryPoolSamplingModeINTELValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkPerformanceOverrideTypeINTEL", "VK_PERFORMANCE_OVERRIDE_TYPE_",
+     VkPerformanceOverrideTypeINTELStrings, VkPerformanceOverrideTypeINTELValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPerformanceOverrideTypeINTELValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkPerformanceParameterTypeINTEL", "VK_PERFORMANCE_PARAMETER_TYPE_",
+     VkPerformanceParameterTypeINTELStrings, VkPerformanceParameterTypeINTELValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPerformanceParameterTypeINTELValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkPerformanceValueTypeINTEL", "VK_PERFORMANCE_VALUE_TYPE_",
+     VkPerformanceValueTypeINTELStrings, VkPerformanceValueTypeINTELValues, 5, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkPerformanceValueTypeINTELValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkLineRasterizationMode", "VK_LINE_RASTERIZATION_MODE_", VkLineRasterizationModeStrings,
+     VkLineRasterizationModeValues, 12, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkLineRasterizationModeValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkFaultLevel", "VK_FAULT_LEVEL_", VkFaultLevelStrings, VkFaultLevelValues, 4, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkFaultLevelValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkFaultType", "VK_FAULT_TYPE_", VkFaultTypeStrings, VkFaultTypeValues, 7, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkFaultTypeValueIndices, 7, NULL, NULL, 0, NULL, 0},
+    {"VkFaultQueryBehavior", "VK_FAULT_QUERY_BEHAVIOR_", VkFaultQueryBehaviorStrings,
+     VkFaultQueryBehaviorValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkFaultQueryBehaviorValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineMatchControl", "VK_PIPELINE_MATCH_CONTROL_", VkPipelineMatchControlStrings,
+     VkPipelineMatchControlValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPipelineMatchControlValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkSciSyncClientTypeNV", "VK_SCI_SYNC_CLIENT_TYPE_", VkSciSyncClientTypeNVStrings,
+     VkSciSyncClientTypeNVValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSciSyncClientTypeNVValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkSciSyncPrimitiveTypeNV", "VK_SCI_SYNC_PRIMITIVE_TYPE_", VkSciSyncPrimitiveTypeNVStrings,
+     VkSciSyncPrimitiveTypeNVValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSciSyncPrimitiveTypeNVValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkFragmentShadingRateNV", "VK_FRAGMENT_SHADING_RATE_", VkFragmentShadingRateNVStrings,
+     VkFragmentShadingRateNVValues, 12, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkFragmentShadingRateNVValueIndices, 16, NULL, NULL, 0, NULL, 0},
+    {"VkFragmentShadingRateTypeNV", "VK_FRAGMENT_SHADING_RATE_TYPE_",
+     VkFragmentShadingRateTypeNVStrings, VkFragmentShadingRateTypeNVValues, 2, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkFragmentShadingRateTypeNVValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkSubpassMergeStatusEXT", "VK_SUBPASS_MERGE_STATUS_", VkSubpassMergeStatusEXTStrings,
+     VkSubpassMergeStatusEXTValues, 14, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSubpassMergeStatusEXTValueIndices, 14, NULL, NULL, 0, NULL, 0},
+    {"VkProvokingVertexModeEXT", "VK_PROVOKING_VERTEX_MODE_", VkProvokingVertexModeEXTStrings,
+     VkProvokingVertexModeEXTValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkProvokingVertexModeEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineCacheValidationVersion", "VK_PIPELINE_CACHE_VALIDATION_VERSION_",
+     VkPipelineCacheValidationVersionStrings, VkPipelineCacheValidationVersionValues, 1,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPipelineCacheValidationVersionValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkPipelineRobustnessBufferBehavior", "VK_PIPELINE_ROBUSTNESS_BUFFER_BEHAVIOR_",
+     VkPipelineRobustnessBufferBehaviorStrings, VkPipelineRobustnessBufferBehaviorValues, 8,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPipelineRobustnessBufferBehaviorValueIndices, 4, NULL,
+     NULL, 0, NULL, 0},
+    {"VkPipelineRobustnessImageBehavior", "VK_PIPELINE_ROBUSTNESS_IMAGE_BEHAVIOR_",
+     VkPipelineRobustnessImageBehaviorStrings, VkPipelineRobustnessImageBehaviorValues, 8,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPipelineRobustnessImageBehaviorValueIndices, 4, NULL, NULL,
+     0, NULL, 0},
+    {"VkDeviceAddressBindingTypeEXT", "VK_DEVICE_ADDRESS_BINDING_TYPE_",
+     VkDeviceAddressBindingTypeEXTStrings, VkDeviceAddressBindingTypeEXTValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDeviceAddressBindingTypeEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkMicromapTypeEXT", "VK_MICROMAP_TYPE_", VkMicromapTypeEXTStrings, VkMicromapTypeEXTValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkMicromapTypeEXTValueIndices, 1,
+     VkMicromapTypeEXTSortedValues, VkMicromapTypeEXTSortedIndices, 1, NULL, 0},
+    {"VkBuildMicromapModeEXT", "VK_BUILD_MICROMAP_MODE_", VkBuildMicromapModeEXTStrings,
+     VkBuildMicromapModeEXTValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkBuildMicromapModeEXTValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkCopyMicromapModeEXT", "VK_COPY_MICROMAP_MODE_", VkCopyMicromapModeEXTStrings,
+     VkCopyMicromapModeEXTValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkCopyMicromapModeEXTValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkOpacityMicromapFormatKHR", "VK_OPACITY_MICROMAP_FORMAT_", VkOpacityMicromapFormatKHRStrings,
+     VkOpacityMicromapFormatKHRValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkOpacityMicromapFormatKHRValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkOpacityMicromapSpecialIndexKHR", "VK_OPACITY_MICROMAP_SPECIAL_INDEX_",
+     VkOpacityMicromapSpecialIndexKHRStrings, VkOpacityMicromapSpecialIndexKHRValues, 9,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, NULL, 0, VkOpacityMicromapSpecialIndexKHRSortedValues,
+     VkOpacityMicromapSpecialIndexKHRSortedIndices, 5, NULL, 0},
     {"VkAccelerationStructureSerializedBlockTypeKHR",
+     "VK_ACCELERATION_STRUCTURE_SERIALIZED_BLOCK_TYPE_",
      VkAccelerationStructureSerializedBlockTypeKHRStrings,
-     VkAccelerationStructureSerializedBlockTypeKHRValues, 1, ENUM_TYPE_ENUM},
-    {"VkIndirectExecutionSetInfoTypeEXT", VkIndirectExecutionSetInfoTypeEXTStrings,
-     VkIndirectExecutionSetInfoTypeEXTValues, 2, ENUM_TYPE_ENUM},
-    {"VkDeviceFaultVendorBinaryHeaderVersionKHR", VkDeviceFaultVendorBinaryHeaderVersionKHRStrings,
-     VkDeviceFaultVendorBinaryHeaderVersionKHRValues, 2, ENUM_TYPE_ENUM},
-    {"VkDepthBiasRepresentationEXT", VkDepthBiasRepresentationEXTStrings,
-     VkDepthBiasRepresentationEXTValues, 3, ENUM_TYPE_ENUM},
-    {"VkDirectDriverLoadingModeLUNARG", VkDirectDriverLoadingModeLUNARGStrings,
-     VkDirectDriverLoadingModeLUNARGValues, 2, ENUM_TYPE_ENUM},
-    {"VkPartitionedAccelerationStructureOpTypeNV",
+     VkAccelerationStructureSerializedBlockTypeKHRValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkAccelerationStructureSerializedBlockTypeKHRValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectExecutionSetInfoTypeEXT", "VK_INDIRECT_EXECUTION_SET_INFO_TYPE_",
+     VkIndirectExecutionSetInfoTypeEXTStrings, VkIndirectExecutionSetInfoTypeEXTValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkIndirectExecutionSetInfoTypeEXTValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkDeviceFaultVendorBinaryHeaderVersionKHR", "VK_DEVICE_FAULT_VENDOR_BINARY_HEADER_VERSION_",
+     VkDeviceFaultVendorBinaryHeaderVersionKHRStrings,
+     VkDeviceFaultVendorBinaryHeaderVersionKHRValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDeviceFaultVendorBinaryHeaderVersionKHRValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkDepthBiasRepresentationEXT", "VK_DEPTH_BIAS_REPRESENTATION_",
+     VkDepthBiasRepresentationEXTStrings, VkDepthBiasRepresentationEXTValues, 3, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDepthBiasRepresentationEXTValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkDirectDriverLoadingModeLUNARG", "VK_DIRECT_DRIVER_LOADING_MODE_",
+     VkDirectDriverLoadingModeLUNARGStrings, VkDirectDriverLoadingModeLUNARGValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDirectDriverLoadingModeLUNARGValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkPartitionedAccelerationStructureOpTypeNV", "VK_PARTITIONED_ACCELERATION_STRUCTURE_OP_TYPE_",
      VkPartitionedAccelerationStructureOpTypeNVStrings,
-     VkPartitionedAccelerationStructureOpTypeNVValues, 3, ENUM_TYPE_ENUM},
-    {"VkAntiLagModeAMD", VkAntiLagModeAMDStrings, VkAntiLagModeAMDValues, 3, ENUM_TYPE_ENUM},
-    {"VkAntiLagStageAMD", VkAntiLagStageAMDStrings, VkAntiLagStageAMDValues, 2, ENUM_TYPE_ENUM},
-    {"VkDisplacementMicromapFormatNV", VkDisplacementMicromapFormatNVStrings,
-     VkDisplacementMicromapFormatNVValues, 3, ENUM_TYPE_ENUM},
-    {"VkShaderCodeTypeEXT", VkShaderCodeTypeEXTStrings, VkShaderCodeTypeEXTValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkScopeKHR", VkScopeKHRStrings, VkScopeKHRValues, 8, ENUM_TYPE_ENUM},
-    {"VkComponentTypeKHR", VkComponentTypeKHRStrings, VkComponentTypeKHRValues, 34, ENUM_TYPE_ENUM},
-    {"VkCubicFilterWeightsQCOM", VkCubicFilterWeightsQCOMStrings, VkCubicFilterWeightsQCOMValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkBlockMatchWindowCompareModeQCOM", VkBlockMatchWindowCompareModeQCOMStrings,
-     VkBlockMatchWindowCompareModeQCOMValues, 2, ENUM_TYPE_ENUM},
-    {"VkLayeredDriverUnderlyingApiMSFT", VkLayeredDriverUnderlyingApiMSFTStrings,
-     VkLayeredDriverUnderlyingApiMSFTValues, 2, ENUM_TYPE_ENUM},
-    {"VkPhysicalDeviceLayeredApiKHR", VkPhysicalDeviceLayeredApiKHRStrings,
-     VkPhysicalDeviceLayeredApiKHRValues, 5, ENUM_TYPE_ENUM},
-    {"VkCompressedTriangleFormatAMDX", VkCompressedTriangleFormatAMDXStrings,
-     VkCompressedTriangleFormatAMDXValues, 1, ENUM_TYPE_ENUM},
-    {"VkDepthClampModeEXT", VkDepthClampModeEXTStrings, VkDepthClampModeEXTValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkCooperativeVectorMatrixLayoutNV", VkCooperativeVectorMatrixLayoutNVStrings,
-     VkCooperativeVectorMatrixLayoutNVValues, 4, ENUM_TYPE_ENUM},
-    {"VkTensorTilingARM", VkTensorTilingARMStrings, VkTensorTilingARMValues, 7, ENUM_TYPE_ENUM},
-    {"VkDataGraphPipelinePropertyARM", VkDataGraphPipelinePropertyARMStrings,
-     VkDataGraphPipelinePropertyARMValues, 4, ENUM_TYPE_ENUM},
-    {"VkDataGraphPipelineSessionBindPointARM", VkDataGraphPipelineSessionBindPointARMStrings,
-     VkDataGraphPipelineSessionBindPointARMValues, 3, ENUM_TYPE_ENUM},
+     VkPartitionedAccelerationStructureOpTypeNVValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPartitionedAccelerationStructureOpTypeNVValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkAntiLagModeAMD", "VK_ANTI_LAG_MODE_", VkAntiLagModeAMDStrings, VkAntiLagModeAMDValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkAntiLagModeAMDValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkAntiLagStageAMD", "VK_ANTI_LAG_STAGE_", VkAntiLagStageAMDStrings, VkAntiLagStageAMDValues,
+     2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkAntiLagStageAMDValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkDisplacementMicromapFormatNV", "VK_DISPLACEMENT_MICROMAP_FORMAT_",
+     VkDisplacementMicromapFormatNVStrings, VkDisplacementMicromapFormatNVValues, 3, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDisplacementMicromapFormatNVValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkShaderCodeTypeEXT", "VK_SHADER_CODE_TYPE_", VkShaderCodeTypeEXTStrings,
+     VkShaderCodeTypeEXTValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkShaderCodeTypeEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkScopeKHR", "VK_SCOPE_", VkScopeKHRStrings, VkScopeKHRValues, 8, ENUM_TYPE_ENUM, NULL, 0,
+     NULL, 0, VkScopeKHRValueIndices, 6, NULL, NULL, 0, NULL, 0},
+    {"VkComponentTypeKHR", "VK_COMPONENT_TYPE_", VkComponentTypeKHRStrings,
+     VkComponentTypeKHRValues, 34, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkComponentTypeKHRValueIndices,
+     11, VkComponentTypeKHRSortedValues, VkComponentTypeKHRSortedIndices, 10, NULL, 0},
+    {"VkCubicFilterWeightsQCOM", "VK_CUBIC_FILTER_WEIGHTS_", VkCubicFilterWeightsQCOMStrings,
+     VkCubicFilterWeightsQCOMValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkCubicFilterWeightsQCOMValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkBlockMatchWindowCompareModeQCOM", "VK_BLOCK_MATCH_WINDOW_COMPARE_MODE_",
+     VkBlockMatchWindowCompareModeQCOMStrings, VkBlockMatchWindowCompareModeQCOMValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkBlockMatchWindowCompareModeQCOMValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkLayeredDriverUnderlyingApiMSFT", "VK_LAYERED_DRIVER_UNDERLYING_API_",
+     VkLayeredDriverUnderlyingApiMSFTStrings, VkLayeredDriverUnderlyingApiMSFTValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkLayeredDriverUnderlyingApiMSFTValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
+    {"VkPhysicalDeviceLayeredApiKHR", "VK_PHYSICAL_DEVICE_LAYERED_API_",
+     VkPhysicalDeviceLayeredApiKHRStrings, VkPhysicalDeviceLayeredApiKHRValues, 5, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkPhysicalDeviceLayeredApiKHRValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkCompressedTriangleFormatAMDX", "VK_COMPRESSED_TRIANGLE_FORMAT_",
+     VkCompressedTriangleFormatAMDXStrings, VkCompressedTriangleFormatAMDXValues, 1, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkCompressedTriangleFormatAMDXValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkDepthClampModeEXT", "VK_DEPTH_CLAMP_MODE_", VkDepthClampModeEXTStrings,
+     VkDepthClampModeEXTValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDepthClampModeEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkCooperativeVectorMatrixLayoutNV", "VK_COOPERATIVE_VECTOR_MATRIX_LAYOUT_",
+     VkCooperativeVectorMatrixLayoutNVStrings, VkCooperativeVectorMatrixLayoutNVValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkCooperativeVectorMatrixLayoutNVValueIndices, 4, NULL, NULL,
+     0, NULL, 0},
+    {"VkTensorTilingARM", "VK_TENSOR_TILING_", VkTensorTilingARMStrings, VkTensorTilingARMValues, 7,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkTensorTilingARMValueIndices, 2,
+     VkTensorTilingARMSortedValues, VkTensorTilingARMSortedIndices, 5, NULL, 0},
+    {"VkDataGraphPipelinePropertyARM", "VK_DATA_GRAPH_PIPELINE_PROPERTY_",
+     VkDataGraphPipelinePropertyARMStrings, VkDataGraphPipelinePropertyARMValues, 4, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDataGraphPipelinePropertyARMValueIndices, 2,
+     VkDataGraphPipelinePropertyARMSortedValues, VkDataGraphPipelinePropertyARMSortedIndices, 2,
+     NULL, 0},
+    {"VkDataGraphPipelineSessionBindPointARM", "VK_DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_",
+     VkDataGraphPipelineSessionBindPointARMStrings, VkDataGraphPipelineSessionBindPointARMValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDataGraphPipelineSessionBindPointARMValueIndices, 1,
+     VkDataGraphPipelineSessionBindPointARMSortedValues,
+     VkDataGraphPipelineSessionBindPointARMSortedIndices, 2, NULL, 0},
     {"VkDataGraphPipelineSessionBindPointTypeARM",
+     "VK_DATA_GRAPH_PIPELINE_SESSION_BIND_POINT_TYPE_",
      VkDataGraphPipelineSessionBindPointTypeARMStrings,
-     VkDataGraphPipelineSessionBindPointTypeARMValues, 1, ENUM_TYPE_ENUM},
+     VkDataGraphPipelineSessionBindPointTypeARMValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDataGraphPipelineSessionBindPointTypeARMValueIndices, 1, NULL, NULL, 0, NULL, 0},
     {"VkPhysicalDeviceDataGraphProcessingEngineTypeARM",
+     "VK_PHYSICAL_DEVICE_DATA_GRAPH_PROCESSING_ENGINE_TYPE_",
      VkPhysicalDeviceDataGraphProcessingEngineTypeARMStrings,
-     VkPhysicalDeviceDataGraphProcessingEngineTypeARMValues, 3, ENUM_TYPE_ENUM},
-    {"VkPhysicalDeviceDataGraphOperationTypeARM", VkPhysicalDeviceDataGraphOperationTypeARMStrings,
-     VkPhysicalDeviceDataGraphOperationTypeARMValues, 4, ENUM_TYPE_ENUM},
-    {"VkDataGraphModelCacheTypeQCOM", VkDataGraphModelCacheTypeQCOMStrings,
-     VkDataGraphModelCacheTypeQCOMValues, 1, ENUM_TYPE_ENUM},
-    {"VkPerfHintTypeQCOM", VkPerfHintTypeQCOMStrings, VkPerfHintTypeQCOMValues, 4, ENUM_TYPE_ENUM},
-    {"VkDescriptorMappingSourceEXT", VkDescriptorMappingSourceEXTStrings,
-     VkDescriptorMappingSourceEXTValues, 11, ENUM_TYPE_ENUM},
-    {"VkGpaPerfBlockAMD", VkGpaPerfBlockAMDStrings, VkGpaPerfBlockAMDValues, 59, ENUM_TYPE_ENUM},
-    {"VkGpaSampleTypeAMD", VkGpaSampleTypeAMDStrings, VkGpaSampleTypeAMDValues, 3, ENUM_TYPE_ENUM},
-    {"VkGpaDeviceClockModeAMD", VkGpaDeviceClockModeAMDStrings, VkGpaDeviceClockModeAMDValues, 6,
-     ENUM_TYPE_ENUM},
-    {"VkDataGraphTOSALevelARM", VkDataGraphTOSALevelARMStrings, VkDataGraphTOSALevelARMValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkDataGraphOpticalFlowPerformanceLevelARM", VkDataGraphOpticalFlowPerformanceLevelARMStrings,
-     VkDataGraphOpticalFlowPerformanceLevelARMValues, 4, ENUM_TYPE_ENUM},
-    {"VkDataGraphPipelineNodeConnectionTypeARM", VkDataGraphPipelineNodeConnectionTypeARMStrings,
-     VkDataGraphPipelineNodeConnectionTypeARMValues, 5, ENUM_TYPE_ENUM},
-    {"VkDataGraphPipelineNodeTypeARM", VkDataGraphPipelineNodeTypeARMStrings,
-     VkDataGraphPipelineNodeTypeARMValues, 1, ENUM_TYPE_ENUM},
-    {"VkNeuralAcceleratorStatisticsModeARM", VkNeuralAcceleratorStatisticsModeARMStrings,
-     VkNeuralAcceleratorStatisticsModeARMValues, 3, ENUM_TYPE_ENUM},
-    {"VkThrottleHintTypeSEC", VkThrottleHintTypeSECStrings, VkThrottleHintTypeSECValues, 3,
-     ENUM_TYPE_ENUM},
-    {"VkColorSpaceKHR", VkColorSpaceKHRStrings, VkColorSpaceKHRValues, 18, ENUM_TYPE_ENUM},
-    {"VkPresentModeKHR", VkPresentModeKHRStrings, VkPresentModeKHRValues, 8, ENUM_TYPE_ENUM},
-    {"VkDisplaySurfaceStereoTypeNV", VkDisplaySurfaceStereoTypeNVStrings,
-     VkDisplaySurfaceStereoTypeNVValues, 4, ENUM_TYPE_ENUM},
-    {"VkDebugReportObjectTypeEXT", VkDebugReportObjectTypeEXTStrings,
-     VkDebugReportObjectTypeEXTValues, 50, ENUM_TYPE_ENUM},
-    {"VkDeviceMemoryReportEventTypeEXT", VkDeviceMemoryReportEventTypeEXTStrings,
-     VkDeviceMemoryReportEventTypeEXTValues, 5, ENUM_TYPE_ENUM},
-    {"VkRasterizationOrderAMD", VkRasterizationOrderAMDStrings, VkRasterizationOrderAMDValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkValidationCheckEXT", VkValidationCheckEXTStrings, VkValidationCheckEXTValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkValidationFeatureEnableEXT", VkValidationFeatureEnableEXTStrings,
-     VkValidationFeatureEnableEXTValues, 5, ENUM_TYPE_ENUM},
-    {"VkValidationFeatureDisableEXT", VkValidationFeatureDisableEXTStrings,
-     VkValidationFeatureDisableEXTValues, 8, ENUM_TYPE_ENUM},
-    {"VkDisplayPowerStateEXT", VkDisplayPowerStateEXTStrings, VkDisplayPowerStateEXTValues, 3,
-     ENUM_TYPE_ENUM},
-    {"VkDeviceEventTypeEXT", VkDeviceEventTypeEXTStrings, VkDeviceEventTypeEXTValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkDisplayEventTypeEXT", VkDisplayEventTypeEXTStrings, VkDisplayEventTypeEXTValues, 1,
-     ENUM_TYPE_ENUM},
-    {"VkTessellationDomainOrigin", VkTessellationDomainOriginStrings,
-     VkTessellationDomainOriginValues, 4, ENUM_TYPE_ENUM},
-    {"VkSamplerYcbcrModelConversion", VkSamplerYcbcrModelConversionStrings,
-     VkSamplerYcbcrModelConversionValues, 10, ENUM_TYPE_ENUM},
-    {"VkSamplerYcbcrRange", VkSamplerYcbcrRangeStrings, VkSamplerYcbcrRangeValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkChromaLocation", VkChromaLocationStrings, VkChromaLocationValues, 4, ENUM_TYPE_ENUM},
-    {"VkSamplerReductionMode", VkSamplerReductionModeStrings, VkSamplerReductionModeValues, 7,
-     ENUM_TYPE_ENUM},
-    {"VkBlendOverlapEXT", VkBlendOverlapEXTStrings, VkBlendOverlapEXTValues, 3, ENUM_TYPE_ENUM},
-    {"VkFullScreenExclusiveEXT", VkFullScreenExclusiveEXTStrings, VkFullScreenExclusiveEXTValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkShaderFloatControlsIndependence", VkShaderFloatControlsIndependenceStrings,
-     VkShaderFloatControlsIndependenceValues, 6, ENUM_TYPE_ENUM},
-    {"VkFragmentShadingRateCombinerOpKHR", VkFragmentShadingRateCombinerOpKHRStrings,
-     VkFragmentShadingRateCombinerOpKHRValues, 5, ENUM_TYPE_ENUM},
-    {"VkOpticalFlowPerformanceLevelNV", VkOpticalFlowPerformanceLevelNVStrings,
-     VkOpticalFlowPerformanceLevelNVValues, 4, ENUM_TYPE_ENUM},
-    {"VkOpticalFlowSessionBindingPointNV", VkOpticalFlowSessionBindingPointNVStrings,
-     VkOpticalFlowSessionBindingPointNVValues, 9, ENUM_TYPE_ENUM},
-    {"VkDeviceFaultAddressTypeKHR", VkDeviceFaultAddressTypeKHRStrings,
-     VkDeviceFaultAddressTypeKHRValues, 14, ENUM_TYPE_ENUM},
-    {"VkLayerSettingTypeEXT", VkLayerSettingTypeEXTStrings, VkLayerSettingTypeEXTValues, 8,
-     ENUM_TYPE_ENUM},
-    {"VkLatencyMarkerNV", VkLatencyMarkerNVStrings, VkLatencyMarkerNVValues, 12, ENUM_TYPE_ENUM},
-    {"VkOutOfBandQueueTypeNV", VkOutOfBandQueueTypeNVStrings, VkOutOfBandQueueTypeNVValues, 2,
-     ENUM_TYPE_ENUM},
-    {"VkVendorId", VkVendorIdStrings, VkVendorIdValues, 9, ENUM_TYPE_ENUM},
-    {"VkDriverId", VkDriverIdStrings, VkDriverIdValues, 44, ENUM_TYPE_ENUM},
-    {"VkShadingRatePaletteEntryNV", VkShadingRatePaletteEntryNVStrings,
-     VkShadingRatePaletteEntryNVValues, 12, ENUM_TYPE_ENUM},
-    {"VkCoarseSampleOrderTypeNV", VkCoarseSampleOrderTypeNVStrings, VkCoarseSampleOrderTypeNVValues,
-     4, ENUM_TYPE_ENUM},
-    {"VkPipelineExecutableStatisticFormatKHR", VkPipelineExecutableStatisticFormatKHRStrings,
-     VkPipelineExecutableStatisticFormatKHRValues, 4, ENUM_TYPE_ENUM},
-    {"VkQueryResultStatusKHR", VkQueryResultStatusKHRStrings, VkQueryResultStatusKHRValues, 4,
-     ENUM_TYPE_ENUM},
-    {"VkVideoEncodeTuningModeKHR", VkVideoEncodeTuningModeKHRStrings,
-     VkVideoEncodeTuningModeKHRValues, 5, ENUM_TYPE_ENUM},
-    {"VkVideoEncodeAV1PredictionModeKHR", VkVideoEncodeAV1PredictionModeKHRStrings,
-     VkVideoEncodeAV1PredictionModeKHRValues, 4, ENUM_TYPE_ENUM},
-    {"VkVideoEncodeAV1RateControlGroupKHR", VkVideoEncodeAV1RateControlGroupKHRStrings,
-     VkVideoEncodeAV1RateControlGroupKHRValues, 3, ENUM_TYPE_ENUM},
-    {"VkDefaultVertexAttributeValueKHR", VkDefaultVertexAttributeValueKHRStrings,
-     VkDefaultVertexAttributeValueKHRValues, 2, ENUM_TYPE_ENUM},
+     VkPhysicalDeviceDataGraphProcessingEngineTypeARMValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPhysicalDeviceDataGraphProcessingEngineTypeARMValueIndices, 1,
+     VkPhysicalDeviceDataGraphProcessingEngineTypeARMSortedValues,
+     VkPhysicalDeviceDataGraphProcessingEngineTypeARMSortedIndices, 2, NULL, 0},
+    {"VkPhysicalDeviceDataGraphOperationTypeARM", "VK_PHYSICAL_DEVICE_DATA_GRAPH_OPERATION_TYPE_",
+     VkPhysicalDeviceDataGraphOperationTypeARMStrings,
+     VkPhysicalDeviceDataGraphOperationTypeARMValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkPhysicalDeviceDataGraphOperationTypeARMValueIndices, 1,
+     VkPhysicalDeviceDataGraphOperationTypeARMSortedValues,
+     VkPhysicalDeviceDataGraphOperationTypeARMSortedIndices, 3, NULL, 0},
+    {"VkDataGraphModelCacheTypeQCOM", "VK_DATA_GRAPH_MODEL_CACHE_TYPE_",
+     VkDataGraphModelCacheTypeQCOMStrings, VkDataGraphModelCacheTypeQCOMValues, 1, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDataGraphModelCacheTypeQCOMValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkPerfHintTypeQCOM", "VK_PERF_HINT_TYPE_", VkPerfHintTypeQCOMStrings,
+     VkPerfHintTypeQCOMValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPerfHintTypeQCOMValueIndices,
+     4, NULL, NULL, 0, NULL, 0},
+    {"VkDescriptorMappingSourceEXT", "VK_DESCRIPTOR_MAPPING_SOURCE_",
+     VkDescriptorMappingSourceEXTStrings, VkDescriptorMappingSourceEXTValues, 11, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDescriptorMappingSourceEXTValueIndices, 11, NULL, NULL, 0, NULL, 0},
+    {"VkGpaPerfBlockAMD", "VK_GPA_PERF_BLOCK_", VkGpaPerfBlockAMDStrings, VkGpaPerfBlockAMDValues,
+     59, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkGpaPerfBlockAMDValueIndices, 57, NULL, NULL, 0, NULL,
+     0},
+    {"VkGpaSampleTypeAMD", "VK_GPA_SAMPLE_TYPE_", VkGpaSampleTypeAMDStrings,
+     VkGpaSampleTypeAMDValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkGpaSampleTypeAMDValueIndices,
+     3, NULL, NULL, 0, NULL, 0},
+    {"VkGpaDeviceClockModeAMD", "VK_GPA_DEVICE_CLOCK_MODE_", VkGpaDeviceClockModeAMDStrings,
+     VkGpaDeviceClockModeAMDValues, 6, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkGpaDeviceClockModeAMDValueIndices, 6, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphTOSALevelARM", "VK_DATA_GRAPH_T_O_S_A_LEVEL_", VkDataGraphTOSALevelARMStrings,
+     VkDataGraphTOSALevelARMValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDataGraphTOSALevelARMValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphOpticalFlowPerformanceLevelARM", "VK_DATA_GRAPH_OPTICAL_FLOW_PERFORMANCE_LEVEL_",
+     VkDataGraphOpticalFlowPerformanceLevelARMStrings,
+     VkDataGraphOpticalFlowPerformanceLevelARMValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDataGraphOpticalFlowPerformanceLevelARMValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkDataGraphPipelineNodeConnectionTypeARM", "VK_DATA_GRAPH_PIPELINE_NODE_CONNECTION_TYPE_",
+     VkDataGraphPipelineNodeConnectionTypeARMStrings,
+     VkDataGraphPipelineNodeConnectionTypeARMValues, 5, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, NULL, 0,
+     VkDataGraphPipelineNodeConnectionTypeARMSortedValues,
+     VkDataGraphPipelineNodeConnectionTypeARMSortedIndices, 5, NULL, 0},
+    {"VkDataGraphPipelineNodeTypeARM", "VK_DATA_GRAPH_PIPELINE_NODE_TYPE_",
+     VkDataGraphPipelineNodeTypeARMStrings, VkDataGraphPipelineNodeTypeARMValues, 1, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, NULL, 0, VkDataGraphPipelineNodeTypeARMSortedValues,
+     VkDataGraphPipelineNodeTypeARMSortedIndices, 1, NULL, 0},
+    {"VkNeuralAcceleratorStatisticsModeARM", "VK_NEURAL_ACCELERATOR_STATISTICS_MODE_",
+     VkNeuralAcceleratorStatisticsModeARMStrings, VkNeuralAcceleratorStatisticsModeARMValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkNeuralAcceleratorStatisticsModeARMValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkThrottleHintTypeSEC", "VK_THROTTLE_HINT_TYPE_", VkThrottleHintTypeSECStrings,
+     VkThrottleHintTypeSECValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkThrottleHintTypeSECValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkColorSpaceKHR", "VK_COLOR_SPACE_", VkColorSpaceKHRStrings, VkColorSpaceKHRValues, 18,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkColorSpaceKHRValueIndices, 1, VkColorSpaceKHRSortedValues,
+     VkColorSpaceKHRSortedIndices, 15, NULL, 0},
+    {"VkPresentModeKHR", "VK_PRESENT_MODE_", VkPresentModeKHRStrings, VkPresentModeKHRValues, 8,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPresentModeKHRValueIndices, 4,
+     VkPresentModeKHRSortedValues, VkPresentModeKHRSortedIndices, 3, NULL, 0},
+    {"VkDisplaySurfaceStereoTypeNV", "VK_DISPLAY_SURFACE_STEREO_TYPE_",
+     VkDisplaySurfaceStereoTypeNVStrings, VkDisplaySurfaceStereoTypeNVValues, 4, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDisplaySurfaceStereoTypeNVValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkDebugReportObjectTypeEXT", "VK_DEBUG_REPORT_OBJECT_TYPE_",
+     VkDebugReportObjectTypeEXTStrings, VkDebugReportObjectTypeEXTValues, 50, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkDebugReportObjectTypeEXTValueIndices, 34, VkDebugReportObjectTypeEXTSortedValues,
+     VkDebugReportObjectTypeEXTSortedIndices, 9, NULL, 0},
+    {"VkDeviceMemoryReportEventTypeEXT", "VK_DEVICE_MEMORY_REPORT_EVENT_TYPE_",
+     VkDeviceMemoryReportEventTypeEXTStrings, VkDeviceMemoryReportEventTypeEXTValues, 5,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDeviceMemoryReportEventTypeEXTValueIndices, 5, NULL, NULL,
+     0, NULL, 0},
+    {"VkRasterizationOrderAMD", "VK_RASTERIZATION_ORDER_", VkRasterizationOrderAMDStrings,
+     VkRasterizationOrderAMDValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkRasterizationOrderAMDValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkValidationCheckEXT", "VK_VALIDATION_CHECK_", VkValidationCheckEXTStrings,
+     VkValidationCheckEXTValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkValidationCheckEXTValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkValidationFeatureEnableEXT", "VK_VALIDATION_FEATURE_ENABLE_",
+     VkValidationFeatureEnableEXTStrings, VkValidationFeatureEnableEXTValues, 5, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkValidationFeatureEnableEXTValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkValidationFeatureDisableEXT", "VK_VALIDATION_FEATURE_DISABLE_",
+     VkValidationFeatureDisableEXTStrings, VkValidationFeatureDisableEXTValues, 8, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkValidationFeatureDisableEXTValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkDisplayPowerStateEXT", "VK_DISPLAY_POWER_STATE_", VkDisplayPowerStateEXTStrings,
+     VkDisplayPowerStateEXTValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDisplayPowerStateEXTValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkDeviceEventTypeEXT", "VK_DEVICE_EVENT_TYPE_", VkDeviceEventTypeEXTStrings,
+     VkDeviceEventTypeEXTValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDeviceEventTypeEXTValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkDisplayEventTypeEXT", "VK_DISPLAY_EVENT_TYPE_", VkDisplayEventTypeEXTStrings,
+     VkDisplayEventTypeEXTValues, 1, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkDisplayEventTypeEXTValueIndices, 1, NULL, NULL, 0, NULL, 0},
+    {"VkTessellationDomainOrigin", "VK_TESSELLATION_DOMAIN_ORIGIN_",
+     VkTessellationDomainOriginStrings, VkTessellationDomainOriginValues, 4, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkTessellationDomainOriginValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkSamplerYcbcrModelConversion", "VK_SAMPLER_YCBCR_MODEL_CONVERSION_",
+     VkSamplerYcbcrModelConversionStrings, VkSamplerYcbcrModelConversionValues, 10, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkSamplerYcbcrModelConversionValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkSamplerYcbcrRange", "VK_SAMPLER_YCBCR_RANGE_", VkSamplerYcbcrRangeStrings,
+     VkSamplerYcbcrRangeValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSamplerYcbcrRangeValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkChromaLocation", "VK_CHROMA_LOCATION_", VkChromaLocationStrings, VkChromaLocationValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkChromaLocationValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkSamplerReductionMode", "VK_SAMPLER_REDUCTION_MODE_", VkSamplerReductionModeStrings,
+     VkSamplerReductionModeValues, 7, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkSamplerReductionModeValueIndices, 3, VkSamplerReductionModeSortedValues,
+     VkSamplerReductionModeSortedIndices, 1, NULL, 0},
+    {"VkBlendOverlapEXT", "VK_BLEND_OVERLAP_", VkBlendOverlapEXTStrings, VkBlendOverlapEXTValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkBlendOverlapEXTValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkFullScreenExclusiveEXT", "VK_FULL_SCREEN_EXCLUSIVE_", VkFullScreenExclusiveEXTStrings,
+     VkFullScreenExclusiveEXTValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkFullScreenExclusiveEXTValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkShaderFloatControlsIndependence", "VK_SHADER_FLOAT_CONTROLS_INDEPENDENCE_",
+     VkShaderFloatControlsIndependenceStrings, VkShaderFloatControlsIndependenceValues, 6,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkShaderFloatControlsIndependenceValueIndices, 3, NULL, NULL,
+     0, NULL, 0},
+    {"VkFragmentShadingRateCombinerOpKHR", "VK_FRAGMENT_SHADING_RATE_COMBINER_OP_",
+     VkFragmentShadingRateCombinerOpKHRStrings, VkFragmentShadingRateCombinerOpKHRValues, 5,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkFragmentShadingRateCombinerOpKHRValueIndices, 5, NULL,
+     NULL, 0, NULL, 0},
+    {"VkOpticalFlowPerformanceLevelNV", "VK_OPTICAL_FLOW_PERFORMANCE_LEVEL_",
+     VkOpticalFlowPerformanceLevelNVStrings, VkOpticalFlowPerformanceLevelNVValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkOpticalFlowPerformanceLevelNVValueIndices, 4, NULL, NULL,
+     0, NULL, 0},
+    {"VkOpticalFlowSessionBindingPointNV", "VK_OPTICAL_FLOW_SESSION_BINDING_POINT_",
+     VkOpticalFlowSessionBindingPointNVStrings, VkOpticalFlowSessionBindingPointNVValues, 9,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkOpticalFlowSessionBindingPointNVValueIndices, 9, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDeviceFaultAddressTypeKHR", "VK_DEVICE_FAULT_ADDRESS_TYPE_",
+     VkDeviceFaultAddressTypeKHRStrings, VkDeviceFaultAddressTypeKHRValues, 14, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkDeviceFaultAddressTypeKHRValueIndices, 7, NULL, NULL, 0, NULL, 0},
+    {"VkLayerSettingTypeEXT", "VK_LAYER_SETTING_TYPE_", VkLayerSettingTypeEXTStrings,
+     VkLayerSettingTypeEXTValues, 8, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkLayerSettingTypeEXTValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkLatencyMarkerNV", "VK_LATENCY_MARKER_", VkLatencyMarkerNVStrings, VkLatencyMarkerNVValues,
+     12, ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkLatencyMarkerNVValueIndices, 12, NULL, NULL, 0, NULL,
+     0},
+    {"VkOutOfBandQueueTypeNV", "VK_OUT_OF_BAND_QUEUE_TYPE_", VkOutOfBandQueueTypeNVStrings,
+     VkOutOfBandQueueTypeNVValues, 2, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkOutOfBandQueueTypeNVValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkVendorId", "VK_VENDOR_ID_", VkVendorIdStrings, VkVendorIdValues, 9, ENUM_TYPE_ENUM, NULL, 0,
+     NULL, 0, NULL, 0, VkVendorIdSortedValues, VkVendorIdSortedIndices, 9, NULL, 0},
+    {"VkDriverId", "VK_DRIVER_ID_", VkDriverIdStrings, VkDriverIdValues, 44, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkDriverIdValueIndices, 31, NULL, NULL, 0, NULL, 0},
+    {"VkShadingRatePaletteEntryNV", "VK_SHADING_RATE_PALETTE_ENTRY_",
+     VkShadingRatePaletteEntryNVStrings, VkShadingRatePaletteEntryNVValues, 12, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkShadingRatePaletteEntryNVValueIndices, 12, NULL, NULL, 0, NULL, 0},
+    {"VkCoarseSampleOrderTypeNV", "VK_COARSE_SAMPLE_ORDER_TYPE_", VkCoarseSampleOrderTypeNVStrings,
+     VkCoarseSampleOrderTypeNVValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkCoarseSampleOrderTypeNVValueIndices, 4, NULL, NULL, 0, NULL, 0},
+    {"VkPipelineExecutableStatisticFormatKHR", "VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_",
+     VkPipelineExecutableStatisticFormatKHRStrings, VkPipelineExecutableStatisticFormatKHRValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkPipelineExecutableStatisticFormatKHRValueIndices, 4, NULL,
+     NULL, 0, NULL, 0},
+    {"VkQueryResultStatusKHR", "VK_QUERY_RESULT_STATUS_", VkQueryResultStatusKHRStrings,
+     VkQueryResultStatusKHRValues, 4, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkQueryResultStatusKHRValueIndices, 2, VkQueryResultStatusKHRSortedValues,
+     VkQueryResultStatusKHRSortedIndices, 2, NULL, 0},
+    {"VkVideoEncodeTuningModeKHR", "VK_VIDEO_ENCODE_TUNING_MODE_",
+     VkVideoEncodeTuningModeKHRStrings, VkVideoEncodeTuningModeKHRValues, 5, ENUM_TYPE_ENUM, NULL,
+     0, NULL, 0, VkVideoEncodeTuningModeKHRValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeAV1PredictionModeKHR", "VK_VIDEO_ENCODE_A_V_1_PREDICTION_MODE_",
+     VkVideoEncodeAV1PredictionModeKHRStrings, VkVideoEncodeAV1PredictionModeKHRValues, 4,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkVideoEncodeAV1PredictionModeKHRValueIndices, 4, NULL, NULL,
+     0, NULL, 0},
+    {"VkVideoEncodeAV1RateControlGroupKHR", "VK_VIDEO_ENCODE_A_V_1_RATE_CONTROL_GROUP_",
+     VkVideoEncodeAV1RateControlGroupKHRStrings, VkVideoEncodeAV1RateControlGroupKHRValues, 3,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkVideoEncodeAV1RateControlGroupKHRValueIndices, 3, NULL,
+     NULL, 0, NULL, 0},
+    {"VkDefaultVertexAttributeValueKHR", "VK_DEFAULT_VERTEX_ATTRIBUTE_VALUE_",
+     VkDefaultVertexAttributeValueKHRStrings, VkDefaultVertexAttributeValueKHRValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkDefaultVertexAttributeValueKHRValueIndices, 2, NULL, NULL,
+     0, NULL, 0},
     {"VkAccelerationStructureMotionInstanceTypeNV",
+     "VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_",
      VkAccelerationStructureMotionInstanceTypeNVStrings,
-     VkAccelerationStructureMotionInstanceTypeNVValues, 3, ENUM_TYPE_ENUM},
-    {"VkVideoEncodeH264CapabilityFlagsEXT", VkVideoEncodeH264CapabilityFlagsEXTStrings,
-     VkVideoEncodeH264CapabilityFlagsEXTValues, 35, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264StdFlagsEXT", VkVideoEncodeH264StdFlagsEXTStrings,
-     VkVideoEncodeH264StdFlagsEXTValues, 20, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264RateControlFlagsEXT", VkVideoEncodeH264RateControlFlagsEXTStrings,
-     VkVideoEncodeH264RateControlFlagsEXTValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265CapabilityFlagsEXT", VkVideoEncodeH265CapabilityFlagsEXTStrings,
-     VkVideoEncodeH265CapabilityFlagsEXTValues, 43, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265StdFlagsEXT", VkVideoEncodeH265StdFlagsEXTStrings,
-     VkVideoEncodeH265StdFlagsEXTValues, 21, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265RateControlFlagsEXT", VkVideoEncodeH265RateControlFlagsEXTStrings,
-     VkVideoEncodeH265RateControlFlagsEXTValues, 5, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265CtbSizeFlagsEXT", VkVideoEncodeH265CtbSizeFlagsEXTStrings,
-     VkVideoEncodeH265CtbSizeFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265TransformBlockSizeFlagsEXT",
+     VkAccelerationStructureMotionInstanceTypeNVValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkAccelerationStructureMotionInstanceTypeNVValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264CapabilityFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_CAPABILITY_",
+     VkVideoEncodeH264CapabilityFlagsEXTStrings, VkVideoEncodeH264CapabilityFlagsEXTValues, 35,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264CapabilityFlagsEXTBitIndices, 26, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264StdFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_STD_",
+     VkVideoEncodeH264StdFlagsEXTStrings, VkVideoEncodeH264StdFlagsEXTValues, 20, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH264StdFlagsEXTBitIndices, 21, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264RateControlFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_RATE_CONTROL_",
+     VkVideoEncodeH264RateControlFlagsEXTStrings, VkVideoEncodeH264RateControlFlagsEXTValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264RateControlFlagsEXTBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265CapabilityFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_CAPABILITY_",
+     VkVideoEncodeH265CapabilityFlagsEXTStrings, VkVideoEncodeH265CapabilityFlagsEXTValues, 43,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265CapabilityFlagsEXTBitIndices, 27, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265StdFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_STD_",
+     VkVideoEncodeH265StdFlagsEXTStrings, VkVideoEncodeH265StdFlagsEXTValues, 21, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH265StdFlagsEXTBitIndices, 21, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265RateControlFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_RATE_CONTROL_",
+     VkVideoEncodeH265RateControlFlagsEXTStrings, VkVideoEncodeH265RateControlFlagsEXTValues, 5,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265RateControlFlagsEXTBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265CtbSizeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_CTB_SIZE_",
+     VkVideoEncodeH265CtbSizeFlagsEXTStrings, VkVideoEncodeH265CtbSizeFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265CtbSizeFlagsEXTBitIndices, 3, NULL, 0, NULL, 0, NULL, NULL,
+     0, NULL, 0},
+    {"VkVideoEncodeH265TransformBlockSizeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_TRANSFORM_BLOCK_SIZE_",
      VkVideoEncodeH265TransformBlockSizeFlagsEXTStrings,
-     VkVideoEncodeH265TransformBlockSizeFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264RateControlStructureEXT", VkVideoEncodeH264RateControlStructureEXTStrings,
-     VkVideoEncodeH264RateControlStructureEXTValues, 3, ENUM_TYPE_ENUM},
-    {"VkVideoEncodeH265RateControlStructureEXT", VkVideoEncodeH265RateControlStructureEXTStrings,
-     VkVideoEncodeH265RateControlStructureEXTValues, 3, ENUM_TYPE_ENUM},
-    {"VkVideoEncodeH264InputModeFlagsEXT", VkVideoEncodeH264InputModeFlagsEXTStrings,
-     VkVideoEncodeH264InputModeFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264OutputModeFlagsEXT", VkVideoEncodeH264OutputModeFlagsEXTStrings,
-     VkVideoEncodeH264OutputModeFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265InputModeFlagsEXT", VkVideoEncodeH265InputModeFlagsEXTStrings,
-     VkVideoEncodeH265InputModeFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265OutputModeFlagsEXT", VkVideoEncodeH265OutputModeFlagsEXTStrings,
-     VkVideoEncodeH265OutputModeFlagsEXTValues, 4, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeH264PictureLayoutFlagsEXT", VkVideoDecodeH264PictureLayoutFlagsEXTStrings,
-     VkVideoDecodeH264PictureLayoutFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoCodingQualityPresetFlagsKHR", VkVideoCodingQualityPresetFlagsKHRStrings,
-     VkVideoCodingQualityPresetFlagsKHRValues, 4, ENUM_TYPE_FLAG32},
+     VkVideoEncodeH265TransformBlockSizeFlagsEXTValues, 4, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH265TransformBlockSizeFlagsEXTBitIndices, 4, NULL, 0, NULL, 0, NULL, NULL, 0,
+     NULL, 0},
+    {"VkVideoEncodeH264RateControlStructureEXT", "VK_VIDEO_ENCODE_H_2_6_4_RATE_CONTROL_STRUCTURE_",
+     VkVideoEncodeH264RateControlStructureEXTStrings,
+     VkVideoEncodeH264RateControlStructureEXTValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkVideoEncodeH264RateControlStructureEXTValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265RateControlStructureEXT", "VK_VIDEO_ENCODE_H_2_6_5_RATE_CONTROL_STRUCTURE_",
+     VkVideoEncodeH265RateControlStructureEXTStrings,
+     VkVideoEncodeH265RateControlStructureEXTValues, 3, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkVideoEncodeH265RateControlStructureEXTValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264InputModeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_INPUT_MODE_",
+     VkVideoEncodeH264InputModeFlagsEXTStrings, VkVideoEncodeH264InputModeFlagsEXTValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264InputModeFlagsEXTBitIndices, 3, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264OutputModeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_OUTPUT_MODE_",
+     VkVideoEncodeH264OutputModeFlagsEXTStrings, VkVideoEncodeH264OutputModeFlagsEXTValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264OutputModeFlagsEXTBitIndices, 3, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265InputModeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_INPUT_MODE_",
+     VkVideoEncodeH265InputModeFlagsEXTStrings, VkVideoEncodeH265InputModeFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265InputModeFlagsEXTBitIndices, 3, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265OutputModeFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_OUTPUT_MODE_",
+     VkVideoEncodeH265OutputModeFlagsEXTStrings, VkVideoEncodeH265OutputModeFlagsEXTValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH265OutputModeFlagsEXTBitIndices, 3, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkVideoDecodeH264PictureLayoutFlagsEXT", "VK_VIDEO_DECODE_H_2_6_4_PICTURE_LAYOUT_",
+     VkVideoDecodeH264PictureLayoutFlagsEXTStrings, VkVideoDecodeH264PictureLayoutFlagsEXTValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoDecodeH264PictureLayoutFlagsEXTBitIndices, 2,
+     VkVideoDecodeH264PictureLayoutFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoCodingQualityPresetFlagsKHR", "VK_VIDEO_CODING_QUALITY_PRESET_",
+     VkVideoCodingQualityPresetFlagsKHRStrings, VkVideoCodingQualityPresetFlagsKHRValues, 4,
+     ENUM_TYPE_FLAG32, VkVideoCodingQualityPresetFlagsKHRBitIndices, 3,
+     VkVideoCodingQualityPresetFlagsKHRCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
     {"VkVideoEncodeH264RateControlStructureFlagsEXT",
+     "VK_VIDEO_ENCODE_H_2_6_4_RATE_CONTROL_STRUCTURE_",
      VkVideoEncodeH264RateControlStructureFlagsEXTStrings,
-     VkVideoEncodeH264RateControlStructureFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
+     VkVideoEncodeH264RateControlStructureFlagsEXTValues, 3, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH264RateControlStructureFlagsEXTBitIndices, 2,
+     VkVideoEncodeH264RateControlStructureFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL,
+     0},
     {"VkVideoEncodeH265RateControlStructureFlagsEXT",
+     "VK_VIDEO_ENCODE_H_2_6_5_RATE_CONTROL_STRUCTURE_",
      VkVideoEncodeH265RateControlStructureFlagsEXTStrings,
-     VkVideoEncodeH265RateControlStructureFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeH264CreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeH265CreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264CreateFlagsEXT", VkVideoEncodeH264CreateFlagsEXTStrings,
-     VkVideoEncodeH264CreateFlagsEXTValues, 2, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH265CreateFlagsEXT", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkVideoCapabilitiesFlagsKHR", VkVideoCapabilitiesFlagsKHRStrings,
-     VkVideoCapabilitiesFlagsKHRValues, 2, ENUM_TYPE_FLAG32},
-    {"VkVideoDecodeH264FieldLayoutFlagsEXT", VkVideoDecodeH264FieldLayoutFlagsEXTStrings,
-     VkVideoDecodeH264FieldLayoutFlagsEXTValues, 3, ENUM_TYPE_FLAG32},
-    {"VkVideoEncodeH264CapabilitiesFlagsEXT", VkVideoEncodeH264CapabilitiesFlagsEXTStrings,
-     VkVideoEncodeH264CapabilitiesFlagsEXTValues, 11, ENUM_TYPE_FLAG32},
+     VkVideoEncodeH265RateControlStructureFlagsEXTValues, 3, ENUM_TYPE_FLAG32,
+     VkVideoEncodeH265RateControlStructureFlagsEXTBitIndices, 2,
+     VkVideoEncodeH265RateControlStructureFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL,
+     0},
+    {"VkVideoDecodeH264CreateFlagsEXT", "VK_VIDEO_DECODE_H_2_6_4_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeH265CreateFlagsEXT", "VK_VIDEO_DECODE_H_2_6_5_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264CreateFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_CREATE_",
+     VkVideoEncodeH264CreateFlagsEXTStrings, VkVideoEncodeH264CreateFlagsEXTValues, 2,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264CreateFlagsEXTBitIndices, 1,
+     VkVideoEncodeH264CreateFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH265CreateFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_5_CREATE_", NULL, NULL, 0,
+     ENUM_TYPE_FLAG32, NULL, 0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoCapabilitiesFlagsKHR", "VK_VIDEO_CAPABILITIES_", VkVideoCapabilitiesFlagsKHRStrings,
+     VkVideoCapabilitiesFlagsKHRValues, 2, ENUM_TYPE_FLAG32, VkVideoCapabilitiesFlagsKHRBitIndices,
+     2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoDecodeH264FieldLayoutFlagsEXT", "VK_VIDEO_DECODE_H_2_6_4_FIELD_LAYOUT_",
+     VkVideoDecodeH264FieldLayoutFlagsEXTStrings, VkVideoDecodeH264FieldLayoutFlagsEXTValues, 3,
+     ENUM_TYPE_FLAG32, VkVideoDecodeH264FieldLayoutFlagsEXTBitIndices, 2,
+     VkVideoDecodeH264FieldLayoutFlagsEXTCombinedIndices, 1, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkVideoEncodeH264CapabilitiesFlagsEXT", "VK_VIDEO_ENCODE_H_2_6_4_CAPABILITIES_",
+     VkVideoEncodeH264CapabilitiesFlagsEXTStrings, VkVideoEncodeH264CapabilitiesFlagsEXTValues, 11,
+     ENUM_TYPE_FLAG32, VkVideoEncodeH264CapabilitiesFlagsEXTBitIndices, 11, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
     {"VkAccelerationStructureMemoryRequirementsTypeKHR",
+     "VK_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_TYPE_",
      VkAccelerationStructureMemoryRequirementsTypeKHRStrings,
-     VkAccelerationStructureMemoryRequirementsTypeKHRValues, 6, ENUM_TYPE_ENUM},
-    {"VkIndirectCommandsLayoutUsageFlagsNVX", VkIndirectCommandsLayoutUsageFlagsNVXStrings,
-     VkIndirectCommandsLayoutUsageFlagsNVXValues, 4, ENUM_TYPE_FLAG32},
-    {"VkObjectEntryUsageFlagsNVX", VkObjectEntryUsageFlagsNVXStrings,
-     VkObjectEntryUsageFlagsNVXValues, 2, ENUM_TYPE_FLAG32},
-    {"VkIndirectCommandsTokenTypeNVX", VkIndirectCommandsTokenTypeNVXStrings,
-     VkIndirectCommandsTokenTypeNVXValues, 8, ENUM_TYPE_ENUM},
-    {"VkObjectEntryTypeNVX", VkObjectEntryTypeNVXStrings, VkObjectEntryTypeNVXValues, 5,
-     ENUM_TYPE_ENUM},
-    {"VkGeometryFlagsNVX", VkGeometryFlagsNVXStrings, VkGeometryFlagsNVXValues, 2,
-     ENUM_TYPE_FLAG32},
-    {"VkGeometryInstanceFlagsNVX", VkGeometryInstanceFlagsNVXStrings,
-     VkGeometryInstanceFlagsNVXValues, 4, ENUM_TYPE_FLAG32},
-    {"VkBuildAccelerationStructureFlagsNVX", VkBuildAccelerationStructureFlagsNVXStrings,
-     VkBuildAccelerationStructureFlagsNVXValues, 5, ENUM_TYPE_FLAG32},
-    {"VkMirSurfaceCreateFlagsKHR", NULL, NULL, 0, ENUM_TYPE_FLAG32},
-    {"VkCopyAccelerationStructureModeNVX", VkCopyAccelerationStructureModeNVXStrings,
-     VkCopyAccelerationStructureModeNVXValues, 2, ENUM_TYPE_ENUM},
-    {"VkAccelerationStructureTypeNVX", VkAccelerationStructureTypeNVXStrings,
-     VkAccelerationStructureTypeNVXValues, 2, ENUM_TYPE_ENUM},
-    {"VkGeometryTypeNVX", VkGeometryTypeNVXStrings, VkGeometryTypeNVXValues, 2, ENUM_TYPE_ENUM},
+     VkAccelerationStructureMemoryRequirementsTypeKHRValues, 6, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkAccelerationStructureMemoryRequirementsTypeKHRValueIndices, 3, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectCommandsLayoutUsageFlagsNVX", "VK_INDIRECT_COMMANDS_LAYOUT_USAGE_",
+     VkIndirectCommandsLayoutUsageFlagsNVXStrings, VkIndirectCommandsLayoutUsageFlagsNVXValues, 4,
+     ENUM_TYPE_FLAG32, VkIndirectCommandsLayoutUsageFlagsNVXBitIndices, 4, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkObjectEntryUsageFlagsNVX", "VK_OBJECT_ENTRY_USAGE_", VkObjectEntryUsageFlagsNVXStrings,
+     VkObjectEntryUsageFlagsNVXValues, 2, ENUM_TYPE_FLAG32, VkObjectEntryUsageFlagsNVXBitIndices, 2,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkIndirectCommandsTokenTypeNVX", "VK_INDIRECT_COMMANDS_TOKEN_TYPE_",
+     VkIndirectCommandsTokenTypeNVXStrings, VkIndirectCommandsTokenTypeNVXValues, 8, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkIndirectCommandsTokenTypeNVXValueIndices, 8, NULL, NULL, 0, NULL, 0},
+    {"VkObjectEntryTypeNVX", "VK_OBJECT_ENTRY_TYPE_", VkObjectEntryTypeNVXStrings,
+     VkObjectEntryTypeNVXValues, 5, ENUM_TYPE_ENUM, NULL, 0, NULL, 0,
+     VkObjectEntryTypeNVXValueIndices, 5, NULL, NULL, 0, NULL, 0},
+    {"VkGeometryFlagsNVX", "VK_GEOMETRY_", VkGeometryFlagsNVXStrings, VkGeometryFlagsNVXValues, 2,
+     ENUM_TYPE_FLAG32, VkGeometryFlagsNVXBitIndices, 2, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkGeometryInstanceFlagsNVX", "VK_GEOMETRY_INSTANCE_", VkGeometryInstanceFlagsNVXStrings,
+     VkGeometryInstanceFlagsNVXValues, 4, ENUM_TYPE_FLAG32, VkGeometryInstanceFlagsNVXBitIndices, 4,
+     NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkBuildAccelerationStructureFlagsNVX", "VK_BUILD_ACCELERATION_STRUCTURE_",
+     VkBuildAccelerationStructureFlagsNVXStrings, VkBuildAccelerationStructureFlagsNVXValues, 5,
+     ENUM_TYPE_FLAG32, VkBuildAccelerationStructureFlagsNVXBitIndices, 5, NULL, 0, NULL, 0, NULL,
+     NULL, 0, NULL, 0},
+    {"VkMirSurfaceCreateFlagsKHR", "VK_MIR_SURFACE_CREATE_", NULL, NULL, 0, ENUM_TYPE_FLAG32, NULL,
+     0, NULL, 0, NULL, 0, NULL, NULL, 0, NULL, 0},
+    {"VkCopyAccelerationStructureModeNVX", "VK_COPY_ACCELERATION_STRUCTURE_MODE_",
+     VkCopyAccelerationStructureModeNVXStrings, VkCopyAccelerationStructureModeNVXValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkCopyAccelerationStructureModeNVXValueIndices, 2, NULL,
+     NULL, 0, NULL, 0},
+    {"VkAccelerationStructureTypeNVX", "VK_ACCELERATION_STRUCTURE_TYPE_",
+     VkAccelerationStructureTypeNVXStrings, VkAccelerationStructureTypeNVXValues, 2, ENUM_TYPE_ENUM,
+     NULL, 0, NULL, 0, VkAccelerationStructureTypeNVXValueIndices, 2, NULL, NULL, 0, NULL, 0},
+    {"VkGeometryTypeNVX", "VK_GEOMETRY_TYPE_", VkGeometryTypeNVXStrings, VkGeometryTypeNVXValues, 2,
+     ENUM_TYPE_ENUM, NULL, 0, NULL, 0, VkGeometryTypeNVXValueIndices, 2, NULL, NULL, 0, NULL, 0},
 };
 
+/**
+ * @brief Formats a character of a string being parsed to match those found in the XML spec
+ * @param ch is the character to format
+ * @return Spaces are returned as underscores, and all other characters are capitalized.
+ */
+static char formatChar(char ch) {
+  if (ch == ' ')
+    return '_';
+  return (char)toupper((unsigned char)ch);
+}
+
+/**
+ * @brief Compares the end of a string against a vendor tag of the same length
+ * @param str is a pointer to the possible vendor tag at the end of the string
+ * @param pVendor is a pointer to the vendor tag
+ * @param length is the length of the vendor tag
+ * @param formatted is whether the string is compared as formatted
+ * @return Less than, equal to, or greater than zero if the string sorts before, matches, or sorts
+ * after the vendor tag.
+ */
+static int compareVendor(char const *str, char const *pVendor, size_t length, bool formatted) {
+  for (size_t i = 0; i < length; ++i) {
+    char const ch = formatted ? formatChar(str[i]) : str[i];
+    if (ch != pVendor[i])
+      return ((unsigned char)ch < (unsigned char)pVendor[i]) ? -1 : 1;
+  }
+
+  return 0;
+}
+
+/**
+ * @brief Finds the vendor tag at the end of a string
+ * @param str is the string to check
+ * @param len is the current length of the string being used
+ * @param formatted is whether the string is compared as formatted
+ * @return Length of the longest vendor tag that the string ends with, or 0 if there is none.
+ *
+ * Vendor tags are grouped by length, so each distinct length is a single binary search.
+ */
+static size_t findVendorSuffix(char const *str, size_t len, bool formatted) {
+  for (size_t i = 0; i < cVendorGroupCount; ++i) {
+    size_t const vendorLen = cVendorGroups[i].length;
+    if (vendorLen > len)
+      continue;
+
+    char const *suffix = str + len - vendorLen;
+    size_t low = cVendorGroups[i].first;
+    size_t high = low + cVendorGroups[i].count;
+    while (low < high) {
+      size_t const mid = low + (high - low) / 2;
+      int const cmp = compareVendor(suffix, getVendor(mid), vendorLen, formatted);
+      if (cmp == 0)
+        return vendorLen;
+      if (cmp < 0)
+        high = mid;
+      else
+        low = mid + 1;
+    }
+  }
+
+  return 0;
+}
+
 /**
  * @brief Removes a vendor tag from the end of the given string view
  * @param str string to chop the vendor tag from
@@ -10667,34 +22044,60 @@ static ValueSet const cValueSets[440] = {
  * originally passed in.
  */
 static size_t stripVendor(char const *str, size_t len) {
-  for (size_t i = 0; i < cVendorCount; ++i) {
-    char const *it = cVendorList[i];
-    if (strlen(it) > len)
-      continue;
+  size_t const vendorLen = findVendorSuffix(str, len, false);
 
-    // Don't strip if it's all that's left
-    if (len == strlen(it) && strncmp(str, it, len) == 0)
-      break;
+  // Don't strip if it's all that's left
+  if (vendorLen == len)
+    return len;
 
-    if (strncmp(str + len - strlen(it), it, strlen(it)) == 0) {
-      len -= strlen(it);
-      break;
-    }
+  return len - vendorLen;
+}
+
+/**
+ * @brief Compares a string being parsed against a string from the XML spec
+ * @param pParseStr is a pointer to the string being parsed, which is compared as formatted
+ * @param pSpecStr is a pointer to the spec string, which must be at least length characters long
+ * @param length is the number of characters to compare
+ * @return True if all the formatted characters match, false otherwise.
+ *
+ * This allows parsing strings in place, without needing to copy and format them first.
+ */
+static bool formattedEquals(char const *pParseStr, char const *pSpecStr, size_t length) {
+  for (size_t i = 0; i < length; ++i) {
+    if (formatChar(pParseStr[i]) != pSpecStr[i])
+      return false;
   }
 
-  return len;
+  return true;
 }
 
 /**
- * @brief Strips '_BIT' from the end of a string, if there
- * @param str string to chop the vendor tag from
+ * @brief Removes a vendor tag from the end of the given string being parsed
+ * @param str string to chop the vendor tag from, compared as formatted
+ * @param size is the current length of the string being used
+ * @return Length of the string without the vendor tag, if it was suffixed, otherwise the size
+ * originally passed in.
+ */
+static size_t stripFormattedVendor(char const *str, size_t len) {
+  size_t const vendorLen = findVendorSuffix(str, len, true);
+
+  // Don't strip if it's all that's left
+  if (vendorLen == len)
+    return len;
+
+  return len - vendorLen;
+}
+
+/**
+ * @brief Strips '_BIT' from the end of a string being parsed, if there
+ * @param str string to chop the vendor tag from, compared as formatted
  * @param size is the current length of the string being used
  * @return Length of the string without the '_BIT'' tag, if it was suffixed, otherwise the size
  * originally passed in.
  */
 static size_t stripBit(char const *str, size_t len) {
   if (len > strlen("_BIT")) {
-    if (strncmp(str + len - strlen("_BIT"), "_BIT", strlen("_BIT")) == 0) {
+    if (formattedEquals(str + len - strlen("_BIT"), "_BIT", strlen("_BIT"))) {
       len -= strlen("_BIT");
     }
   }
@@ -10736,7 +22139,7 @@ static ValueSet const *getValueSet(char const *pVkType) {
   // Try the original name (with flagbits -> flags)
   for (size_t i = 0; i < cValueSetCount; ++i) {
     ValueSet const *it = &cValueSets[i];
-    if (strcmp(localStr, it->name) == 0) {
+    if (strcmp(localStr, getValueSetName(it)) == 0) {
       return it;
     }
   }
@@ -10745,7 +22148,7 @@ static ValueSet const *getValueSet(char const *pVkType) {
   localStr[stripVendor(localStr, localLen)] = '\0';
   for (size_t i = 0; i < cValueSetCount; ++i) {
     ValueSet const *it = &cValueSets[i];
-    if (strcmp(localStr, it->name) == 0) {
+    if (strcmp(localStr, getValueSetName(it)) == 0) {
       return it;
     }
   }
@@ -10753,52 +22156,9 @@ static ValueSet const *getValueSet(char const *pVkType) {
   return NULL;
 }
 
-/**
- * @brief Converts a Vulkan Flag typename into the prefix that is used for it's enums
- * @param pTypeName is the type to generate the Vulkan enum prefix for
- * @param nameLength is the length of the type name
- * @return Generated prefix string, the ownership of which passes to the caller
- *
- * Any capitalized letters except for the first has an underscore inserted before it, an underscore
- * is added to the end, and all characters are converted to upper case.
- *
- * It also removed the 'Flags' or 'FlagBits' suffixes.
- */
-static char const *generateEnumPrefix(char const *pTypeName, size_t nameLength) {
-  // Flag Bits
-  char const *pFlags = strstr(pTypeName, "Flags");
-  // Flags
-  char const *pFlagBits = strstr(pTypeName, "FlagBits");
-
-  char *pPrefixStr = (char *)malloc(nameLength * 2);
-  char *pDst = pPrefixStr;
-  for (char const *ch = pTypeName; ch < pTypeName + nameLength;) {
-    if (ch == pFlags) {
-      ch += strlen("Flags");
-    } else if (ch == pFlagBits) {
-      ch += strlen("FlagBits");
-    } else if (ch == pTypeName) {
-      *pDst++ = toupper(*ch);
-      ++ch;
-    } else if (isupper(*ch) || isdigit(*ch)) {
-      *pDst++ = '_';
-      *pDst++ = *ch;
-      ++ch;
-    } else {
-      *pDst++ = toupper(*ch);
-      ++ch;
-    }
-  }
-  *pDst++ = '_';
-  *pDst = '\0';
-  assert(pDst < pPrefixStr + (nameLength * 2));
-
-  return pPrefixStr;
-}
-
 /**
  * @brief Finds the corresponding value for the given string
- * @param pValueStr is a pointer to the string representing the value
+ * @param pValueStr is a pointer to the string representing the value, compared as formatted
  * @param valueLength is the length of the pValueStr string
  * @param pPrefixStr is a pointer to a pre-determined prefix string that the value may have
  * @param prefixLength is the length of the pPrefixStr string
@@ -10817,26 +22177,25 @@ static bool parseValue(char const *pValueStr,
                        ValueSet const *pValueSet,
                        void *pParsedValue) {
   // Check if there's a matching prefix
-  if (valueLength >= prefixLength && strncmp(pValueStr, pPrefixStr, prefixLength) == 0) {
+  if (valueLength >= prefixLength && formattedEquals(pValueStr, pPrefixStr, prefixLength)) {
     // There is, limit the searching scope to the part *after* the prefix
     pValueStr += prefixLength;
     valueLength -= prefixLength;
   }
 
   // Try the initial value
-  char const *const *const pSearchEnd = pValueSet->valueNames + pValueSet->count;
-  for (char const *const *pStart = pValueSet->valueNames; pStart != pSearchEnd; ++pStart) {
-    if (valueLength == strlen(*pStart) && strncmp(pValueStr, *pStart, valueLength) == 0) {
-      size_t const offset = pStart - pValueSet->valueNames;
+  for (size_t offset = 0; offset < pValueSet->count; ++offset) {
+    if (valueLength == getValueNameLength(pValueSet, offset) &&
+        formattedEquals(pValueStr, getValueName(pValueSet, offset), valueLength)) {
       switch (pValueSet->type) {
       case ENUM_TYPE_ENUM:
-        *(int32_t *)pParsedValue |= ((int32_t *)pValueSet->values)[offset];
+        *(int32_t *)pParsedValue |= ((int32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pParsedValue |= ((uint32_t *)pValueSet->values)[offset];
+        *(uint32_t *)pParsedValue |= ((uint32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pParsedValue |= ((uint64_t *)pValueSet->values)[offset];
+        *(uint64_t *)pParsedValue |= ((uint64_t const *)getValues(pValueSet))[offset];
         break;
       }
       return true;
@@ -10844,25 +22203,25 @@ static bool parseValue(char const *pValueStr,
   }
 
   // Remove the vendor tag suffix if it's on the value
-  valueLength = stripVendor(pValueStr, valueLength);
-  if (valueLength > 0 && pValueStr[valueLength - 1] == '_')
+  valueLength = stripFormattedVendor(pValueStr, valueLength);
+  if (valueLength > 0 && formatChar(pValueStr[valueLength - 1]) == '_')
     --valueLength;
 
   // Remove '_BIT' if it's there
   valueLength = stripBit(pValueStr, valueLength);
 
-  for (char const *const *pStart = pValueSet->valueNames; pStart != pSearchEnd; ++pStart) {
-    if (valueLength == strlen(*pStart) && strncmp(pValueStr, *pStart, valueLength) == 0) {
-      size_t const offset = pStart - pValueSet->valueNames;
+  for (size_t offset = 0; offset < pValueSet->count; ++offset) {
+    if (valueLength == getValueNameLength(pValueSet, offset) &&
+        formattedEquals(pValueStr, getValueName(pValueSet, offset), valueLength)) {
       switch (pValueSet->type) {
       case ENUM_TYPE_ENUM:
-        *(int32_t *)pParsedValue |= ((int32_t *)pValueSet->values)[offset];
+        *(int32_t *)pParsedValue |= ((int32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pParsedValue |= ((uint32_t *)pValueSet->values)[offset];
+        *(uint32_t *)pParsedValue |= ((uint32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pParsedValue |= ((uint64_t *)pValueSet->values)[offset];
+        *(uint64_t *)pParsedValue |= ((uint64_t const *)getValues(pValueSet))[offset];
         break;
       }
       return true;
@@ -10873,38 +22232,30 @@ static bool parseValue(char const *pValueStr,
 }
 
 /**
- * @brief Takes a given string and formats it for use with parsing
+ * @brief Trims a given string for use with parsing
  * @param ppStart is a double-pointer to the start of the string, which can be moved
  * @param pEnd is a pointer to the current end of the string
- * @return Pointer to the new end of the formatted string
+ * @return Pointer to the new end of the trimmed string
  *
- * First, any non alphanumeric characters are trimmed from both ends of the string.
- * After than, any spaces are replaced with underscores, and finally all the characters are
- * capitalized. This will generate the string closest to the original ones found in the XML spec.
+ * Any non alphanumeric characters are trimmed from both ends of the string. The remaining
+ * characters are left as-is, and are formatted as they are compared (see formatChar).
  */
-static char *formatString(char **ppStart, char *pEnd) {
+static char const *trimString(char const **ppStart, char const *pEnd) {
   // Trim left
   for (; *ppStart != pEnd;) {
-    if (isalnum(**ppStart))
+    if (isalnum((unsigned char)**ppStart))
       break;
     else
       ++(*ppStart);
   }
 
   // Trim right
-  char *pNewEnd = *ppStart;
-  for (char *ch = *ppStart; ch < pEnd; ++ch) {
-    if (isalnum(*ch))
+  char const *pNewEnd = *ppStart;
+  for (char const *ch = *ppStart; ch < pEnd; ++ch) {
+    if (isalnum((unsigned char)*ch))
       pNewEnd = ch + 1;
   }
 
-  for (char *ch = *ppStart; ch < pNewEnd; ++ch) {
-    if (*ch == ' ')
-      *ch = '_';
-    else
-      *ch = toupper(*ch);
-  }
-
   return pNewEnd;
 }
 
@@ -10916,238 +22267,286 @@ uint32_t serializeMin(uint32_t lhs, uint32_t rhs) {
   return rhs;
 }
 
-static STecVkSerializationResult serializeBitmask(ValueSet const *pValueSet,
-                                                  void const *pVkValue,
-                                                  uint32_t *pSerializedLength,
-                                                  char *pSerialized) {
-  if (pValueSet->count == 0) {
-    // If this is a non-existing bitmask, then return an empty string
-    *pSerializedLength = 0;
-    return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+/**
+ * @brief Returns the numeric value of the value set's entry at the given index
+ * @param pValueSet is the value set the entry belongs to
+ * @param index is the index of the entry in the value set
+ * @return Value of the entry, zero-extended to 64-bits
+ */
+static uint64_t getValue(ValueSet const *pValueSet, size_t index) {
+  switch (pValueSet->type) {
+  case ENUM_TYPE_ENUM:
+    return (uint32_t)((int32_t const *)getValues(pValueSet))[index];
+  case ENUM_TYPE_FLAG32:
+    return ((uint32_t const *)getValues(pValueSet))[index];
+  case ENUM_TYPE_FLAG64:
+    return ((uint64_t const *)getValues(pValueSet))[index];
   }
+  return 0;
+}
 
-  // As we want to search in reverse order (to possible catch values that encompass multiple bits)
-  // we decrement both items here, so the 'end' is at a valid value and 'start' is now one 'beyond
-  // the end'
-  char const *const *pSearchStart = pValueSet->valueNames + pValueSet->count - 1;
-  char const *const *pSearchEnd = pValueSet->valueNames - 1;
-
-  // Number of characters serialized so far
-  uint32_t serializedLength = 0;
-  // Will turn true if there isn't enough space in the destination string to fully serialize all the
-  // values
-  bool incomplete = false;
-  // Will host the temporary internal string, so we don't overwrite data in the destination string
-  // unless we're successfully returning
-  char *pTempStr = NULL;
+/**
+ * @brief Returns the position of the lowest set bit in the given non-zero value
+ */
+static uint32_t countTrailingZeros(uint64_t value) {
+#if defined(__GNUC__) || defined(__clang__)
+  return (uint32_t)__builtin_ctzll(value);
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+  unsigned long index;
+  _BitScanForward64(&index, value);
+  return (uint32_t)index;
+#else
+  uint32_t count = 0;
+  for (; (value & 1) == 0; value >>= 1)
+    ++count;
+  return count;
+#endif
+}
 
-  if (pSerialized != NULL) {
-    // We'll only bother with the internal string if we can outputt string data
-    pTempStr = (char *)malloc(*pSerializedLength);
+/**
+ * @brief Copies as much of a string as fits into a destination string at the given position
+ * @param pDst is either NULL or a pointer to the destination string
+ * @param dstLength is the size of the destination string
+ * @param position is the position in the destination string to copy to
+ * @param pSrc is a pointer to the string to copy
+ * @param srcLength is the length of the string to copy
+ */
+static void copyClamped(
+    char *pDst, uint32_t dstLength, uint32_t position, char const *pSrc, uint32_t srcLength) {
+  if (pDst != NULL && position < dstLength) {
+    memcpy(pDst + position, pSrc, serializeMin(dstLength - position, srcLength));
   }
+}
 
-  char *pSrcStr = pTempStr;
-  bool valueIsZero;
-
-  while (pSearchStart != pSearchEnd) {
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      valueIsZero = *(int32_t *)pVkValue == 0;
-      break;
-    case ENUM_TYPE_FLAG32:
-      valueIsZero = *(uint32_t *)pVkValue == 0;
-      break;
-    case ENUM_TYPE_FLAG64:
-      valueIsZero = *(uint64_t *)pVkValue == 0;
-      break;
-    }
+/**
+ * @brief Matches the names of a value set to the bits of a bitmask value
+ * @param pValueSet is the value set being serialized from
+ * @param pValue is a pointer to the value being serialized, which is updated to the bits that
+ * could not be matched to any name
+ * @param pBitEntries is a pointer to the indices of the named single bits set in the value, in
+ * descending order
+ * @param bitEntryCount is the number of indices in pBitEntries
+ * @param pDst is either NULL or a pointer to a character array the matched names are written to
+ * @param dstLength is the size of pDst, any names past which are not written
+ * @return Number of characters needed for all the matched names and separators.
+ */
+static uint32_t matchBitmask(ValueSet const *pValueSet,
+                             uint64_t *pValue,
+                             uint16_t const *pBitEntries,
+                             uint32_t bitEntryCount,
+                             char *pDst,
+                             uint32_t dstLength) {
+  uint64_t value = *pValue;
+  uint32_t serializedLength = 0;
+  uint32_t bitEntryIt = 0;
+  uint32_t combinedIt = 0;
+  uint16_t const *const pCombinedIndices = getCombinedIndices(pValueSet);
 
-    if (valueIsZero && serializedLength > 0) {
+  while (bitEntryIt < bitEntryCount || combinedIt < pValueSet->combinedCount) {
+    if (value == 0 && serializedLength > 0) {
       // No more non-zero values to serialize, and we've serialized something,
       // so we can skip any possible zero-values
       break;
     }
 
-    size_t offset = pSearchStart - pValueSet->valueNames;
-    bool match;
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      match = (((int32_t *)pValueSet->values)[offset] & *(int32_t *)pVkValue) ==
-              ((int32_t *)pValueSet->values)[offset];
-      break;
-    case ENUM_TYPE_FLAG32:
-      match = (((uint32_t *)pValueSet->values)[offset] & *(uint32_t *)pVkValue) ==
-              ((uint32_t *)pValueSet->values)[offset];
-      break;
-    case ENUM_TYPE_FLAG64:
-      match = (((uint64_t *)pValueSet->values)[offset] & *(uint64_t *)pVkValue) ==
-              ((uint64_t *)pValueSet->values)[offset];
-      break;
+    // Take whichever candidate is further along in the value set
+    size_t offset;
+    if (combinedIt == pValueSet->combinedCount ||
+        (bitEntryIt < bitEntryCount && pBitEntries[bitEntryIt] > pCombinedIndices[combinedIt])) {
+      offset = pBitEntries[bitEntryIt++];
+    } else {
+      offset = pCombinedIndices[combinedIt++];
     }
 
-    if (match) {
-      // Found a compatible bit mask, add it
-      if (serializedLength > 0) {
-        if (pTempStr == NULL) {
-          serializedLength += 3;
-        } else {
-          uint32_t toCopy = serializeMin(*pSerializedLength - serializedLength, 3);
-          memcpy(pSrcStr, " | ", toCopy);
-          pSrcStr += toCopy;
-          serializedLength += toCopy;
-          if (toCopy != 3) {
-            incomplete = true;
-            break;
-          }
-        }
-      }
-
-      if (pSrcStr == NULL) {
-        serializedLength += (uint32_t)strlen(*pSearchStart);
-      } else {
-        uint32_t toCopy =
-            serializeMin(*pSerializedLength - serializedLength, (uint32_t)strlen(*pSearchStart));
-        memcpy(pSrcStr, *pSearchStart, toCopy);
-        pSrcStr += toCopy;
-        serializedLength += toCopy;
-        if (toCopy != strlen(*pSearchStart)) {
-          incomplete = true;
-          break;
-        }
-      }
+    uint64_t const entryValue = getValue(pValueSet, offset);
+    if ((entryValue & value) != entryValue)
+      continue;
 
-      switch (pValueSet->type) {
-      case ENUM_TYPE_ENUM:
-        *(int32_t *)pVkValue ^= ((int32_t *)pValueSet->values)[offset];
-        break;
-      case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pVkValue ^= ((uint32_t *)pValueSet->values)[offset];
-        break;
-      case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pVkValue ^= ((uint64_t *)pValueSet->values)[offset];
-        break;
-      }
+    // Found a compatible bit mask, add it
+    if (serializedLength > 0) {
+      copyClamped(pDst, dstLength, serializedLength, " | ", 3);
+      serializedLength += 3;
     }
 
-    --pSearchStart;
+    uint32_t const nameLength = getValueNameLength(pValueSet, offset);
+    copyClamped(pDst, dstLength, serializedLength, getValueName(pValueSet, offset), nameLength);
+    serializedLength += nameLength;
+
+    value ^= entryValue;
+  }
+
+  *pValue = value;
+  return serializedLength;
+}
+
+static STecVkSerializationResult serializeBitmask(ValueSet const *pValueSet,
+                                                  void const *pVkValue,
+                                                  uint32_t *pSerializedLength,
+                                                  char *pSerialized) {
+  if (pValueSet->count == 0) {
+    // If this is a non-existing bitmask, then return an empty string
+    *pSerializedLength = 0;
+    return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
   }
 
+  uint64_t value = 0;
   switch (pValueSet->type) {
   case ENUM_TYPE_ENUM:
-    valueIsZero = *(int32_t *)pVkValue == 0;
-    break;
   case ENUM_TYPE_FLAG32:
-    valueIsZero = *(uint32_t *)pVkValue == 0;
+    value = *(uint32_t *)pVkValue;
     break;
   case ENUM_TYPE_FLAG64:
-    valueIsZero = *(uint64_t *)pVkValue == 0;
+    value = *(uint64_t *)pVkValue;
     break;
   }
 
-  if (!incomplete && !valueIsZero) {
+  // Collect the value indices of the named single bits that are set, sorted in descending order so
+  // that they can be merged with the (also descending) combined values, matching the precedence of
+  // searching the whole value set in reverse.
+  uint16_t const *const pBitIndices = getBitIndices(pValueSet);
+  uint16_t bitEntries[64];
+  uint32_t bitEntryCount = 0;
+  for (uint64_t bits = value; bits != 0; bits &= bits - 1) {
+    uint32_t const bit = countTrailingZeros(bits);
+    if (bit >= pValueSet->bitIndexCount || pBitIndices[bit] == cNoValueIndex)
+      continue;
+
+    uint16_t const index = pBitIndices[bit];
+    uint32_t insertAt = bitEntryCount++;
+    for (; insertAt > 0 && bitEntries[insertAt - 1] < index; --insertAt) {
+      bitEntries[insertAt] = bitEntries[insertAt - 1];
+    }
+    bitEntries[insertAt] = index;
+  }
+
+  // The names are matched first to find the total length and whether the whole value can be
+  // serialized, so that they can then be written directly to the destination string, without it
+  // being touched on failure and without needing a temporary string
+  uint64_t remainingValue = value;
+  uint32_t const serializedLength =
+      matchBitmask(pValueSet, &remainingValue, bitEntries, bitEntryCount, NULL, 0);
+
+  if (pSerialized != NULL && serializedLength > *pSerializedLength) {
+    // Not enough space in the destination string, write as much as will fit
+    matchBitmask(pValueSet, &value, bitEntries, bitEntryCount, pSerialized, *pSerializedLength);
+    return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+  }
+
+  if (remainingValue != 0) {
     // Failed to find a valid bitmask for the value
-    free(pTempStr);
     return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
   }
 
+  if (pSerialized != NULL) {
+    matchBitmask(pValueSet, &value, bitEntries, bitEntryCount, pSerialized, serializedLength);
+  }
   *pSerializedLength = serializedLength;
-  if (pSerialized != NULL && serializedLength > 0) {
-    memcpy(pSerialized, pTempStr, serializedLength);
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+}
+
+/**
+ * @brief Finds the index of the first entry of a plain enum value set with the given value
+ * @param pValueSet is the value set to search
+ * @param value is the value being searched for
+ * @return Index of the matching entry, or cNoValueIndex if there isn't one.
+ *
+ * Values in the dense core range are directly indexed, as are extension values for sets with
+ * extension blocks, with anything else being binary searched.
+ */
+static uint16_t findEnumIndex(ValueSet const *pValueSet, int32_t value) {
+  if (value >= 0 && (uint32_t)value < pValueSet->valueIndexCount) {
+    return getValueIndices(pValueSet)[value];
   }
-  free(pTempStr);
-  if (incomplete) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+
+  if (pValueSet->extensionBlockCount != 0 && value >= cExtensionValueBase) {
+    // Extension values are 1000000000 + (ext - 1) * 1000 + offset
+    uint32_t const block = (uint32_t)(value - cExtensionValueBase) / 1000;
+    uint32_t const offset = (uint32_t)(value - cExtensionValueBase) % 1000;
+    if (block >= pValueSet->extensionBlockCount)
+      return cNoValueIndex;
+
+    uint16_t const *const pExtensionBlocks = getExtensionBlocks(pValueSet);
+    if (offset >= (uint32_t)(pExtensionBlocks[block + 1] - pExtensionBlocks[block]))
+      return cNoValueIndex;
+    return pExtensionBlocks[pExtensionBlocks[block] + offset];
   }
-  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+
+  int32_t const *const pSortedValues = getSortedValues(pValueSet);
+  uint32_t low = 0;
+  uint32_t high = pValueSet->sortedCount;
+  while (low < high) {
+    uint32_t const mid = low + (high - low) / 2;
+    if (pSortedValues[mid] < value)
+      low = mid + 1;
+    else
+      high = mid;
+  }
+  if (low < pValueSet->sortedCount && pSortedValues[low] == value) {
+    return getSortedIndices(pValueSet)[low];
+  }
+
+  return cNoValueIndex;
 }
 
 static STecVkSerializationResult serializeEnum(ValueSet const *pValueSet,
                                                void const *pVkValue,
                                                uint32_t *pSerializedLength,
                                                char *pSerialized) {
-  void const *pSearchStart = pValueSet->values;
-  void const *pSearchEnd;
+  size_t offset = cNoValueIndex;
 
   switch (pValueSet->type) {
   case ENUM_TYPE_ENUM:
-  case ENUM_TYPE_FLAG32:
-    pSearchEnd = (uint32_t *)pSearchStart + pValueSet->count;
+    offset = findEnumIndex(pValueSet, *(int32_t *)pVkValue);
     break;
-  case ENUM_TYPE_FLAG64:
-    pSearchEnd = (uint64_t *)pSearchStart + pValueSet->count;
-    break;
-  }
-
-  while (pSearchStart != pSearchEnd) {
-    bool match;
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      match = *(int32_t *)pSearchStart == *(int32_t *)pVkValue;
-      break;
-    case ENUM_TYPE_FLAG32:
-      match = *(uint32_t *)pSearchStart == *(uint32_t *)pVkValue;
-      break;
-    case ENUM_TYPE_FLAG64:
-      match = *(uint64_t *)pSearchStart == *(uint64_t *)pVkValue;
-      break;
-    }
-
-    if (match) {
-      size_t offset;
-      switch (pValueSet->type) {
-      case ENUM_TYPE_ENUM:
-      case ENUM_TYPE_FLAG32:
-        offset = (uint32_t *)pSearchStart - (uint32_t *)pValueSet->values;
-        break;
-      case ENUM_TYPE_FLAG64:
-        offset = (uint64_t *)pSearchStart - (uint64_t *)pValueSet->values;
+  case ENUM_TYPE_FLAG32:
+  case ENUM_TYPE_FLAG64: {
+    // Flag types don't have value indices, so search the values directly
+    uint64_t const value =
+        (pValueSet->type == ENUM_TYPE_FLAG32) ? *(uint32_t *)pVkValue : *(uint64_t *)pVkValue;
+    for (size_t i = 0; i < pValueSet->count; ++i) {
+      if (getValue(pValueSet, i) == value) {
+        offset = i;
         break;
       }
-
-      uint32_t const sourceLength = (uint32_t)strlen(pValueSet->valueNames[offset]);
-      if (pSerialized != NULL) {
-        if (*pSerializedLength < sourceLength) {
-          memcpy(pSerialized, pValueSet->valueNames[offset], *pSerializedLength);
-          return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
-        } else {
-          // Copy full value
-          memcpy(pSerialized, pValueSet->valueNames[offset], sourceLength);
-        }
-      }
-      // In all success cases, set the length of the value string, either for how much is needed
-      // or was copied.
-      *pSerializedLength = sourceLength;
-
-      return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
     }
+  } break;
+  }
 
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-    case ENUM_TYPE_FLAG32:
-      pSearchStart = ((uint32_t *)pSearchStart) + 1;
-      break;
-    case ENUM_TYPE_FLAG64:
-      pSearchStart = ((uint64_t *)pSearchStart) + 1;
-      break;
+  if (offset == cNoValueIndex) {
+    return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
+  }
+
+  uint32_t const sourceLength = getValueNameLength(pValueSet, offset);
+  if (pSerialized != NULL) {
+    if (*pSerializedLength < sourceLength) {
+      memcpy(pSerialized, getValueName(pValueSet, offset), *pSerializedLength);
+      return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+    } else {
+      // Copy full value
+      memcpy(pSerialized, getValueName(pValueSet, offset), sourceLength);
     }
   }
+  // In all success cases, set the length of the value string, either for how much is needed
+  // or was copied.
+  *pSerializedLength = sourceLength;
 
-  return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
 }
 
-static STecVkSerializationResult parseBitmask(char *pVkString,
+static STecVkSerializationResult parseBitmask(char const *pVkString,
+                                              size_t strLength,
                                               ValueSet const *pValueSet,
                                               char const *pPrefixStr,
                                               size_t prefixLength,
                                               void *pParsedValue) {
   uint64_t retVal = 0;
-  char *const strEnd = pVkString + strlen(pVkString);
+  char const *const strEnd = pVkString + strLength;
 
-  char *startCh = pVkString;
-  char *endCh = pVkString;
+  char const *startCh = pVkString;
+  char const *endCh = pVkString;
   for (; endCh != strEnd; ++endCh) {
     if (*endCh == '|') {
-      char *pNewEndCh = formatString(&startCh, endCh);
+      char const *pNewEndCh = trimString(&startCh, endCh);
 
       bool foundVal =
           parseValue(startCh, pNewEndCh - startCh, pPrefixStr, prefixLength, pValueSet, &retVal);
@@ -11158,7 +22557,7 @@ static STecVkSerializationResult parseBitmask(char *pVkString,
     }
   }
   if (startCh != endCh) {
-    char *pNewEndCh = formatString(&startCh, endCh);
+    char const *pNewEndCh = trimString(&startCh, endCh);
 
     bool foundVal =
         parseValue(startCh, pNewEndCh - startCh, pPrefixStr, prefixLength, pValueSet, &retVal);
@@ -11180,14 +22579,15 @@ static STecVkSerializationResult parseBitmask(char *pVkString,
   return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
 }
 
-static STecVkSerializationResult parseEnum(char *pVkString,
+static STecVkSerializationResult parseEnum(char const *pVkString,
+                                           size_t strLength,
                                            ValueSet const *pValueSet,
                                            char const *pPrefixStr,
                                            size_t prefixLength,
                                            void *pParsedValue) {
   uint64_t retVal = 0;
 
-  char *pStrEnd = formatString(&pVkString, pVkString + strlen(pVkString));
+  char const *pStrEnd = trimString(&pVkString, pVkString + strLength);
   bool found =
       parseValue(pVkString, pStrEnd - pVkString, pPrefixStr, prefixLength, pValueSet, &retVal);
   if (found) {
@@ -11208,16 +22608,102 @@ static STecVkSerializationResult parseEnum(char *pVkString,
   return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
 }
 
-static STecVkSerializationResult vk_serialize(char const *pVkType,
+static STecVkSerializationResult serializeValue(ValueSet const *pValueSet,
+                                                void const *pVkValue,
+                                                uint32_t *pSerializedLength,
+                                                char *pSerialized) {
+  if (pValueSet->type != ENUM_TYPE_ENUM) {
+    return serializeBitmask(pValueSet, pVkValue, pSerializedLength, pSerialized);
+  }
+
+  return serializeEnum(pValueSet, pVkValue, pSerializedLength, pSerialized);
+}
+
+#ifdef VK_VALUE_SERIALIZATION_CONFIG_CACHE
+#ifndef VK_VALUE_SERIALIZATION_CACHE_SIZE
+#define VK_VALUE_SERIALIZATION_CACHE_SIZE 64
+#endif
+
+#ifndef VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE
+#define VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE 128
+#endif
+
+#if defined(__cplusplus)
+#define SERIALIZATION_THREAD_LOCAL thread_local
+#elif defined(_MSC_VER)
+#define SERIALIZATION_THREAD_LOCAL __declspec(thread)
+#else
+#define SERIALIZATION_THREAD_LOCAL _Thread_local
+#endif
+
+typedef struct SerializationCacheEntry {
+  ValueSet const *pValueSet; // NULL if the entry is unused
+  uint64_t value;
+  uint32_t length;
+  char serialized[VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE];
+} SerializationCacheEntry;
+
+// Each thread has its own cache, so no synchronization is needed
+static SERIALIZATION_THREAD_LOCAL SerializationCacheEntry
+    sSerializationCache[VK_VALUE_SERIALIZATION_CACHE_SIZE];
+
+/**
+ * @brief Serializes a value, using the calling thread's cache of previously serialized values
+ * @param pValueSet is the value set being serialized from
+ * @param pVkValue is a pointer to the value being serialized
+ * @param valueSize is the size of the value being serialized
+ * @param pSerializedLength is a pointer to the length of pSerialized, as with vk_serialize32
+ * @param pSerialized is either NULL or a pointer to the destination string
+ * @return Same as serializing without the cache.
+ *
+ * Each (value set, value) pair maps to a single entry, so a new pair evicts whatever was there.
+ * Only successfully serialized strings that fit into an entry are cached, with anything else being
+ * serialized directly to the destination.
+ */
+static STecVkSerializationResult serializeCached(ValueSet const *pValueSet,
+                                                 void const *pVkValue,
+                                                 size_t valueSize,
+                                                 uint32_t *pSerializedLength,
+                                                 char *pSerialized) {
+  uint64_t const value =
+      (valueSize == sizeof(uint32_t)) ? *(uint32_t const *)pVkValue : *(uint64_t const *)pVkValue;
+
+  uint64_t hash = (uint64_t)(uintptr_t)pValueSet ^ (value * 0x9E3779B97F4A7C15ULL);
+  hash ^= hash >> 32;
+  SerializationCacheEntry *pEntry = &sSerializationCache[hash % VK_VALUE_SERIALIZATION_CACHE_SIZE];
+
+  if (pEntry->pValueSet != pValueSet || pEntry->value != value) {
+    // Cache miss, serialize into the entry, invalidating it first in case it fails
+    uint32_t length = VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE;
+    pEntry->pValueSet = NULL;
+    if (serializeValue(pValueSet, pVkValue, &length, pEntry->serialized) !=
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
+      return serializeValue(pValueSet, pVkValue, pSerializedLength, pSerialized);
+    }
+
+    pEntry->pValueSet = pValueSet;
+    pEntry->value = value;
+    pEntry->length = length;
+  }
+
+  if (pSerialized != NULL) {
+    if (*pSerializedLength < pEntry->length) {
+      memcpy(pSerialized, pEntry->serialized, *pSerializedLength);
+      return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+    }
+    memcpy(pSerialized, pEntry->serialized, pEntry->length);
+  }
+  *pSerializedLength = pEntry->length;
+
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+}
+#endif
+
+static STecVkSerializationResult vk_serialize(ValueSet const *pValueSet,
                                               void const *pVkValue,
                                               size_t valueSize,
                                               uint32_t *pSerializedLength,
                                               char *pSerialized) {
-  if (pVkType == NULL || strlen(pVkType) == 0) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
-  }
-
-  ValueSet const *const pValueSet = getValueSet(pVkType);
   if (pValueSet == NULL) {
     return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
   }
@@ -11235,36 +22721,64 @@ static STecVkSerializationResult vk_serialize(char const *pVkType,
     break;
   }
 
-  if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
-    return serializeBitmask(pValueSet, pVkValue, pSerializedLength, pSerialized);
+#ifdef VK_VALUE_SERIALIZATION_CONFIG_CACHE
+  return serializeCached(pValueSet, pVkValue, valueSize, pSerializedLength, pSerialized);
+#else
+  return serializeValue(pValueSet, pVkValue, pSerializedLength, pSerialized);
+#endif
+}
+
+STecVkValueSet const *vk_get_value_set(char const *pVkType) {
+  if (pVkType == NULL || strlen(pVkType) == 0) {
+    return NULL;
   }
 
-  return serializeEnum(pValueSet, pVkValue, pSerializedLength, pSerialized);
+  return getValueSet(pVkType);
+}
+
+STecVkValueSet const *vk_get_value_set_at(uint32_t index) {
+  if (index >= cValueSetCount) {
+    return NULL;
+  }
+
+  return &cValueSets[index];
 }
 
 STecVkSerializationResult vk_serialize32(char const *pVkType,
                                          uint32_t vkValue,
                                          uint32_t *pSerializedLength,
                                          char *pSerialized) {
-  return vk_serialize(pVkType, &vkValue, sizeof(uint32_t), pSerializedLength, pSerialized);
+  return vk_serialize(vk_get_value_set(pVkType), &vkValue, sizeof(uint32_t), pSerializedLength,
+                      pSerialized);
 }
 
 STecVkSerializationResult vk_serialize64(char const *pVkType,
                                          uint64_t vkValue,
                                          uint32_t *pSerializedLength,
                                          char *pSerialized) {
-  return vk_serialize(pVkType, &vkValue, sizeof(uint64_t), pSerializedLength, pSerialized);
+  return vk_serialize(vk_get_value_set(pVkType), &vkValue, sizeof(uint64_t), pSerializedLength,
+                      pSerialized);
+}
+
+STecVkSerializationResult vk_serialize_set32(STecVkValueSet const *pValueSet,
+                                             uint32_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized) {
+  return vk_serialize(pValueSet, &vkValue, sizeof(uint32_t), pSerializedLength, pSerialized);
 }
 
-static STecVkSerializationResult vk_parse(char const *pVkType,
+STecVkSerializationResult vk_serialize_set64(STecVkValueSet const *pValueSet,
+                                             uint64_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized) {
+  return vk_serialize(pValueSet, &vkValue, sizeof(uint64_t), pSerializedLength, pSerialized);
+}
+
+static STecVkSerializationResult vk_parse(ValueSet const *pValueSet,
                                           char const *pVkString,
+                                          size_t strLength,
                                           void *pParsedValue,
                                           size_t parseValueSize) {
-  if (pVkType == NULL || strlen(pVkType) == 0) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
-  }
-
-  ValueSet const *const pValueSet = getValueSet(pVkType);
   if (pValueSet == NULL) {
     return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
   }
@@ -11282,10 +22796,9 @@ static STecVkSerializationResult vk_parse(char const *pVkType,
     break;
   }
 
-  size_t const strLength = strlen(pVkString);
   if (strLength == 0) {
     // Only flags/bitmasks can have no/empty values, all enum types must have *something*
-    if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
+    if (pValueSet->type != ENUM_TYPE_ENUM) {
       switch (parseValueSize) {
       case sizeof(uint32_t):
         *(uint32_t *)pParsedValue = 0;
@@ -11300,41 +22813,61 @@ static STecVkSerializationResult vk_parse(char const *pVkType,
     }
   }
 
-  char *mutableStr = (char *)malloc(strLength + 1);
-  memcpy(mutableStr, pVkString, strLength);
-  mutableStr[strLength] = '\0';
-
-  char const *prefixStr = generateEnumPrefix(pVkType, stripVendor(pVkType, strlen(pVkType)));
-
-  STecVkSerializationResult result;
-  if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
-    result = parseBitmask(mutableStr, pValueSet, prefixStr, strlen(prefixStr), pParsedValue);
-  } else {
-    result = parseEnum(mutableStr, pValueSet, prefixStr, strlen(prefixStr), pParsedValue);
+  if (pValueSet->type != ENUM_TYPE_ENUM) {
+    return parseBitmask(pVkString, strLength, pValueSet, getValueSetPrefix(pValueSet),
+                        strlen(getValueSetPrefix(pValueSet)), pParsedValue);
   }
 
-  free((void *)prefixStr);
-  free(mutableStr);
-
-  return result;
+  return parseEnum(pVkString, strLength, pValueSet, getValueSetPrefix(pValueSet),
+                   strlen(getValueSetPrefix(pValueSet)), pParsedValue);
 }
 
 STecVkSerializationResult vk_parse32(char const *pVkType,
                                      char const *pVkString,
                                      void *pParsedValue) {
+  return vk_parse_set32(vk_get_value_set(pVkType), pVkString, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse64(char const *pVkType,
+                                     char const *pVkString,
+                                     void *pParsedValue) {
+  return vk_parse_set64(vk_get_value_set(pVkType), pVkString, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set32(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue) {
+  size_t const strLength = (pVkString != NULL) ? strlen(pVkString) : 0;
+  return vk_parse_set_n32(pValueSet, pVkString, strLength, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set64(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue) {
+  size_t const strLength = (pVkString != NULL) ? strlen(pVkString) : 0;
+  return vk_parse_set_n64(pValueSet, pVkString, strLength, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set_n32(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue) {
   uint32_t tempValue;
-  STecVkSerializationResult result = vk_parse(pVkType, pVkString, &tempValue, sizeof(uint32_t));
+  STecVkSerializationResult result =
+      vk_parse(pValueSet, pVkString, stringLength, &tempValue, sizeof(uint32_t));
   if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
     memcpy(pParsedValue, &tempValue, sizeof(uint32_t));
   }
   return result;
 }
 
-STecVkSerializationResult vk_parse64(char const *pVkType,
-                                     char const *pVkString,
-                                     void *pParsedValue) {
+STecVkSerializationResult vk_parse_set_n64(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue) {
   uint64_t tempValue;
-  STecVkSerializationResult result = vk_parse(pVkType, pVkString, &tempValue, sizeof(uint64_t));
+  STecVkSerializationResult result =
+      vk_parse(pValueSet, pVkString, stringLength, &tempValue, sizeof(uint64_t));
   if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
     memcpy(pParsedValue, &tempValue, sizeof(uint64_t));
   }
@@ -11347,4 +22880,839 @@ STecVkSerializationResult vk_parse64(char const *pVkType,
 }
 #endif
 
+#ifdef __cplusplus
+namespace vk_value_set {
+
+/**
+ * @brief Compile-time binding of a Vulkan enumerator/flag type to its value set
+ * @tparam Index is the index of the type's value set, as used with vk_get_value_set_at
+ * @tparam T is the underlying integer type of the Vulkan type's values
+ */
+template <uint32_t Index, typename T>
+struct Binding {
+  static constexpr uint32_t cIndex = Index;
+  using ValueType = T;
+};
+
+using VkFramebufferCreateFlags = Binding<0, uint32_t>;
+using VkFramebufferCreateFlagBits = VkFramebufferCreateFlags;
+using VkQueryPoolCreateFlags = Binding<1, uint32_t>;
+using VkQueryPoolCreateFlagBits = VkQueryPoolCreateFlags;
+using VkRenderPassCreateFlags = Binding<2, uint32_t>;
+using VkRenderPassCreateFlagBits = VkRenderPassCreateFlags;
+using VkSamplerCreateFlags = Binding<3, uint32_t>;
+using VkSamplerCreateFlagBits = VkSamplerCreateFlags;
+using VkPipelineLayoutCreateFlags = Binding<4, uint32_t>;
+using VkPipelineLayoutCreateFlagBits = VkPipelineLayoutCreateFlags;
+using VkPipelineCacheCreateFlags = Binding<5, uint32_t>;
+using VkPipelineCacheCreateFlagBits = VkPipelineCacheCreateFlags;
+using VkPipelineDepthStencilStateCreateFlags = Binding<6, uint32_t>;
+using VkPipelineDepthStencilStateCreateFlagBits = VkPipelineDepthStencilStateCreateFlags;
+using VkPipelineDynamicStateCreateFlags = Binding<7, uint32_t>;
+using VkPipelineDynamicStateCreateFlagBits = VkPipelineDynamicStateCreateFlags;
+using VkPipelineColorBlendStateCreateFlags = Binding<8, uint32_t>;
+using VkPipelineColorBlendStateCreateFlagBits = VkPipelineColorBlendStateCreateFlags;
+using VkPipelineMultisampleStateCreateFlags = Binding<9, uint32_t>;
+using VkPipelineMultisampleStateCreateFlagBits = VkPipelineMultisampleStateCreateFlags;
+using VkPipelineRasterizationStateCreateFlags = Binding<10, uint32_t>;
+using VkPipelineRasterizationStateCreateFlagBits = VkPipelineRasterizationStateCreateFlags;
+using VkPipelineViewportStateCreateFlags = Binding<11, uint32_t>;
+using VkPipelineViewportStateCreateFlagBits = VkPipelineViewportStateCreateFlags;
+using VkPipelineTessellationStateCreateFlags = Binding<12, uint32_t>;
+using VkPipelineTessellationStateCreateFlagBits = VkPipelineTessellationStateCreateFlags;
+using VkPipelineInputAssemblyStateCreateFlags = Binding<13, uint32_t>;
+using VkPipelineInputAssemblyStateCreateFlagBits = VkPipelineInputAssemblyStateCreateFlags;
+using VkPipelineVertexInputStateCreateFlags = Binding<14, uint32_t>;
+using VkPipelineVertexInputStateCreateFlagBits = VkPipelineVertexInputStateCreateFlags;
+using VkPipelineShaderStageCreateFlags = Binding<15, uint32_t>;
+using VkPipelineShaderStageCreateFlagBits = VkPipelineShaderStageCreateFlags;
+using VkDescriptorSetLayoutCreateFlags = Binding<16, uint32_t>;
+using VkDescriptorSetLayoutCreateFlagBits = VkDescriptorSetLayoutCreateFlags;
+using VkBufferViewCreateFlags = Binding<17, uint32_t>;
+using VkBufferViewCreateFlagBits = VkBufferViewCreateFlags;
+using VkInstanceCreateFlags = Binding<18, uint32_t>;
+using VkInstanceCreateFlagBits = VkInstanceCreateFlags;
+using VkDeviceCreateFlags = Binding<19, uint32_t>;
+using VkDeviceCreateFlagBits = VkDeviceCreateFlags;
+using VkDeviceQueueCreateFlags = Binding<20, uint32_t>;
+using VkDeviceQueueCreateFlagBits = VkDeviceQueueCreateFlags;
+using VkQueueFlags = Binding<21, uint32_t>;
+using VkQueueFlagBits = VkQueueFlags;
+using VkMemoryPropertyFlags = Binding<22, uint32_t>;
+using VkMemoryPropertyFlagBits = VkMemoryPropertyFlags;
+using VkMemoryHeapFlags = Binding<23, uint32_t>;
+using VkMemoryHeapFlagBits = VkMemoryHeapFlags;
+using VkAccessFlags = Binding<24, uint32_t>;
+using VkAccessFlagBits = VkAccessFlags;
+using VkBufferUsageFlags = Binding<25, uint32_t>;
+using VkBufferUsageFlagBits = VkBufferUsageFlags;
+using VkBufferCreateFlags = Binding<26, uint32_t>;
+using VkBufferCreateFlagBits = VkBufferCreateFlags;
+using VkShaderStageFlags = Binding<27, uint32_t>;
+using VkShaderStageFlagBits = VkShaderStageFlags;
+using VkImageUsageFlags = Binding<28, uint32_t>;
+using VkImageUsageFlagBits = VkImageUsageFlags;
+using VkImageCreateFlags = Binding<29, uint32_t>;
+using VkImageCreateFlagBits = VkImageCreateFlags;
+using VkImageViewCreateFlags = Binding<30, uint32_t>;
+using VkImageViewCreateFlagBits = VkImageViewCreateFlags;
+using VkPipelineCreateFlags = Binding<31, uint32_t>;
+using VkPipelineCreateFlagBits = VkPipelineCreateFlags;
+using VkColorComponentFlags = Binding<32, uint32_t>;
+using VkColorComponentFlagBits = VkColorComponentFlags;
+using VkFenceCreateFlags = Binding<33, uint32_t>;
+using VkFenceCreateFlagBits = VkFenceCreateFlags;
+using VkSemaphoreCreateFlags = Binding<34, uint32_t>;
+using VkSemaphoreCreateFlagBits = VkSemaphoreCreateFlags;
+using VkFormatFeatureFlags = Binding<35, uint32_t>;
+using VkFormatFeatureFlagBits = VkFormatFeatureFlags;
+using VkQueryControlFlags = Binding<36, uint32_t>;
+using VkQueryControlFlagBits = VkQueryControlFlags;
+using VkQueryResultFlags = Binding<37, uint32_t>;
+using VkQueryResultFlagBits = VkQueryResultFlags;
+using VkShaderModuleCreateFlags = Binding<38, uint32_t>;
+using VkShaderModuleCreateFlagBits = VkShaderModuleCreateFlags;
+using VkEventCreateFlags = Binding<39, uint32_t>;
+using VkEventCreateFlagBits = VkEventCreateFlags;
+using VkCommandPoolCreateFlags = Binding<40, uint32_t>;
+using VkCommandPoolCreateFlagBits = VkCommandPoolCreateFlags;
+using VkCommandPoolResetFlags = Binding<41, uint32_t>;
+using VkCommandPoolResetFlagBits = VkCommandPoolResetFlags;
+using VkCommandBufferResetFlags = Binding<42, uint32_t>;
+using VkCommandBufferResetFlagBits = VkCommandBufferResetFlags;
+using VkCommandBufferUsageFlags = Binding<43, uint32_t>;
+using VkCommandBufferUsageFlagBits = VkCommandBufferUsageFlags;
+using VkQueryPipelineStatisticFlags = Binding<44, uint32_t>;
+using VkQueryPipelineStatisticFlagBits = VkQueryPipelineStatisticFlags;
+using VkMemoryMapFlags = Binding<45, uint32_t>;
+using VkMemoryMapFlagBits = VkMemoryMapFlags;
+using VkMemoryUnmapFlags = Binding<46, uint32_t>;
+using VkMemoryUnmapFlagBits = VkMemoryUnmapFlags;
+using VkImageAspectFlags = Binding<47, uint32_t>;
+using VkImageAspectFlagBits = VkImageAspectFlags;
+using VkSparseMemoryBindFlags = Binding<48, uint32_t>;
+using VkSparseMemoryBindFlagBits = VkSparseMemoryBindFlags;
+using VkSparseImageFormatFlags = Binding<49, uint32_t>;
+using VkSparseImageFormatFlagBits = VkSparseImageFormatFlags;
+using VkSubpassDescriptionFlags = Binding<50, uint32_t>;
+using VkSubpassDescriptionFlagBits = VkSubpassDescriptionFlags;
+using VkPipelineStageFlags = Binding<51, uint32_t>;
+using VkPipelineStageFlagBits = VkPipelineStageFlags;
+using VkSampleCountFlags = Binding<52, uint32_t>;
+using VkSampleCountFlagBits = VkSampleCountFlags;
+using VkAttachmentDescriptionFlags = Binding<53, uint32_t>;
+using VkAttachmentDescriptionFlagBits = VkAttachmentDescriptionFlags;
+using VkStencilFaceFlags = Binding<54, uint32_t>;
+using VkStencilFaceFlagBits = VkStencilFaceFlags;
+using VkCullModeFlags = Binding<55, uint32_t>;
+using VkCullModeFlagBits = VkCullModeFlags;
+using VkDescriptorPoolCreateFlags = Binding<56, uint32_t>;
+using VkDescriptorPoolCreateFlagBits = VkDescriptorPoolCreateFlags;
+using VkDescriptorPoolResetFlags = Binding<57, uint32_t>;
+using VkDescriptorPoolResetFlagBits = VkDescriptorPoolResetFlags;
+using VkDependencyFlags = Binding<58, uint32_t>;
+using VkDependencyFlagBits = VkDependencyFlags;
+using VkSubgroupFeatureFlags = Binding<59, uint32_t>;
+using VkSubgroupFeatureFlagBits = VkSubgroupFeatureFlags;
+using VkIndirectCommandsLayoutUsageFlagsNV = Binding<60, uint32_t>;
+using VkIndirectCommandsLayoutUsageFlagBitsNV = VkIndirectCommandsLayoutUsageFlagsNV;
+using VkIndirectStateFlagsNV = Binding<61, uint32_t>;
+using VkIndirectStateFlagBitsNV = VkIndirectStateFlagsNV;
+using VkGeometryFlagsKHR = Binding<62, uint32_t>;
+using VkGeometryFlagBitsKHR = VkGeometryFlagsKHR;
+using VkGeometryInstanceFlagsKHR = Binding<63, uint32_t>;
+using VkGeometryInstanceFlagBitsKHR = VkGeometryInstanceFlagsKHR;
+using VkClusterAccelerationStructureGeometryFlagsNV = Binding<64, uint32_t>;
+using VkClusterAccelerationStructureGeometryFlagBitsNV =
+    VkClusterAccelerationStructureGeometryFlagsNV;
+using VkClusterAccelerationStructureClusterFlagsNV = Binding<65, uint32_t>;
+using VkClusterAccelerationStructureClusterFlagBitsNV =
+    VkClusterAccelerationStructureClusterFlagsNV;
+using VkClusterAccelerationStructureAddressResolutionFlagsNV = Binding<66, uint32_t>;
+using VkClusterAccelerationStructureAddressResolutionFlagBitsNV =
+    VkClusterAccelerationStructureAddressResolutionFlagsNV;
+using VkBuildAccelerationStructureFlagsKHR = Binding<67, uint32_t>;
+using VkBuildAccelerationStructureFlagBitsKHR = VkBuildAccelerationStructureFlagsKHR;
+using VkPrivateDataSlotCreateFlags = Binding<68, uint32_t>;
+using VkPrivateDataSlotCreateFlagBits = VkPrivateDataSlotCreateFlags;
+using VkAccelerationStructureCreateFlagsKHR = Binding<69, uint32_t>;
+using VkAccelerationStructureCreateFlagBitsKHR = VkAccelerationStructureCreateFlagsKHR;
+using VkDescriptorUpdateTemplateCreateFlags = Binding<70, uint32_t>;
+using VkDescriptorUpdateTemplateCreateFlagBits = VkDescriptorUpdateTemplateCreateFlags;
+using VkPipelineCreationFeedbackFlags = Binding<71, uint32_t>;
+using VkPipelineCreationFeedbackFlagBits = VkPipelineCreationFeedbackFlags;
+using VkPerformanceCounterDescriptionFlagsKHR = Binding<72, uint32_t>;
+using VkPerformanceCounterDescriptionFlagBitsKHR = VkPerformanceCounterDescriptionFlagsKHR;
+using VkAcquireProfilingLockFlagsKHR = Binding<73, uint32_t>;
+using VkAcquireProfilingLockFlagBitsKHR = VkAcquireProfilingLockFlagsKHR;
+using VkSemaphoreWaitFlags = Binding<74, uint32_t>;
+using VkSemaphoreWaitFlagBits = VkSemaphoreWaitFlags;
+using VkPipelineCompilerControlFlagsAMD = Binding<75, uint32_t>;
+using VkPipelineCompilerControlFlagBitsAMD = VkPipelineCompilerControlFlagsAMD;
+using VkShaderCorePropertiesFlagsAMD = Binding<76, uint32_t>;
+using VkShaderCorePropertiesFlagBitsAMD = VkShaderCorePropertiesFlagsAMD;
+using VkDeviceDiagnosticsConfigFlagsNV = Binding<77, uint32_t>;
+using VkDeviceDiagnosticsConfigFlagBitsNV = VkDeviceDiagnosticsConfigFlagsNV;
+using VkRefreshObjectFlagsKHR = Binding<78, uint32_t>;
+using VkRefreshObjectFlagBitsKHR = VkRefreshObjectFlagsKHR;
+using VkAccessFlags2 = Binding<79, uint64_t>;
+using VkAccessFlagBits2 = VkAccessFlags2;
+using VkPipelineStageFlags2 = Binding<80, uint64_t>;
+using VkPipelineStageFlagBits2 = VkPipelineStageFlags2;
+using VkAccelerationStructureMotionInfoFlagsNV = Binding<81, uint32_t>;
+using VkAccelerationStructureMotionInfoFlagBitsNV = VkAccelerationStructureMotionInfoFlagsNV;
+using VkAccelerationStructureMotionInstanceFlagsNV = Binding<82, uint32_t>;
+using VkAccelerationStructureMotionInstanceFlagBitsNV =
+    VkAccelerationStructureMotionInstanceFlagsNV;
+using VkFormatFeatureFlags2 = Binding<83, uint64_t>;
+using VkFormatFeatureFlagBits2 = VkFormatFeatureFlags2;
+using VkFormatFeatureFlags4KHR = Binding<84, uint64_t>;
+using VkFormatFeatureFlagBits4KHR = VkFormatFeatureFlags4KHR;
+using VkRenderingFlags = Binding<85, uint32_t>;
+using VkRenderingFlagBits = VkRenderingFlags;
+using VkMemoryDecompressionMethodFlagsEXT = Binding<86, uint64_t>;
+using VkMemoryDecompressionMethodFlagBitsEXT = VkMemoryDecompressionMethodFlagsEXT;
+using VkDeviceFaultFlagsKHR = Binding<87, uint32_t>;
+using VkDeviceFaultFlagBitsKHR = VkDeviceFaultFlagsKHR;
+using VkBuildMicromapFlagsEXT = Binding<88, uint32_t>;
+using VkBuildMicromapFlagBitsEXT = VkBuildMicromapFlagsEXT;
+using VkMicromapCreateFlagsEXT = Binding<89, uint32_t>;
+using VkMicromapCreateFlagBitsEXT = VkMicromapCreateFlagsEXT;
+using VkIndirectCommandsLayoutUsageFlagsEXT = Binding<90, uint32_t>;
+using VkIndirectCommandsLayoutUsageFlagBitsEXT = VkIndirectCommandsLayoutUsageFlagsEXT;
+using VkIndirectCommandsInputModeFlagsEXT = Binding<91, uint32_t>;
+using VkIndirectCommandsInputModeFlagBitsEXT = VkIndirectCommandsInputModeFlagsEXT;
+using VkDirectDriverLoadingFlagsLUNARG = Binding<92, uint32_t>;
+using VkDirectDriverLoadingFlagBitsLUNARG = VkDirectDriverLoadingFlagsLUNARG;
+using VkPipelineCreateFlags2 = Binding<93, uint64_t>;
+using VkPipelineCreateFlagBits2 = VkPipelineCreateFlags2;
+using VkBufferUsageFlags2 = Binding<94, uint64_t>;
+using VkBufferUsageFlagBits2 = VkBufferUsageFlags2;
+using VkImageUsageFlags2KHR = Binding<95, uint64_t>;
+using VkImageUsageFlagBits2KHR = VkImageUsageFlags2KHR;
+using VkImageCreateFlags2KHR = Binding<96, uint64_t>;
+using VkImageCreateFlagBits2KHR = VkImageCreateFlags2KHR;
+using VkAddressCopyFlagsKHR = Binding<97, uint32_t>;
+using VkAddressCopyFlagBitsKHR = VkAddressCopyFlagsKHR;
+using VkTensorCreateFlagsARM = Binding<98, uint64_t>;
+using VkTensorCreateFlagBitsARM = VkTensorCreateFlagsARM;
+using VkTensorUsageFlagsARM = Binding<99, uint64_t>;
+using VkTensorUsageFlagBitsARM = VkTensorUsageFlagsARM;
+using VkTensorViewCreateFlagsARM = Binding<100, uint64_t>;
+using VkTensorViewCreateFlagBitsARM = VkTensorViewCreateFlagsARM;
+using VkDataGraphPipelineSessionCreateFlagsARM = Binding<101, uint64_t>;
+using VkDataGraphPipelineSessionCreateFlagBitsARM = VkDataGraphPipelineSessionCreateFlagsARM;
+using VkDataGraphPipelineDispatchFlagsARM = Binding<102, uint64_t>;
+using VkDataGraphPipelineDispatchFlagBitsARM = VkDataGraphPipelineDispatchFlagsARM;
+using VkVideoEncodeRgbModelConversionFlagsVALVE = Binding<103, uint32_t>;
+using VkVideoEncodeRgbModelConversionFlagBitsVALVE = VkVideoEncodeRgbModelConversionFlagsVALVE;
+using VkVideoEncodeRgbRangeCompressionFlagsVALVE = Binding<104, uint32_t>;
+using VkVideoEncodeRgbRangeCompressionFlagBitsVALVE = VkVideoEncodeRgbRangeCompressionFlagsVALVE;
+using VkVideoEncodeRgbChromaOffsetFlagsVALVE = Binding<105, uint32_t>;
+using VkVideoEncodeRgbChromaOffsetFlagBitsVALVE = VkVideoEncodeRgbChromaOffsetFlagsVALVE;
+using VkSpirvResourceTypeFlagsEXT = Binding<106, uint32_t>;
+using VkSpirvResourceTypeFlagBitsEXT = VkSpirvResourceTypeFlagsEXT;
+using VkGpaSqShaderStageFlagsAMD = Binding<107, uint32_t>;
+using VkGpaSqShaderStageFlagBitsAMD = VkGpaSqShaderStageFlagsAMD;
+using VkGpaPerfBlockPropertiesFlagsAMD = Binding<108, uint32_t>;
+using VkGpaPerfBlockPropertiesFlagBitsAMD = VkGpaPerfBlockPropertiesFlagsAMD;
+using VkPhysicalDeviceGpaPropertiesFlagsAMD = Binding<109, uint32_t>;
+using VkPhysicalDeviceGpaPropertiesFlagBitsAMD = VkPhysicalDeviceGpaPropertiesFlagsAMD;
+using VkAddressCommandFlagsKHR = Binding<110, uint32_t>;
+using VkAddressCommandFlagBitsKHR = VkAddressCommandFlagsKHR;
+using VkCompositeAlphaFlagsKHR = Binding<111, uint32_t>;
+using VkCompositeAlphaFlagBitsKHR = VkCompositeAlphaFlagsKHR;
+using VkDisplayPlaneAlphaFlagsKHR = Binding<112, uint32_t>;
+using VkDisplayPlaneAlphaFlagBitsKHR = VkDisplayPlaneAlphaFlagsKHR;
+using VkSurfaceTransformFlagsKHR = Binding<113, uint32_t>;
+using VkSurfaceTransformFlagBitsKHR = VkSurfaceTransformFlagsKHR;
+using VkSwapchainCreateFlagsKHR = Binding<114, uint32_t>;
+using VkSwapchainCreateFlagBitsKHR = VkSwapchainCreateFlagsKHR;
+using VkDisplayModeCreateFlagsKHR = Binding<115, uint32_t>;
+using VkDisplayModeCreateFlagBitsKHR = VkDisplayModeCreateFlagsKHR;
+using VkDisplaySurfaceCreateFlagsKHR = Binding<116, uint32_t>;
+using VkDisplaySurfaceCreateFlagBitsKHR = VkDisplaySurfaceCreateFlagsKHR;
+using VkAndroidSurfaceCreateFlagsKHR = Binding<117, uint32_t>;
+using VkAndroidSurfaceCreateFlagBitsKHR = VkAndroidSurfaceCreateFlagsKHR;
+using VkViSurfaceCreateFlagsNN = Binding<118, uint32_t>;
+using VkViSurfaceCreateFlagBitsNN = VkViSurfaceCreateFlagsNN;
+using VkWaylandSurfaceCreateFlagsKHR = Binding<119, uint32_t>;
+using VkWaylandSurfaceCreateFlagBitsKHR = VkWaylandSurfaceCreateFlagsKHR;
+using VkUbmSurfaceCreateFlagsSEC = Binding<120, uint32_t>;
+using VkUbmSurfaceCreateFlagBitsSEC = VkUbmSurfaceCreateFlagsSEC;
+using VkWin32SurfaceCreateFlagsKHR = Binding<121, uint32_t>;
+using VkWin32SurfaceCreateFlagBitsKHR = VkWin32SurfaceCreateFlagsKHR;
+using VkXlibSurfaceCreateFlagsKHR = Binding<122, uint32_t>;
+using VkXlibSurfaceCreateFlagBitsKHR = VkXlibSurfaceCreateFlagsKHR;
+using VkXcbSurfaceCreateFlagsKHR = Binding<123, uint32_t>;
+using VkXcbSurfaceCreateFlagBitsKHR = VkXcbSurfaceCreateFlagsKHR;
+using VkDirectFBSurfaceCreateFlagsEXT = Binding<124, uint32_t>;
+using VkDirectFBSurfaceCreateFlagBitsEXT = VkDirectFBSurfaceCreateFlagsEXT;
+using VkIOSSurfaceCreateFlagsMVK = Binding<125, uint32_t>;
+using VkIOSSurfaceCreateFlagBitsMVK = VkIOSSurfaceCreateFlagsMVK;
+using VkMacOSSurfaceCreateFlagsMVK = Binding<126, uint32_t>;
+using VkMacOSSurfaceCreateFlagBitsMVK = VkMacOSSurfaceCreateFlagsMVK;
+using VkMetalSurfaceCreateFlagsEXT = Binding<127, uint32_t>;
+using VkMetalSurfaceCreateFlagBitsEXT = VkMetalSurfaceCreateFlagsEXT;
+using VkImagePipeSurfaceCreateFlagsFUCHSIA = Binding<128, uint32_t>;
+using VkImagePipeSurfaceCreateFlagBitsFUCHSIA = VkImagePipeSurfaceCreateFlagsFUCHSIA;
+using VkStreamDescriptorSurfaceCreateFlagsGGP = Binding<129, uint32_t>;
+using VkStreamDescriptorSurfaceCreateFlagBitsGGP = VkStreamDescriptorSurfaceCreateFlagsGGP;
+using VkHeadlessSurfaceCreateFlagsEXT = Binding<130, uint32_t>;
+using VkHeadlessSurfaceCreateFlagBitsEXT = VkHeadlessSurfaceCreateFlagsEXT;
+using VkScreenSurfaceCreateFlagsQNX = Binding<131, uint32_t>;
+using VkScreenSurfaceCreateFlagBitsQNX = VkScreenSurfaceCreateFlagsQNX;
+using VkPeerMemoryFeatureFlags = Binding<132, uint32_t>;
+using VkPeerMemoryFeatureFlagBits = VkPeerMemoryFeatureFlags;
+using VkMemoryAllocateFlags = Binding<133, uint32_t>;
+using VkMemoryAllocateFlagBits = VkMemoryAllocateFlags;
+using VkDeviceGroupPresentModeFlagsKHR = Binding<134, uint32_t>;
+using VkDeviceGroupPresentModeFlagBitsKHR = VkDeviceGroupPresentModeFlagsKHR;
+using VkDebugReportFlagsEXT = Binding<135, uint32_t>;
+using VkDebugReportFlagBitsEXT = VkDebugReportFlagsEXT;
+using VkCommandPoolTrimFlags = Binding<136, uint32_t>;
+using VkCommandPoolTrimFlagBits = VkCommandPoolTrimFlags;
+using VkExternalMemoryHandleTypeFlagsNV = Binding<137, uint32_t>;
+using VkExternalMemoryHandleTypeFlagBitsNV = VkExternalMemoryHandleTypeFlagsNV;
+using VkClusterAccelerationStructureIndexFormatFlagsNV = Binding<138, uint32_t>;
+using VkClusterAccelerationStructureIndexFormatFlagBitsNV =
+    VkClusterAccelerationStructureIndexFormatFlagsNV;
+using VkExternalMemoryFeatureFlagsNV = Binding<139, uint32_t>;
+using VkExternalMemoryFeatureFlagBitsNV = VkExternalMemoryFeatureFlagsNV;
+using VkExternalMemoryHandleTypeFlags = Binding<140, uint32_t>;
+using VkExternalMemoryHandleTypeFlagBits = VkExternalMemoryHandleTypeFlags;
+using VkExternalMemoryFeatureFlags = Binding<141, uint32_t>;
+using VkExternalMemoryFeatureFlagBits = VkExternalMemoryFeatureFlags;
+using VkExternalSemaphoreHandleTypeFlags = Binding<142, uint32_t>;
+using VkExternalSemaphoreHandleTypeFlagBits = VkExternalSemaphoreHandleTypeFlags;
+using VkExternalSemaphoreFeatureFlags = Binding<143, uint32_t>;
+using VkExternalSemaphoreFeatureFlagBits = VkExternalSemaphoreFeatureFlags;
+using VkSemaphoreImportFlags = Binding<144, uint32_t>;
+using VkSemaphoreImportFlagBits = VkSemaphoreImportFlags;
+using VkExternalFenceHandleTypeFlags = Binding<145, uint32_t>;
+using VkExternalFenceHandleTypeFlagBits = VkExternalFenceHandleTypeFlags;
+using VkExternalFenceFeatureFlags = Binding<146, uint32_t>;
+using VkExternalFenceFeatureFlagBits = VkExternalFenceFeatureFlags;
+using VkFenceImportFlags = Binding<147, uint32_t>;
+using VkFenceImportFlagBits = VkFenceImportFlags;
+using VkSurfaceCounterFlagsEXT = Binding<148, uint32_t>;
+using VkSurfaceCounterFlagBitsEXT = VkSurfaceCounterFlagsEXT;
+using VkPipelineViewportSwizzleStateCreateFlagsNV = Binding<149, uint32_t>;
+using VkPipelineViewportSwizzleStateCreateFlagBitsNV = VkPipelineViewportSwizzleStateCreateFlagsNV;
+using VkPipelineDiscardRectangleStateCreateFlagsEXT = Binding<150, uint32_t>;
+using VkPipelineDiscardRectangleStateCreateFlagBitsEXT =
+    VkPipelineDiscardRectangleStateCreateFlagsEXT;
+using VkPipelineCoverageToColorStateCreateFlagsNV = Binding<151, uint32_t>;
+using VkPipelineCoverageToColorStateCreateFlagBitsNV = VkPipelineCoverageToColorStateCreateFlagsNV;
+using VkPipelineCoverageModulationStateCreateFlagsNV = Binding<152, uint32_t>;
+using VkPipelineCoverageModulationStateCreateFlagBitsNV =
+    VkPipelineCoverageModulationStateCreateFlagsNV;
+using VkPipelineCoverageReductionStateCreateFlagsNV = Binding<153, uint32_t>;
+using VkPipelineCoverageReductionStateCreateFlagBitsNV =
+    VkPipelineCoverageReductionStateCreateFlagsNV;
+using VkValidationCacheCreateFlagsEXT = Binding<154, uint32_t>;
+using VkValidationCacheCreateFlagBitsEXT = VkValidationCacheCreateFlagsEXT;
+using VkDebugUtilsMessageSeverityFlagsEXT = Binding<155, uint32_t>;
+using VkDebugUtilsMessageSeverityFlagBitsEXT = VkDebugUtilsMessageSeverityFlagsEXT;
+using VkDebugUtilsMessageTypeFlagsEXT = Binding<156, uint32_t>;
+using VkDebugUtilsMessageTypeFlagBitsEXT = VkDebugUtilsMessageTypeFlagsEXT;
+using VkDebugUtilsMessengerCreateFlagsEXT = Binding<157, uint32_t>;
+using VkDebugUtilsMessengerCreateFlagBitsEXT = VkDebugUtilsMessengerCreateFlagsEXT;
+using VkDebugUtilsMessengerCallbackDataFlagsEXT = Binding<158, uint32_t>;
+using VkDebugUtilsMessengerCallbackDataFlagBitsEXT = VkDebugUtilsMessengerCallbackDataFlagsEXT;
+using VkDeviceMemoryReportFlagsEXT = Binding<159, uint32_t>;
+using VkDeviceMemoryReportFlagBitsEXT = VkDeviceMemoryReportFlagsEXT;
+using VkPipelineRasterizationConservativeStateCreateFlagsEXT = Binding<160, uint32_t>;
+using VkPipelineRasterizationConservativeStateCreateFlagBitsEXT =
+    VkPipelineRasterizationConservativeStateCreateFlagsEXT;
+using VkDescriptorBindingFlags = Binding<161, uint32_t>;
+using VkDescriptorBindingFlagBits = VkDescriptorBindingFlags;
+using VkConditionalRenderingFlagsEXT = Binding<162, uint32_t>;
+using VkConditionalRenderingFlagBitsEXT = VkConditionalRenderingFlagsEXT;
+using VkResolveModeFlags = Binding<163, uint32_t>;
+using VkResolveModeFlagBits = VkResolveModeFlags;
+using VkPipelineRasterizationStateStreamCreateFlagsEXT = Binding<164, uint32_t>;
+using VkPipelineRasterizationStateStreamCreateFlagBitsEXT =
+    VkPipelineRasterizationStateStreamCreateFlagsEXT;
+using VkPipelineRasterizationDepthClipStateCreateFlagsEXT = Binding<165, uint32_t>;
+using VkPipelineRasterizationDepthClipStateCreateFlagBitsEXT =
+    VkPipelineRasterizationDepthClipStateCreateFlagsEXT;
+using VkSwapchainImageUsageFlagsANDROID = Binding<166, uint32_t>;
+using VkSwapchainImageUsageFlagBitsANDROID = VkSwapchainImageUsageFlagsANDROID;
+using VkToolPurposeFlags = Binding<167, uint32_t>;
+using VkToolPurposeFlagBits = VkToolPurposeFlags;
+using VkSubmitFlags = Binding<168, uint32_t>;
+using VkSubmitFlagBits = VkSubmitFlags;
+using VkImageFormatConstraintsFlagsFUCHSIA = Binding<169, uint32_t>;
+using VkImageFormatConstraintsFlagBitsFUCHSIA = VkImageFormatConstraintsFlagsFUCHSIA;
+using VkHostImageCopyFlags = Binding<170, uint32_t>;
+using VkHostImageCopyFlagBits = VkHostImageCopyFlags;
+using VkPartitionedAccelerationStructureInstanceFlagsNV = Binding<171, uint32_t>;
+using VkPartitionedAccelerationStructureInstanceFlagBitsNV =
+    VkPartitionedAccelerationStructureInstanceFlagsNV;
+using VkImageConstraintsInfoFlagsFUCHSIA = Binding<172, uint32_t>;
+using VkImageConstraintsInfoFlagBitsFUCHSIA = VkImageConstraintsInfoFlagsFUCHSIA;
+using VkGraphicsPipelineLibraryFlagsEXT = Binding<173, uint32_t>;
+using VkGraphicsPipelineLibraryFlagBitsEXT = VkGraphicsPipelineLibraryFlagsEXT;
+using VkImageCompressionFlagsEXT = Binding<174, uint32_t>;
+using VkImageCompressionFlagBitsEXT = VkImageCompressionFlagsEXT;
+using VkImageCompressionFixedRateFlagsEXT = Binding<175, uint32_t>;
+using VkImageCompressionFixedRateFlagBitsEXT = VkImageCompressionFixedRateFlagsEXT;
+using VkExportMetalObjectTypeFlagsEXT = Binding<176, uint32_t>;
+using VkExportMetalObjectTypeFlagBitsEXT = VkExportMetalObjectTypeFlagsEXT;
+using VkRenderingAttachmentFlagsKHR = Binding<177, uint32_t>;
+using VkRenderingAttachmentFlagBitsKHR = VkRenderingAttachmentFlagsKHR;
+using VkResolveImageFlagsKHR = Binding<178, uint32_t>;
+using VkResolveImageFlagBitsKHR = VkResolveImageFlagsKHR;
+using VkDeviceAddressBindingFlagsEXT = Binding<179, uint32_t>;
+using VkDeviceAddressBindingFlagBitsEXT = VkDeviceAddressBindingFlagsEXT;
+using VkOpticalFlowGridSizeFlagsNV = Binding<180, uint32_t>;
+using VkOpticalFlowGridSizeFlagBitsNV = VkOpticalFlowGridSizeFlagsNV;
+using VkOpticalFlowUsageFlagsNV = Binding<181, uint32_t>;
+using VkOpticalFlowUsageFlagBitsNV = VkOpticalFlowUsageFlagsNV;
+using VkOpticalFlowSessionCreateFlagsNV = Binding<182, uint32_t>;
+using VkOpticalFlowSessionCreateFlagBitsNV = VkOpticalFlowSessionCreateFlagsNV;
+using VkOpticalFlowExecuteFlagsNV = Binding<183, uint32_t>;
+using VkOpticalFlowExecuteFlagBitsNV = VkOpticalFlowExecuteFlagsNV;
+using VkFrameBoundaryFlagsEXT = Binding<184, uint32_t>;
+using VkFrameBoundaryFlagBitsEXT = VkFrameBoundaryFlagsEXT;
+using VkPresentScalingFlagsKHR = Binding<185, uint32_t>;
+using VkPresentScalingFlagBitsKHR = VkPresentScalingFlagsKHR;
+using VkPresentGravityFlagsKHR = Binding<186, uint32_t>;
+using VkPresentGravityFlagBitsKHR = VkPresentGravityFlagsKHR;
+using VkShaderCreateFlagsEXT = Binding<187, uint32_t>;
+using VkShaderCreateFlagBitsEXT = VkShaderCreateFlagsEXT;
+using VkTileShadingRenderPassFlagsQCOM = Binding<188, uint32_t>;
+using VkTileShadingRenderPassFlagBitsQCOM = VkTileShadingRenderPassFlagsQCOM;
+using VkPhysicalDeviceSchedulingControlsFlagsARM = Binding<189, uint64_t>;
+using VkPhysicalDeviceSchedulingControlsFlagBitsARM = VkPhysicalDeviceSchedulingControlsFlagsARM;
+using VkSurfaceCreateFlagsOHOS = Binding<190, uint32_t>;
+using VkSurfaceCreateFlagBitsOHOS = VkSurfaceCreateFlagsOHOS;
+using VkPresentStageFlagsEXT = Binding<191, uint32_t>;
+using VkPresentStageFlagBitsEXT = VkPresentStageFlagsEXT;
+using VkPastPresentationTimingFlagsEXT = Binding<192, uint32_t>;
+using VkPastPresentationTimingFlagBitsEXT = VkPastPresentationTimingFlagsEXT;
+using VkPresentTimingInfoFlagsEXT = Binding<193, uint32_t>;
+using VkPresentTimingInfoFlagBitsEXT = VkPresentTimingInfoFlagsEXT;
+using VkSwapchainImageUsageFlagsOHOS = Binding<194, uint32_t>;
+using VkSwapchainImageUsageFlagBitsOHOS = VkSwapchainImageUsageFlagsOHOS;
+using VkPerformanceCounterDescriptionFlagsARM = Binding<195, uint32_t>;
+using VkPerformanceCounterDescriptionFlagBitsARM = VkPerformanceCounterDescriptionFlagsARM;
+using VkShaderInstrumentationValuesFlagsARM = Binding<196, uint32_t>;
+using VkShaderInstrumentationValuesFlagBitsARM = VkShaderInstrumentationValuesFlagsARM;
+using VkDataGraphTOSAQualityFlagsARM = Binding<197, uint32_t>;
+using VkDataGraphTOSAQualityFlagBitsARM = VkDataGraphTOSAQualityFlagsARM;
+using VkDataGraphOpticalFlowGridSizeFlagsARM = Binding<198, uint32_t>;
+using VkDataGraphOpticalFlowGridSizeFlagBitsARM = VkDataGraphOpticalFlowGridSizeFlagsARM;
+using VkDataGraphOpticalFlowImageUsageFlagsARM = Binding<199, uint32_t>;
+using VkDataGraphOpticalFlowImageUsageFlagBitsARM = VkDataGraphOpticalFlowImageUsageFlagsARM;
+using VkDataGraphOpticalFlowCreateFlagsARM = Binding<200, uint32_t>;
+using VkDataGraphOpticalFlowCreateFlagBitsARM = VkDataGraphOpticalFlowCreateFlagsARM;
+using VkDataGraphOpticalFlowExecuteFlagsARM = Binding<201, uint32_t>;
+using VkDataGraphOpticalFlowExecuteFlagBitsARM = VkDataGraphOpticalFlowExecuteFlagsARM;
+using VkVideoCodecOperationFlagsKHR = Binding<202, uint32_t>;
+using VkVideoCodecOperationFlagBitsKHR = VkVideoCodecOperationFlagsKHR;
+using VkVideoCapabilityFlagsKHR = Binding<203, uint32_t>;
+using VkVideoCapabilityFlagBitsKHR = VkVideoCapabilityFlagsKHR;
+using VkVideoSessionCreateFlagsKHR = Binding<204, uint32_t>;
+using VkVideoSessionCreateFlagBitsKHR = VkVideoSessionCreateFlagsKHR;
+using VkVideoSessionParametersCreateFlagsKHR = Binding<205, uint32_t>;
+using VkVideoSessionParametersCreateFlagBitsKHR = VkVideoSessionParametersCreateFlagsKHR;
+using VkVideoBeginCodingFlagsKHR = Binding<206, uint32_t>;
+using VkVideoBeginCodingFlagBitsKHR = VkVideoBeginCodingFlagsKHR;
+using VkVideoEndCodingFlagsKHR = Binding<207, uint32_t>;
+using VkVideoEndCodingFlagBitsKHR = VkVideoEndCodingFlagsKHR;
+using VkVideoCodingControlFlagsKHR = Binding<208, uint32_t>;
+using VkVideoCodingControlFlagBitsKHR = VkVideoCodingControlFlagsKHR;
+using VkVideoDecodeUsageFlagsKHR = Binding<209, uint32_t>;
+using VkVideoDecodeUsageFlagBitsKHR = VkVideoDecodeUsageFlagsKHR;
+using VkVideoDecodeCapabilityFlagsKHR = Binding<210, uint32_t>;
+using VkVideoDecodeCapabilityFlagBitsKHR = VkVideoDecodeCapabilityFlagsKHR;
+using VkVideoDecodeFlagsKHR = Binding<211, uint32_t>;
+using VkVideoDecodeFlagBitsKHR = VkVideoDecodeFlagsKHR;
+using VkVideoDecodeH264PictureLayoutFlagsKHR = Binding<212, uint32_t>;
+using VkVideoDecodeH264PictureLayoutFlagBitsKHR = VkVideoDecodeH264PictureLayoutFlagsKHR;
+using VkVideoEncodeFlagsKHR = Binding<213, uint32_t>;
+using VkVideoEncodeFlagBitsKHR = VkVideoEncodeFlagsKHR;
+using VkVideoEncodeUsageFlagsKHR = Binding<214, uint32_t>;
+using VkVideoEncodeUsageFlagBitsKHR = VkVideoEncodeUsageFlagsKHR;
+using VkVideoEncodeContentFlagsKHR = Binding<215, uint32_t>;
+using VkVideoEncodeContentFlagBitsKHR = VkVideoEncodeContentFlagsKHR;
+using VkVideoEncodeCapabilityFlagsKHR = Binding<216, uint32_t>;
+using VkVideoEncodeCapabilityFlagBitsKHR = VkVideoEncodeCapabilityFlagsKHR;
+using VkVideoEncodeFeedbackFlagsKHR = Binding<217, uint32_t>;
+using VkVideoEncodeFeedbackFlagBitsKHR = VkVideoEncodeFeedbackFlagsKHR;
+using VkVideoEncodePerPartitionFeedbackFlagsKHR = Binding<218, uint32_t>;
+using VkVideoEncodePerPartitionFeedbackFlagBitsKHR = VkVideoEncodePerPartitionFeedbackFlagsKHR;
+using VkVideoEncodeRateControlFlagsKHR = Binding<219, uint32_t>;
+using VkVideoEncodeRateControlFlagBitsKHR = VkVideoEncodeRateControlFlagsKHR;
+using VkVideoEncodeRateControlModeFlagsKHR = Binding<220, uint32_t>;
+using VkVideoEncodeRateControlModeFlagBitsKHR = VkVideoEncodeRateControlModeFlagsKHR;
+using VkVideoEncodeIntraRefreshModeFlagsKHR = Binding<221, uint32_t>;
+using VkVideoEncodeIntraRefreshModeFlagBitsKHR = VkVideoEncodeIntraRefreshModeFlagsKHR;
+using VkVideoChromaSubsamplingFlagsKHR = Binding<222, uint32_t>;
+using VkVideoChromaSubsamplingFlagBitsKHR = VkVideoChromaSubsamplingFlagsKHR;
+using VkVideoComponentBitDepthFlagsKHR = Binding<223, uint32_t>;
+using VkVideoComponentBitDepthFlagBitsKHR = VkVideoComponentBitDepthFlagsKHR;
+using VkVideoEncodeH264CapabilityFlagsKHR = Binding<224, uint32_t>;
+using VkVideoEncodeH264CapabilityFlagBitsKHR = VkVideoEncodeH264CapabilityFlagsKHR;
+using VkVideoEncodeH264StdFlagsKHR = Binding<225, uint32_t>;
+using VkVideoEncodeH264StdFlagBitsKHR = VkVideoEncodeH264StdFlagsKHR;
+using VkVideoEncodeH264RateControlFlagsKHR = Binding<226, uint32_t>;
+using VkVideoEncodeH264RateControlFlagBitsKHR = VkVideoEncodeH264RateControlFlagsKHR;
+using VkVideoEncodeH265CapabilityFlagsKHR = Binding<227, uint32_t>;
+using VkVideoEncodeH265CapabilityFlagBitsKHR = VkVideoEncodeH265CapabilityFlagsKHR;
+using VkVideoEncodeH265StdFlagsKHR = Binding<228, uint32_t>;
+using VkVideoEncodeH265StdFlagBitsKHR = VkVideoEncodeH265StdFlagsKHR;
+using VkVideoEncodeH265RateControlFlagsKHR = Binding<229, uint32_t>;
+using VkVideoEncodeH265RateControlFlagBitsKHR = VkVideoEncodeH265RateControlFlagsKHR;
+using VkVideoEncodeH265CtbSizeFlagsKHR = Binding<230, uint32_t>;
+using VkVideoEncodeH265CtbSizeFlagBitsKHR = VkVideoEncodeH265CtbSizeFlagsKHR;
+using VkVideoEncodeH265TransformBlockSizeFlagsKHR = Binding<231, uint32_t>;
+using VkVideoEncodeH265TransformBlockSizeFlagBitsKHR = VkVideoEncodeH265TransformBlockSizeFlagsKHR;
+using VkVideoEncodeAV1CapabilityFlagsKHR = Binding<232, uint32_t>;
+using VkVideoEncodeAV1CapabilityFlagBitsKHR = VkVideoEncodeAV1CapabilityFlagsKHR;
+using VkVideoEncodeAV1StdFlagsKHR = Binding<233, uint32_t>;
+using VkVideoEncodeAV1StdFlagBitsKHR = VkVideoEncodeAV1StdFlagsKHR;
+using VkVideoEncodeAV1RateControlFlagsKHR = Binding<234, uint32_t>;
+using VkVideoEncodeAV1RateControlFlagBitsKHR = VkVideoEncodeAV1RateControlFlagsKHR;
+using VkVideoEncodeAV1SuperblockSizeFlagsKHR = Binding<235, uint32_t>;
+using VkVideoEncodeAV1SuperblockSizeFlagBitsKHR = VkVideoEncodeAV1SuperblockSizeFlagsKHR;
+using VkAccessFlags3KHR = Binding<236, uint64_t>;
+using VkAccessFlagBits3KHR = VkAccessFlags3KHR;
+using VkAttachmentLoadOp = Binding<237, int32_t>;
+using VkAttachmentStoreOp = Binding<238, int32_t>;
+using VkBlendFactor = Binding<239, int32_t>;
+using VkBlendOp = Binding<240, int32_t>;
+using VkBorderColor = Binding<241, int32_t>;
+using VkPipelineCacheHeaderVersion = Binding<242, int32_t>;
+using VkComponentSwizzle = Binding<243, int32_t>;
+using VkCommandBufferLevel = Binding<244, int32_t>;
+using VkCompareOp = Binding<245, int32_t>;
+using VkDescriptorType = Binding<246, int32_t>;
+using VkDynamicState = Binding<247, int32_t>;
+using VkPolygonMode = Binding<248, int32_t>;
+using VkFormat = Binding<249, int32_t>;
+using VkFrontFace = Binding<250, int32_t>;
+using VkImageLayout = Binding<251, int32_t>;
+using VkImageTiling = Binding<252, int32_t>;
+using VkImageType = Binding<253, int32_t>;
+using VkImageViewType = Binding<254, int32_t>;
+using VkIndirectCommandsTokenTypeEXT = Binding<255, int32_t>;
+using VkSharingMode = Binding<256, int32_t>;
+using VkIndexType = Binding<257, int32_t>;
+using VkLogicOp = Binding<258, int32_t>;
+using VkPhysicalDeviceType = Binding<259, int32_t>;
+using VkPipelineBindPoint = Binding<260, int32_t>;
+using VkPrimitiveTopology = Binding<261, int32_t>;
+using VkQueryType = Binding<262, int32_t>;
+using VkSubpassContents = Binding<263, int32_t>;
+using VkStencilOp = Binding<264, int32_t>;
+using VkStructureType = Binding<265, int32_t>;
+using VkSystemAllocationScope = Binding<266, int32_t>;
+using VkInternalAllocationType = Binding<267, int32_t>;
+using VkSamplerAddressMode = Binding<268, int32_t>;
+using VkFilter = Binding<269, int32_t>;
+using VkSamplerMipmapMode = Binding<270, int32_t>;
+using VkVertexInputRate = Binding<271, int32_t>;
+using VkClusterAccelerationStructureTypeNV = Binding<272, int32_t>;
+using VkClusterAccelerationStructureOpTypeNV = Binding<273, int32_t>;
+using VkClusterAccelerationStructureOpModeNV = Binding<274, int32_t>;
+using VkObjectType = Binding<275, int32_t>;
+using VkRayTracingInvocationReorderModeEXT = Binding<276, int32_t>;
+using VkIndirectCommandsTokenTypeNV = Binding<277, int32_t>;
+using VkDescriptorUpdateTemplateType = Binding<278, int32_t>;
+using VkViewportCoordinateSwizzleNV = Binding<279, int32_t>;
+using VkDiscardRectangleModeEXT = Binding<280, int32_t>;
+using VkPointClippingBehavior = Binding<281, int32_t>;
+using VkCoverageModulationModeNV = Binding<282, int32_t>;
+using VkCoverageReductionModeNV = Binding<283, int32_t>;
+using VkValidationCacheHeaderVersionEXT = Binding<284, int32_t>;
+using VkShaderInfoTypeAMD = Binding<285, int32_t>;
+using VkQueueGlobalPriority = Binding<286, int32_t>;
+using VkTimeDomainKHR = Binding<287, int32_t>;
+using VkConservativeRasterizationModeEXT = Binding<288, int32_t>;
+using VkSemaphoreType = Binding<289, int32_t>;
+using VkBuildAccelerationStructureModeKHR = Binding<290, int32_t>;
+using VkCopyAccelerationStructureModeKHR = Binding<291, int32_t>;
+using VkAccelerationStructureTypeKHR = Binding<292, int32_t>;
+using VkGeometryTypeKHR = Binding<293, int32_t>;
+using VkRayTracingShaderGroupTypeKHR = Binding<294, int32_t>;
+using VkAccelerationStructureBuildTypeKHR = Binding<295, int32_t>;
+using VkAccelerationStructureCompatibilityKHR = Binding<296, int32_t>;
+using VkRayTracingLssIndexingModeNV = Binding<297, int32_t>;
+using VkRayTracingLssPrimitiveEndCapsModeNV = Binding<298, int32_t>;
+using VkShaderGroupShaderKHR = Binding<299, int32_t>;
+using VkMemoryOverallocationBehaviorAMD = Binding<300, int32_t>;
+using VkPerformanceCounterScopeKHR = Binding<301, int32_t>;
+using VkPerformanceCounterUnitKHR = Binding<302, int32_t>;
+using VkPerformanceCounterStorageKHR = Binding<303, int32_t>;
+using VkPerformanceConfigurationTypeINTEL = Binding<304, int32_t>;
+using VkQueryPoolSamplingModeINTEL = Binding<305, int32_t>;
+using VkPerformanceOverrideTypeINTEL = Binding<306, int32_t>;
+using VkPerformanceParameterTypeINTEL = Binding<307, int32_t>;
+using VkPerformanceValueTypeINTEL = Binding<308, int32_t>;
+using VkLineRasterizationMode = Binding<309, int32_t>;
+using VkFaultLevel = Binding<310, int32_t>;
+using VkFaultType = Binding<311, int32_t>;
+using VkFaultQueryBehavior = Binding<312, int32_t>;
+using VkPipelineMatchControl = Binding<313, int32_t>;
+using VkSciSyncClientTypeNV = Binding<314, int32_t>;
+using VkSciSyncPrimitiveTypeNV = Binding<315, int32_t>;
+using VkFragmentShadingRateNV = Binding<316, int32_t>;
+using VkFragmentShadingRateTypeNV = Binding<317, int32_t>;
+using VkSubpassMergeStatusEXT = Binding<318, int32_t>;
+using VkProvokingVertexModeEXT = Binding<319, int32_t>;
+using VkPipelineCacheValidationVersion = Binding<320, int32_t>;
+using VkPipelineRobustnessBufferBehavior = Binding<321, int32_t>;
+using VkPipelineRobustnessImageBehavior = Binding<322, int32_t>;
+using VkDeviceAddressBindingTypeEXT = Binding<323, int32_t>;
+using VkMicromapTypeEXT = Binding<324, int32_t>;
+using VkBuildMicromapModeEXT = Binding<325, int32_t>;
+using VkCopyMicromapModeEXT = Binding<326, int32_t>;
+using VkOpacityMicromapFormatKHR = Binding<327, int32_t>;
+using VkOpacityMicromapSpecialIndexKHR = Binding<328, int32_t>;
+using VkAccelerationStructureSerializedBlockTypeKHR = Binding<329, int32_t>;
+using VkIndirectExecutionSetInfoTypeEXT = Binding<330, int32_t>;
+using VkDeviceFaultVendorBinaryHeaderVersionKHR = Binding<331, int32_t>;
+using VkDepthBiasRepresentationEXT = Binding<332, int32_t>;
+using VkDirectDriverLoadingModeLUNARG = Binding<333, int32_t>;
+using VkPartitionedAccelerationStructureOpTypeNV = Binding<334, int32_t>;
+using VkAntiLagModeAMD = Binding<335, int32_t>;
+using VkAntiLagStageAMD = Binding<336, int32_t>;
+using VkDisplacementMicromapFormatNV = Binding<337, int32_t>;
+using VkShaderCodeTypeEXT = Binding<338, int32_t>;
+using VkScopeKHR = Binding<339, int32_t>;
+using VkComponentTypeKHR = Binding<340, int32_t>;
+using VkCubicFilterWeightsQCOM = Binding<341, int32_t>;
+using VkBlockMatchWindowCompareModeQCOM = Binding<342, int32_t>;
+using VkLayeredDriverUnderlyingApiMSFT = Binding<343, int32_t>;
+using VkPhysicalDeviceLayeredApiKHR = Binding<344, int32_t>;
+using VkCompressedTriangleFormatAMDX = Binding<345, int32_t>;
+using VkDepthClampModeEXT = Binding<346, int32_t>;
+using VkCooperativeVectorMatrixLayoutNV = Binding<347, int32_t>;
+using VkTensorTilingARM = Binding<348, int32_t>;
+using VkDataGraphPipelinePropertyARM = Binding<349, int32_t>;
+using VkDataGraphPipelineSessionBindPointARM = Binding<350, int32_t>;
+using VkDataGraphPipelineSessionBindPointTypeARM = Binding<351, int32_t>;
+using VkPhysicalDeviceDataGraphProcessingEngineTypeARM = Binding<352, int32_t>;
+using VkPhysicalDeviceDataGraphOperationTypeARM = Binding<353, int32_t>;
+using VkDataGraphModelCacheTypeQCOM = Binding<354, int32_t>;
+using VkPerfHintTypeQCOM = Binding<355, int32_t>;
+using VkDescriptorMappingSourceEXT = Binding<356, int32_t>;
+using VkGpaPerfBlockAMD = Binding<357, int32_t>;
+using VkGpaSampleTypeAMD = Binding<358, int32_t>;
+using VkGpaDeviceClockModeAMD = Binding<359, int32_t>;
+using VkDataGraphTOSALevelARM = Binding<360, int32_t>;
+using VkDataGraphOpticalFlowPerformanceLevelARM = Binding<361, int32_t>;
+using VkDataGraphPipelineNodeConnectionTypeARM = Binding<362, int32_t>;
+using VkDataGraphPipelineNodeTypeARM = Binding<363, int32_t>;
+using VkNeuralAcceleratorStatisticsModeARM = Binding<364, int32_t>;
+using VkThrottleHintTypeSEC = Binding<365, int32_t>;
+using VkColorSpaceKHR = Binding<366, int32_t>;
+using VkPresentModeKHR = Binding<367, int32_t>;
+using VkDisplaySurfaceStereoTypeNV = Binding<368, int32_t>;
+using VkDebugReportObjectTypeEXT = Binding<369, int32_t>;
+using VkDeviceMemoryReportEventTypeEXT = Binding<370, int32_t>;
+using VkRasterizationOrderAMD = Binding<371, int32_t>;
+using VkValidationCheckEXT = Binding<372, int32_t>;
+using VkValidationFeatureEnableEXT = Binding<373, int32_t>;
+using VkValidationFeatureDisableEXT = Binding<374, int32_t>;
+using VkDisplayPowerStateEXT = Binding<375, int32_t>;
+using VkDeviceEventTypeEXT = Binding<376, int32_t>;
+using VkDisplayEventTypeEXT = Binding<377, int32_t>;
+using VkTessellationDomainOrigin = Binding<378, int32_t>;
+using VkSamplerYcbcrModelConversion = Binding<379, int32_t>;
+using VkSamplerYcbcrRange = Binding<380, int32_t>;
+using VkChromaLocation = Binding<381, int32_t>;
+using VkSamplerReductionMode = Binding<382, int32_t>;
+using VkBlendOverlapEXT = Binding<383, int32_t>;
+using VkFullScreenExclusiveEXT = Binding<384, int32_t>;
+using VkShaderFloatControlsIndependence = Binding<385, int32_t>;
+using VkFragmentShadingRateCombinerOpKHR = Binding<386, int32_t>;
+using VkOpticalFlowPerformanceLevelNV = Binding<387, int32_t>;
+using VkOpticalFlowSessionBindingPointNV = Binding<388, int32_t>;
+using VkDeviceFaultAddressTypeKHR = Binding<389, int32_t>;
+using VkLayerSettingTypeEXT = Binding<390, int32_t>;
+using VkLatencyMarkerNV = Binding<391, int32_t>;
+using VkOutOfBandQueueTypeNV = Binding<392, int32_t>;
+using VkVendorId = Binding<393, int32_t>;
+using VkDriverId = Binding<394, int32_t>;
+using VkShadingRatePaletteEntryNV = Binding<395, int32_t>;
+using VkCoarseSampleOrderTypeNV = Binding<396, int32_t>;
+using VkPipelineExecutableStatisticFormatKHR = Binding<397, int32_t>;
+using VkQueryResultStatusKHR = Binding<398, int32_t>;
+using VkVideoEncodeTuningModeKHR = Binding<399, int32_t>;
+using VkVideoEncodeAV1PredictionModeKHR = Binding<400, int32_t>;
+using VkVideoEncodeAV1RateControlGroupKHR = Binding<401, int32_t>;
+using VkDefaultVertexAttributeValueKHR = Binding<402, int32_t>;
+using VkAccelerationStructureMotionInstanceTypeNV = Binding<403, int32_t>;
+using VkVideoEncodeH264CapabilityFlagsEXT = Binding<404, uint32_t>;
+using VkVideoEncodeH264CapabilityFlagBitsEXT = VkVideoEncodeH264CapabilityFlagsEXT;
+using VkVideoEncodeH264StdFlagsEXT = Binding<405, uint32_t>;
+using VkVideoEncodeH264StdFlagBitsEXT = VkVideoEncodeH264StdFlagsEXT;
+using VkVideoEncodeH264RateControlFlagsEXT = Binding<406, uint32_t>;
+using VkVideoEncodeH264RateControlFlagBitsEXT = VkVideoEncodeH264RateControlFlagsEXT;
+using VkVideoEncodeH265CapabilityFlagsEXT = Binding<407, uint32_t>;
+using VkVideoEncodeH265CapabilityFlagBitsEXT = VkVideoEncodeH265CapabilityFlagsEXT;
+using VkVideoEncodeH265StdFlagsEXT = Binding<408, uint32_t>;
+using VkVideoEncodeH265StdFlagBitsEXT = VkVideoEncodeH265StdFlagsEXT;
+using VkVideoEncodeH265RateControlFlagsEXT = Binding<409, uint32_t>;
+using VkVideoEncodeH265RateControlFlagBitsEXT = VkVideoEncodeH265RateControlFlagsEXT;
+using VkVideoEncodeH265CtbSizeFlagsEXT = Binding<410, uint32_t>;
+using VkVideoEncodeH265CtbSizeFlagBitsEXT = VkVideoEncodeH265CtbSizeFlagsEXT;
+using VkVideoEncodeH265TransformBlockSizeFlagsEXT = Binding<411, uint32_t>;
+using VkVideoEncodeH265TransformBlockSizeFlagBitsEXT = VkVideoEncodeH265TransformBlockSizeFlagsEXT;
+using VkVideoEncodeH264RateControlStructureEXT = Binding<412, int32_t>;
+using VkVideoEncodeH265RateControlStructureEXT = Binding<413, int32_t>;
+using VkVideoEncodeH264InputModeFlagsEXT = Binding<414, uint32_t>;
+using VkVideoEncodeH264InputModeFlagBitsEXT = VkVideoEncodeH264InputModeFlagsEXT;
+using VkVideoEncodeH264OutputModeFlagsEXT = Binding<415, uint32_t>;
+using VkVideoEncodeH264OutputModeFlagBitsEXT = VkVideoEncodeH264OutputModeFlagsEXT;
+using VkVideoEncodeH265InputModeFlagsEXT = Binding<416, uint32_t>;
+using VkVideoEncodeH265InputModeFlagBitsEXT = VkVideoEncodeH265InputModeFlagsEXT;
+using VkVideoEncodeH265OutputModeFlagsEXT = Binding<417, uint32_t>;
+using VkVideoEncodeH265OutputModeFlagBitsEXT = VkVideoEncodeH265OutputModeFlagsEXT;
+using VkVideoDecodeH264PictureLayoutFlagsEXT = Binding<418, uint32_t>;
+using VkVideoDecodeH264PictureLayoutFlagBitsEXT = VkVideoDecodeH264PictureLayoutFlagsEXT;
+using VkVideoCodingQualityPresetFlagsKHR = Binding<419, uint32_t>;
+using VkVideoCodingQualityPresetFlagBitsKHR = VkVideoCodingQualityPresetFlagsKHR;
+using VkVideoEncodeH264RateControlStructureFlagsEXT = Binding<420, uint32_t>;
+using VkVideoEncodeH264RateControlStructureFlagBitsEXT =
+    VkVideoEncodeH264RateControlStructureFlagsEXT;
+using VkVideoEncodeH265RateControlStructureFlagsEXT = Binding<421, uint32_t>;
+using VkVideoEncodeH265RateControlStructureFlagBitsEXT =
+    VkVideoEncodeH265RateControlStructureFlagsEXT;
+using VkVideoDecodeH264CreateFlagsEXT = Binding<422, uint32_t>;
+using VkVideoDecodeH264CreateFlagBitsEXT = VkVideoDecodeH264CreateFlagsEXT;
+using VkVideoDecodeH265CreateFlagsEXT = Binding<423, uint32_t>;
+using VkVideoDecodeH265CreateFlagBitsEXT = VkVideoDecodeH265CreateFlagsEXT;
+using VkVideoEncodeH264CreateFlagsEXT = Binding<424, uint32_t>;
+using VkVideoEncodeH264CreateFlagBitsEXT = VkVideoEncodeH264CreateFlagsEXT;
+using VkVideoEncodeH265CreateFlagsEXT = Binding<425, uint32_t>;
+using VkVideoEncodeH265CreateFlagBitsEXT = VkVideoEncodeH265CreateFlagsEXT;
+using VkVideoCapabilitiesFlagsKHR = Binding<426, uint32_t>;
+using VkVideoCapabilitiesFlagBitsKHR = VkVideoCapabilitiesFlagsKHR;
+using VkVideoDecodeH264FieldLayoutFlagsEXT = Binding<427, uint32_t>;
+using VkVideoDecodeH264FieldLayoutFlagBitsEXT = VkVideoDecodeH264FieldLayoutFlagsEXT;
+using VkVideoEncodeH264CapabilitiesFlagsEXT = Binding<428, uint32_t>;
+using VkVideoEncodeH264CapabilitiesFlagBitsEXT = VkVideoEncodeH264CapabilitiesFlagsEXT;
+using VkAccelerationStructureMemoryRequirementsTypeKHR = Binding<429, int32_t>;
+using VkIndirectCommandsLayoutUsageFlagsNVX = Binding<430, uint32_t>;
+using VkIndirectCommandsLayoutUsageFlagBitsNVX = VkIndirectCommandsLayoutUsageFlagsNVX;
+using VkObjectEntryUsageFlagsNVX = Binding<431, uint32_t>;
+using VkObjectEntryUsageFlagBitsNVX = VkObjectEntryUsageFlagsNVX;
+using VkIndirectCommandsTokenTypeNVX = Binding<432, int32_t>;
+using VkObjectEntryTypeNVX = Binding<433, int32_t>;
+using VkGeometryFlagsNVX = Binding<434, uint32_t>;
+using VkGeometryFlagBitsNVX = VkGeometryFlagsNVX;
+using VkGeometryInstanceFlagsNVX = Binding<435, uint32_t>;
+using VkGeometryInstanceFlagBitsNVX = VkGeometryInstanceFlagsNVX;
+using VkBuildAccelerationStructureFlagsNVX = Binding<436, uint32_t>;
+using VkBuildAccelerationStructureFlagBitsNVX = VkBuildAccelerationStructureFlagsNVX;
+using VkMirSurfaceCreateFlagsKHR = Binding<437, uint32_t>;
+using VkMirSurfaceCreateFlagBitsKHR = VkMirSurfaceCreateFlagsKHR;
+using VkCopyAccelerationStructureModeNVX = Binding<438, int32_t>;
+using VkAccelerationStructureTypeNVX = Binding<439, int32_t>;
+using VkGeometryTypeNVX = Binding<440, int32_t>;
+using VkMemoryUnmapFlagsKHR = VkMemoryUnmapFlags;
+using VkMemoryUnmapFlagBitsKHR = VkMemoryUnmapFlags;
+using VkGeometryFlagsNV = VkGeometryFlagsKHR;
+using VkGeometryFlagBitsNV = VkGeometryFlagsKHR;
+using VkGeometryInstanceFlagsNV = VkGeometryInstanceFlagsKHR;
+using VkGeometryInstanceFlagBitsNV = VkGeometryInstanceFlagsKHR;
+using VkBuildAccelerationStructureFlagsNV = VkBuildAccelerationStructureFlagsKHR;
+using VkBuildAccelerationStructureFlagBitsNV = VkBuildAccelerationStructureFlagsKHR;
+using VkPrivateDataSlotCreateFlagsEXT = VkPrivateDataSlotCreateFlags;
+using VkPrivateDataSlotCreateFlagBitsEXT = VkPrivateDataSlotCreateFlags;
+using VkDescriptorUpdateTemplateCreateFlagsKHR = VkDescriptorUpdateTemplateCreateFlags;
+using VkDescriptorUpdateTemplateCreateFlagBitsKHR = VkDescriptorUpdateTemplateCreateFlags;
+using VkPipelineCreationFeedbackFlagsEXT = VkPipelineCreationFeedbackFlags;
+using VkPipelineCreationFeedbackFlagBitsEXT = VkPipelineCreationFeedbackFlags;
+using VkSemaphoreWaitFlagsKHR = VkSemaphoreWaitFlags;
+using VkSemaphoreWaitFlagBitsKHR = VkSemaphoreWaitFlags;
+using VkAccessFlags2KHR = VkAccessFlags2;
+using VkAccessFlagBits2KHR = VkAccessFlags2;
+using VkPipelineStageFlags2KHR = VkPipelineStageFlags2;
+using VkPipelineStageFlagBits2KHR = VkPipelineStageFlags2;
+using VkFormatFeatureFlags2KHR = VkFormatFeatureFlags2;
+using VkFormatFeatureFlagBits2KHR = VkFormatFeatureFlags2;
+using VkMemoryDecompressionMethodFlagsNV = VkMemoryDecompressionMethodFlagsEXT;
+using VkMemoryDecompressionMethodFlagBitsNV = VkMemoryDecompressionMethodFlagsEXT;
+using VkRenderingFlagsKHR = VkRenderingFlags;
+using VkRenderingFlagBitsKHR = VkRenderingFlags;
+using VkPipelineCreateFlags2KHR = VkPipelineCreateFlags2;
+using VkPipelineCreateFlagBits2KHR = VkPipelineCreateFlags2;
+using VkBufferUsageFlags2KHR = VkBufferUsageFlags2;
+using VkBufferUsageFlagBits2KHR = VkBufferUsageFlags2;
+using VkPeerMemoryFeatureFlagsKHR = VkPeerMemoryFeatureFlags;
+using VkPeerMemoryFeatureFlagBitsKHR = VkPeerMemoryFeatureFlags;
+using VkMemoryAllocateFlagsKHR = VkMemoryAllocateFlags;
+using VkMemoryAllocateFlagBitsKHR = VkMemoryAllocateFlags;
+using VkCommandPoolTrimFlagsKHR = VkCommandPoolTrimFlags;
+using VkCommandPoolTrimFlagBitsKHR = VkCommandPoolTrimFlags;
+using VkExternalMemoryHandleTypeFlagsKHR = VkExternalMemoryHandleTypeFlags;
+using VkExternalMemoryHandleTypeFlagBitsKHR = VkExternalMemoryHandleTypeFlags;
+using VkExternalMemoryFeatureFlagsKHR = VkExternalMemoryFeatureFlags;
+using VkExternalMemoryFeatureFlagBitsKHR = VkExternalMemoryFeatureFlags;
+using VkExternalSemaphoreHandleTypeFlagsKHR = VkExternalSemaphoreHandleTypeFlags;
+using VkExternalSemaphoreHandleTypeFlagBitsKHR = VkExternalSemaphoreHandleTypeFlags;
+using VkExternalSemaphoreFeatureFlagsKHR = VkExternalSemaphoreFeatureFlags;
+using VkExternalSemaphoreFeatureFlagBitsKHR = VkExternalSemaphoreFeatureFlags;
+using VkSemaphoreImportFlagsKHR = VkSemaphoreImportFlags;
+using VkSemaphoreImportFlagBitsKHR = VkSemaphoreImportFlags;
+using VkExternalFenceHandleTypeFlagsKHR = VkExternalFenceHandleTypeFlags;
+using VkExternalFenceHandleTypeFlagBitsKHR = VkExternalFenceHandleTypeFlags;
+using VkExternalFenceFeatureFlagsKHR = VkExternalFenceFeatureFlags;
+using VkExternalFenceFeatureFlagBitsKHR = VkExternalFenceFeatureFlags;
+using VkFenceImportFlagsKHR = VkFenceImportFlags;
+using VkFenceImportFlagBitsKHR = VkFenceImportFlags;
+using VkDescriptorBindingFlagsEXT = VkDescriptorBindingFlags;
+using VkDescriptorBindingFlagBitsEXT = VkDescriptorBindingFlags;
+using VkResolveModeFlagsKHR = VkResolveModeFlags;
+using VkResolveModeFlagBitsKHR = VkResolveModeFlags;
+using VkToolPurposeFlagsEXT = VkToolPurposeFlags;
+using VkToolPurposeFlagBitsEXT = VkToolPurposeFlags;
+using VkSubmitFlagsKHR = VkSubmitFlags;
+using VkSubmitFlagBitsKHR = VkSubmitFlags;
+using VkHostImageCopyFlagsEXT = VkHostImageCopyFlags;
+using VkHostImageCopyFlagBitsEXT = VkHostImageCopyFlags;
+using VkPresentScalingFlagsEXT = VkPresentScalingFlagsKHR;
+using VkPresentScalingFlagBitsEXT = VkPresentScalingFlagsKHR;
+using VkPresentGravityFlagsEXT = VkPresentGravityFlagsKHR;
+using VkPresentGravityFlagBitsEXT = VkPresentGravityFlagsKHR;
+using VkRayTracingInvocationReorderModeNV = VkRayTracingInvocationReorderModeEXT;
+using VkDescriptorUpdateTemplateTypeKHR = VkDescriptorUpdateTemplateType;
+using VkPointClippingBehaviorKHR = VkPointClippingBehavior;
+using VkQueueGlobalPriorityKHR = VkQueueGlobalPriority;
+using VkQueueGlobalPriorityEXT = VkQueueGlobalPriority;
+using VkTimeDomainEXT = VkTimeDomainKHR;
+using VkSemaphoreTypeKHR = VkSemaphoreType;
+using VkCopyAccelerationStructureModeNV = VkCopyAccelerationStructureModeKHR;
+using VkAccelerationStructureTypeNV = VkAccelerationStructureTypeKHR;
+using VkGeometryTypeNV = VkGeometryTypeKHR;
+using VkRayTracingShaderGroupTypeNV = VkRayTracingShaderGroupTypeKHR;
+using VkAccelerationStructureMemoryRequirementsTypeNV =
+    VkAccelerationStructureMemoryRequirementsTypeKHR;
+using VkLineRasterizationModeKHR = VkLineRasterizationMode;
+using VkLineRasterizationModeEXT = VkLineRasterizationMode;
+using VkPipelineRobustnessBufferBehaviorEXT = VkPipelineRobustnessBufferBehavior;
+using VkPipelineRobustnessImageBehaviorEXT = VkPipelineRobustnessImageBehavior;
+using VkOpacityMicromapFormatEXT = VkOpacityMicromapFormatKHR;
+using VkOpacityMicromapSpecialIndexEXT = VkOpacityMicromapSpecialIndexKHR;
+using VkDeviceFaultVendorBinaryHeaderVersionEXT = VkDeviceFaultVendorBinaryHeaderVersionKHR;
+using VkScopeNV = VkScopeKHR;
+using VkComponentTypeNV = VkComponentTypeKHR;
+using VkTessellationDomainOriginKHR = VkTessellationDomainOrigin;
+using VkSamplerYcbcrModelConversionKHR = VkSamplerYcbcrModelConversion;
+using VkSamplerYcbcrRangeKHR = VkSamplerYcbcrRange;
+using VkChromaLocationKHR = VkChromaLocation;
+using VkSamplerReductionModeEXT = VkSamplerReductionMode;
+using VkShaderFloatControlsIndependenceKHR = VkShaderFloatControlsIndependence;
+using VkDeviceFaultAddressTypeEXT = VkDeviceFaultAddressTypeKHR;
+using VkDriverIdKHR = VkDriverId;
+
+} // namespace vk_value_set
+#endif
+
 #endif // VK_VALUE_SERIALIZATION_H
@@ -17,63 +17,207 @@
 
 #include "vk_value_serialization.h"
 
+#include <algorithm>
+#include <memory>
 #include <string>
+#include <string_view>
 #include <type_traits>
 
 /**
- * @brief Macro that automatically stringifies the given Vulkan type for serialization
- * @param VKTYPE Actual Vulkan type
+ * @brief Macro that binds the given Vulkan type's value set at compile-time for serialization
+ * @param VKTYPE Name of the Vulkan type, which must have a binding in the vk_value_set namespace
  * @param VALUE Value to be serialized
  * @param STRPTR Pointer to the string to store the serialization in. Only modified if true is
  * returned.
  * @return True if serialization was successful. False otherwise.
  */
-#define VK_SERIALIZE(VKTYPE, VALUE, STRPTR) vk_serialize<VKTYPE>(#VKTYPE, VALUE, STRPTR)
+#define VK_SERIALIZE(VKTYPE, VALUE, STRPTR) vk_serialize<vk_value_set::VKTYPE>(VALUE, STRPTR)
 
 /**
- * @brief Macro that automatically stringifies the given Vulkan type for parsing
- * @param VKTYPE Actual Vulkan type
+ * @brief Macro that binds the given Vulkan type's value set at compile-time for parsing
+ * @param VKTYPE Name of the Vulkan type, which must have a binding in the vk_value_set namespace
  * @param STRING String to be parsed
  * @param VALPTR Pointer to the value to store the parsed value in. Only modified if true is
  * returned.
  * @return True if serialization was successful. False otherwise.
  */
-#define VK_PARSE(VKTYPE, STRING, VALPTR) vk_parse<VKTYPE>(#VKTYPE, STRING, VALPTR)
+#define VK_PARSE(VKTYPE, STRING, VALPTR) vk_parse<vk_value_set::VKTYPE>(STRING, VALPTR)
+
+/// Size of the local buffer values are serialized into, longer values need an allocation
+#define VK_SERIALIZATION_BUFFER_SIZE 256
 
 /**
- * @brief Serializes a Vulkan enumerator/flag type
+ * @brief Serializes a Vulkan enumerator/flag type using a value set, into a character array
  * @tparam Vulkan type being serialized
- * @param pVkType Name of the Vulkan enumerator/flag type
+ * @param pValueSet Value set of the Vulkan enumerator/flag type
  * @param vkValue Value being serialized
- * @param pString Pointer to a string that will be modified with the serialized value. Only modified
- * if true is returned.
- * @return True the value was successfully serialized. False otherwise.
+ * @param pSerializedLength Pointer to the size of pSerialized, as with vk_serialize_set32/64
+ * @param pSerialized Either nullptr or a pointer to the character array to serialize into
+ * @return Same as vk_serialize_set32/64.
  */
 template <typename T>
-STecVkSerializationResult vk_serialize(char const *pVkType, T vkValue, std::string *pString) {
+STecVkSerializationResult vk_serialize_set(STecVkValueSet const *pValueSet,
+                                           T vkValue,
+                                           uint32_t *pSerializedLength,
+                                           char *pSerialized) {
   // Only have parse/serialize for 32/64-bit flag types
   static_assert(sizeof(T) == 4 || sizeof(T) == 8,
                 "vk_serialize only supports 32 and 64-bit types currently.");
 
-  STecVkSerializationResult result;
-  uint32_t serializedLength;
   if constexpr (sizeof(T) == 4) {
-    result = vk_serialize32(pVkType, vkValue, &serializedLength, nullptr);
+    return vk_serialize_set32(pValueSet, vkValue, pSerializedLength, pSerialized);
+  } else {
+    return vk_serialize_set64(pValueSet, vkValue, pSerializedLength, pSerialized);
+  }
+}
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type using a value set, to an output iterator
+ * @tparam Vulkan type being serialized
+ * @param pValueSet Value set of the Vulkan enumerator/flag type
+ * @param vkValue Value being serialized
+ * @param out Output iterator the serialized characters are written to. Only written to if true is
+ * returned.
+ * @param pOutEnd Optional pointer set to the output iterator one past the last written character.
+ * @return True the value was successfully serialized. False otherwise.
+ *
+ * Values that serialize to no more than VK_SERIALIZATION_BUFFER_SIZE characters take a single
+ * call, without any allocations.
+ */
+template <typename T, typename OutputIt>
+STecVkSerializationResult vk_serialize_set_to(STecVkValueSet const *pValueSet,
+                                              T vkValue,
+                                              OutputIt out,
+                                              OutputIt *pOutEnd = nullptr) {
+  char buffer[VK_SERIALIZATION_BUFFER_SIZE];
+  uint32_t serializedLength = sizeof(buffer);
+  STecVkSerializationResult result =
+      vk_serialize_set(pValueSet, vkValue, &serializedLength, buffer);
+
+  if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
+    out = std::copy(buffer, buffer + serializedLength, out);
+  } else if (result == STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE) {
+    // Too long for the local buffer, so find the full size needed
+    result = vk_serialize_set(pValueSet, vkValue, &serializedLength, nullptr);
     if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
-      pString->resize(serializedLength);
-      result = vk_serialize32(pVkType, vkValue, &serializedLength, pString->data());
+      std::unique_ptr<char[]> pBuffer{new char[serializedLength]};
+      result = vk_serialize_set(pValueSet, vkValue, &serializedLength, pBuffer.get());
+      out = std::copy(pBuffer.get(), pBuffer.get() + serializedLength, out);
     }
-  } else if constexpr (sizeof(T) == 8) {
-    result = vk_serialize64(pVkType, vkValue, &serializedLength, nullptr);
+  }
+
+  if (pOutEnd != nullptr) {
+    *pOutEnd = out;
+  }
+  return result;
+}
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type using a value set
+ * @tparam Vulkan type being serialized
+ * @param pValueSet Value set of the Vulkan enumerator/flag type
+ * @param vkValue Value being serialized
+ * @param pString Pointer to a string that will be modified with the serialized value. Only modified
+ * if true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ *
+ * Values that serialize to no more than VK_SERIALIZATION_BUFFER_SIZE characters take a single
+ * call, and only allocate if the string's capacity is too small.
+ */
+template <typename T>
+STecVkSerializationResult vk_serialize_set(STecVkValueSet const *pValueSet,
+                                           T vkValue,
+                                           std::string *pString) {
+  char buffer[VK_SERIALIZATION_BUFFER_SIZE];
+  uint32_t serializedLength = sizeof(buffer);
+  STecVkSerializationResult result =
+      vk_serialize_set(pValueSet, vkValue, &serializedLength, buffer);
+
+  if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
+    pString->assign(buffer, serializedLength);
+  } else if (result == STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE) {
+    // Too long for the local buffer, so find the full size needed
+    result = vk_serialize_set(pValueSet, vkValue, &serializedLength, nullptr);
     if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
       pString->resize(serializedLength);
-      result = vk_serialize64(pVkType, vkValue, &serializedLength, pString->data());
+      result = vk_serialize_set(pValueSet, vkValue, &serializedLength, pString->data());
     }
   }
 
   return result;
 }
 
+/**
+ * @brief Serializes a Vulkan enumerator/flag type
+ * @tparam Vulkan type being serialized
+ * @param pVkType Name of the Vulkan enumerator/flag type
+ * @param vkValue Value being serialized
+ * @param pString Pointer to a string that will be modified with the serialized value. Only modified
+ * if true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename T>
+STecVkSerializationResult vk_serialize(char const *pVkType, T vkValue, std::string *pString) {
+  return vk_serialize_set(vk_get_value_set(pVkType), vkValue, pString);
+}
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type, bound to its value set at compile-time
+ * @tparam VkValueSet Binding of the Vulkan type in the vk_value_set namespace, such as
+ * vk_value_set::VkCullModeFlags
+ * @param vkValue Value being serialized
+ * @param pString Pointer to a string that will be modified with the serialized value. Only modified
+ * if true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename VkValueSet>
+STecVkSerializationResult vk_serialize(typename VkValueSet::ValueType vkValue,
+                                       std::string *pString) {
+  return vk_serialize_set(vk_get_value_set_at(VkValueSet::cIndex), vkValue, pString);
+}
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type, bound to its value set at compile-time, to an
+ * output iterator
+ * @tparam VkValueSet Binding of the Vulkan type in the vk_value_set namespace, such as
+ * vk_value_set::VkCullModeFlags
+ * @param vkValue Value being serialized
+ * @param out Output iterator the serialized characters are written to. Only written to if true is
+ * returned.
+ * @param pOutEnd Optional pointer set to the output iterator one past the last written character.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename VkValueSet, typename OutputIt>
+STecVkSerializationResult vk_serialize_to(typename VkValueSet::ValueType vkValue,
+                                          OutputIt out,
+                                          OutputIt *pOutEnd = nullptr) {
+  return vk_serialize_set_to(vk_get_value_set_at(VkValueSet::cIndex), vkValue, out, pOutEnd);
+}
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string using a value set
+ * @tparam Vulkan type being parsed
+ * @param pValueSet Value set of the Vulkan enumerator/flag type
+ * @param vkString String being parsed, which is parsed in place without being copied
+ * @param pValue Pointer to a value that will be modified with the parsed value. Only modified if
+ * true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename T>
+STecVkSerializationResult vk_parse_set(STecVkValueSet const *pValueSet,
+                                       std::string_view vkString,
+                                       T *pValue) {
+  // Only have parse/serialize for 32/64-bit flag types
+  static_assert(sizeof(T) == 4 || sizeof(T) == 8,
+                "vk_parse only supports 32 and 64-bit types currently.");
+
+  if constexpr (sizeof(T) == 4) {
+    return vk_parse_set_n32(pValueSet, vkString.data(), vkString.size(), pValue);
+  } else {
+    return vk_parse_set_n64(pValueSet, vkString.data(), vkString.size(), pValue);
+  }
+}
+
 /**
  * @brief Parses a Vulkan enumerator/flag serialized string
  * @tparam Vulkan type being parsed
@@ -99,4 +243,35 @@ STecVkSerializationResult vk_parse(char const *pVkType, char const *pVkString, T
   return result;
 }
 
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string view
+ * @tparam Vulkan type being parsed
+ * @param pVkType Name of the Vulkan enumerator/flag type
+ * @param vkString String being parsed, which is parsed in place without being copied
+ * @param pValue Pointer to a value that will be modified with the parsed value. Only modified if
+ * true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename T>
+STecVkSerializationResult vk_parse(char const *pVkType, std::string_view vkString, T *pValue) {
+  return vk_parse_set(vk_get_value_set(pVkType), vkString, pValue);
+}
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string, bound to its value set at compile-time
+ * @tparam VkValueSet Binding of the Vulkan type in the vk_value_set namespace, such as
+ * vk_value_set::VkCullModeFlags
+ * @param vkString String being parsed, which is parsed in place without being copied
+ * @param pValue Pointer to a value that will be modified with the parsed value. Only modified if
+ * true is returned.
+ * @return True the value was successfully serialized. False otherwise.
+ */
+template <typename VkValueSet, typename T>
+STecVkSerializationResult vk_parse(std::string_view vkString, T *pValue) {
+  static_assert(sizeof(T) == sizeof(typename VkValueSet::ValueType),
+                "vk_parse value type size does not match that of the Vulkan type.");
+
+  return vk_parse_set(vk_get_value_set_at(VkValueSet::cIndex), vkString, pValue);
+}
+
 #endif // VK_VALUE_SERIALIZATION_HPP
@@ -29,6 +29,9 @@ extern "C" {
 
 #include <openxr/openxr.h>
 
+#include <stdbool.h>
+#include <stddef.h>
+
 #ifdef __cplusplus
 static_assert((XR_CURRENT_API_VERSION & 0xffffffffULL) >= 0,
               "XR_CURRENT_API_VERSION is lower than the minimum supported version (v0)");
@@ -51,8 +54,22 @@ _Static_assert((XR_CURRENT_API_VERSION & 0xffffffffULL) >= 0,
 /// returns NULL.
 char const *XrResult_to_string(XrResult result);
 
+/// Parses a string representing a XrResult value into pResult. Both the names returned by
+/// XrResult_to_string and any other names for the same values are accepted, where the comparison is
+/// case insensitive, spaces can be used in place of underscores, the 'XR_' prefix is optional
+/// and any surrounding whitespace is ignored. Returns true if the string was recognized and pResult
+/// set, otherwise returns false and pResult is not modified.
+bool XrResult_from_string(char const *pString, XrResult *pResult);
+
+/// Same as XrResult_from_string, except that the string is of the given length, rather than
+/// null-terminated.
+bool XrResult_from_string_n(char const *pString, size_t length, XrResult *pResult);
+
 #ifdef XR_RESULT_TO_STRING_CONFIG_MAIN
 
+#include <ctype.h>
+#include <string.h>
+
 char const *XrResult_to_string(XrResult result) {
   // Check in descending order to get the 'latest' version of the error code text available.
   // Also, because codes have been re-used over time, can't use a switch and have to do this large
@@ -417,6 +434,376 @@ char const *XrResult_to_string(XrResult result) {
   }
 }
 
+static uint16_t const cXrResultHashSeeds[88] = {
+    1, 2, 0,  2, 5, 1, 0, 1, 1, 4, 2, 1, 1, 0, 2, 6, 1, 1, 5, 2, 1, 2, 3, 0, 1, 1, 1, 1, 2, 2,
+    5, 1, 14, 1, 0, 4, 0, 1, 1, 2, 1, 0, 2, 0, 3, 3, 2, 3, 3, 2, 0, 4, 0, 7, 4, 3, 2, 1, 1, 5,
+    1, 3, 1,  1, 2, 2, 1, 1, 1, 7, 0, 1, 1, 7, 7, 3, 4, 7, 2, 3, 2, 2, 5, 2, 2, 2, 2, 5,
+};
+
+static char const *const cXrResultHashNames[256] = {
+    NULL,
+    NULL,
+    "ERROR_SPATIAL_CAPABILITY_UNSUPPORTED_EXT",
+    "SCENE_MARKER_DATA_NOT_STRING_MSFT",
+    NULL,
+    "ERROR_SWAPCHAIN_FORMAT_UNSUPPORTED",
+    "ERROR_RENDER_MODEL_KEY_INVALID_FB",
+    "ERROR_COLOCATION_DISCOVERY_NETWORK_FAILED_META",
+    "ERROR_SCENE_MESH_BUFFER_ID_INVALID_MSFT",
+    NULL,
+    NULL,
+    "ERROR_RENDER_MODEL_ASSET_UNAVAILABLE_EXT",
+    "ERROR_FORM_FACTOR_UNSUPPORTED",
+    NULL,
+    "ERROR_LOCALIZATION_MAP_ALREADY_EXISTS_ML",
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    NULL,
+    "ERROR_COLOCATION_DISCOVERY_NO_DISCOVERY_METHOD_META",
+    NULL,
+    "ERROR_LOCALIZATION_MAP_UNAVAILABLE_ML",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_ENTITY_ID_INVALID_ANDROID",
+    "ERROR_ENVIRONMENT_BLEND_MODE_UNSUPPORTED",
+    NULL,
+    NULL,
+    NULL,
+    "ERROR_ANDROID_THREAD_SETTINGS_ID_INVALID_KHR",
+    "ERROR_SPATIAL_ANCHOR_SHARING_AUTHENTICATION_FAILURE_BD",
+    NULL,
+    NULL,
+    "ERROR_VALIDATION_FAILURE",
+    NULL,
+    NULL,
+    "ERROR_TRACKABLE_TYPE_NOT_SUPPORTED_ANDROID",
+    "ERROR_SPATIAL_ANCHORS_NOT_LOCALIZED_ML",
+    "EVENT_UNAVAILABLE",
+    "ERROR_GRAPHICS_REQUIREMENTS_CALL_MISSING",
+    NULL,
+    "ERROR_HANDLE_INVALID",
+    "COLOCATION_DISCOVERY_ALREADY_DISCOVERING_META",
+    "ERROR_KEYLESS_AUTH_FAILED_ANDROID",
+    "ERROR_ANCHOR_ALREADY_PERSISTED_ANDROID",
+    NULL,
+    "ERROR_MARKER_DETECTOR_INVALID_CREATE_INFO_ML",
+    "ERROR_COLOR_SPACE_UNSUPPORTED_FB",
+    NULL,
+    "ERROR_SYSTEM_NOTIFICATION_INCOMPATIBLE_SKU_ML",
+    "ERROR_LOCALIZATION_MAP_PERMISSION_DENIED_ML",
+    "ERROR_SPATIAL_ENTITY_ID_INVALID_EXT",
+    "ERROR_SESSION_RUNNING",
+    "ERROR_ANCHOR_NOT_SUPPORTED_FOR_ENTITY_BD",
+    "ERROR_API_VERSION_UNSUPPORTED",
+    "ERROR_SPATIAL_CAPABILITY_CONFIGURATION_INVALID_EXT",
+    "ERROR_SPACE_COMPONENT_STATUS_ALREADY_SET_FB",
+    "ERROR_SPACE_STORAGE_AT_CAPACITY_META",
+    "ERROR_SPATIAL_ANCHORS_ANCHOR_NOT_FOUND_ML",
+    "ERROR_MARKER_DETECTOR_LOCATE_FAILED_ML",
+    "ERROR_PLANE_DETECTION_PERMISSION_DENIED_EXT",
+    "ERROR_PATH_FORMAT_INVALID",
+    NULL,
+    "ERROR_MARKER_DETECTOR_PERMISSION_DENIED_ML",
+    "ERROR_MARKER_ID_INVALID_VARJO",
+    "ERROR_LIMIT_REACHED",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_NAME_INVALID_MSFT",
+    "ERROR_ACTION_TYPE_MISMATCH",
+    NULL,
+    "ERROR_NOT_INTERACTION_RENDER_MODEL_EXT",
+    NULL,
+    NULL,
+    "ENVIRONMENT_DEPTH_NOT_AVAILABLE_META",
+    "ERROR_SPACE_CLOUD_STORAGE_DISABLED_FB",
+    "ERROR_LOCALIZATION_MAP_INCOMPATIBLE_ML",
+    NULL,
+    "ERROR_LOCALIZATION_MAP_FAIL_ML",
+    "ERROR_INITIALIZATION_FAILED",
+    "ERROR_WORLD_MESH_DETECTOR_PERMISSION_DENIED_ML",
+    NULL,
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_SHARING_NETWORK_TIMEOUT_BD",
+    NULL,
+    NULL,
+    "ERROR_SPACE_NETWORK_REQUEST_FAILED_FB",
+    NULL,
+    "ERROR_SPATIAL_COMPONENT_UNSUPPORTED_FOR_CAPABILITY_EXT",
+    "ERROR_FACIAL_EXPRESSION_PERMISSION_DENIED_ML",
+    "ERROR_SYSTEM_NOTIFICATION_PERMISSION_DENIED_ML",
+    "ERROR_SPATIAL_ANCHORS_PERMISSION_DENIED_ML",
+    "ERROR_PATH_UNSUPPORTED",
+    "ERROR_SESSION_LOST",
+    NULL,
+    "ERROR_RUNTIME_UNAVAILABLE",
+    "ERROR_SPACE_GROUP_NOT_FOUND_META",
+    "ERROR_INSUFFICIENT_RESOURCES_PASSTHROUGH_FB",
+    "ERROR_VIEW_CONFIGURATION_TYPE_UNSUPPORTED",
+    "ERROR_SPATIAL_COMPONENT_NOT_ENABLED_EXT",
+    "ERROR_SPACE_MAPPING_INSUFFICIENT_FB",
+    NULL,
+    NULL,
+    "ERROR_INSTANCE_LOST",
+    "ERROR_SIZE_INSUFFICIENT",
+    "COLOCATION_DISCOVERY_ALREADY_ADVERTISING_META",
+    "ERROR_ACTIONSETS_ALREADY_ATTACHED",
+    "ERROR_RUNTIME_FAILURE",
+    "ERROR_UNKNOWN_PASSTHROUGH_FB",
+    "ERROR_POSE_INVALID",
+    NULL,
+    "ERROR_SPACE_RATE_LIMITED_META",
+    "ERROR_SPATIAL_ANCHORS_OUT_OF_MAP_BOUNDS_ML",
+    "ERROR_SESSION_NOT_RUNNING",
+    "ERROR_SYSTEM_INVALID",
+    NULL,
+    "ERROR_NOT_PERMITTED_PASSTHROUGH_FB",
+    NULL,
+    "ERROR_MARKER_DETECTOR_INVALID_DATA_QUERY_ML",
+    "ERROR_SERVICE_NOT_READY_ANDROID",
+    "ERROR_PATH_INVALID",
+    "ERROR_SPATIAL_ANCHOR_NAME_NOT_FOUND_MSFT",
+    "ERROR_SPATIAL_ANCHORS_SPACE_NOT_LOCATABLE_ML",
+    "ERROR_LOCALIZED_NAME_DUPLICATED",
+    "ERROR_SURFACE_ANCHOR_LOCATION_UNSUPPORTED_ANDROID",
+    NULL,
+    "ERROR_MARKER_NOT_TRACKED_VARJO",
+    "ERROR_SPACE_TOO_BRIGHT_META",
+    "ERROR_SECONDARY_VIEW_CONFIGURATION_TYPE_NOT_ENABLED_MSFT",
+    NULL,
+    NULL,
+    "ERROR_PERMISSION_INSUFFICIENT",
+    NULL,
+    NULL,
+    "ERROR_FEATURE_REQUIRED_PASSTHROUGH_FB",
+    "ERROR_ANCHOR_ID_NOT_FOUND_ANDROID",
+    "ERROR_SPACE_NOT_LOCATABLE_EXT",
+    "ERROR_SPACE_COMPONENT_NOT_SUPPORTED_FB",
+    NULL,
+    NULL,
+    NULL,
+    "ERROR_SCENE_COMPUTE_CONSISTENCY_MISMATCH_MSFT",
+    "RENDER_MODEL_UNAVAILABLE_FB",
+    NULL,
+    "ERROR_EXTENSION_NOT_PRESENT",
+    NULL,
+    "ERROR_SPACE_PERMISSION_INSUFFICIENT_META",
+    "ERROR_INDEX_OUT_OF_RANGE",
+    "ERROR_GEOSPATIAL_COORDINATES_INVALID_ANDROID",
+    "ERROR_FEATURE_UNSUPPORTED",
+    "ERROR_ANCHOR_NOT_OWNED_BY_CALLER_ANDROID",
+    NULL,
+    NULL,
+    "ERROR_SPACE_INSUFFICIENT_RESOURCES_META",
+    "ERROR_PATH_COUNT_EXCEEDED",
+    "ERROR_MESH_DATA_LIMIT_EXCEEDED_ANDROID",
+    "ERROR_SCENE_COMPUTE_FEATURE_INCOMPATIBLE_MSFT",
+    NULL,
+    NULL,
+    "ERROR_LOCALIZATION_MAP_CANNOT_EXPORT_CLOUD_MAP_ML",
+    "ERROR_SCENE_CAPTURE_FAILURE_BD",
+    NULL,
+    "ERROR_FILE_CONTENTS_INVALID",
+    "SPACE_BOUNDS_UNAVAILABLE",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_SHARING_LOCALIZATION_FAIL_BD",
+    "ERROR_NAME_INVALID",
+    NULL,
+    "ERROR_SPACE_COMPONENT_STATUS_PENDING_FB",
+    "ERROR_GRAPHICS_DEVICE_INVALID",
+    "ERROR_MISMATCHING_TRACKABLE_TYPE_ANDROID",
+    "SESSION_LOSS_PENDING",
+    "ERROR_IMAGE_FORMAT_UNSUPPORTED_ANDROID",
+    "ERROR_EXTENSION_DEPENDENCY_NOT_ENABLED",
+    "ERROR_SCENE_COMPONENT_TYPE_MISMATCH_MSFT",
+    "ERROR_RENDER_MODEL_ID_INVALID_EXT",
+    "ERROR_SPATIAL_BUFFER_ID_INVALID_EXT",
+    "ERROR_SPACE_INSUFFICIENT_VIEW_META",
+    "ERROR_UNEXPECTED_STATE_PASSTHROUGH_FB",
+    NULL,
+    "ERROR_SPACE_COMPONENT_NOT_ENABLED_FB",
+    "ERROR_SPATIAL_ANCHOR_ATTACHABLE_COMPONENT_NOT_FOUND_ANDROID",
+    NULL,
+    "ERROR_SPATIAL_SENSING_SERVICE_UNAVAILABLE_BD",
+    "ERROR_GEOSPATIAL_TRACKER_NOT_RUNNING_ANDROID",
+    "ERROR_COMPUTE_NEW_SCENE_NOT_COMPLETED_MSFT",
+    "ERROR_RENDER_MODEL_GLTF_EXTENSION_REQUIRED_EXT",
+    "ERROR_SPATIAL_PERSISTENCE_SCOPE_UNSUPPORTED_EXT",
+    "ERROR_KEYLESS_AUTH_NOT_SETUP_ANDROID",
+    "ERROR_MARKER_INVALID_ML",
+    "ERROR_NAME_DUPLICATED",
+    "ERROR_CALL_ORDER_INVALID",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_SHARING_MAP_INSUFFICIENT_BD",
+    NULL,
+    "ERROR_LAYER_INVALID",
+    "ERROR_PERSISTED_DATA_NOT_READY_ANDROID",
+    "ERROR_DISPLAY_REFRESH_RATE_UNSUPPORTED_FB",
+    NULL,
+    "ERROR_FUTURE_PENDING_EXT",
+    NULL,
+    NULL,
+    "ERROR_SPACE_LOCALIZATION_FAILED_FB",
+    "ERROR_CONTROLLER_MODEL_KEY_INVALID_MSFT",
+    NULL,
+    "ERROR_ANDROID_THREAD_SETTINGS_FAILURE_KHR",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_SHARING_NETWORK_FAILURE_BD",
+    "ERROR_FEATURE_ALREADY_CREATED_PASSTHROUGH_FB",
+    NULL,
+    "SUCCESS",
+    "ERROR_LOCALIZED_NAME_INVALID",
+    "ERROR_REPROJECTION_MODE_UNSUPPORTED_MSFT",
+    "ERROR_SCENE_COMPONENT_ID_INVALID_MSFT",
+    "ERROR_HINT_ALREADY_SET_QCOM",
+    "ERROR_SPACE_TOO_DARK_META",
+    "ERROR_FILE_ACCESS_ERROR",
+    "ERROR_GEOSPATIAL_CLOUD_AUTH_FAILED_ANDROID",
+    NULL,
+    "ERROR_SWAPCHAIN_RECT_INVALID",
+    "ERROR_SPATIAL_ENTITY_ID_INVALID_BD",
+    "ERROR_OUT_OF_MEMORY",
+    "ERROR_SPACE_NETWORK_TIMEOUT_FB",
+    NULL,
+    "ERROR_REFERENCE_SPACE_UNSUPPORTED",
+    NULL,
+    "TIMEOUT_EXPIRED",
+    "ERROR_ANCHOR_NOT_TRACKING_ANDROID",
+    "ERROR_FORM_FACTOR_UNAVAILABLE",
+    "ERROR_WORLD_MESH_DETECTOR_SPACE_NOT_LOCATABLE_ML",
+    "ERROR_PASSTHROUGH_COLOR_LUT_BUFFER_SIZE_MISMATCH_META",
+    "BOUNDARY_VISIBILITY_SUPPRESSION_NOT_ALLOWED_META",
+    NULL,
+    "ERROR_CREATE_SPATIAL_ANCHOR_FAILED_MSFT",
+    NULL,
+    NULL,
+    NULL,
+    "ERROR_SESSION_NOT_STOPPING",
+    "ERROR_LAYER_LIMIT_EXCEEDED",
+    NULL,
+    "SESSION_NOT_FOCUSED",
+    "ERROR_SESSION_NOT_READY",
+    NULL,
+    "ERROR_ACTIONSET_NOT_ATTACHED",
+    "ERROR_FUNCTION_UNSUPPORTED",
+    "FRAME_DISCARDED",
+    "ERROR_API_LAYER_NOT_PRESENT",
+    "ERROR_NOT_AN_ANCHOR_HTC",
+    NULL,
+    "ERROR_LOCALIZATION_MAP_IMPORT_EXPORT_PERMISSION_DENIED_ML",
+    NULL,
+    NULL,
+    "ERROR_FUTURE_INVALID_EXT",
+    NULL,
+    "ERROR_SPATIAL_ANCHOR_NOT_FOUND_BD",
+    "ERROR_TIME_INVALID",
+    "ERROR_SPATIAL_PERSISTENCE_SCOPE_INCOMPATIBLE_EXT",
+};
+
+static int32_t const cXrResultHashValues[256] = {
+    0,           0,           -1000740001, 1000147000,  0,           -26,         -1000119000,
+    -1000571001, -1000097003, 0,           0,           -1000300001, -34,         0,
+    -1000139005, 0,           0,           0,           0,           0,           -1000571002,
+    0,           -1000139001, 0,           -1000795001, -42,         0,           0,
+    0,           -1000003000, -1000391001, 0,           0,           -1,          0,
+    0,           -1000455001, -1000140001, 4,           -50,         0,           -12,
+    1000571004,  -1000787001, -1000457001, 0,           -1000138003, -1000108000, 0,
+    -1000473001, -1000139004, -1000740002, -14,         -1000389002, -4,          -1000740005,
+    -1000113003, -1000259001, -1000141000, -1000138001, -1000429001, -21,         0,
+    -1000138000, -1000124001, -10,         0,           -1000142002, -27,         0,
+    -1000301000, 0,           0,           1000291000,  -1000169004, -1000139000, 0,
+    -1000139002, -6,          -1000474000, 0,           0,           -1000391000, 0,
+    0,           -1000169003, 0,           -1000740004, 1000482000,  -1000473000, -1000140000,
+    -22,         -17,         0,           -51,         -1000572002, -1000118004, -41,
+    -1000740006, -1000169000, 0,           0,           -13,         -11,         1000571003,
+    -47,         -2,          -1000118050, -39,         0,           -1000259004, -1000140002,
+    -16,         -18,         0,           -1000118003, 0,           -1000138002, -1000458000,
+    -19,         -1000142001, -1000140003, -48,         -1000797000, 0,           -1000124000,
+    -1000259006, -1000053000, 0,           0,           -1000710000, 0,           0,
+    -1000118002, -1000457000, -1000429000, -1000113000, 0,           0,           0,
+    -1000097005, 1000119020,  0,           -9,          0,           -1000259003, -40,
+    -1000789001, -8,          -1000701000, 0,           0,           -1000259000, -20,
+    -1000462000, -1000097004, 0,           0,           -1000139006, -1000392000, 0,
+    -33,         7,           0,           -1000391003, -45,         0,           -1000113002,
+    -38,         -1000455000, 3,           -1000709000, -1000710001, -1000097002, -1000300000,
+    -1000740003, -1000259002, -1000118000, 0,           -1000113001, -1000790001, 0,
+    -1000389001, -1000789000, -1000097000, -1000300002, -1000763001, -1000787000, -1000138004,
+    -44,         -37,         0,           -1000391004, 0,           -23,         -1000457003,
+    -1000101000, 0,           -1000469001, 0,           0,           -1000169001, -1000055000,
+    0,           -1000003001, 0,           -1000391002, -1000118001, 0,           0,
+    -49,         -1000066000, -1000097001, -1000306000, -1000259005, -32,         -1000789002,
+    0,           -25,         -1000389000, -3,          -1000169002, 0,           -31,
+    0,           1,           -1000457002, -35,         -1000474001, -1000266000, 1000528000,
+    0,           -1000039001, 0,           0,           0,           -29,         -24,
+    0,           8,           -28,         0,           -46,         -7,          9,
+    -36,         -1000319000, 0,           -1000139003, 0,           0,           -1000469002,
+    0,           -1000390000, -30,         -1000781001,
+};
+
+/// Formats a character being parsed to match the names, with spaces as underscores and all other
+/// characters capitalized. Names are plain ASCII, so this avoids the locale lookups of toupper.
+static char formatXrResultChar(char ch) {
+  if (ch == ' ')
+    return '_';
+  if (ch >= 'a' && ch <= 'z')
+    return (char)(ch - 'a' + 'A');
+  return ch;
+}
+
+bool XrResult_from_string(char const *pString, XrResult *pResult) {
+  if (pString == NULL)
+    return false;
+
+  return XrResult_from_string_n(pString, strlen(pString), pResult);
+}
+
+bool XrResult_from_string_n(char const *pString, size_t length, XrResult *pResult) {
+  if (pString == NULL)
+    return false;
+
+  // Trim whitespace from either end
+  char const *pEnd = pString + length;
+  while (pString != pEnd && isspace((unsigned char)*pString))
+    ++pString;
+  while (pEnd != pString && isspace((unsigned char)pEnd[-1]))
+    --pEnd;
+  length = (size_t)(pEnd - pString);
+
+  // Skip the optional prefix
+  if (length > 3 && formatXrResultChar(pString[0]) == 'X' &&
+      formatXrResultChar(pString[1]) == 'R' && formatXrResultChar(pString[2]) == '_') {
+    pString += 3;
+    length -= 3;
+  }
+
+  // 32-bit FNV-1a of the formatted name
+  uint32_t hash = 2166136261U;
+  for (size_t i = 0; i < length; ++i) {
+    hash = (hash ^ (unsigned char)formatXrResultChar(pString[i])) * 16777619U;
+  }
+
+  // Displace by the seed of the hash's bucket, then mix to find the only slot the name can be in
+  uint32_t slot = hash ^ cXrResultHashSeeds[hash % 88];
+  slot ^= slot >> 16;
+  slot *= 0x85EBCA6BU;
+  slot ^= slot >> 13;
+  slot *= 0xC2B2AE35U;
+  slot ^= slot >> 16;
+  slot %= 256;
+
+  char const *pName = cXrResultHashNames[slot];
+  if (pName == NULL)
+    return false;
+  for (size_t i = 0; i < length; ++i) {
+    if (pName[i] == '\0' || formatXrResultChar(pString[i]) != pName[i])
+      return false;
+  }
+  if (pName[length] != '\0')
+    return false;
+
+  *pResult = (XrResult)cXrResultHashValues[slot];
+  return true;
+}
+
 #endif // XR_RESULT_TO_STRING_CONFIG_MAIN
 
 #ifdef __cplusplus
@@ -11,5 +11,14 @@
 #define VK_STRUCT_COMPARE_CONFIG_MAIN
 #include <vk_struct_compare.h>
 
+#define VK_STRUCT_COPY_CONFIG_MAIN
+#include <vk_struct_copy.h>
+
+#define VK_STRUCT_ENCODE_CONFIG_MAIN
+#include <vk_struct_encode.h>
+
+#define VK_STRUCT_HASH_CONFIG_MAIN
+#include <vk_struct_hash.h>
+
 #define VK_VALUE_SERIALIZATION_CONFIG_MAIN
 #include <vk_value_serialization.h>
\ No newline at end of file
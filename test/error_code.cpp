@@ -29,6 +29,9 @@ TEST_CASE("Success Case") {
     CHECK(test.message() == std::string{#X});                                                      \
     CHECK(std::string{VkResult_to_string(X)} == std::string{#X});                                  \
     CHECK(std::string{vkResultToString(X)} == std::string{#X});                                    \
+    VkResult parsed = VK_RESULT_MAX_ENUM;                                                          \
+    CHECK(VkResult_from_string(#X, &parsed));                                                      \
+    CHECK(parsed == X);                                                                            \
   }
 
 TEST_CASE("Specific positive-value cases") {
@@ -82,4 +85,54 @@ TEST_CASE("Unknown negative error cases") {
     CHECK(std::string{vkResultToString(static_cast<VkResult>(i))} ==
           std::string{"(unrecognized negative VkResult value)"});
   }
-}
\ No newline at end of file
+}
+TEST_CASE("Parsing result strings") {
+  VkResult parsed = VK_RESULT_MAX_ENUM;
+
+  SECTION("Failure cases") {
+    CHECK_FALSE(VkResult_from_string(nullptr, &parsed));
+    CHECK_FALSE(VkResult_from_string("", &parsed));
+    CHECK_FALSE(VkResult_from_string("VK_", &parsed));
+    CHECK_FALSE(VkResult_from_string("VK_GARBAGIO", &parsed));
+    CHECK_FALSE(VkResult_from_string("VK_SUCCESSFUL", &parsed));
+    CHECK_FALSE(VkResult_from_string("VK_SUCCES", &parsed));
+    CHECK_FALSE(VkResult_from_string("XR_SUCCESS", &parsed));
+    CHECK_FALSE(VkResult_from_string("_VK_SUCCESS_", &parsed));
+    CHECK_FALSE(VkResult_from_string("--VK_ERROR_DEVICE_LOST!!", &parsed));
+    CHECK_FALSE(VkResult_from_string("(VK_SUCCESS)", &parsed));
+    CHECK(parsed == VK_RESULT_MAX_ENUM);
+  }
+
+  SECTION("Short, case insensitive and whitespace variations") {
+    CHECK(VkResult_from_string("SUCCESS", &parsed));
+    CHECK(parsed == VK_SUCCESS);
+
+    CHECK(VkResult_from_string("  vk error Device_lost ", &parsed));
+    CHECK(parsed == VK_ERROR_DEVICE_LOST);
+
+    CHECK(VkResult_from_string("error_out_of_date_khr", &parsed));
+    CHECK(parsed == VK_ERROR_OUT_OF_DATE_KHR);
+
+    CHECK(VkResult_from_string("\tVK_TIMEOUT\n", &parsed));
+    CHECK(parsed == VK_TIMEOUT);
+  }
+
+  SECTION("Aliases") {
+    CHECK(VkResult_from_string("VK_ERROR_OUT_OF_POOL_MEMORY_KHR", &parsed));
+    CHECK(parsed == VK_ERROR_OUT_OF_POOL_MEMORY);
+
+    CHECK(VkResult_from_string("VK_ERROR_FRAGMENTATION_EXT", &parsed));
+    CHECK(parsed == VK_ERROR_FRAGMENTATION);
+  }
+
+  SECTION("Strings that aren't null-terminated") {
+    char const *pStr = "VK_TIMEOUT | VK_NOT_READY";
+    CHECK(VkResult_from_string_n(pStr, 10, &parsed));
+    CHECK(parsed == VK_TIMEOUT);
+
+    CHECK(VkResult_from_string_n(pStr + 13, 12, &parsed));
+    CHECK(parsed == VK_NOT_READY);
+
+    CHECK_FALSE(VkResult_from_string_n(pStr, 9, &parsed));
+  }
+}
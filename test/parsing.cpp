@@ -8,6 +8,9 @@
 #define VK_VALUE_SERIALIZATION_CONFIG_MAIN
 #include <vk_value_serialization.hpp>
 
+#include <string>
+#include <string_view>
+
 constexpr uint32_t cDummyNum = 999999;
 
 TEST_CASE("Parsing: Failure Cases") {
@@ -384,4 +387,151 @@ TEST_CASE("Parsing: Checking bitmask conversions from string to bitmask values")
       CHECK(retVal == (0x10000000000ULL | 0x00000001ULL));
     }
   }
-}
\ No newline at end of file
+}
+
+TEST_CASE("Parsing: Value sets") {
+  SECTION("Failure case where a bad type is given") {
+    uint32_t dummy = cDummyNum;
+    CHECK(vk_parse_set32(nullptr, "2D", &dummy) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND);
+    CHECK(dummy == cDummyNum);
+  }
+
+  SECTION("Enum") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkImageType");
+    VkImageType imageType = (VkImageType)cDummyNum;
+
+    CHECK(vk_parse_set32(pValueSet, "", &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_HAS_NO_EMPTY_VALUE);
+    CHECK(imageType == cDummyNum);
+
+    CHECK(vk_parse_set32(pValueSet, "VK_IMAGE_TYPE_3D", &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(imageType == VK_IMAGE_TYPE_3D);
+
+    CHECK(vk_parse_set32(pValueSet, "2d", &imageType) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(imageType == VK_IMAGE_TYPE_2D);
+  }
+
+  SECTION("Bitmask") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkDebugReportFlagBitsEXT");
+    VkDebugReportFlagsEXT debugReportFlags = cDummyNum;
+
+    CHECK(vk_parse_set32(pValueSet, "", &debugReportFlags) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(debugReportFlags == 0);
+
+    CHECK(vk_parse_set32(pValueSet, "VK_DEBUG_REPORT_DEBUG_BIT_EXT | ERROR", &debugReportFlags) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(debugReportFlags == (VK_DEBUG_REPORT_DEBUG_BIT_EXT | VK_DEBUG_REPORT_ERROR_BIT_EXT));
+
+    uint64_t wideFlags = cDummyNum;
+    CHECK(vk_parse_set64(pValueSet, "DEBUG", &wideFlags) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_MISMATCH);
+    CHECK(wideFlags == cDummyNum);
+  }
+
+  SECTION("Bitmask (64-bit)") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkPipelineStageFlags2");
+    VkPipelineStageFlags2 retVal = 0;
+
+    CHECK(vk_parse_set64(pValueSet,
+                         "INVOCATION_MASK_BIT_HUAWEI | VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT",
+                         &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == (0x10000000000ULL | 0x00000001ULL));
+  }
+}
+
+TEST_CASE("Parsing: Structure types") {
+  VkStructureType sType = (VkStructureType)cDummyNum;
+
+  CHECK(vk_parse("VkStructureType", "VK_STRUCTURE_TYPE_GARBAGIO", &sType) ==
+        STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+  CHECK(sType == cDummyNum);
+
+  CHECK(vk_parse("VkStructureType", "APPLICATION_INFO", &sType) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+  CHECK(sType == VK_STRUCTURE_TYPE_APPLICATION_INFO);
+
+  CHECK(vk_parse("VkStructureType", "VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR", &sType) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+  CHECK(sType == VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR);
+
+  CHECK(vk_parse("VkStructureType", "debug utils messenger create info ext", &sType) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+  CHECK(sType == VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT);
+}
+
+TEST_CASE("Parsing: Compile-time value set bindings") {
+  SECTION("Enum") {
+    VkImageType imageType = (VkImageType)cDummyNum;
+
+    CHECK(vk_parse<vk_value_set::VkImageType>("6D", &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(imageType == cDummyNum);
+
+    CHECK(vk_parse<vk_value_set::VkImageType>("VK_IMAGE_TYPE_3D", &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(imageType == VK_IMAGE_TYPE_3D);
+
+    CHECK(VK_PARSE(VkImageType, "2d", &imageType) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(imageType == VK_IMAGE_TYPE_2D);
+  }
+
+  SECTION("Bitmask") {
+    VkDebugReportFlagsEXT debugReportFlags = cDummyNum;
+
+    CHECK(VK_PARSE(VkDebugReportFlagBitsEXT, "DEBUG | ERROR", &debugReportFlags) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(debugReportFlags == (VK_DEBUG_REPORT_DEBUG_BIT_EXT | VK_DEBUG_REPORT_ERROR_BIT_EXT));
+  }
+
+  SECTION("Bitmask (64-bit)") {
+    VkPipelineStageFlags2 retVal = 0;
+
+    CHECK(VK_PARSE(VkPipelineStageFlags2KHR,
+                   "INVOCATION_MASK_BIT_HUAWEI | VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT",
+                   &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == (0x10000000000ULL | 0x00000001ULL));
+  }
+}
+
+TEST_CASE("Parsing: String views") {
+  SECTION("Strings are parsed only up to the given length") {
+    std::string_view const str = "FRONT | BACK | GARBAGE";
+    VkCullModeFlags cullMode = cDummyNum;
+
+    CHECK(vk_parse("VkCullModeFlags", str, &cullMode) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(cullMode == cDummyNum);
+
+    CHECK(vk_parse("VkCullModeFlags", str.substr(0, 12), &cullMode) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(cullMode == VK_CULL_MODE_FRONT_AND_BACK);
+
+    CHECK(vk_parse<vk_value_set::VkCullModeFlags>(str.substr(0, 5), &cullMode) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(cullMode == VK_CULL_MODE_FRONT_BIT);
+  }
+
+  SECTION("Strings are not modified") {
+    std::string const str = " vk image_type 3d ";
+    VkImageType imageType = (VkImageType)cDummyNum;
+
+    CHECK(vk_parse_set(vk_get_value_set("VkImageType"), str, &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(imageType == VK_IMAGE_TYPE_3D);
+    CHECK(str == " vk image_type 3d ");
+  }
+
+  SECTION("Empty views") {
+    VkCullModeFlags cullMode = cDummyNum;
+    CHECK(vk_parse<vk_value_set::VkCullModeFlags>(std::string_view{}, &cullMode) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(cullMode == 0);
+
+    VkImageType imageType = (VkImageType)cDummyNum;
+    CHECK(vk_parse<vk_value_set::VkImageType>(std::string_view{}, &imageType) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_HAS_NO_EMPTY_VALUE);
+    CHECK(imageType == cDummyNum);
+  }
+}
@@ -7,6 +7,7 @@
 #include <vulkan/vulkan.h>
 
 #include <cstring>
+#include <iterator>
 #include <string>
 
 namespace {
@@ -65,6 +66,16 @@ TEST_CASE("Serialize: Enum") {
     CHECK(retVal == "2D");
   }
 
+  SECTION("Extension value success cases") {
+    CHECK(vk_serialize("VkImageLayout", VK_IMAGE_LAYOUT_PRESENT_SRC_KHR, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "PRESENT_SRC_KHR");
+
+    CHECK(vk_serialize("VkImageLayout", VK_IMAGE_LAYOUT_PRESENT_SRC_KHR + 1, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == "PRESENT_SRC_KHR");
+  }
+
   SECTION("Vendor Tag Success") {
     CHECK(vk_serialize("VkPresentModeKHR", VK_PRESENT_MODE_IMMEDIATE_KHR, &retVal) ==
           STEC_VK_SERIALIZATION_RESULT_SUCCESS);
@@ -168,6 +179,15 @@ TEST_CASE("Serialize: Bitmask") {
   }
 #endif
 
+#ifdef VK_EXT_pipeline_creation_cache_control
+  SECTION("Types with aliases of values from outside the type serialize successfully") {
+    CHECK(vk_serialize("VkPipelineCacheCreateFlags",
+                       VK_PIPELINE_CACHE_CREATE_EXTERNALLY_SYNCHRONIZED_BIT_EXT,
+                       &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "EXTERNALLY_SYNCHRONIZED");
+  }
+#endif
+
   SECTION("Passing in a string of varying sizes for serialization") {
     char testStr[20];
     memset(testStr, 0, 20);
@@ -234,4 +254,171 @@ TEST_CASE("Serialize: Bitmask") {
       CHECK(std::string{testStr, serializedLength} == "3");
     }
   }
-}
\ No newline at end of file
+}
+
+TEST_CASE("Serialize: Value sets") {
+  char retStr[32];
+  uint32_t retLength;
+
+  SECTION("Failure case where a bad type is given") {
+    CHECK(vk_get_value_set(nullptr) == nullptr);
+    CHECK(vk_get_value_set("") == nullptr);
+    CHECK(vk_get_value_set("VkGarbagio") == nullptr);
+
+    retLength = sizeof(retStr);
+    CHECK(vk_serialize_set32(nullptr, VK_IMAGE_TYPE_3D, &retLength, retStr) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND);
+  }
+
+  SECTION("Type name variations resolve to the same value set") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkCullModeFlags");
+    CHECK(pValueSet != nullptr);
+    CHECK(vk_get_value_set("VkCullModeFlagBits") == pValueSet);
+    CHECK(vk_get_value_set("VkImageLayout") != pValueSet);
+  }
+
+  SECTION("Failure case where the value size doesn't match") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkPipelineStageFlags2");
+    retLength = sizeof(retStr);
+    CHECK(vk_serialize_set32(pValueSet, 0, &retLength, retStr) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_MISMATCH);
+  }
+
+  SECTION("Success cases") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkImageLayout");
+    retLength = sizeof(retStr);
+    CHECK(vk_serialize_set32(pValueSet, VK_IMAGE_LAYOUT_PRESENT_SRC_KHR, &retLength, retStr) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(std::string{retStr, retLength} == "PRESENT_SRC_KHR");
+
+    pValueSet = vk_get_value_set("VkCullModeFlagBits");
+    retLength = sizeof(retStr);
+    CHECK(vk_serialize_set32(pValueSet, VK_CULL_MODE_FRONT_BIT | VK_CULL_MODE_BACK_BIT, &retLength,
+                             retStr) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(std::string{retStr, retLength} == "FRONT_AND_BACK");
+
+    pValueSet = vk_get_value_set("VkPipelineStageFlagBits2");
+    retLength = sizeof(retStr);
+    CHECK(vk_serialize_set64(pValueSet, VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, &retLength, retStr) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(std::string{retStr, retLength} == "TOP_OF_PIPE");
+  }
+}
+
+TEST_CASE("Serialize: Structure types") {
+  std::string retVal = cDummyStr;
+
+  SECTION("Failure case where the value is not a structure type") {
+    CHECK(vk_serialize("VkStructureType", -1U, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == cDummyStr);
+
+    // Past the last extension block
+    CHECK(vk_serialize("VkStructureType", 1000999000U, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == cDummyStr);
+
+    // Past the last value of an extension block
+    CHECK(vk_serialize("VkStructureType", VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR + 999,
+                       &retVal) == STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == cDummyStr);
+  }
+
+  SECTION("Success cases") {
+    CHECK(vk_serialize("VkStructureType", VK_STRUCTURE_TYPE_APPLICATION_INFO, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "APPLICATION_INFO");
+
+    CHECK(vk_serialize("VkStructureType", VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES,
+                       &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "PHYSICAL_DEVICE_VULKAN_1_2_FEATURES");
+
+    CHECK(vk_serialize("VkStructureType", VK_STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "SWAPCHAIN_CREATE_INFO_KHR");
+
+    CHECK(vk_serialize("VkStructureType", VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT,
+                       &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT");
+  }
+}
+
+TEST_CASE("Serialize: Compile-time value set bindings") {
+  std::string retVal = cDummyStr;
+
+  SECTION("Enum") {
+    CHECK(vk_serialize<vk_value_set::VkImageLayout>(VK_IMAGE_LAYOUT_PRESENT_SRC_KHR, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "PRESENT_SRC_KHR");
+
+    CHECK(VK_SERIALIZE(VkImageType, VK_IMAGE_TYPE_3D, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "3D");
+
+    CHECK(VK_SERIALIZE(VkImageType, -1, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == "3D");
+  }
+
+  SECTION("Bitmask") {
+    CHECK(vk_serialize<vk_value_set::VkCullModeFlags>(VK_CULL_MODE_BACK_BIT, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "BACK");
+
+    CHECK(VK_SERIALIZE(VkCullModeFlagBits, VK_CULL_MODE_FRONT_BIT | VK_CULL_MODE_BACK_BIT,
+                       &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "FRONT_AND_BACK");
+  }
+
+  SECTION("Bitmask (64-bit)") {
+    CHECK(VK_SERIALIZE(VkPipelineStageFlags2, VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "TOP_OF_PIPE");
+
+    CHECK(VK_SERIALIZE(VkPipelineStageFlagBits2KHR, VK_PIPELINE_STAGE_2_TOP_OF_PIPE_BIT, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == "TOP_OF_PIPE");
+  }
+}
+
+TEST_CASE("Serialize: Output iterators") {
+  std::string retVal = cDummyStr;
+
+  SECTION("Failure case leaves the output untouched") {
+    CHECK(vk_serialize_to<vk_value_set::VkImageType>(-1, std::back_inserter(retVal)) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == cDummyStr);
+  }
+
+  SECTION("Success cases append to the output") {
+    CHECK(
+        vk_serialize_to<vk_value_set::VkImageType>(VK_IMAGE_TYPE_3D, std::back_inserter(retVal)) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == cDummyStr + "3D");
+
+    char testStr[32];
+    char *pEnd = nullptr;
+    CHECK(vk_serialize_to<vk_value_set::VkCullModeFlags>(
+              VK_CULL_MODE_FRONT_BIT | VK_CULL_MODE_BACK_BIT, testStr, &pEnd) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(std::string{testStr, pEnd} == "FRONT_AND_BACK");
+  }
+
+  SECTION("Values longer than the local buffer") {
+    STecVkValueSet const *pValueSet = vk_get_value_set("VkPipelineStageFlags2");
+    uint64_t const value = 0x7FFFFFFULL;
+
+    uint32_t serializedLength;
+    REQUIRE(vk_serialize_set64(pValueSet, value, &serializedLength, nullptr) ==
+            STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    REQUIRE(serializedLength > VK_SERIALIZATION_BUFFER_SIZE);
+
+    std::string serialized;
+    CHECK(vk_serialize_set_to(pValueSet, value, std::back_inserter(serialized)) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(serialized.size() == serializedLength);
+
+    CHECK(vk_serialize_set(pValueSet, value, &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(retVal == serialized);
+  }
+}
@@ -44,6 +44,12 @@ TEST_CASE("Serialize64: Serializing one of the few 64-bit flag types, VkAccessFl
                          &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
       CHECK(retVal == "ACCELERATION_STRUCTURE_WRITE_BIT_KHR | INDEX_READ");
     }
+    SECTION("Bits in the upper 32-bits") {
+      CHECK(vk_serialize("VkAccessFlags2KHR",
+                         VK_ACCESS_2_SHADER_SAMPLED_READ_BIT_KHR | VK_ACCESS_2_INDEX_READ_BIT_KHR,
+                         &retVal) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+      CHECK(retVal == "SHADER_SAMPLED_READ | INDEX_READ");
+    }
     SECTION("Flags") {
       CHECK(vk_serialize("VkAccessFlags2KHR", VK_ACCESS_2_INDEX_READ_BIT_KHR, &retVal) ==
             STEC_VK_SERIALIZATION_RESULT_SUCCESS);
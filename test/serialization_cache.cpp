@@ -0,0 +1,142 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#include <catch2/catch_test_macros.hpp>
+#include <vk_value_serialization.hpp>
+#include <vulkan/vulkan.h>
+
+#include <cstring>
+#include <string>
+#include <thread>
+#include <vector>
+
+#ifndef VK_VALUE_SERIALIZATION_CONFIG_CACHE
+#error                                                                                             \
+    "These tests are for the serialization cache, VK_VALUE_SERIALIZATION_CONFIG_CACHE must be defined"
+#endif
+
+TEST_CASE("Serialization Cache: Repeated serialization") {
+  std::string first;
+  std::string second;
+
+  SECTION("Enums") {
+    CHECK(vk_serialize("VkImageType", VK_IMAGE_TYPE_3D, &first) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(vk_serialize("VkImageType", VK_IMAGE_TYPE_3D, &second) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(first == "3D");
+    CHECK(second == "3D");
+  }
+
+  SECTION("Bitmasks") {
+    CHECK(vk_serialize("VkCullModeFlagBits", VK_CULL_MODE_FRONT_AND_BACK, &first) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(vk_serialize("VkCullModeFlagBits", VK_CULL_MODE_FRONT_AND_BACK, &second) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(first == "FRONT_AND_BACK");
+    CHECK(second == "FRONT_AND_BACK");
+  }
+
+  SECTION("The same value of different types") {
+    CHECK(vk_serialize("VkImageType", 1, &first) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(vk_serialize("VkImageViewType", 1, &second) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(first == "2D");
+    CHECK(second == "2D");
+
+    CHECK(vk_serialize("VkCullModeFlagBits", 1, &first) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(first == "FRONT");
+  }
+
+  SECTION("Strings too long to be cached") {
+    CHECK(vk_serialize("VkAccessFlagBits", 0x1FFFFU, &first) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(vk_serialize("VkAccessFlagBits", 0x1FFFFU, &second) ==
+          STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(first.size() > 128);
+    CHECK(first == second);
+  }
+}
+
+TEST_CASE("Serialization Cache: Failures are not cached") {
+  std::string retVal = "AAABBBCCC";
+
+  for (int i = 0; i < 2; ++i) {
+    CHECK(vk_serialize("VkImageType", -1U, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == "AAABBBCCC");
+
+    CHECK(vk_serialize("VkCullModeFlagBits", VK_CULL_MODE_BACK_BIT | 0x777, &retVal) ==
+          STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND);
+    CHECK(retVal == "AAABBBCCC");
+  }
+}
+
+TEST_CASE("Serialization Cache: Incomplete destinations") {
+  STecVkValueSet const *pValueSet = vk_get_value_set("VkCullModeFlagBits");
+  REQUIRE(pValueSet != nullptr);
+
+  // Cache the value first
+  uint32_t length = 0;
+  CHECK(vk_serialize_set32(pValueSet, VK_CULL_MODE_FRONT_AND_BACK, &length, nullptr) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+  CHECK(length == strlen("FRONT_AND_BACK"));
+
+  char serialized[] = "AAABBBCCCDDDEEEFFF";
+  length = 5;
+  CHECK(vk_serialize_set32(pValueSet, VK_CULL_MODE_FRONT_AND_BACK, &length, serialized) ==
+        STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE);
+  CHECK(length == 5);
+  CHECK(std::string{serialized} == "FRONTBCCCDDDEEEFFF");
+
+  length = sizeof(serialized);
+  CHECK(vk_serialize_set32(pValueSet, VK_CULL_MODE_FRONT_AND_BACK, &length, serialized) ==
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+  CHECK(length == strlen("FRONT_AND_BACK"));
+  CHECK(std::string{serialized} == "FRONT_AND_BACKEFFF");
+}
+
+TEST_CASE("Serialization Cache: Eviction") {
+  // Serialize more values than there are cache entries, twice, so that entries get evicted
+  STecVkValueSet const *pValueSet = vk_get_value_set("VkFormat");
+  REQUIRE(pValueSet != nullptr);
+
+  std::vector<std::string> expected;
+  for (uint32_t value = 0; value <= VK_FORMAT_ASTC_12x12_SRGB_BLOCK; ++value) {
+    std::string serialized;
+    CHECK(vk_serialize_set(pValueSet, value, &serialized) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    expected.push_back(serialized);
+  }
+
+  for (uint32_t value = VK_FORMAT_ASTC_12x12_SRGB_BLOCK + 1; value-- > 0;) {
+    std::string serialized;
+    CHECK(vk_serialize_set(pValueSet, value, &serialized) == STEC_VK_SERIALIZATION_RESULT_SUCCESS);
+    CHECK(serialized == expected[value]);
+  }
+}
+
+TEST_CASE("Serialization Cache: Multiple threads") {
+  std::vector<std::thread> threads;
+  std::vector<int> failures(4, 0);
+
+  for (size_t i = 0; i < failures.size(); ++i) {
+    threads.emplace_back([&failures, i] {
+      for (int n = 0; n < 1000; ++n) {
+        std::string serialized;
+        uint32_t const format = (uint32_t)((n + i) % 4) + VK_FORMAT_R8G8B8A8_UNORM;
+        if (vk_serialize("VkFormat", format, &serialized) != STEC_VK_SERIALIZATION_RESULT_SUCCESS ||
+            serialized.find("R8G8B8A8_") != 0)
+          ++failures[i];
+
+        if (vk_serialize("VkCullModeFlagBits", (uint32_t)(n + i) % 4, &serialized) !=
+            STEC_VK_SERIALIZATION_RESULT_SUCCESS)
+          ++failures[i];
+      }
+    });
+  }
+
+  for (auto &thread : threads)
+    thread.join();
+  for (int failureCount : failures)
+    CHECK(failureCount == 0);
+}
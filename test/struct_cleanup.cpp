@@ -0,0 +1,159 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#define VK_STRUCT_CLEANUP_CONFIG_MAIN
+#include <vk_struct_cleanup.h>
+
+#include <catch2/catch_test_macros.hpp>
+#include <vulkan/vulkan.h>
+
+#include <cstdlib>
+
+namespace {
+
+template <typename T>
+T *allocateStruct(VkStructureType sType) {
+  T *pStruct = static_cast<T *>(calloc(1, sizeof(T)));
+  pStruct->sType = sType;
+  return pStruct;
+}
+
+struct FreeTracker {
+  size_t freeCount;
+  size_t resetCount;
+  void const *pResetData;
+};
+
+void trackedFree(void *pUserData, void *pMemory) {
+  static_cast<FreeTracker *>(pUserData)->freeCount++;
+  free(pMemory);
+}
+
+void trackedReset(void *pUserData, void const *pData) {
+  auto *pTracker = static_cast<FreeTracker *>(pUserData);
+  pTracker->resetCount++;
+  pTracker->pResetData = pData;
+}
+
+} // namespace
+
+TEST_CASE("Struct Cleanup: Long pNext chains") {
+  // Long enough that cleaning up each link of the chain recursively would exhaust the stack
+  constexpr size_t cChainLength = 1000000;
+
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+
+  VkBaseOutStructure *pTail = reinterpret_cast<VkBaseOutStructure *>(&createInfo);
+  for (size_t i = 0; i < cChainLength; ++i) {
+    auto *pFeatures =
+        allocateStruct<VkPhysicalDeviceFeatures2>(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2);
+
+    pTail->pNext = reinterpret_cast<VkBaseOutStructure *>(pFeatures);
+    pTail = pTail->pNext;
+  }
+
+  cleanup_VkDeviceCreateInfo(&createInfo);
+}
+
+TEST_CASE("Struct Cleanup: Unknown structs in a pNext chain") {
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+
+  // The chain is followed through structs that aren't known, so the rest of it is still cleaned up
+  auto *pUnknown = allocateStruct<VkBaseOutStructure>(VK_STRUCTURE_TYPE_MAX_ENUM);
+  auto *pFeatures =
+      allocateStruct<VkPhysicalDeviceFeatures2>(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2);
+  pUnknown->pNext = reinterpret_cast<VkBaseOutStructure *>(pFeatures);
+  createInfo.pNext = pUnknown;
+
+  cleanup_vk_struct(&createInfo);
+}
+
+TEST_CASE("Struct Cleanup: Arrays of structs") {
+  constexpr uint32_t cQueueCount = 8;
+
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+
+  auto *pQueueCreateInfos =
+      static_cast<VkDeviceQueueCreateInfo *>(calloc(cQueueCount, sizeof(VkDeviceQueueCreateInfo)));
+  for (uint32_t i = 0; i < cQueueCount; ++i) {
+    pQueueCreateInfos[i].sType = VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO;
+    pQueueCreateInfos[i].pNext = allocateStruct<VkDeviceQueueGlobalPriorityCreateInfoKHR>(
+        VK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR);
+    pQueueCreateInfos[i].queueCount = i + 1;
+    pQueueCreateInfos[i].pQueuePriorities = static_cast<float *>(calloc(i + 1, sizeof(float)));
+  }
+  createInfo.queueCreateInfoCount = cQueueCount;
+  createInfo.pQueueCreateInfos = pQueueCreateInfos;
+
+  cleanup_vk_struct(&createInfo);
+}
+
+TEST_CASE("Struct Cleanup: Callbacks") {
+  FreeTracker tracker = {};
+
+  VkInstanceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO;
+  createInfo.pNext =
+      allocateStruct<VkValidationFeaturesEXT>(VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT);
+  auto *pAppInfo = allocateStruct<VkApplicationInfo>(VK_STRUCTURE_TYPE_APPLICATION_INFO);
+  pAppInfo->pApplicationName = static_cast<char *>(calloc(8, 1));
+  createInfo.pApplicationInfo = pAppInfo;
+
+  SECTION("Free") {
+    VkStructCleanupCallbacks callbacks = {&tracker, trackedFree, nullptr};
+    cleanup_vk_struct_with_callbacks(&createInfo, &callbacks);
+
+    // The pNext struct, the application info and its name, with NULL pointers skipped
+    CHECK(tracker.freeCount == 3);
+    CHECK(tracker.resetCount == 0);
+
+    // Cleanup afterwards goes back to using free() directly
+    createInfo.pNext =
+        allocateStruct<VkValidationFeaturesEXT>(VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT);
+    createInfo.pApplicationInfo = nullptr;
+    cleanup_vk_struct(&createInfo);
+    CHECK(tracker.freeCount == 3);
+  }
+
+  SECTION("Arena") {
+    VkStructCleanupCallbacks callbacks = {&tracker, trackedFree, trackedReset};
+    cleanup_vk_struct_with_callbacks(&createInfo, &callbacks);
+
+    CHECK(tracker.freeCount == 0);
+    CHECK(tracker.resetCount == 1);
+    CHECK(tracker.pResetData == &createInfo);
+
+    // Stands in for the arena, which would have owned the data
+    cleanup_vk_struct(&createInfo);
+  }
+
+  SECTION("Default free") {
+    // Without a pfnFree, the data is still released with free() rather than leaked
+    VkStructCleanupCallbacks callbacks = {&tracker, nullptr, nullptr};
+    cleanup_VkInstanceCreateInfo_with_callbacks(&createInfo, &callbacks);
+
+    CHECK(tracker.freeCount == 0);
+    CHECK(tracker.resetCount == 0);
+  }
+}
+
+TEST_CASE("Struct Cleanup: Callbacks for structs without an sType") {
+  FreeTracker tracker = {};
+  VkStructCleanupCallbacks callbacks = {&tracker, trackedFree, nullptr};
+
+  VkSubpassDescription subpass = {};
+  auto *pAttachments =
+      static_cast<VkAttachmentReference *>(calloc(2, sizeof(VkAttachmentReference)));
+  subpass.colorAttachmentCount = 2;
+  subpass.pColorAttachments = pAttachments;
+  subpass.pDepthStencilAttachment =
+      static_cast<VkAttachmentReference *>(calloc(1, sizeof(VkAttachmentReference)));
+
+  cleanup_VkSubpassDescription_with_callbacks(&subpass, &callbacks);
+
+  CHECK(tracker.freeCount == 2);
+}
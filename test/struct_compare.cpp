@@ -0,0 +1,320 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#define VK_STRUCT_COMPARE_CONFIG_MAIN
+#include <vk_struct_compare.h>
+
+#include <catch2/catch_test_macros.hpp>
+#include <vulkan/vulkan.h>
+
+#include <algorithm>
+#include <cmath>
+#include <string>
+#include <vector>
+
+namespace {
+
+struct FeatureChain {
+  VkDeviceCreateInfo createInfo;
+  VkPhysicalDeviceFeatures2 features;
+  VkPhysicalDeviceVulkan11Features features11;
+  VkPhysicalDeviceVulkan12Features features12;
+};
+
+void initChain(FeatureChain &chain) {
+  chain = {};
+  chain.createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  chain.features.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+  chain.features11.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES;
+  chain.features12.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES;
+}
+
+// Links the structs of the chain in the given order after the create info
+void linkChain(FeatureChain &chain, std::vector<void *> const &order) {
+  VkBaseOutStructure *pTail = reinterpret_cast<VkBaseOutStructure *>(&chain.createInfo);
+  for (void *pStruct : order) {
+    pTail->pNext = static_cast<VkBaseOutStructure *>(pStruct);
+    pTail = pTail->pNext;
+  }
+  pTail->pNext = nullptr;
+}
+
+} // namespace
+
+TEST_CASE("Struct Compare: pNext chains") {
+  FeatureChain chain1;
+  FeatureChain chain2;
+  initChain(chain1);
+  initChain(chain2);
+  linkChain(chain1, {&chain1.features, &chain1.features11, &chain1.features12});
+  linkChain(chain2, {&chain2.features, &chain2.features11, &chain2.features12});
+
+  SECTION("Equal chains") {
+    CHECK(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+  }
+
+  SECTION("Different data in the chain") {
+    chain2.features12.timelineSemaphore = VK_TRUE;
+
+    CHECK_FALSE(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+  }
+
+  SECTION("Different data in the first struct") {
+    chain2.createInfo.enabledExtensionCount = 1;
+
+    CHECK_FALSE(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+  }
+
+  SECTION("Different chain lengths") {
+    linkChain(chain2, {&chain2.features, &chain2.features11});
+
+    CHECK_FALSE(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct(&chain2.createInfo, &chain1.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain2.createInfo, &chain1.createInfo));
+  }
+
+  SECTION("Different chain order") {
+    linkChain(chain2, {&chain2.features12, &chain2.features, &chain2.features11});
+
+    CHECK_FALSE(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+
+    chain2.features11.multiview = VK_TRUE;
+    CHECK_FALSE(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+  }
+
+  SECTION("Different sTypes in the chain") {
+    linkChain(chain2, {&chain2.features, &chain2.features11, &chain2.features11});
+
+    CHECK_FALSE(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+    CHECK_FALSE(compare_vk_struct_unordered(&chain2.createInfo, &chain1.createInfo));
+  }
+
+  SECTION("Shared chains") {
+    chain2.createInfo.pNext = chain1.createInfo.pNext;
+
+    CHECK(compare_vk_struct(&chain1.createInfo, &chain2.createInfo));
+    CHECK(compare_vk_struct_unordered(&chain1.createInfo, &chain2.createInfo));
+  }
+}
+
+TEST_CASE("Struct Compare: Repeated sTypes in a pNext chain") {
+  VkPhysicalDeviceFeatures2 features1[2] = {};
+  VkPhysicalDeviceFeatures2 features2[2] = {};
+  for (int i = 0; i < 2; ++i) {
+    features1[i].sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+    features2[i].sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+  }
+  features1[1].features.geometryShader = VK_TRUE;
+  features2[1].features.geometryShader = VK_TRUE;
+
+  VkDeviceCreateInfo createInfo1 = {};
+  createInfo1.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  createInfo1.pNext = &features1[0];
+  features1[0].pNext = &features1[1];
+
+  VkDeviceCreateInfo createInfo2 = createInfo1;
+  createInfo2.pNext = &features2[0];
+  features2[0].pNext = &features2[1];
+
+  // Structs of the same sType are matched in the order they appear
+  CHECK(compare_vk_struct_unordered(&createInfo1, &createInfo2));
+
+  createInfo2.pNext = &features2[1];
+  features2[1].pNext = &features2[0];
+  features2[0].pNext = nullptr;
+  CHECK_FALSE(compare_vk_struct_unordered(&createInfo1, &createInfo2));
+}
+
+TEST_CASE("Struct Compare: Unknown structs in a pNext chain") {
+  VkBaseInStructure unknown1 = {};
+  unknown1.sType = VK_STRUCTURE_TYPE_MAX_ENUM;
+  VkBaseInStructure unknown2 = unknown1;
+
+  VkDeviceCreateInfo createInfo1 = {};
+  createInfo1.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  createInfo1.pNext = &unknown1;
+  VkDeviceCreateInfo createInfo2 = createInfo1;
+
+  // Unknown structs can't be compared, so are only equal to themselves
+  CHECK(compare_vk_struct(&createInfo1, &createInfo2));
+  CHECK(compare_vk_struct_unordered(&createInfo1, &createInfo2));
+
+  createInfo2.pNext = &unknown2;
+  CHECK_FALSE(compare_vk_struct(&createInfo1, &createInfo2));
+  CHECK_FALSE(compare_vk_struct_unordered(&createInfo1, &createInfo2));
+}
+
+TEST_CASE("Struct Compare: Long pNext chains") {
+  // Long enough that comparing each link of the chain recursively would exhaust the stack
+  constexpr size_t cChainLength = 1000000;
+
+  std::vector<VkPhysicalDeviceFeatures2> chain1(cChainLength);
+  std::vector<VkPhysicalDeviceFeatures2> chain2(cChainLength);
+  for (size_t i = 0; i < cChainLength; ++i) {
+    chain1[i] = {};
+    chain1[i].sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+    chain1[i].pNext = (i + 1 < cChainLength) ? &chain1[i + 1] : nullptr;
+
+    chain2[i] = chain1[i];
+    chain2[i].pNext = (i + 1 < cChainLength) ? &chain2[i + 1] : nullptr;
+  }
+
+  CHECK(compare_vk_struct(chain1.data(), chain2.data()));
+
+  chain2.back().features.geometryShader = VK_TRUE;
+  CHECK_FALSE(compare_vk_struct(chain1.data(), chain2.data()));
+}
+
+TEST_CASE("Struct Compare: Plain data structs") {
+  SECTION("Compared as a block") {
+    VkVertexInputAttributeDescription attribute1 = {};
+    attribute1.location = 1;
+    attribute1.format = VK_FORMAT_R32G32B32_SFLOAT;
+    VkVertexInputAttributeDescription attribute2 = attribute1;
+
+    CHECK(compare_VkVertexInputAttributeDescription(&attribute1, &attribute2));
+
+    attribute2.offset = 12;
+    CHECK_FALSE(compare_VkVertexInputAttributeDescription(&attribute1, &attribute2));
+  }
+
+  SECTION("Nested plain data structs") {
+    VkImageCopy copy1 = {};
+    copy1.extent = {4, 4, 1};
+    VkImageCopy copy2 = copy1;
+
+    CHECK(compare_VkImageCopy(&copy1, &copy2));
+
+    copy2.dstOffset.z = 1;
+    CHECK_FALSE(compare_VkImageCopy(&copy1, &copy2));
+  }
+
+  SECTION("Floats are compared by value") {
+    VkViewport viewport1 = {};
+    viewport1.minDepth = 0.f;
+    VkViewport viewport2 = viewport1;
+    viewport2.minDepth = -0.f;
+
+    CHECK(compare_VkViewport(&viewport1, &viewport2));
+  }
+
+  SECTION("Multi-dimensional arrays") {
+    VkTransformMatrixKHR matrix1 = {};
+    VkTransformMatrixKHR matrix2 = {};
+
+    CHECK(compare_VkTransformMatrixKHR(&matrix1, &matrix2));
+
+    matrix2.matrix[2][3] = 1.f;
+    CHECK_FALSE(compare_VkTransformMatrixKHR(&matrix1, &matrix2));
+  }
+}
+
+TEST_CASE("Struct Compare: Selected union members") {
+  VkPerformanceValueINTEL value1 = {};
+  value1.type = VK_PERFORMANCE_VALUE_TYPE_UINT32_INTEL;
+  value1.data.value64 = 0x100000005;
+  VkPerformanceValueINTEL value2 = value1;
+  value2.data.value64 = 0x200000005;
+
+  // Only the selected member of the union is compared
+  CHECK(compare_VkPerformanceValueINTEL(&value1, &value2));
+  CHECK(order_VkPerformanceValueINTEL(&value1, &value2) == 0);
+
+  value2.type = VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL;
+  value1.type = VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL;
+  CHECK_FALSE(compare_VkPerformanceValueINTEL(&value1, &value2));
+  CHECK(order_VkPerformanceValueINTEL(&value1, &value2) < 0);
+}
+
+TEST_CASE("Struct Order: Consistent with comparisons") {
+  SECTION("Values") {
+    VkSamplerCreateInfo info1 = {};
+    info1.sType = VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO;
+    VkSamplerCreateInfo info2 = info1;
+
+    CHECK(order_VkSamplerCreateInfo(&info1, &info2) == 0);
+
+    info2.maxAnisotropy = 4.f;
+    CHECK(order_VkSamplerCreateInfo(&info1, &info2) < 0);
+    CHECK(order_VkSamplerCreateInfo(&info2, &info1) > 0);
+
+    info1.magFilter = VK_FILTER_LINEAR;
+    CHECK(order_VkSamplerCreateInfo(&info1, &info2) > 0);
+    CHECK(order_VkSamplerCreateInfo(&info2, &info1) < 0);
+  }
+
+  SECTION("Floats") {
+    VkViewport viewport1 = {};
+    VkViewport viewport2 = {};
+    viewport2.minDepth = -0.f;
+
+    CHECK(order_VkViewport(&viewport1, &viewport2) == 0);
+
+    viewport2.minDepth = NAN;
+    CHECK(order_VkViewport(&viewport1, &viewport2) < 0);
+    CHECK(order_VkViewport(&viewport2, &viewport1) > 0);
+    CHECK(order_VkViewport(&viewport2, &viewport2) == 0);
+  }
+
+  SECTION("Strings") {
+    std::string name1 = "a";
+    std::string name2 = "b";
+
+    VkApplicationInfo appInfo1 = {};
+    appInfo1.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+    VkApplicationInfo appInfo2 = appInfo1;
+
+    appInfo1.pApplicationName = name1.c_str();
+    CHECK(order_VkApplicationInfo(&appInfo1, &appInfo2) > 0);
+
+    appInfo2.pApplicationName = name2.c_str();
+    CHECK(order_VkApplicationInfo(&appInfo1, &appInfo2) < 0);
+
+    name2 = name1;
+    appInfo2.pApplicationName = name2.c_str();
+    CHECK(order_VkApplicationInfo(&appInfo1, &appInfo2) == 0);
+  }
+
+  SECTION("Sorted and deduplicated") {
+    std::vector<VkVertexInputAttributeDescription> attributes(6);
+    for (size_t i = 0; i < attributes.size(); ++i) {
+      attributes[i] = {};
+      attributes[i].location = static_cast<uint32_t>(i % 3);
+    }
+
+    std::sort(attributes.begin(), attributes.end(),
+              [](VkVertexInputAttributeDescription const &lhs,
+                 VkVertexInputAttributeDescription const &rhs) {
+                return order_VkVertexInputAttributeDescription(&lhs, &rhs) < 0;
+              });
+    attributes.erase(std::unique(attributes.begin(), attributes.end(),
+                                 [](VkVertexInputAttributeDescription const &lhs,
+                                    VkVertexInputAttributeDescription const &rhs) {
+                                   return compare_VkVertexInputAttributeDescription(&lhs, &rhs);
+                                 }),
+                     attributes.end());
+
+    REQUIRE(attributes.size() == 3);
+    CHECK(attributes[0].location == 0);
+    CHECK(attributes[2].location == 2);
+  }
+}
+
+#ifdef __cpp_impl_three_way_comparison
+TEST_CASE("Struct Order: C++ operators") {
+  VkExtent3D extent1 = {1, 2, 3};
+  VkExtent3D extent2 = {1, 2, 4};
+
+  CHECK(extent1 == extent1);
+  CHECK(extent1 != extent2);
+  CHECK(extent1 < extent2);
+  CHECK(std::is_gt(extent2 <=> extent1));
+}
+#endif
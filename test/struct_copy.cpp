@@ -0,0 +1,242 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#define VK_STRUCT_COPY_CONFIG_MAIN
+#include <vk_struct_copy.h>
+
+#include <catch2/catch_test_macros.hpp>
+#include <vulkan/vulkan.h>
+
+#include <cstdlib>
+#include <cstring>
+#include <vector>
+
+namespace {
+
+// Whether the pointer is within the single allocation of a copy
+bool inCopy(void const *pCopy, size_t size, void const *pData) {
+  char const *pBase = static_cast<char const *>(pCopy);
+  char const *pPtr = static_cast<char const *>(pData);
+  return pPtr >= pBase && pPtr < pBase + size;
+}
+
+} // namespace
+
+TEST_CASE("Struct Copy: Strings and pNext chains") {
+  char const *cLayers[] = {"VK_LAYER_one", "VK_LAYER_two"};
+
+  VkApplicationInfo appInfo = {};
+  appInfo.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+  appInfo.pApplicationName = "Application";
+  appInfo.applicationVersion = 42;
+  appInfo.pEngineName = nullptr;
+
+  VkValidationFeatureEnableEXT enables[] = {
+      VK_VALIDATION_FEATURE_ENABLE_BEST_PRACTICES_EXT,
+      VK_VALIDATION_FEATURE_ENABLE_SYNCHRONIZATION_VALIDATION_EXT};
+  VkValidationFeaturesEXT validationFeatures = {};
+  validationFeatures.sType = VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT;
+  validationFeatures.enabledValidationFeatureCount = 2;
+  validationFeatures.pEnabledValidationFeatures = enables;
+
+  VkInstanceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO;
+  createInfo.pNext = &validationFeatures;
+  createInfo.pApplicationInfo = &appInfo;
+  createInfo.enabledLayerCount = 2;
+  createInfo.ppEnabledLayerNames = cLayers;
+
+  VkInstanceCreateInfo *pCopy = copy_VkInstanceCreateInfo(&createInfo);
+  REQUIRE(pCopy != nullptr);
+
+  CHECK(pCopy->sType == VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO);
+  CHECK(pCopy->enabledExtensionCount == 0);
+  CHECK(pCopy->ppEnabledExtensionNames == nullptr);
+
+  REQUIRE(pCopy->pApplicationInfo != nullptr);
+  CHECK(pCopy->pApplicationInfo != &appInfo);
+  CHECK(pCopy->pApplicationInfo->applicationVersion == 42);
+  CHECK(pCopy->pApplicationInfo->pApplicationName != appInfo.pApplicationName);
+  CHECK(strcmp(pCopy->pApplicationInfo->pApplicationName, "Application") == 0);
+  CHECK(pCopy->pApplicationInfo->pEngineName == nullptr);
+
+  REQUIRE(pCopy->enabledLayerCount == 2);
+  CHECK(pCopy->ppEnabledLayerNames != cLayers);
+  for (uint32_t i = 0; i < 2; ++i) {
+    CHECK(pCopy->ppEnabledLayerNames[i] != cLayers[i]);
+    CHECK(strcmp(pCopy->ppEnabledLayerNames[i], cLayers[i]) == 0);
+  }
+
+  auto const *pFeatures = static_cast<VkValidationFeaturesEXT const *>(pCopy->pNext);
+  REQUIRE(pFeatures != nullptr);
+  CHECK(pFeatures != &validationFeatures);
+  CHECK(pFeatures->sType == VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT);
+  CHECK(pFeatures->pNext == nullptr);
+  REQUIRE(pFeatures->enabledValidationFeatureCount == 2);
+  CHECK(pFeatures->pEnabledValidationFeatures != enables);
+  CHECK(pFeatures->pEnabledValidationFeatures[0] == enables[0]);
+  CHECK(pFeatures->pEnabledValidationFeatures[1] == enables[1]);
+
+  // The copy owns none of the original data, so the original can change freely afterwards
+  cLayers[0] = "VK_LAYER_three";
+  CHECK(strcmp(pCopy->ppEnabledLayerNames[0], "VK_LAYER_one") == 0);
+
+  // All of it is in the single allocation
+  free(pCopy);
+}
+
+TEST_CASE("Struct Copy: Arrays of structs") {
+  constexpr uint32_t cQueueCount = 8;
+
+  std::vector<float> priorities[cQueueCount];
+  VkDeviceQueueGlobalPriorityCreateInfoKHR globalPriorities[cQueueCount] = {};
+  VkDeviceQueueCreateInfo queueCreateInfos[cQueueCount] = {};
+  for (uint32_t i = 0; i < cQueueCount; ++i) {
+    priorities[i].assign(i + 1, 1.f / (i + 1));
+
+    globalPriorities[i].sType = VK_STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_KHR;
+    globalPriorities[i].globalPriority = VK_QUEUE_GLOBAL_PRIORITY_HIGH_KHR;
+
+    queueCreateInfos[i].sType = VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO;
+    queueCreateInfos[i].pNext = &globalPriorities[i];
+    queueCreateInfos[i].queueFamilyIndex = i;
+    queueCreateInfos[i].queueCount = i + 1;
+    queueCreateInfos[i].pQueuePriorities = priorities[i].data();
+  }
+
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  createInfo.queueCreateInfoCount = cQueueCount;
+  createInfo.pQueueCreateInfos = queueCreateInfos;
+
+  VkDeviceCreateInfo *pCopy = copy_VkDeviceCreateInfo(&createInfo);
+  REQUIRE(pCopy != nullptr);
+  REQUIRE(pCopy->queueCreateInfoCount == cQueueCount);
+  CHECK(pCopy->pQueueCreateInfos != queueCreateInfos);
+
+  for (uint32_t i = 0; i < cQueueCount; ++i) {
+    VkDeviceQueueCreateInfo const &queueCreateInfo = pCopy->pQueueCreateInfos[i];
+    CHECK(queueCreateInfo.queueFamilyIndex == i);
+    REQUIRE(queueCreateInfo.queueCount == i + 1);
+    CHECK(queueCreateInfo.pQueuePriorities != priorities[i].data());
+    CHECK(memcmp(queueCreateInfo.pQueuePriorities, priorities[i].data(),
+                 priorities[i].size() * sizeof(float)) == 0);
+
+    auto const *pGlobalPriority =
+        static_cast<VkDeviceQueueGlobalPriorityCreateInfoKHR const *>(queueCreateInfo.pNext);
+    REQUIRE(pGlobalPriority != nullptr);
+    CHECK(pGlobalPriority != &globalPriorities[i]);
+    CHECK(pGlobalPriority->globalPriority == VK_QUEUE_GLOBAL_PRIORITY_HIGH_KHR);
+  }
+
+  free(pCopy);
+}
+
+TEST_CASE("Struct Copy: Unknown structs in a pNext chain") {
+  VkPhysicalDeviceFeatures2 features = {};
+  features.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+  features.features.geometryShader = VK_TRUE;
+
+  VkBaseOutStructure unknown = {};
+  unknown.sType = VK_STRUCTURE_TYPE_MAX_ENUM;
+  unknown.pNext = reinterpret_cast<VkBaseOutStructure *>(&features);
+
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  createInfo.pNext = &unknown;
+
+  // The unknown struct is left out, with the rest of the chain still copied
+  auto *pCopy = static_cast<VkDeviceCreateInfo *>(copy_vk_struct(&createInfo));
+  REQUIRE(pCopy != nullptr);
+
+  auto const *pFeatures = static_cast<VkPhysicalDeviceFeatures2 const *>(pCopy->pNext);
+  REQUIRE(pFeatures != nullptr);
+  CHECK(pFeatures != &features);
+  CHECK(pFeatures->sType == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2);
+  CHECK(pFeatures->features.geometryShader == VK_TRUE);
+  CHECK(pFeatures->pNext == nullptr);
+
+  free(pCopy);
+
+  // Unknown structs can't be copied themselves
+  CHECK(copy_vk_struct(&unknown) == nullptr);
+}
+
+TEST_CASE("Struct Copy: Long pNext chains") {
+  // Long enough that copying each link of the chain recursively would exhaust the stack
+  constexpr size_t cChainLength = 1000000;
+
+  std::vector<VkPhysicalDeviceFeatures2> chain(cChainLength);
+  for (size_t i = 0; i < cChainLength; ++i) {
+    chain[i] = {};
+    chain[i].sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+    chain[i].pNext = (i + 1 < cChainLength) ? &chain[i + 1] : nullptr;
+  }
+
+  VkDeviceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO;
+  createInfo.pNext = chain.data();
+
+  VkDeviceCreateInfo *pCopy = copy_VkDeviceCreateInfo(&createInfo);
+  REQUIRE(pCopy != nullptr);
+
+  size_t copySize = sizeof(VkDeviceCreateInfo) + cChainLength * sizeof(VkPhysicalDeviceFeatures2);
+  size_t length = 0;
+  for (auto const *pCurrent = static_cast<VkBaseInStructure const *>(pCopy->pNext);
+       pCurrent != nullptr; pCurrent = pCurrent->pNext) {
+    CHECK(inCopy(pCopy, copySize, pCurrent));
+    ++length;
+  }
+  CHECK(length == cChainLength);
+
+  free(pCopy);
+}
+
+TEST_CASE("Struct Copy: Deep sizes") {
+  SECTION("Structs without held data") {
+    VkImageCreateInfo createInfo = {};
+    createInfo.sType = VK_STRUCTURE_TYPE_IMAGE_CREATE_INFO;
+
+    CHECK(size_VkImageCreateInfo(&createInfo) == sizeof(VkImageCreateInfo));
+    CHECK(size_vk_struct(&createInfo) == sizeof(VkImageCreateInfo));
+  }
+
+  SECTION("Held data, padding and pNext chains") {
+    VkApplicationInfo appInfo = {};
+    appInfo.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+    appInfo.pApplicationName = "App";
+
+    VkPhysicalDeviceFeatures2 features = {};
+    features.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+
+    VkInstanceCreateInfo createInfo = {};
+    createInfo.sType = VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO;
+    createInfo.pNext = &features;
+    createInfo.pApplicationInfo = &appInfo;
+
+    // The application info and its name follow the create info, then the chain after the
+    // alignment padding of the name
+    size_t expected = sizeof(VkInstanceCreateInfo) + sizeof(VkApplicationInfo) + sizeof("App");
+    expected = (expected + alignof(VkPhysicalDeviceFeatures2) - 1) &
+               ~(alignof(VkPhysicalDeviceFeatures2) - 1);
+    expected += sizeof(VkPhysicalDeviceFeatures2);
+
+    CHECK(size_VkInstanceCreateInfo(&createInfo) == expected);
+    CHECK(size_vk_struct(&createInfo) == expected);
+
+    // The copy fits within the size exactly
+    VkInstanceCreateInfo *pCopy = copy_VkInstanceCreateInfo(&createInfo);
+    REQUIRE(pCopy != nullptr);
+    CHECK(reinterpret_cast<char const *>(pCopy->pNext) + sizeof(VkPhysicalDeviceFeatures2) ==
+          reinterpret_cast<char const *>(pCopy) + expected);
+    free(pCopy);
+  }
+
+  SECTION("Unknown structs") {
+    VkBaseOutStructure unknown = {};
+    unknown.sType = VK_STRUCTURE_TYPE_MAX_ENUM;
+
+    CHECK(size_vk_struct(&unknown) == 0);
+  }
+}
@@ -0,0 +1,246 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#define VK_STRUCT_COMPARE_CONFIG_MAIN
+#define VK_STRUCT_COPY_CONFIG_MAIN
+#define VK_STRUCT_ENCODE_CONFIG_MAIN
+#include <vk_struct_compare.h>
+#include <vk_struct_copy.h>
+#include <vk_struct_encode.h>
+
+#include <catch2/catch_test_macros.hpp>
+#include <vulkan/vulkan.h>
+
+#include <cstddef>
+#include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include <vector>
+
+namespace {
+
+std::vector<char> encode(void const *pData) {
+  std::vector<char> encoded(encode_vk_struct(pData, nullptr, 0));
+  REQUIRE(!encoded.empty());
+  REQUIRE(encode_vk_struct(pData, encoded.data(), encoded.size()) == encoded.size());
+  return encoded;
+}
+
+// Whether the pointer is within the single allocation of a decoded struct
+bool inDecoded(void const *pDecoded, size_t size, void const *pData) {
+  char const *pBase = static_cast<char const *>(pDecoded);
+  char const *pPtr = static_cast<char const *>(pData);
+  return pPtr >= pBase && pPtr < pBase + size;
+}
+
+} // namespace
+
+TEST_CASE("Struct Encode: Round trip") {
+  char const *cLayers[] = {"VK_LAYER_one", "VK_LAYER_two"};
+
+  VkApplicationInfo appInfo = {};
+  appInfo.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+  appInfo.pApplicationName = "Application";
+  appInfo.applicationVersion = 42;
+
+  VkValidationFeatureEnableEXT enables[] = {
+      VK_VALIDATION_FEATURE_ENABLE_BEST_PRACTICES_EXT,
+      VK_VALIDATION_FEATURE_ENABLE_SYNCHRONIZATION_VALIDATION_EXT};
+  VkValidationFeaturesEXT validationFeatures = {};
+  validationFeatures.sType = VK_STRUCTURE_TYPE_VALIDATION_FEATURES_EXT;
+  validationFeatures.enabledValidationFeatureCount = 2;
+  validationFeatures.pEnabledValidationFeatures = enables;
+
+  VkInstanceCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO;
+  createInfo.pNext = &validationFeatures;
+  createInfo.pApplicationInfo = &appInfo;
+  createInfo.enabledLayerCount = 2;
+  createInfo.ppEnabledLayerNames = cLayers;
+
+  std::vector<char> encoded = encode(&createInfo);
+  CHECK(encode_vk_struct(&createInfo, encoded.data(), encoded.size() - 1) == encoded.size());
+
+  auto *pDecoded =
+      static_cast<VkInstanceCreateInfo *>(decode_vk_struct(encoded.data(), encoded.size()));
+  REQUIRE(pDecoded != nullptr);
+  CHECK(compare_vk_struct(&createInfo, pDecoded));
+
+  // Everything is held by the single allocation
+  size_t const size = size_vk_struct(&createInfo);
+  CHECK(inDecoded(pDecoded, size, pDecoded->pApplicationInfo));
+  CHECK(inDecoded(pDecoded, size, pDecoded->pApplicationInfo->pApplicationName));
+  CHECK(inDecoded(pDecoded, size, pDecoded->ppEnabledLayerNames));
+  CHECK(inDecoded(pDecoded, size, pDecoded->ppEnabledLayerNames[1]));
+  CHECK(inDecoded(pDecoded, size, pDecoded->pNext));
+  CHECK(strcmp(pDecoded->ppEnabledLayerNames[1], "VK_LAYER_two") == 0);
+
+  // The encoded data doesn't depend on where it is decoded to
+  std::vector<char> moved(encoded.size() + 1);
+  memcpy(moved.data() + 1, encoded.data(), encoded.size());
+  auto *pMoved =
+      static_cast<VkInstanceCreateInfo *>(decode_vk_struct(moved.data() + 1, encoded.size()));
+  REQUIRE(pMoved != nullptr);
+  CHECK(compare_vk_struct(pDecoded, pMoved));
+
+  free(pMoved);
+  free(pDecoded);
+}
+
+TEST_CASE("Struct Encode: Arrays of structs") {
+  uint32_t const code[] = {0x07230203, 0, 0, 0};
+  uint32_t constant = 7;
+  VkSpecializationMapEntry mapEntry = {0, 0, sizeof(uint32_t)};
+
+  VkSpecializationInfo specialization = {};
+  specialization.mapEntryCount = 1;
+  specialization.pMapEntries = &mapEntry;
+  specialization.dataSize = sizeof(uint32_t);
+  specialization.pData = &constant;
+
+  VkShaderModuleCreateInfo moduleInfo = {};
+  moduleInfo.sType = VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO;
+  moduleInfo.codeSize = sizeof(code);
+  moduleInfo.pCode = code;
+
+  VkPipelineShaderStageCreateInfo stages[2] = {};
+  stages[0].sType = VK_STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO;
+  stages[0].stage = VK_SHADER_STAGE_VERTEX_BIT;
+  stages[0].pName = "main";
+  stages[0].pSpecializationInfo = &specialization;
+  stages[1] = stages[0];
+  stages[1].pNext = &moduleInfo;
+  stages[1].stage = VK_SHADER_STAGE_FRAGMENT_BIT;
+  stages[1].pName = "fragment";
+
+  VkGraphicsPipelineCreateInfo createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO;
+  createInfo.stageCount = 2;
+  createInfo.pStages = stages;
+
+  std::vector<char> encoded = encode(&createInfo);
+
+  auto *pDecoded =
+      static_cast<VkGraphicsPipelineCreateInfo *>(decode_vk_struct(encoded.data(), encoded.size()));
+  REQUIRE(pDecoded != nullptr);
+  CHECK(compare_vk_struct(&createInfo, pDecoded));
+
+  REQUIRE(pDecoded->stageCount == 2);
+  CHECK(strcmp(pDecoded->pStages[1].pName, "fragment") == 0);
+  REQUIRE(pDecoded->pStages[0].pSpecializationInfo != nullptr);
+  CHECK(*static_cast<uint32_t const *>(pDecoded->pStages[0].pSpecializationInfo->pData) == 7);
+
+  auto const *pModule = static_cast<VkShaderModuleCreateInfo const *>(pDecoded->pStages[1].pNext);
+  REQUIRE(pModule != nullptr);
+  CHECK(pModule->sType == VK_STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO);
+  CHECK(memcmp(pModule->pCode, code, sizeof(code)) == 0);
+
+  free(pDecoded);
+}
+
+VKAPI_ATTR VkBool32 VKAPI_CALL messengerCallback(VkDebugUtilsMessageSeverityFlagBitsEXT,
+                                                 VkDebugUtilsMessageTypeFlagsEXT,
+                                                 VkDebugUtilsMessengerCallbackDataEXT const *,
+                                                 void *) {
+  return VK_FALSE;
+}
+
+TEST_CASE("Struct Encode: Opaque pointers are encoded as NULL") {
+  int userData = 0;
+
+  VkDebugUtilsMessengerCreateInfoEXT createInfo = {};
+  createInfo.sType = VK_STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT;
+  createInfo.messageSeverity = VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT;
+  createInfo.pfnUserCallback = messengerCallback;
+  createInfo.pUserData = &userData;
+
+  std::vector<char> encoded = encode(&createInfo);
+
+  SECTION("Encoded") {
+    auto *pDecoded = static_cast<VkDebugUtilsMessengerCreateInfoEXT *>(
+        decode_vk_struct(encoded.data(), encoded.size()));
+    REQUIRE(pDecoded != nullptr);
+    CHECK(pDecoded->messageSeverity == VK_DEBUG_UTILS_MESSAGE_SEVERITY_ERROR_BIT_EXT);
+    CHECK(pDecoded->pfnUserCallback == nullptr);
+    CHECK(pDecoded->pUserData == nullptr);
+
+    free(pDecoded);
+  }
+
+  SECTION("Decoded") {
+    // whatever the encoded data holds for them isn't passed on
+    size_t const structOffset = encoded.size() - size_vk_struct(&createInfo);
+    void *pUserData = &userData;
+    PFN_vkDebugUtilsMessengerCallbackEXT pfnCallback = messengerCallback;
+    memcpy(encoded.data() + structOffset + offsetof(VkDebugUtilsMessengerCreateInfoEXT, pUserData),
+           &pUserData, sizeof(void *));
+    memcpy(encoded.data() + structOffset +
+               offsetof(VkDebugUtilsMessengerCreateInfoEXT, pfnUserCallback),
+           &pfnCallback, sizeof(pfnCallback));
+
+    auto *pDecoded = static_cast<VkDebugUtilsMessengerCreateInfoEXT *>(
+        decode_vk_struct(encoded.data(), encoded.size()));
+    REQUIRE(pDecoded != nullptr);
+    CHECK(pDecoded->pfnUserCallback == nullptr);
+    CHECK(pDecoded->pUserData == nullptr);
+
+    free(pDecoded);
+  }
+}
+
+TEST_CASE("Struct Encode: Invalid data") {
+  VkApplicationInfo appInfo = {};
+  appInfo.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+  appInfo.pApplicationName = "Application";
+
+  std::vector<char> encoded = encode(&appInfo);
+
+  SECTION("Unknown sType") {
+    VkApplicationInfo unknown = appInfo;
+    unknown.sType = VK_STRUCTURE_TYPE_MAX_ENUM;
+    CHECK(encode_vk_struct(&unknown, nullptr, 0) == 0);
+  }
+
+  SECTION("Unknown encoded sType") {
+    // not a value of VkStructureType, which is read without being loaded as one
+    uint32_t const sType = 0x8F9BE3E2;
+    memcpy(encoded.data() + encoded.size() - size_vk_struct(&appInfo), &sType, sizeof(uint32_t));
+    CHECK(decode_vk_struct(encoded.data(), encoded.size()) == nullptr);
+  }
+
+  SECTION("Truncated") {
+    CHECK(decode_vk_struct(encoded.data(), encoded.size() - 1) == nullptr);
+    CHECK(decode_vk_struct(encoded.data(), 4) == nullptr);
+    CHECK(decode_vk_struct(nullptr, encoded.size()) == nullptr);
+  }
+
+  SECTION("Different format version") {
+    uint32_t formatVersion = VK_STRUCT_ENCODE_FORMAT_VERSION + 1;
+    memcpy(encoded.data() + sizeof(uint32_t), &formatVersion, sizeof(uint32_t));
+    CHECK(decode_vk_struct(encoded.data(), encoded.size()) == nullptr);
+  }
+
+  SECTION("Different struct layout") {
+    // the fingerprint of the layout the structs were encoded with follows the format version
+    uint64_t layout;
+    memcpy(&layout, encoded.data() + 2 * sizeof(uint32_t), sizeof(uint64_t));
+    layout ^= 1;
+    memcpy(encoded.data() + 2 * sizeof(uint32_t), &layout, sizeof(uint64_t));
+    CHECK(decode_vk_struct(encoded.data(), encoded.size()) == nullptr);
+  }
+
+  SECTION("Pointer outside of the data") {
+    // the encoded struct follows the header, with the offset of the name in place of its pointer
+    size_t const memberOffset =
+        encoded.size() - size_vk_struct(&appInfo) + offsetof(VkApplicationInfo, pApplicationName);
+    char *pOffset = reinterpret_cast<char *>(static_cast<uintptr_t>(encoded.size()));
+    memcpy(encoded.data() + memberOffset, &pOffset, sizeof(char *));
+    CHECK(decode_vk_struct(encoded.data(), encoded.size()) == nullptr);
+
+    // or pointing back to the struct itself
+    pOffset = reinterpret_cast<char *>(static_cast<uintptr_t>(1));
+    memcpy(encoded.data() + memberOffset, &pOffset, sizeof(char *));
+    CHECK(decode_vk_struct(encoded.data(), encoded.size()) == nullptr);
+  }
+}
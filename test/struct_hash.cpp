@@ -0,0 +1,140 @@
+// Copyright (C) 2026 George Cave - gcave@stablecoder.ca
+//
+// SPDX-License-Identifier: Apache-2.0
+
+#define VK_STRUCT_COMPARE_CONFIG_MAIN
+#define VK_STRUCT_HASH_CONFIG_MAIN
+#define VK_STRUCT_HASH_STD_SPECIALIZATIONS
+#include <vk_struct_compare.h>
+#include <vk_struct_hash.h>
+
+#include <catch2/catch_test_macros.hpp>
+#include <vulkan/vulkan.h>
+
+#include <string>
+#include <unordered_map>
+
+TEST_CASE("Struct Hash: Consistent with comparisons") {
+  SECTION("Signed zero floats") {
+    VkSamplerCreateInfo info1 = {};
+    info1.sType = VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO;
+    info1.mipLodBias = 0.f;
+    VkSamplerCreateInfo info2 = info1;
+    info2.mipLodBias = -0.f;
+
+    REQUIRE(compare_VkSamplerCreateInfo(&info1, &info2));
+    CHECK(hash_VkSamplerCreateInfo(&info1) == hash_VkSamplerCreateInfo(&info2));
+  }
+
+  SECTION("Equal strings at different addresses") {
+    std::string name1 = "application";
+    std::string name2 = name1;
+
+    VkApplicationInfo appInfo1 = {};
+    appInfo1.sType = VK_STRUCTURE_TYPE_APPLICATION_INFO;
+    appInfo1.pApplicationName = name1.c_str();
+    VkApplicationInfo appInfo2 = appInfo1;
+    appInfo2.pApplicationName = name2.c_str();
+
+    REQUIRE(compare_VkApplicationInfo(&appInfo1, &appInfo2));
+    CHECK(hash_VkApplicationInfo(&appInfo1) == hash_VkApplicationInfo(&appInfo2));
+
+    appInfo2.pApplicationName = nullptr;
+    REQUIRE_FALSE(compare_VkApplicationInfo(&appInfo1, &appInfo2));
+    CHECK(hash_VkApplicationInfo(&appInfo1) != hash_VkApplicationInfo(&appInfo2));
+  }
+
+  SECTION("The sType and pNext are not hashed") {
+    VkPhysicalDeviceFeatures2 features = {};
+    features.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+
+    VkPhysicalDeviceFeatures2 chained = features;
+    chained.pNext = &features;
+
+    CHECK(hash_VkPhysicalDeviceFeatures2(&features) == hash_VkPhysicalDeviceFeatures2(&chained));
+  }
+
+  SECTION("Alias structs") {
+    VkPhysicalDeviceFeatures2KHR features1 = {};
+    features1.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2_KHR;
+    VkPhysicalDeviceFeatures2KHR features2 = features1;
+    features2.features.geometryShader = VK_TRUE;
+
+    CHECK_FALSE(compare_VkPhysicalDeviceFeatures2KHR(&features1, &features2));
+    CHECK(hash_VkPhysicalDeviceFeatures2KHR(&features1) !=
+          hash_VkPhysicalDeviceFeatures2KHR(&features2));
+    CHECK(hash_VkPhysicalDeviceFeatures2KHR(&features2) ==
+          hash_VkPhysicalDeviceFeatures2(&features2));
+  }
+}
+
+TEST_CASE("Struct Hash: pNext chains") {
+  VkPhysicalDeviceVulkan11Features features11 = {};
+  features11.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_1_FEATURES;
+  VkPhysicalDeviceVulkan12Features features12 = {};
+  features12.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_1_2_FEATURES;
+  features12.timelineSemaphore = VK_TRUE;
+
+  VkPhysicalDeviceFeatures2 features1 = {};
+  features1.sType = VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2;
+  VkPhysicalDeviceFeatures2 features2 = features1;
+
+  features1.pNext = &features11;
+  features11.pNext = &features12;
+
+  // Copies of the chained structs, linked in the other order
+  VkPhysicalDeviceVulkan11Features otherFeatures11 = features11;
+  VkPhysicalDeviceVulkan12Features otherFeatures12 = features12;
+  features2.pNext = &otherFeatures12;
+  otherFeatures12.pNext = &otherFeatures11;
+  otherFeatures11.pNext = nullptr;
+
+  REQUIRE(compare_vk_struct_unordered(&features1, &features2));
+  CHECK(hash_vk_struct_unordered(&features1) == hash_vk_struct_unordered(&features2));
+
+  REQUIRE_FALSE(compare_vk_struct(&features1, &features2));
+  CHECK(hash_vk_struct(&features1) != hash_vk_struct(&features2));
+
+  otherFeatures11.pNext = &otherFeatures12;
+  otherFeatures12.pNext = nullptr;
+  features2.pNext = &otherFeatures11;
+  REQUIRE(compare_vk_struct(&features1, &features2));
+  CHECK(hash_vk_struct(&features1) == hash_vk_struct(&features2));
+
+  otherFeatures12.timelineSemaphore = VK_FALSE;
+  CHECK(hash_vk_struct(&features1) != hash_vk_struct(&features2));
+  CHECK(hash_vk_struct_unordered(&features1) != hash_vk_struct_unordered(&features2));
+}
+
+TEST_CASE("Struct Hash: Unordered containers") {
+  VkSamplerCreateInfo info = {};
+  info.sType = VK_STRUCTURE_TYPE_SAMPLER_CREATE_INFO;
+
+  SECTION("Functors") {
+    std::unordered_map<VkSamplerCreateInfo, int, vk_struct_hash<VkSamplerCreateInfo>,
+                       vk_struct_equal<VkSamplerCreateInfo>>
+        samplers;
+    samplers[info] = 1;
+
+    info.maxAnisotropy = 16.f;
+    samplers[info] = 2;
+
+    CHECK(samplers.size() == 2);
+
+    info.maxAnisotropy = 0.f;
+    CHECK(samplers.at(info) == 1);
+  }
+
+  SECTION("std specializations") {
+    std::unordered_map<VkSamplerCreateInfo, int> samplers;
+    samplers[info] = 1;
+
+    info.maxAnisotropy = 16.f;
+    samplers[info] = 2;
+
+    CHECK(samplers.size() == 2);
+
+    info.maxAnisotropy = 0.f;
+    CHECK(samplers.at(info) == 1);
+  }
+}
@@ -4,6 +4,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import os
+
 from datetime import datetime
 
 def writeHeader(outFile):
@@ -21,4 +23,30 @@ def writeHeader(outFile):
     Check for an updated version anytime, or state concerns/bugs.
 */
 
-""".format(datetime.now().year))
\ No newline at end of file
+""".format(datetime.now().year))
+
+def getShardName(variants):
+    # The shard a struct is declared in when a header is split up, being the first feature or
+    # extension that requires it, or the core VK_VERSION_1_0 if none do
+    for struct_data in sorted(variants.values(), key=lambda item: item['first']):
+        for require_data in struct_data.get('requires', {}).values():
+            for define in require_data['defines']:
+                # of OR'd defines, the first is used
+                name = define.strip('()').split(',')[0]
+                if name != 'VK_ENABLE_BETA_EXTENSIONS':
+                    return name
+    return 'VK_VERSION_1_0'
+
+
+def getShards(structs):
+    # Groups the structs by their shard, in the same order as given
+    shards = {}
+    for struct, variants in structs.items():
+        shards.setdefault(getShardName(variants), {})[struct] = variants
+    return dict(sorted(shards.items()))
+
+
+def getShardInclude(shardDir, shard, outputFile):
+    # The path to include a shard by from the header that includes them all
+    path = os.path.join(shardDir, '{}.h'.format(shard))
+    return os.path.relpath(path, os.path.dirname(os.path.abspath(outputFile))).replace(os.sep, '/')
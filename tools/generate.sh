@@ -14,6 +14,14 @@ SKIP_PARSE=0
 SKIP_FETCH=0
 DOCS_REPO=""
 IGNORE_FEATURES=""
+SERIALIZATION_OPTS=""
+SOURCE_OUTPUT=""
+SHARD_HEADERS=0
+CLEANUP_OPTS=""
+COMPARE_OPTS=""
+COPY_OPTS=""
+ENCODE_OPTS=""
+HASH_OPTS=""
 
 # Type specific vars
 API=vulkan
@@ -25,10 +33,16 @@ help_blurb() {
     echo " -s, --start <INT>  The starting version of Vulkan to generate for (default: 72)"
     echo " -e, --end <INT>    The ending version of Vulkan to generate for (default: none)"
     echo " -o, --output <DIR> The directory in which to generate header files (default: <repo>/include)"
+    echo " --split-source <DIR>  Generate struct cleanup/compare/copy/encode/hash definitions as source files in the directory"
+    echo " --shard-headers    Split the struct cleanup/compare declarations into a header per feature/extension"
     echo " --skip-parse       Skips generating new XML cache, just generate header files"
     echo " --skip-fetch       Skips fetching documentation updates from remote"
     echo " --openxr           Parse and generate for OpenXR API instead of Vulkan"
     echo " --vulkansc         Parse and generate for Vulkan SC instead of regular Vulkan"
+    echo " --string-pool      Generate value serialization headers with relocation-free string pools"
+    echo " --allow-list <FILE>  Only generate value serialization for the types listed in the file"
+    echo " --deny-list <FILE>   Don't generate value serialization for the types listed in the file"
+    echo " --skip-vendor-extensions  Don't generate value serialization for vendor-specific extensions"
 }
 
 # Command-line parsing
@@ -50,6 +64,14 @@ while [[ $# -gt 0 ]]; do
         OUTPUT="$(readlink -e "$2")"
         shift 2
         ;;
+    --split-source)
+        SOURCE_OUTPUT="$(readlink -e "$2")"
+        shift 2
+        ;;
+    --shard-headers)
+        SHARD_HEADERS=1
+        shift
+        ;;
     --skip-parse)
         SKIP_PARSE=1
         shift
@@ -71,6 +93,22 @@ while [[ $# -gt 0 ]]; do
         REGEX="^vksc[1-9].[0-9]*\.[0-9]*$"
         shift
         ;;
+    --string-pool)
+        SERIALIZATION_OPTS="$SERIALIZATION_OPTS --string-pool"
+        shift
+        ;;
+    --allow-list)
+        SERIALIZATION_OPTS="$SERIALIZATION_OPTS --allow-list $(readlink -e "$2")"
+        shift 2
+        ;;
+    --deny-list)
+        SERIALIZATION_OPTS="$SERIALIZATION_OPTS --deny-list $(readlink -e "$2")"
+        shift 2
+        ;;
+    --skip-vendor-extensions)
+        SERIALIZATION_OPTS="$SERIALIZATION_OPTS --skip-vendor-extensions"
+        shift
+        ;;
     -h | --help)
         help_blurb
         exit 0
@@ -128,17 +166,38 @@ if [ $SKIP_PARSE -eq 0 ]; then
     popd >/dev/null
 fi
 
+# Generate struct cleanup/compare/copy/encode/hash definitions as separate source files
+if [ "$SOURCE_OUTPUT" != "" ]; then
+    CLEANUP_OPTS="--source ${SOURCE_OUTPUT}/vk_struct_cleanup.c"
+    COMPARE_OPTS="--source ${SOURCE_OUTPUT}/vk_struct_compare.c"
+    COPY_OPTS="--source ${SOURCE_OUTPUT}/vk_struct_copy.c"
+    ENCODE_OPTS="--source ${SOURCE_OUTPUT}/vk_struct_encode.c"
+    HASH_OPTS="--source ${SOURCE_OUTPUT}/vk_struct_hash.c"
+fi
+
+# Split the struct cleanup/compare declarations into a header per feature/extension
+if [ $SHARD_HEADERS -eq 1 ]; then
+    CLEANUP_OPTS="$CLEANUP_OPTS --shard-dir ${OUTPUT}/vk_struct_cleanup"
+    COMPARE_OPTS="$COMPARE_OPTS --shard-dir ${OUTPUT}/vk_struct_compare"
+fi
+
 # Generate headers
 if [[ "$API" == "vulkan" ]]; then
-    ./generate_serialization_header.py --input $CACHE --output "${OUTPUT}/vk_value_serialization.h"
+    ./generate_serialization_header.py --input $CACHE --output "${OUTPUT}/vk_value_serialization.h" $SERIALIZATION_OPTS
     ./generate_result_string_header.py --input $CACHE --output "${OUTPUT}/vk_result_to_string.h"    --api $API
-    ./generate_cleanup_header.py       --input $CACHE --output "${OUTPUT}/vk_struct_cleanup.h"
-    ./generate_comparison_header.py    --input $CACHE --output "${OUTPUT}/vk_struct_compare.h"  --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt"
+    ./generate_cleanup_header.py       --input $CACHE --output "${OUTPUT}/vk_struct_cleanup.h" $CLEANUP_OPTS
+    ./generate_comparison_header.py    --input $CACHE --output "${OUTPUT}/vk_struct_compare.h"  --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $COMPARE_OPTS
+    ./generate_copy_header.py          --input $CACHE --output "${OUTPUT}/vk_struct_copy.h"     --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $COPY_OPTS
+    ./generate_encode_header.py        --input $CACHE --output "${OUTPUT}/vk_struct_encode.h"   --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $ENCODE_OPTS
+    ./generate_hash_header.py          --input $CACHE --output "${OUTPUT}/vk_struct_hash.h"     --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $HASH_OPTS
 elif [[ "$API" == "vulkansc" ]]; then
-    ./generate_serialization_header.py --input $CACHE --output "${OUTPUT}/vksc_value_serialization.h"
+    ./generate_serialization_header.py --input $CACHE --output "${OUTPUT}/vksc_value_serialization.h" $SERIALIZATION_OPTS
     ./generate_result_string_header.py --input $CACHE --output "${OUTPUT}/vksc_result_to_string.h"    --api $API
-    ./generate_cleanup_header.py       --input $CACHE --output "${OUTPUT}/vk_struct_cleanup.h"
-    ./generate_comparison_header.py    --input $CACHE --output "${OUTPUT}/vk_struct_compare.h"
+    ./generate_cleanup_header.py       --input $CACHE --output "${OUTPUT}/vk_struct_cleanup.h" $CLEANUP_OPTS
+    ./generate_comparison_header.py    --input $CACHE --output "${OUTPUT}/vk_struct_compare.h" $COMPARE_OPTS
+    ./generate_copy_header.py          --input $CACHE --output "${OUTPUT}/vk_struct_copy.h"    --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $COPY_OPTS
+    ./generate_encode_header.py        --input $CACHE --output "${OUTPUT}/vk_struct_encode.h"  --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $ENCODE_OPTS
+    ./generate_hash_header.py          --input $CACHE --output "${OUTPUT}/vk_struct_hash.h"    --verified-void "${ROOT_DIR}/data/vk_verified_voids.txt" $HASH_OPTS
 elif [[ "$API" == "openxr" ]]; then
     ./generate_result_string_header.py --input $CACHE --output "${OUTPUT}/xr_result_to_string.h"    --api $API
 fi
@@ -149,3 +208,12 @@ clang-format -i *.h
 clang-format -i *.hpp
 clang-format -i *.h
 clang-format -i *.hpp
+
+if [ $SHARD_HEADERS -eq 1 ] && [[ "$API" != "openxr" ]]; then
+    clang-format -i vk_struct_cleanup/*.h vk_struct_compare/*.h
+fi
+
+if [ "$SOURCE_OUTPUT" != "" ]; then
+    cd "${SOURCE_OUTPUT}"
+    clang-format -i vk_struct_cleanup.c vk_struct_compare.c vk_struct_copy.c vk_struct_encode.c vk_struct_hash.c
+fi
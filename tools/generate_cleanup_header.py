@@ -7,6 +7,7 @@
 import argparse
 import gen_common
 import json
+import os
 import sys
 import xml.etree.ElementTree as ET
 
@@ -66,17 +67,42 @@ def get_define_guards(type_data, first_version, last_version):
     return guard_sets
 
 
+def format_define_guard(guard_list):
+    if len(guard_list) == 1:
+        return guard_list[0]
+    return ' || '.join('({})'.format(guard) for guard in guard_list)
+
+
 def output_define_guard(guard_list, out_file):
     if guard_list:
-        out_file.write('#if ')
-        if len(guard_list) == 1:
-            out_file.write('{}'.format(guard_list[0]))
-        else:
-            for idx, guard in enumerate(guard_list):
-                if idx > 0:
-                    out_file.write(' || ')
-                out_file.write('({})'.format(guard))
-        out_file.write('\n')
+        out_file.write('#if {}\n'.format(format_define_guard(guard_list)))
+
+
+def get_structure_type_value(structure_types, sType):
+    # Resolve through aliases, so all names sharing a value map to the same key
+    while sType in structure_types and 'alias' in structure_types[sType]:
+        sType = structure_types[sType]['alias']
+    if sType in structure_types and 'value' in structure_types[sType]:
+        return structure_types[sType]['value']
+    return sType
+
+
+def output_dispatch_case(sType, struct, out_file):
+    out_file.write('    case {}:\n'.format(sType))
+    out_file.write('        cleanup_members_{0}(({0} const*)pData, pCallbacks);\n'.format(struct))
+    out_file.write('        return;\n')
+
+
+def struct_needs_cleanup(struct, data):
+    # A struct only needs cleaning up if some variant of it points to externally held data,
+    # otherwise its cleanup function is empty and calls to it can be skipped entirely
+    for struct_data in data['structs'][struct].values():
+        if 'alias' in struct_data:
+            struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+        for member_data in struct_data.get('members', {}).values():
+            if 'suffix' in member_data and '*' in member_data['suffix']:
+                return True
+    return False
 
 
 def process_multi_member(member, member_data, iteration, suffix, available_characters, data, out_file):
@@ -97,19 +123,38 @@ def process_multi_member(member, member_data, iteration, suffix, available_chara
 
     else:
         # last level of indirection
-        if member_data['type'] in data['structs']:
-            # if an API-related structure type, clean it up
+        if member_data['type'] in data['structs'] and struct_needs_cleanup(member_data['type'], data):
+            # if an API-related structure type that holds data, clean it up with a tight loop
             if iteration[0].isdigit():
                 out_file.write('for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, iteration[0]))
             else:
                 out_file.write('for (size_t {0} = 0; {0} < pData->{1}{2}; ++{0}) {{\n'.format(iter_character, iteration[0], suffix))
 
             out_file.write('''\
-                cleanup_{2}(&pData->{3}{1}[{0}]);
+                cleanup_members_{2}(&pData->{3}{1}[{0}], pCallbacks);
             }}
             '''.format(iter_character, suffix, member_data['type'], member))
 
-    out_file.write('    free((void *)pData->{}{});\n'.format(member, suffix))
+    out_file.write('    cleanup_free(pData->{}{}, pCallbacks);\n'.format(member, suffix))
+
+
+def output_declarations(structs, first_version, last_version, out_file):
+    for struct, variants in structs.items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            out_file.write('\n')
+
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+
+            # Normal function declaration
+            out_file.write('void cleanup_{0}({0} const* pData);\n'.format(struct))
+            out_file.write('void cleanup_{0}_with_callbacks({0} const* pData, VkStructCleanupCallbacks const* pCallbacks);\n'.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
 
 
 def main(argv):
@@ -120,6 +165,10 @@ def main(argv):
     parser.add_argument('-o', '--output',
                         help='Output file to write to',
                         required=True)
+    parser.add_argument('-s', '--source',
+                        help='Source file to write the definitions to, leaving only declarations in the output header')
+    parser.add_argument('--shard-dir',
+                        help='Directory to split the declarations into, as a header per feature/extension, with the output header including them all')
     args = parser.parse_args()
 
     try:
@@ -145,7 +194,17 @@ def main(argv):
     out_file.write("""\
 #ifndef VK_STRUCT_CLEANUP_H
 #define VK_STRUCT_CLEANUP_H
+""")
+    if args.source:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the cleanup functions are required.
 
+    The definitions are compiled separately, from the accompanying {} source file.
+*/
+""".format(os.path.basename(args.source)))
+    else:
+        out_file.write("""
 /*  USAGE:
     To use, include this header where the declarations for the boolean checks are required.
 
@@ -154,7 +213,33 @@ def main(argv):
 
     so that the definitions are compiled somewhere following the one definition rule.
 */
+""")
+    if args.shard_dir:
+        out_file.write("""
+/*  SHARDS:
+    The declarations are split into a header for each feature or extension, named after it, in
+    the {0} directory (such as {0}/VK_KHR_swapchain.h).
+
+    Where only the functions of some structs are needed, including just those headers is quicker
+    to compile than including this whole header.
+*/
+""".format(os.path.basename(os.path.normpath(args.shard_dir))))
+
+        os.makedirs(args.shard_dir, exist_ok=True)
+        decl_file = open(os.path.join(args.shard_dir, 'common.h'), "w")
+        gen_common.writeHeader(decl_file)
+        decl_file.write("""\
+#ifndef VK_STRUCT_CLEANUP_COMMON_H
+#define VK_STRUCT_CLEANUP_COMMON_H
+
+/*  The generic cleanup functions, included by each of the headers that {} is
+    split into.
+*/
+""".format(os.path.basename(args.output)))
+    else:
+        decl_file = out_file
 
+    decl_file.write("""
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -163,7 +248,7 @@ extern "C" {
 """)
 
     # static asserts for minimum version
-    out_file.write('''
+    decl_file.write('''
 #ifdef __cplusplus
 static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION is lower than the minimum supported version (v{0})");
 #else
@@ -172,7 +257,7 @@ _Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the m
 '''.format(first_version))
 
     # warnings for above max generated version
-    out_file.write('''
+    decl_file.write('''
 #if VK_HEADER_VERSION > {0}
 #if _MSC_VER
 #pragma message(__FILE__ ": warning: VK_HEADER_VERSION is higher than what the header fully supports (v{0})")
@@ -183,37 +268,163 @@ _Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the m
 '''.format(last_version))
 
     # Generic struct catchall
-    out_file.write('\nvoid cleanup_vk_struct(void const* pData);\n')
+    decl_file.write('''
+void cleanup_vk_struct(void const* pData);
+
+// Callbacks used to release the data held by structs, in place of free()
+typedef struct VkStructCleanupCallbacks {
+    // Passed as the first parameter of the callbacks
+    void* pUserData;
+    // Frees a single allocation held by a struct, never called with NULL. If NULL, free() is used
+    void (*pfnFree)(void* pUserData, void* pMemory);
+    // If set, all data held by the struct given to cleanup is assumed to come from a single arena.
+    // This is called once with that struct to release the arena, instead of walking the struct and
+    // freeing each allocation
+    void (*pfnReset)(void* pUserData, void const* pData);
+} VkStructCleanupCallbacks;
+
+// As cleanup_vk_struct, but releasing the held data through the given callbacks, or free() if NULL.
+// The same goes for each cleanup_<VK_STRUCT_NAME>_with_callbacks function.
+void cleanup_vk_struct_with_callbacks(void const* pData, VkStructCleanupCallbacks const* pCallbacks);
+''')
+
+    if args.shard_dir:
+        decl_file.write("""
+#ifdef __cplusplus
+}
+#endif
+
+#endif // VK_STRUCT_CLEANUP_COMMON_H
+""")
+        decl_file.close()
+
+        # A header per feature/extension, each only holding the declarations of its structs
+        shards = gen_common.getShards(data['structs'])
+        for shard, structs in shards.items():
+            shard_file = open(os.path.join(args.shard_dir, '{}.h'.format(shard)), "w")
+            gen_common.writeHeader(shard_file)
+            shard_file.write("""\
+#ifndef VK_STRUCT_CLEANUP_{0}_H
+#define VK_STRUCT_CLEANUP_{0}_H
+
+/*  {1}
+    The cleanup functions of the structs first required by this feature/extension.
+
+    This can be included in place of the whole {2} header, which the definitions are
+    compiled from.
+*/
+
+#include "common.h"
+
+#ifdef __cplusplus
+extern "C" {{
+#endif
+""".format(shard.upper(), shard, os.path.basename(args.output)))
+            output_declarations(structs, first_version, last_version, shard_file)
+            shard_file.write("""
+#ifdef __cplusplus
+}}
+#endif
+
+#endif // VK_STRUCT_CLEANUP_{}_H
+""".format(shard.upper()))
+            shard_file.close()
+
+        out_file.write('\n#include "{}"\n'.format(gen_common.getShardInclude(args.shard_dir, 'common', args.output)))
+        for shard in shards:
+            out_file.write('#include "{}"\n'.format(gen_common.getShardInclude(args.shard_dir, shard, args.output)))
+        out_file.write("""
+#ifdef __cplusplus
+extern "C" {
+#endif
+""")
+    else:
+        output_declarations(data['structs'], first_version, last_version, out_file)
 
-    # Dynamic Declarations
+    # Definition Header
+    if args.source:
+        def_file = open(args.source, "w")
+        gen_common.writeHeader(def_file)
+        def_file.write("""\
+#include "{}"
+
+#include <stdlib.h>
+""".format(os.path.basename(args.output)))
+    else:
+        def_file = out_file
+        def_file.write("""
+#ifdef VK_STRUCT_CLEANUP_CONFIG_MAIN
+
+#include <stdlib.h>
+""")
+
+    # Definitions
+    def_file.write("""
+// Releases a single allocation through the callbacks, or free() where none are given
+static void cleanup_free(void const* pMemory, VkStructCleanupCallbacks const* pCallbacks) {
+    if (pCallbacks == NULL || pCallbacks->pfnFree == NULL) {
+        free((void*)pMemory);
+    } else if (pMemory != NULL) {
+        pCallbacks->pfnFree(pCallbacks->pUserData, (void*)pMemory);
+    }
+}
+""")
+
+    # The internal functions that do the work, with the public ones forwarding to them, so that the
+    # callbacks are passed down the struct tree and the arena is only released once, at the top
+    def_file.write('\nstatic void cleanup_members_vk_struct(void const* pData, VkStructCleanupCallbacks const* pCallbacks);\n')
     for struct, variants in data['structs'].items():
         if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
             continue
 
         sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
         for variant, struct_data in sorted_variants.items():
-            out_file.write('\n')
-            
             struct_guards = get_define_guards(struct_data, first_version, last_version)
-            output_define_guard(struct_guards, out_file)
-
-            # Normal function declaration
-            out_file.write('void cleanup_{0}({0} const* pData);\n'.format(struct))
+            output_define_guard(struct_guards, def_file)
+            def_file.write('static void cleanup_members_{0}({0} const* pData, VkStructCleanupCallbacks const* pCallbacks);\n'.format(struct))
             if struct_guards:
-                out_file.write('#endif\n')
+                def_file.write('#endif\n')
 
-    # Definition Header
-    out_file.write("""
-#ifdef VK_STRUCT_CLEANUP_CONFIG_MAIN
+    def_file.write("""
+void cleanup_vk_struct(void const* pData) { cleanup_members_vk_struct(pData, NULL); }
 
-#include <stdlib.h>
-""")
+void cleanup_vk_struct_with_callbacks(void const* pData, VkStructCleanupCallbacks const* pCallbacks) {
+    if (pCallbacks != NULL && pCallbacks->pfnReset != NULL) {
+        // arena mode, everything held by the struct is released at once
+        pCallbacks->pfnReset(pCallbacks->pUserData, pData);
+        return;
+    }
 
-    # Definitions
-    out_file.write("""
-void cleanup_vk_struct(void const* pData) {
+    cleanup_members_vk_struct(pData, pCallbacks);
+}
+
+// Walks a pNext chain iteratively, rather than each struct recursing into the next, so that stack
+// use doesn't grow with the length of the chain. Each struct in the chain is owned and about to be
+// freed, so it is detached from the rest of the chain before its own data is cleaned up.
+static void cleanup_pNext_chain(void const* pNext, VkStructCleanupCallbacks const* pCallbacks) {
+    VkBaseOutStructure* pCurrent = (VkBaseOutStructure*)pNext;
+
+    while (pCurrent != NULL) {
+        VkBaseOutStructure* pNextStruct = pCurrent->pNext;
+        pCurrent->pNext = NULL;
+
+        cleanup_members_vk_struct(pCurrent, pCallbacks);
+        cleanup_free(pCurrent, pCallbacks);
+
+        pCurrent = pNextStruct;
+    }
+}
+
+static void cleanup_members_vk_struct(void const* pData, VkStructCleanupCallbacks const* pCallbacks) {
     VkBaseInStructure const* pTemp = (VkBaseInStructure const*)pData;
-""")
+
+    switch (pTemp->sType) {""")
+
+    # Group the structs by their sType value, as different names (such as the vendor and promoted
+    # names) can map to the same value in different versions, and each value can only be a single
+    # case label
+    structure_types = data['enums'].get('VkStructureType', {}).get('values', {})
+    dispatch_groups = {}
 
     for struct, variants in data['structs'].items():
         if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
@@ -227,20 +438,38 @@ void cleanup_vk_struct(void const* pData) {
                 continue
             sTypeValue = struct_data['members']['sType']['value']
 
-            out_file.write('\n')
-            
             struct_guards = get_define_guards(struct_data, first_version, last_version)
-            output_define_guard(struct_guards, out_file)
-
-            out_file.write(
-                'if (pTemp->sType =={}) {{\n'.format(sTypeValue))
-            out_file.write(
-                '        cleanup_{0}(({0} const*)pData);\n'.format(struct))
-            out_file.write('        return;\n    }')
-            if struct_guards:
-                out_file.write('\n#endif\n')
-
-    out_file.write('}\n')
+            group_key = get_structure_type_value(structure_types, sTypeValue)
+            dispatch_groups.setdefault(group_key, []).append((sTypeValue, struct, struct_guards))
+
+    for group in dispatch_groups.values():
+        def_file.write('\n')
+
+        # Only the first entry whose guard passes gets a case label, the same as the first match
+        # would have been taken in a chain of checks
+        directive_open = False
+        for sTypeValue, struct, struct_guards in group:
+            if not struct_guards:
+                # an unguarded entry always matches, so any after it are unreachable
+                if directive_open:
+                    def_file.write('#else\n')
+                output_dispatch_case(sTypeValue, struct, def_file)
+                break
+
+            def_file.write('#elif ' if directive_open else '#if ')
+            def_file.write('{}\n'.format(format_define_guard(struct_guards)))
+            output_dispatch_case(sTypeValue, struct, def_file)
+            directive_open = True
+
+        if directive_open:
+            def_file.write('#endif\n')
+
+    def_file.write("""
+    default:
+        break;
+    }
+}
+""")
 
 
     # Dynamic Definitions
@@ -250,23 +479,37 @@ void cleanup_vk_struct(void const* pData) {
 
         sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
         for variant, struct_data in sorted_variants.items():
-            out_file.write('\n')
+            def_file.write('\n')
             
             struct_guards = get_define_guards(struct_data, first_version, last_version)
-            output_define_guard(struct_guards, out_file)
+            output_define_guard(struct_guards, def_file)
 
             if 'alias' in struct_data:
                 # for an alias struct, use the alias's data
                 struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
             
+            # The public functions, releasing the data through free() or the given callbacks
+            def_file.write('void cleanup_{0}({0} const* pData) {{ cleanup_members_{0}(pData, NULL); }}\n'.format(struct))
+            def_file.write('''
+void cleanup_{0}_with_callbacks({0} const* pData, VkStructCleanupCallbacks const* pCallbacks) {{
+    if (pCallbacks != NULL && pCallbacks->pfnReset != NULL) {{
+        pCallbacks->pfnReset(pCallbacks->pUserData, pData);
+        return;
+    }}
+
+    cleanup_members_{0}(pData, pCallbacks);
+}}
+
+'''.format(struct))
+
             if not 'members' in struct_data:
                 # if there are no members, leave an empty function
-                out_file.write(
-                    'void cleanup_{0}({0} const* pData) {{}}\n'.format(struct))
+                def_file.write(
+                    'static void cleanup_members_{0}({0} const* pData, VkStructCleanupCallbacks const* pCallbacks) {{}}\n'.format(struct))
             else:
                 # there are members, deal with them
-                out_file.write(
-                    'void cleanup_{0}({0} const* pData) {{'.format(struct))
+                def_file.write(
+                    'static void cleanup_members_{0}({0} const* pData, VkStructCleanupCallbacks const* pCallbacks) {{'.format(struct))
 
                 for member, member_data in struct_data['members'].items():
                     if not 'suffix' in member_data or not '*' in member_data['suffix']:
@@ -276,35 +519,36 @@ void cleanup_vk_struct(void const* pData) {
 
                     if not 'len' in member_data:
                         # single item
-                        out_file.write('\n    // {}\n'.format(member))
+                        def_file.write('\n    // {}\n'.format(member))
 
                         if member == 'pNext':
-                            # pNext could be anything, use dynamic call
-                            out_file.write('''\
-                                if (pData->pNext != NULL)
-                                    cleanup_vk_struct(pData->pNext);
-                                ''')
-                            
-                        elif member_type in data['structs']:
+                            # pNext could be anything, walk the chain dynamically
+                            def_file.write('    cleanup_pNext_chain(pData->pNext, pCallbacks);\n')
+                            continue
+
+                        if member_type in data['structs'] and struct_needs_cleanup(member_type, data):
                             # a Vulkan struct type
-                            out_file.write('''\
+                            def_file.write('''\
                                 if (pData->{0} != NULL)
-                                    cleanup_{1}(pData->{0});
+                                    cleanup_members_{1}(pData->{0}, pCallbacks);
                                 '''.format(member, member_type))
 
-                        out_file.write('    free((void*)pData->{});\n'.format(member))
+                        def_file.write('    cleanup_free(pData->{}, pCallbacks);\n'.format(member))
                     else:
                         # multiple items
-                        out_file.write('\n    // {} - {}\n'.format(member, member_data['len']))
-                        process_multi_member(member, member_data, member_data['len'].split(','), '', 'ijklmn', data, out_file)
+                        def_file.write('\n    // {} - {}\n'.format(member, member_data['len']))
+                        process_multi_member(member, member_data, member_data['len'].split(','), '', 'ijklmn', data, def_file)
 
-                out_file.write('}\n')
+                def_file.write('}\n')
 
             if struct_guards:
-                out_file.write('#endif\n')
+                def_file.write('#endif\n')
 
     # Footer
-    out_file.write('\n#endif // VK_STRUCT_CLEANUP_CONFIG_MAIN\n')
+    if args.source:
+        def_file.close()
+    else:
+        out_file.write('\n#endif // VK_STRUCT_CLEANUP_CONFIG_MAIN\n')
     out_file.write("""
 #ifdef __cplusplus
 }
@@ -6,7 +6,9 @@
 
 import argparse
 import gen_common
+import io
 import json
+import os
 import re
 import sys
 import xml.etree.ElementTree as ET
@@ -81,12 +83,77 @@ def output_define_guard(guard_list, out_file):
         out_file.write('\n')
 
 
+def format_define_guard(guard_list):
+    if len(guard_list) == 1:
+        return guard_list[0]
+    return ' || '.join('({})'.format(guard) for guard in guard_list)
+
+
+def get_structure_type_value(structure_types, sType):
+    # Resolve through aliases, so all names sharing a value map to the same key
+    while sType in structure_types and 'alias' in structure_types[sType]:
+        sType = structure_types[sType]['alias']
+    if sType in structure_types and 'value' in structure_types[sType]:
+        return structure_types[sType]['value']
+    return sType
+
+
+def output_dispatch_case(sType, struct, out_file):
+    out_file.write('    case {}:\n'.format(sType))
+    out_file.write('        return compare_{0}(({0} const*)s1, ({0} const*)s2);\n'.format(struct))
+
+
 def string_found(string1, string2):
     if re.search(r"\b" + re.escape(string1) + r"\b", string2):
         return True
     return False
 
 
+def get_plain_data_size(access, struct_data, data):
+    # Returns an expression of the summed sizes of all the members of a struct that can be compared
+    # as a block of memory, or None if any member can't be. When the sum equals the size of the
+    # struct, it has no padding, so a single memcmp is the same as comparing each member.
+    if not 'members' in struct_data:
+        return None
+
+    sizes = []
+    for member, member_data in struct_data['members'].items():
+        suffix = member_data.get('suffix', '')
+        if '*' in suffix or ':' in suffix or 'len' in member_data:
+            # pointers are followed, bitfields can't be sized and arrays are only partly compared
+            return None
+        if member_data['type'] in data['unions'] or member_data['type'] == 'float' or member_data['type'] == 'double':
+            # floats are compared by value, where -0.0 equals 0.0 and NaN doesn't equal itself
+            return None
+
+        member_access = '{}{}'.format(access, member)
+        if member_data['type'] in data['structs']:
+            # only structs with a single definition, so it is known which members are being summed
+            variants = list(data['structs'][member_data['type']].values())
+            if len(variants) != 1:
+                return None
+            nested_data = variants[0]
+            while 'alias' in nested_data:
+                nested_data = data['structs'][nested_data['alias']['name']][nested_data['alias']['hash']]
+
+            if '[' in suffix:
+                nested_size = get_plain_data_size('{}[0].'.format(member_access), nested_data, data)
+                if nested_size is None:
+                    return None
+                sizes.append('sizeof({0}) / sizeof({0}[0]) * ({1})'.format(member_access, nested_size))
+            else:
+                nested_size = get_plain_data_size('{}.'.format(member_access), nested_data, data)
+                if nested_size is None:
+                    return None
+                sizes.append(nested_size)
+        else:
+            sizes.append('sizeof({})'.format(member_access))
+
+    if not sizes:
+        return None
+    return ' + '.join(sizes)
+
+
 def process_multi_member(member, member_data, struct_data, iteration, suffix, available_characters, data, out_file):
     if len(available_characters) == 0:
         print('ERROR: ran out of nestable variable names, add more!')
@@ -148,27 +215,39 @@ def process_multi_member(member, member_data, struct_data, iteration, suffix, av
                           case VK_LAYER_SETTING_TYPE_BOOL32_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(VkBool32)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_INT32_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(int32_t)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_INT64_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(int64_t)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_UINT32_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(uint32_t)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_UINT64_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(uint64_t)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_FLOAT32_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(float)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_FLOAT64_EXT:
                             if (memcmp(s1->{0}{1}, s2->{0}{1}, {2} * sizeof(double)) != 0)
                                 return false;
+                            break;
                           case VK_LAYER_SETTING_TYPE_STRING_EXT:
-                            if (strncmp((char const *)s1->{0}{1}, (char const *) s2->{0}{1}, {2}) != 0)
-                                return false;
+                            for (uint32_t i = 0; i < {2}; ++i) {{
+                                char const *pString1 = ((char const *const *)s1->{0}{1})[i];
+                                char const *pString2 = ((char const *const *)s2->{0}{1})[i];
+                                if (pString1 != pString2 && (pString1 == NULL || pString2 == NULL || strcmp(pString1, pString2) != 0))
+                                    return false;
+                            }}
+                            break;
                           default:
                             break;
                         }}
@@ -190,6 +269,354 @@ def process_multi_member(member, member_data, struct_data, iteration, suffix, av
                 else:
                     out_file.write('  if (memcmp(&s1->{0}{1}, &s2->{0}{1}, {2}) != 0)\n  return false;\n'.format(member, suffix, this_iteration))
 
+def is_arithmetic_type(member_data, data):
+    # Types that are ordered by value, any others being ordered by their bytes
+    if ':' in member_data.get('suffix', ''):
+        # bitfields are always integers
+        return True
+    if member_data['type'] in data['enums']:
+        return True
+    if re.match(r'^Vk\w*Flag(s|Bits)[0-9]*[A-Z]*$', member_data['type']):
+        return True
+    return member_data['type'] in ['char', 'int', 'size_t',
+                                   'int8_t', 'int16_t', 'int32_t', 'int64_t',
+                                   'uint8_t', 'uint16_t', 'uint32_t', 'uint64_t',
+                                   'VkBool32', 'VkDeviceAddress', 'VkDeviceSize', 'VkFlags', 'VkFlags64', 'VkSampleMask']
+
+
+def output_order_value(access, member_data, data, out_file):
+    # Orders a value compared by the comparisons with ==
+    if member_data['type'] == 'float' or member_data['type'] == 'double':
+        out_file.write('  if ((result = order_double(s1->{0}, s2->{0})) != 0)\n    return result;\n'.format(access))
+    elif is_arithmetic_type(member_data, data):
+        out_file.write('  if (s1->{0} != s2->{0})\n    return (s1->{0} < s2->{0}) ? -1 : 1;\n'.format(access))
+    else:
+        out_file.write('  if (s1->{0} != s2->{0})\n    return order_bytes(&s1->{0}, &s2->{0}, sizeof(s1->{0}));\n'.format(access))
+
+
+def output_order_pointer(access, order_expression, out_file):
+    # Pointers to the same data are equal, and otherwise NULL is ordered before anything else
+    out_file.write('''\
+        if (s1->{0} != s2->{0}) {{
+            if (s1->{0} == NULL)
+                return -1;
+            if (s2->{0} == NULL)
+                return 1;
+            if ((result = {1}) != 0)
+                return result;
+        }}
+'''.format(access, order_expression))
+
+
+def process_order_multi_member(struct, member, member_data, struct_data, iteration, suffix, available_characters, data, out_file):
+    # Follows process_multi_member, ordering what it compares
+    if len(available_characters) == 0:
+        print('ERROR: ran out of nestable variable names, add more!')
+        sys.exit(1)
+    iter_character = available_characters[0]
+    this_iteration = iteration[0]
+    access = '{}{}'.format(member, suffix)
+
+    if len(iteration) > 1:
+        # more than one level of indirection
+        if this_iteration.isdigit():
+            loop = 'for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, this_iteration)
+        else:
+            loop = 'for (size_t {0} = 0; {0} < s1->{1}; ++{0}) {{\n'.format(iter_character, this_iteration)
+
+        out_file.write('if (s1->{0} != s2->{0}) {{\n'.format(access))
+        out_file.write('  if (s1->{0} == NULL)\n    return -1;\n  if (s2->{0} == NULL)\n    return 1;\n'.format(access))
+        out_file.write(loop)
+        process_order_multi_member(struct, member, member_data, struct_data, iteration[1:], '{}[{}]'.format(suffix, iter_character), available_characters[1:], data, out_file)
+        out_file.write('}\n')
+        out_file.write('}\n')
+        return
+
+    # last level of indirection
+    if member_data['type'] in data['structs']:
+        # structs pointed to are not compared
+        return
+
+    for struct_member, struct_member_data in struct_data['members'].items():
+        if string_found(struct_member, this_iteration):
+            this_iteration = this_iteration.replace(struct_member, 's1->{}'.format(struct_member))
+            if member_data['type'] != 'void':
+                this_iteration = '({}) * sizeof({})'.format(this_iteration, member_data['type'])
+
+    if member_data['type'] == 'char':
+        if this_iteration != 'null-terminated':
+            print('ERROR: Unsupported character ordering of {}'.format(member))
+            sys.exit(1)
+        if '*' in member_data['suffix']:
+            output_order_pointer(access, 'order_sign(strcmp(s1->{0}, s2->{0}))'.format(access), out_file)
+        else:
+            max_str_len = member_data['suffix'].replace('[', '')
+            max_str_len = max_str_len.replace(']', '')
+            out_file.write('if ((result = order_sign(strncmp(s1->{0}, s2->{0}, {1}))) != 0)\n  return result;\n'.format(access, max_str_len))
+
+    elif member_data['type'] == 'void':
+        if struct == 'VkLayerSettingEXT' and member == 'pValues':
+            out_file.write('''\
+                if (s1->{0} != s2->{0}) {{
+                    if (s1->{0} == NULL)
+                        return -1;
+                    if (s2->{0} == NULL)
+                        return 1;
+
+                    switch (s1->type) {{
+                      case VK_LAYER_SETTING_TYPE_BOOL32_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(VkBool32));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_INT32_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(int32_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_INT64_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(int64_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_UINT32_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(uint32_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_UINT64_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(uint64_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_FLOAT32_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(float));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_FLOAT64_EXT:
+                        result = order_bytes(s1->{0}, s2->{0}, {1} * sizeof(double));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_STRING_EXT:
+                        result = 0;
+                        for (uint32_t i = 0; i < {1} && result == 0; ++i) {{
+                            char const *pString1 = ((char const *const *)s1->{0})[i];
+                            char const *pString2 = ((char const *const *)s2->{0})[i];
+                            if (pString1 != pString2)
+                                result = (pString1 == NULL) ? -1 : (pString2 == NULL) ? 1 : order_sign(strcmp(pString1, pString2));
+                        }}
+                        break;
+                      default:
+                        result = 0;
+                        break;
+                    }}
+                    if (result != 0)
+                        return result;
+                }}\n\n'''.format(access, this_iteration))
+            return
+
+        for item in verified_voids:
+            if item['struct'] == struct and item['member'] == member:
+                output_order_pointer(access, 'order_bytes(s1->{0}, s2->{0}, {1})'.format(access, this_iteration), out_file)
+                return
+
+        print('Error: Unverified void type, investigate {} :: {}'.format(struct, member))
+        sys.exit(1)
+
+    elif '*' in member_data['suffix']:
+        output_order_pointer(access, 'order_bytes(s1->{0}, s2->{0}, {1})'.format(access, this_iteration), out_file)
+    else:
+        out_file.write('if ((result = order_bytes(&s1->{0}, &s2->{0}, {1})) != 0)\n  return result;\n'.format(access, this_iteration))
+
+
+def output_order_function(struct, struct_data, data, out_file):
+    # The members are ordered in the same passes they are compared in, so that the first member that
+    # compares differently decides the order
+    processed = set()
+    members = {member: member_data for member, member_data in struct_data.get('members', {}).items()
+               if member != 'sType' and member != 'pNext'}
+
+    def is_local(member_data):
+        suffix = member_data.get('suffix', '')
+        return '*' not in suffix and '[' not in suffix
+
+    # first pass, simple/local items
+    started = False
+    for member, member_data in members.items():
+        if not is_local(member_data) or member_data['type'] in data['structs'] or member_data['type'] in data['unions']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local, simple types\n')
+            started = True
+        output_order_value(member, member_data, data, out_file)
+    if started:
+        out_file.write('\n')
+
+    # second pass, local struct types
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['unions']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local, Vulkan struct types\n')
+            started = True
+        out_file.write('  if ((result = order_{0}(&s1->{1}, &s2->{1})) != 0)\n    return result;\n'.format(member_data['type'], member))
+    if started:
+        out_file.write('\n')
+
+    # third pass, union types with no selector, which are compared as a whole
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['structs'] or 'selector' in member_data:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // union types (no selector)\n')
+            started = True
+        out_file.write('  if ((result = order_bytes(&s1->{0}, &s2->{0}, sizeof(s1->{0}))) != 0)\n    return result;\n'.format(member))
+    if started:
+        out_file.write('\n')
+
+    # fourth pass, union types with selector
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['structs']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // union types (with selector)\n')
+            started = True
+
+        union_data = data['unions'][member_data['type']]
+        enum_data = data['enums'][struct_data['members'][member_data['selector']]['type']]
+        enum_value_data = enum_data['values']
+
+        out_file.write('  switch (s1->{}) {{\n'.format(member_data['selector']))
+        for union_member, union_member_data in union_data['members'].items():
+            non_guarded_cases = 0
+            all_guards = []
+            for case in union_member_data['selection'].split(','):
+                value_guards = get_define_guards(enum_value_data[case], enum_data['first'], enum_data['last'])
+                output_define_guard(value_guards, out_file)
+                out_file.write('  case {}:\n'.format(case))
+                if value_guards:
+                    out_file.write('#endif\n')
+                    all_guards += value_guards
+                else:
+                    non_guarded_cases += 1
+
+            if non_guarded_cases == 0:
+                output_define_guard(all_guards, out_file)
+
+            access = '{}.{}'.format(member, union_member)
+            if union_member_data['type'] in data['structs'] and '*' in union_member_data.get('suffix', ''):
+                output_order_pointer(access, 'order_{}(s1->{}, s2->{})'.format(union_member_data['type'], access, access), out_file)
+            elif union_member_data['type'] in data['structs']:
+                out_file.write('    if ((result = order_{0}(&s1->{1}, &s2->{1})) != 0)\n      return result;\n'.format(union_member_data['type'], access))
+            else:
+                output_order_value(access, union_member_data, data, out_file)
+            out_file.write('    break;\n')
+
+            if non_guarded_cases == 0:
+                out_file.write('#endif\n')
+            out_file.write('\n')
+
+        out_file.write('  default:\n')
+        out_file.write('    break;\n')
+        out_file.write('  }\n\n')
+
+    # fifth pass, local array members
+    started = False
+    for member, member_data in members.items():
+        if member in processed or '*' in member_data.get('suffix', ''):
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local array members\n')
+            started = True
+
+        if 'len' in member_data and member_data['type'] == 'char':
+            max_str_len = member_data['suffix'].replace('[', '')
+            max_str_len = max_str_len.replace(']', '')
+            out_file.write('  if ((result = order_sign(strncmp(s1->{0}, s2->{0}, {1}))) != 0)\n    return result;\n'.format(member, max_str_len))
+        elif 'len' in member_data:
+            out_file.write('  if ((result = order_bytes(s1->{0}, s2->{0}, s1->{1})) != 0)\n    return result;\n'.format(member, member_data['len']))
+        else:
+            out_file.write('  if ((result = order_bytes(s1->{0}, s2->{0}, sizeof(s1->{0}))) != 0)\n    return result;\n'.format(member))
+    if started:
+        out_file.write('\n')
+
+    # sixth pass, heap items
+    started = False
+    for member, member_data in members.items():
+        if member in processed or member_data['type'] in data['structs']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // non-local members\n')
+            started = True
+
+        if 'len' in member_data:
+            out_file.write('\n  // {} - {}\n'.format(member, member_data['len']))
+            process_order_multi_member(struct, member, member_data, struct_data, member_data['len'].split(','), '', 'ijklmn', data, out_file)
+        else:
+            # only the pointers themselves are compared
+            out_file.write('  if (s1->{0} != s2->{0})\n    return ((uintptr_t)s1->{0} < (uintptr_t)s2->{0}) ? -1 : 1;\n'.format(member))
+
+
+def output_declarations(structs, first_version, last_version, out_file):
+    for struct, variants in structs.items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            out_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+            out_file.write('bool compare_{0}({0} const *s1, {0} const *s2);\n'.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
+
+
+def output_order_declarations(structs, first_version, last_version, out_file):
+    out_file.write('\n#ifdef VK_STRUCT_COMPARE_ORDER\n')
+    for struct, variants in structs.items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            out_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+            out_file.write('int order_{0}({0} const *s1, {0} const *s2);\n'.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
+    out_file.write('\n#endif // VK_STRUCT_COMPARE_ORDER\n')
+
+
+# C++20 operators, so the structs can be used with sorted containers and algorithms
+OPERATORS_CHECK = """
+#if defined(__cplusplus) && defined(__cpp_impl_three_way_comparison) &&                           \\
+    defined(VK_STRUCT_COMPARE_OPERATORS)
+"""
+
+
+def output_operators(structs, first_version, last_version, out_file):
+    for struct, variants in structs.items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            # an alias is the same type as the struct it aliases, which has its own operators
+            if 'alias' in struct_data:
+                continue
+
+            out_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+            out_file.write('''\
+inline bool operator==({0} const &lhs, {0} const &rhs) {{ return compare_{0}(&lhs, &rhs); }}
+inline std::weak_ordering operator<=>({0} const &lhs, {0} const &rhs) {{
+  return order_{0}(&lhs, &rhs) <=> 0;
+}}
+'''.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
+
+
 # main
 data = dict()
 
@@ -203,6 +630,10 @@ parser.add_argument('-o', '--output',
 parser.add_argument('-v', '--verified-void',
                         help='File containing verified void comparisons',
                         required=True)
+parser.add_argument('-s', '--source',
+                        help='Source file to write the definitions to, leaving only declarations in the output header')
+parser.add_argument('--shard-dir',
+                        help='Directory to split the declarations into, as a header per feature/extension, with the output header including them all')
 args = parser.parse_args()
 
 try:
@@ -245,7 +676,17 @@ gen_common.writeHeader(out_file)
 # Specific Header
 out_file.write("""#ifndef VK_STRUCT_COMPARE_H
 #define VK_STRUCT_COMPARE_H
+""")
+if args.source:
+    out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the boolean checks are required.
 
+    The definitions are compiled separately, from the accompanying {} source file.
+*/
+""".format(os.path.basename(args.source)))
+else:
+    out_file.write("""
 /*  USAGE:
     To use, include this header where the declarations for the boolean checks are required.
 
@@ -254,11 +695,56 @@ out_file.write("""#ifndef VK_STRUCT_COMPARE_H
 
     so that the definitions are compiled somewhere following the one definition rule.
 */
-
+""")
+out_file.write("""
 /*
     These compare_*(lhs, rhs) functions only check the given struct's directly held data.
     Data held externally via pointers is not compared and must be done by the caller.
+
+    The compare_vk_struct*(lhs, rhs) functions compare structs of any known sType, including their
+    pNext chains. Structs in a chain that don't have a known sType are only equal to themselves.
+
+    If VK_STRUCT_COMPARE_ORDER is defined, the order_*(lhs, rhs) functions give a total order of the
+    structs, returning a value less than, equal to or greater than zero, as with memcmp. They follow
+    the same members as the comparisons, returning zero only where the comparison is true (except
+    for NaN values, which are ordered after all other values and equal to each other). The order is
+    of the held values and bytes, so it isn't meaningful beyond being consistent. It needs to be
+    defined where the definitions are compiled as well as where the functions are used.
+
+    If VK_STRUCT_COMPARE_OPERATORS is defined, then for C++20, operator== and operator<=> are also
+    defined for the structs using these functions, which implies VK_STRUCT_COMPARE_ORDER.
+*/
+""")
+if args.shard_dir:
+    out_file.write("""
+/*  SHARDS:
+    The declarations are split into a header for each feature or extension, named after it, in
+    the {0} directory (such as {0}/VK_KHR_swapchain.h).
+
+    Where only the functions of some structs are needed, including just those headers is quicker
+    to compile than including this whole header.
+*/
+""".format(os.path.basename(os.path.normpath(args.shard_dir))))
+
+    os.makedirs(args.shard_dir, exist_ok=True)
+    decl_file = open(os.path.join(args.shard_dir, 'common.h'), "w")
+    gen_common.writeHeader(decl_file)
+    decl_file.write("""\
+#ifndef VK_STRUCT_COMPARE_COMMON_H
+#define VK_STRUCT_COMPARE_COMMON_H
+
+/*  The generic comparison functions, included by each of the headers that {} is
+    split into.
 */
+""".format(os.path.basename(args.output)))
+else:
+    decl_file = out_file
+
+decl_file.write("""
+// The operators are defined using the order functions
+#if defined(VK_STRUCT_COMPARE_OPERATORS) && !defined(VK_STRUCT_COMPARE_ORDER)
+#define VK_STRUCT_COMPARE_ORDER
+#endif
 
 #ifdef __cplusplus
 extern "C" {
@@ -270,7 +756,7 @@ extern "C" {
 """)
 
 # static asserts for minimum version
-out_file.write('''
+decl_file.write('''
 #ifdef __cplusplus
 static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION is lower than the minimum supported version (v{0})");
 #else
@@ -279,7 +765,7 @@ _Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the m
 '''.format(first_version))
 
 # warnings for above max generated version
-out_file.write('''
+decl_file.write('''
 #if VK_HEADER_VERSION > {0}
 #if _MSC_VER
 #pragma message(__FILE__ ": warning: VK_HEADER_VERSION is higher than what the header fully supports (v{0})")
@@ -289,24 +775,111 @@ out_file.write('''
 #endif
 '''.format(last_version))
 
-# per-struct declarations
-for struct, variants in data['structs'].items():
-    if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
-        continue
+# Generic struct catchall
+decl_file.write('''
+// Compares two structs with a known sType, along with their pNext chains in order
+bool compare_vk_struct(void const *s1, void const *s2);
 
-    sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
-    for variant, struct_data in sorted_variants.items():
-        out_file.write('\n')
-        struct_guards = get_define_guards(struct_data, first_version, last_version)
-        output_define_guard(struct_guards, out_file)
-        out_file.write('bool compare_{0}({0} const *s1, {0} const *s2);\n'.format(struct))
-        if struct_guards:
-            out_file.write('#endif\n')
+// Compares two structs with a known sType, with the structs in their pNext chains matched by sType
+// rather than by position in the chain
+bool compare_vk_struct_unordered(void const *s1, void const *s2);
+''')
+
+if args.shard_dir:
+    decl_file.write("""
+#ifdef __cplusplus
+}
+#endif
+""")
+    decl_file.write(OPERATORS_CHECK)
+    decl_file.write("""#include <compare>
+#endif
+
+#endif // VK_STRUCT_COMPARE_COMMON_H
+""")
+    decl_file.close()
+
+    # A header per feature/extension, each only holding the declarations of its structs
+    shards = gen_common.getShards(data['structs'])
+    for shard, structs in shards.items():
+        shard_file = open(os.path.join(args.shard_dir, '{}.h'.format(shard)), "w")
+        gen_common.writeHeader(shard_file)
+        shard_file.write("""\
+#ifndef VK_STRUCT_COMPARE_{0}_H
+#define VK_STRUCT_COMPARE_{0}_H
+
+/*  {1}
+    The comparison functions of the structs first required by this feature/extension.
+
+    This can be included in place of the whole {2} header, which the definitions are
+    compiled from.
+*/
+
+#include "common.h"
+
+#ifdef __cplusplus
+extern "C" {{
+#endif
+""".format(shard.upper(), shard, os.path.basename(args.output)))
+        output_declarations(structs, first_version, last_version, shard_file)
+        output_order_declarations(structs, first_version, last_version, shard_file)
+        shard_file.write("""
+#ifdef __cplusplus
+}
+#endif
+""")
+        shard_file.write(OPERATORS_CHECK)
+        output_operators(structs, first_version, last_version, shard_file)
+        shard_file.write("""
+#endif // __cpp_impl_three_way_comparison
+
+#endif // VK_STRUCT_COMPARE_{}_H
+""".format(shard.upper()))
+        shard_file.close()
+
+    out_file.write('\n#include "{}"\n'.format(gen_common.getShardInclude(args.shard_dir, 'common', args.output)))
+    for shard in shards:
+        out_file.write('#include "{}"\n'.format(gen_common.getShardInclude(args.shard_dir, shard, args.output)))
+    out_file.write("""
+#ifdef __cplusplus
+extern "C" {
+#endif
+""")
+else:
+    output_declarations(data['structs'], first_version, last_version, out_file)
+    output_order_declarations(data['structs'], first_version, last_version, out_file)
 
 # definitions
-out_file.write('\n#ifdef VK_STRUCT_COMPARE_CONFIG_MAIN\n')
+if args.source:
+    def_file = open(args.source, "w")
+    gen_common.writeHeader(def_file)
+    def_file.write('#include "{}"\n'.format(os.path.basename(args.output)))
+else:
+    def_file = out_file
+    def_file.write('\n#ifdef VK_STRUCT_COMPARE_CONFIG_MAIN\n')
+
+def_file.write('''
+#include <string.h>
+
+#ifdef VK_STRUCT_COMPARE_ORDER
+static int order_sign(int value) { return (value > 0) - (value < 0); }
+
+static int order_bytes(void const *p1, void const *p2, size_t size) {
+  return order_sign(memcmp(p1, p2, size));
+}
 
-out_file.write('\n#include <string.h>\n')
+// Values that compare equal with == are ordered as equal, with NaNs ordered after everything else
+static int order_double(double v1, double v2) {
+  if (v1 < v2)
+    return -1;
+  if (v1 > v2)
+    return 1;
+  if (v1 == v2)
+    return 0;
+  return (v1 != v1) - (v2 != v2);
+}
+#endif
+''')
 
 # all structs
 for struct, variants in data['structs'].items():
@@ -315,22 +888,34 @@ for struct, variants in data['structs'].items():
 
     sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
     for variant, struct_data in sorted_variants.items():
-        out_file.write('\n')
+        def_file.write('\n')
         struct_guards = get_define_guards(struct_data, first_version, last_version)
-        output_define_guard(struct_guards, out_file)
-        out_file.write('bool compare_{0}({0} const *s1, {0} const *s2) {{\n'.format(struct))
+        output_define_guard(struct_guards, def_file)
+        def_file.write('bool compare_{0}({0} const *s1, {0} const *s2) {{\n'.format(struct))
 
         while 'alias' in struct_data:
             # swap in the alias data until reach the end of the chain
             struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
 
         if not 'members' in struct_data:
-            out_file.write('  return true;\n')
-            out_file.write('}\n')
+            def_file.write('  return true;\n')
+            def_file.write('}\n')
             if struct_guards:
-                out_file.write('#endif\n')
+                def_file.write('#endif\n')
             continue
 
+        # Members handled by an earlier pass, tracked per function rather than in the member data, as
+        # alias structs share their member data with the struct they alias
+        processed = set()
+
+        # structs of only plain data are compared as a single block, with the member comparisons
+        # that follow only remaining for where the struct has padding on the compiling platform
+        plain_data_size = get_plain_data_size('s1->', struct_data, data)
+        if plain_data_size is not None:
+            def_file.write('  // plain data, compared as a single block when there is no padding\n')
+            def_file.write('  if (sizeof({0}) == {1})\n'.format(struct, plain_data_size))
+            def_file.write('    return memcmp(s1, s2, sizeof({})) == 0;\n\n'.format(struct))
+
         # first pass, only simple/local items
         compare_started = False
         for member, member_data in struct_data['members'].items():
@@ -338,136 +923,137 @@ for struct, variants in data['structs'].items():
                 continue
             if member == 'sType' or member == 'pNext' or member_data['type'] in data['structs'] or member_data['type'] in data['unions']:
                 continue
-            member_data['proccessed'] = True
+            processed.add(member)
 
             if not compare_started:
-                out_file.write('  // local, simple types\n')
-                out_file.write('  if (')
+                def_file.write('  // local, simple types\n')
+                def_file.write('  if (')
             else:
-                out_file.write(' || ')
+                def_file.write(' || ')
             compare_started = True
 
-            out_file.write('(s1->{0} != s2 ->{0})'.format(member))
+            def_file.write('(s1->{0} != s2 ->{0})'.format(member))
         if compare_started:
-            out_file.write(')')
-            out_file.write('return false;\n\n')
+            def_file.write(')')
+            def_file.write('return false;\n\n')
 
         # second pass, local struct types
         compare_started = False
         for member, member_data in struct_data['members'].items():
-            if 'proccessed' in member_data:
+            if member in processed:
                 continue
             if 'suffix' in member_data and ('*' in member_data['suffix'] or '[' in member_data['suffix']):
                 continue
             if member == 'sType' or member == 'pNext' or member_data['type'] in data['unions']:
                 continue
-            member_data['proccessed'] = True
+            processed.add(member)
 
             if not compare_started:
-                out_file.write('  // local, Vulkan struct types\n')
-                out_file.write('  if (')
+                def_file.write('  // local, Vulkan struct types\n')
+                def_file.write('  if (')
             else:
-                out_file.write(' || ')
+                def_file.write(' || ')
             compare_started = True
 
-            out_file.write('!compare_{0}(&s1->{1}, &s2->{1})'.format(member_data['type'], member))
+            def_file.write('!compare_{0}(&s1->{1}, &s2->{1})'.format(member_data['type'], member))
         if compare_started:
-            out_file.write(')')
-            out_file.write('return false;\n\n')
+            def_file.write(')')
+            def_file.write('return false;\n\n')
 
         # third pass, union types with no selector
         compare_started = False
         for member, member_data in struct_data['members'].items():
-            if 'proccessed' in member_data:
+            if member in processed:
                 continue
             if 'suffix' in member_data and ('*' in member_data['suffix'] or '[' in member_data['suffix']):
                 continue
             if member == 'sType' or member == 'pNext' or member_data['type'] in data['structs'] or 'selector' in member_data:
                 continue
-            member_data['proccessed'] = True
+            processed.add(member)
 
             if not member_data['type'].startswith('VkDeviceOrHostAddress') and member_data['type'] != 'VkClearValue' and member_data['type'] != 'VkClearColorValue':
                 print("Error: Unhandled non-selector union type {}::{}".format(struct, member))
                 sys.exit(1)
 
             if not compare_started:
-                out_file.write('  // union types (no selector)\n')
-                out_file.write('  if (')
+                def_file.write('  // union types (no selector)\n')
+                def_file.write('  if (')
             else:
-                out_file.write(' || ')
+                def_file.write(' || ')
             compare_started = True
 
             union_type = data['unions'][member_data['type']]
-            out_file.write('memcmp(&s1->{0}, &s2->{0}, sizeof({1})) != 0'.format(member, member_data['type']))
+            def_file.write('memcmp(&s1->{0}, &s2->{0}, sizeof({1})) != 0'.format(member, member_data['type']))
         if compare_started:
-            out_file.write(')\n    return false;\n\n')
+            def_file.write(')\n    return false;\n\n')
 
         # fourth pass, union types with selector
         compare_started = False
         for member, member_data in struct_data['members'].items():
-            if 'proccessed' in member_data:
+            if member in processed:
                 continue
             if 'suffix' in member_data and ('*' in member_data['suffix'] or '[' in member_data['suffix']):
                 continue
             if member == 'sType' or member == 'pNext' or member_data['type'] in data['structs']:
                 continue
-            member_data['proccessed'] = True
+            processed.add(member)
 
             if not compare_started:
-                out_file.write('  // union types (with selector)\n')
+                def_file.write('  // union types (with selector)\n')
             compare_started = True
 
             union_data = data['unions'][member_data['type']]
             enum_data = data['enums'][struct_data['members'][member_data['selector']]['type']]
             enum_value_data = enum_data['values']
 
-            out_file.write('  switch (s1->{}) {{\n'.format(member_data['selector']))
-            out_file.write('  // {}\n'.format(member_data['type']))
+            def_file.write('  switch (s1->{}) {{\n'.format(member_data['selector']))
+            def_file.write('  // {}\n'.format(member_data['type']))
             for union_member, union_member_data in union_data['members'].items():
                 non_guarded_cases = 0
                 guarded_cases = 0
                 all_guards = []
                 for case in union_member_data['selection'].split(','):
                     value_guards = get_define_guards(enum_value_data[case], enum_data['first'], enum_data['last'])
-                    output_define_guard(value_guards, out_file)
-                    out_file.write('  case {}:\n'.format(case))
+                    output_define_guard(value_guards, def_file)
+                    def_file.write('  case {}:\n'.format(case))
                     if value_guards:
-                        out_file.write('#endif \n')
+                        def_file.write('#endif \n')
                         guarded_cases += 1
                         all_guards += value_guards
                     else:
                         non_guarded_cases += 1
 
                 if non_guarded_cases == 0:
-                    output_define_guard(all_guards, out_file)
+                    output_define_guard(all_guards, def_file)
                 
                 if union_member_data['type'] in data['structs'] and 'suffix' in union_member_data and '*' in union_member_data['suffix']:
-                    out_file.write('    if(!compare_{0}(s1->{1}.{2}, s2->{1}.{2}))'.format(union_member_data['type'], member, union_member))
+                    def_file.write('    if(!compare_{0}(s1->{1}.{2}, s2->{1}.{2}))'.format(union_member_data['type'], member, union_member))
                 elif union_member_data['type'] in data['structs']:
-                    out_file.write('    if(!compare_{0}(&s1->{1}.{2}, &s2->{1}.{2}))'.format(union_member_data['type'], member, union_member))
+                    def_file.write('    if(!compare_{0}(&s1->{1}.{2}, &s2->{1}.{2}))'.format(union_member_data['type'], member, union_member))
                 else:
-                    out_file.write('    if(s1->{0}.{1} != s2->{0}.{1})'.format(member, union_member))
-                out_file.write('      return false;\n')
+                    def_file.write('    if(s1->{0}.{1} != s2->{0}.{1})'.format(member, union_member))
+                def_file.write('      return false;\n')
+                def_file.write('    break;\n')
                 if non_guarded_cases == 0:
-                    out_file.write('#endif\n')
-                out_file.write('\n')
+                    def_file.write('#endif\n')
+                def_file.write('\n')
                 
-            out_file.write('  default: ;\n')
-            out_file.write('  }\n\n')
+            def_file.write('  default: ;\n')
+            def_file.write('  }\n\n')
 
         # fifth pass, local array members
         compare_started = False
         for member, member_data in struct_data['members'].items():
-            if 'proccessed' in member_data:
+            if member in processed:
                 continue
             if 'suffix' in member_data and '*' in member_data['suffix']:
                 continue
             if member == 'sType' or member == 'pNext':
                 continue
-            member_data['proccessed'] = True
+            processed.add(member)
 
             if not compare_started:
-                out_file.write('  // local array members\n')
+                def_file.write('  // local array members\n')
             compare_started = True
 
             max_str_len = member_data['suffix'].replace('[', '')
@@ -477,45 +1063,216 @@ for struct, variants in data['structs'].items():
                 # a dynamic comparison
                 if member_data['type'] == 'char':
                     if member_data['len'] == 'null-terminated':
-                        out_file.write('if (strncmp(s1->{0}, s2->{0}, {1}) != 0) return false;\n'.format(member, max_str_len))
+                        def_file.write('if (strncmp(s1->{0}, s2->{0}, {1}) != 0) return false;\n'.format(member, max_str_len))
                     else:
                         print('ERROR: Non null-terminated char member {}::{}\n'.format(struct, member))
                         sys.exit(1)
                 else:
-                    out_file.write('if (memcmp(s1->{0}, s2->{0}, s1->{1}) != 0) return false;\n'.format(member, member_data['len']))
+                    def_file.write('if (memcmp(s1->{0}, s2->{0}, s1->{1}) != 0) return false;\n'.format(member, member_data['len']))
             else:
-                out_file.write('if (memcmp(s1->{0}, s2->{0}, {1} * sizeof({2})) != 0) return false;\n'.format(member, max_str_len, member_data['type']))
+                # the size of the array itself, as the suffix of multi-dimensional arrays isn't a count
+                def_file.write('if (memcmp(s1->{0}, s2->{0}, sizeof(s1->{0})) != 0) return false;\n'.format(member))
 
         # sixth pass, heap items
         compare_started = False
         for member, member_data in struct_data['members'].items():
-            if 'proccessed' in member_data:
+            if member in processed:
                 continue
             if member == 'sType' or member == 'pNext' or member_data['type'] in data['structs']:
                 continue
-            member_data['processed'] = True
+            processed.add(member)
 
             if not compare_started:
-                out_file.write('  // non-local members\n')
+                def_file.write('  // non-local members\n')
             compare_started = True
 
             if 'len' in member_data:
-                out_file.write('\n  // {} - {}\n'.format(member, member_data['len']))
-                process_multi_member(member, member_data, struct_data, member_data['len'].split(','), '', 'ijklmn', data, out_file)
+                def_file.write('\n  // {} - {}\n'.format(member, member_data['len']))
+                process_multi_member(member, member_data, struct_data, member_data['len'].split(','), '', 'ijklmn', data, def_file)
             else:
-                out_file.write('  if (s1->{0} != s2->{0}) return false;\n\n'.format(member))
+                def_file.write('  if (s1->{0} != s2->{0}) return false;\n\n'.format(member))
 
         # complete the comparison
-        out_file.write('  return true;\n')
-        out_file.write('}\n')
+        def_file.write('  return true;\n')
+        def_file.write('}\n')
         if struct_guards:
-            out_file.write('#endif\n')
+            def_file.write('#endif\n')
+
+# ordering of all structs
+def_file.write('\n#ifdef VK_STRUCT_COMPARE_ORDER\n')
+for struct, variants in data['structs'].items():
+    if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+        continue
+
+    sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+    for variant, struct_data in sorted_variants.items():
+        def_file.write('\n')
+        struct_guards = get_define_guards(struct_data, first_version, last_version)
+        output_define_guard(struct_guards, def_file)
+        def_file.write('int order_{0}({0} const *s1, {0} const *s2) {{\n'.format(struct))
+
+        while 'alias' in struct_data:
+            # swap in the alias data until reach the end of the chain
+            struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+
+        order_body = io.StringIO()
+        output_order_function(struct, struct_data, data, order_body)
+        if 'result = ' in order_body.getvalue():
+            def_file.write('  int result;\n\n')
+        elif not order_body.getvalue():
+            def_file.write('  (void)s1;\n  (void)s2;\n')
+        def_file.write(order_body.getvalue())
+        def_file.write('  return 0;\n')
+        def_file.write('}\n')
+        if struct_guards:
+            def_file.write('#endif\n')
+def_file.write('\n#endif // VK_STRUCT_COMPARE_ORDER\n')
+
+# Comparison of a single struct of any known sType
+def_file.write("""
+// Compares two structs of the same sType, but not their pNext chains, returning false if the sType
+// isn't known
+static bool compare_vk_struct_single(void const *s1, void const *s2) {
+    VkBaseInStructure const* pTemp = (VkBaseInStructure const*)s1;
+
+    switch (pTemp->sType) {""")
+
+# Group the structs by their sType value, as different names (such as the vendor and promoted
+# names) can map to the same value in different versions, and each value can only be a single
+# case label
+structure_types = data['enums'].get('VkStructureType', {}).get('values', {})
+dispatch_groups = {}
+
+for struct, variants in data['structs'].items():
+    if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+        continue
+
+    sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+    for variant, struct_data in sorted_variants.items():
+
+        # only deal with structs that have defined sType
+        if not 'members' in struct_data or 'sType' not in struct_data['members']:
+            continue
+        sTypeValue = struct_data['members']['sType']['value']
+
+        struct_guards = get_define_guards(struct_data, first_version, last_version)
+        group_key = get_structure_type_value(structure_types, sTypeValue)
+        dispatch_groups.setdefault(group_key, []).append((sTypeValue, struct, struct_guards))
+
+for group in dispatch_groups.values():
+    def_file.write('\n')
+
+    # Only the first entry whose guard passes gets a case label
+    directive_open = False
+    for sTypeValue, struct, struct_guards in group:
+        if not struct_guards:
+            # an unguarded entry always matches, so any after it are unreachable
+            if directive_open:
+                def_file.write('#else\n')
+            output_dispatch_case(sTypeValue, struct, def_file)
+            break
+
+        def_file.write('#elif ' if directive_open else '#if ')
+        def_file.write('{}\n'.format(format_define_guard(struct_guards)))
+        output_dispatch_case(sTypeValue, struct, def_file)
+        directive_open = True
+
+    if directive_open:
+        def_file.write('#endif\n')
+
+def_file.write("""
+    default:
+        return false;
+    }
+}
+
+static bool compare_vk_struct_pair(VkBaseInStructure const* s1, VkBaseInStructure const* s2) {
+    if (s1 == s2)
+        return true;
+    return s1->sType == s2->sType && compare_vk_struct_single(s1, s2);
+}
+
+bool compare_vk_struct(void const *s1, void const *s2) {
+    VkBaseInStructure const* pCurrent1 = (VkBaseInStructure const*)s1;
+    VkBaseInStructure const* pCurrent2 = (VkBaseInStructure const*)s2;
+
+    // Chains are walked iteratively, so that stack use doesn't grow with the length of the chain
+    while (pCurrent1 != NULL && pCurrent2 != NULL) {
+        // from a shared struct onwards, the rest of the chains are the same
+        if (pCurrent1 == pCurrent2)
+            return true;
+        if (!compare_vk_struct_pair(pCurrent1, pCurrent2))
+            return false;
+
+        pCurrent1 = pCurrent1->pNext;
+        pCurrent2 = pCurrent2->pNext;
+    }
+
+    // both chains have to end at the same point
+    return pCurrent1 == pCurrent2;
+}
+
+bool compare_vk_struct_unordered(void const *s1, void const *s2) {
+    VkBaseInStructure const* pChain1 = (VkBaseInStructure const*)s1;
+    VkBaseInStructure const* pChain2 = (VkBaseInStructure const*)s2;
+
+    // The given structs themselves have to match, only their chains can be in any order
+    if (!compare_vk_struct_pair(pChain1, pChain2))
+        return false;
+    pChain1 = pChain1->pNext;
+    pChain2 = pChain2->pNext;
+
+    size_t length1 = 0;
+    size_t length2 = 0;
+    for (VkBaseInStructure const* pCurrent = pChain1; pCurrent != NULL; pCurrent = pCurrent->pNext)
+        ++length1;
+    for (VkBaseInStructure const* pCurrent = pChain2; pCurrent != NULL; pCurrent = pCurrent->pNext)
+        ++length2;
+    if (length1 != length2)
+        return false;
+
+    // Each struct of the first chain is matched to the struct of the same sType in the second
+    // chain, where if an sType is in a chain more than once, they are matched in the order they
+    // appear. With the chains the same length, every struct is then matched exactly once.
+    for (VkBaseInStructure const* pCurrent1 = pChain1; pCurrent1 != NULL; pCurrent1 = pCurrent1->pNext) {
+        size_t occurrence = 0;
+        for (VkBaseInStructure const* pPrior = pChain1; pPrior != pCurrent1; pPrior = pPrior->pNext) {
+            if (pPrior->sType == pCurrent1->sType)
+                ++occurrence;
+        }
+
+        VkBaseInStructure const* pCurrent2 = pChain2;
+        while (pCurrent2 != NULL) {
+            if (pCurrent2->sType == pCurrent1->sType) {
+                if (occurrence == 0)
+                    break;
+                --occurrence;
+            }
+            pCurrent2 = pCurrent2->pNext;
+        }
+
+        if (pCurrent2 == NULL || !compare_vk_struct_pair(pCurrent1, pCurrent2))
+            return false;
+    }
+
+    return true;
+}
+""")
 
 # footer
-out_file.write('\n#endif // VK_STRUCT_COMPARE_CONFIG_MAIN')
+if args.source:
+    def_file.close()
+else:
+    out_file.write('\n#endif // VK_STRUCT_COMPARE_CONFIG_MAIN')
 out_file.write("""
 #ifdef __cplusplus
 }
 #endif
 """)
+
+if not args.shard_dir:
+    out_file.write(OPERATORS_CHECK)
+    out_file.write('#include <compare>\n')
+    output_operators(data['structs'], first_version, last_version, out_file)
+    out_file.write('\n#endif // __cpp_impl_three_way_comparison\n')
 out_file.write('\n#endif // VK_STRUCT_COMPARE_H\n')
@@ -0,0 +1,935 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2026 George Cave.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import gen_common
+import json
+import os
+import re
+import sys
+
+# Types other than the Vulkan ones that can be copied by value, anything else pointed to (such as
+# platform windows/displays) is opaque and only has its pointer copied
+SCALAR_TYPES = ['char', 'float', 'double', 'int8_t', 'uint8_t', 'int16_t', 'uint16_t',
+                'int32_t', 'uint32_t', 'int64_t', 'uint64_t', 'size_t', 'int']
+
+verified_voids = []
+
+
+def get_define_guards(type_data, first_version, last_version):
+    guard_sets = []
+
+    # Guard based on required definitions
+    if 'requires' in type_data:
+        for require_variant, require_data in type_data['requires'].items():
+            guard = ''
+            check_started = False
+
+            # check version numbers first
+            if require_data['first'] != first_version:
+                guard += 'VK_HEADER_VERSION >= {}'.format(require_data['first'])
+                check_started = True
+
+            if require_data['last'] != last_version:
+                if check_started:
+                    guard += ' && '
+                guard += 'VK_HEADER_VERSION <= {}'.format(require_data['last'])
+                check_started = True
+
+            # add defines
+            for define in require_data['defines']:
+                if check_started:
+                    guard += ' && '
+                # Brackets around OR defines
+                if ',' in define:
+                    guard += '({})'.format(define.replace(',', ' || '))
+                else:
+                    guard += define
+                check_started = True
+
+            if guard:
+                guard_sets.append(guard)
+    else:
+        # do a guard based only on version numbers for the struct
+        firstCheck = type_data['first']
+        lastCheck = type_data['last']
+        guard = ''
+
+        # Guard check for first version
+        if firstCheck != first_version:
+            guard = 'VK_HEADER_VERSION >= {}'.format(firstCheck)
+
+        # Guard check for last version
+        if lastCheck != last_version:
+            if guard:
+                # If already started, append to it
+                guard += ' && '
+            guard += 'VK_HEADER_VERSION <= {}'.format(lastCheck)
+        if guard:
+            guard_sets.append(guard)
+
+    return guard_sets
+
+
+def format_define_guard(guard_list):
+    if len(guard_list) == 1:
+        return guard_list[0]
+    return ' || '.join('({})'.format(guard) for guard in guard_list)
+
+
+def output_define_guard(guard_list, out_file):
+    if guard_list:
+        out_file.write('#if {}\n'.format(format_define_guard(guard_list)))
+
+
+def get_structure_type_value(structure_types, sType):
+    # Resolve through aliases, so all names sharing a value map to the same key
+    while sType in structure_types and 'alias' in structure_types[sType]:
+        sType = structure_types[sType]['alias']
+    if sType in structure_types and 'value' in structure_types[sType]:
+        return structure_types[sType]['value']
+    return sType
+
+
+def string_found(string1, string2):
+    if re.search(r"\b" + re.escape(string1) + r"\b", string2):
+        return True
+    return False
+
+
+def get_struct_variants(struct, data):
+    # The member data of each variant of a struct, following aliases
+    variants = []
+    for struct_data in data['structs'][struct].values():
+        while 'alias' in struct_data:
+            struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+        variants.append(struct_data)
+    return variants
+
+
+def struct_has_pNext(struct, data):
+    if struct not in data['structs']:
+        return False
+    for struct_data in get_struct_variants(struct, data):
+        if 'pNext' in struct_data.get('members', {}):
+            return True
+    return False
+
+
+def is_copyable_type(type, data):
+    # Whether the type is complete and can be copied by value
+    return type in data['structs'] or type in data['unions'] or type.startswith('Vk') or type.startswith('StdVideo') or type in SCALAR_TYPES
+
+
+def is_verified_void(struct, member):
+    for item in verified_voids:
+        if item['struct'] == struct and item['member'] == member:
+            return True
+    return False
+
+
+def pointer_is_copied(struct, member, member_data, data):
+    # Whether the data pointed to by a member is deep-copied, rather than just the pointer
+    if member == 'pNext':
+        return False
+    counts = member_data['len'].split(',') if 'len' in member_data else ['1']
+    if len(counts) != member_data['suffix'].count('*'):
+        # without a length for each level, how much is pointed to isn't known
+        return False
+    if member_data['type'] == 'void':
+        return 'len' in member_data and (is_verified_void(struct, member) or (struct == 'VkLayerSettingEXT' and member == 'pValues'))
+    return is_copyable_type(member_data['type'], data)
+
+
+held_data_cache = {}
+
+
+def struct_holds_data(struct, data):
+    # Whether copying the struct has to do more than copy the struct itself and follow its pNext
+    # chain, ie. it points to other data, or holds other structs that do
+    if struct not in data['structs']:
+        return False
+    if struct in held_data_cache:
+        return held_data_cache[struct]
+    held_data_cache[struct] = False
+
+    holds_data = False
+    for struct_data in get_struct_variants(struct, data):
+        for member, member_data in struct_data.get('members', {}).items():
+            if member_needs_copy(struct, member, member_data, data):
+                holds_data = True
+
+    held_data_cache[struct] = holds_data
+    return holds_data
+
+
+def member_needs_copy(struct, member, member_data, data):
+    suffix = member_data.get('suffix', '')
+    if '*' in suffix:
+        return pointer_is_copied(struct, member, member_data, data)
+    if member_data['type'] in data['structs']:
+        return struct_holds_data(member_data['type'], data) or struct_has_pNext(member_data['type'], data)
+    if 'selector' in member_data:
+        for union_member, union_member_data in data['unions'][member_data['type']]['members'].items():
+            if member_needs_copy(member_data['type'], union_member, union_member_data, data):
+                return True
+    return False
+
+
+def get_pointer_levels(struct, member, member_data):
+    # The count of each level of indirection, from the outermost one
+    counts = member_data['len'].split(',') if 'len' in member_data else ['1']
+    for count in counts[1:]:
+        if count != '1' and count != 'null-terminated':
+            print('ERROR: Unsupported inner pointer length for {}::{}'.format(struct, member))
+            sys.exit(1)
+    return counts
+
+
+def get_element_type(member_data, depth, levels):
+    # The type of the elements at the given level of indirection
+    element_type = member_data['type']
+    if member_data['suffix'].strip().startswith('const'):
+        element_type += ' const'
+    return element_type + '*' * (levels - depth - 1)
+
+
+def get_unqualified_type(type):
+    if type.endswith(' const'):
+        return type[:-len(' const')]
+    return type
+
+
+def get_count_expression(count, struct_data):
+    # replaced in a single pass, as a member can be named pData itself
+    return re.sub(r'\b[A-Za-z_]\w*\b',
+                  lambda match: 'pData->' + match.group(0) if match.group(0) in struct_data['members'] else match.group(0),
+                  count)
+
+
+def get_size_expression(count, type):
+    if count == '1':
+        return 'sizeof({})'.format(type)
+    return '({}) * sizeof({})'.format(count, type)
+
+
+def get_element(pointer, count, iter_character):
+    # The element(s) of an array as an lvalue, either indexed in a loop or the only one
+    if count == '1':
+        return '*{}'.format(pointer)
+    return '{}[{}]'.format(pointer, iter_character)
+
+
+def split_element(element):
+    # An element as a pointer to it, and how its members are accessed
+    if element.startswith('*'):
+        return element[1:], element[1:] + '->'
+    return '&' + element, element + '.'
+
+
+def get_pNext_guards(type, data):
+    # The guards of the variants of a struct that have a pNext member, or an empty list if they all
+    # do, as a struct can gain or lose its sType/pNext between versions
+    guards = []
+    all_have_pNext = True
+    for struct_data in data['structs'][type].values():
+        variant_data = struct_data
+        while 'alias' in variant_data:
+            variant_data = data['structs'][variant_data['alias']['name']][variant_data['alias']['hash']]
+        if 'pNext' in variant_data.get('members', {}):
+            guards += get_define_guards(struct_data, data['api']['first'], data['api']['last'])
+        else:
+            all_have_pNext = False
+
+    if all_have_pNext:
+        return []
+    return guards
+
+
+def output_pNext_chain(type, line, data, out_file):
+    guards = get_pNext_guards(type, data)
+    output_define_guard(guards, out_file)
+    out_file.write(line)
+    if guards:
+        out_file.write('#endif\n')
+
+
+def output_struct_size(type, element, data, out_file):
+    # sizes everything held by a copied struct
+    pointer, access = split_element(element)
+    if struct_holds_data(type, data):
+        out_file.write('    copy_size_{}({}, pOffset);\n'.format(type, pointer))
+    if struct_has_pNext(type, data):
+        output_pNext_chain(type, '    copy_size_pNext_chain({}pNext, pOffset);\n'.format(access), data, out_file)
+
+
+def output_struct_data(type, element, data, out_file):
+    # copies everything held by a copied struct, which still points to the original data
+    pointer, access = split_element(element)
+    if struct_holds_data(type, data):
+        out_file.write('    copy_data_{}({}, pBase, pOffset);\n'.format(type, pointer))
+    if struct_has_pNext(type, data):
+        output_pNext_chain(type, '    {0}pNext = copy_data_pNext_chain({0}pNext, pBase, pOffset);\n'.format(access), data, out_file)
+
+
+def elements_hold_data(member_data, depth, levels, data):
+    # Whether the copied elements point to more data that needs copying as well
+    if depth + 1 < levels:
+        return True
+    return struct_holds_data(member_data['type'], data) or struct_has_pNext(member_data['type'], data)
+
+
+def output_pointer_size(struct, member, member_data, struct_data, access, counts, depth, data, out_file):
+    levels = len(counts)
+    count = counts[depth]
+    element_type = get_unqualified_type(get_element_type(member_data, depth, levels))
+    iter_character = 'ijklmn'[depth]
+
+    out_file.write('if ({} != NULL) {{\n'.format(access))
+    if count == 'null-terminated':
+        out_file.write('    *pOffset = copy_reserve_size(*pOffset, strlen({}) + 1, 1);\n'.format(access))
+    elif member_data['type'] == 'void':
+        out_file.write('    *pOffset = copy_reserve_size(*pOffset, {}, COPY_DATA_ALIGNMENT);\n'.format(get_count_expression(count, struct_data)))
+    else:
+        count = get_count_expression(count, struct_data)
+        out_file.write('    *pOffset = copy_reserve_size(*pOffset, {}, COPY_ALIGNOF({}));\n'.format(get_size_expression(count, element_type), element_type))
+
+        if elements_hold_data(member_data, depth, levels, data):
+            if count != '1':
+                out_file.write('for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, count))
+            element = get_element(access, count, iter_character)
+
+            if depth + 1 < levels:
+                output_pointer_size(struct, member, member_data, struct_data, element, counts, depth + 1, data, out_file)
+            else:
+                output_struct_size(member_data['type'], element, data, out_file)
+
+            if count != '1':
+                out_file.write('}\n')
+    out_file.write('}\n')
+
+
+def output_pointer_data(struct, member, member_data, struct_data, access, counts, depth, data, out_file):
+    levels = len(counts)
+    count = counts[depth]
+    element_type = get_element_type(member_data, depth, levels)
+    iter_character = 'ijklmn'[depth]
+    copy_variable = 'pCopy' if depth == 0 else 'pCopy{}'.format(depth)
+
+    out_file.write('if ({} != NULL) {{\n'.format(access))
+    if count == 'null-terminated':
+        out_file.write('    {0} = (char*)copy_reserve(pBase, pOffset, {0}, strlen({0}) + 1, 1);\n'.format(access))
+    elif member_data['type'] == 'void':
+        out_file.write('    {0} = copy_reserve(pBase, pOffset, {0}, {1}, COPY_DATA_ALIGNMENT);\n'.format(access, get_count_expression(count, struct_data)))
+    else:
+        count = get_count_expression(count, struct_data)
+        unqualified_type = get_unqualified_type(element_type)
+        size = get_size_expression(count, unqualified_type)
+
+        if elements_hold_data(member_data, depth, levels, data):
+            # the copied elements are modified to point to their own copied data
+            out_file.write('    {0}* {1} = ({0}*)copy_reserve(pBase, pOffset, {2}, {3}, COPY_ALIGNOF({0}));\n'.format(unqualified_type, copy_variable, access, size))
+
+            if count != '1':
+                out_file.write('for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, count))
+            element = get_element(copy_variable, count, iter_character)
+
+            if depth + 1 < levels:
+                output_pointer_data(struct, member, member_data, struct_data, element, counts, depth + 1, data, out_file)
+            else:
+                output_struct_data(member_data['type'], element, data, out_file)
+
+            if count != '1':
+                out_file.write('}\n')
+            out_file.write('    {} = {};\n'.format(access, copy_variable))
+        else:
+            out_file.write('    {0} = ({1}*)copy_reserve(pBase, pOffset, {0}, {2}, COPY_ALIGNOF({3}));\n'.format(access, element_type, size, unqualified_type))
+    out_file.write('}\n')
+
+
+def output_layer_setting_values(copy_pass, out_file):
+    # The type of the values is given by another member, with strings being arrays of strings
+    if copy_pass:
+        out_file.write('''\
+            if (pData->pValues != NULL && pData->type == VK_LAYER_SETTING_TYPE_STRING_EXT) {
+                char const** pCopy = (char const**)copy_reserve(pBase, pOffset, pData->pValues, pData->valueCount * sizeof(char const*), COPY_ALIGNOF(char const*));
+                for (size_t i = 0; i < pData->valueCount; ++i) {
+                    if (pCopy[i] != NULL)
+                        pCopy[i] = (char*)copy_reserve(pBase, pOffset, pCopy[i], strlen(pCopy[i]) + 1, 1);
+                }
+                pData->pValues = pCopy;
+            } else if (pData->pValues != NULL) {
+                pData->pValues = copy_reserve(pBase, pOffset, pData->pValues, pData->valueCount * copy_layer_setting_value_size(pData->type), COPY_DATA_ALIGNMENT);
+            }
+            ''')
+    else:
+        out_file.write('''\
+            if (pData->pValues != NULL && pData->type == VK_LAYER_SETTING_TYPE_STRING_EXT) {
+                char const* const* pStrings = (char const* const*)pData->pValues;
+                *pOffset = copy_reserve_size(*pOffset, pData->valueCount * sizeof(char const*), COPY_ALIGNOF(char const*));
+                for (size_t i = 0; i < pData->valueCount; ++i) {
+                    if (pStrings[i] != NULL)
+                        *pOffset = copy_reserve_size(*pOffset, strlen(pStrings[i]) + 1, 1);
+                }
+            } else if (pData->pValues != NULL) {
+                *pOffset = copy_reserve_size(*pOffset, pData->valueCount * copy_layer_setting_value_size(pData->type), COPY_DATA_ALIGNMENT);
+            }
+            ''')
+
+
+def output_union_cases(member, member_data, struct_data, copy_pass, data, out_file):
+    # only the selected member of the union is copied
+    union_data = data['unions'][member_data['type']]
+    enum_data = data['enums'][struct_data['members'][member_data['selector']]['type']]
+    enum_value_data = enum_data['values']
+
+    out_file.write('  switch (pData->{}) {{\n'.format(member_data['selector']))
+    for union_member, union_member_data in union_data['members'].items():
+        if not member_needs_copy(member_data['type'], union_member, union_member_data, data):
+            continue
+
+        non_guarded_cases = 0
+        all_guards = []
+        for case in union_member_data['selection'].split(','):
+            value_guards = get_define_guards(enum_value_data[case], enum_data['first'], enum_data['last'])
+            output_define_guard(value_guards, out_file)
+            out_file.write('  case {}:\n'.format(case))
+            if value_guards:
+                out_file.write('#endif\n')
+                all_guards += value_guards
+            else:
+                non_guarded_cases += 1
+
+        if non_guarded_cases == 0:
+            output_define_guard(all_guards, out_file)
+
+        access = 'pData->{}.{}'.format(member, union_member)
+        if '*' in union_member_data.get('suffix', ''):
+            counts = get_pointer_levels(member_data['type'], union_member, union_member_data)
+            if copy_pass:
+                output_pointer_data(member_data['type'], union_member, union_member_data, struct_data, access, counts, 0, data, out_file)
+            else:
+                output_pointer_size(member_data['type'], union_member, union_member_data, struct_data, access, counts, 0, data, out_file)
+        elif copy_pass:
+            output_struct_data(union_member_data['type'], access, data, out_file)
+        else:
+            output_struct_size(union_member_data['type'], access, data, out_file)
+        out_file.write('    break;\n')
+
+        if non_guarded_cases == 0:
+            out_file.write('#endif\n')
+        out_file.write('\n')
+
+    out_file.write('  default:\n')
+    out_file.write('    break;\n')
+    out_file.write('  }\n')
+
+
+def output_members(struct, struct_data, copy_pass, data, out_file):
+    for member, member_data in struct_data['members'].items():
+        if not member_needs_copy(struct, member, member_data, data):
+            continue
+
+        if 'len' in member_data:
+            out_file.write('\n    // {} - {}\n'.format(member, member_data['len']))
+        else:
+            out_file.write('\n    // {}\n'.format(member))
+
+        suffix = member_data.get('suffix', '')
+        access = 'pData->{}'.format(member)
+        if struct == 'VkLayerSettingEXT' and member == 'pValues':
+            output_layer_setting_values(copy_pass, out_file)
+        elif '*' in suffix:
+            counts = get_pointer_levels(struct, member, member_data)
+            if copy_pass:
+                output_pointer_data(struct, member, member_data, struct_data, access, counts, 0, data, out_file)
+            else:
+                output_pointer_size(struct, member, member_data, struct_data, access, counts, 0, data, out_file)
+        elif 'selector' in member_data:
+            output_union_cases(member, member_data, struct_data, copy_pass, data, out_file)
+        elif '[' in suffix:
+            # a local array of structs
+            count = suffix.replace('[', '').replace(']', '')
+            out_file.write('for (size_t i = 0; i < {}; ++i) {{\n'.format(count))
+            if copy_pass:
+                output_struct_data(member_data['type'], '{}[i]'.format(access), data, out_file)
+            else:
+                output_struct_size(member_data['type'], '{}[i]'.format(access), data, out_file)
+            out_file.write('}\n')
+        elif copy_pass:
+            output_struct_data(member_data['type'], access, data, out_file)
+        else:
+            output_struct_size(member_data['type'], access, data, out_file)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--input',
+                        help='Input JSON API cache file',
+                        required=True)
+    parser.add_argument('-o', '--output',
+                        help='Output file to write to',
+                        required=True)
+    parser.add_argument('-v', '--verified-void',
+                        help='File containing verified void comparisons, whose lengths are in bytes',
+                        required=True)
+    parser.add_argument('-s', '--source',
+                        help='Source file to write the definitions to, leaving only declarations in the output header')
+    args = parser.parse_args()
+
+    try:
+        json_file = open(args.input, 'r')
+        data = json.load(json_file)
+    except:
+        print("Error: Could not open input file: ", args.input)
+        sys.exit(1)
+
+    try:
+        verified_voids_file = open(args.verified_void, 'r')
+        for line in verified_voids_file:
+            # skip comment lines
+            if line.startswith('#'):
+                continue
+            line_data = line.split(' ')
+            if len(line_data) != 2:
+                print('Error: More than two items on  a verified voids file line "{}"'.format(line))
+                sys.exit(1)
+            verified_voids.append({
+                'struct': line_data[0],
+                'member': line_data[1].strip(),
+            })
+    except:
+        print('Error: Could not open verified-voids file: ', args.verified_void)
+        sys.exit(1)
+
+    # sort struct data
+    data['structs'] = dict(sorted(data['structs'].items()))
+
+    # Get first/last versions
+    first_version = data['api']['first']
+    last_version = data['api']['last']
+
+    out_file = open(args.output, "w")
+
+    # Common Header
+    gen_common.writeHeader(out_file)
+
+    # Specific Header
+    out_file.write("""\
+#ifndef VK_STRUCT_COPY_H
+#define VK_STRUCT_COPY_H
+""")
+    if args.source:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the copy functions are required.
+
+    The definitions are compiled separately, from the accompanying {} source file.
+*/
+""".format(os.path.basename(args.source)))
+    else:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the copy functions are required.
+
+    On *ONE* compilation unit, include the definition of:
+    #define VK_STRUCT_COPY_CONFIG_MAIN
+
+    so that the definitions are compiled somewhere following the one definition rule.
+*/
+""")
+    out_file.write("""
+/*
+    These copy_*(ptr) functions deep-copy the given struct, along with everything it points to and
+    its pNext chain, into a single allocation. The copy is released with a single call to free(),
+    and must *not* be given to the cleanup functions.
+
+    Structs in a pNext chain without a known sType are skipped, and the data of pointers to opaque
+    or untyped data (such as platform handles or user data) is not copied, only the pointers.
+
+    The size_*(ptr) functions return the deep size of the given struct without allocating, which is
+    the size of the struct and everything a copy of it would hold, including the alignment padding
+    between them. This is the exact size of the allocation a copy is made in, so can be used for
+    memory accounting or to pre-size arenas.
+*/
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <vulkan/vulkan.h>
+
+#include <stdbool.h>
+""")
+
+    # static asserts for minimum version
+    out_file.write('''
+#ifdef __cplusplus
+static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION is lower than the minimum supported version (v{0})");
+#else
+_Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the minimum supported version (v{0})");
+#endif
+'''.format(first_version))
+
+    # warnings for above max generated version
+    out_file.write('''
+#if VK_HEADER_VERSION > {0}
+#if _MSC_VER
+#pragma message(__FILE__ ": warning: VK_HEADER_VERSION is higher than what the header fully supports (v{0})")
+#else
+#warning "VK_HEADER_VERSION is higher than what the header fully supports (v{0})"
+#endif
+#endif
+'''.format(last_version))
+
+    # Generic struct catchall
+    out_file.write('''
+// Returns a copy of a struct with a known sType, or NULL if it isn't known or allocation failed
+void* copy_vk_struct(void const* pData);
+
+// Returns the deep size of a struct with a known sType, or 0 if it isn't known
+size_t size_vk_struct(void const* pData);
+''')
+
+    # Dynamic Declarations
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            out_file.write('\n')
+
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+            out_file.write('{0}* copy_{0}({0} const* pData);\n'.format(struct))
+            out_file.write('size_t size_{0}({0} const* pData);\n'.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
+
+    # Definition Header
+    if args.source:
+        def_file = open(args.source, "w")
+        gen_common.writeHeader(def_file)
+        def_file.write("""\
+#include "{}"
+
+#include <stdlib.h>
+#include <string.h>
+""".format(os.path.basename(args.output)))
+    else:
+        def_file = out_file
+        def_file.write("""
+#ifdef VK_STRUCT_COPY_CONFIG_MAIN
+
+#include <stdlib.h>
+#include <string.h>
+""")
+
+    # Definitions
+    def_file.write("""
+#if defined(__cplusplus)
+#define COPY_ALIGNOF(TYPE) alignof(TYPE)
+#elif defined(_MSC_VER)
+#define COPY_ALIGNOF(TYPE) __alignof(TYPE)
+#else
+#define COPY_ALIGNOF(TYPE) _Alignof(TYPE)
+#endif
+
+// Untyped data could hold anything, so is aligned for any fundamental type
+#define COPY_DATA_ALIGNMENT 16
+
+// Copies are made in two passes over the original struct. The first sizes everything that is to
+// be copied, at the same offsets and with the same alignment padding as the second pass then
+// copies it all to, in a single allocation.
+
+static size_t copy_reserve_size(size_t offset, size_t size, size_t alignment) {
+    return ((offset + alignment - 1) & ~(alignment - 1)) + size;
+}
+
+static void* copy_reserve(char* pBase, size_t* pOffset, void const* pData, size_t size, size_t alignment) {
+    char* pCopy = pBase + ((*pOffset + alignment - 1) & ~(alignment - 1));
+    // alignment padding is zeroed, so that a copy holds no uninitialized bytes
+    memset(pBase + *pOffset, 0, (size_t)(pCopy - pBase) - *pOffset);
+    memcpy(pCopy, pData, size);
+    *pOffset = (size_t)(pCopy - pBase) + size;
+    return pCopy;
+}
+""")
+
+    # Forward declarations of the internal sizing/copying functions, as structs refer to each other
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+        if not struct_holds_data(struct, data):
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            def_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+            def_file.write('static void copy_size_{0}({0} const* pData, size_t* pOffset);\n'.format(struct))
+            def_file.write('static void copy_data_{0}({0}* pData, char* pBase, size_t* pOffset);\n'.format(struct))
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Group the structs by their sType value, as different names (such as the vendor and promoted
+    # names) can map to the same value in different versions, and each value can only be a single
+    # case label
+    structure_types = data['enums'].get('VkStructureType', {}).get('values', {})
+    dispatch_groups = {}
+
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            while 'alias' in struct_data:
+                struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+
+            # only deal with structs that have defined sType
+            if not 'members' in struct_data or 'sType' not in struct_data['members']:
+                continue
+            sTypeValue = struct_data['members']['sType']['value']
+
+            group_key = get_structure_type_value(structure_types, sTypeValue)
+            dispatch_groups.setdefault(group_key, []).append((sTypeValue, struct, struct_guards))
+
+    def output_dispatch(case_writer):
+        for group in dispatch_groups.values():
+            def_file.write('\n')
+
+            # Only the first entry whose guard passes gets a case label
+            directive_open = False
+            for sTypeValue, struct, struct_guards in group:
+                if not struct_guards:
+                    # an unguarded entry always matches, so any after it are unreachable
+                    if directive_open:
+                        def_file.write('#else\n')
+                    case_writer(sTypeValue, struct)
+                    break
+
+                def_file.write('#elif ' if directive_open else '#if ')
+                def_file.write('{}\n'.format(format_define_guard(struct_guards)))
+                case_writer(sTypeValue, struct)
+                directive_open = True
+
+            if directive_open:
+                def_file.write('#endif\n')
+
+    # Sizing of a single struct in a pNext chain, not including the rest of the chain
+    def_file.write("""
+// Adds the size of a struct with a known sType to the offset, returning false if it isn't known
+static bool copy_size_vk_struct(void const* pData, size_t* pOffset) {
+    VkBaseInStructure const* pTemp = (VkBaseInStructure const*)pData;
+
+    switch (pTemp->sType) {""")
+
+    def output_size_case(sTypeValue, struct):
+        def_file.write('    case {}:\n'.format(sTypeValue))
+        def_file.write('        *pOffset = copy_reserve_size(*pOffset, sizeof({0}), COPY_ALIGNOF({0}));\n'.format(struct))
+        if struct_holds_data(struct, data):
+            def_file.write('        copy_size_{0}(({0} const*)pData, pOffset);\n'.format(struct))
+        def_file.write('        return true;\n')
+
+    output_dispatch(output_size_case)
+    def_file.write("""
+    default:
+        return false;
+    }
+}
+""")
+
+    # Copying of a single struct in a pNext chain, not including the rest of the chain
+    def_file.write("""
+// Copies a struct with a known sType, returning NULL if it isn't known
+static VkBaseOutStructure* copy_data_vk_struct(void const* pData, char* pBase, size_t* pOffset) {
+    VkBaseInStructure const* pTemp = (VkBaseInStructure const*)pData;
+
+    switch (pTemp->sType) {""")
+
+    def output_data_case(sTypeValue, struct):
+        def_file.write('    case {}: {{\n'.format(sTypeValue))
+        def_file.write('        {0}* pCopy = ({0}*)copy_reserve(pBase, pOffset, pData, sizeof({0}), COPY_ALIGNOF({0}));\n'.format(struct))
+        if struct_holds_data(struct, data):
+            def_file.write('        copy_data_{}(pCopy, pBase, pOffset);\n'.format(struct))
+        def_file.write('        return (VkBaseOutStructure*)pCopy;\n')
+        def_file.write('    }\n')
+
+    output_dispatch(output_data_case)
+    def_file.write("""
+    default:
+        return NULL;
+    }
+}
+
+// Chains are walked iteratively, rather than each struct recursing into the next, so that stack use
+// doesn't grow with the length of the chain
+static void copy_size_pNext_chain(void const* pNext, size_t* pOffset) {
+    VkBaseInStructure const* pCurrent = (VkBaseInStructure const*)pNext;
+
+    while (pCurrent != NULL) {
+        copy_size_vk_struct(pCurrent, pOffset);
+        pCurrent = pCurrent->pNext;
+    }
+}
+
+static void* copy_data_pNext_chain(void const* pNext, char* pBase, size_t* pOffset) {
+    VkBaseInStructure const* pCurrent = (VkBaseInStructure const*)pNext;
+    VkBaseOutStructure* pHead = NULL;
+    VkBaseOutStructure* pTail = NULL;
+
+    while (pCurrent != NULL) {
+        // structs that aren't known are left out of the copied chain
+        VkBaseOutStructure* pCopy = copy_data_vk_struct(pCurrent, pBase, pOffset);
+        if (pCopy != NULL) {
+            if (pTail == NULL)
+                pHead = pCopy;
+            else
+                pTail->pNext = pCopy;
+            pTail = pCopy;
+        }
+        pCurrent = pCurrent->pNext;
+    }
+    if (pTail != NULL)
+        pTail->pNext = NULL;
+
+    return pHead;
+}
+
+size_t size_vk_struct(void const* pData) {
+    size_t size = 0;
+    if (!copy_size_vk_struct(pData, &size))
+        return 0;
+    copy_size_pNext_chain(((VkBaseInStructure const*)pData)->pNext, &size);
+    return size;
+}
+
+void* copy_vk_struct(void const* pData) {
+    size_t size = size_vk_struct(pData);
+    if (size == 0)
+        return NULL;
+
+    char* pBase = (char*)malloc(size);
+    if (pBase == NULL)
+        return NULL;
+
+    size_t offset = 0;
+    VkBaseOutStructure* pCopy = copy_data_vk_struct(pData, pBase, &offset);
+    pCopy->pNext = (VkBaseOutStructure*)copy_data_pNext_chain(pCopy->pNext, pBase, &offset);
+    return pCopy;
+}
+""")
+
+    # The value sizes of layer settings
+    if 'VkLayerSettingEXT' in data['structs']:
+        for variant, struct_data in data['structs']['VkLayerSettingEXT'].items():
+            def_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+            def_file.write('''\
+static size_t copy_layer_setting_value_size(VkLayerSettingTypeEXT type) {
+    switch (type) {
+    case VK_LAYER_SETTING_TYPE_BOOL32_EXT:
+        return sizeof(VkBool32);
+    case VK_LAYER_SETTING_TYPE_INT32_EXT:
+        return sizeof(int32_t);
+    case VK_LAYER_SETTING_TYPE_INT64_EXT:
+        return sizeof(int64_t);
+    case VK_LAYER_SETTING_TYPE_UINT32_EXT:
+        return sizeof(uint32_t);
+    case VK_LAYER_SETTING_TYPE_UINT64_EXT:
+        return sizeof(uint64_t);
+    case VK_LAYER_SETTING_TYPE_FLOAT32_EXT:
+        return sizeof(float);
+    case VK_LAYER_SETTING_TYPE_FLOAT64_EXT:
+        return sizeof(double);
+    default:
+        return 0;
+    }
+}
+''')
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Dynamic Definitions
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        holds_data = struct_holds_data(struct, data)
+        has_pNext = struct_has_pNext(struct, data)
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            def_file.write('\n')
+
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+
+            while 'alias' in struct_data:
+                # for an alias struct, use the alias's data
+                struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+            variant_has_pNext = 'pNext' in struct_data.get('members', {})
+
+            if holds_data:
+                def_file.write('static void copy_size_{0}({0} const* pData, size_t* pOffset) {{'.format(struct))
+                if 'members' in struct_data:
+                    output_members(struct, struct_data, False, data, def_file)
+                def_file.write('}\n\n')
+
+                def_file.write('static void copy_data_{0}({0}* pData, char* pBase, size_t* pOffset) {{'.format(struct))
+                if 'members' in struct_data:
+                    output_members(struct, struct_data, True, data, def_file)
+                def_file.write('}\n\n')
+
+            def_file.write('size_t size_{0}({0} const* pData) {{\n'.format(struct))
+            def_file.write('    size_t size = sizeof({});\n'.format(struct))
+            if holds_data:
+                def_file.write('    copy_size_{}(pData, &size);\n'.format(struct))
+            if variant_has_pNext:
+                def_file.write('    copy_size_pNext_chain(pData->pNext, &size);\n')
+            def_file.write('    return size;\n')
+            def_file.write('}\n\n')
+
+            def_file.write('{0}* copy_{0}({0} const* pData) {{\n'.format(struct))
+            def_file.write('''\
+    {0}* pCopy = ({0}*)malloc(size_{0}(pData));
+    if (pCopy == NULL)
+        return NULL;
+
+    memcpy(pCopy, pData, sizeof({0}));
+'''.format(struct))
+            if holds_data or variant_has_pNext:
+                def_file.write('    size_t offset = sizeof({});\n'.format(struct))
+            if holds_data:
+                def_file.write('    copy_data_{}(pCopy, (char*)pCopy, &offset);\n'.format(struct))
+            if variant_has_pNext:
+                def_file.write('    pCopy->pNext = copy_data_pNext_chain(pCopy->pNext, (char*)pCopy, &offset);\n')
+            def_file.write('    return pCopy;\n')
+            def_file.write('}\n')
+
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Footer
+    if args.source:
+        def_file.close()
+    else:
+        out_file.write('\n#endif // VK_STRUCT_COPY_CONFIG_MAIN\n')
+    out_file.write("""
+#ifdef __cplusplus
+}
+#endif
+""")
+    out_file.write('\n#endif // VK_STRUCT_COPY_H\n')
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,825 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2026 George Cave.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import gen_common
+import json
+import os
+import sys
+import zlib
+
+# The encoded data is a copy made by the struct copy header, so what is deep-copied, and so ends up
+# in the encoded data, is decided the same way as generate_copy_header.py does
+import generate_copy_header as copy_header
+from generate_copy_header import (get_define_guards, format_define_guard, output_define_guard,
+                                  get_structure_type_value, get_struct_variants, struct_has_pNext,
+                                  pointer_is_copied, get_pointer_levels, get_element_type,
+                                  get_unqualified_type, get_count_expression, get_size_expression,
+                                  get_element, split_element, output_pNext_chain)
+
+
+relocation_cache = {}
+
+
+def struct_needs_relocation(struct, data):
+    # Whether the struct holds any pointers, other than its pNext, or holds other structs that do,
+    # which have to be turned into offsets when encoding and back when decoding
+    if struct not in data['structs']:
+        return False
+    if struct in relocation_cache:
+        return relocation_cache[struct]
+    relocation_cache[struct] = False
+
+    needs_relocation = False
+    for struct_data in get_struct_variants(struct, data):
+        for member, member_data in struct_data.get('members', {}).items():
+            if member_needs_relocation(member, member_data, data):
+                needs_relocation = True
+
+    relocation_cache[struct] = needs_relocation
+    return needs_relocation
+
+
+def is_function_pointer(member_data):
+    return member_data['type'].startswith('PFN_')
+
+
+def member_needs_relocation(member, member_data, data):
+    if member == 'pNext':
+        # chains are walked separately
+        return False
+    if '*' in member_data.get('suffix', '') or is_function_pointer(member_data):
+        return True
+    if member_data['type'] in data['structs']:
+        return struct_needs_relocation(member_data['type'], data) or struct_has_pNext(member_data['type'], data)
+    if 'selector' in member_data:
+        for union_member, union_member_data in data['unions'][member_data['type']]['members'].items():
+            if member_needs_relocation(union_member, union_member_data, data):
+                return True
+    return False
+
+
+def get_relocated_structs(data):
+    # The structs that can be part of an encoded struct, either having an sType themselves or being
+    # held by other structs, as relocation functions for any others would be left unused
+    held_types = set()
+    for variants in data['structs'].values():
+        for struct_data in variants.values():
+            for member_data in struct_data.get('members', {}).values():
+                held_types.add(member_data['type'])
+    for union_data in data['unions'].values():
+        for member_data in union_data['members'].values():
+            held_types.add(member_data['type'])
+
+    relocated = set()
+    for struct in data['structs']:
+        if not struct_needs_relocation(struct, data):
+            continue
+        has_sType = any('sType' in struct_data.get('members', {}) for struct_data in get_struct_variants(struct, data))
+        if has_sType or struct in held_types:
+            relocated.add(struct)
+    return relocated
+
+
+# Types with the same size and alignment as each other
+LAYOUT_TYPES = {
+    'char': 'int8',
+    'int8_t': 'int8',
+    'uint8_t': 'int8',
+    'int16_t': 'int16',
+    'uint16_t': 'int16',
+    'int32_t': 'int32',
+    'uint32_t': 'int32',
+    'VkBool32': 'int32',
+    'VkFlags': 'int32',
+    'VkSampleMask': 'int32',
+    'int64_t': 'int64',
+    'uint64_t': 'int64',
+    'VkDeviceSize': 'int64',
+    'VkDeviceAddress': 'int64',
+    'VkFlags64': 'int64',
+}
+
+
+def strip_vendor(name, data):
+    for vendor in data['vendors']:
+        if name.endswith(vendor):
+            return name[:-len(vendor)]
+    return name
+
+
+def get_layout_type(type, data):
+    # The layout of a member doesn't change when its type is renamed (such as when promoted) or
+    # gains values, so types are reduced to what decides their layout
+    if type in LAYOUT_TYPES:
+        return LAYOUT_TYPES[type]
+
+    # enums have the size of int, and aliases of them (such as from another vendor) might not be
+    # known by their own name
+    enum_data = data['enums'].get(type)
+    if enum_data is None:
+        stripped = strip_vendor(type, data)
+        enum_data = next((enum_data for enum, enum_data in data['enums'].items() if strip_vendor(enum, data) == stripped), None)
+    visited = set()
+    while enum_data is not None and 'alias' in enum_data and enum_data['alias'] not in visited:
+        visited.add(enum_data['alias'])
+        enum_data = data['enums'].get(enum_data['alias'])
+    if enum_data is not None:
+        return LAYOUT_TYPES.get(enum_data.get('type', 'VkFlags'), 'int32')
+
+    if type in data['structs']:
+        # follow to the name the struct is ultimately an alias of
+        visited = set()
+        while type not in visited:
+            visited.add(type)
+            alias = next((struct_data['alias']['name'] for struct_data in data['structs'][type].values() if 'alias' in struct_data), None)
+            if alias is None or alias not in data['structs']:
+                break
+            type = alias
+    return type
+
+
+def get_struct_shape(struct_data, data):
+    # An identifier of the layout of the struct's members, as what each member's type is reduced to
+    # along with any array/bit-field suffix, where pointers are all the same
+    shape = []
+    for member_data in struct_data.get('members', {}).values():
+        suffix = member_data.get('suffix', '').replace('const', '').replace(' ', '')
+        if '*' in suffix:
+            shape.append('*')
+        else:
+            shape.append('{}{}'.format(get_layout_type(member_data['type'], data), suffix))
+    return '0x{:08X}u'.format(zlib.crc32(';'.join(shape).encode()))
+
+
+def elements_need_relocation(member_data, depth, levels, data):
+    if depth + 1 < levels:
+        return True
+    return struct_needs_relocation(member_data['type'], data) or struct_has_pNext(member_data['type'], data)
+
+
+def output_struct_relocation(type, element, data, out_file):
+    pointer, access = split_element(element)
+    if struct_needs_relocation(type, data):
+        out_file.write('    encode_relocate_{}({}, pContext);\n'.format(type, pointer))
+    if struct_has_pNext(type, data):
+        output_pNext_chain(type, '    encode_relocate_pNext_chain(&{}pNext, pContext);\n'.format(access), data, out_file)
+
+
+def output_pointer_relocation(struct, member, member_data, struct_data, access, counts, depth, data, out_file):
+    levels = len(counts)
+    count = counts[depth]
+    element_type = get_unqualified_type(get_element_type(member_data, depth, levels))
+    iter_character = 'ijklmn'[depth]
+    element_variable = 'pElements' if depth == 0 else 'pElements{}'.format(depth)
+
+    if count == 'null-terminated':
+        out_file.write('    encode_relocate_string(&{}, pContext);\n'.format(access))
+    elif member_data['type'] == 'void':
+        out_file.write('    encode_relocate(&{}, {}, ENCODE_DATA_ALIGNMENT, pContext);\n'.format(access, get_count_expression(count, struct_data)))
+    else:
+        count = get_count_expression(count, struct_data)
+        size = get_size_expression(count, element_type)
+
+        if elements_need_relocation(member_data, depth, levels, data):
+            out_file.write('{{\n    {0}* {1} = ({0}*)encode_relocate(&{2}, {3}, ENCODE_ALIGNOF({0}), pContext);\n'.format(element_type, element_variable, access, size))
+            out_file.write('    if ({} != NULL) {{\n'.format(element_variable))
+
+            if count != '1':
+                out_file.write('for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, count))
+            element = get_element(element_variable, count, iter_character)
+
+            if depth + 1 < levels:
+                output_pointer_relocation(struct, member, member_data, struct_data, element, counts, depth + 1, data, out_file)
+            else:
+                output_struct_relocation(member_data['type'], element, data, out_file)
+
+            if count != '1':
+                out_file.write('}\n')
+            out_file.write('    }\n}\n')
+        else:
+            out_file.write('    encode_relocate(&{}, {}, ENCODE_ALIGNOF({}), pContext);\n'.format(access, size, element_type))
+
+
+def output_opaque_pointer(access, out_file):
+    # what isn't copied isn't part of the encoded data, so can't be pointed to after decoding, and is
+    # also cleared when decoding so that whatever the encoded data holds is never passed on
+    out_file.write('    {} = NULL;\n'.format(access))
+
+
+def output_layer_setting_values(out_file):
+    # The type of the values is given by another member, with strings being arrays of strings
+    out_file.write('''\
+    uint32_t type = encode_load_enum(&pData->type);
+    if (type == VK_LAYER_SETTING_TYPE_STRING_EXT) {
+        char const** pStrings = (char const**)encode_relocate(&pData->pValues, pData->valueCount * sizeof(char const*), ENCODE_ALIGNOF(char const*), pContext);
+        if (pStrings != NULL) {
+            for (size_t i = 0; i < pData->valueCount; ++i)
+                encode_relocate_string(&pStrings[i], pContext);
+        }
+    } else {
+        encode_relocate(&pData->pValues, pData->valueCount * encode_layer_setting_value_size(type), ENCODE_DATA_ALIGNMENT, pContext);
+    }
+''')
+
+
+def output_pointer_member(struct, member, member_data, struct_data, access, data, out_file):
+    if pointer_is_copied(struct, member, member_data, data):
+        counts = get_pointer_levels(struct, member, member_data)
+        output_pointer_relocation(struct, member, member_data, struct_data, access, counts, 0, data, out_file)
+    else:
+        output_opaque_pointer(access, out_file)
+
+
+def output_union_cases(member, member_data, struct_data, data, out_file):
+    # only the selected member of the union was copied
+    union_data = data['unions'][member_data['type']]
+    enum_data = data['enums'][struct_data['members'][member_data['selector']]['type']]
+    enum_value_data = enum_data['values']
+
+    out_file.write('  switch (encode_load_enum(&pData->{})) {{\n'.format(member_data['selector']))
+    for union_member, union_member_data in union_data['members'].items():
+        if not member_needs_relocation(union_member, union_member_data, data):
+            continue
+
+        non_guarded_cases = 0
+        all_guards = []
+        for case in union_member_data['selection'].split(','):
+            value_guards = get_define_guards(enum_value_data[case], enum_data['first'], enum_data['last'])
+            output_define_guard(value_guards, out_file)
+            out_file.write('  case {}:\n'.format(case))
+            if value_guards:
+                out_file.write('#endif\n')
+                all_guards += value_guards
+            else:
+                non_guarded_cases += 1
+
+        if non_guarded_cases == 0:
+            output_define_guard(all_guards, out_file)
+
+        access = 'pData->{}.{}'.format(member, union_member)
+        if '*' in union_member_data.get('suffix', ''):
+            output_pointer_member(member_data['type'], union_member, union_member_data, struct_data, access, data, out_file)
+        else:
+            output_struct_relocation(union_member_data['type'], access, data, out_file)
+        out_file.write('    break;\n')
+
+        if non_guarded_cases == 0:
+            out_file.write('#endif\n')
+        out_file.write('\n')
+
+    out_file.write('  default:\n')
+    out_file.write('    break;\n')
+    out_file.write('  }\n')
+
+
+def output_members(struct, struct_data, data, out_file):
+    for member, member_data in struct_data['members'].items():
+        if not member_needs_relocation(member, member_data, data):
+            continue
+
+        if 'len' in member_data:
+            out_file.write('\n    // {} - {}\n'.format(member, member_data['len']))
+        else:
+            out_file.write('\n    // {}\n'.format(member))
+
+        suffix = member_data.get('suffix', '')
+        access = 'pData->{}'.format(member)
+        if struct == 'VkLayerSettingEXT' and member == 'pValues':
+            output_layer_setting_values(out_file)
+        elif is_function_pointer(member_data):
+            # the code pointed to isn't at the same address in another process
+            output_opaque_pointer(access, out_file)
+        elif '*' in suffix:
+            output_pointer_member(struct, member, member_data, struct_data, access, data, out_file)
+        elif 'selector' in member_data:
+            output_union_cases(member, member_data, struct_data, data, out_file)
+        elif '[' in suffix:
+            # a local array of structs
+            count = suffix.replace('[', '').replace(']', '')
+            out_file.write('for (size_t i = 0; i < {}; ++i) {{\n'.format(count))
+            output_struct_relocation(member_data['type'], '{}[i]'.format(access), data, out_file)
+            out_file.write('}\n')
+        else:
+            output_struct_relocation(member_data['type'], access, data, out_file)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--input',
+                        help='Input JSON API cache file',
+                        required=True)
+    parser.add_argument('-o', '--output',
+                        help='Output file to write to',
+                        required=True)
+    parser.add_argument('-v', '--verified-void',
+                        help='File containing verified void comparisons, whose lengths are in bytes',
+                        required=True)
+    parser.add_argument('-s', '--source',
+                        help='Source file to write the definitions to, leaving only declarations in the output header')
+    args = parser.parse_args()
+
+    try:
+        json_file = open(args.input, 'r')
+        data = json.load(json_file)
+    except:
+        print("Error: Could not open input file: ", args.input)
+        sys.exit(1)
+
+    try:
+        verified_voids_file = open(args.verified_void, 'r')
+        for line in verified_voids_file:
+            # skip comment lines
+            if line.startswith('#'):
+                continue
+            line_data = line.split(' ')
+            if len(line_data) != 2:
+                print('Error: More than two items on  a verified voids file line "{}"'.format(line))
+                sys.exit(1)
+            copy_header.verified_voids.append({
+                'struct': line_data[0],
+                'member': line_data[1].strip(),
+            })
+    except:
+        print('Error: Could not open verified-voids file: ', args.verified_void)
+        sys.exit(1)
+
+    # sort struct data
+    data['structs'] = dict(sorted(data['structs'].items()))
+
+    # Get first/last versions
+    first_version = data['api']['first']
+    last_version = data['api']['last']
+
+    out_file = open(args.output, "w")
+
+    # Common Header
+    gen_common.writeHeader(out_file)
+
+    # Specific Header
+    out_file.write("""\
+#ifndef VK_STRUCT_ENCODE_H
+#define VK_STRUCT_ENCODE_H
+""")
+    if args.source:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the encode functions are required.
+
+    The definitions are compiled separately, from the accompanying {} source file.
+*/
+""".format(os.path.basename(args.source)))
+    else:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the encode functions are required.
+
+    On *ONE* compilation unit, include the definition of:
+    #define VK_STRUCT_ENCODE_CONFIG_MAIN
+
+    so that the definitions are compiled somewhere following the one definition rule. The
+    definitions of the struct copy header are also required.
+*/
+""")
+    out_file.write("""
+/*
+    encode_vk_struct(ptr, buffer, size) encodes a struct with a known sType, along with everything
+    it points to and its pNext chain, into a single binary blob that can be stored, such as to disk
+    as the key of a pipeline cache, and decode_vk_struct(buffer, size) decodes it back.
+
+    The encoded struct is a copy made as by copy_vk_struct, with its pointers replaced by the
+    offsets of what they point to within the copy. Decoding is then a single read of the whole copy
+    and a walk over it to turn the offsets back into pointers, rather than parsing it field by
+    field. The decoded struct is released with a single call to free(), as a copy is.
+
+    As the copy is of the in-memory layout of the structs, the encoded data can only be decoded by
+    a build with the same pointer size, byte order and layout of the encoded structs. These are
+    recorded as a fingerprint in a header at the start of the encoded data, along with the format
+    version, and decoding data with either differing fails. The fingerprint only covers the structs
+    that are in the encoded data, so it stays valid across Vulkan header versions, as long as those
+    structs keep the same layout.
+
+    Pointers to data that isn't copied (such as platform handles or user data) and function pointers
+    (such as VkDebugUtilsMessengerCreateInfoEXT::pfnUserCallback) are encoded as NULL, as what they
+    point to isn't part of the encoded data, and are also NULL after decoding, whatever the encoded
+    data holds. Any that are needed have to be set again by the caller on the decoded struct.
+    Handles and members of unions without a selector (such as VkDeviceOrHostAddressKHR) are encoded
+    as their values.
+*/
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <vk_struct_copy.h>
+#include <vulkan/vulkan.h>
+
+#include <stddef.h>
+""")
+
+    # static asserts for minimum version
+    out_file.write('''
+#ifdef __cplusplus
+static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION is lower than the minimum supported version (v{0})");
+#else
+_Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the minimum supported version (v{0})");
+#endif
+'''.format(first_version))
+
+    # warnings for above max generated version
+    out_file.write('''
+#if VK_HEADER_VERSION > {0}
+#if _MSC_VER
+#pragma message(__FILE__ ": warning: VK_HEADER_VERSION is higher than what the header fully supports (v{0})")
+#else
+#warning "VK_HEADER_VERSION is higher than what the header fully supports (v{0})"
+#endif
+#endif
+'''.format(last_version))
+
+    out_file.write('''
+// The version of the encoded data format, which is increased whenever it changes
+#define VK_STRUCT_ENCODE_FORMAT_VERSION 2
+
+// Encodes a struct with a known sType into the buffer, returning the size of the encoded data, or 0
+// if the sType isn't known or allocation failed. If the buffer is NULL or smaller than the
+// returned size, nothing is written, so the size required can be queried first.
+size_t encode_vk_struct(void const* pData, void* pBuffer, size_t bufferSize);
+
+// Returns the struct decoded from encoded data in a single allocation, or NULL if the data isn't
+// valid, was encoded by an incompatible build or allocation failed
+void* decode_vk_struct(void const* pBuffer, size_t bufferSize);
+''')
+
+    # Definition Header
+    if args.source:
+        def_file = open(args.source, "w")
+        gen_common.writeHeader(def_file)
+        def_file.write("""\
+#include "{}"
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+""".format(os.path.basename(args.output)))
+    else:
+        def_file = out_file
+        def_file.write("""
+#ifdef VK_STRUCT_ENCODE_CONFIG_MAIN
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+""")
+
+    # Definitions
+    def_file.write("""
+#if defined(__cplusplus)
+#define ENCODE_ALIGNOF(TYPE) alignof(TYPE)
+#elif defined(_MSC_VER)
+#define ENCODE_ALIGNOF(TYPE) __alignof(TYPE)
+#else
+#define ENCODE_ALIGNOF(TYPE) _Alignof(TYPE)
+#endif
+
+// The alignment untyped data is copied with
+#define ENCODE_DATA_ALIGNMENT 16
+
+#define ENCODE_MAGIC 0x45534B56 // 'VKSE'
+
+typedef struct EncodeHeader {
+    uint32_t magic;
+    uint32_t formatVersion;
+    // Fingerprint of the platform and the layout of the encoded structs
+    uint64_t layout;
+    uint64_t size;
+} EncodeHeader;
+
+typedef struct EncodeContext {
+    char* pBase;
+    size_t size;
+    bool encode;
+    bool valid;
+    uint64_t layout;
+} EncodeContext;
+
+// The start of the layout fingerprint, from what the layout of any struct depends on
+static uint64_t encode_platform_layout(void) {
+    uint16_t const byteOrder = 1;
+    uint8_t littleEndian;
+    memcpy(&littleEndian, &byteOrder, 1);
+
+    return (uint64_t)sizeof(void*) | (uint64_t)sizeof(size_t) << 8 | (uint64_t)littleEndian << 16;
+}
+
+// The fingerprint is built up as the copy is walked, which visits the same structs and pointers in
+// the same order when encoding and decoding, so only matches where they all have the same layout
+static void encode_mix_layout(EncodeContext* pContext, uint64_t value) {
+    uint64_t layout = (pContext->layout ^ value) * UINT64_C(0x9E3779B97F4A7C15);
+    pContext->layout = layout ^ (layout >> 29);
+}
+
+// Mixes in a struct, from the shape of its members in the registry and its size
+static void encode_mix_struct(EncodeContext* pContext, uint32_t shape, size_t size) {
+    encode_mix_layout(pContext, (uint64_t)shape << 32 | (uint64_t)size);
+}
+
+// Relocates the pointer member at pMember, returning what it points to. When encoding, the pointer
+// is replaced by the offset of what it points to from the start of the copy. When decoding, the
+// offset is replaced by the pointer again, once checked that the size bytes there are within the
+// copy and aligned. As a copy is laid out in the order it is made, what is pointed to is always
+// after what points to it, so an offset of 0 can't be valid and doubles as NULL, and cycles can't
+// be made.
+//
+// The position of the pointer within the copy is mixed into the layout fingerprint, along with the
+// size of what it points to, which covers the offsets of the pointer members of structs.
+static void* encode_relocate(void* pMember, size_t size, size_t alignment, EncodeContext* pContext) {
+    encode_mix_layout(pContext, (uint64_t)((char*)pMember - pContext->pBase) << 32 | (uint64_t)size);
+
+    char* pPointer;
+    memcpy(&pPointer, pMember, sizeof(char*));
+    if (pPointer == NULL)
+        return NULL;
+
+    if (pContext->encode) {
+        char* pOffset = (char*)(uintptr_t)(pPointer - pContext->pBase);
+        memcpy(pMember, &pOffset, sizeof(char*));
+        return pPointer;
+    }
+
+    size_t offset = (size_t)(uintptr_t)pPointer;
+    size_t memberOffset = (size_t)((char*)pMember - pContext->pBase);
+    if (offset <= memberOffset || offset > pContext->size || size > pContext->size - offset ||
+        offset % alignment != 0) {
+        pContext->valid = false;
+        pPointer = NULL;
+    } else {
+        pPointer = pContext->pBase + offset;
+    }
+    memcpy(pMember, &pPointer, sizeof(char*));
+    return pPointer;
+}
+
+static void encode_relocate_string(void* pMember, EncodeContext* pContext) {
+    char const* pString = (char const*)encode_relocate(pMember, 1, 1, pContext);
+
+    // decoded strings have to end within the copy
+    if (pString != NULL && !pContext->encode &&
+        memchr(pString, '\\0', pContext->size - (size_t)(pString - pContext->pBase)) == NULL)
+        pContext->valid = false;
+}
+
+// Loads an enum member as its 32-bit value, as the encoded data can hold values that aren't valid
+// for the enum, which would be undefined to load as the enum type in C++
+static uint32_t encode_load_enum(void const* pMember) {
+    uint32_t value;
+    memcpy(&value, pMember, sizeof(uint32_t));
+    return value;
+}
+
+// Whether a struct of the given size at pData is within the copy
+static bool encode_struct_fits(void const* pData, size_t size, EncodeContext const* pContext) {
+    return size <= pContext->size - (size_t)((char const*)pData - pContext->pBase);
+}
+""")
+
+    # Group the structs by their sType value, as different names (such as the vendor and promoted
+    # names) can map to the same value in different versions, and each value can only be a single
+    # case label
+    structure_types = data['enums'].get('VkStructureType', {}).get('values', {})
+    dispatch_groups = {}
+
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            while 'alias' in struct_data:
+                struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+
+            # only deal with structs that have defined sType
+            if not 'members' in struct_data or 'sType' not in struct_data['members']:
+                continue
+            sTypeValue = struct_data['members']['sType']['value']
+
+            group_key = get_structure_type_value(structure_types, sTypeValue)
+            dispatch_groups.setdefault(group_key, []).append((sTypeValue, struct, struct_guards, get_struct_shape(struct_data, data)))
+
+    relocated_structs = get_relocated_structs(data)
+
+    # Forward declarations of the internal relocation functions, as structs refer to each other.
+    # Alias structs are the same type as what they alias, so are relocated by the same function.
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+        if struct not in relocated_structs:
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            def_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+            if 'alias' in struct_data:
+                def_file.write('#define encode_relocate_{} encode_relocate_{}\n'.format(struct, struct_data['alias']['name']))
+            else:
+                def_file.write('static void encode_relocate_{0}({0}* pData, EncodeContext* pContext);\n'.format(struct))
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Relocation of a single struct in a pNext chain, not including the rest of the chain
+    def_file.write("""
+// Relocates a struct with a known sType, returning false if it isn't known or doesn't fit within
+// the copy
+static bool encode_relocate_vk_struct(void* pData, EncodeContext* pContext) {
+    switch (encode_load_enum(&((VkBaseOutStructure*)pData)->sType)) {""")
+
+    for group in dispatch_groups.values():
+        def_file.write('\n')
+
+        # Only the first entry whose guard passes gets a case label
+        directive_open = False
+        for sTypeValue, struct, struct_guards, shape in group:
+            if directive_open or struct_guards:
+                if not struct_guards:
+                    def_file.write('#else\n')
+                else:
+                    def_file.write('#elif ' if directive_open else '#if ')
+                    def_file.write('{}\n'.format(format_define_guard(struct_guards)))
+
+            def_file.write('    case {}:\n'.format(sTypeValue))
+            if struct_needs_relocation(struct, data):
+                def_file.write('        if (!encode_struct_fits(pData, sizeof({}), pContext))\n'.format(struct))
+                def_file.write('            return false;\n')
+                def_file.write('        encode_relocate_{0}(({0}*)pData, pContext);\n'.format(struct))
+                def_file.write('        return true;\n')
+            else:
+                # relocated structs are mixed into the fingerprint by their relocation function
+                def_file.write('        encode_mix_struct(pContext, {}, sizeof({}));\n'.format(shape, struct))
+                def_file.write('        return encode_struct_fits(pData, sizeof({}), pContext);\n'.format(struct))
+
+            if not struct_guards:
+                # an unguarded entry always matches, so any after it are unreachable
+                break
+            directive_open = True
+
+        if directive_open:
+            def_file.write('#endif\n')
+
+    def_file.write("""
+    default:
+        return false;
+    }
+}
+
+// Chains are walked iteratively, rather than each struct recursing into the next, so that stack use
+// doesn't grow with the length of the chain
+static void encode_relocate_pNext_chain(void* pNext, EncodeContext* pContext) {
+    VkBaseOutStructure* pCurrent = (VkBaseOutStructure*)encode_relocate(
+        pNext, sizeof(VkBaseOutStructure), ENCODE_ALIGNOF(VkBaseOutStructure), pContext);
+
+    while (pCurrent != NULL) {
+        // copies only hold known structs in their chains
+        if (!encode_relocate_vk_struct(pCurrent, pContext)) {
+            pContext->valid = false;
+            return;
+        }
+        pCurrent = (VkBaseOutStructure*)encode_relocate(
+            &pCurrent->pNext, sizeof(VkBaseOutStructure), ENCODE_ALIGNOF(VkBaseOutStructure), pContext);
+    }
+}
+
+size_t encode_vk_struct(void const* pData, void* pBuffer, size_t bufferSize) {
+    size_t size = size_vk_struct(pData);
+    if (size == 0)
+        return 0;
+
+    size_t encodedSize = sizeof(EncodeHeader) + size;
+    if (pBuffer == NULL || bufferSize < encodedSize)
+        return encodedSize;
+
+    char* pCopy = (char*)copy_vk_struct(pData);
+    if (pCopy == NULL)
+        return 0;
+
+    EncodeContext context = {pCopy, size, true, true, encode_platform_layout()};
+    encode_relocate_vk_struct(pCopy, &context);
+    encode_relocate_pNext_chain(&((VkBaseOutStructure*)pCopy)->pNext, &context);
+
+    EncodeHeader header = {ENCODE_MAGIC, VK_STRUCT_ENCODE_FORMAT_VERSION, context.layout, size};
+    memcpy(pBuffer, &header, sizeof(EncodeHeader));
+    memcpy((char*)pBuffer + sizeof(EncodeHeader), pCopy, size);
+
+    free(pCopy);
+    return encodedSize;
+}
+
+void* decode_vk_struct(void const* pBuffer, size_t bufferSize) {
+    if (pBuffer == NULL || bufferSize < sizeof(EncodeHeader))
+        return NULL;
+
+    EncodeHeader header;
+    memcpy(&header, pBuffer, sizeof(EncodeHeader));
+    if (header.magic != ENCODE_MAGIC || header.formatVersion != VK_STRUCT_ENCODE_FORMAT_VERSION ||
+        header.size < sizeof(VkBaseOutStructure) || header.size > bufferSize - sizeof(EncodeHeader))
+        return NULL;
+
+    size_t size = (size_t)header.size;
+    char* pData = (char*)malloc(size);
+    if (pData == NULL)
+        return NULL;
+    memcpy(pData, (char const*)pBuffer + sizeof(EncodeHeader), size);
+
+    EncodeContext context = {pData, size, false, true, encode_platform_layout()};
+    if (encode_relocate_vk_struct(pData, &context))
+        encode_relocate_pNext_chain(&((VkBaseOutStructure*)pData)->pNext, &context);
+    else
+        context.valid = false;
+
+    // the structs are only known to have the layout they were encoded with once all were visited
+    if (!context.valid || context.layout != header.layout) {
+        free(pData);
+        return NULL;
+    }
+    return pData;
+}
+""")
+
+    # The value sizes of layer settings
+    if 'VkLayerSettingEXT' in data['structs']:
+        for variant, struct_data in data['structs']['VkLayerSettingEXT'].items():
+            def_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+            def_file.write('''\
+static size_t encode_layer_setting_value_size(uint32_t type) {
+    switch (type) {
+    case VK_LAYER_SETTING_TYPE_BOOL32_EXT:
+        return sizeof(VkBool32);
+    case VK_LAYER_SETTING_TYPE_INT32_EXT:
+        return sizeof(int32_t);
+    case VK_LAYER_SETTING_TYPE_INT64_EXT:
+        return sizeof(int64_t);
+    case VK_LAYER_SETTING_TYPE_UINT32_EXT:
+        return sizeof(uint32_t);
+    case VK_LAYER_SETTING_TYPE_UINT64_EXT:
+        return sizeof(uint64_t);
+    case VK_LAYER_SETTING_TYPE_FLOAT32_EXT:
+        return sizeof(float);
+    case VK_LAYER_SETTING_TYPE_FLOAT64_EXT:
+        return sizeof(double);
+    default:
+        return 0;
+    }
+}
+''')
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Dynamic Definitions
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+        if struct not in relocated_structs:
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            if 'alias' in struct_data:
+                continue
+            def_file.write('\n')
+
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+
+            def_file.write('static void encode_relocate_{0}({0}* pData, EncodeContext* pContext) {{\n'.format(struct))
+            def_file.write('    encode_mix_struct(pContext, {}, sizeof({}));\n'.format(get_struct_shape(struct_data, data), struct))
+            if 'members' in struct_data:
+                output_members(struct, struct_data, data, def_file)
+            def_file.write('}\n')
+
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Footer
+    if args.source:
+        def_file.close()
+    else:
+        out_file.write('\n#endif // VK_STRUCT_ENCODE_CONFIG_MAIN\n')
+    out_file.write("""
+#ifdef __cplusplus
+}
+#endif
+""")
+    out_file.write('\n#endif // VK_STRUCT_ENCODE_H\n')
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
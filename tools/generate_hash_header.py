@@ -0,0 +1,759 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2026 George Cave.
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import argparse
+import gen_common
+import json
+import os
+import re
+import sys
+
+# The hashes follow the same rules as the comparisons of generate_comparison_header.py, hashing
+# only what is compared and in the same way, so that structs that compare equal always hash equal
+
+verified_voids = []
+
+
+def get_define_guards(type_data, first_version, last_version):
+    guard_sets = []
+
+    # Guard based on required definitions
+    if 'requires' in type_data:
+        for require_variant, require_data in type_data['requires'].items():
+            guard = ''
+            check_started = False
+
+            # check version numbers first
+            if require_data['first'] != first_version:
+                guard += 'VK_HEADER_VERSION >= {}'.format(require_data['first'])
+                check_started = True
+
+            if require_data['last'] != last_version:
+                if check_started:
+                    guard += ' && '
+                guard += 'VK_HEADER_VERSION <= {}'.format(require_data['last'])
+                check_started = True
+
+            # add defines
+            for define in require_data['defines']:
+                if check_started:
+                    guard += ' && '
+                # Brackets around OR defines
+                if ',' in define:
+                    guard += '({})'.format(define.replace(',', ' || '))
+                else:
+                    guard += define
+                check_started = True
+
+            if guard:
+                guard_sets.append(guard)
+    else:
+        # do a guard based only on version numbers for the struct
+        firstCheck = type_data['first']
+        lastCheck = type_data['last']
+        guard = ''
+
+        # Guard check for first version
+        if firstCheck != first_version:
+            guard = 'VK_HEADER_VERSION >= {}'.format(firstCheck)
+
+        # Guard check for last version
+        if lastCheck != last_version:
+            if guard:
+                # If already started, append to it
+                guard += ' && '
+            guard += 'VK_HEADER_VERSION <= {}'.format(lastCheck)
+        if guard:
+            guard_sets.append(guard)
+
+    return guard_sets
+
+
+def format_define_guard(guard_list):
+    if len(guard_list) == 1:
+        return guard_list[0]
+    return ' || '.join('({})'.format(guard) for guard in guard_list)
+
+
+def output_define_guard(guard_list, out_file):
+    if guard_list:
+        out_file.write('#if {}\n'.format(format_define_guard(guard_list)))
+
+
+def get_structure_type_value(structure_types, sType):
+    # Resolve through aliases, so all names sharing a value map to the same key
+    while sType in structure_types and 'alias' in structure_types[sType]:
+        sType = structure_types[sType]['alias']
+    if sType in structure_types and 'value' in structure_types[sType]:
+        return structure_types[sType]['value']
+    return sType
+
+
+def output_dispatch_case(sType, struct, out_file):
+    out_file.write('    case {}:\n'.format(sType))
+    out_file.write('        *pHash = hash_{0}(({0} const*)pData);\n'.format(struct))
+    out_file.write('        return true;\n')
+
+
+def string_found(string1, string2):
+    if re.search(r"\b" + re.escape(string1) + r"\b", string2):
+        return True
+    return False
+
+
+def is_verified_void(struct, member):
+    for item in verified_voids:
+        if item['struct'] == struct and item['member'] == member:
+            return True
+    return False
+
+
+def get_local_array_size(member_data):
+    # The number of elements of a local array member
+    size = member_data['suffix'].replace('[', '')
+    return size.replace(']', '')
+
+
+def output_scalar(access, member_data, out_file):
+    if ':' in member_data.get('suffix', ''):
+        # bitfields can't be addressed, but are always integers
+        out_file.write('  hash = hash_combine(hash, {});\n'.format(access))
+    else:
+        out_file.write('  hash = HASH_VALUE(hash, {});\n'.format(access))
+
+
+def output_heap_member(struct, member, member_data, struct_data, iteration, suffix, available_characters, data, out_file):
+    # Follows process_multi_member of the comparison generator
+    if len(available_characters) == 0:
+        print('ERROR: ran out of nestable variable names, add more!')
+        sys.exit(1)
+    iter_character = available_characters[0]
+    this_iteration = iteration[0]
+
+    if len(iteration) > 1:
+        # more than one level of indirection
+        out_file.write('  if (s->{0}{1} != NULL) {{\n'.format(member, suffix))
+        if this_iteration.isdigit():
+            out_file.write('  for (size_t {0} = 0; {0} < {1}; ++{0}) {{\n'.format(iter_character, this_iteration))
+        else:
+            out_file.write('  for (size_t {0} = 0; {0} < s->{1}; ++{0}) {{\n'.format(iter_character, this_iteration))
+
+        output_heap_member(struct, member, member_data, struct_data, iteration[1:], '{}[{}]'.format(suffix, iter_character), available_characters[1:], data, out_file)
+        out_file.write('}\n')
+        out_file.write('}\n')
+        return
+
+    # last level of indirection
+    if member_data['type'] in data['structs']:
+        # structs pointed to are not compared
+        return
+
+    # the same byte count as is compared
+    for struct_member, struct_member_data in struct_data['members'].items():
+        if string_found(struct_member, this_iteration):
+            this_iteration = this_iteration.replace(struct_member, 's->{}'.format(struct_member))
+            if member_data['type'] != 'void':
+                this_iteration = '({}) * sizeof({})'.format(this_iteration, member_data['type'])
+
+    access = 's->{}{}'.format(member, suffix)
+    if member_data['type'] == 'char':
+        if this_iteration != 'null-terminated':
+            print('ERROR: Unsupported character hash of {}'.format(member))
+            sys.exit(1)
+        if '*' in member_data['suffix']:
+            out_file.write('  hash = hash_string(hash, {});\n'.format(access))
+        else:
+            out_file.write('  hash = hash_string_n(hash, {}, {});\n'.format(access, get_local_array_size(member_data)))
+
+    elif member_data['type'] == 'void':
+        if struct == 'VkLayerSettingEXT' and member == 'pValues':
+            out_file.write('''\
+                if ({0} != NULL) {{
+                    switch (s->type) {{
+                      case VK_LAYER_SETTING_TYPE_BOOL32_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(VkBool32));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_INT32_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(int32_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_INT64_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(int64_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_UINT32_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(uint32_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_UINT64_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(uint64_t));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_FLOAT32_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(float));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_FLOAT64_EXT:
+                        hash = hash_bytes(hash, {0}, {1} * sizeof(double));
+                        break;
+                      case VK_LAYER_SETTING_TYPE_STRING_EXT:
+                        for (uint32_t i = 0; i < {1}; ++i)
+                            hash = hash_string(hash, ((char const *const *){0})[i]);
+                        break;
+                      default:
+                        break;
+                    }}
+                }}\n'''.format(access, this_iteration))
+            return
+
+        if not is_verified_void(struct, member):
+            print('Error: Unverified void type, investigate {} :: {}'.format(struct, member))
+            sys.exit(1)
+        out_file.write('  if ({0} != NULL)\n    hash = hash_bytes(hash, {0}, {1});\n'.format(access, this_iteration))
+
+    elif '*' in member_data['suffix']:
+        out_file.write('  if ({0} != NULL)\n    hash = hash_bytes(hash, {0}, {1});\n'.format(access, this_iteration))
+    else:
+        out_file.write('  hash = hash_bytes(hash, &{0}, {1});\n'.format(access, this_iteration))
+
+
+def output_union_cases(struct, member, member_data, struct_data, data, out_file):
+    union_data = data['unions'][member_data['type']]
+    enum_data = data['enums'][struct_data['members'][member_data['selector']]['type']]
+    enum_value_data = enum_data['values']
+
+    out_file.write('  switch (s->{}) {{\n'.format(member_data['selector']))
+    for union_member, union_member_data in union_data['members'].items():
+        non_guarded_cases = 0
+        all_guards = []
+        for case in union_member_data['selection'].split(','):
+            value_guards = get_define_guards(enum_value_data[case], enum_data['first'], enum_data['last'])
+            output_define_guard(value_guards, out_file)
+            out_file.write('  case {}:\n'.format(case))
+            if value_guards:
+                out_file.write('#endif\n')
+                all_guards += value_guards
+            else:
+                non_guarded_cases += 1
+
+        if non_guarded_cases == 0:
+            output_define_guard(all_guards, out_file)
+
+        access = 's->{}.{}'.format(member, union_member)
+        if union_member_data['type'] in data['structs'] and '*' in union_member_data.get('suffix', ''):
+            out_file.write('    if ({0} != NULL)\n      hash = hash_combine(hash, hash_{1}({0}));\n'.format(access, union_member_data['type']))
+        elif union_member_data['type'] in data['structs']:
+            out_file.write('    hash = hash_combine(hash, hash_{}(&{}));\n'.format(union_member_data['type'], access))
+        else:
+            out_file.write('  ')
+            output_scalar(access, union_member_data, out_file)
+        out_file.write('    break;\n')
+
+        if non_guarded_cases == 0:
+            out_file.write('#endif\n')
+        out_file.write('\n')
+
+    out_file.write('  default:\n')
+    out_file.write('    break;\n')
+    out_file.write('  }\n\n')
+
+
+def output_struct_hash(struct, struct_data, data, out_file):
+    # The members are handled in the same passes as they are compared in, with each member only
+    # handled by the first pass that takes it
+    processed = set()
+
+    def is_local(member_data):
+        suffix = member_data.get('suffix', '')
+        return '*' not in suffix and '[' not in suffix
+
+    members = {member: member_data for member, member_data in struct_data['members'].items()
+               if member != 'sType' and member != 'pNext'}
+
+    # first pass, simple/local items
+    started = False
+    for member, member_data in members.items():
+        if not is_local(member_data) or member_data['type'] in data['structs'] or member_data['type'] in data['unions']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local, simple types\n')
+            started = True
+        output_scalar('s->{}'.format(member), member_data, out_file)
+    if started:
+        out_file.write('\n')
+
+    # second pass, local struct types
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['unions']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local, Vulkan struct types\n')
+            started = True
+        out_file.write('  hash = hash_combine(hash, hash_{}(&s->{}));\n'.format(member_data['type'], member))
+    if started:
+        out_file.write('\n')
+
+    # third pass, union types with no selector, which are compared as a whole
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['structs'] or 'selector' in member_data:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // union types (no selector)\n')
+            started = True
+        out_file.write('  hash = hash_bytes(hash, &s->{0}, sizeof(s->{0}));\n'.format(member))
+    if started:
+        out_file.write('\n')
+
+    # fourth pass, union types with selector
+    started = False
+    for member, member_data in members.items():
+        if member in processed or not is_local(member_data) or member_data['type'] in data['structs']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // union types (with selector)\n')
+            started = True
+        output_union_cases(struct, member, member_data, struct_data, data, out_file)
+
+    # fifth pass, local array members
+    started = False
+    for member, member_data in members.items():
+        if member in processed or '*' in member_data.get('suffix', ''):
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // local array members\n')
+            started = True
+
+        if 'len' in member_data and member_data['type'] == 'char':
+            out_file.write('  hash = hash_string_n(hash, s->{}, {});\n'.format(member, get_local_array_size(member_data)))
+        elif 'len' in member_data:
+            # only as many bytes as the length, up to the size of the array
+            out_file.write('  hash = hash_bytes(hash, s->{0}, s->{1} < sizeof(s->{0}) ? s->{1} : sizeof(s->{0}));\n'.format(member, member_data['len']))
+        else:
+            out_file.write('  hash = hash_bytes(hash, s->{0}, sizeof(s->{0}));\n'.format(member))
+    if started:
+        out_file.write('\n')
+
+    # sixth pass, heap items
+    started = False
+    for member, member_data in members.items():
+        if member in processed or member_data['type'] in data['structs']:
+            continue
+        processed.add(member)
+        if not started:
+            out_file.write('  // non-local members\n')
+            started = True
+
+        if 'len' in member_data:
+            out_file.write('\n  // {} - {}\n'.format(member, member_data['len']))
+            output_heap_member(struct, member, member_data, struct_data, member_data['len'].split(','), '', 'ijklmn', data, out_file)
+        else:
+            # only the pointer itself is compared
+            out_file.write('  hash = HASH_VALUE(hash, s->{});\n'.format(member))
+
+
+def main(argv):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-i', '--input',
+                        help='Input JSON API cache file',
+                        required=True)
+    parser.add_argument('-o', '--output',
+                        help='Output file to write to',
+                        required=True)
+    parser.add_argument('-v', '--verified-void',
+                        help='File containing verified void comparisons',
+                        required=True)
+    parser.add_argument('-s', '--source',
+                        help='Source file to write the definitions to, leaving only declarations in the output header')
+    args = parser.parse_args()
+
+    try:
+        json_file = open(args.input, 'r')
+        data = json.load(json_file)
+    except:
+        print("Error: Could not open input file: ", args.input)
+        sys.exit(1)
+
+    try:
+        verified_voids_file = open(args.verified_void, 'r')
+        for line in verified_voids_file:
+            # skip comment lines
+            if line.startswith('#'):
+                continue
+            line_data = line.split(' ')
+            if len(line_data) != 2:
+                print('Error: More than two items on  a verified voids file line "{}"'.format(line))
+                sys.exit(1)
+            verified_voids.append({
+                'struct': line_data[0],
+                'member': line_data[1].strip(),
+            })
+    except:
+        print('Error: Could not open verified-voids file: ', args.verified_void)
+        sys.exit(1)
+
+    # sort struct data
+    data['structs'] = dict(sorted(data['structs'].items()))
+
+    # Get first/last versions
+    first_version = data['api']['first']
+    last_version = data['api']['last']
+
+    out_file = open(args.output, "w")
+
+    # Common Header
+    gen_common.writeHeader(out_file)
+
+    # Specific Header
+    out_file.write("""\
+#ifndef VK_STRUCT_HASH_H
+#define VK_STRUCT_HASH_H
+""")
+    if args.source:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the hash functions are required.
+
+    The definitions are compiled separately, from the accompanying {} source file.
+*/
+""".format(os.path.basename(args.source)))
+    else:
+        out_file.write("""
+/*  USAGE:
+    To use, include this header where the declarations for the hash functions are required.
+
+    On *ONE* compilation unit, include the definition of:
+    #define VK_STRUCT_HASH_CONFIG_MAIN
+
+    so that the definitions are compiled somewhere following the one definition rule.
+*/
+""")
+    out_file.write("""
+/*
+    These hash_*(ptr) functions hash exactly what the matching compare_*(lhs, rhs) functions of
+    vk_struct_compare.h compare, so that structs that compare equal always hash equal. As with the
+    comparisons, the sType and pNext chain of the given struct are not part of the hash.
+
+    The hash_vk_struct*(ptr) functions hash structs of any known sType including their pNext
+    chains, the same as the compare_vk_struct*(lhs, rhs) functions compare them.
+
+    For C++, the vk_struct_hash<T> and vk_struct_equal<T> functors (the latter using the compare_*
+    functions) can be given as the hasher and key equality of unordered containers. If the
+    following is defined before including this header, std::hash and std::equal_to are also
+    specialized for the structs, so they can be used directly as keys of unordered containers:
+    #define VK_STRUCT_HASH_STD_SPECIALIZATIONS
+*/
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+#include <vulkan/vulkan.h>
+
+#include <stdint.h>
+""")
+
+    # static asserts for minimum version
+    out_file.write('''
+#ifdef __cplusplus
+static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION is lower than the minimum supported version (v{0})");
+#else
+_Static_assert(VK_HEADER_VERSION >= {0}, "VK_HEADER_VERSION  is lower than the minimum supported version (v{0})");
+#endif
+'''.format(first_version))
+
+    # warnings for above max generated version
+    out_file.write('''
+#if VK_HEADER_VERSION > {0}
+#if _MSC_VER
+#pragma message(__FILE__ ": warning: VK_HEADER_VERSION is higher than what the header fully supports (v{0})")
+#else
+#warning "VK_HEADER_VERSION is higher than what the header fully supports (v{0})"
+#endif
+#endif
+'''.format(last_version))
+
+    # Generic struct catchall
+    out_file.write('''
+// Hashes a struct along with its pNext chain in order, consistent with compare_vk_struct
+uint64_t hash_vk_struct(void const* pData);
+
+// Hashes a struct along with its pNext chain in any order, consistent with
+// compare_vk_struct_unordered
+uint64_t hash_vk_struct_unordered(void const* pData);
+''')
+
+    # Dynamic Declarations
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            out_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, out_file)
+            out_file.write('uint64_t hash_{0}({0} const* s);\n'.format(struct))
+            if struct_guards:
+                out_file.write('#endif\n')
+
+    # Definition Header
+    if args.source:
+        def_file = open(args.source, "w")
+        gen_common.writeHeader(def_file)
+        def_file.write('#include "{}"\n'.format(os.path.basename(args.output)))
+    else:
+        def_file = out_file
+        def_file.write('\n#ifdef VK_STRUCT_HASH_CONFIG_MAIN\n')
+
+    def_file.write("""
+#include <stdbool.h>
+#include <string.h>
+
+static uint64_t hash_combine(uint64_t hash, uint64_t value) {
+    // The finalizer of MurmurHash3, so that every bit of the value affects the whole hash
+    value ^= value >> 33;
+    value *= 0xff51afd7ed558ccdULL;
+    value ^= value >> 33;
+    value *= 0xc4ceb9fe1a85ec53ULL;
+    value ^= value >> 33;
+
+    return hash ^ (value + 0x9e3779b97f4a7c15ULL + (hash << 6) + (hash >> 2));
+}
+
+static uint64_t hash_bytes(uint64_t hash, void const* pData, size_t size) {
+    unsigned char const* pBytes = (unsigned char const*)pData;
+
+    while (size >= sizeof(uint64_t)) {
+        uint64_t value;
+        memcpy(&value, pBytes, sizeof(uint64_t));
+        hash = hash_combine(hash, value);
+        pBytes += sizeof(uint64_t);
+        size -= sizeof(uint64_t);
+    }
+    if (size > 0) {
+        uint64_t value = 0;
+        memcpy(&value, pBytes, size);
+        hash = hash_combine(hash, value);
+    }
+
+    return hash;
+}
+
+static uint64_t hash_string(uint64_t hash, char const* pString) {
+    if (pString == NULL)
+        return hash_combine(hash, 0);
+    return hash_combine(hash_bytes(hash, pString, strlen(pString)), 1);
+}
+
+static uint64_t hash_string_n(uint64_t hash, char const* pString, size_t maxLength) {
+    size_t length = 0;
+    while (length < maxLength && pString[length] != '\\0')
+        ++length;
+    return hash_bytes(hash, pString, length);
+}
+
+// Values are compared with ==, so any that compare equal to zero (such as -0.0 and 0.0) are hashed
+// the same way, which also doesn't depend on their type
+#define HASH_VALUE(HASH, VALUE)                                                                    \\
+    ((VALUE) == 0 ? hash_combine(HASH, 0) : hash_bytes(HASH, &(VALUE), sizeof(VALUE)))
+""")
+
+    # Dynamic Definitions
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            def_file.write('\n')
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            output_define_guard(struct_guards, def_file)
+            def_file.write('uint64_t hash_{0}({0} const* s) {{\n'.format(struct))
+
+            while 'alias' in struct_data:
+                # for an alias struct, use the alias's data
+                struct_data = data['structs'][struct_data['alias']['name']][struct_data['alias']['hash']]
+
+            if 'members' not in struct_data or not [member for member in struct_data['members'] if member != 'sType' and member != 'pNext']:
+                def_file.write('  (void)s;\n')
+                def_file.write('  return 0;\n')
+            else:
+                def_file.write('  uint64_t hash = 0;\n\n')
+                output_struct_hash(struct, struct_data, data, def_file)
+                def_file.write('  return hash;\n')
+            def_file.write('}\n')
+            if struct_guards:
+                def_file.write('#endif\n')
+
+    # Hashing of a single struct of any known sType
+    def_file.write("""
+// Hashes a struct with a known sType, but not its pNext chain, returning false if it isn't known
+static bool hash_vk_struct_single(void const* pData, uint64_t* pHash) {
+    VkBaseInStructure const* pTemp = (VkBaseInStructure const*)pData;
+
+    switch (pTemp->sType) {""")
+
+    # Group the structs by their sType value, the same as for compare_vk_struct, so the same struct
+    # is used for each value
+    structure_types = data['enums'].get('VkStructureType', {}).get('values', {})
+    dispatch_groups = {}
+
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+
+            # only deal with structs that have defined sType
+            if not 'members' in struct_data or 'sType' not in struct_data['members']:
+                continue
+            sTypeValue = struct_data['members']['sType']['value']
+
+            struct_guards = get_define_guards(struct_data, first_version, last_version)
+            group_key = get_structure_type_value(structure_types, sTypeValue)
+            dispatch_groups.setdefault(group_key, []).append((sTypeValue, struct, struct_guards))
+
+    for group in dispatch_groups.values():
+        def_file.write('\n')
+
+        # Only the first entry whose guard passes gets a case label
+        directive_open = False
+        for sTypeValue, struct, struct_guards in group:
+            if not struct_guards:
+                # an unguarded entry always matches, so any after it are unreachable
+                if directive_open:
+                    def_file.write('#else\n')
+                output_dispatch_case(sTypeValue, struct, def_file)
+                break
+
+            def_file.write('#elif ' if directive_open else '#if ')
+            def_file.write('{}\n'.format(format_define_guard(struct_guards)))
+            output_dispatch_case(sTypeValue, struct, def_file)
+            directive_open = True
+
+        if directive_open:
+            def_file.write('#endif\n')
+
+    def_file.write("""
+    default:
+        return false;
+    }
+}
+
+static uint64_t hash_vk_struct_link(VkBaseInStructure const* pData) {
+    uint64_t hash;
+    if (hash_vk_struct_single(pData, &hash))
+        return hash_combine(hash, (uint64_t)pData->sType);
+
+    // structs that aren't known are only equal to themselves
+    return hash_combine(0, (uint64_t)(uintptr_t)pData);
+}
+
+uint64_t hash_vk_struct(void const* pData) {
+    uint64_t hash = 0;
+    for (VkBaseInStructure const* pCurrent = (VkBaseInStructure const*)pData; pCurrent != NULL; pCurrent = pCurrent->pNext)
+        hash = hash_combine(hash, hash_vk_struct_link(pCurrent));
+    return hash;
+}
+
+uint64_t hash_vk_struct_unordered(void const* pData) {
+    VkBaseInStructure const* pHead = (VkBaseInStructure const*)pData;
+
+    // the hashes of the chain are summed, so that the order they are in doesn't matter
+    uint64_t chainHash = 0;
+    for (VkBaseInStructure const* pCurrent = pHead->pNext; pCurrent != NULL; pCurrent = pCurrent->pNext)
+        chainHash += hash_vk_struct_link(pCurrent);
+
+    return hash_combine(hash_vk_struct_link(pHead), chainHash);
+}
+""")
+
+    # Footer
+    if args.source:
+        def_file.close()
+    else:
+        out_file.write('\n#endif // VK_STRUCT_HASH_CONFIG_MAIN\n')
+    out_file.write("""
+#ifdef __cplusplus
+}
+#endif
+""")
+
+    # C++ functors, so the structs can be used as keys of unordered containers
+    out_file.write("""
+#ifdef __cplusplus
+#include <vk_struct_compare.h>
+
+#include <cstddef>
+#include <functional>
+
+// Hasher for unordered containers, specialized for each struct
+template <typename T>
+struct vk_struct_hash;
+
+// Key equality for unordered containers, specialized for each struct
+template <typename T>
+struct vk_struct_equal;
+
+""")
+    cpp_structs = []
+    for struct, variants in data['structs'].items():
+        if struct == 'VkBaseInStructure' or struct == 'VkBaseOutStructure':
+            continue
+
+        sorted_variants = dict(sorted(variants.items(), key=lambda item: item[1]['first']))
+        for variant, struct_data in sorted_variants.items():
+            # an alias is the same type as the struct it aliases, which has its own specializations
+            if 'alias' in struct_data:
+                continue
+            cpp_structs.append((struct, get_define_guards(struct_data, first_version, last_version)))
+
+    for struct, struct_guards in cpp_structs:
+        output_define_guard(struct_guards, out_file)
+        out_file.write('''\
+template <>
+struct vk_struct_hash<{0}> {{
+  std::size_t operator()({0} const& s) const noexcept {{ return static_cast<std::size_t>(hash_{0}(&s)); }}
+}};
+template <>
+struct vk_struct_equal<{0}> {{
+  bool operator()({0} const& lhs, {0} const& rhs) const {{ return compare_{0}(&lhs, &rhs); }}
+}};
+'''.format(struct))
+        if struct_guards:
+            out_file.write('#endif\n')
+        out_file.write('\n')
+
+    # The std specializations are opt-in, as the structs aren't owned by this header, and any other
+    # library specializing them as well would break the one definition rule
+    out_file.write("""\
+#ifdef VK_STRUCT_HASH_STD_SPECIALIZATIONS
+namespace std {
+
+""")
+    for struct, struct_guards in cpp_structs:
+        output_define_guard(struct_guards, out_file)
+        out_file.write('''\
+template <>
+struct hash<{0}> : vk_struct_hash<{0}> {{}};
+template <>
+struct equal_to<{0}> : vk_struct_equal<{0}> {{}};
+'''.format(struct))
+        if struct_guards:
+            out_file.write('#endif\n')
+        out_file.write('\n')
+
+    out_file.write('} // namespace std\n')
+    out_file.write('#endif // VK_STRUCT_HASH_STD_SPECIALIZATIONS\n')
+    out_file.write('\n#endif // __cplusplus\n')
+    out_file.write('\n#endif // VK_STRUCT_HASH_H\n')
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-# Copyright (C) 2022-2023 George Cave.
+# Copyright (C) 2022-2026 George Cave.
 #
 # SPDX-License-Identifier: Apache-2.0
 
@@ -10,6 +10,66 @@ import sys
 import json
 
 
+def formatName(name):
+    # Names are hashed and compared as formatted for parsing, with spaces as underscores and all
+    # other characters capitalized
+    return name.replace(' ', '_').upper()
+
+
+def hashName(name):
+    # 32-bit FNV-1a, matching the generated hash function
+    hash = 2166136261
+    for char in formatName(name):
+        hash = ((hash ^ ord(char)) * 16777619) & 0xFFFFFFFF
+    return hash
+
+
+def mixHash(hash):
+    # Murmur3 finalizer, matching the generated mix function
+    hash ^= hash >> 16
+    hash = (hash * 0x85EBCA6B) & 0xFFFFFFFF
+    hash ^= hash >> 13
+    hash = (hash * 0xC2B2AE35) & 0xFFFFFFFF
+    hash ^= hash >> 16
+    return hash
+
+
+def buildPerfectHash(names):
+    # Hash and displace: names are first split into buckets by their hash, then, starting with the
+    # largest buckets, a seed is found for each bucket that places all of its names into free slots
+    hashes = [hashName(name) for name in names]
+    if len(set(hashes)) != len(hashes):
+        print('Error: Result names have colliding hashes')
+        sys.exit(1)
+
+    slotCount = 1
+    while slotCount < len(names):
+        slotCount *= 2
+    bucketCount = max(1, (len(names) + 1) // 2)
+
+    buckets = [[] for _ in range(bucketCount)]
+    for index, hash in enumerate(hashes):
+        buckets[hash % bucketCount].append(index)
+
+    seeds = [0] * bucketCount
+    slots = [None] * slotCount
+    for bucket in sorted(range(bucketCount), key=lambda bucket: -len(buckets[bucket])):
+        if not buckets[bucket]:
+            continue
+        for seed in range(1, 0x10000):
+            placed = [mixHash(hashes[index] ^ seed) % slotCount for index in buckets[bucket]]
+            if len(set(placed)) == len(placed) and all(slots[slot] is None for slot in placed):
+                break
+        else:
+            print('Error: Could not find a perfect hash seed for the result names')
+            sys.exit(1)
+        seeds[bucket] = seed
+        for index, slot in zip(buckets[bucket], placed):
+            slots[slot] = index
+
+    return seeds, slots
+
+
 def main(argv):
     parser = argparse.ArgumentParser()
     parser.add_argument('-i', '--input',
@@ -42,12 +102,14 @@ def main(argv):
         enumType = 'VkResult'
         header = '<vulkan/vulkan.h>'
         guard = 'VK_RESULT'
+        prefix = 'VK_'
     elif args.api == 'openxr':
         apiVersionStr = '(XR_CURRENT_API_VERSION & 0xffffffffULL)'
         apiVersionDefine = 'XR_CURRENT_API_VERSION'
         enumType = 'XrResult'
         header = '<openxr/openxr.h>'
         guard = 'XR_RESULT'
+        prefix = 'XR_'
 
     # Common Header
     gen_common.writeHeader(outFile)
@@ -70,6 +132,9 @@ extern "C" {{
 
 #include {1}
 
+#include <stdbool.h>
+#include <stddef.h>
+
 """.format(guard, header))
 
     # static asserts
@@ -94,7 +159,18 @@ extern "C" {{
 /// Returns a string representing the given VkResult parameter. If there is no known representation,
 /// returns NULL.
 char const *{0}_to_string({0} result);
-""".format(enumType))
+
+/// Parses a string representing a {0} value into pResult. Both the names returned by
+/// {0}_to_string and any other names for the same values are accepted, where the comparison is
+/// case insensitive, spaces can be used in place of underscores, the '{1}' prefix is optional
+/// and any surrounding whitespace is ignored. Returns true if the string was recognized and pResult
+/// set, otherwise returns false and pResult is not modified.
+bool {0}_from_string(char const *pString, {0} *pResult);
+
+/// Same as {0}_from_string, except that the string is of the given length, rather than
+/// null-terminated.
+bool {0}_from_string_n(char const *pString, size_t length, {0} *pResult);
+""".format(enumType, prefix))
 
     if args.api == 'vulkan':
         outFile.write("""
@@ -106,6 +182,9 @@ char const *vkResultToString(VkResult result);
     outFile.write("""
 #ifdef {0}_TO_STRING_CONFIG_MAIN
 
+#include <ctype.h>
+#include <string.h>
+
 char const* {1}_to_string({1} result) {{
   // Check in descending order to get the 'latest' version of the error code text available.
   // Also, because codes have been re-used over time, can't use a switch and have to do this large set of ifs.
@@ -134,6 +213,108 @@ char const* {1}_to_string({1} result) {{
 }
 """)
 
+    # Parsing, with every name for each value, without the prefix, placed by a perfect hash
+    names = []
+    for key, data in apiData['enums'][enumType]['values'].items():
+        if 'alias' in data:
+            target = data['alias']
+            while 'alias' in apiData['enums'][enumType]['values'][target]:
+                target = apiData['enums'][enumType]['values'][target]['alias']
+            value = apiData['enums'][enumType]['values'][target]['value']
+        else:
+            value = data['value']
+        names.append((key[len(prefix):] if key.startswith(prefix) else key, value))
+
+    seeds, slots = buildPerfectHash([name for name, value in names])
+
+    outFile.write("""
+static uint16_t const c{0}HashSeeds[{1}] = {{
+""".format(enumType, len(seeds)))
+    for seed in seeds:
+        outFile.write('  {},\n'.format(seed))
+    outFile.write('};\n')
+
+    outFile.write("""
+static char const *const c{0}HashNames[{1}] = {{
+""".format(enumType, len(slots)))
+    for slot in slots:
+        outFile.write('  {},\n'.format('NULL' if slot is None else '"{}"'.format(names[slot][0])))
+    outFile.write('};\n')
+
+    outFile.write("""
+static int32_t const c{0}HashValues[{1}] = {{
+""".format(enumType, len(slots)))
+    for slot in slots:
+        outFile.write('  {},\n'.format(0 if slot is None else names[slot][1]))
+    outFile.write('};\n')
+
+    outFile.write("""
+/// Formats a character being parsed to match the names, with spaces as underscores and all other
+/// characters capitalized. Names are plain ASCII, so this avoids the locale lookups of toupper.
+static char format{0}Char(char ch) {{
+  if (ch == ' ')
+    return '_';
+  if (ch >= 'a' && ch <= 'z')
+    return (char)(ch - 'a' + 'A');
+  return ch;
+}}
+
+bool {0}_from_string(char const *pString, {0} *pResult) {{
+  if (pString == NULL)
+    return false;
+
+  return {0}_from_string_n(pString, strlen(pString), pResult);
+}}
+
+bool {0}_from_string_n(char const *pString, size_t length, {0} *pResult) {{
+  if (pString == NULL)
+    return false;
+
+  // Trim whitespace from either end
+  char const *pEnd = pString + length;
+  while (pString != pEnd && isspace((unsigned char)*pString))
+    ++pString;
+  while (pEnd != pString && isspace((unsigned char)pEnd[-1]))
+    --pEnd;
+  length = (size_t)(pEnd - pString);
+
+  // Skip the optional prefix
+  if (length > {2} && format{0}Char(pString[0]) == '{3}' && format{0}Char(pString[1]) == '{4}' &&
+      format{0}Char(pString[2]) == '_') {{
+    pString += {2};
+    length -= {2};
+  }}
+
+  // 32-bit FNV-1a of the formatted name
+  uint32_t hash = 2166136261U;
+  for (size_t i = 0; i < length; ++i) {{
+    hash = (hash ^ (unsigned char)format{0}Char(pString[i])) * 16777619U;
+  }}
+
+  // Displace by the seed of the hash's bucket, then mix to find the only slot the name can be in
+  uint32_t slot = hash ^ c{0}HashSeeds[hash % {1}];
+  slot ^= slot >> 16;
+  slot *= 0x85EBCA6BU;
+  slot ^= slot >> 13;
+  slot *= 0xC2B2AE35U;
+  slot ^= slot >> 16;
+  slot %= {5};
+
+  char const *pName = c{0}HashNames[slot];
+  if (pName == NULL)
+    return false;
+  for (size_t i = 0; i < length; ++i) {{
+    if (pName[i] == '\\0' || format{0}Char(pString[i]) != pName[i])
+      return false;
+  }}
+  if (pName[length] != '\\0')
+    return false;
+
+  *pResult = ({0})c{0}HashValues[slot];
+  return true;
+}}
+""".format(enumType, len(seeds), len(prefix), prefix[0], prefix[1], len(slots)))
+
     if args.api == 'vulkan':
         outFile.write("""
 char const* vkResultToString(VkResult result) {
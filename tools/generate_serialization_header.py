@@ -10,6 +10,12 @@ import sys
 import json
 
 
+def sortVendors(vendors):
+    # Vendor tags are ordered by descending length and then by name, so that the tags of each length
+    # are a contiguous, sorted range
+    return sorted(vendors, key=lambda vendor: (-len(vendor), vendor))
+
+
 def processVendors(outFile, vendors):
     outFile.write(
         '#define cVendorCount sizeof(cVendorList) / sizeof(char const*)')
@@ -19,6 +25,30 @@ def processVendors(outFile, vendors):
     outFile.write('};\n\n')
 
 
+def processVendorGroups(outFile, vendors):
+    # Ranges of the sorted vendor tags with the same length, so that checking for a vendor suffix only
+    # needs a single binary search per distinct tag length
+    groups = []
+    for index, vendor in enumerate(vendors):
+        if groups and groups[-1][0] == len(vendor):
+            groups[-1][2] += 1
+        else:
+            groups.append([len(vendor), index, 1])
+
+    outFile.write('struct VendorGroup {\n')
+    outFile.write('  uint8_t length;\n')
+    outFile.write('  uint16_t first;\n')
+    outFile.write('  uint16_t count;\n')
+    outFile.write('};\n\n')
+    outFile.write(
+        '#define cVendorGroupCount sizeof(cVendorGroups) / sizeof(struct VendorGroup)\n')
+    outFile.write('static struct VendorGroup const cVendorGroups[{}] = {{\n'.format(len(groups)))
+    for length, first, count in groups:
+        outFile.write('  {{{}, {}, {}}}, // {}\n'.format(length, first, count,
+                                                      ' - '.join(sorted({vendors[first], vendors[first + count - 1]}))))
+    outFile.write('};\n\n')
+
+
 def processEnumValue( enum, enum_data, value, value_data):
     if 'value' in value_data:
         # Spitting out plain values
@@ -36,23 +66,300 @@ def processEnumValue( enum, enum_data, value, value_data):
         print('Error: Unhandled enum value type {}::{}'.format(enum, value))
         sys.exit(1)
 
-def processEnums(outFile, enums, vendors, first, last):
+def stripVendor(name, vendors):
+    # Mirrors the header's stripVendor, stripping the longest vendor tag suffixing the name, unless
+    # it is the whole name
+    for vendor in sortVendors(vendors):
+        if name.endswith(vendor):
+            return name if name == vendor else name[:-len(vendor)]
+    return name
+
+
+def parsePrefix(enum, vendors):
+    # The prefix that parsed value strings may start with, generated from the vendor-stripped type
+    # name by removing 'Flags'/'FlagBits', inserting an underscore before every capital letter or
+    # digit after the first character, and upper-casing the rest
+    name = stripVendor(enum, vendors)
+    flagsPos = enum.find('Flags')
+    flagBitsPos = enum.find('FlagBits')
+    prefix = ''
+    pos = 0
+    while pos < len(name):
+        if pos == flagsPos:
+            pos += len('Flags')
+        elif pos == flagBitsPos:
+            pos += len('FlagBits')
+        elif pos == 0:
+            prefix += name[pos].upper()
+            pos += 1
+        elif name[pos].isupper() or name[pos].isdigit():
+            prefix += '_' + name[pos]
+            pos += 1
+        else:
+            prefix += name[pos].upper()
+            pos += 1
+    return prefix + '_'
+
+
+def writeTable(outFile, valueType, name, rows):
+    # Rows are (value, comment) pairs, with rows without a value being written as just a comment
+    outFile.write('static {} const {}[{}] = {{\n'.format(valueType, name,
+                                                        len([row for row in rows if row[0] is not None])))
+    for value, comment in rows:
+        if value is None:
+            outFile.write('  // {}\n'.format(comment))
+        else:
+            outFile.write('  {}, // {}\n'.format(value, comment))
+    outFile.write('};\n\n')
+
+
+# Names of the shared arrays that tables are appended to when generating a string pool layout, by
+# the type of their values
+cPoolNames = {
+    'int32_t': 'cInt32Pool',
+    'uint32_t': 'cUint32Pool',
+    'uint64_t': 'cUint64Pool',
+    'uint16_t': 'cUint16Pool',
+}
+
+
+def addTable(outFile, pools, valueType, enum, table, rows):
+    # Returns the value set field initializer that refers to the table, either a pointer to a
+    # separate array, or the offset of the table in the shared pool array for its type
+    if pools is None:
+        writeTable(outFile, valueType, '{}{}'.format(enum, table), rows)
+        return '{}{}'.format(enum, table)
+
+    pool = pools.setdefault(valueType, [])
+    offset = len([row for row in pool if row[0] is not None])
+    pool.append((None, '{}{}'.format(enum, table)))
+    pool.extend(rows)
+    return str(offset)
+
+
+def writePools(outFile, pools):
+    for valueType, poolName in cPoolNames.items():
+        rows = pools.get(valueType, [])
+        if not [row for row in rows if row[0] is not None]:
+            # MSVC can't do zero-sized arrays
+            rows = [('0', 'unused')]
+        writeTable(outFile, valueType, poolName, rows)
+
+
+def processBitIndices(outFile, pools, enum, entries, bitWidth):
+    # Single-bit values are indexed by their bit position, keeping the last (preferred) name for
+    # each bit. Everything else (zero and multi-bit values) is kept in a short list searched in the
+    # same descending order the values table would be.
+    bitIndices = []
+    combinedIndices = []
+    for idx, (valueStr, value_str) in enumerate(entries):
+        value = int(value_str, 0) & ((1 << bitWidth) - 1)
+        if value != 0 and (value & (value - 1)) == 0:
+            bit = value.bit_length() - 1
+            while len(bitIndices) <= bit:
+                bitIndices.append(None)
+            bitIndices[bit] = idx
+        else:
+            combinedIndices.insert(0, idx)
+
+    tables = dict()
+    if bitIndices:
+        rows = []
+        for bit, idx in enumerate(bitIndices):
+            if idx is None:
+                rows.append(('cNoValueIndex', 'bit {}'.format(bit)))
+            else:
+                rows.append((idx, entries[idx][0]))
+        tables['bitIndices'] = addTable(outFile, pools, 'uint16_t', enum, 'BitIndices', rows)
+
+    if combinedIndices:
+        rows = [(idx, entries[idx][0]) for idx in combinedIndices]
+        tables['combinedIndices'] = addTable(outFile, pools, 'uint16_t', enum, 'CombinedIndices', rows)
+
+    tables['bitIndexCount'] = len(bitIndices)
+    tables['combinedCount'] = len(combinedIndices)
+    return tables
+
+
+# Extension enum values are 1000000000 + (ext - 1) * 1000 + offset
+cExtensionValueBase = 1000000000
+
+# Number of extension values for a set to index them by extension block, rather than sorting them
+cExtensionBlockThreshold = 256
+
+
+def processValueIndices(outFile, pools, enum, entries):
+    # Keep the first name for each value, as a linear search of the values table would find
+    firstIndices = dict()
+    for idx, (valueStr, value_str) in enumerate(entries):
+        value = int(value_str, 0)
+        if not value in firstIndices:
+            firstIndices[value] = idx
+
+    # Core values counting up from zero are typically dense enough to be directly indexed, while
+    # extension values (1000000000 + (ext - 1) * 1000 + offset) and other sparse values are sorted
+    # for a binary search
+    coreValues = [value for value in firstIndices if 0 <= value < cExtensionValueBase]
+    valueIndexCount = 0
+    if coreValues and max(coreValues) < 2 * len(coreValues):
+        valueIndexCount = max(coreValues) + 1
+
+    # Sets with many extension values (ie. VkStructureType) also directly index those, by the block
+    # of each extension and then by the offset within it
+    extensionValues = [value for value in firstIndices if value >= cExtensionValueBase]
+    extensionBlockCount = 0
+    if len(extensionValues) >= cExtensionBlockThreshold:
+        extensionBlockCount = (max(extensionValues) - cExtensionValueBase) // 1000 + 1
+    sortedValues = sorted(value for value in firstIndices
+                          if not 0 <= value < valueIndexCount and not (extensionBlockCount != 0 and value >= cExtensionValueBase))
+
+    tables = dict()
+    if valueIndexCount != 0:
+        rows = []
+        for value in range(valueIndexCount):
+            if value in firstIndices:
+                rows.append((firstIndices[value], entries[firstIndices[value]][0]))
+            else:
+                rows.append(('cNoValueIndex', value))
+        tables['valueIndices'] = addTable(outFile, pools, 'uint16_t', enum, 'ValueIndices', rows)
+
+    if sortedValues:
+        rows = [(value, entries[firstIndices[value]][0]) for value in sortedValues]
+        tables['sortedValues'] = addTable(outFile, pools, 'int32_t', enum, 'SortedValues', rows)
+
+        rows = [(firstIndices[value], entries[firstIndices[value]][0]) for value in sortedValues]
+        tables['sortedIndices'] = addTable(outFile, pools, 'uint16_t', enum, 'SortedIndices', rows)
+
+    if extensionBlockCount != 0:
+        # The table starts with the offset of each block's indices from the start of the table, plus
+        # one past the end of the last block, followed by the indices of each block's values
+        blockLengths = [0] * extensionBlockCount
+        for value in extensionValues:
+            block, offset = divmod(value - cExtensionValueBase, 1000)
+            blockLengths[block] = max(blockLengths[block], offset + 1)
+
+        rows = []
+        blockStart = extensionBlockCount + 1
+        for block in range(extensionBlockCount):
+            rows.append((blockStart, 'extension {}'.format(block + 1)))
+            blockStart += blockLengths[block]
+        rows.append((blockStart, 'end'))
+        for block in range(extensionBlockCount):
+            if blockLengths[block] != 0:
+                rows.append((None, 'extension {}'.format(block + 1)))
+            for offset in range(blockLengths[block]):
+                value = cExtensionValueBase + block * 1000 + offset
+                if value in firstIndices:
+                    rows.append((firstIndices[value], entries[firstIndices[value]][0]))
+                else:
+                    rows.append(('cNoValueIndex', value))
+        tables['extensionBlocks'] = addTable(outFile, pools, 'uint16_t', enum, 'ExtensionBlocks', rows)
+
+    tables['valueIndexCount'] = valueIndexCount
+    tables['sortedCount'] = len(sortedValues)
+    tables['extensionBlockCount'] = extensionBlockCount
+    return tables
+
+
+# Vendor tags of extensions that are not specific to a single vendor
+cMultiVendorTags = ['KHR', 'KHX', 'EXT']
+
+
+def isVendorSpecific(name, vendors):
+    # Type names end with the vendor tag, while extension names have it after the API prefix
+    if name.startswith('VK_') or name.startswith('XR_'):
+        tag = name.split('_')[1]
+        return tag in vendors and not tag in cMultiVendorTags
+    strippedName = stripVendor(name, vendors)
+    return strippedName != name and not name[len(strippedName):] in cMultiVendorTags
+
+
+def isVendorExtensionValue(value_data, vendors):
+    # Values are from vendor-specific extensions if every set of requirements that brings them in
+    # includes one
+    if not 'requires' in value_data:
+        return False
+    for require_data in value_data['requires'].values():
+        if not [define for define in require_data['defines'] if isVendorSpecific(define, vendors)]:
+            return False
+    return True
+
+
+def readTypeList(path):
+    # One type per line, with lines starting with '#' being comments
+    try:
+        file = open(path, 'r')
+        lines = file.readlines()
+    except:
+        print('Error: Could not open type list file: ', path)
+        sys.exit(1)
+
+    types = []
+    for line in lines:
+        line = line.strip()
+        if line == '' or line.startswith('#'):
+            continue
+        types.append(line)
+    return types
+
+
+def resolveTypeName(enums, name):
+    # FlagBits types share the value set of their Flags type, and aliased types that of their target
+    typeName = name
+    if not typeName in enums:
+        typeName = typeName.replace('FlagBits', 'Flags', 1)
+    if not typeName in enums:
+        print('Error: Unknown type in type list: {}'.format(name))
+        sys.exit(1)
+    while 'alias' in enums[typeName] and enums[typeName]['alias'] in enums:
+        typeName = enums[typeName]['alias']
+    return typeName
+
+
+def subsetEnums(enums, vendors, allowList, denyList, skipVendorExtensions):
+    allowed = None
+    if allowList is not None:
+        allowed = [resolveTypeName(enums, name) for name in allowList]
+    denied = []
+    if denyList is not None:
+        denied = [resolveTypeName(enums, name) for name in denyList]
+
+    subset = dict()
+    for enum, enum_data in enums.items():
+        target = enum
+        while 'alias' in enums[target] and enums[target]['alias'] in enums:
+            target = enums[target]['alias']
+
+        if allowed is not None and not target in allowed:
+            continue
+        if target in denied:
+            continue
+        if skipVendorExtensions and (isVendorSpecific(enum, vendors) or isVendorSpecific(target, vendors)):
+            continue
+        subset[enum] = enum_data
+    return subset
+
+
+def processEnums(outFile, pools, enums, vendors, first, last, skipVendorExtensions):
+    enumTables = dict()
+
     for enum, enum_data in enums.items():
-        # Skip VkResult
-        if enum == 'VkResult' or enum == 'VkStructureType' or 'alias' in enum_data:
+        # Skip VkResult, which has its own headers
+        if enum == 'VkResult' or 'alias' in enum_data:
             continue
         # Skip if there's no values, MSVC can't do zero-sized arrays
         if not 'values' in enum_data:
             continue
 
-        names = 'static char const *const {}Strings[{}] = {{\n'.format(enum, len(enum_data['values']))
-        values = 'static int32_t const {}Values[{}] = {{\n'.format(enum, len(enum_data['values']))
-
+        valueType = 'int32_t'
+        bitWidth = 0
         if 'type' in enum_data:
           if enum_data['type'] == 'VkFlags':
-            values = 'static uint32_t const {}Values[{}] = {{\n'.format(enum, len(enum_data['values']))
+            valueType = 'uint32_t'
+            bitWidth = 32
           elif enum_data['type'] == 'VkFlags64':
-            values = 'static uint64_t const {}Values[{}] = {{\n'.format(enum, len(enum_data['values']))
+            valueType = 'uint64_t'
+            bitWidth = 64
           else:
             print('Error: Unhandled enum type: '.format(enum_data['type']))
             sys.exit(1)
@@ -89,63 +396,312 @@ def processEnums(outFile, enums, vendors, first, last):
             mainPrefix += typeDigit
             mainPrefix += '_'
 
-        # items with alias first
-        current = first
-        while current <= last:
-            for value, value_data in enum_data['values'].items():
-                if not 'alias' in value_data:
-                    continue
-                if value_data['first'] != current:
-                    continue
-                value_str = processEnumValue(enum, enum_data, value, value_data)
-                if not value_str:
-                  continue
-
-                valueStr = value
-                if valueStr.startswith(mainPrefix):
-                    valueStr = valueStr[len(mainPrefix):]
-                if vendorName != '' and valueStr.endswith(vendorName):
-                    valueStr = valueStr[:-len(vendorName)-1]
-                if valueStr.endswith('_BIT'):
-                    valueStr = valueStr[:-4]
-
-                # Name
-                names += '  \"{}\", // {}\n'.format(valueStr, value_str)
-                # Value
-                values += '  {}, // {}\n'.format(value_str, valueStr)
-            current += 1
-
-        # items without alias last
-        current = first
-        while current <= last:
-            for value, value_data in enum_data['values'].items():
-                if 'alias' in value_data:
-                    continue
-                if value_data['first'] != current:
-                    continue
-                value_str = processEnumValue(enum, enum_data, value, value_data)
-                if not value_str:
-                  continue
-
-                valueStr = value
-                if valueStr.startswith(mainPrefix):
-                    valueStr = valueStr[len(mainPrefix):]
-                if vendorName != '' and valueStr.endswith(vendorName):
-                    valueStr = valueStr[:-len(vendorName)-1]
-                if valueStr.endswith('_BIT'):
-                    valueStr = valueStr[:-4]
-
-                # Name
-                names += '  \"{}\", // {}\n'.format(valueStr, value_str)
-                # Value
-                values += '  {}, // {}\n'.format(value_str, valueStr)
-            current += 1
-
-        names += '};\n\n'
-        values += '};\n\n'
-
-        outFile.write(names)
-        outFile.write(values)
+        # (short name, value string) pairs, in table order
+        entries = []
+
+        # items with alias first, then items without alias last
+        for aliasPass in [True, False]:
+            current = first
+            while current <= last:
+                for value, value_data in enum_data['values'].items():
+                    if ('alias' in value_data) != aliasPass:
+                        continue
+                    if value_data['first'] != current:
+                        continue
+                    if skipVendorExtensions and isVendorExtensionValue(value_data, vendors):
+                        continue
+                    value_str = processEnumValue(enum, enum_data, value, value_data)
+                    if not value_str:
+                      continue
+
+                    valueStr = value
+                    if valueStr.startswith(mainPrefix):
+                        valueStr = valueStr[len(mainPrefix):]
+                    if vendorName != '' and valueStr.endswith(vendorName):
+                        valueStr = valueStr[:-len(vendorName)-1]
+                    if valueStr.endswith('_BIT'):
+                        valueStr = valueStr[:-4]
+
+                    entries.append((valueStr, value_str))
+                current += 1
+
+        # Aliases of values outside of the set can leave nothing to output
+        if not entries:
+            continue
+
+        tables = dict()
+        tables['count'] = len(entries)
+        tables['names'] = [valueStr for valueStr, value_str in entries]
+        if pools is None:
+            # In the string pool layout, names are written with the rest of the strings
+            writeTable(outFile, 'char const *', '{}Strings'.format(enum),
+                       [('"{}"'.format(valueStr), value_str) for valueStr, value_str in entries])
+        tables['values'] = addTable(outFile, pools, valueType, enum, 'Values',
+                                    [(value_str, valueStr) for valueStr, value_str in entries])
+
+        if bitWidth != 0:
+            tables.update(processBitIndices(outFile, pools, enum, entries, bitWidth))
+        else:
+            tables.update(processValueIndices(outFile, pools, enum, entries))
+
+        enumTables[enum] = tables
+
+    return enumTables
+
+
+def processStringPool(outFile, enums, vendors, enumTables):
+    # All strings are kept in one struct of character arrays, with a member for the vendors and for
+    # each value set, so that they can be referred to by offset rather than needing pointers that
+    # each have to be relocated when loaded as part of a shared library
+    members = [('vendors', list(vendors))]
+    for enum, enum_data in enums.items():
+        if enum == 'VkResult' or 'alias' in enum_data:
+            continue
+        strings = [enum, parsePrefix(enum, vendors)]
+        if enum in enumTables:
+            strings += enumTables[enum]['names']
+        members.append((enum, strings))
+
+    outFile.write('struct StringPool {\n')
+    for member, strings in members:
+        outFile.write('  char {}[{}];\n'.format(member, sum(len(string) + 1 for string in strings)))
+    outFile.write('};\n\n')
+
+    # Each string is a separate literal so that the null terminators can't merge with the next
+    # character, with the last one using the literal's own terminator
+    outFile.write('static struct StringPool const cStringPool = {\n')
+    for member, strings in members:
+        outFile.write('  // {}\n'.format(member))
+        for string in strings[:-1]:
+            outFile.write('  "{}\\0"\n'.format(string))
+        outFile.write('  "{}",\n'.format(strings[-1]))
+    outFile.write('};\n\n')
+
+    # Vendors, relative to the vendors member
+    offsets = []
+    offset = 0
+    for vendor in vendors:
+        offsets.append((offset, vendor))
+        offset += len(vendor) + 1
+    writeTable(outFile, 'uint16_t', 'cVendorOffsets', offsets)
+    outFile.write('#define cVendorCount sizeof(cVendorOffsets) / sizeof(uint16_t)\n\n')
+
+    # Value names, relative to the start of the value set's member
+    offsets = []
+    lengths = []
+    nameCount = 0
+    for member, strings in members[1:]:
+        offset = len(strings[0]) + 1
+        enumTables.setdefault(member, dict())['prefix'] = offset
+        offset += len(strings[1]) + 1
+        if not member in enumTables or not 'names' in enumTables[member]:
+            continue
+        enumTables[member]['valueNames'] = nameCount
+        nameCount += len(strings) - 2
+        offsets.append((None, member))
+        lengths.append((None, member))
+        for name in strings[2:]:
+            offsets.append((offset, name))
+            lengths.append((len(name), name))
+            offset += len(name) + 1
+    writeTable(outFile, 'uint16_t', 'cValueNameOffsets', offsets)
+    writeTable(outFile, 'uint16_t', 'cValueNameLengths', lengths)
+
+
+def processValueSetBindings(outFile, enums):
+    # Indices follow the order of the cValueSets array
+    indices = dict()
+    for enum, enum_data in enums.items():
+        if enum == 'VkResult' or 'alias' in enum_data:
+            continue
+        indices[enum] = len(indices)
+
+    outFile.write("""
+#ifdef __cplusplus
+namespace vk_value_set {
+
+/**
+ * @brief Compile-time binding of a Vulkan enumerator/flag type to its value set
+ * @tparam Index is the index of the type's value set, as used with vk_get_value_set_at
+ * @tparam T is the underlying integer type of the Vulkan type's values
+ */
+template <uint32_t Index, typename T>
+struct Binding {
+  static constexpr uint32_t cIndex = Index;
+  using ValueType = T;
+};
+
+""")
+    for enum, index in indices.items():
+        valueType = 'int32_t'
+        if enums[enum].get('type') == 'VkFlags':
+            valueType = 'uint32_t'
+        elif enums[enum].get('type') == 'VkFlags64':
+            valueType = 'uint64_t'
+        outFile.write('using {} = Binding<{}, {}>;\n'.format(enum, index, valueType))
+        if 'Flags' in enum:
+            outFile.write('using {} = {};\n'.format(enum.replace('Flags', 'FlagBits', 1), enum))
+
+    # Aliased type names, such as those of promoted extensions
+    for enum, enum_data in enums.items():
+        if not 'alias' in enum_data:
+            continue
+        target = enum_data['alias']
+        while target in enums and 'alias' in enums[target]:
+            target = enums[target]['alias']
+        if not target in indices:
+            continue
+        outFile.write('using {} = {};\n'.format(enum, target))
+        if 'Flags' in enum:
+            outFile.write('using {} = {};\n'.format(enum.replace('Flags', 'FlagBits', 1), target))
+
+    outFile.write("""
+} // namespace vk_value_set
+#endif
+""")
+
+
+# Value sets referring to their strings and tables by pointer
+cPointerValueSetDefinition = """
+struct STecVkValueSet {
+  char const *name;
+  char const *prefix;
+  char const *const *valueNames;
+  void const *values;
+  uint32_t count;
+  EnumType type;
+  uint16_t const *bitIndices;
+  uint32_t bitIndexCount;
+  uint16_t const *combinedIndices;
+  uint32_t combinedCount;
+  uint16_t const *valueIndices;
+  uint32_t valueIndexCount;
+  int32_t const *sortedValues;
+  uint16_t const *sortedIndices;
+  uint32_t sortedCount;
+  uint16_t const *extensionBlocks;
+  uint32_t extensionBlockCount;
+};
+
+typedef struct STecVkValueSet ValueSet;
+
+static char const *getVendor(size_t index) { return cVendorList[index]; }
+
+static char const *getValueSetName(ValueSet const *pValueSet) { return pValueSet->name; }
+
+static char const *getValueSetPrefix(ValueSet const *pValueSet) { return pValueSet->prefix; }
+
+static char const *getValueName(ValueSet const *pValueSet, size_t index) {
+  return pValueSet->valueNames[index];
+}
+
+static uint32_t getValueNameLength(ValueSet const *pValueSet, size_t index) {
+  return (uint32_t)strlen(pValueSet->valueNames[index]);
+}
+
+static void const *getValues(ValueSet const *pValueSet) { return pValueSet->values; }
+
+static uint16_t const *getBitIndices(ValueSet const *pValueSet) { return pValueSet->bitIndices; }
+
+static uint16_t const *getCombinedIndices(ValueSet const *pValueSet) {
+  return pValueSet->combinedIndices;
+}
+
+static uint16_t const *getValueIndices(ValueSet const *pValueSet) {
+  return pValueSet->valueIndices;
+}
+
+static int32_t const *getSortedValues(ValueSet const *pValueSet) {
+  return pValueSet->sortedValues;
+}
+
+static uint16_t const *getSortedIndices(ValueSet const *pValueSet) {
+  return pValueSet->sortedIndices;
+}
+
+static uint16_t const *getExtensionBlocks(ValueSet const *pValueSet) {
+  return pValueSet->extensionBlocks;
+}
+"""
+
+# Value sets referring to their strings and tables by offsets into the shared pools
+cPoolValueSetDefinition = """
+struct STecVkValueSet {
+  uint32_t strings; // Offset of the value set's strings in cStringPool, starting with its name
+  uint16_t prefix;  // Offset of the prefix from the value set's strings
+  uint32_t valueNames; // Index of the first name in cValueNameOffsets/cValueNameLengths
+  uint32_t values;     // Index of the first value in the pool for the value set's type
+  uint32_t count;
+  EnumType type;
+  uint32_t bitIndices; // Indices into cUint16Pool
+  uint32_t bitIndexCount;
+  uint32_t combinedIndices;
+  uint32_t combinedCount;
+  uint32_t valueIndices;
+  uint32_t valueIndexCount;
+  uint32_t sortedValues; // Index into cInt32Pool
+  uint32_t sortedIndices;
+  uint32_t sortedCount;
+  uint32_t extensionBlocks; // Index into cUint16Pool
+  uint32_t extensionBlockCount;
+};
+
+typedef struct STecVkValueSet ValueSet;
+
+static char const *getVendor(size_t index) { return cStringPool.vendors + cVendorOffsets[index]; }
+
+static char const *getValueSetName(ValueSet const *pValueSet) {
+  return (char const *)&cStringPool + pValueSet->strings;
+}
+
+static char const *getValueSetPrefix(ValueSet const *pValueSet) {
+  return getValueSetName(pValueSet) + pValueSet->prefix;
+}
+
+static char const *getValueName(ValueSet const *pValueSet, size_t index) {
+  return getValueSetName(pValueSet) + cValueNameOffsets[pValueSet->valueNames + index];
+}
+
+static uint32_t getValueNameLength(ValueSet const *pValueSet, size_t index) {
+  return cValueNameLengths[pValueSet->valueNames + index];
+}
+
+static void const *getValues(ValueSet const *pValueSet) {
+  switch (pValueSet->type) {
+  case ENUM_TYPE_ENUM:
+    return cInt32Pool + pValueSet->values;
+  case ENUM_TYPE_FLAG32:
+    return cUint32Pool + pValueSet->values;
+  case ENUM_TYPE_FLAG64:
+    return cUint64Pool + pValueSet->values;
+  }
+  return NULL;
+}
+
+static uint16_t const *getBitIndices(ValueSet const *pValueSet) {
+  return cUint16Pool + pValueSet->bitIndices;
+}
+
+static uint16_t const *getCombinedIndices(ValueSet const *pValueSet) {
+  return cUint16Pool + pValueSet->combinedIndices;
+}
+
+static uint16_t const *getValueIndices(ValueSet const *pValueSet) {
+  return cUint16Pool + pValueSet->valueIndices;
+}
+
+static int32_t const *getSortedValues(ValueSet const *pValueSet) {
+  return cInt32Pool + pValueSet->sortedValues;
+}
+
+static uint16_t const *getSortedIndices(ValueSet const *pValueSet) {
+  return cUint16Pool + pValueSet->sortedIndices;
+}
+
+static uint16_t const *getExtensionBlocks(ValueSet const *pValueSet) {
+  return cUint16Pool + pValueSet->extensionBlocks;
+}
+"""
 
 
 def main(argv):
@@ -156,6 +712,16 @@ def main(argv):
     parser.add_argument('-o', '--output',
                         help='Output file to write to',
                         required=True)
+    parser.add_argument('--string-pool',
+                        help='Store all strings and tables in shared pools referred to by offset, rather than by pointer, so that no relocations are needed for them',
+                        action='store_true')
+    parser.add_argument('--allow-list',
+                        help='File listing the only types to generate value sets for, one per line')
+    parser.add_argument('--deny-list',
+                        help='File listing types to not generate value sets for, one per line')
+    parser.add_argument('--skip-vendor-extensions',
+                        help='Skip types and values only provided by vendor-specific (non-KHR/EXT) extensions',
+                        action='store_true')
     args = parser.parse_args()
 
     try:
@@ -168,6 +734,17 @@ def main(argv):
     firstVersion = apiData['api']['first']
     lastVersion = apiData['api']['last']
 
+    # Reduce the generated value sets to those requested
+    if args.allow_list or args.deny_list or args.skip_vendor_extensions:
+        allowList = None
+        if args.allow_list:
+            allowList = readTypeList(args.allow_list)
+        denyList = None
+        if args.deny_list:
+            denyList = readTypeList(args.deny_list)
+        apiData['enums'] = subsetEnums(apiData['enums'], apiData['vendors'], allowList, denyList,
+                                       args.skip_vendor_extensions)
+
     outFile = open(args.output, "w")
 
     # Common Header
@@ -185,6 +762,14 @@ def main(argv):
    
     so that the definitions are compiled somewhere following the one definition rule, either from
     this header *OR* the vk_value_serialization.hpp header.
+
+    Optionally, also define on that compilation unit:
+    #define VK_VALUE_SERIALIZATION_CONFIG_CACHE
+
+    to have each thread keep a small cache of recently serialized values, so that serializing the
+    same value of the same type again is just a copy of the cached string. The number of entries
+    and the longest string cached can be changed by defining VK_VALUE_SERIALIZATION_CACHE_SIZE
+    (default 64) and VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE (default 128).
 */
 
 #ifdef __cplusplus
@@ -338,21 +923,162 @@ STecVkSerializationResult vk_parse64(char const *pVkType,
                                      char const *pVkString,
                                      void *pParsedValue);
 
+/// Opaque handle to the set of values of a single Vulkan enumerator/flag type
+typedef struct STecVkValueSet STecVkValueSet;
+
+/**
+ * @brief Finds the value set for a Vulkan enumerator/flag type
+ * @param pVkType is a pointer to the string name of the Vulkan enumerator/flag type
+ * @return Pointer to the type's value set, or NULL if the type could not be determined or found.
+ *
+ * The returned value set is valid for the lifetime of the program, and can be used with the
+ * vk_serialize_set32/64 and vk_parse_set32/64 functions to skip resolving the type name on every
+ * call.
+ */
+STecVkValueSet const *vk_get_value_set(char const *pVkType);
+
+/**
+ * @brief Returns the value set at the given index
+ * @param index is the index of the value set
+ * @return Pointer to the value set, or NULL if the index is out of range.
+ *
+ * The indices of each type's value set are fixed for a given version of this header, and are
+ * available at compile-time in C++ via the vk_value_set namespace.
+ */
+STecVkValueSet const *vk_get_value_set_at(uint32_t index);
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type (32-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param vkValue is the numeric value being serialized
+ * @param pSerializedLength is a pointer to an integer related to the size of pSerialized, as
+ * described in vk_serialize32.
+ * @param pSerialized is either NULL or a pointer to an character array.
+ *
+ * Behaves the same as vk_serialize32, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_serialize_set32(STecVkValueSet const *pValueSet,
+                                             uint32_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized);
+
+/**
+ * @brief Serializes a Vulkan enumerator/flag type (64-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param vkValue is the numeric value being serialized
+ * @param pSerializedLength is a pointer to an integer related to the size of pSerialized, as
+ * described in vk_serialize64.
+ * @param pSerialized is either NULL or a pointer to an character array.
+ *
+ * Behaves the same as vk_serialize64, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_serialize_set64(STecVkValueSet const *pValueSet,
+                                             uint64_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (32-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse32, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_parse_set32(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (64-bit) using a value set
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse64, except that if pValueSet is NULL, then
+ * STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND is returned.
+ */
+STecVkSerializationResult vk_parse_set64(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (32-bit) of a given length
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed, which doesn't need to be
+ * null-terminated
+ * @param stringLength is the number of characters of pVkString to parse
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse_set32. The string is parsed in place, and is neither copied nor
+ * modified.
+ */
+STecVkSerializationResult vk_parse_set_n32(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue);
+
+/**
+ * @brief Parses a Vulkan enumerator/flag serialized string (64-bit) of a given length
+ * @param pValueSet is a pointer to the value set of the Vulkan enumerator/flag type
+ * @param pVkString is a pointer to the string being parsed, which doesn't need to be
+ * null-terminated
+ * @param stringLength is the number of characters of pVkString to parse
+ * @param pParsedValue is a pointer to a value that will be modified with the parsed value. Only
+ * modified if STEC_VK_SERIALIZATION_RESULT_SUCCESS is returned.
+ *
+ * Behaves the same as vk_parse_set64. The string is parsed in place, and is neither copied nor
+ * modified.
+ */
+STecVkSerializationResult vk_parse_set_n64(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue);
+
 """)
 
     # Definition Start
     outFile.write("\n#ifdef VK_VALUE_SERIALIZATION_CONFIG_MAIN\n")
-    outFile.write("#include <assert.h>\n")
     outFile.write("#include <ctype.h>\n")
     outFile.write("#include <stdbool.h>\n")
-    outFile.write("#include <stdlib.h>\n")
-    outFile.write("#include <string.h>\n\n")
+    if args.string_pool:
+        outFile.write("#include <stddef.h>\n")
+    outFile.write("#include <string.h>\n")
+    outFile.write("#ifdef _MSC_VER\n")
+    outFile.write("#include <intrin.h>\n")
+    outFile.write("#endif\n\n")
+
+    # Sentinel for bit positions without a single-bit value
+    outFile.write("#define cNoValueIndex 0xFFFF\n\n")
+
+    # Start of the extension enum values
+    outFile.write("#define cExtensionValueBase {}\n\n".format(cExtensionValueBase))
+
+    if args.string_pool:
+        # Enums, with tables appended to the shared pools
+        pools = dict()
+        enumTables = processEnums(outFile, pools, apiData['enums'], apiData['vendors'], firstVersion, lastVersion,
+                                  args.skip_vendor_extensions)
+        writePools(outFile, pools)
+
+        # Vendors and all other strings
+        processStringPool(outFile, apiData['enums'], sortVendors(apiData['vendors']), enumTables)
+    else:
+        # Vendors
+        processVendors(outFile, sortVendors(apiData['vendors']))
 
-    # Vendors
-    processVendors(outFile, apiData['vendors'])
+        # Enums
+        enumTables = processEnums(outFile, None, apiData['enums'], apiData['vendors'], firstVersion, lastVersion,
+                                  args.skip_vendor_extensions)
 
-    # Enums
-    processEnums(outFile, apiData['enums'], apiData['vendors'], firstVersion, lastVersion)
+    # Vendor tags grouped by length
+    processVendorGroups(outFile, sortVendors(apiData['vendors']))
 
     # Enum Type Declaration
     outFile.write("""
@@ -361,20 +1087,17 @@ typedef enum EnumType {
   ENUM_TYPE_FLAG32,
   ENUM_TYPE_FLAG64,
 } EnumType;
-
-typedef struct ValueSet {
-  char const *name;
-  char const *const *valueNames;
-  void const *values;
-  uint32_t count;
-  EnumType type;
-} ValueSet;
 """)
 
+    if args.string_pool:
+        outFile.write(cPoolValueSetDefinition)
+    else:
+        outFile.write(cPointerValueSetDefinition)
+
     # Enum Pointer Array
     usefulEnumCount = 0
     for enum, enum_data in apiData['enums'].items():
-        if enum == 'VkResult' or enum == 'VkStructureType' or 'alias' in enum_data:
+        if enum == 'VkResult' or 'alias' in enum_data:
             continue
         usefulEnumCount += 1
 
@@ -383,7 +1106,7 @@ static const uint32_t cValueSetCount = {0};
 static ValueSet const cValueSets[{0}] = {{
 """.format(usefulEnumCount))
     for enum, enum_data in apiData['enums'].items():
-        if enum == 'VkResult' or enum == 'VkStructureType' or 'alias' in enum_data:
+        if enum == 'VkResult' or 'alias' in enum_data:
             continue
 
         enum_type = 'ENUM_TYPE_ENUM'
@@ -396,18 +1119,91 @@ static ValueSet const cValueSets[{0}] = {{
             print('Error: Unhandled enum type: '.format(enum_data['type']))
             sys.exit(1)
 
-        valueCount = 0
-        if 'values' in enum_data:
-          valueCount = len(enum_data['values'])
-        if valueCount == 0:
-            outFile.write('  {{"{}", NULL, NULL, 0, {}}},\n'.format(enum, enum_type))
+        # Tables that aren't there are either NULL or at offset 0 with no entries
+        noTable = '0' if args.string_pool else 'NULL'
+        tables = enumTables.get(enum, dict())
+        if args.string_pool:
+            strings = 'offsetof(struct StringPool, {})'.format(enum)
+            prefix = tables['prefix']
+            valueNames = tables.get('valueNames', 0)
         else:
-            outFile.write('  {{"{0}", {0}Strings, {0}Values, {1}, {2}}},\n'.format(
-                enum, valueCount, enum_type))
+            strings = '"{}"'.format(enum)
+            prefix = '"{}"'.format(parsePrefix(enum, apiData['vendors']))
+            valueNames = '{}Strings'.format(enum) if 'names' in tables else 'NULL'
+        outFile.write('  {{{}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}, {}}},\n'.format(
+            strings, prefix, valueNames, tables.get('values', noTable), tables.get('count', 0), enum_type,
+            tables.get('bitIndices', noTable), tables.get('bitIndexCount', 0),
+            tables.get('combinedIndices', noTable), tables.get('combinedCount', 0),
+            tables.get('valueIndices', noTable), tables.get('valueIndexCount', 0),
+            tables.get('sortedValues', noTable), tables.get('sortedIndices', noTable), tables.get('sortedCount', 0),
+            tables.get('extensionBlocks', noTable), tables.get('extensionBlockCount', 0)))
     outFile.write('};\n')
 
     # Function definitions
     outFile.write("""
+/**
+ * @brief Formats a character of a string being parsed to match those found in the XML spec
+ * @param ch is the character to format
+ * @return Spaces are returned as underscores, and all other characters are capitalized.
+ */
+static char formatChar(char ch) {
+  if (ch == ' ')
+    return '_';
+  return (char)toupper((unsigned char)ch);
+}
+
+/**
+ * @brief Compares the end of a string against a vendor tag of the same length
+ * @param str is a pointer to the possible vendor tag at the end of the string
+ * @param pVendor is a pointer to the vendor tag
+ * @param length is the length of the vendor tag
+ * @param formatted is whether the string is compared as formatted
+ * @return Less than, equal to, or greater than zero if the string sorts before, matches, or sorts
+ * after the vendor tag.
+ */
+static int compareVendor(char const *str, char const *pVendor, size_t length, bool formatted) {
+  for (size_t i = 0; i < length; ++i) {
+    char const ch = formatted ? formatChar(str[i]) : str[i];
+    if (ch != pVendor[i])
+      return ((unsigned char)ch < (unsigned char)pVendor[i]) ? -1 : 1;
+  }
+
+  return 0;
+}
+
+/**
+ * @brief Finds the vendor tag at the end of a string
+ * @param str is the string to check
+ * @param len is the current length of the string being used
+ * @param formatted is whether the string is compared as formatted
+ * @return Length of the longest vendor tag that the string ends with, or 0 if there is none.
+ *
+ * Vendor tags are grouped by length, so each distinct length is a single binary search.
+ */
+static size_t findVendorSuffix(char const *str, size_t len, bool formatted) {
+  for (size_t i = 0; i < cVendorGroupCount; ++i) {
+    size_t const vendorLen = cVendorGroups[i].length;
+    if (vendorLen > len)
+      continue;
+
+    char const *suffix = str + len - vendorLen;
+    size_t low = cVendorGroups[i].first;
+    size_t high = low + cVendorGroups[i].count;
+    while (low < high) {
+      size_t const mid = low + (high - low) / 2;
+      int const cmp = compareVendor(suffix, getVendor(mid), vendorLen, formatted);
+      if (cmp == 0)
+        return vendorLen;
+      if (cmp < 0)
+        high = mid;
+      else
+        low = mid + 1;
+    }
+  }
+
+  return 0;
+}
+
 /**
  * @brief Removes a vendor tag from the end of the given string view
  * @param str string to chop the vendor tag from
@@ -416,34 +1212,60 @@ static ValueSet const cValueSets[{0}] = {{
  * originally passed in.
  */
 static size_t stripVendor(char const *str, size_t len) {
-  for (size_t i = 0; i < cVendorCount; ++i) {
-    char const *it = cVendorList[i];
-    if (strlen(it) > len)
-      continue;
+  size_t const vendorLen = findVendorSuffix(str, len, false);
 
-    // Don't strip if it's all that's left
-    if (len == strlen(it) && strncmp(str, it, len) == 0)
-      break;
+  // Don't strip if it's all that's left
+  if (vendorLen == len)
+    return len;
 
-    if (strncmp(str + len - strlen(it), it, strlen(it)) == 0) {
-      len -= strlen(it);
-      break;
-    }
+  return len - vendorLen;
+}
+
+/**
+ * @brief Compares a string being parsed against a string from the XML spec
+ * @param pParseStr is a pointer to the string being parsed, which is compared as formatted
+ * @param pSpecStr is a pointer to the spec string, which must be at least length characters long
+ * @param length is the number of characters to compare
+ * @return True if all the formatted characters match, false otherwise.
+ *
+ * This allows parsing strings in place, without needing to copy and format them first.
+ */
+static bool formattedEquals(char const *pParseStr, char const *pSpecStr, size_t length) {
+  for (size_t i = 0; i < length; ++i) {
+    if (formatChar(pParseStr[i]) != pSpecStr[i])
+      return false;
   }
 
-  return len;
+  return true;
 }
 
 /**
- * @brief Strips '_BIT' from the end of a string, if there
- * @param str string to chop the vendor tag from
+ * @brief Removes a vendor tag from the end of the given string being parsed
+ * @param str string to chop the vendor tag from, compared as formatted
+ * @param size is the current length of the string being used
+ * @return Length of the string without the vendor tag, if it was suffixed, otherwise the size
+ * originally passed in.
+ */
+static size_t stripFormattedVendor(char const *str, size_t len) {
+  size_t const vendorLen = findVendorSuffix(str, len, true);
+
+  // Don't strip if it's all that's left
+  if (vendorLen == len)
+    return len;
+
+  return len - vendorLen;
+}
+
+/**
+ * @brief Strips '_BIT' from the end of a string being parsed, if there
+ * @param str string to chop the vendor tag from, compared as formatted
  * @param size is the current length of the string being used
  * @return Length of the string without the '_BIT'' tag, if it was suffixed, otherwise the size
  * originally passed in.
  */
 static size_t stripBit(char const *str, size_t len) {
   if (len > strlen("_BIT")) {
-    if (strncmp(str + len - strlen("_BIT"), "_BIT", strlen("_BIT")) == 0) {
+    if (formattedEquals(str + len - strlen("_BIT"), "_BIT", strlen("_BIT"))) {
       len -= strlen("_BIT");
     }
   }
@@ -485,7 +1307,7 @@ static ValueSet const *getValueSet(char const *pVkType) {
   // Try the original name (with flagbits -> flags)
   for (size_t i = 0; i < cValueSetCount; ++i) {
     ValueSet const *it = &cValueSets[i];
-    if (strcmp(localStr, it->name) == 0) {
+    if (strcmp(localStr, getValueSetName(it)) == 0) {
       return it;
     }
   }
@@ -494,7 +1316,7 @@ static ValueSet const *getValueSet(char const *pVkType) {
   localStr[stripVendor(localStr, localLen)] = '\\0';
   for (size_t i = 0; i < cValueSetCount; ++i) {
     ValueSet const *it = &cValueSets[i];
-    if (strcmp(localStr, it->name) == 0) {
+    if (strcmp(localStr, getValueSetName(it)) == 0) {
       return it;
     }
   }
@@ -502,52 +1324,9 @@ static ValueSet const *getValueSet(char const *pVkType) {
   return NULL;
 }
 
-/**
- * @brief Converts a Vulkan Flag typename into the prefix that is used for it's enums
- * @param pTypeName is the type to generate the Vulkan enum prefix for
- * @param nameLength is the length of the type name
- * @return Generated prefix string, the ownership of which passes to the caller
- *
- * Any capitalized letters except for the first has an underscore inserted before it, an underscore
- * is added to the end, and all characters are converted to upper case.
- *
- * It also removed the 'Flags' or 'FlagBits' suffixes.
- */
-static char const *generateEnumPrefix(char const *pTypeName, size_t nameLength) {
-  // Flag Bits
-  char const *pFlags = strstr(pTypeName, "Flags");
-  // Flags
-  char const *pFlagBits = strstr(pTypeName, "FlagBits");
-
-  char *pPrefixStr = (char *)malloc(nameLength * 2);
-  char *pDst = pPrefixStr;
-  for (char const *ch = pTypeName; ch < pTypeName + nameLength;) {
-    if (ch == pFlags) {
-      ch += strlen("Flags");
-    } else if (ch == pFlagBits) {
-      ch += strlen("FlagBits");
-    } else if (ch == pTypeName) {
-      *pDst++ = toupper(*ch);
-      ++ch;
-    } else if (isupper(*ch) || isdigit(*ch)) {
-      *pDst++ = '_';
-      *pDst++ = *ch;
-      ++ch;
-    } else {
-      *pDst++ = toupper(*ch);
-      ++ch;
-    }
-  }
-  *pDst++ = '_';
-  *pDst = '\\0';
-  assert(pDst < pPrefixStr + (nameLength * 2));
-
-  return pPrefixStr;
-}
-
 /**
  * @brief Finds the corresponding value for the given string
- * @param pValueStr is a pointer to the string representing the value
+ * @param pValueStr is a pointer to the string representing the value, compared as formatted
  * @param valueLength is the length of the pValueStr string
  * @param pPrefixStr is a pointer to a pre-determined prefix string that the value may have
  * @param prefixLength is the length of the pPrefixStr string
@@ -566,26 +1345,25 @@ static bool parseValue(char const *pValueStr,
                        ValueSet const *pValueSet,
                        void *pParsedValue) {
   // Check if there's a matching prefix
-  if (valueLength >= prefixLength && strncmp(pValueStr, pPrefixStr, prefixLength) == 0) {
+  if (valueLength >= prefixLength && formattedEquals(pValueStr, pPrefixStr, prefixLength)) {
     // There is, limit the searching scope to the part *after* the prefix
     pValueStr += prefixLength;
     valueLength -= prefixLength;
   }
 
   // Try the initial value
-  char const *const *const pSearchEnd = pValueSet->valueNames + pValueSet->count;
-  for (char const *const *pStart = pValueSet->valueNames; pStart != pSearchEnd; ++pStart) {
-    if (valueLength == strlen(*pStart) && strncmp(pValueStr, *pStart, valueLength) == 0) {
-      size_t const offset = pStart - pValueSet->valueNames;
+  for (size_t offset = 0; offset < pValueSet->count; ++offset) {
+    if (valueLength == getValueNameLength(pValueSet, offset) &&
+        formattedEquals(pValueStr, getValueName(pValueSet, offset), valueLength)) {
       switch (pValueSet->type) {
       case ENUM_TYPE_ENUM:
-        *(int32_t *)pParsedValue |= ((int32_t *)pValueSet->values)[offset];
+        *(int32_t *)pParsedValue |= ((int32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pParsedValue |= ((uint32_t *)pValueSet->values)[offset];
+        *(uint32_t *)pParsedValue |= ((uint32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pParsedValue |= ((uint64_t *)pValueSet->values)[offset];
+        *(uint64_t *)pParsedValue |= ((uint64_t const *)getValues(pValueSet))[offset];
         break;
       }
       return true;
@@ -593,25 +1371,25 @@ static bool parseValue(char const *pValueStr,
   }
 
   // Remove the vendor tag suffix if it's on the value
-  valueLength = stripVendor(pValueStr, valueLength);
-  if (valueLength > 0 && pValueStr[valueLength - 1] == '_')
+  valueLength = stripFormattedVendor(pValueStr, valueLength);
+  if (valueLength > 0 && formatChar(pValueStr[valueLength - 1]) == '_')
     --valueLength;
 
   // Remove '_BIT' if it's there
   valueLength = stripBit(pValueStr, valueLength);
 
-  for (char const *const *pStart = pValueSet->valueNames; pStart != pSearchEnd; ++pStart) {
-    if (valueLength == strlen(*pStart) && strncmp(pValueStr, *pStart, valueLength) == 0) {
-      size_t const offset = pStart - pValueSet->valueNames;
+  for (size_t offset = 0; offset < pValueSet->count; ++offset) {
+    if (valueLength == getValueNameLength(pValueSet, offset) &&
+        formattedEquals(pValueStr, getValueName(pValueSet, offset), valueLength)) {
       switch (pValueSet->type) {
       case ENUM_TYPE_ENUM:
-        *(int32_t *)pParsedValue |= ((int32_t *)pValueSet->values)[offset];
+        *(int32_t *)pParsedValue |= ((int32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pParsedValue |= ((uint32_t *)pValueSet->values)[offset];
+        *(uint32_t *)pParsedValue |= ((uint32_t const *)getValues(pValueSet))[offset];
         break;
       case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pParsedValue |= ((uint64_t *)pValueSet->values)[offset];
+        *(uint64_t *)pParsedValue |= ((uint64_t const *)getValues(pValueSet))[offset];
         break;
       }
       return true;
@@ -622,38 +1400,30 @@ static bool parseValue(char const *pValueStr,
 }
 
 /**
- * @brief Takes a given string and formats it for use with parsing
+ * @brief Trims a given string for use with parsing
  * @param ppStart is a double-pointer to the start of the string, which can be moved
  * @param pEnd is a pointer to the current end of the string
- * @return Pointer to the new end of the formatted string
+ * @return Pointer to the new end of the trimmed string
  *
- * First, any non alphanumeric characters are trimmed from both ends of the string.
- * After than, any spaces are replaced with underscores, and finally all the characters are
- * capitalized. This will generate the string closest to the original ones found in the XML spec.
+ * Any non alphanumeric characters are trimmed from both ends of the string. The remaining
+ * characters are left as-is, and are formatted as they are compared (see formatChar).
  */
-static char *formatString(char **ppStart, char *pEnd) {
+static char const *trimString(char const **ppStart, char const *pEnd) {
   // Trim left
   for (; *ppStart != pEnd;) {
-    if (isalnum(**ppStart))
+    if (isalnum((unsigned char)**ppStart))
       break;
     else
       ++(*ppStart);
   }
 
   // Trim right
-  char *pNewEnd = *ppStart;
-  for (char *ch = *ppStart; ch < pEnd; ++ch) {
-    if (isalnum(*ch))
+  char const *pNewEnd = *ppStart;
+  for (char const *ch = *ppStart; ch < pEnd; ++ch) {
+    if (isalnum((unsigned char)*ch))
       pNewEnd = ch + 1;
   }
 
-  for (char *ch = *ppStart; ch < pNewEnd; ++ch) {
-    if (*ch == ' ')
-      *ch = '_';
-    else
-      *ch = toupper(*ch);
-  }
-
   return pNewEnd;
 }
 
@@ -665,238 +1435,287 @@ uint32_t serializeMin(uint32_t lhs, uint32_t rhs) {
   return rhs;
 }
 
-static STecVkSerializationResult serializeBitmask(ValueSet const *pValueSet,
-                                                  void const *pVkValue,
-                                                  uint32_t *pSerializedLength,
-                                                  char *pSerialized) {
-  if (pValueSet->count == 0) {
-    // If this is a non-existing bitmask, then return an empty string
-    *pSerializedLength = 0;
-    return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+/**
+ * @brief Returns the numeric value of the value set's entry at the given index
+ * @param pValueSet is the value set the entry belongs to
+ * @param index is the index of the entry in the value set
+ * @return Value of the entry, zero-extended to 64-bits
+ */
+static uint64_t getValue(ValueSet const *pValueSet, size_t index) {
+  switch (pValueSet->type) {
+  case ENUM_TYPE_ENUM:
+    return (uint32_t)((int32_t const *)getValues(pValueSet))[index];
+  case ENUM_TYPE_FLAG32:
+    return ((uint32_t const *)getValues(pValueSet))[index];
+  case ENUM_TYPE_FLAG64:
+    return ((uint64_t const *)getValues(pValueSet))[index];
   }
+  return 0;
+}
 
-  // As we want to search in reverse order (to possible catch values that encompass multiple bits)
-  // we decrement both items here, so the 'end' is at a valid value and 'start' is now one 'beyond
-  // the end'
-  char const *const *pSearchStart = pValueSet->valueNames + pValueSet->count - 1;
-  char const *const *pSearchEnd = pValueSet->valueNames - 1;
-
-  // Number of characters serialized so far
-  uint32_t serializedLength = 0;
-  // Will turn true if there isn't enough space in the destination string to fully serialize all the
-  // values
-  bool incomplete = false;
-  // Will host the temporary internal string, so we don't overwrite data in the destination string
-  // unless we're successfully returning
-  char *pTempStr = NULL;
+/**
+ * @brief Returns the position of the lowest set bit in the given non-zero value
+ */
+static uint32_t countTrailingZeros(uint64_t value) {
+#if defined(__GNUC__) || defined(__clang__)
+  return (uint32_t)__builtin_ctzll(value);
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_ARM64))
+  unsigned long index;
+  _BitScanForward64(&index, value);
+  return (uint32_t)index;
+#else
+  uint32_t count = 0;
+  for (; (value & 1) == 0; value >>= 1)
+    ++count;
+  return count;
+#endif
+}
 
-  if (pSerialized != NULL) {
-    // We'll only bother with the internal string if we can outputt string data
-    pTempStr = (char *)malloc(*pSerializedLength);
+/**
+ * @brief Copies as much of a string as fits into a destination string at the given position
+ * @param pDst is either NULL or a pointer to the destination string
+ * @param dstLength is the size of the destination string
+ * @param position is the position in the destination string to copy to
+ * @param pSrc is a pointer to the string to copy
+ * @param srcLength is the length of the string to copy
+ */
+static void copyClamped(
+    char *pDst, uint32_t dstLength, uint32_t position, char const *pSrc, uint32_t srcLength) {
+  if (pDst != NULL && position < dstLength) {
+    memcpy(pDst + position, pSrc, serializeMin(dstLength - position, srcLength));
   }
+}
 
-  char *pSrcStr = pTempStr;
-  bool valueIsZero;
-
-  while (pSearchStart != pSearchEnd) {
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      valueIsZero = *(int32_t *)pVkValue == 0;
-      break;
-    case ENUM_TYPE_FLAG32:
-      valueIsZero = *(uint32_t *)pVkValue == 0;
-      break;
-    case ENUM_TYPE_FLAG64:
-      valueIsZero = *(uint64_t *)pVkValue == 0;
-      break;
-    }
+/**
+ * @brief Matches the names of a value set to the bits of a bitmask value
+ * @param pValueSet is the value set being serialized from
+ * @param pValue is a pointer to the value being serialized, which is updated to the bits that
+ * could not be matched to any name
+ * @param pBitEntries is a pointer to the indices of the named single bits set in the value, in
+ * descending order
+ * @param bitEntryCount is the number of indices in pBitEntries
+ * @param pDst is either NULL or a pointer to a character array the matched names are written to
+ * @param dstLength is the size of pDst, any names past which are not written
+ * @return Number of characters needed for all the matched names and separators.
+ */
+static uint32_t matchBitmask(ValueSet const *pValueSet,
+                             uint64_t *pValue,
+                             uint16_t const *pBitEntries,
+                             uint32_t bitEntryCount,
+                             char *pDst,
+                             uint32_t dstLength) {
+  uint64_t value = *pValue;
+  uint32_t serializedLength = 0;
+  uint32_t bitEntryIt = 0;
+  uint32_t combinedIt = 0;
+  uint16_t const *const pCombinedIndices = getCombinedIndices(pValueSet);
 
-    if (valueIsZero && serializedLength > 0) {
+  while (bitEntryIt < bitEntryCount || combinedIt < pValueSet->combinedCount) {
+    if (value == 0 && serializedLength > 0) {
       // No more non-zero values to serialize, and we've serialized something,
       // so we can skip any possible zero-values
       break;
     }
 
-    size_t offset = pSearchStart - pValueSet->valueNames;
-    bool match;
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      match = (((int32_t *)pValueSet->values)[offset] & *(int32_t *)pVkValue) ==
-              ((int32_t *)pValueSet->values)[offset];
-      break;
-    case ENUM_TYPE_FLAG32:
-      match = (((uint32_t *)pValueSet->values)[offset] & *(uint32_t *)pVkValue) ==
-              ((uint32_t *)pValueSet->values)[offset];
-      break;
-    case ENUM_TYPE_FLAG64:
-      match = (((uint64_t *)pValueSet->values)[offset] & *(uint64_t *)pVkValue) ==
-              ((uint64_t *)pValueSet->values)[offset];
-      break;
+    // Take whichever candidate is further along in the value set
+    size_t offset;
+    if (combinedIt == pValueSet->combinedCount ||
+        (bitEntryIt < bitEntryCount &&
+         pBitEntries[bitEntryIt] > pCombinedIndices[combinedIt])) {
+      offset = pBitEntries[bitEntryIt++];
+    } else {
+      offset = pCombinedIndices[combinedIt++];
     }
 
-    if (match) {
-      // Found a compatible bit mask, add it
-      if (serializedLength > 0) {
-        if (pTempStr == NULL) {
-          serializedLength += 3;
-        } else {
-          uint32_t toCopy = serializeMin(*pSerializedLength - serializedLength, 3);
-          memcpy(pSrcStr, " | ", toCopy);
-          pSrcStr += toCopy;
-          serializedLength += toCopy;
-          if (toCopy != 3) {
-            incomplete = true;
-            break;
-          }
-        }
-      }
-
-      if (pSrcStr == NULL) {
-        serializedLength += (uint32_t)strlen(*pSearchStart);
-      } else {
-        uint32_t toCopy =
-            serializeMin(*pSerializedLength - serializedLength, (uint32_t)strlen(*pSearchStart));
-        memcpy(pSrcStr, *pSearchStart, toCopy);
-        pSrcStr += toCopy;
-        serializedLength += toCopy;
-        if (toCopy != strlen(*pSearchStart)) {
-          incomplete = true;
-          break;
-        }
-      }
+    uint64_t const entryValue = getValue(pValueSet, offset);
+    if ((entryValue & value) != entryValue)
+      continue;
 
-      switch (pValueSet->type) {
-      case ENUM_TYPE_ENUM:
-        *(int32_t *)pVkValue ^= ((int32_t *)pValueSet->values)[offset];
-        break;
-      case ENUM_TYPE_FLAG32:
-        *(uint32_t *)pVkValue ^= ((uint32_t *)pValueSet->values)[offset];
-        break;
-      case ENUM_TYPE_FLAG64:
-        *(uint64_t *)pVkValue ^= ((uint64_t *)pValueSet->values)[offset];
-        break;
-      }
+    // Found a compatible bit mask, add it
+    if (serializedLength > 0) {
+      copyClamped(pDst, dstLength, serializedLength, " | ", 3);
+      serializedLength += 3;
     }
 
-    --pSearchStart;
+    uint32_t const nameLength = getValueNameLength(pValueSet, offset);
+    copyClamped(pDst, dstLength, serializedLength, getValueName(pValueSet, offset), nameLength);
+    serializedLength += nameLength;
+
+    value ^= entryValue;
   }
 
+  *pValue = value;
+  return serializedLength;
+}
+
+static STecVkSerializationResult serializeBitmask(ValueSet const *pValueSet,
+                                                  void const *pVkValue,
+                                                  uint32_t *pSerializedLength,
+                                                  char *pSerialized) {
+  if (pValueSet->count == 0) {
+    // If this is a non-existing bitmask, then return an empty string
+    *pSerializedLength = 0;
+    return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+  }
+
+  uint64_t value = 0;
   switch (pValueSet->type) {
   case ENUM_TYPE_ENUM:
-    valueIsZero = *(int32_t *)pVkValue == 0;
-    break;
   case ENUM_TYPE_FLAG32:
-    valueIsZero = *(uint32_t *)pVkValue == 0;
+    value = *(uint32_t *)pVkValue;
     break;
   case ENUM_TYPE_FLAG64:
-    valueIsZero = *(uint64_t *)pVkValue == 0;
+    value = *(uint64_t *)pVkValue;
     break;
   }
 
-  if (!incomplete && !valueIsZero) {
+  // Collect the value indices of the named single bits that are set, sorted in descending order so
+  // that they can be merged with the (also descending) combined values, matching the precedence of
+  // searching the whole value set in reverse.
+  uint16_t const *const pBitIndices = getBitIndices(pValueSet);
+  uint16_t bitEntries[64];
+  uint32_t bitEntryCount = 0;
+  for (uint64_t bits = value; bits != 0; bits &= bits - 1) {
+    uint32_t const bit = countTrailingZeros(bits);
+    if (bit >= pValueSet->bitIndexCount || pBitIndices[bit] == cNoValueIndex)
+      continue;
+
+    uint16_t const index = pBitIndices[bit];
+    uint32_t insertAt = bitEntryCount++;
+    for (; insertAt > 0 && bitEntries[insertAt - 1] < index; --insertAt) {
+      bitEntries[insertAt] = bitEntries[insertAt - 1];
+    }
+    bitEntries[insertAt] = index;
+  }
+
+  // The names are matched first to find the total length and whether the whole value can be
+  // serialized, so that they can then be written directly to the destination string, without it
+  // being touched on failure and without needing a temporary string
+  uint64_t remainingValue = value;
+  uint32_t const serializedLength =
+      matchBitmask(pValueSet, &remainingValue, bitEntries, bitEntryCount, NULL, 0);
+
+  if (pSerialized != NULL && serializedLength > *pSerializedLength) {
+    // Not enough space in the destination string, write as much as will fit
+    matchBitmask(pValueSet, &value, bitEntries, bitEntryCount, pSerialized, *pSerializedLength);
+    return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+  }
+
+  if (remainingValue != 0) {
     // Failed to find a valid bitmask for the value
-    free(pTempStr);
     return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
   }
 
+  if (pSerialized != NULL) {
+    matchBitmask(pValueSet, &value, bitEntries, bitEntryCount, pSerialized, serializedLength);
+  }
   *pSerializedLength = serializedLength;
-  if (pSerialized != NULL && serializedLength > 0) {
-    memcpy(pSerialized, pTempStr, serializedLength);
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+}
+
+/**
+ * @brief Finds the index of the first entry of a plain enum value set with the given value
+ * @param pValueSet is the value set to search
+ * @param value is the value being searched for
+ * @return Index of the matching entry, or cNoValueIndex if there isn't one.
+ *
+ * Values in the dense core range are directly indexed, as are extension values for sets with
+ * extension blocks, with anything else being binary searched.
+ */
+static uint16_t findEnumIndex(ValueSet const *pValueSet, int32_t value) {
+  if (value >= 0 && (uint32_t)value < pValueSet->valueIndexCount) {
+    return getValueIndices(pValueSet)[value];
   }
-  free(pTempStr);
-  if (incomplete) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+
+  if (pValueSet->extensionBlockCount != 0 && value >= cExtensionValueBase) {
+    // Extension values are 1000000000 + (ext - 1) * 1000 + offset
+    uint32_t const block = (uint32_t)(value - cExtensionValueBase) / 1000;
+    uint32_t const offset = (uint32_t)(value - cExtensionValueBase) % 1000;
+    if (block >= pValueSet->extensionBlockCount)
+      return cNoValueIndex;
+
+    uint16_t const *const pExtensionBlocks = getExtensionBlocks(pValueSet);
+    if (offset >= (uint32_t)(pExtensionBlocks[block + 1] - pExtensionBlocks[block]))
+      return cNoValueIndex;
+    return pExtensionBlocks[pExtensionBlocks[block] + offset];
   }
-  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+
+  int32_t const *const pSortedValues = getSortedValues(pValueSet);
+  uint32_t low = 0;
+  uint32_t high = pValueSet->sortedCount;
+  while (low < high) {
+    uint32_t const mid = low + (high - low) / 2;
+    if (pSortedValues[mid] < value)
+      low = mid + 1;
+    else
+      high = mid;
+  }
+  if (low < pValueSet->sortedCount && pSortedValues[low] == value) {
+    return getSortedIndices(pValueSet)[low];
+  }
+
+  return cNoValueIndex;
 }
 
 static STecVkSerializationResult serializeEnum(ValueSet const *pValueSet,
                                                void const *pVkValue,
                                                uint32_t *pSerializedLength,
                                                char *pSerialized) {
-  void const *pSearchStart = pValueSet->values;
-  void const *pSearchEnd;
+  size_t offset = cNoValueIndex;
 
   switch (pValueSet->type) {
   case ENUM_TYPE_ENUM:
-  case ENUM_TYPE_FLAG32:
-    pSearchEnd = (uint32_t *)pSearchStart + pValueSet->count;
-    break;
-  case ENUM_TYPE_FLAG64:
-    pSearchEnd = (uint64_t *)pSearchStart + pValueSet->count;
+    offset = findEnumIndex(pValueSet, *(int32_t *)pVkValue);
     break;
-  }
-
-  while (pSearchStart != pSearchEnd) {
-    bool match;
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-      match = *(int32_t *)pSearchStart == *(int32_t *)pVkValue;
-      break;
-    case ENUM_TYPE_FLAG32:
-      match = *(uint32_t *)pSearchStart == *(uint32_t *)pVkValue;
-      break;
-    case ENUM_TYPE_FLAG64:
-      match = *(uint64_t *)pSearchStart == *(uint64_t *)pVkValue;
-      break;
-    }
-
-    if (match) {
-      size_t offset;
-      switch (pValueSet->type) {
-      case ENUM_TYPE_ENUM:
-      case ENUM_TYPE_FLAG32:
-        offset = (uint32_t *)pSearchStart - (uint32_t *)pValueSet->values;
-        break;
-      case ENUM_TYPE_FLAG64:
-        offset = (uint64_t *)pSearchStart - (uint64_t *)pValueSet->values;
+  case ENUM_TYPE_FLAG32:
+  case ENUM_TYPE_FLAG64: {
+    // Flag types don't have value indices, so search the values directly
+    uint64_t const value = (pValueSet->type == ENUM_TYPE_FLAG32) ? *(uint32_t *)pVkValue
+                                                                 : *(uint64_t *)pVkValue;
+    for (size_t i = 0; i < pValueSet->count; ++i) {
+      if (getValue(pValueSet, i) == value) {
+        offset = i;
         break;
       }
-
-      uint32_t const sourceLength = (uint32_t)strlen(pValueSet->valueNames[offset]);
-      if (pSerialized != NULL) {
-        if (*pSerializedLength < sourceLength) {
-          memcpy(pSerialized, pValueSet->valueNames[offset], *pSerializedLength);
-          return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
-        } else {
-          // Copy full value
-          memcpy(pSerialized, pValueSet->valueNames[offset], sourceLength);
-        }
-      }
-      // In all success cases, set the length of the value string, either for how much is needed
-      // or was copied.
-      *pSerializedLength = sourceLength;
-
-      return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
     }
+  } break;
+  }
 
-    switch (pValueSet->type) {
-    case ENUM_TYPE_ENUM:
-    case ENUM_TYPE_FLAG32:
-      pSearchStart = ((uint32_t *)pSearchStart) + 1;
-      break;
-    case ENUM_TYPE_FLAG64:
-      pSearchStart = ((uint64_t *)pSearchStart) + 1;
-      break;
+  if (offset == cNoValueIndex) {
+    return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
+  }
+
+  uint32_t const sourceLength = getValueNameLength(pValueSet, offset);
+  if (pSerialized != NULL) {
+    if (*pSerializedLength < sourceLength) {
+      memcpy(pSerialized, getValueName(pValueSet, offset), *pSerializedLength);
+      return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+    } else {
+      // Copy full value
+      memcpy(pSerialized, getValueName(pValueSet, offset), sourceLength);
     }
   }
+  // In all success cases, set the length of the value string, either for how much is needed
+  // or was copied.
+  *pSerializedLength = sourceLength;
 
-  return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
 }
 
-static STecVkSerializationResult parseBitmask(char *pVkString,
+static STecVkSerializationResult parseBitmask(char const *pVkString,
+                                              size_t strLength,
                                               ValueSet const *pValueSet,
                                               char const *pPrefixStr,
                                               size_t prefixLength,
                                               void *pParsedValue) {
   uint64_t retVal = 0;
-  char *const strEnd = pVkString + strlen(pVkString);
+  char const *const strEnd = pVkString + strLength;
 
-  char *startCh = pVkString;
-  char *endCh = pVkString;
+  char const *startCh = pVkString;
+  char const *endCh = pVkString;
   for (; endCh != strEnd; ++endCh) {
     if (*endCh == '|') {
-      char *pNewEndCh = formatString(&startCh, endCh);
+      char const *pNewEndCh = trimString(&startCh, endCh);
 
       bool foundVal =
           parseValue(startCh, pNewEndCh - startCh, pPrefixStr, prefixLength, pValueSet, &retVal);
@@ -907,7 +1726,7 @@ static STecVkSerializationResult parseBitmask(char *pVkString,
     }
   }
   if (startCh != endCh) {
-    char *pNewEndCh = formatString(&startCh, endCh);
+    char const *pNewEndCh = trimString(&startCh, endCh);
 
     bool foundVal =
         parseValue(startCh, pNewEndCh - startCh, pPrefixStr, prefixLength, pValueSet, &retVal);
@@ -929,14 +1748,15 @@ static STecVkSerializationResult parseBitmask(char *pVkString,
   return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
 }
 
-static STecVkSerializationResult parseEnum(char *pVkString,
+static STecVkSerializationResult parseEnum(char const *pVkString,
+                                           size_t strLength,
                                            ValueSet const *pValueSet,
                                            char const *pPrefixStr,
                                            size_t prefixLength,
                                            void *pParsedValue) {
   uint64_t retVal = 0;
 
-  char *pStrEnd = formatString(&pVkString, pVkString + strlen(pVkString));
+  char const *pStrEnd = trimString(&pVkString, pVkString + strLength);
   bool found =
       parseValue(pVkString, pStrEnd - pVkString, pPrefixStr, prefixLength, pValueSet, &retVal);
   if (found) {
@@ -957,16 +1777,103 @@ static STecVkSerializationResult parseEnum(char *pVkString,
   return STEC_VK_SERIALIZATION_RESULT_ERROR_VALUE_NOT_FOUND;
 }
 
-static STecVkSerializationResult vk_serialize(char const *pVkType,
+static STecVkSerializationResult serializeValue(ValueSet const *pValueSet,
+                                                void const *pVkValue,
+                                                uint32_t *pSerializedLength,
+                                                char *pSerialized) {
+  if (pValueSet->type != ENUM_TYPE_ENUM) {
+    return serializeBitmask(pValueSet, pVkValue, pSerializedLength, pSerialized);
+  }
+
+  return serializeEnum(pValueSet, pVkValue, pSerializedLength, pSerialized);
+}
+
+#ifdef VK_VALUE_SERIALIZATION_CONFIG_CACHE
+#ifndef VK_VALUE_SERIALIZATION_CACHE_SIZE
+#define VK_VALUE_SERIALIZATION_CACHE_SIZE 64
+#endif
+
+#ifndef VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE
+#define VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE 128
+#endif
+
+#if defined(__cplusplus)
+#define SERIALIZATION_THREAD_LOCAL thread_local
+#elif defined(_MSC_VER)
+#define SERIALIZATION_THREAD_LOCAL __declspec(thread)
+#else
+#define SERIALIZATION_THREAD_LOCAL _Thread_local
+#endif
+
+typedef struct SerializationCacheEntry {
+  ValueSet const *pValueSet; // NULL if the entry is unused
+  uint64_t value;
+  uint32_t length;
+  char serialized[VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE];
+} SerializationCacheEntry;
+
+// Each thread has its own cache, so no synchronization is needed
+static SERIALIZATION_THREAD_LOCAL SerializationCacheEntry
+    sSerializationCache[VK_VALUE_SERIALIZATION_CACHE_SIZE];
+
+/**
+ * @brief Serializes a value, using the calling thread's cache of previously serialized values
+ * @param pValueSet is the value set being serialized from
+ * @param pVkValue is a pointer to the value being serialized
+ * @param valueSize is the size of the value being serialized
+ * @param pSerializedLength is a pointer to the length of pSerialized, as with vk_serialize32
+ * @param pSerialized is either NULL or a pointer to the destination string
+ * @return Same as serializing without the cache.
+ *
+ * Each (value set, value) pair maps to a single entry, so a new pair evicts whatever was there.
+ * Only successfully serialized strings that fit into an entry are cached, with anything else being
+ * serialized directly to the destination.
+ */
+static STecVkSerializationResult serializeCached(ValueSet const *pValueSet,
+                                                 void const *pVkValue,
+                                                 size_t valueSize,
+                                                 uint32_t *pSerializedLength,
+                                                 char *pSerialized) {
+  uint64_t const value =
+      (valueSize == sizeof(uint32_t)) ? *(uint32_t const *)pVkValue : *(uint64_t const *)pVkValue;
+
+  uint64_t hash = (uint64_t)(uintptr_t)pValueSet ^ (value * 0x9E3779B97F4A7C15ULL);
+  hash ^= hash >> 32;
+  SerializationCacheEntry *pEntry =
+      &sSerializationCache[hash % VK_VALUE_SERIALIZATION_CACHE_SIZE];
+
+  if (pEntry->pValueSet != pValueSet || pEntry->value != value) {
+    // Cache miss, serialize into the entry, invalidating it first in case it fails
+    uint32_t length = VK_VALUE_SERIALIZATION_CACHE_STRING_SIZE;
+    pEntry->pValueSet = NULL;
+    if (serializeValue(pValueSet, pVkValue, &length, pEntry->serialized) !=
+        STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
+      return serializeValue(pValueSet, pVkValue, pSerializedLength, pSerialized);
+    }
+
+    pEntry->pValueSet = pValueSet;
+    pEntry->value = value;
+    pEntry->length = length;
+  }
+
+  if (pSerialized != NULL) {
+    if (*pSerializedLength < pEntry->length) {
+      memcpy(pSerialized, pEntry->serialized, *pSerializedLength);
+      return STEC_VK_SERIALIZATION_RESULT_ERROR_INCOMPLETE;
+    }
+    memcpy(pSerialized, pEntry->serialized, pEntry->length);
+  }
+  *pSerializedLength = pEntry->length;
+
+  return STEC_VK_SERIALIZATION_RESULT_SUCCESS;
+}
+#endif
+
+static STecVkSerializationResult vk_serialize(ValueSet const *pValueSet,
                                               void const *pVkValue,
                                               size_t valueSize,
                                               uint32_t *pSerializedLength,
                                               char *pSerialized) {
-  if (pVkType == NULL || strlen(pVkType) == 0) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
-  }
-
-  ValueSet const *const pValueSet = getValueSet(pVkType);
   if (pValueSet == NULL) {
     return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
   }
@@ -984,36 +1891,64 @@ static STecVkSerializationResult vk_serialize(char const *pVkType,
     break;
   }
 
-  if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
-    return serializeBitmask(pValueSet, pVkValue, pSerializedLength, pSerialized);
+#ifdef VK_VALUE_SERIALIZATION_CONFIG_CACHE
+  return serializeCached(pValueSet, pVkValue, valueSize, pSerializedLength, pSerialized);
+#else
+  return serializeValue(pValueSet, pVkValue, pSerializedLength, pSerialized);
+#endif
+}
+
+STecVkValueSet const *vk_get_value_set(char const *pVkType) {
+  if (pVkType == NULL || strlen(pVkType) == 0) {
+    return NULL;
   }
 
-  return serializeEnum(pValueSet, pVkValue, pSerializedLength, pSerialized);
+  return getValueSet(pVkType);
+}
+
+STecVkValueSet const *vk_get_value_set_at(uint32_t index) {
+  if (index >= cValueSetCount) {
+    return NULL;
+  }
+
+  return &cValueSets[index];
 }
 
 STecVkSerializationResult vk_serialize32(char const *pVkType,
                                          uint32_t vkValue,
                                          uint32_t *pSerializedLength,
                                          char *pSerialized) {
-  return vk_serialize(pVkType, &vkValue, sizeof(uint32_t), pSerializedLength, pSerialized);
+  return vk_serialize(vk_get_value_set(pVkType), &vkValue, sizeof(uint32_t), pSerializedLength,
+                      pSerialized);
 }
 
 STecVkSerializationResult vk_serialize64(char const *pVkType,
                                          uint64_t vkValue,
                                          uint32_t *pSerializedLength,
                                          char *pSerialized) {
-  return vk_serialize(pVkType, &vkValue, sizeof(uint64_t), pSerializedLength, pSerialized);
+  return vk_serialize(vk_get_value_set(pVkType), &vkValue, sizeof(uint64_t), pSerializedLength,
+                      pSerialized);
+}
+
+STecVkSerializationResult vk_serialize_set32(STecVkValueSet const *pValueSet,
+                                             uint32_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized) {
+  return vk_serialize(pValueSet, &vkValue, sizeof(uint32_t), pSerializedLength, pSerialized);
+}
+
+STecVkSerializationResult vk_serialize_set64(STecVkValueSet const *pValueSet,
+                                             uint64_t vkValue,
+                                             uint32_t *pSerializedLength,
+                                             char *pSerialized) {
+  return vk_serialize(pValueSet, &vkValue, sizeof(uint64_t), pSerializedLength, pSerialized);
 }
 
-static STecVkSerializationResult vk_parse(char const *pVkType,
+static STecVkSerializationResult vk_parse(ValueSet const *pValueSet,
                                           char const *pVkString,
+                                          size_t strLength,
                                           void *pParsedValue,
                                           size_t parseValueSize) {
-  if (pVkType == NULL || strlen(pVkType) == 0) {
-    return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
-  }
-
-  ValueSet const *const pValueSet = getValueSet(pVkType);
   if (pValueSet == NULL) {
     return STEC_VK_SERIALIZATION_RESULT_ERROR_TYPE_NOT_FOUND;
   }
@@ -1031,10 +1966,9 @@ static STecVkSerializationResult vk_parse(char const *pVkType,
     break;
   }
 
-  size_t const strLength = strlen(pVkString);
   if (strLength == 0) {
     // Only flags/bitmasks can have no/empty values, all enum types must have *something*
-    if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
+    if (pValueSet->type != ENUM_TYPE_ENUM) {
       switch (parseValueSize) {
       case sizeof(uint32_t):
         *(uint32_t *)pParsedValue = 0;
@@ -1049,41 +1983,61 @@ static STecVkSerializationResult vk_parse(char const *pVkType,
     }
   }
 
-  char *mutableStr = (char *)malloc(strLength + 1);
-  memcpy(mutableStr, pVkString, strLength);
-  mutableStr[strLength] = '\\0';
-
-  char const *prefixStr = generateEnumPrefix(pVkType, stripVendor(pVkType, strlen(pVkType)));
-
-  STecVkSerializationResult result;
-  if (strstr(pVkType, "Flags") != NULL || strstr(pVkType, "FlagBits") != NULL) {
-    result = parseBitmask(mutableStr, pValueSet, prefixStr, strlen(prefixStr), pParsedValue);
-  } else {
-    result = parseEnum(mutableStr, pValueSet, prefixStr, strlen(prefixStr), pParsedValue);
+  if (pValueSet->type != ENUM_TYPE_ENUM) {
+    return parseBitmask(pVkString, strLength, pValueSet, getValueSetPrefix(pValueSet),
+                        strlen(getValueSetPrefix(pValueSet)), pParsedValue);
   }
 
-  free((void *)prefixStr);
-  free(mutableStr);
-
-  return result;
+  return parseEnum(pVkString, strLength, pValueSet, getValueSetPrefix(pValueSet),
+                   strlen(getValueSetPrefix(pValueSet)), pParsedValue);
 }
 
 STecVkSerializationResult vk_parse32(char const *pVkType,
                                      char const *pVkString,
                                      void *pParsedValue) {
+  return vk_parse_set32(vk_get_value_set(pVkType), pVkString, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse64(char const *pVkType,
+                                     char const *pVkString,
+                                     void *pParsedValue) {
+  return vk_parse_set64(vk_get_value_set(pVkType), pVkString, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set32(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue) {
+  size_t const strLength = (pVkString != NULL) ? strlen(pVkString) : 0;
+  return vk_parse_set_n32(pValueSet, pVkString, strLength, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set64(STecVkValueSet const *pValueSet,
+                                         char const *pVkString,
+                                         void *pParsedValue) {
+  size_t const strLength = (pVkString != NULL) ? strlen(pVkString) : 0;
+  return vk_parse_set_n64(pValueSet, pVkString, strLength, pParsedValue);
+}
+
+STecVkSerializationResult vk_parse_set_n32(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue) {
   uint32_t tempValue;
-  STecVkSerializationResult result = vk_parse(pVkType, pVkString, &tempValue, sizeof(uint32_t));
+  STecVkSerializationResult result =
+      vk_parse(pValueSet, pVkString, stringLength, &tempValue, sizeof(uint32_t));
   if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
     memcpy(pParsedValue, &tempValue, sizeof(uint32_t));
   }
   return result;
 }
 
-STecVkSerializationResult vk_parse64(char const *pVkType,
-                                     char const *pVkString,
-                                     void *pParsedValue) {
+STecVkSerializationResult vk_parse_set_n64(STecVkValueSet const *pValueSet,
+                                           char const *pVkString,
+                                           size_t stringLength,
+                                           void *pParsedValue) {
   uint64_t tempValue;
-  STecVkSerializationResult result = vk_parse(pVkType, pVkString, &tempValue, sizeof(uint64_t));
+  STecVkSerializationResult result =
+      vk_parse(pValueSet, pVkString, stringLength, &tempValue, sizeof(uint64_t));
   if (result == STEC_VK_SERIALIZATION_RESULT_SUCCESS) {
     memcpy(pParsedValue, &tempValue, sizeof(uint64_t));
   }
@@ -1098,7 +2052,12 @@ STecVkSerializationResult vk_parse64(char const *pVkType,
 #ifdef __cplusplus
 }
 #endif
+""")
+
+    # C++ compile-time value set bindings
+    processValueSetBindings(outFile, apiData['enums'])
 
+    outFile.write("""
 #endif // VK_VALUE_SERIALIZATION_H
 """)
     outFile.close()